@@ -93,6 +93,7 @@ a = Analysis(
         # sounds bundled via sound_datas (below) — excludes .wav masters
         ('maps',      'maps'),
         ('config.json', '.'),
+        ('opening_book.json', '.'),
         # LICENSE and ASSETS_LICENSE.md copied to top-level in build workflow
         ('boneglaive/graphical/assets', 'boneglaive/graphical/assets'),
     ] + sound_datas,
@@ -6,9 +6,10 @@ Provides a clean interface between the game and AI controllers.
 
 from typing import Optional, TYPE_CHECKING
 from boneglaive.utils.debug import logger
-from boneglaive.utils.config import ConfigManager
+from boneglaive.utils.config import get_config
 
 if TYPE_CHECKING:
+    from boneglaive.ai.weights import AIWeights
     from boneglaive.game.engine import Game
     from boneglaive.graphical.ui_adapter import GraphicalUIAdapter
 
@@ -24,7 +25,8 @@ class AIInterface:
         self.ui = None
         self.initialized = False
         self.ai_controller = None
-        self.config = ConfigManager()
+        self.background_turn = None
+        self.config = get_config()
 
     def initialize(self, game: 'Game', ui: Optional['GraphicalUIAdapter'] = None) -> bool:
         """
@@ -42,9 +44,15 @@ class AIInterface:
             self.ui = ui
 
             # Import and initialize the AI controller
-            # Use SmartAI for intelligent decision-making
-            from boneglaive.ai.smart_ai import SmartAI
-            self.ai_controller = SmartAI(game, ui)
+            # Use SmartAI for intelligent decision-making, at the configured difficulty
+            from boneglaive.ai.smart_ai import SmartAI, difficulty_options
+            difficulty = self.config.get('ai_difficulty', 'medium')
+            try:
+                options = difficulty_options(difficulty)
+            except ValueError as e:
+                logger.warning(f"{e}; using medium")
+                options = difficulty_options('medium')
+            self.ai_controller = SmartAI(game, ui, weights=self.load_weights(), **options)
 
             logger.info("AI interface initialized successfully")
             self.initialized = True
@@ -54,6 +62,30 @@ class AIInterface:
             self.initialized = False
             return False
 
+    def load_weights(self) -> 'AIWeights':
+        """
+        Scoring weights named by the ai_weights_file config key.
+
+        A relative path is resolved against the project root. A missing or
+        unreadable file falls back to the default weights.
+
+        Returns:
+            The configured AIWeights
+        """
+        from boneglaive.ai.weights import AIWeights, DEFAULT_WEIGHTS
+        from boneglaive.utils.paths import asset_path
+
+        path = self.config.get('ai_weights_file', '')
+        if not path:
+            return DEFAULT_WEIGHTS
+        try:
+            weights = AIWeights.load(asset_path(path))
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"Could not load AI weights from {path}: {e}; using defaults")
+            return DEFAULT_WEIGHTS
+        logger.info(f"Loaded AI weights from {path}")
+        return weights
+
     def process_turn(self) -> bool:
         """
         Process an AI turn.
@@ -72,9 +104,56 @@ class AIInterface:
             logger.error(f"Error processing AI turn: {e}")
             return False
 
+    def start_background_turn(self) -> bool:
+        """
+        Start computing an AI turn on a worker thread against a clone of the game.
+
+        Poll background_turn_ready() while the render loop keeps running, then
+        call finish_background_turn() on the main thread to queue the plan.
+
+        Returns:
+            True if the worker was started
+        """
+        if not self.initialized or not self.ai_controller:
+            logger.error("AI interface not properly initialized")
+            return False
+
+        try:
+            from boneglaive.ai.background import BackgroundTurn
+            self.background_turn = BackgroundTurn(self.ai_controller).start()
+            return True
+        except Exception as e:
+            logger.error(f"Error starting background AI turn: {e}")
+            self.background_turn = None
+            return False
+
+    def background_turn_ready(self) -> bool:
+        """Whether finish_background_turn() can be called without blocking."""
+        return self.background_turn is None or self.background_turn.done()
+
+    def finish_background_turn(self) -> bool:
+        """
+        Queue the background turn's plan on the live game (main thread only).
+
+        Thinks synchronously if no background turn was started.
+
+        Returns:
+            True if the turn was processed successfully, False otherwise
+        """
+        background_turn, self.background_turn = self.background_turn, None
+        if background_turn is None:
+            return self.process_turn()
+
+        try:
+            return background_turn.apply()
+        except Exception as e:
+            logger.error(f"Error applying background AI turn: {e}")
+            return False
+
     def cleanup(self) -> None:
         """Clean up resources used by the AI."""
         self.game = None
         self.ui = None
         self.ai_controller = None
+        self.background_turn = None
         self.initialized = False
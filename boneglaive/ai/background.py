@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Background turns for Smart AI.
+Computes an AI turn on a worker thread against a cloned game, so the caller's
+render loop keeps running; the finished decision is applied on the caller's thread.
+"""
+
+import threading
+from typing import Dict, List, Optional, TYPE_CHECKING
+from boneglaive.utils.debug import logger
+from boneglaive.utils.message_log import message_log
+from boneglaive.ai.turn_planner import search_rng, translate_action
+
+if TYPE_CHECKING:
+    from boneglaive.game.engine import Game
+    from boneglaive.ai.smart_ai import SmartAI, TurnDecision
+
+
+class BackgroundTurn:
+    """
+    One AI turn thought out on a worker thread.
+
+    The live game is cloned on the calling thread when the turn is created; the
+    worker only ever touches the clone. apply() must be called from the thread
+    that owns the live game (the pygame thread) and queues the decision there.
+    """
+
+    def __init__(self, controller: 'SmartAI'):
+        """
+        Clone the controller's game for the worker.
+
+        Args:
+            controller: The live AI controller whose turn is being computed
+        """
+        self.controller = controller
+        self.decision: Optional['TurnDecision'] = None
+        self.error: Optional[Exception] = None
+
+        memo = {}
+        # The worker resolves chance outcomes from its own generator; the global
+        # random module belongs to the main thread (animations, the live game)
+        self._state = controller.game.clone(
+            memo, rng=search_rng(controller.game, controller.player_number, "turn"))
+        # id(clone object) -> live object, for everything a decision can reference
+        self._to_live: Dict[int, object] = {
+            id(memo[id(obj)]): obj for obj in self._live_objects(controller.game) if id(obj) in memo
+        }
+        self._thread = threading.Thread(target=self._run, name="ai-turn", daemon=True)
+
+    @staticmethod
+    def _live_objects(game: 'Game') -> List[object]:
+        """Units, their skills and respawnable dead units."""
+        objects = []
+        for unit in game.units:
+            objects.append(unit)
+            objects.extend(getattr(unit, 'active_skills', []) or [])
+        objects.extend(game.dead_units)
+        return objects
+
+    def start(self) -> 'BackgroundTurn':
+        """Start thinking on the worker thread."""
+        self._thread.start()
+        return self
+
+    def done(self) -> bool:
+        """Whether the worker has finished (successfully or not)."""
+        return self._thread.ident is not None and not self._thread.is_alive()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the worker finishes.
+
+        Args:
+            timeout: Seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if the worker has finished
+        """
+        self._thread.join(timeout)
+        return self.done()
+
+    def _run(self) -> None:
+        """Worker: play the AI turn on the clone and translate what it queued."""
+        from boneglaive.ai.smart_ai import SmartAI, TurnDecision
+
+        try:
+            # Messages the AI produces while queueing on the clone are regenerated
+            # when the decision is applied to the live game
+            with message_log.suppressed():
+                ai = SmartAI(self._state, None, beam_width=self.controller.beam_width,
+                             player_number=self.controller.player_number,
+                             weights=self.controller.weights,
+                             endgame_threshold=self.controller.endgame_threshold,
+                             plan_budget=self.controller.plan_budget)
+                ai.process_turn()
+
+            decision = TurnDecision()
+            for dead_unit, position in ai.last_decision.respawns:
+                live_dead_unit = self._to_live.get(id(dead_unit))
+                if live_dead_unit is not None:
+                    decision.respawns.append((live_dead_unit, position))
+            for unit, action in ai.last_decision.steps:
+                live_unit = self._to_live.get(id(unit))
+                live_action = translate_action(action, self._to_live)
+                if live_unit is not None and live_action is not None:
+                    decision.steps.append((live_unit, live_action))
+            self.decision = decision
+        except Exception as e:
+            import traceback
+            self.error = e
+            logger.error(f"Error in background AI turn: {e}")
+            logger.error(traceback.format_exc())
+
+    def apply(self) -> bool:
+        """
+        Queue the finished decision on the live game (caller's thread).
+
+        Falls back to thinking synchronously on the live game if the worker failed.
+
+        Returns:
+            True if the turn was queued
+        """
+        self.wait()
+        if self.decision is None:
+            logger.warning("Background AI turn produced no decision; thinking on the live game")
+            return self.controller.process_turn()
+
+        self.controller.apply_decision(self.decision)
+        logger.info(f"Applied background AI turn: {len(self.decision.steps)} actions, "
+                    f"{len(self.decision.respawns)} respawns")
+        return True
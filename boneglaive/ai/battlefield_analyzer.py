@@ -4,7 +4,7 @@ Battlefield Analyzer for Smart AI.
 Analyzes game state to provide tactical intelligence.
 """
 
-from typing import Dict, List, Tuple, TYPE_CHECKING
+from typing import Dict, List, Optional, Set, Tuple, TYPE_CHECKING
 from boneglaive.utils.debug import logger
 
 if TYPE_CHECKING:
@@ -25,6 +25,14 @@ class ThreatZone:
         self.threatening_units.append(unit)
         self.threat_level += potential_damage
 
+    def remove_threat(self, unit: 'Unit', potential_damage: int) -> None:
+        """Remove a threatening unit previously added with add_threat."""
+        for i, threatening in enumerate(self.threatening_units):
+            if threatening is unit:
+                del self.threatening_units[i]
+                self.threat_level -= potential_damage
+                return
+
 
 class BattlefieldAnalysis:
     """Container for battlefield analysis results."""
@@ -58,6 +66,59 @@ class BattlefieldAnalysis:
         # Vulnerable allies (units in danger)
         self.vulnerable_allies: List[Tuple['Unit', float]] = []  # (unit, danger_score)
 
+        # Bookkeeping for incremental updates (see BattlefieldAnalyzer.update)
+        self.threat_sources: Dict[int, Tuple['Unit', int, List[Tuple[int, int]]]] = {}  # id(enemy) -> (enemy, damage, cells)
+        self.unit_states: Dict[int, Tuple['Unit', tuple]] = {}  # id(unit) -> (unit, state the analysis saw)
+        self.terrain: Dict[Tuple[int, int], object] = {}  # terrain the threat map's line of sight was traced over
+
+    def copy(self, unit_map: Optional[Dict[int, 'Unit']] = None) -> 'BattlefieldAnalysis':
+        """
+        Copy the analysis, optionally translating units into another game.
+
+        Much cheaper than deepcopy: only the mutable containers are copied.
+
+        Args:
+            unit_map: id(original unit) -> unit to use in the copy, e.g. the memo
+                      filled by Game.clone(). Units missing from it are kept as-is.
+
+        Returns:
+            An independent BattlefieldAnalysis
+        """
+        unit_map = unit_map or {}
+
+        def unit(u):
+            return unit_map.get(id(u), u)
+
+        clone = BattlefieldAnalysis()
+        for pos, zone in self.threat_map.items():
+            copied = ThreatZone(pos)
+            copied.threatening_units = [unit(u) for u in zone.threatening_units]
+            copied.threat_level = zone.threat_level
+            clone.threat_map[pos] = copied
+
+        clone.ai_units = [unit(u) for u in self.ai_units]
+        clone.enemy_units = [unit(u) for u in self.enemy_units]
+        clone.ai_total_hp = self.ai_total_hp
+        clone.enemy_total_hp = self.enemy_total_hp
+        clone.ai_avg_hp_percent = self.ai_avg_hp_percent
+        clone.enemy_avg_hp_percent = self.enemy_avg_hp_percent
+        clone.ai_gp = self.ai_gp
+        clone.enemy_gp = self.enemy_gp
+        clone.gp_difference = self.gp_difference
+        clone.ai_center_control = self.ai_center_control
+        clone.enemy_center_control = self.enemy_center_control
+        clone.priority_targets = [(unit(u), score) for u, score in self.priority_targets]
+        clone.vulnerable_allies = [(unit(u), score) for u, score in self.vulnerable_allies]
+
+        for enemy_id, (enemy, damage, cells) in self.threat_sources.items():
+            copied_enemy = unit(enemy)
+            clone.threat_sources[id(copied_enemy)] = (copied_enemy, damage, cells)
+        for tracked, state in self.unit_states.values():
+            copied_unit = unit(tracked)
+            clone.unit_states[id(copied_unit)] = (copied_unit, state)
+        clone.terrain = self.terrain
+        return clone
+
 
 class BattlefieldAnalyzer:
     """
@@ -107,11 +168,97 @@ class BattlefieldAnalyzer:
         # Find vulnerable allies
         self._identify_vulnerable_allies(analysis)
 
+        # Remember what the analysis was built from so update() can diff against it
+        analysis.unit_states = self._unit_states()
+        analysis.terrain = dict(self.game.map.terrain)
+
         logger.debug(f"Battlefield analysis complete: {len(analysis.ai_units)} AI units, "
                     f"{len(analysis.enemy_units)} enemy units, GP: {analysis.ai_gp}-{analysis.enemy_gp}")
 
         return analysis
 
+    def update(self, analysis: BattlefieldAnalysis) -> BattlefieldAnalysis:
+        """
+        Bring an analysis up to date after units moved, took damage or died.
+
+        Only the threat map is expensive to rebuild (every enemy traces line of
+        sight to every tile in range), so only the threat cells of enemies that
+        changed, or whose line of sight may have changed, are recomputed. A unit
+        entering or leaving a tile can only block or open sight lines that pass
+        through that tile, i.e. for enemies whose attack range reaches past it.
+        The per-unit passes (categories, health, GP, control, priorities,
+        vulnerable allies) are linear in the unit count and are simply redone.
+
+        Args:
+            analysis: Analysis previously produced by analyze() (or copied from
+                      one with BattlefieldAnalysis.copy) for this game
+
+        Returns:
+            The same analysis object, updated in place
+        """
+        new_states = self._unit_states()
+        changed_ids: Set[int] = set()
+        changed_cells: Set[Tuple[int, int]] = set()
+
+        for unit_id in set(analysis.unit_states) | set(new_states):
+            old = analysis.unit_states.get(unit_id)
+            new = new_states.get(unit_id)
+            if old is not None and new is not None and old[1] == new[1]:
+                continue
+            changed_ids.add(unit_id)
+            for entry in (old, new):
+                if entry is not None:
+                    changed_cells.add(entry[1][0])
+
+        terrain_changed = analysis.terrain != self.game.map.terrain
+        if not changed_ids and not terrain_changed:
+            return analysis
+
+        # Cheap per-unit passes (reset first: the passes skip empty sides)
+        analysis.ai_units = []
+        analysis.enemy_units = []
+        analysis.ai_total_hp = analysis.enemy_total_hp = 0
+        analysis.ai_avg_hp_percent = analysis.enemy_avg_hp_percent = 0.0
+        analysis.ai_center_control = analysis.enemy_center_control = 0.0
+        self._categorize_units(analysis)
+        self._calculate_health_metrics(analysis)
+        self._calculate_gp_status(analysis)
+
+        # Threat map: patch only the footprints that can have changed
+        current_enemies = {id(enemy): enemy for enemy in analysis.enemy_units}
+        for enemy_id in list(analysis.threat_sources):
+            enemy, _, _ = analysis.threat_sources[enemy_id]
+            if (terrain_changed or enemy_id in changed_ids or enemy_id not in current_enemies
+                    or self._sees_through(enemy, changed_cells)):
+                self._remove_enemy_threat(analysis, enemy_id)
+        for enemy_id, enemy in current_enemies.items():
+            if enemy_id not in analysis.threat_sources:
+                self._add_enemy_threat(analysis, enemy)
+
+        self._evaluate_map_control(analysis)
+        self._identify_priority_targets(analysis)
+        self._identify_vulnerable_allies(analysis)
+
+        analysis.unit_states = new_states
+        if terrain_changed:
+            analysis.terrain = dict(self.game.map.terrain)
+
+        logger.debug(f"Battlefield analysis updated: {len(changed_ids)} changed units, "
+                    f"{len(analysis.threat_sources)} threat sources")
+
+        return analysis
+
+    def _unit_states(self) -> Dict[int, Tuple['Unit', tuple]]:
+        """Snapshot everything about each unit that the analysis depends on."""
+        states = {}
+        for unit in self.game.units:
+            stats = unit.get_effective_stats()
+            untargetable = hasattr(unit, 'is_untargetable') and unit.is_untargetable()
+            states[id(unit)] = (unit, ((unit.y, unit.x), unit.hp, unit.max_hp, unit.is_alive(),
+                                       untargetable, getattr(unit, 'is_topiary', False),
+                                       stats['attack'], stats['attack_range']))
+        return states
+
     def _categorize_units(self, analysis: BattlefieldAnalysis) -> None:
         """Separate AI and enemy units."""
         for unit in self.game.units:
@@ -155,28 +302,57 @@ class BattlefieldAnalyzer:
         """
         # For each enemy unit, mark all positions they can attack
         for enemy in analysis.enemy_units:
-            # Topiary units are terrain — they cannot attack
-            if getattr(enemy, 'is_topiary', False):
+            self._add_enemy_threat(analysis, enemy)
+
+    def _add_enemy_threat(self, analysis: BattlefieldAnalysis, enemy: 'Unit') -> None:
+        """Mark every position one enemy can attack and record its footprint."""
+        # Topiary units are terrain — they cannot attack
+        if getattr(enemy, 'is_topiary', False):
+            return
+
+        stats = enemy.get_effective_stats()
+        attack_range = stats['attack_range']
+        potential_damage = stats['attack']
+        cells = []
+
+        # Check all positions within attack range (chess distance, so a square around the enemy)
+        for y in range(max(0, enemy.y - attack_range), min(self.game.map.height, enemy.y + attack_range + 1)):
+            for x in range(max(0, enemy.x - attack_range), min(self.game.map.width, enemy.x + attack_range + 1)):
+                if (y, x) == (enemy.y, enemy.x):
+                    continue
+                # Check line of sight
+                if not self.game.has_line_of_sight(enemy.y, enemy.x, y, x):
+                    continue
+                pos = (y, x)
+                if pos not in analysis.threat_map:
+                    analysis.threat_map[pos] = ThreatZone(pos)
+
+                analysis.threat_map[pos].add_threat(enemy, potential_damage)
+                cells.append(pos)
+
+        analysis.threat_sources[id(enemy)] = (enemy, potential_damage, cells)
+
+    def _remove_enemy_threat(self, analysis: BattlefieldAnalysis, enemy_id: int) -> None:
+        """Take one enemy's recorded footprint back out of the threat map."""
+        enemy, potential_damage, cells = analysis.threat_sources.pop(enemy_id)
+        for pos in cells:
+            zone = analysis.threat_map.get(pos)
+            if zone is None:
                 continue
+            zone.remove_threat(enemy, potential_damage)
+            if not zone.threatening_units:
+                del analysis.threat_map[pos]
 
-            stats = enemy.get_effective_stats()
-            attack_range = stats['attack_range']
-            potential_damage = stats['attack']
-
-            # Check all positions within attack range
-            for y in range(self.game.map.height):
-                for x in range(self.game.map.width):
-                    distance = self.game.chess_distance(enemy.y, enemy.x, y, x)
-
-                    if distance <= attack_range and distance > 0:
-                        # Check line of sight
-                        if not self.game.has_line_of_sight(enemy.y, enemy.x, y, x):
-                            continue
-                        pos = (y, x)
-                        if pos not in analysis.threat_map:
-                            analysis.threat_map[pos] = ThreatZone(pos)
-
-                        analysis.threat_map[pos].add_threat(enemy, potential_damage)
+    def _sees_through(self, enemy: 'Unit', cells: Set[Tuple[int, int]]) -> bool:
+        """
+        Whether any of the cells can lie on one of the enemy's sight lines.
+
+        Sight lines exclude both endpoints, so a cell can only block a line to a
+        target further away, i.e. strictly inside the enemy's attack range.
+        """
+        attack_range = enemy.get_effective_stats()['attack_range']
+        return any(0 < self.game.chess_distance(enemy.y, enemy.x, y, x) < attack_range
+                   for y, x in cells)
 
     def _evaluate_map_control(self, analysis: BattlefieldAnalysis) -> None:
         """
@@ -0,0 +1,439 @@
+#!/usr/bin/env python3
+"""
+Endgame solver for Smart AI.
+
+Once only a handful of roster units are left alive, the solver looks for a
+winning line: a turn after which, whatever the opponent does, the GP threshold
+is reached within a few turns. It is an AND/OR search over whole turns with
+iterative deepening, simulated on cloned games. On the opponent's turns every
+legal reply (Game.legal_actions) must still lose. On its own turns the solver
+only tries forcing orders, since GP only comes from kills: each unit either
+attacks or aims a skill at an enemy (once per distinct target, from the first
+tile that reaches it) or waits. That narrowing can miss a win that needs a
+quiet move first. Results are shared between transposed positions through a
+transposition table. Subtrees where the remaining enemy units cannot yield
+enough GP are cut without simulation, so positions far from the threshold
+cost nothing.
+
+Chance outcomes inside the tree (teleport destinations, Wretched Decension,
+Neural Shunt orders, same-timestamp ordering) are not branched on. They are
+drawn from the solver's own generator, seeded per position, and a turn that
+drew from it never counts towards a win: another roll might not lose. The
+generator is never the global random stream, so solving is reproducible and
+safe on the AI worker thread. Respawns are not searched either: a position
+where the opponent has a unit ready to respawn counts as not won, since the
+respawned unit might hold out. A reported win is therefore forced.
+
+SmartAI only runs the solver when asked to (the hard difficulty). When no win
+is found within the depth and budget, it keeps its normal planning. Searches stop at a node budget, which is deterministic so seeded
+self-play stays reproducible. A wall-clock cap acts as a safety net.
+
+Benchmark nodes per second and solve time on endgames reached by self-play:
+    python -m boneglaive.ai.endgame --positions 6
+"""
+
+import random
+import time
+from enum import Enum
+from typing import Dict, Iterator, List, Optional, Tuple, TYPE_CHECKING
+from boneglaive.utils.debug import logger
+from boneglaive.utils.constants import GP_ELIGIBLE_UNITS
+from boneglaive.utils.message_log import message_log
+from boneglaive.game.actions import UnitAction, legal_actions, queue_unit_action
+from boneglaive.game.targeting import skill_target_candidates
+from boneglaive.ai.turn_planner import search_rng
+
+if TYPE_CHECKING:
+    from boneglaive.game.engine import Game
+    from boneglaive.game.units import Unit
+
+# --- Endgame search limits -----------------------------------------------------
+ENDGAME_UNIT_THRESHOLD = 4    # SmartAI solves when fewer living units than this remain
+ENDGAME_NODE_BUDGET = 400     # unit actions simulated per solve
+ENDGAME_TIME_BUDGET = 3.0     # seconds; safety cap on top of the node budget
+ENDGAME_MAX_DEPTH = 3         # turns (both players counted)
+
+# Most GP a single enemy death can award: the kill itself plus an upgraded
+# Auction Curse collecting the soul. Used to cut subtrees that cannot reach the threshold.
+MAX_GP_PER_DEATH = 2
+
+# Unit attributes that identify an object rather than describe the position
+_UNHASHED_ATTRIBUTES = {'_game', 'active_skills', 'passive_skill', 'id', 'greek_id', 'action_timestamp'}
+
+# (unit index, move, attack, skill index, skill target) for every unit given orders
+TurnPlan = Tuple[Tuple[int, Optional[Tuple[int, int]], Optional[Tuple[int, int]],
+                       Optional[int], Optional[Tuple[int, int]]], ...]
+
+
+class _OutOfBudget(Exception):
+    """Raised inside the search when the node or time budget is spent."""
+
+
+class EndgameResult:
+    """Outcome of one solve."""
+
+    def __init__(self):
+        self.plan: Optional[TurnPlan] = None   # The winning turn, when solved
+        self.solved: bool = False              # A forced win was found
+        self.turns_to_win: int = 0             # Turns (both players) until the win, when solved
+        self.depth: int = 0                    # Deepest fully searched depth (turns)
+        self.nodes: int = 0                    # Unit actions simulated
+        self.tt_hits: int = 0                  # Results reused from the transposition table
+        self.elapsed: float = 0.0              # Wall-clock seconds
+
+    @property
+    def nodes_per_second(self) -> float:
+        return self.nodes / self.elapsed if self.elapsed else 0.0
+
+
+def live_unit_count(game: 'Game') -> int:
+    """Roster units alive on the board, both sides (summons are not counted)."""
+    return sum(1 for unit in game.units if unit.is_alive() and unit.type in GP_ELIGIBLE_UNITS)
+
+
+def _freeze(value, unit_index: Dict[int, int]):
+    """Hashable, object-identity-free form of a unit attribute."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, Enum):
+        return value.name
+    if id(value) in unit_index:
+        return ('unit', unit_index[id(value)])
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v, unit_index) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted((_freeze(v, unit_index) for v in value), key=repr))
+    if isinstance(value, dict):
+        return tuple(sorted(((k, _freeze(v, unit_index)) for k, v in value.items()), key=repr))
+    return type(value).__name__
+
+
+def position_key(game: 'Game') -> Tuple:
+    """
+    Transposition table key for a position at the start of a turn.
+
+    Covers the side to move, GP, terrain version, every unit's scalar state and
+    skill cooldowns, and the respawn queue. Objects are keyed by unit index, not
+    identity, so equal positions reached through different clones collide.
+    """
+    unit_index = {id(unit): i for i, unit in enumerate(game.units)}
+    units = []
+    for unit in game.units:
+        state = tuple((name, _freeze(value, unit_index)) for name, value in vars(unit).items()
+                      if name not in _UNHASHED_ATTRIBUTES)
+        cooldowns = tuple(skill.current_cooldown for skill in getattr(unit, 'active_skills', []) or [])
+        units.append((state, cooldowns))
+    dead = tuple((du.player, du.unit_type.name, du.respawn_timer) for du in game.dead_units)
+    return (game.current_player, game.player1_gp, game.player2_gp,
+            getattr(game.map, 'version', 0), tuple(units), dead)
+
+
+def win_reachable(game: 'Game', player: int) -> bool:
+    """
+    Whether the enemy units still alive can yield enough GP for `player` to win.
+
+    GP only comes from enemy deaths. Respawned enemies could add more, so the
+    bound only ever cuts a line as not won, never claims a win.
+    """
+    gp = game.player1_gp if player == 1 else game.player2_gp
+    killable = sum(1 for unit in game.units
+                   if unit.player != player and unit.is_alive() and unit.type in GP_ELIGIBLE_UNITS)
+    return gp + MAX_GP_PER_DEATH * killable >= game.gp_win_threshold
+
+
+class EndgameSolver:
+    """Forced-win search over whole turns with a transposition table."""
+
+    def __init__(self, game: 'Game', player: int, node_budget: int = ENDGAME_NODE_BUDGET,
+                 time_budget: float = ENDGAME_TIME_BUDGET, max_depth: int = ENDGAME_MAX_DEPTH):
+        """
+        Args:
+            game: Position to solve; `player` must be the side to move. Never modified.
+            player: Player to find a win for
+            node_budget: Unit actions to simulate before giving up
+            time_budget: Seconds before giving up
+            max_depth: Deepest search, in turns
+        """
+        self.game = game
+        self.player = player
+        self.node_budget = node_budget
+        self.time_budget = time_budget
+        self.max_depth = max_depth
+        # position key -> (depth searched, won, winning plan). A win holds at any
+        # greater depth; a failure only at the same or a smaller one.
+        self.table: Dict[Tuple, Tuple[int, bool, Optional[TurnPlan]]] = {}
+        self._nodes = 0
+        self._tt_hits = 0
+        self._deadline = 0.0
+        # Chance outcomes inside the tree; seeded per position so solves are reproducible
+        self.rng = search_rng(game, player, "endgame")
+
+    def solve(self) -> EndgameResult:
+        """
+        Deepen one turn at a time until a win is found, the depth limit
+        is reached, or the budget runs out.
+
+        The search runs on a clone drawing from the solver's own generator, so
+        solving does not change how the live game plays out.
+
+        Returns:
+            EndgameResult for the solving player
+        """
+        result = EndgameResult()
+        start = time.perf_counter()
+        self._deadline = start + self.time_budget
+        try:
+            with message_log.suppressed():
+                root = self.game.clone(rng=self.rng)
+                for depth in range(1, self.max_depth + 1):
+                    try:
+                        won, plan = self._search(root, depth)
+                    except _OutOfBudget:
+                        break
+                    result.depth = depth
+                    if won:
+                        result.solved, result.plan, result.turns_to_win = True, plan, depth
+                        break
+        finally:
+            result.nodes = self._nodes
+            result.tt_hits = self._tt_hits
+            result.elapsed = time.perf_counter() - start
+        logger.info(f"Endgame solve for P{self.player}: depth {result.depth}, solved {result.solved}, "
+                    f"{result.nodes} nodes in {result.elapsed:.2f}s")
+        return result
+
+    # -- search ---------------------------------------------------------------------
+
+    def _search(self, state: 'Game', depth: int) -> Tuple[bool, Optional[TurnPlan]]:
+        """
+        Whether the solving player wins from `state` within `depth` turns.
+
+        Returns:
+            (won, plan): on the solving player's turns, plan is a winning turn
+        """
+        if state.winner:
+            return state.winner == self.player, None
+        if depth == 0 or not win_reachable(state, self.player):
+            return False, None
+        ours = state.current_player == self.player
+        if not ours and any(dead.player == state.current_player and dead.ready_for_respawn
+                            for dead in state.dead_units):
+            return False, None
+
+        key = position_key(state)
+        entry = self.table.get(key)
+        if entry is not None:
+            entry_depth, entry_won, entry_plan = entry
+            if (entry_won and entry_depth <= depth) or (not entry_won and entry_depth >= depth):
+                self._tt_hits += 1
+                return entry_won, entry_plan
+
+        won, plan = not ours, None
+        rolls = state.rng.getstate()
+        for turn, child in self._turns(state, state.current_player):
+            # A turn decided by a roll proves nothing: another roll may not lose
+            child_won = child.rng.getstate() == rolls and self._search(child, depth - 1)[0]
+            if ours and child_won:
+                won, plan = True, turn
+                break
+            if not ours and not child_won:
+                won = False
+                break
+
+        self.table[key] = (depth, won, plan)
+        return won, plan
+
+    def _tick(self) -> None:
+        self._nodes += 1
+        if self._nodes > self.node_budget or time.perf_counter() > self._deadline:
+            raise _OutOfBudget()
+
+    # -- move generation --------------------------------------------------------------
+
+    def _turns(self, state: 'Game', side: int) -> Iterator[Tuple[TurnPlan, 'Game']]:
+        """
+        Yield (plan, position after the turn) for every joint turn of `side`.
+
+        Units are given orders one after another on successive clones, so each
+        unit's legal actions account for the orders already queued.
+        """
+        actors = [i for i, unit in enumerate(state.units)
+                  if unit.player == side and unit.is_alive() and self._can_take_orders(unit)]
+        if not actors:
+            self._tick()
+            child = state.clone()
+            self._finish_turn(child)
+            yield (), child
+            return
+        yield from self._extend(state, actors, 0, ())
+
+    def _extend(self, state: 'Game', actors: List[int], k: int,
+                plan: TurnPlan) -> Iterator[Tuple[TurnPlan, 'Game']]:
+        unit = state.units[actors[k]]
+        last = k + 1 == len(actors)
+        actions = (self._forcing_actions(state, unit) if unit.player == self.player
+                   else self._replies(state, unit))
+        for action in actions:
+            self._tick()
+            if action == UnitAction() and not last:
+                # Waiting queues nothing: the next unit can order from this position
+                child = state
+            else:
+                memo = {}
+                child = state.clone(memo)
+                skill = memo.get(id(action.skill)) if action.skill is not None else None
+                if not queue_unit_action(child, memo[id(unit)], action._replace(skill=skill)):
+                    continue
+            skill_index = unit.active_skills.index(action.skill) if action.skill is not None else None
+            step = (actors[k], action.move, action.attack, skill_index, action.target)
+            if not last:
+                yield from self._extend(child, actors, k + 1, plan + (step,))
+            else:
+                self._finish_turn(child)
+                yield plan + (step,), child
+
+    @staticmethod
+    def _finish_turn(state: 'Game') -> None:
+        state.execute_turn(ui=None)
+        state.check_game_over()
+
+    @staticmethod
+    def _can_take_orders(unit: 'Unit') -> bool:
+        return not (getattr(unit, 'is_topiary', False) or getattr(unit, 'neural_shunt_affected', False)
+                    or getattr(unit, 'jawline_affected', False))
+
+    @staticmethod
+    def _covers_enemy(target: Tuple[int, int], area: int, enemies: List[Tuple[int, int]]) -> bool:
+        return any(max(abs(y - target[0]), abs(x - target[1])) <= area for y, x in enemies)
+
+    @classmethod
+    def _replies(cls, state: 'Game', unit: 'Unit') -> Iterator[UnitAction]:
+        """
+        Every legal action of an opponent unit, lazily: waiting, then forcing
+        actions as they are found, then quiet moves. Most refutations come early,
+        and a refuted node never enumerates the rest.
+        """
+        enemies = [(u.y, u.x) for u in state.units if u.player != unit.player and u.is_alive()]
+        yield UnitAction()
+        quiet = []
+        for action in legal_actions(state, unit, include_wait=False):
+            if action.attack is not None or (action.skill is not None and action.target is not None and
+                                             cls._covers_enemy(action.target, action.skill.area or 0, enemies)):
+                yield action
+            else:
+                quiet.append(action)
+        yield from quiet
+
+    @classmethod
+    def _forcing_actions(cls, state: 'Game', unit: 'Unit') -> Iterator[UnitAction]:
+        """
+        The solving side's candidate orders, lazily: each distinct attack, and
+        each skill target whose area covers an enemy, once from the first tile
+        (standing still first) that reaches it; then waiting.
+        """
+        enemies = [(u.y, u.x) for u in state.units if u.player != unit.player and u.is_alive()]
+        skills = [skill for skill in unit.active_skills if skill.current_cooldown == 0]
+        seen = set()
+        for move in [None] + state.get_possible_moves(unit):
+            found = []
+            for target in state.get_possible_attacks(unit, move):
+                if target not in seen:
+                    seen.add(target)
+                    found.append(UnitAction(move=move, attack=target))
+            # can_use() reads move_target for the cast origin; restore it before yielding
+            queued_move = unit.move_target
+            unit.move_target = move
+            try:
+                for skill in skills:
+                    area = skill.area or 0
+                    for target in skill_target_candidates(skill, unit, state, validate=False):
+                        effect = (id(skill), target)
+                        if (effect not in seen and cls._covers_enemy(target, area, enemies)
+                                and skill.can_use(unit, target, state)):
+                            seen.add(effect)
+                            found.append(UnitAction(move=move, skill=skill, target=target))
+            finally:
+                unit.move_target = queued_move
+            yield from found
+        yield UnitAction()
+
+
+def plan_to_actions(game: 'Game', plan: TurnPlan) -> List[Tuple['Unit', UnitAction]]:
+    """
+    Express a solver plan in a game's own units and skills.
+
+    Args:
+        game: The solved position (or a clone of it with the same unit order)
+        plan: EndgameResult.plan
+
+    Returns:
+        (unit, UnitAction) pairs in order
+    """
+    steps = []
+    for unit_index, move, attack, skill_index, target in plan:
+        unit = game.units[unit_index]
+        skill = unit.active_skills[skill_index] if skill_index is not None else None
+        steps.append((unit, UnitAction(move=move, attack=attack, skill=skill, target=target)))
+    return steps
+
+
+def main(argv=None) -> int:
+    """Benchmark the solver on endgames reached by self-play."""
+    import argparse
+    import logging
+    from boneglaive.ai.selfplay import MAPS
+    from boneglaive.ai.smart_ai import SmartAI
+    from boneglaive.game.engine import Game
+
+    parser = argparse.ArgumentParser(description="Benchmark the endgame solver")
+    parser.add_argument("--positions", type=int, default=4, help="endgame positions to solve")
+    parser.add_argument("--maps", nargs="+", default=list(MAPS))
+    parser.add_argument("--units", type=int, default=ENDGAME_UNIT_THRESHOLD - 1,
+                        help="living units at which a position is solved")
+    parser.add_argument("--nodes", type=int, default=ENDGAME_NODE_BUDGET)
+    parser.add_argument("--time", type=float, default=ENDGAME_TIME_BUDGET)
+    parser.add_argument("--depth", type=int, default=ENDGAME_MAX_DEPTH)
+    args = parser.parse_args(argv)
+    logging.disable(logging.CRITICAL)
+
+    # Reach positions with few units by self-play with the solver switched off
+    def factory(game, player):
+        return SmartAI(game, player_number=player, beam_width=0, endgame_threshold=0)
+
+    rows = []
+    seed = 0
+    while len(rows) < args.positions and seed < args.positions * 20:
+        map_name = args.maps[seed % len(args.maps)]
+        random.seed(seed)
+        game = Game(skip_setup=True, map_name=map_name)
+        controllers = {p: factory(game, p) for p in (1, 2)}
+        with message_log.suppressed():
+            for _ in range(300):
+                if game.winner or live_unit_count(game) <= args.units:
+                    break
+                controllers[game.current_player].process_turn()
+                game.execute_turn(ui=None)
+                game.check_game_over()
+        seed += 1
+        if game.winner or live_unit_count(game) > args.units:
+            continue
+        result = EndgameSolver(game, game.current_player, args.nodes, args.time, args.depth).solve()
+        rows.append(result)
+        outcome = f"win in {result.turns_to_win}" if result.solved else "no win"
+        print(f"{map_name:<16} seed {seed - 1:>3}: {live_unit_count(game)} units, "
+              f"GP {game.player1_gp}-{game.player2_gp}, depth {result.depth}, {outcome:>8}, "
+              f"{result.nodes:>5} nodes, {result.tt_hits:>4} tt hits, {result.elapsed:6.2f}s, "
+              f"{result.nodes_per_second:5.0f} nodes/s")
+
+    if rows:
+        nodes = sum(r.nodes for r in rows)
+        elapsed = sum(r.elapsed for r in rows)
+        print(f"\n{len(rows)} positions, {sum(r.solved for r in rows)} solved, "
+              f"mean solve time {elapsed / len(rows):.2f}s, "
+              f"{nodes / elapsed if elapsed else 0:.0f} nodes/s")
+    return 0
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(main())
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Evaluator instrumentation for Smart AI.
+Records time and candidate counts for every TacticalEvaluator evaluator, per AI turn.
+
+Evaluators report their candidates where they produce them: count(generated=n) next to
+the enumeration (reachable tiles, skill_target_candidates, enemy loops) and
+count(scored=n) next to the _score_* calls, so a scorer that rejects most of what it
+sees shows up even when it returns nothing.
+
+Run a batch of headless games and rank the slowest evaluators:
+    python -m boneglaive.ai.evaluator_stats --games 8
+    python -m boneglaive.ai.evaluator_stats --games 8 --rank generated
+"""
+
+import threading
+import time
+from functools import wraps
+from typing import Dict, List, Optional, Tuple
+
+
+class EvaluatorRecord:
+    """Accumulated cost of one evaluator."""
+
+    def __init__(self):
+        self.calls: int = 0
+        self.total_time: float = 0.0  # Seconds, including evaluators it calls
+        self.self_time: float = 0.0   # Seconds, excluding instrumented evaluators it calls
+        self.max_time: float = 0.0    # Slowest single call (inclusive)
+        self.generated: int = 0       # Candidate targets enumerated
+        self.scored: int = 0          # Candidates that passed validity and were scored
+        self.returned: int = 0        # Candidate actions returned
+
+    def add(self, elapsed: float, self_elapsed: float, generated: int, scored: int,
+            returned: int) -> None:
+        """Record one call."""
+        self.calls += 1
+        self.total_time += elapsed
+        self.self_time += self_elapsed
+        self.max_time = max(self.max_time, elapsed)
+        self.generated += generated
+        self.scored += scored
+        self.returned += returned
+
+    def merge(self, other: 'EvaluatorRecord') -> None:
+        """Fold another record into this one."""
+        self.calls += other.calls
+        self.total_time += other.total_time
+        self.self_time += other.self_time
+        self.max_time = max(self.max_time, other.max_time)
+        self.generated += other.generated
+        self.scored += other.scored
+        self.returned += other.returned
+
+
+class EvaluatorStats:
+    """
+    Collects EvaluatorRecords per AI turn and across a whole session.
+
+    Disabled by default; instrumented evaluators cost one attribute check
+    while it is off.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.turns: List[Tuple[str, Dict[str, EvaluatorRecord]]] = []  # (label, records) per AI turn
+        self.totals: Dict[str, EvaluatorRecord] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()  # Per-thread call stack and open turn
+
+    def reset(self) -> None:
+        """Drop everything recorded so far."""
+        with self._lock:
+            self.turns = []
+            self.totals = {}
+
+    def begin_turn(self, label: str) -> None:
+        """Start collecting a new AI turn on the calling thread."""
+        if self.enabled:
+            self._local.turn = (label, {})
+
+    def end_turn(self) -> None:
+        """Close the calling thread's current AI turn."""
+        turn = getattr(self._local, 'turn', None)
+        self._local.turn = None
+        if turn is not None:
+            with self._lock:
+                self.turns.append(turn)
+
+    def count(self, generated: int = 0, scored: int = 0) -> None:
+        """
+        Credit candidates to the innermost running evaluator on the calling thread.
+
+        Args:
+            generated: Candidate targets just enumerated
+            scored: Candidates just run through a scorer
+        """
+        if not self.enabled:
+            return
+        stack = getattr(self._local, 'stack', None)
+        if stack:
+            frame = stack[-1]
+            frame[1] += generated
+            frame[2] += scored
+
+    def _record(self, name: str, elapsed: float, self_elapsed: float,
+                generated: int, scored: int, returned: int) -> None:
+        counts = (elapsed, self_elapsed, generated, scored, returned)
+        with self._lock:
+            self.totals.setdefault(name, EvaluatorRecord()).add(*counts)
+        turn = getattr(self._local, 'turn', None)
+        if turn is not None:
+            turn[1].setdefault(name, EvaluatorRecord()).add(*counts)
+
+    def ranking(self, key: str = 'self_time') -> List[Tuple[str, EvaluatorRecord]]:
+        """
+        Evaluators ordered by cost, most expensive first.
+
+        Args:
+            key: EvaluatorRecord attribute to rank by
+
+        Returns:
+            (evaluator name, record) pairs
+        """
+        with self._lock:
+            items = list(self.totals.items())
+        return sorted(items, key=lambda item: getattr(item[1], key), reverse=True)
+
+    def format_report(self, limit: Optional[int] = 15, key: str = 'self_time') -> str:
+        """
+        Human-readable table of the most expensive evaluators.
+
+        Args:
+            limit: Rows to show (None for all)
+            key: EvaluatorRecord attribute to rank by (self_time, generated, scored, ...)
+
+        Returns:
+            The report text
+        """
+        ranked = self.ranking(key)
+        grand_self = sum(record.self_time for _, record in ranked) or 1.0
+        turn_count = len(self.turns) or 1
+
+        lines = [f"Evaluator cost over {len(self.turns)} AI turns (ranked by {key.replace('_', ' ')})",
+                 f"{'evaluator':<38}{'calls':>8}{'self ms':>10}{'share':>7}"
+                 f"{'ms/turn':>9}{'ms/call':>9}{'max ms':>9}{'gen':>9}{'scored':>9}{'returned':>9}"]
+        for name, record in ranked[:limit]:
+            lines.append(
+                f"{name:<38}{record.calls:>8}{record.self_time * 1000:>10.1f}"
+                f"{record.self_time / grand_self:>7.1%}{record.self_time * 1000 / turn_count:>9.2f}"
+                f"{record.total_time * 1000 / record.calls:>9.3f}{record.max_time * 1000:>9.2f}"
+                f"{record.generated:>9}{record.scored:>9}{record.returned:>9}")
+        return "\n".join(lines)
+
+
+# Global stats instance
+evaluator_stats = EvaluatorStats()
+
+
+def instrument(func):
+    """Record an evaluator's time and candidate counts while stats are enabled."""
+    name = func.__name__
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if not evaluator_stats.enabled:
+            return func(*args, **kwargs)
+
+        local = evaluator_stats._local
+        stack = getattr(local, 'stack', None)
+        if stack is None:
+            stack = local.stack = []
+
+        stack.append([0.0, 0, 0])  # Time in instrumented callees, generated, scored
+        start = time.perf_counter()
+        try:
+            result = func(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            child_time, generated, scored = stack.pop()
+            if stack:
+                stack[-1][0] += elapsed
+
+        returned = len(result) if isinstance(result, list) else 0
+        evaluator_stats._record(name, elapsed, elapsed - child_time, generated, scored, returned)
+        return result
+
+    wrapper.__wrapped_evaluator__ = True
+    return wrapper
+
+
+def instrument_evaluators(cls):
+    """
+    Class decorator: instrument every _evaluate_* method of an evaluator class.
+
+    Args:
+        cls: Evaluator class
+
+    Returns:
+        The same class
+    """
+    for attr, value in list(vars(cls).items()):
+        if attr.startswith('_evaluate_') and callable(value) \
+                and not getattr(value, '__wrapped_evaluator__', False):
+            setattr(cls, attr, instrument(value))
+    return cls
+
+
+def main(argv=None) -> int:
+    """Play headless games with instrumentation on and print the ranking."""
+    import argparse
+    import logging
+    from boneglaive.ai.selfplay import MAPS, play_headless_game, smart_ai_factory
+    # Under "python -m" this file is __main__; the evaluators report to the imported module's instance
+    from boneglaive.ai.evaluator_stats import evaluator_stats as stats
+
+    parser = argparse.ArgumentParser(description="Rank Smart AI evaluators by cost over headless games")
+    parser.add_argument("--games", type=int, default=4, help="games to play (maps are cycled)")
+    parser.add_argument("--maps", nargs="+", default=list(MAPS), help="maps to cycle through")
+    parser.add_argument("--beam", type=int, default=None, help="beam width for both sides")
+    parser.add_argument("--limit", type=int, default=20, help="rows in the report")
+    parser.add_argument("--rank", default="self_time",
+                        choices=["self_time", "total_time", "calls", "generated", "scored", "returned"],
+                        help="column to rank evaluators by")
+    args = parser.parse_args(argv)
+
+    logging.disable(logging.CRITICAL)
+    stats.reset()
+    stats.enabled = True
+
+    factory = smart_ai_factory(args.beam)
+    for game_index in range(args.games):
+        map_name = args.maps[game_index % len(args.maps)]
+        result = play_headless_game(map_name, seed=game_index, player1=factory, player2=factory)
+        print(f"game {game_index + 1}/{args.games}: {map_name}, winner {result.winner}, "
+              f"{result.turns} turns, {result.elapsed:.1f}s")
+
+    stats.enabled = False
+    print()
+    print(stats.format_report(args.limit, args.rank))
+    return 0
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(main())
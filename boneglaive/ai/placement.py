@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+"""
+Offline setup-phase placement optimizer.
+
+For each map and roster, proposes candidate placements from the engine's own
+formations (clustered, line, triangle and scattered, with shuffled unit-to-tile
+assignment). Each candidate is scored by headless playouts through the real
+setup phase, against a fixed set of random opponent setups. Every candidate
+meets the same opponents, so the scores can be compared. The same opponents
+also meet a random formation per playout, the placement the AI makes without a
+book. The winner is stored in the opening book (boneglaive.game.opening_book),
+which the AI's setup path reads at game start, but only when it beats that
+random-formation baseline.
+
+The book is saved after every roster. Rosters already in the book are skipped
+unless --force is given, so an interrupted run continues where it stopped.
+
+    python -m boneglaive.ai.placement --maps lime_foyer --random-rosters 10 --workers 16
+"""
+
+import os
+import random
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import combinations
+from typing import Dict, List, Optional, Sequence, Tuple, TYPE_CHECKING
+from boneglaive.utils.constants import HEIGHT, MAX_UNITS, WIDTH, UnitType
+from boneglaive.utils.debug import logger
+from boneglaive.game.opening_book import OpeningBook, Placement, roster_key
+from boneglaive.game.recruitment import RECRUITMENT_ORDER
+
+if TYPE_CHECKING:
+    from boneglaive.game.engine import Game
+
+FORMATIONS = ("clustered", "line", "triangle", "scattered")
+
+DEFAULT_CANDIDATES = 12      # placements tried per roster
+DEFAULT_PLAYOUTS = 8         # opponent setups each candidate is played against
+DEFAULT_PLACEMENT_TURNS = 200
+
+
+def _placeable_tiles(game: 'Game') -> List[Tuple[int, int]]:
+    return [(y, x) for y in range(HEIGHT) for x in range(WIDTH) if game.map.can_place_unit(y, x)]
+
+
+def setup_game(map_name: str, seed: int, placements: Dict[int, Placement]) -> 'Game':
+    """
+    Build a game through the real setup phase with fixed placements for both players.
+
+    Args:
+        map_name: Map to play on
+        seed: Seed for the global random module (placement conflicts, passives)
+        placements: Player -> [(unit type, y, x), ...]
+
+    Returns:
+        A game ready for player 1's first turn
+
+    Raises:
+        ValueError: If a placement is rejected by the setup phase
+    """
+    from boneglaive.game.engine import Game
+
+    random.seed(seed)
+    game = Game(skip_setup=False, map_name=map_name)
+    # Hot-seat setup so both players place their own units
+    game.local_multiplayer = True
+    for player in (1, 2):
+        for unit_type, y, x in placements[player]:
+            if game.place_setup_unit(y, x, unit_type) is not True:
+                raise ValueError(f"Cannot place {unit_type.name} for player {player} at ({y}, {x})")
+        game.confirm_setup()
+    game.local_multiplayer = False
+    return game
+
+
+def opponent_placement(game: 'Game', seed: int, player: Optional[int] = None) -> Placement:
+    """
+    A random roster at random tiles: one stand-in for an unknown human setup.
+
+    Args:
+        game: Any game on the map (only its placeable tiles are read)
+        seed: Seed for the roster and tiles
+        player: Draw an independent setup per player for the same seed (None = the book's opponents)
+    """
+    rng = random.Random(f"opponent:{seed}" if player is None else f"opponent:{seed}:{player}")
+    roster = rng.sample(RECRUITMENT_ORDER, MAX_UNITS)
+    tiles = rng.sample(_placeable_tiles(game), MAX_UNITS)
+    return [(unit_type, y, x) for unit_type, (y, x) in zip(roster, tiles)]
+
+
+def random_setup_game(map_name: str, seed: int) -> 'Game':
+    """
+    Build a game through the real setup phase with a random roster at random
+    tiles for each player, so neither side is the fixed default roster.
+
+    Args:
+        map_name: Map to play on
+        seed: Seed for both rosters, their tiles and the setup phase
+
+    Returns:
+        A game ready for player 1's first turn
+    """
+    from boneglaive.game.engine import Game
+
+    board = Game(skip_setup=False, map_name=map_name)
+    return setup_game(map_name, seed, {player: opponent_placement(board, seed, player) for player in (1, 2)})
+
+
+def candidate_placements(map_name: str, roster: Sequence[UnitType], count: int,
+                         seed: int = 0) -> List[Placement]:
+    """
+    Distinct placements for a roster, drawn from the engine's formations.
+
+    The global random state is restored afterwards.
+
+    Args:
+        map_name: Map to place on
+        roster: Unit types to place
+        count: Placements wanted (fewer if the map cannot produce that many distinct ones)
+        seed: Seed for the formations
+
+    Returns:
+        Up to `count` placements
+    """
+    from boneglaive.game.engine import Game
+
+    state = random.getstate()
+    try:
+        random.seed(f"placement:{map_name}:{roster_key(roster)}:{seed}")
+        game = Game(skip_setup=False, map_name=map_name)
+        tiles = _placeable_tiles(game)
+        candidates, seen = [], set()
+        for attempt in range(count * 4):
+            if len(candidates) >= count:
+                break
+            shuffled = list(tiles)
+            random.shuffle(shuffled)
+            positions = game._select_positions_by_formation(
+                shuffled, FORMATIONS[attempt % len(FORMATIONS)], "full_map")
+            types = list(roster)
+            random.shuffle(types)
+            placement = [(t, y, x) for t, (y, x) in zip(types, positions)]
+            key = frozenset(placement)
+            if len(placement) == len(roster) and len({(y, x) for _, y, x in placement}) == len(roster) \
+                    and key not in seen:
+                seen.add(key)
+                candidates.append(placement)
+        return candidates
+    finally:
+        random.setstate(state)
+
+
+def random_formations(map_name: str, roster: Sequence[UnitType], count: int,
+                      seed: int = 0) -> List[Placement]:
+    """
+    Placements the AI's setup makes without a book entry: a random formation
+    on shuffled tiles with a random unit-to-tile assignment.
+
+    The global random state is restored afterwards.
+
+    Args:
+        map_name: Map to place on
+        roster: Unit types to place
+        count: Placements wanted (duplicates allowed)
+        seed: Seed for the formations
+
+    Returns:
+        `count` placements
+    """
+    from boneglaive.game.engine import Game
+
+    state = random.getstate()
+    try:
+        random.seed(f"baseline:{map_name}:{roster_key(roster)}:{seed}")
+        game = Game(skip_setup=False, map_name=map_name)
+        tiles = _placeable_tiles(game)
+        placements = []
+        while len(placements) < count:
+            shuffled = list(tiles)
+            random.shuffle(shuffled)
+            positions = game._select_positions_by_formation(shuffled, random.choice(FORMATIONS), "full_map")
+            types = list(roster)
+            random.shuffle(types)
+            placement = [(t, y, x) for t, (y, x) in zip(types, positions)]
+            if len(placement) == len(roster) and len({(y, x) for _, y, x in placement}) == len(roster):
+                placements.append(placement)
+        return placements
+    finally:
+        random.setstate(state)
+
+
+def _playout(task: Tuple[str, int, List[Tuple[str, int, int]], int, Optional[int], int]) -> Tuple[float, int]:
+    """
+    Worker: play one candidate against one opponent setup.
+
+    Returns:
+        (score for the candidate's player: 1 win, 0.5 draw, 0 loss, GP lead)
+    """
+    import logging
+    from boneglaive.utils.message_log import message_log
+    from boneglaive.game.engine import Game
+    from boneglaive.ai.selfplay import play_out, smart_ai_factory
+
+    map_name, player, placement, seed, beam_width, max_turns = task
+    logging.disable(logging.CRITICAL)
+    candidate = [(UnitType[name], y, x) for name, y, x in placement]
+    with message_log.suppressed():
+        opponent = opponent_placement(Game(skip_setup=False, map_name=map_name), seed)
+        game = setup_game(map_name, seed, {player: candidate, 3 - player: opponent})
+        factory = smart_ai_factory(beam_width)
+        result = play_out(game, factory, factory, max_turns, seed)
+    gp = {1: result.player1_gp, 2: result.player2_gp}
+    score = 0.5 if result.winner is None else float(result.winner == player)
+    return score, gp[player] - gp[3 - player]
+
+
+class PlacementOptimizer:
+    """Scores candidate placements per map and roster, and records the best in a book."""
+
+    def __init__(self, book: OpeningBook, player: int = 2, candidates: int = DEFAULT_CANDIDATES,
+                 playouts: int = DEFAULT_PLAYOUTS, beam_width: Optional[int] = 0,
+                 max_turns: int = DEFAULT_PLACEMENT_TURNS, executor: Optional[Executor] = None):
+        """
+        Args:
+            book: Opening book results are recorded in
+            player: Seat the placements are optimized for (the vs-AI opponent is player 2)
+            candidates: Placements tried per roster
+            playouts: Opponent setups each candidate plays against
+            beam_width: SmartAI beam width for both sides in playouts
+            max_turns: Turn limit per playout
+            executor: Pool to run playouts on (None plays them in this process)
+        """
+        self.book = book
+        self.player = player
+        self.candidates = candidates
+        self.playouts = playouts
+        self.beam_width = beam_width
+        self.max_turns = max_turns
+        self.executor = executor
+
+    def optimize(self, map_name: str, roster: Sequence[UnitType]) -> Optional[Tuple[Placement, float]]:
+        """
+        Find the best placement for one roster on one map and record it if it
+        beats the random-formation baseline.
+
+        Returns:
+            (best placement, its mean score), or None when no candidate won
+            more often than the baseline and nothing was recorded
+        """
+        candidates = candidate_placements(map_name, roster, self.candidates)
+        # Playout `seed` of the baseline meets the same opponent as every candidate's
+        baselines = random_formations(map_name, roster, self.playouts)
+        tasks = [(map_name, self.player, [(t.name, y, x) for t, y, x in placement], seed,
+                  self.beam_width, self.max_turns)
+                 for placement in candidates for seed in range(self.playouts)]
+        tasks += [(map_name, self.player, [(t.name, y, x) for t, y, x in placement], seed,
+                   self.beam_width, self.max_turns)
+                  for seed, placement in enumerate(baselines)]
+        if self.executor is None:
+            outcomes = [_playout(task) for task in tasks]
+        else:
+            outcomes = list(self.executor.map(_playout, tasks))
+
+        def mean(games: List[Tuple[float, int]]) -> Tuple[float, float]:
+            return sum(s for s, _ in games) / len(games), sum(g for _, g in games) / len(games)
+
+        best, best_key = None, None
+        for index, placement in enumerate(candidates):
+            key = mean(outcomes[index * self.playouts:(index + 1) * self.playouts])
+            if best_key is None or key > best_key:
+                best, best_key = placement, key
+        baseline_key = mean(outcomes[len(candidates) * self.playouts:])
+
+        # Win rate must improve; a GP lead alone does not justify a book entry
+        if best_key[0] <= baseline_key[0]:
+            logger.info(f"No placement for {roster_key(roster)} on {map_name} beat random formations "
+                        f"({best_key[0]:.3f} vs {baseline_key[0]:.3f})")
+            return None
+        self.book.record(map_name, self.player, best, best_key[0], self.playouts)
+        logger.info(f"Best placement for {roster_key(roster)} on {map_name}: {best} "
+                    f"({best_key[0]:.3f} vs {baseline_key[0]:.3f} for random formations)")
+        return best, best_key[0]
+
+
+def all_rosters() -> List[Tuple[UnitType, ...]]:
+    """Every roster the AI setup can draw: MAX_UNITS distinct recruitable types."""
+    return list(combinations(RECRUITMENT_ORDER, MAX_UNITS))
+
+
+def main(argv=None) -> int:
+    """Optimize placements and write them to the opening book."""
+    import argparse
+    from boneglaive.ai.tournament import available_maps
+
+    parser = argparse.ArgumentParser(description="Build the AI's opening book by headless playouts")
+    parser.add_argument("--maps", nargs="+", default=None, help="maps (default: all in maps/)")
+    parser.add_argument("--roster", action="append", default=[],
+                        help="comma-separated unit types, e.g. GLAIVEMAN,GRAYMAN,LANDSCAPER")
+    parser.add_argument("--random-rosters", type=int, default=0, help="also optimize N random rosters")
+    parser.add_argument("--all-rosters", action="store_true", help="optimize every possible roster")
+    parser.add_argument("--player", type=int, default=2, choices=(1, 2))
+    parser.add_argument("--candidates", type=int, default=DEFAULT_CANDIDATES)
+    parser.add_argument("--playouts", type=int, default=DEFAULT_PLAYOUTS)
+    parser.add_argument("--beam", type=int, default=0, help="beam width for both sides")
+    parser.add_argument("--max-turns", type=int, default=DEFAULT_PLACEMENT_TURNS)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="playout processes (1 plays in this process)")
+    parser.add_argument("--book", default=None, help="opening book file (default: the game's book)")
+    parser.add_argument("--force", action="store_true", help="re-optimize rosters already in the book")
+    parser.add_argument("--seed", type=int, default=0, help="seed for --random-rosters")
+    args = parser.parse_args(argv)
+
+    try:
+        rosters = [tuple(UnitType[name.strip().upper()] for name in text.split(",")) for text in args.roster]
+    except KeyError as e:
+        parser.error(f"Unknown unit type {e}")
+    if args.all_rosters:
+        rosters += all_rosters()
+    elif args.random_rosters:
+        rosters += random.Random(args.seed).sample(all_rosters(), args.random_rosters)
+    if not rosters:
+        parser.error("give --roster, --random-rosters or --all-rosters")
+
+    book = OpeningBook(args.book) if args.book else OpeningBook()
+    maps = args.maps or available_maps()
+    jobs = [(m, r) for m in maps for r in rosters if args.force or not book.has(m, args.player, r)]
+    print(f"{len(jobs)} map/roster pairs to optimize ({len(maps) * len(rosters) - len(jobs)} already in the book)")
+
+    executor = ProcessPoolExecutor(args.workers) if args.workers > 1 else None
+    try:
+        optimizer = PlacementOptimizer(book, args.player, args.candidates, args.playouts,
+                                       args.beam, args.max_turns, executor)
+        for index, (map_name, roster) in enumerate(jobs):
+            result = optimizer.optimize(map_name, roster)
+            if result is None:
+                print(f"[{index + 1}/{len(jobs)}] {map_name} {roster_key(roster)}: "
+                      f"no placement beat random formations")
+                continue
+            placement, score = result
+            book.save()
+            tiles = ", ".join(f"{t.name}@{y},{x}" for t, y, x in placement)
+            print(f"[{index + 1}/{len(jobs)}] {map_name} {roster_key(roster)}: {score:.3f}  {tiles}")
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    print(f"Opening book written to {book.path}")
+    return 0
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(main())
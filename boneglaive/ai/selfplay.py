@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Headless self-play for Smart AI.
+Plays complete games between two AI controllers without a renderer.
+"""
+
+import random
+import time
+from typing import Callable, Dict, List, Optional, TYPE_CHECKING
+from boneglaive.utils.debug import logger
+
+if TYPE_CHECKING:
+    from boneglaive.game.engine import Game
+    from boneglaive.ai.weights import AIWeights
+
+# Safety valve: a game that has not produced a winner after this many turns
+# (both players counted) is scored as a draw.
+DEFAULT_MAX_TURNS = 300
+
+MAPS = ("lime_foyer", "stained_stones", "hard_pressed", "verdant_terrace")
+
+# Builds an AI controller for one side: (game, player_number) -> object with process_turn()
+ControllerFactory = Callable[['Game', int], object]
+
+
+class GameResult:
+    """Outcome of one headless game."""
+
+    def __init__(self, map_name: str, seed: Optional[int], winner: Optional[int],
+                 turns: int, player1_gp: int, player2_gp: int, elapsed: float,
+                 units: Optional[Dict[int, List[str]]] = None,
+                 think_time: Optional[Dict[int, float]] = None):
+        self.map_name = map_name
+        self.seed = seed
+        self.winner = winner          # 1, 2, or None for a draw (turn limit)
+        self.turns = turns            # Player turns played (both sides)
+        self.player1_gp = player1_gp
+        self.player2_gp = player2_gp
+        self.elapsed = elapsed        # Wall-clock seconds
+        self.units = units or {}      # Player -> starting unit type names
+        self.think_time = think_time or {}  # Player -> CPU seconds spent in process_turn()
+
+    def to_dict(self) -> Dict[str, object]:
+        """Plain-data form for logs and result files."""
+        return dict(self.__dict__)
+
+
+def smart_ai_factory(beam_width: Optional[int] = None,
+                     weights: Optional['AIWeights'] = None,
+                     difficulty: Optional[str] = None,
+                     plan_budget: Optional[int] = None) -> ControllerFactory:
+    """
+    Factory for SmartAI controllers.
+
+    Args:
+        beam_width: Joint-plan beam width (None keeps the difficulty's or SmartAI's default)
+        weights: Scoring weights (None keeps the defaults)
+        difficulty: ai_difficulty preset to start from (None = SmartAI's defaults)
+        plan_budget: Planner nodes per turn (None = unlimited)
+
+    Returns:
+        A ControllerFactory
+    """
+    def build(game: 'Game', player: int):
+        from boneglaive.ai.smart_ai import SmartAI, difficulty_options
+        options = difficulty_options(difficulty) if difficulty is not None else {}
+        if plan_budget is not None:
+            options['plan_budget'] = plan_budget
+        if beam_width is not None:
+            options['beam_width'] = beam_width
+        if weights is not None:
+            options['weights'] = weights
+        return SmartAI(game, player_number=player, **options)
+    return build
+
+
+def play_headless_game(map_name: str = "lime_foyer", seed: Optional[int] = None,
+                       player1: Optional[ControllerFactory] = None,
+                       player2: Optional[ControllerFactory] = None,
+                       max_turns: int = DEFAULT_MAX_TURNS,
+                       random_rosters: bool = False) -> GameResult:
+    """
+    Play one complete game between two AI controllers.
+
+    Args:
+        map_name: Map to play on
+        seed: Seed for the global random module (None leaves it alone)
+        player1: Factory for player 1's controller (default SmartAI)
+        player2: Factory for player 2's controller (default SmartAI)
+        max_turns: Turn limit after which the game is scored as a draw
+        random_rosters: Set the game up through the real setup phase with a
+                        random roster and placement per side, drawn from the
+                        seed (False uses the fixed skip-setup units)
+
+    Returns:
+        GameResult for the game
+    """
+    from boneglaive.game.engine import Game
+
+    if random_rosters:
+        from boneglaive.ai.placement import random_setup_game
+        if seed is None:
+            seed = random.randrange(2 ** 31)
+        game = random_setup_game(map_name, seed)
+        return play_out(game, player1, player2, max_turns, seed)
+
+    if seed is not None:
+        random.seed(seed)
+
+    game = Game(skip_setup=True, map_name=map_name)
+    return play_out(game, player1, player2, max_turns, seed)
+
+
+def play_out(game: 'Game', player1: Optional[ControllerFactory] = None,
+             player2: Optional[ControllerFactory] = None,
+             max_turns: int = DEFAULT_MAX_TURNS, seed: Optional[int] = None) -> GameResult:
+    """
+    Play a game that is already set up to its end between two AI controllers.
+
+    Args:
+        game: Game past its setup phase
+        player1: Factory for player 1's controller (default SmartAI)
+        player2: Factory for player 2's controller (default SmartAI)
+        max_turns: Turn limit after which the game is scored as a draw
+        seed: Seed the game was set up with (recorded in the result only)
+
+    Returns:
+        GameResult for the game
+    """
+    factories = {1: player1 or smart_ai_factory(), 2: player2 or smart_ai_factory()}
+    controllers = {player: factory(game, player) for player, factory in factories.items()}
+
+    units = {player: sorted(u.type.name for u in game.units if u.player == player)
+             for player in factories}
+    think_time = {player: 0.0 for player in factories}
+
+    start = time.perf_counter()
+    turns = 0
+    while not game.winner and turns < max_turns:
+        think_start = time.process_time()
+        controllers[game.current_player].process_turn()
+        think_time[game.current_player] += time.process_time() - think_start
+        game.execute_turn(ui=None)
+        game.check_game_over()
+        turns += 1
+    elapsed = time.perf_counter() - start
+
+    logger.info(f"Self-play on {game.map_name} (seed {seed}): winner {game.winner}, "
+                f"{turns} turns, GP {game.player1_gp}-{game.player2_gp}, {elapsed:.2f}s")
+
+    return GameResult(game.map_name, seed, game.winner, turns,
+                      game.player1_gp, game.player2_gp, elapsed, units, think_time)
@@ -4,11 +4,16 @@ Smart AI Controller for Boneglaive.
 Orchestrates modular AI systems for intelligent gameplay.
 """
 
-from typing import Optional, TYPE_CHECKING
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+import numpy as np
 from boneglaive.utils.debug import logger
 from boneglaive.ai.battlefield_analyzer import BattlefieldAnalyzer
-from boneglaive.ai.strategic_planner import StrategicPlanner
 from boneglaive.ai.tactical_evaluator import TacticalEvaluator, Action
+from boneglaive.ai.evaluator_stats import evaluator_stats
+from boneglaive.ai.weights import AIWeights, DEFAULT_WEIGHTS
+from boneglaive.ai.endgame import (EndgameSolver, ENDGAME_UNIT_THRESHOLD, live_unit_count,
+                                   plan_to_actions)
+from boneglaive.ai.turn_planner import TurnPlanner, DEFAULT_BEAM_WIDTH, queue_action
 
 if TYPE_CHECKING:
     from boneglaive.game.engine import Game
@@ -16,25 +21,86 @@ if TYPE_CHECKING:
     from boneglaive.graphical.ui_adapter import GraphicalUIAdapter
 
 
+# SmartAI options for each ai_difficulty setting. Medium is the default
+# configuration; easy picks each unit's best action in turn without a joint
+# search; hard keeps a wider beam and is the only level that runs the endgame
+# solver.
+DIFFICULTY_OPTIONS: Dict[str, Dict[str, int]] = {
+    "easy": {'beam_width': 0},
+    "medium": {},
+    "hard": {'beam_width': 8, 'endgame_threshold': ENDGAME_UNIT_THRESHOLD},
+}
+
+
+def difficulty_options(difficulty: str) -> Dict[str, int]:
+    """
+    SmartAI keyword arguments for a difficulty level.
+
+    Raises:
+        ValueError: If the level is not one of DIFFICULTY_OPTIONS
+    """
+    if difficulty not in DIFFICULTY_OPTIONS:
+        raise ValueError(f"Unknown AI difficulty '{difficulty}' "
+                         f"(expected one of {', '.join(DIFFICULTY_OPTIONS)})")
+    return dict(DIFFICULTY_OPTIONS[difficulty])
+
+
+class TurnDecision:
+    """Everything an AI turn queued, in order, so it can be replayed on another game."""
+
+    def __init__(self):
+        self.respawns: List[Tuple[object, Tuple[int, int]]] = []  # (DeadUnit, spawn position)
+        self.steps: List[Tuple['Unit', Action]] = []              # (unit, action) in queue order
+
+
 class SmartAI:
     """Intelligent AI controller using modular decision-making systems."""
 
-    def __init__(self, game: 'Game', ui: Optional['GraphicalUIAdapter'] = None):
+    def __init__(self, game: 'Game', ui: Optional['GraphicalUIAdapter'] = None,
+                 beam_width: int = DEFAULT_BEAM_WIDTH, player_number: int = 2,
+                 weights: AIWeights = DEFAULT_WEIGHTS,
+                 endgame_threshold: int = 0,
+                 plan_budget: Optional[int] = None):
         """
         Initialize the Smart AI.
 
         Args:
             game: Reference to the Game instance
             ui: Optional reference to the graphical UI adapter (for animations)
+            beam_width: Joint-plan beam width; 0 takes each unit's best action in
+                        turn, scored against the board earlier units leave
+                        behind (cheapest)
+            player_number: Player this AI controls (the vs-AI mode always uses 2;
+                           headless self-play runs one controller per side)
+            weights: Scoring weights and strategy thresholds (see boneglaive.ai.weights)
+            endgame_threshold: Search for a forced win when fewer living units than
+                               this remain (see boneglaive.ai.endgame); 0 (the
+                               default) disables
+            plan_budget: Child states the joint planner may simulate per turn before
+                         finishing greedily (None = no limit)
         """
         self.game = game
         self.ui = ui
-        self.player_number = 2  # AI is always player 2
+        self.player_number = player_number
 
         # Initialize AI modules
         self.analyzer = BattlefieldAnalyzer(game, self.player_number)
-        self.planner = StrategicPlanner(game, self.player_number)
-        self.evaluator = TacticalEvaluator(game, self.player_number)
+        self.weights = weights
+        self.evaluator = TacticalEvaluator(game, self.player_number, weights)
+        self.beam_width = beam_width
+        self.plan_budget = plan_budget
+        self.turn_planner = (TurnPlanner(game, self.player_number, beam_width=beam_width,
+                                         weights=weights, node_budget=plan_budget)
+                             if beam_width > 0 else None)
+        # Without a beam, units still act on a clone in turn so each sees what the
+        # previous one did (see _process_units)
+        self.greedy_planner = TurnPlanner(game, self.player_number, beam_width=1, branching=1,
+                                          weights=weights)
+        self.endgame_threshold = endgame_threshold
+        self.last_endgame = None  # EndgameResult of the most recent solve, if any
+
+        # What the most recent process_turn() queued (see BackgroundTurn)
+        self.last_decision = TurnDecision()
 
         logger.info("Smart AI initialized")
 
@@ -45,21 +111,25 @@ class SmartAI:
         Returns:
             True if turn processed successfully
         """
+        evaluator_stats.begin_turn(f"P{self.player_number} turn {self.game.turn}")
+        self.last_decision = TurnDecision()
         try:
             # Analyze the battlefield
             analysis = self.analyzer.analyze()
 
-            # Create strategic plan
-            plan = self.planner.plan(analysis)
-
             # Handle respawns if any
             self._handle_respawns(analysis)
 
-            # Process each unit
-            for unit in analysis.ai_units:
-                self._process_unit(unit, analysis, plan)
-
-                # Update UI after each unit
+            if self._play_endgame():
+                if self.ui:
+                    self.ui.draw_board()
+            elif self.turn_planner:
+                # Search joint actions across all units, then queue the winning plan
+                self._queue_plan(self.turn_planner.plan_turn(analysis.ai_units, analysis))
+                if self.ui:
+                    self.ui.draw_board()
+            else:
+                self._process_units(analysis)
                 if self.ui:
                     self.ui.draw_board()
 
@@ -71,6 +141,32 @@ class SmartAI:
             logger.error(traceback.format_exc())
             return True  # Return True to allow turn to complete
 
+        finally:
+            evaluator_stats.end_turn()
+
+    def _play_endgame(self) -> bool:
+        """
+        With few units left, search for a winning line and queue it.
+
+        Returns:
+            True if the solver found a win and its plan was queued
+        """
+        if not self.endgame_threshold or live_unit_count(self.game) >= self.endgame_threshold:
+            return False
+        if self.game.current_player != self.player_number:
+            return False
+
+        result = EndgameSolver(self.game, self.player_number).solve()
+        self.last_endgame = result
+        if not result.solved or not result.plan:
+            return False
+
+        logger.info(f"Endgame solver found a win in {result.turns_to_win} turns "
+                    f"({result.nodes} nodes, {result.elapsed:.2f}s)")
+        self._queue_plan([(unit, Action("unit_action", target=action))
+                          for unit, action in plan_to_actions(self.game, result.plan)])
+        return True
+
     def _handle_respawns(self, analysis) -> None:
         """
         Handle unit respawns intelligently.
@@ -84,137 +180,97 @@ class SmartAI:
         if not ready_dead_units:
             return
 
+        # Every dead unit is scored against the same board
+        scores = self._score_spawn_layer(analysis)
         for dead_unit in ready_dead_units:
-            spawn_location = self._find_respawn_location(dead_unit, analysis)
+            spawn_location = self._find_respawn_location(dead_unit, scores)
 
             if spawn_location:
                 success = self.game.queue_respawn(dead_unit, spawn_location)
                 if success:
+                    self.last_decision.respawns.append((dead_unit, spawn_location))
                     logger.info(f"AI queued respawn for {dead_unit.greek_id}")
 
-    def _find_respawn_location(self, dead_unit, analysis) -> Optional[tuple]:
+    def _find_respawn_location(self, dead_unit, scores: np.ndarray) -> Optional[tuple]:
         """
         Find optimal respawn location.
 
         Args:
             dead_unit: DeadUnit to respawn
-            analysis: Battlefield analysis
+            scores: Spawn score layer from _score_spawn_layer
 
         Returns:
             Best spawn position (y, x) or None
         """
-        valid_positions = []
-
-        # Find all valid spawn positions
-        for y in range(self.game.map.height):
-            for x in range(self.game.map.width):
-                if (self.game.is_valid_position(y, x) and
-                    self.game.map.is_passable(y, x) and
-                    not self.game.get_unit_at(y, x)):
-                    valid_positions.append((y, x))
-
-        if not valid_positions:
+        candidates = np.where(self.game.board_layers.respawn_mask(), scores, -np.inf)
+        # argmax takes the first best tile in row-major order
+        best = int(np.argmax(candidates))
+        if candidates.flat[best] == -np.inf:
             return None
+        return divmod(best, candidates.shape[1])
 
-        # Score positions
-        best_pos = None
-        best_score = float('-inf')
-
-        for pos in valid_positions:
-            score = self._score_spawn_position(pos, analysis)
-            if score > best_score:
-                best_score = score
-                best_pos = pos
-
-        return best_pos
-
-    def _score_spawn_position(self, pos: tuple, analysis) -> float:
+    def _score_spawn_layer(self, analysis) -> np.ndarray:
         """
-        Score a spawn position.
+        Score every tile as a spawn position.
 
         Args:
-            pos: Position to score
             analysis: Battlefield analysis
 
         Returns:
-            Position score
+            (height, width) array of position scores
         """
-        score = 0.0
+        layers = self.game.board_layers
 
         # Prefer safe positions
-        if pos not in analysis.threat_map:
-            score += 30
-        else:
-            threat = analysis.threat_map[pos]
-            score -= threat.threat_level
+        threat = np.zeros(layers.rows.shape)
+        threatened = np.zeros(layers.rows.shape, dtype=bool)
+        if analysis.threat_map:
+            ys, xs = zip(*analysis.threat_map)
+            threat[ys, xs] = [zone.threat_level for zone in analysis.threat_map.values()]
+            threatened[ys, xs] = True
+        score = np.where(threatened, -threat, 30.0)
 
         # Prefer positions near allies
         if analysis.ai_units:
-            min_distance = min(self.game.chess_distance(pos[0], pos[1], ally.y, ally.x)
-                             for ally in analysis.ai_units)
+            min_distance = layers.chess_distance((ally.y, ally.x) for ally in analysis.ai_units)
             # Sweet spot: 3-5 tiles away
-            if 3 <= min_distance <= 5:
-                score += 20
-            elif min_distance < 3:
-                score += 5
-            else:
-                score -= min_distance
+            score += np.where((min_distance >= 3) & (min_distance <= 5), 20,
+                              np.where(min_distance < 3, 5, -min_distance))
 
         return score
 
-    def _process_unit(self, unit: 'Unit', analysis, plan) -> None:
+    def _queue_plan(self, steps) -> None:
         """
-        Process actions for a single unit.
+        Queue a joint turn plan on the live units.
 
         Args:
-            unit: Unit to process
-            analysis: Battlefield analysis
-            plan: Strategic plan
+            steps: (unit, action) pairs from the turn planner, in order
         """
-        # Topiary units cannot act
-        if getattr(unit, 'is_topiary', False):
-            return
-
-        # Neural Shunt units will act randomly — skip AI planning
-        if getattr(unit, 'neural_shunt_affected', False):
-            return
-
-        # Jawline-affected units cannot move or use skills (can still attack)
-        if getattr(unit, 'jawline_affected', False):
-            # Only evaluate attacks, skip full action evaluation
+        for unit, action in steps:
+            if not action.data.get('attack_only'):
+                # Reset unit targets
+                unit.move_target = None
+                unit.attack_target = None
+                unit.skill_target = None
+                unit.selected_skill = None
             try:
-                attacks = self.evaluator._evaluate_attacks(unit, analysis, plan)
-                if attacks:
-                    best = max(attacks, key=lambda a: a.priority)
-                    if best.target:
-                        unit.attack_target = (best.target.y, best.target.x)
+                self._execute_action(unit, action)
             except Exception as e:
-                logger.error(f"Error evaluating attacks for jawline-affected {unit.get_display_name()}: {e}")
-            return
-
-        # Reset unit targets
-        unit.move_target = None
-        unit.attack_target = None
-        unit.skill_target = None
-        unit.selected_skill = None
+                logger.error(f"Error executing action for {unit.get_display_name()}: {e}")
 
-        # Evaluate all possible actions
-        try:
-            actions = self.evaluator.evaluate_unit_actions(unit, analysis, plan)
-        except Exception as e:
-            logger.error(f"Error evaluating actions for {unit.get_display_name()}: {e}")
-            return
-
-        if not actions:
-            return
+    def _process_units(self, analysis) -> None:
+        """
+        Queue each unit's best action in turn.
 
-        # Execute best action
-        best_action = actions[0]
+        Every chosen action is applied to a clone of the game and the analysis is
+        brought up to date (BattlefieldAnalyzer.update) before the next unit is
+        scored, so a later unit does not follow up on a target that is already
+        dead or walk onto a tile an ally is moving to.
 
-        try:
-            self._execute_action(unit, best_action)
-        except Exception as e:
-            logger.error(f"Error executing action for {unit.get_display_name()}: {e}")
+        Args:
+            analysis: Start-of-turn battlefield analysis
+        """
+        self._queue_plan(self.greedy_planner.plan_turn(analysis.ai_units, analysis))
 
     def _execute_action(self, unit: 'Unit', action: Action) -> None:
         """
@@ -224,44 +280,20 @@ class SmartAI:
             unit: Unit performing action
             action: Action to execute
         """
-        if action.type == "attack":
-            from boneglaive.utils.constants import UnitType
-            target = action.target
-            unit.attack_target = (target.y, target.x)
-
-            # DERELICTIONIST: activate Severance and set retreat move to maximize damage
-            if unit.type == UnitType.DERELICTIONIST:
-                unit.can_move_post_skill = True
-                unit.used_skill_this_turn = True
-                unit.severance_active = True
-                unit.severance_duration = 1
-                unit.attack_queued_from = (unit.y, unit.x)
-                # Use pre-computed retreat position if available, otherwise compute it
-                if 'severance_move' in action.data:
-                    retreat_pos = action.data['severance_move']
-                else:
-                    retreat_pos = self.evaluator._derelictionist_best_retreat(unit, target)
-                if retreat_pos != (unit.y, unit.x):
-                    unit.move_target = retreat_pos
-
-        elif action.type == "move":
-            pos = action.target
-            unit.move_target = pos
-
-        elif action.type == "skill":
-            skill, target = action.target
-
-            # Convert target to position tuple
-            if hasattr(target, 'y'):  # It's a unit
-                target_pos = (target.y, target.x)
-            else:  # It's a position
-                target_pos = target
-
-            # IMPORTANT: Call skill.use() to properly queue the skill AND set cooldown
-            # Previously this just set unit.selected_skill directly, bypassing cooldown logic
-            skill.use(unit, target_pos, self.game)
-
-        elif action.type == "move_attack":
-            move_pos, attack_target = action.target
-            unit.move_target = move_pos
-            unit.attack_target = (attack_target.y, attack_target.x)
+        queue_action(self.game, unit, action, self.evaluator)
+        self.last_decision.steps.append((unit, action))
+
+    def apply_decision(self, decision: TurnDecision) -> None:
+        """
+        Queue a turn decided elsewhere (e.g. on a cloned game) on this AI's game.
+
+        Args:
+            decision: Respawns and actions expressed in terms of this game's objects
+        """
+        self.last_decision = TurnDecision()
+        for dead_unit, position in decision.respawns:
+            if self.game.queue_respawn(dead_unit, position):
+                self.last_decision.respawns.append((dead_unit, position))
+        self._queue_plan(decision.steps)
+        if self.ui:
+            self.ui.draw_board()
@@ -7,6 +7,7 @@ Determines high-level strategy and team objectives.
 from enum import Enum
 from typing import TYPE_CHECKING, List
 from boneglaive.utils.debug import logger
+from boneglaive.ai.weights import AIWeights, DEFAULT_WEIGHTS
 
 if TYPE_CHECKING:
     from boneglaive.game.engine import Game
@@ -48,16 +49,18 @@ class StrategicPlanner:
     Provides objectives and priorities for tactical execution.
     """
 
-    def __init__(self, game: 'Game', ai_player: int):
+    def __init__(self, game: 'Game', ai_player: int, weights: AIWeights = DEFAULT_WEIGHTS):
         """
         Initialize the strategic planner.
 
         Args:
             game: The game instance
             ai_player: The AI's player number
+            weights: Strategy thresholds (see boneglaive.ai.weights)
         """
         self.game = game
         self.ai_player = ai_player
+        self.weights = weights
 
     def plan(self, analysis: 'BattlefieldAnalysis') -> StrategicPlan:
         """
@@ -108,23 +111,26 @@ class StrategicPlanner:
         logger.info(f"    Vulnerable allies: {len(analysis.vulnerable_allies)}")
         logger.info(f"    Center control: {analysis.ai_center_control:.1%}")
 
+        w = self.weights
+
         # Desperate situation: Losing badly on GP and units/HP
-        if gp_diff <= -2 and (hp_ratio < 0.6 or unit_count_ratio < 0.7):
+        if gp_diff <= w.desperate_gp_diff and (hp_ratio < w.desperate_hp_ratio or
+                                               unit_count_ratio < w.desperate_unit_ratio):
             logger.info("  → DESPERATE SITUATION: Going all-in!")
             return Strategy.DESPERATE_RUSH
 
         # Winning situation: Ahead on GP or resources
-        if gp_diff >= 2 or (hp_ratio > 1.3 and unit_count_ratio >= 1.0):
+        if gp_diff >= w.winning_gp_diff or (hp_ratio > w.winning_hp_ratio and unit_count_ratio >= 1.0):
             logger.info("  → WINNING POSITION: Aggressive push!")
             return Strategy.AGGRESSIVE_PUSH
 
         # Vulnerable situation: Have units in danger
-        if len(analysis.vulnerable_allies) >= 2:
+        if len(analysis.vulnerable_allies) >= w.defensive_vulnerable_count:
             logger.info("  → UNITS IN DANGER: Defensive hold")
             return Strategy.DEFENSIVE_HOLD
 
         # Poor positioning: Not controlling center
-        if analysis.ai_center_control < 0.35:
+        if analysis.ai_center_control < w.poor_center_control:
             logger.info("  → POOR POSITIONING: Securing position")
             return Strategy.SECURE_POSITION
 
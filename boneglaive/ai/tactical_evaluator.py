@@ -6,8 +6,13 @@ Scores individual unit actions to find optimal choices.
 
 from typing import TYPE_CHECKING, List, Tuple
 from boneglaive.utils.debug import logger
+from boneglaive.ai.evaluator_stats import evaluator_stats, instrument_evaluators
 from boneglaive.game.skills import TargetType
 from boneglaive.game.units import UnitType
+from boneglaive.game.targeting import skill_target_candidates
+from boneglaive.ai.weights import (
+    AIWeights, DEFAULT_WEIGHTS, ENGAGEMENT_RANGE, IDLE_SKILL_FAR_SCORE,
+)
 
 if TYPE_CHECKING:
     from boneglaive.game.engine import Game
@@ -16,30 +21,6 @@ if TYPE_CHECKING:
     from boneglaive.ai.strategic_planner import StrategicPlan
 
 
-# --- Action score budget -----------------------------------------------------
-# The AI picks the single highest-scored action. To stop units from idling far
-# from the enemy while wasting skills on empty tiles, three score tiers must hold:
-#   * A skill that affects NO enemy (cast into empty space) must score BELOW the
-#     approach gradient, so closing the distance always wins over a do-nothing cast.
-#   * The approach gradient (moving toward the nearest enemy) is a smooth, non-
-#     clipping pull that stays meaningfully positive across the whole map, but is
-#     capped so it never beats a real in-range combat action.
-#   * A real attack / a skill that actually hits an enemy keeps its existing
-#     50+ score and continues to dominate when a target is in range.
-ENGAGEMENT_RANGE = 4          # within this many tiles of an enemy, idle self/utility
-                              # skills regain their standalone value
-# Approach gradient = BASELINE + SCALE * (1 - min_enemy_distance / max_map_distance).
-# Non-clipping: even at maximum map separation the pull stays above IDLE_SKILL_FAR_SCORE,
-# so a far-away unit always prefers advancing to wasting a skill on nothing. Capped well
-# below the 50+ score of a real in-range attack/skill so it never overrides actual combat.
-APPROACH_BASELINE = 6.0       # floor pull when an enemy exists (any distance), non-aggressive
-APPROACH_SCALE = 14.0         # additional distance-scaled pull, non-aggressive
-APPROACH_BASELINE_AGGRO = 8.0 # floor pull, aggressive_push / desperate_rush
-APPROACH_SCALE_AGGRO = 22.0   # additional distance-scaled pull, aggressive
-IDLE_SKILL_FAR_SCORE = 4.0    # value of a standalone self-buff with no enemy in range
-                              # (deliberately below the far end of the approach gradient)
-
-
 class Action:
     """Represents a possible action for a unit."""
 
@@ -50,22 +31,25 @@ class Action:
         self.data = {}          # Additional action data
 
 
+@instrument_evaluators
 class TacticalEvaluator:
     """
     Evaluates and scores possible actions for individual units.
     Considers strategic objectives when scoring.
     """
 
-    def __init__(self, game: 'Game', ai_player: int):
+    def __init__(self, game: 'Game', ai_player: int, weights: AIWeights = DEFAULT_WEIGHTS):
         """
         Initialize the tactical evaluator.
 
         Args:
             game: The game instance
             ai_player: The AI's player number
+            weights: Scoring weights (see boneglaive.ai.weights)
         """
         self.game = game
         self.ai_player = ai_player
+        self.weights = weights
 
     def evaluate_unit_actions(self, unit: 'Unit', analysis: 'BattlefieldAnalysis',
                               plan: 'StrategicPlan') -> List[Action]:
@@ -142,6 +126,7 @@ class TacticalEvaluator:
         attack_range = stats['attack_range']
         damage = stats['attack']
 
+        evaluator_stats.count(generated=len(analysis.enemy_units))
         # Check each enemy for attackability
         for enemy in analysis.enemy_units:
             # Skip HEINOUS VAPOR units (invulnerable - waste of actions)
@@ -187,6 +172,7 @@ class TacticalEvaluator:
                 else:
                     effective_damage = damage
 
+                evaluator_stats.count(scored=1)
                 score = self._score_attack(unit, enemy, analysis, plan, effective_damage)
 
                 # LANDSCAPER: cooldown cycling bonus — attacks reduce skill cooldowns
@@ -217,26 +203,27 @@ class TacticalEvaluator:
         Returns:
             Attack score
         """
+        w = self.weights
         score = 0.0
 
         # Base damage value
-        score += damage * 2
+        score += damage * w.attack_damage
 
         # Bonus for killing blow
         if target.hp <= damage:
-            score += 50
+            score += w.kill_bonus
             # Extra bonus if strategy wants kills
             if plan.strategy.value in ["aggressive_push", "desperate_rush"]:
-                score += 20
+                score += w.aggressive_kill_bonus
 
         # Bonus for attacking focus targets
         if target in plan.focus_targets:
-            score += 30
+            score += w.focus_target_bonus
 
         # Bonus for attacking high-priority targets
         for priority_target, target_score in analysis.priority_targets[:3]:
             if priority_target == target:
-                score += target_score * 0.5
+                score += target_score * w.priority_target_factor
                 break
 
         # Penalty if attacker is vulnerable after attack
@@ -245,15 +232,15 @@ class TacticalEvaluator:
             threat = analysis.threat_map[attacker_pos]
             # If we'll die from counterattack, reduce score
             if threat.threat_level >= attacker.hp:
-                score -= 40
+                score -= w.lethal_counter_penalty
                 # Unless it's desperate rush or we get the kill
                 if plan.strategy.value == "desperate_rush" or target.hp <= damage:
-                    score += 20  # Partially restore score for trades
+                    score += w.trade_refund  # Partially restore score for trades
 
         # Defensive strategy: only attack if safe
         if plan.strategy.value == "defensive_hold":
             if not self._is_attack_safe(attacker, analysis):
-                score -= 30
+                score -= w.unsafe_attack_penalty
 
         return score
 
@@ -274,7 +261,7 @@ class TacticalEvaluator:
 
         threat = analysis.threat_map[pos]
         # Safe if threat is less than 40% of current HP
-        return threat.threat_level < (unit.hp * 0.4)
+        return threat.threat_level < (unit.hp * self.weights.safe_attack_threat_ratio)
 
     def _evaluate_moves(self, unit: 'Unit', analysis: 'BattlefieldAnalysis',
                        plan: 'StrategicPlan') -> List[Action]:
@@ -296,6 +283,7 @@ class TacticalEvaluator:
         # Get all reachable positions
         reachable = self._get_reachable_positions(unit, move_range)
 
+        evaluator_stats.count(generated=len(reachable), scored=len(reachable))
         # Score each position
         for pos in reachable:
             score = self._score_move_position(unit, pos, analysis, plan)
@@ -377,6 +365,7 @@ class TacticalEvaluator:
         Returns:
             Position score
         """
+        w = self.weights
         y, x = position
         score = 0.0
 
@@ -386,15 +375,15 @@ class TacticalEvaluator:
             threat_level = threat.threat_level
             # Heavy penalty if we'll die
             if threat_level >= unit.hp:
-                score -= 100
+                score -= w.lethal_tile_penalty
             else:
                 # Penalty proportional to threat
-                score -= (threat_level / unit.hp) * 50
+                score -= (threat_level / unit.hp) * w.threat_penalty
 
         # Defensive strategy: strongly prefer safe positions
         if plan.strategy.value == "defensive_hold":
-            if not threat or threat.threat_level < unit.hp * 0.3:
-                score += 20
+            if not threat or threat.threat_level < unit.hp * w.defensive_safe_threat_ratio:
+                score += w.defensive_safe_bonus
 
         # Enemy approach: ALL strategies should move toward enemies (with varying aggression)
         if analysis.enemy_units:
@@ -408,11 +397,11 @@ class TacticalEvaluator:
             max_dist = max(1, self.game.map.width - 1, self.game.map.height - 1)
             closeness = 1.0 - min(min_distance, max_dist) / max_dist  # 1.0 adjacent -> 0 corner
             if plan.strategy.value in ["aggressive_push", "desperate_rush"]:
-                score += APPROACH_BASELINE_AGGRO + APPROACH_SCALE_AGGRO * closeness
+                score += w.approach_baseline_aggro + w.approach_scale_aggro * closeness
             else:
                 # Even defensive/trading strategies advance when safe (the threat
                 # penalty above still blocks walking into lethal positions).
-                score += APPROACH_BASELINE + APPROACH_SCALE * closeness
+                score += w.approach_baseline + w.approach_scale * closeness
 
             # Bonus if this position enables attack (all strategies benefit)
             stats = unit.get_effective_stats()
@@ -424,9 +413,9 @@ class TacticalEvaluator:
                     if self.game.has_line_of_sight(y, x, enemy.y, enemy.x):
                         # Aggressive strategies get bigger bonus
                         if plan.strategy.value in ["aggressive_push", "desperate_rush"]:
-                            score += 30
+                            score += w.attack_position_bonus_aggro
                         else:
-                            score += 15  # Still significant for other strategies
+                            score += w.attack_position_bonus  # Still significant for other strategies
                         break
 
         # Positioning strategy: move toward center
@@ -434,13 +423,13 @@ class TacticalEvaluator:
             center_y = self.game.map.height // 2
             center_x = self.game.map.width // 2
             distance_to_center = self.game.chess_distance(y, x, center_y, center_x)
-            score += max(10 - distance_to_center, 0)
+            score += max(w.center_pull - distance_to_center, 0)
 
         # Bonus for supporting vulnerable allies
         for ally, _ in analysis.vulnerable_allies:
             distance_to_ally = self.game.chess_distance(y, x, ally.y, ally.x)
             if distance_to_ally <= 3:
-                score += 10
+                score += w.support_ally_bonus
 
         # Penalty for moving away from team
         if len(analysis.ai_units) > 1:
@@ -448,8 +437,8 @@ class TacticalEvaluator:
             avg_distance = sum(self.game.chess_distance(y, x, ally.y, ally.x)
                              for ally in other_allies) / len(other_allies)
             # Penalty if too far from team
-            if avg_distance > 6:
-                score -= 15
+            if avg_distance > w.isolation_distance:
+                score -= w.isolation_penalty
 
         return score
 
@@ -620,8 +609,10 @@ class TacticalEvaluator:
             # Check if it's a self-targeted/AOE skill
             if effective_target_type == TargetType.SELF:
                 # Self-targeted AOE skills (e.g., Jawline)
+                evaluator_stats.count(generated=1)
                 try:
                     if skill.can_use(unit, (unit.y, unit.x), self.game):
+                        evaluator_stats.count(scored=1)
                         # Score based on number of enemies in AOE
                         score = self._score_aoe_skill_use(unit, skill, analysis, plan)
                         # Self-buff skills (Infuse, Karrier Rave, Ossify) have standalone
@@ -630,7 +621,7 @@ class TacticalEvaluator:
                         # advances first instead of buffing in place every cooldown.
                         if score == 0 and skill.name in ("Infuse", "Karrier Rave", "Ossify"):
                             if self._nearest_enemy_distance(unit.y, unit.x, analysis) <= ENGAGEMENT_RANGE:
-                                score = 30.0
+                                score = self.weights.self_buff_near_score
                             else:
                                 score = IDLE_SKILL_FAR_SCORE
                         if score > 0:
@@ -644,6 +635,7 @@ class TacticalEvaluator:
                     # Try positions around the unit and around enemies
                     area_targets_tried = set()
                     search_range = getattr(skill, 'range', 3)
+                    evaluator_stats.count(generated=(2 * search_range + 1) ** 2)
                     for dy in range(-search_range, search_range + 1):
                         for dx in range(-search_range, search_range + 1):
                             ty, tx = unit.y + dy, unit.x + dx
@@ -654,6 +646,7 @@ class TacticalEvaluator:
                                 continue
                             try:
                                 if skill.can_use(unit, (ty, tx), self.game):
+                                    evaluator_stats.count(scored=1)
                                     score = self._score_area_skill_at_tile(unit, skill, (ty, tx), analysis, plan)
                                     if score > 0:
                                         action = Action("skill", target=(skill, (ty, tx)), priority=score)
@@ -664,6 +657,7 @@ class TacticalEvaluator:
                     continue
             else:
                 # Enemy-targeted skills
+                evaluator_stats.count(generated=len(analysis.enemy_units))
                 for enemy in analysis.enemy_units:
                     # Skip HEINOUS VAPOR units (invulnerable - waste of actions)
                     if enemy.type == UnitType.HEINOUS_VAPOR:
@@ -679,6 +673,7 @@ class TacticalEvaluator:
 
                     try:
                         if skill.can_use(unit, (enemy.y, enemy.x), self.game):
+                            evaluator_stats.count(scored=1)
                             score = self._score_skill_use(unit, skill, enemy, analysis, plan)
                             action = Action("skill", target=(skill, enemy), priority=score)
                             actions.append(action)
@@ -712,6 +707,7 @@ class TacticalEvaluator:
             that does not improve engagement is near-worthless (this is what stopped
             units from blinking into a corner while the enemy stood across the map).
         """
+        w = self.weights
         ty, tx = tile
         area = getattr(skill, 'area', 0) or 0
 
@@ -743,19 +739,19 @@ class TacticalEvaluator:
             for e in targetable
         )
         if in_range:
-            score = 40.0 + min((cur_dist - new_dist), 8) * 0.5  # 40..44, below a real hit
+            score = w.area_in_range_base + min((cur_dist - new_dist), 8) * w.area_advance_step  # 40..44, below a real hit
             threat = analysis.threat_map.get((ty, tx))
             if threat:
                 if threat.threat_level >= unit.hp:
-                    score -= 25.0  # do not blink into a lethal tile
+                    score -= w.area_lethal_penalty  # do not blink into a lethal tile
                 else:
-                    score -= (threat.threat_level / max(unit.hp, 1)) * 10.0
+                    score -= (threat.threat_level / max(unit.hp, 1)) * w.area_threat_penalty
             return max(score, 0.0)
 
         # No hit, not in range: value strictly by distance closed. A teleport that does
         # not close the gap scores below the approach gradient so a plain move wins.
         if new_dist < cur_dist:
-            return min(IDLE_SKILL_FAR_SCORE + (cur_dist - new_dist) * 2.0, 25.0)
+            return min(IDLE_SKILL_FAR_SCORE + (cur_dist - new_dist) * w.area_close_step, w.area_close_cap)
         return 0.0  # neutral/backward teleport into empty space — do not waste the skill
 
     def _score_skill_use(self, unit: 'Unit', skill, target: 'Unit',
@@ -773,24 +769,26 @@ class TacticalEvaluator:
         Returns:
             Skill usage score
         """
+        w = self.weights
+
         # Higher base score - skills are generally better than basic attacks
-        score = 50.0
+        score = w.skill_base
 
         # Big bonus for focus targets
         if target in plan.focus_targets:
-            score += 30
+            score += w.skill_focus_bonus
 
         # Aggressive strategies: use skills more
         if plan.strategy.value in ["aggressive_push", "desperate_rush"]:
-            score += 20
+            score += w.skill_aggressive_bonus
 
         # Bonus for low HP enemies (skills can secure kills)
         if target.hp < target.max_hp * 0.4:
-            score += 25
+            score += w.skill_low_hp_bonus
 
         # Bonus for high HP enemies (skills deal more damage)
         if target.hp > target.max_hp * 0.7:
-            score += 15
+            score += w.skill_high_hp_bonus
 
         # Distance consideration - skills often have better range
         distance = self.game.chess_distance(unit.y, unit.x, target.y, target.x)
@@ -799,12 +797,12 @@ class TacticalEvaluator:
 
         # Extra bonus if skill can hit from safer distance than basic attack
         if distance > attack_range:
-            score += 20
+            score += w.skill_standoff_bonus
 
         # Bonus based on target priority (high value targets)
         for priority_target, _ in analysis.priority_targets[:3]:
             if target == priority_target:
-                score += 20
+                score += w.skill_priority_bonus
                 break
 
         return score
@@ -837,18 +835,20 @@ class TacticalEvaluator:
         if enemies_in_range == 0:
             return 0
 
+        w = self.weights
+
         # Base score multiplied by number of targets
-        score = 40.0 * enemies_in_range
+        score = w.aoe_per_enemy * enemies_in_range
 
         # Big bonus for hitting multiple enemies
         if enemies_in_range >= 2:
-            score += 50
+            score += w.aoe_two_enemy_bonus
         if enemies_in_range >= 3:
-            score += 30
+            score += w.aoe_three_enemy_bonus
 
         # Aggressive strategies: prefer AOE damage
         if plan.strategy.value in ["aggressive_push", "desperate_rush"]:
-            score += 20
+            score += w.aoe_aggressive_bonus
 
         return score
 
@@ -883,6 +883,7 @@ class TacticalEvaluator:
         # Get reachable positions
         reachable = self._get_reachable_positions(unit, move_range)
 
+        evaluator_stats.count(generated=len(reachable) * len(analysis.enemy_units))
         # For each position, check if we can attack from there
         for pos in reachable:
             y, x = pos
@@ -924,6 +925,7 @@ class TacticalEvaluator:
                         effective_damage = damage
 
                     # Score the combo: position value + attack value
+                    evaluator_stats.count(scored=1)
                     move_score = self._score_move_position(unit, pos, analysis, plan)
                     attack_score = self._score_attack(unit, enemy, analysis, plan, effective_damage)
 
@@ -932,7 +934,7 @@ class TacticalEvaluator:
                         attack_score += self._landscaper_cooldown_cycling_bonus(unit, effective_damage)
 
                     # Combo score is sum with a bonus
-                    combo_score = move_score + attack_score + 10
+                    combo_score = move_score + attack_score + self.weights.combo_bonus
 
                     action = Action("move_attack", target=(pos, enemy), priority=combo_score)
                     action.data['move_to'] = pos
@@ -961,6 +963,7 @@ class TacticalEvaluator:
             List of Site Inspection actions with scores
         """
         actions = []
+        w = self.weights
         skill_range = getattr(skill, 'range', 3)
 
         # Get all friendly units (including self)
@@ -976,6 +979,7 @@ class TacticalEvaluator:
                 distance = self.game.chess_distance(unit.y, unit.x, target_y, target_x)
                 if distance > skill_range:
                     continue
+                evaluator_stats.count(generated=1)
 
                 # Check if skill can be used at this position
                 try:
@@ -1010,6 +1014,7 @@ class TacticalEvaluator:
                 if not allies_in_area or impassable_count >= 2:
                     continue
 
+                evaluator_stats.count(scored=1)
                 # Calculate score
                 score = 0.0
 
@@ -1022,34 +1027,34 @@ class TacticalEvaluator:
 
                     if not has_full and not has_partial:
                         unbuffed_allies += 1
-                        score += 30  # Good value for buffing new ally
+                        score += w.site_inspection_new_ally
                     elif has_partial and impassable_count == 0:
-                        score += 15  # Decent value for upgrading partial to full
+                        score += w.site_inspection_upgrade  # Upgrading partial to full
                     elif has_full or has_partial:
-                        score += 5   # Small value for refreshing existing buff
+                        score += w.site_inspection_refresh
 
                 # Bonus for hitting multiple allies
                 if len(allies_in_area) >= 2:
-                    score += 20
+                    score += w.site_inspection_two_allies
                 if len(allies_in_area) >= 3:
-                    score += 15
+                    score += w.site_inspection_three_allies
 
                 # Terrain penalty (reduces effectiveness)
                 if impassable_count == 1:
-                    score -= 10  # Partial buff is less valuable
+                    score -= w.site_inspection_terrain_penalty  # Partial buff is less valuable
 
                 # Strategy bonuses
                 if plan.strategy.value in ["aggressive_push", "desperate_rush"]:
                     # Prefer buffing in aggressive situations
-                    score += 15
+                    score += w.site_inspection_aggressive
                 elif plan.strategy.value == "defensive_hold":
                     # Still good for defense
-                    score += 10
+                    score += w.site_inspection_defensive
 
                 # Bonus for buffing high-priority units or focus targets
                 for ally in allies_in_area:
                     if ally in plan.focus_targets:
-                        score += 10
+                        score += w.site_inspection_focus
 
                 # Engagement gate: a lone caster self-buffing far from any enemy is the
                 # classic wasted-skill-at-range case (the +1 atk/+1 move expires before a
@@ -1060,7 +1065,7 @@ class TacticalEvaluator:
                     continue
 
                 # Only create action if score is worthwhile
-                if score > 20:
+                if score > w.site_inspection_threshold:
                     action = Action("skill", target=(skill, (target_y, target_x)), priority=score)
                     action.data['target_pos'] = (target_y, target_x)
                     action.data['allies_affected'] = len(allies_in_area)
@@ -1093,6 +1098,7 @@ class TacticalEvaluator:
             List of Marrow Dike actions with scores
         """
         actions = []
+        w = self.weights
 
         # Check if skill is usable
         try:
@@ -1101,6 +1107,7 @@ class TacticalEvaluator:
         except Exception:
             return actions
 
+        evaluator_stats.count(generated=1)
         # Analyze the 5x5 area around unit
         center_y, center_x = unit.y, unit.x
 
@@ -1143,28 +1150,29 @@ class TacticalEvaluator:
                     # Enemy unit
                     enemies_inside.append(other_unit)
 
+        evaluator_stats.count(scored=1)
         # Calculate score based on tactical situation
         score = 0.0
 
         # DEFENSIVE SCORING: Protect endangered allies
         if allies_endangered:
-            score += len(allies_endangered) * 40
-            logger.debug(f"  Marrow Dike: {len(allies_endangered)} allies endangered, +{len(allies_endangered) * 40} score")
+            score += len(allies_endangered) * w.marrow_dike_endangered_ally
+            logger.debug(f"  Marrow Dike: {len(allies_endangered)} allies endangered, +{len(allies_endangered) * w.marrow_dike_endangered_ally} score")
 
         # OFFENSIVE SCORING: Trap enemies
         if enemies_inside:
             enemy_score = 0
             for enemy in enemies_inside:
                 # Base value for trapping
-                enemy_score += 50
+                enemy_score += w.marrow_dike_trap_enemy
 
                 # Bonus for priority targets
                 if enemy in [t for t, s in analysis.priority_targets[:3]]:
-                    enemy_score += 30
+                    enemy_score += w.marrow_dike_priority
 
                 # Bonus for low HP enemies (easier to finish off)
                 if enemy.hp < enemy.max_hp * 0.4:
-                    enemy_score += 20
+                    enemy_score += w.marrow_dike_low_hp
 
             score += enemy_score
             logger.debug(f"  Marrow Dike: {len(enemies_inside)} enemies trapped, +{enemy_score} score")
@@ -1172,7 +1180,7 @@ class TacticalEvaluator:
         # PENALTY: Too many allies trapped disadvantageously
         # (More than 2 allies and no enemies = probably bad positioning)
         if len(allies_inside) > 2 and len(enemies_inside) == 0:
-            penalty = len(allies_inside) * 15
+            penalty = len(allies_inside) * w.marrow_dike_crowding_penalty
             score -= penalty
             logger.debug(f"  Marrow Dike: {len(allies_inside)} allies trapped with no enemies, -{penalty} score")
 
@@ -1182,29 +1190,29 @@ class TacticalEvaluator:
         center_map_x = self.game.map.width // 2
         distance_to_center = self.game.chess_distance(unit.y, unit.x, center_map_y, center_map_x)
         if distance_to_center <= 3:
-            score += 10
-            logger.debug(f"  Marrow Dike: Near map center, +10 score")
+            score += w.marrow_dike_center
+            logger.debug(f"  Marrow Dike: Near map center, +{w.marrow_dike_center} score")
 
         # STRATEGY BONUSES
         if plan.strategy.value == "defensive_hold":
             # Boost defensive usage
             if allies_endangered:
-                score += 25
-                logger.debug(f"  Marrow Dike: Defensive strategy + endangered allies, +25 score")
+                score += w.marrow_dike_defensive
+                logger.debug(f"  Marrow Dike: Defensive strategy + endangered allies, +{w.marrow_dike_defensive} score")
         elif plan.strategy.value in ["aggressive_push", "desperate_rush"]:
             # Boost offensive usage
             if enemies_inside:
-                score += 20
-                logger.debug(f"  Marrow Dike: Aggressive strategy + enemies trapped, +20 score")
+                score += w.marrow_dike_aggressive
+                logger.debug(f"  Marrow Dike: Aggressive strategy + enemies trapped, +{w.marrow_dike_aggressive} score")
 
         # UNIT CONDITION BONUSES
         # Low HP = prefer defensive usage
         if unit.hp < unit.max_hp * 0.5:
-            score += 20
-            logger.debug(f"  Marrow Dike: Unit low HP, +20 score")
+            score += w.marrow_dike_self_low_hp
+            logger.debug(f"  Marrow Dike: Unit low HP, +{w.marrow_dike_self_low_hp} score")
 
         # Minimum threshold - don't use unless it's tactically valuable
-        if score > 40:
+        if score > w.marrow_dike_threshold:
             action = Action("skill", target=(skill, unit), priority=score)
             action.data['enemies_trapped'] = len(enemies_inside)
             action.data['allies_protected'] = len(allies_endangered)
@@ -1240,6 +1248,7 @@ class TacticalEvaluator:
             List of Gaussian Dusk actions (one per viable direction)
         """
         actions = []
+        w = self.weights
 
         # Check if skill is usable
         try:
@@ -1259,6 +1268,7 @@ class TacticalEvaluator:
             ('WEST', (0, -1))
         ]
 
+        evaluator_stats.count(generated=len(directions))
         # Evaluate each cardinal direction
         for dir_name, (dy, dx) in directions:
             # Trace line from unit position in this direction
@@ -1285,52 +1295,53 @@ class TacticalEvaluator:
                 logger.debug(f"  Gaussian Dusk {dir_name}: No enemies")
                 continue
 
+            evaluator_stats.count(scored=1)
             # Calculate score for this direction
             score = 0.0
 
             # Base score per enemy hit
-            score += len(enemies_in_line) * 50
-            logger.debug(f"  Gaussian Dusk {dir_name}: {len(enemies_in_line)} enemies, +{len(enemies_in_line) * 50} base")
+            score += len(enemies_in_line) * w.gaussian_dusk_per_enemy
+            logger.debug(f"  Gaussian Dusk {dir_name}: {len(enemies_in_line)} enemies, +{len(enemies_in_line) * w.gaussian_dusk_per_enemy} base")
 
             # Bonus for killing blows
             kills = 0
             for enemy in enemies_in_line:
                 if enemy.hp <= damage:
                     kills += 1
-                    score += 30
+                    score += w.gaussian_dusk_kill
             if kills > 0:
-                logger.debug(f"  Gaussian Dusk {dir_name}: {kills} kills, +{kills * 30} bonus")
+                logger.debug(f"  Gaussian Dusk {dir_name}: {kills} kills, +{kills * w.gaussian_dusk_kill} bonus")
 
             # Bonus for priority targets
             priority_hits = 0
             for enemy in enemies_in_line:
                 if enemy in [t for t, s in analysis.priority_targets[:3]]:
                     priority_hits += 1
-                    score += 40
+                    score += w.gaussian_dusk_priority
             if priority_hits > 0:
-                logger.debug(f"  Gaussian Dusk {dir_name}: {priority_hits} priority targets, +{priority_hits * 40} bonus")
+                logger.debug(f"  Gaussian Dusk {dir_name}: {priority_hits} priority targets, +{priority_hits * w.gaussian_dusk_priority} bonus")
 
             # Bonus for hitting multiple enemies (efficient use)
             if len(enemies_in_line) >= 2:
-                multi_bonus = 25
+                multi_bonus = w.gaussian_dusk_two_enemies
                 score += multi_bonus
                 logger.debug(f"  Gaussian Dusk {dir_name}: Multi-hit, +{multi_bonus} bonus")
 
             if len(enemies_in_line) >= 3:
-                extra_bonus = 20
+                extra_bonus = w.gaussian_dusk_three_enemies
                 score += extra_bonus
                 logger.debug(f"  Gaussian Dusk {dir_name}: 3+ enemies, +{extra_bonus} bonus")
 
             # Strategy bonuses
             if plan.strategy.value in ["aggressive_push", "desperate_rush"]:
-                strategy_bonus = 20
+                strategy_bonus = w.gaussian_dusk_aggressive
                 score += strategy_bonus
                 logger.debug(f"  Gaussian Dusk {dir_name}: Aggressive strategy, +{strategy_bonus} bonus")
 
             # Bonus for hitting low HP enemies (easier to finish off)
             low_hp_targets = sum(1 for e in enemies_in_line if e.hp < e.max_hp * 0.4)
             if low_hp_targets > 0:
-                low_hp_bonus = low_hp_targets * 15
+                low_hp_bonus = low_hp_targets * w.gaussian_dusk_low_hp
                 score += low_hp_bonus
                 logger.debug(f"  Gaussian Dusk {dir_name}: {low_hp_targets} low HP, +{low_hp_bonus} bonus")
 
@@ -1379,6 +1390,7 @@ class TacticalEvaluator:
             List of Vagal Run actions targeting allies
         """
         actions = []
+        w = self.weights
         skill_range = getattr(skill, 'range', 3)
 
         # Get all friendly units (excluding self)
@@ -1397,6 +1409,7 @@ class TacticalEvaluator:
             'shredded', 'derelicted', 'shrapnel_duration'
         ]
 
+        evaluator_stats.count(generated=len(friendly_units))
         # Evaluate each ally
         for ally in friendly_units:
             # Check range
@@ -1415,6 +1428,7 @@ class TacticalEvaluator:
             if hasattr(ally, 'vagal_run_active') and ally.vagal_run_active:
                 continue
 
+            evaluator_stats.count(scored=1)
             # Calculate score
             score = 0.0
 
@@ -1432,12 +1446,12 @@ class TacticalEvaluator:
 
             # Base score for cleansing
             if status_count > 0:
-                score += status_count * 40
-                logger.debug(f"  Vagal Run on {ally.get_display_name()}: {status_count} statuses, +{status_count * 40}")
+                score += status_count * w.vagal_run_per_status
+                logger.debug(f"  Vagal Run on {ally.get_display_name()}: {status_count} statuses, +{status_count * w.vagal_run_per_status}")
 
             # Bonus for critical statuses
             if critical_statuses > 0:
-                crit_bonus = critical_statuses * 60
+                crit_bonus = critical_statuses * w.vagal_run_critical
                 score += crit_bonus
                 logger.debug(f"  Vagal Run on {ally.get_display_name()}: {critical_statuses} critical statuses, +{crit_bonus}")
 
@@ -1453,15 +1467,15 @@ class TacticalEvaluator:
                 # Small score - damage isn't usually desirable on allies
                 # But if ally needs status cleared, this is acceptable
                 if status_count > 0:
-                    score += 10  # Worth using even though it damages
-                    logger.debug(f"  Vagal Run on {ally.get_display_name()}: Close range damage acceptable with statuses, +10")
+                    score += w.vagal_run_damage_ok  # Worth using even though it damages
+                    logger.debug(f"  Vagal Run on {ally.get_display_name()}: Close range damage acceptable with statuses, +{w.vagal_run_damage_ok}")
             # Far range (7+): Healing component
             elif final_distance >= 7:
                 heal_amount = final_distance - 6
                 hp_missing = ally.max_hp - ally.hp
                 actual_heal = min(heal_amount, hp_missing)
                 if actual_heal > 0:
-                    heal_score = actual_heal * 2
+                    heal_score = actual_heal * w.vagal_run_heal
                     score += heal_score
                     logger.debug(f"  Vagal Run on {ally.get_display_name()}: Healing {actual_heal} HP, +{heal_score}")
 
@@ -1470,18 +1484,18 @@ class TacticalEvaluator:
             if ally_pos in analysis.threat_map:
                 threat = analysis.threat_map[ally_pos]
                 if threat.threat_level >= ally.hp * 0.5:
-                    endangered_bonus = 40
+                    endangered_bonus = w.vagal_run_endangered
                     score += endangered_bonus
                     logger.debug(f"  Vagal Run on {ally.get_display_name()}: Endangered, +{endangered_bonus}")
 
             # Bonus for priority units
             if ally in plan.focus_targets:
-                priority_bonus = 30
+                priority_bonus = w.vagal_run_focus
                 score += priority_bonus
                 logger.debug(f"  Vagal Run on {ally.get_display_name()}: Priority target, +{priority_bonus}")
 
             # Only create action if worthwhile
-            if score > 30:
+            if score > w.vagal_run_threshold:
                 action = Action("skill", target=(skill, ally), priority=score)
                 action.data['ally_target'] = ally
                 action.data['statuses_cleared'] = status_count
@@ -1510,6 +1524,7 @@ class TacticalEvaluator:
             List of Derelict actions targeting allies
         """
         actions = []
+        w = self.weights
         skill_range = getattr(skill, 'range', 3)
         push_distance = 4
 
@@ -1520,6 +1535,7 @@ class TacticalEvaluator:
         if not friendly_units:
             return actions
 
+        evaluator_stats.count(generated=len(friendly_units))
         # Evaluate each ally
         for ally in friendly_units:
             # Check range
@@ -1569,6 +1585,7 @@ class TacticalEvaluator:
             if tiles_pushed == 0:
                 continue
 
+            evaluator_stats.count(scored=1)
             # Calculate score
             score = 0.0
 
@@ -1603,19 +1620,19 @@ class TacticalEvaluator:
 
             # Rescue scoring: High value if moving ally from danger to safety
             if endangered and landing_threat < current_threat * 0.5:
-                rescue_score = 80
+                rescue_score = w.derelict_rescue
                 score += rescue_score
                 logger.debug(f"  Derelict on {ally.get_display_name()}: Rescue from danger, +{rescue_score}")
 
             # Bonus for each enemy near current position (escaping)
             if enemies_near_current > 0:
-                escape_score = enemies_near_current * 15
+                escape_score = enemies_near_current * w.derelict_escape
                 score += escape_score
                 logger.debug(f"  Derelict on {ally.get_display_name()}: Escaping {enemies_near_current} enemies, +{escape_score}")
 
             # Penalty if landing zone has more enemies
             if enemies_near_landing > enemies_near_current:
-                penalty = (enemies_near_landing - enemies_near_current) * 20
+                penalty = (enemies_near_landing - enemies_near_current) * w.derelict_landing_penalty
                 score -= penalty
                 logger.debug(f"  Derelict on {ally.get_display_name()}: Landing near more enemies, -{penalty}")
 
@@ -1627,37 +1644,37 @@ class TacticalEvaluator:
             actual_heal = min(heal_amount, hp_missing)
 
             if actual_heal > 0:
-                heal_score = actual_heal * 3
+                heal_score = actual_heal * w.derelict_heal
                 score += heal_score
                 logger.debug(f"  Derelict on {ally.get_display_name()}: Healing {actual_heal} HP, +{heal_score}")
 
             # Bonus for safe landing zone
             if landing_threat < ally.hp * 0.3:
-                safe_landing = 30
+                safe_landing = w.derelict_safe_landing
                 score += safe_landing
                 logger.debug(f"  Derelict on {ally.get_display_name()}: Safe landing zone, +{safe_landing}")
 
             # Penalty for immobilization (ally can't move next turn)
             # Only significant if ally is in danger at landing position
             if landing_threat > ally.hp * 0.3:
-                immobile_penalty = 40
+                immobile_penalty = w.derelict_immobile_penalty
                 score -= immobile_penalty
                 logger.debug(f"  Derelict on {ally.get_display_name()}: Immobilized in danger, -{immobile_penalty}")
 
             # Bonus for priority units
             if ally in plan.focus_targets:
-                priority_bonus = 25
+                priority_bonus = w.derelict_focus
                 score += priority_bonus
                 logger.debug(f"  Derelict on {ally.get_display_name()}: Priority target, +{priority_bonus}")
 
             # Strategy bonuses
             if plan.strategy.value == "defensive_hold" and endangered:
-                defensive_bonus = 20
+                defensive_bonus = w.derelict_defensive
                 score += defensive_bonus
                 logger.debug(f"  Derelict on {ally.get_display_name()}: Defensive rescue, +{defensive_bonus}")
 
             # Only create action if worthwhile
-            if score > 40:
+            if score > w.derelict_threshold:
                 action = Action("skill", target=(skill, ally), priority=score)
                 action.data['ally_target'] = ally
                 action.data['landing_pos'] = (landing_y, landing_x)
@@ -1687,6 +1704,7 @@ class TacticalEvaluator:
             List of Partition actions targeting allies
         """
         actions = []
+        w = self.weights
         skill_range = getattr(skill, 'range', 3)
 
         # Get all friendly units (excluding self if desired)
@@ -1696,6 +1714,7 @@ class TacticalEvaluator:
         if not friendly_units:
             return actions
 
+        evaluator_stats.count(generated=len(friendly_units))
         # Evaluate each ally
         for ally in friendly_units:
             # Check range
@@ -1714,6 +1733,7 @@ class TacticalEvaluator:
             if hasattr(ally, 'partition_shield_active') and ally.partition_shield_active:
                 continue
 
+            evaluator_stats.count(scored=1)
             # Calculate score
             score = 0.0
 
@@ -1729,33 +1749,33 @@ class TacticalEvaluator:
 
             # High score for endangered allies
             if endangered:
-                endangered_score = 100
+                endangered_score = w.partition_endangered
                 score += endangered_score
                 logger.debug(f"  Partition on {ally.get_display_name()}: Endangered (threat {threat_level}), +{endangered_score}")
 
             # Bonus for low HP allies (preemptive protection)
             if ally.hp < ally.max_hp * 0.4:
-                low_hp_score = 50
+                low_hp_score = w.partition_low_hp
                 score += low_hp_score
                 logger.debug(f"  Partition on {ally.get_display_name()}: Low HP ({ally.hp}/{ally.max_hp}), +{low_hp_score}")
 
             # Bonus for priority units
             if ally in plan.focus_targets:
-                priority_score = 60
+                priority_score = w.partition_focus
                 score += priority_score
                 logger.debug(f"  Partition on {ally.get_display_name()}: Priority target, +{priority_score}")
 
             # Bonus for key unit types (DERELICTIONIST itself, high-value units)
             if ally == unit:
                 # Shielding self
-                self_shield = 40
+                self_shield = w.partition_self
                 score += self_shield
                 logger.debug(f"  Partition on {ally.get_display_name()}: Self-shield, +{self_shield}")
             elif hasattr(ally, 'type'):
                 from boneglaive.utils.constants import UnitType
                 # Protect other DERELICTIONISTs or key support units
                 if ally.type in [UnitType.DERELICTIONIST, UnitType.POTPOURRIST]:
-                    support_bonus = 40
+                    support_bonus = w.partition_support
                     score += support_bonus
                     logger.debug(f"  Partition on {ally.get_display_name()}: Support unit, +{support_bonus}")
 
@@ -1772,19 +1792,19 @@ class TacticalEvaluator:
             if enemies_in_range > 0:
                 # Estimate shield will block 1 damage per enemy per turn for 3 turns
                 estimated_blocks = min(enemies_in_range * 3, 9)  # Cap at 9 damage blocked
-                shield_value = estimated_blocks * 5
+                shield_value = estimated_blocks * w.partition_per_block
                 score += shield_value
                 logger.debug(f"  Partition on {ally.get_display_name()}: {enemies_in_range} enemies in range, estimated {estimated_blocks} blocks, +{shield_value}")
 
             # Strategy bonuses
             if plan.strategy.value == "defensive_hold":
-                defensive_bonus = 25
+                defensive_bonus = w.partition_defensive
                 score += defensive_bonus
                 logger.debug(f"  Partition on {ally.get_display_name()}: Defensive strategy, +{defensive_bonus}")
 
             # Penalty for full HP allies in safe positions (wasteful)
             if ally.hp == ally.max_hp and threat_level < ally.hp * 0.2:
-                waste_penalty = 30
+                waste_penalty = w.partition_waste_penalty
                 score -= waste_penalty
                 logger.debug(f"  Partition on {ally.get_display_name()}: Full HP and safe, -{waste_penalty}")
 
@@ -1792,12 +1812,12 @@ class TacticalEvaluator:
             # (Moving toward enemies)
             if hasattr(ally, 'move_target') and ally.move_target:
                 # Ally is moving - likely engaging
-                engaging_bonus = 15
+                engaging_bonus = w.partition_engaging
                 score += engaging_bonus
                 logger.debug(f"  Partition on {ally.get_display_name()}: Engaging/moving, +{engaging_bonus}")
 
             # Only create action if worthwhile
-            if score > 40:
+            if score > w.partition_threshold:
                 action = Action("skill", target=(skill, ally), priority=score)
                 action.data['ally_target'] = ally
                 action.data['threat_level'] = threat_level
@@ -1899,36 +1919,11 @@ class TacticalEvaluator:
             logger.debug(f"            Broaching Gas: Only {charges} charges, skipping")
             return actions
 
-        # Get source position (current or planned)
-        if unit.move_target:
-            source_y, source_x = unit.move_target
-        else:
-            source_y, source_x = unit.y, unit.x
-
-        # Find valid placement positions (empty, passable, within range 4)
-        valid_positions = []
-        for y in range(self.game.map.height):
-            for x in range(self.game.map.width):
-                # Check if position is valid
-                if not self.game.is_valid_position(y, x):
-                    continue
-                if not self.game.map.is_passable(y, x):
-                    continue
-                if self.game.get_unit_at(y, x) is not None:
-                    continue
-
-                # Check range
-                distance = self.game.chess_distance(source_y, source_x, y, x)
-                if distance > skill.range:
-                    continue
-
-                # Check line of sight
-                if not self.game.has_line_of_sight(source_y, source_x, y, x):
-                    continue
-
-                valid_positions.append((y, x))
+        # Find valid placement positions (empty, passable, within range 4, in sight)
+        valid_positions = skill_target_candidates(skill, unit, self.game, validate=False)
 
         # Score each position
+        evaluator_stats.count(generated=len(valid_positions), scored=len(valid_positions))
         for pos in valid_positions:
             score = self._score_broaching_gas_placement(unit, pos, charges, analysis, plan)
             if score > 0:
@@ -1943,6 +1938,7 @@ class TacticalEvaluator:
                                       analysis: 'BattlefieldAnalysis', plan: 'StrategicPlan') -> float:
         """Score a Broaching Gas placement position."""
         score = 0.0
+        w = self.weights
         y, x = pos
 
         # Count nearby enemies (damage value)
@@ -1959,7 +1955,7 @@ class TacticalEvaluator:
             dist = self.game.chess_distance(y, x, enemy.y, enemy.x)
             if dist <= 1:  # Adjacent
                 nearby_enemies += 1
-                score += 25.0  # Each adjacent enemy gets damaged per turn
+                score += w.broaching_gas_per_enemy  # Each adjacent enemy gets damaged per turn
 
         # Count nearby allies with status effects (cleanse value)
         cleanse_value = 0
@@ -1983,17 +1979,17 @@ class TacticalEvaluator:
             return 0.0
 
         # Base score for a placement that actually does something
-        score += 30.0
+        score += w.gas_base
 
         # Charge bonus (prefer 3-4 charges)
         if charges >= 4:
-            score += 40.0  # Excellent value
+            score += w.gas_four_charges
         elif charges >= 3:
-            score += 20.0  # Good value
+            score += w.gas_three_charges
         else:
-            score -= 10.0  # Mediocre value
+            score -= w.gas_low_charge_penalty
 
-        score += cleanse_value * 20.0
+        score += cleanse_value * w.broaching_gas_per_cleanse
 
         # Bonus if near focus targets
         for enemy in plan.focus_targets:
@@ -2001,7 +1997,7 @@ class TacticalEvaluator:
                 continue
             dist = self.game.chess_distance(y, x, enemy.y, enemy.x)
             if dist <= 1:
-                score += 30.0
+                score += w.broaching_gas_focus
 
         return score
 
@@ -2015,33 +2011,11 @@ class TacticalEvaluator:
             logger.debug(f"            Saft-E-Gas: Only {charges} charges, skipping")
             return actions
 
-        # Get source position (current or planned)
-        if unit.move_target:
-            source_y, source_x = unit.move_target
-        else:
-            source_y, source_x = unit.y, unit.x
-
         # Find valid placement positions
-        valid_positions = []
-        for y in range(self.game.map.height):
-            for x in range(self.game.map.width):
-                if not self.game.is_valid_position(y, x):
-                    continue
-                if not self.game.map.is_passable(y, x):
-                    continue
-                if self.game.get_unit_at(y, x) is not None:
-                    continue
-
-                distance = self.game.chess_distance(source_y, source_x, y, x)
-                if distance > skill.range:
-                    continue
-
-                if not self.game.has_line_of_sight(source_y, source_x, y, x):
-                    continue
-
-                valid_positions.append((y, x))
+        valid_positions = skill_target_candidates(skill, unit, self.game, validate=False)
 
         # Score each position
+        evaluator_stats.count(generated=len(valid_positions), scored=len(valid_positions))
         for pos in valid_positions:
             score = self._score_saft_e_gas_placement(unit, pos, charges, analysis, plan)
             if score > 0:
@@ -2056,18 +2030,19 @@ class TacticalEvaluator:
                                    analysis: 'BattlefieldAnalysis', plan: 'StrategicPlan') -> float:
         """Score a Saft-E-Gas placement position."""
         score = 0.0
+        w = self.weights
         y, x = pos
 
         # Base score
-        score += 30.0
+        score += w.gas_base
 
         # Charge bonus
         if charges >= 4:
-            score += 40.0
+            score += w.gas_four_charges
         elif charges >= 3:
-            score += 20.0
+            score += w.gas_three_charges
         else:
-            score -= 10.0
+            score -= w.gas_low_charge_penalty
 
         # Count nearby injured allies (healing value)
         heal_value = 0
@@ -2083,8 +2058,8 @@ class TacticalEvaluator:
                 # Defense buff value (always useful)
                 defense_value += 1
 
-        score += heal_value * 15.0
-        score += defense_value * 10.0
+        score += heal_value * w.saft_e_gas_per_heal
+        score += defense_value * w.saft_e_gas_per_ally
 
         # Bonus if allies are in danger
         endangered_allies = 0
@@ -2097,7 +2072,7 @@ class TacticalEvaluator:
                     if threat.threat_level >= ally.hp * 0.5:
                         endangered_allies += 1
 
-        score += endangered_allies * 25.0
+        score += endangered_allies * w.saft_e_gas_endangered
 
         return score
 
@@ -2121,6 +2096,7 @@ class TacticalEvaluator:
             source_y, source_x = unit.y, unit.x
 
         # Option 1: Diverge self
+        evaluator_stats.count(generated=1)
         # Check if self-targeting is valid (requires at least 1 empty adjacent tile)
         self_pos = (source_y, source_x)
         adjacent_empty = 0
@@ -2134,6 +2110,7 @@ class TacticalEvaluator:
 
         if adjacent_empty >= 1:
             # Score self-diverge
+            evaluator_stats.count(scored=1)
             score = self._score_diverge_self(unit, charges, analysis, plan)
             if score > 0:
                 action = Action("skill", target=(skill, self_pos), priority=score)
@@ -2146,6 +2123,7 @@ class TacticalEvaluator:
         for ally in analysis.ai_units:
             if ally.type != UnitType.HEINOUS_VAPOR:
                 continue
+            evaluator_stats.count(generated=1)
 
             # Check if within range
             dist = self.game.chess_distance(source_y, source_x, ally.y, ally.x)
@@ -2167,6 +2145,7 @@ class TacticalEvaluator:
 
             if vapor_adjacent_empty >= 1:
                 # Score vapor-diverge
+                evaluator_stats.count(scored=1)
                 score = self._score_diverge_vapor(unit, ally, charges, analysis, plan)
                 if score > 0:
                     action = Action("skill", target=(skill, (ally.y, ally.x)), priority=score)
@@ -2182,15 +2161,16 @@ class TacticalEvaluator:
                            analysis: 'BattlefieldAnalysis', plan: 'StrategicPlan') -> float:
         """Score self-diverge action."""
         score = 0.0
+        w = self.weights
 
         # Base score
-        score += 50.0
+        score += w.diverge_self_base
 
         # HUGE bonus for 4 charges (optimal)
         if charges >= 4:
-            score += 80.0  # Creates 2 vapors for 4 turns = incredible value
+            score += w.diverge_self_four_charges  # Creates 2 vapors for 4 turns = incredible value
         elif charges >= 3:
-            score += 30.0  # Still good
+            score += w.diverge_self_three_charges
 
         # Strategic value: splitting creates Coolant (heals) + Cutting (damages)
         # This is high value if there are nearby allies and enemies
@@ -2211,7 +2191,7 @@ class TacticalEvaluator:
 
         # Bonus if in good tactical position
         if nearby_allies >= 2 and nearby_enemies >= 1:
-            score += 40.0  # Great position for dual-purpose vapors
+            score += w.diverge_self_position  # Great position for dual-purpose vapors
 
         return score
 
@@ -2219,23 +2199,24 @@ class TacticalEvaluator:
                             analysis: 'BattlefieldAnalysis', plan: 'StrategicPlan') -> float:
         """Score diverging an existing vapor."""
         score = 0.0
+        w = self.weights
 
         # Base score
-        score += 40.0
+        score += w.diverge_vapor_base
 
         # Charge bonus
         if charges >= 4:
-            score += 60.0
+            score += w.diverge_vapor_four_charges
         elif charges >= 3:
-            score += 20.0
+            score += w.diverge_vapor_three_charges
 
         # Bonus for refreshing a dying vapor
         if hasattr(vapor, 'vapor_duration') and vapor.vapor_duration <= 1:
-            score += 50.0  # High value to refresh expiring vapor
+            score += w.diverge_vapor_refresh  # High value to refresh expiring vapor
 
         # Bonus for repositioning/upgrading existing vapor
         # Diverge converts any vapor type into Coolant + Cutting
-        score += 20.0  # Always some value in splitting
+        score += w.diverge_vapor_split  # Always some value in splitting
 
         return score
 
@@ -2301,6 +2282,7 @@ class TacticalEvaluator:
 
         # Evaluate Auction Curse (enemy-targeted, can use generic evaluation)
         if auction_curse:
+            evaluator_stats.count(generated=len(analysis.enemy_units))
             for enemy in analysis.enemy_units:
                 # Skip HEINOUS VAPOR
                 if enemy.type == UnitType.HEINOUS_VAPOR:
@@ -2308,10 +2290,11 @@ class TacticalEvaluator:
 
                 try:
                     if auction_curse.can_use(unit, (enemy.y, enemy.x), self.game):
+                        evaluator_stats.count(scored=1)
                         score = self._score_skill_use(unit, auction_curse, enemy, analysis, plan)
                         # Bonus for enemies near furniture (more damage)
                         nearby_furniture_count = self._count_nearby_furniture(enemy.y, enemy.x, radius=2)
-                        score += nearby_furniture_count * 10.0
+                        score += nearby_furniture_count * self.weights.auction_curse_per_furniture
                         
                         action = Action("skill", target=(auction_curse, enemy), priority=score)
                         actions.append(action)
@@ -2352,37 +2335,24 @@ class TacticalEvaluator:
         
         actions = []
 
-        # Get source position
-        if unit.move_target:
-            source_y, source_x = unit.move_target
-        else:
-            source_y, source_x = unit.y, unit.x
-
-        # Find all furniture within range 4
+        # Find all furniture within range 4 and in sight
         furniture_positions = []
-        for y in range(self.game.map.height):
-            for x in range(self.game.map.width):
-                terrain = self.game.map.get_terrain_at(y, x)
-                if terrain not in [TerrainType.LECTERN, TerrainType.COAT_RACK,
-                                 TerrainType.OTTOMAN, TerrainType.CONSOLE, TerrainType.CURIOSITY_SHELF,
-                                 TerrainType.TIFFANY_LAMP, TerrainType.EASEL, TerrainType.SCULPTURE,
-                                 TerrainType.BENCH, TerrainType.PODIUM, TerrainType.VASE,
-                                 TerrainType.WORKBENCH, TerrainType.COUCH, TerrainType.TOOLBOX,
-                                 TerrainType.COT, TerrainType.CONVEYOR, TerrainType.MINI_PUMPKIN,
-                                 TerrainType.POTPOURRI_BOWL]:
-                    continue
-
-                # Check range
-                distance = self.game.chess_distance(source_y, source_x, y, x)
-                if distance > skill.range:
-                    continue
-
-                # Check line of sight
-                if not self.game.has_line_of_sight(source_y, source_x, y, x):
-                    continue
+        candidates = skill_target_candidates(skill, unit, self.game, validate=False)
+        evaluator_stats.count(generated=len(candidates))
+        for y, x in candidates:
+            terrain = self.game.map.get_terrain_at(y, x)
+            if terrain not in [TerrainType.LECTERN, TerrainType.COAT_RACK,
+                             TerrainType.OTTOMAN, TerrainType.CONSOLE, TerrainType.CURIOSITY_SHELF,
+                             TerrainType.TIFFANY_LAMP, TerrainType.EASEL, TerrainType.SCULPTURE,
+                             TerrainType.BENCH, TerrainType.PODIUM, TerrainType.VASE,
+                             TerrainType.WORKBENCH, TerrainType.COUCH, TerrainType.TOOLBOX,
+                             TerrainType.COT, TerrainType.CONVEYOR, TerrainType.MINI_PUMPKIN,
+                             TerrainType.POTPOURRI_BOWL]:
+                continue
 
-                furniture_positions.append((y, x))
+            furniture_positions.append((y, x))
 
+        evaluator_stats.count(scored=len(furniture_positions))
         # Score each furniture piece
         for pos in furniture_positions:
             score = self._score_market_futures_placement(unit, pos, analysis, plan)
@@ -2397,10 +2367,11 @@ class TacticalEvaluator:
                                        analysis: 'BattlefieldAnalysis', plan: 'StrategicPlan') -> float:
         """Score a Market Futures furniture placement."""
         score = 0.0
+        w = self.weights
         y, x = pos
 
         # Base score
-        score += 40.0
+        score += w.market_futures_base
 
         # Get astral value (will be generated if doesn't exist)
         astral_value = self.game.map.get_cosmic_value(y, x, player=unit.player, game=self.game)
@@ -2409,11 +2380,11 @@ class TacticalEvaluator:
 
         # Bonus for high astral value (better teleport range + buffs)
         if astral_value >= 9:
-            score += 50.0  # Excellent value
+            score += w.market_futures_astral_high
         elif astral_value >= 7:
-            score += 30.0  # Good value
+            score += w.market_futures_astral_mid
         elif astral_value >= 5:
-            score += 15.0  # Decent value
+            score += w.market_futures_astral_low
 
         # Count nearby allies (investment buff value)
         nearby_allies = 0
@@ -2422,19 +2393,19 @@ class TacticalEvaluator:
             if dist <= 3:  # Within reasonable distance
                 nearby_allies += 1
 
-        score += nearby_allies * 20.0
+        score += nearby_allies * w.market_futures_per_ally
 
         # Check if position is strategic (safe area, good positioning)
         # Bonus if NOT in threat zone
         if (y, x) not in analysis.threat_map:
-            score += 25.0  # Safe teleport destination
+            score += w.market_futures_safe  # Safe teleport destination
 
         # Check for existing anchors - avoid redundancy
         if hasattr(self.game, 'teleport_anchors'):
             for anchor_pos in self.game.teleport_anchors:
                 dist = self.game.chess_distance(y, x, anchor_pos[0], anchor_pos[1])
                 if dist <= 5:  # Too close to existing anchor
-                    score -= 30.0
+                    score -= w.market_futures_anchor_penalty
 
         return score
 
@@ -2445,37 +2416,24 @@ class TacticalEvaluator:
         
         actions = []
 
-        # Get source position
-        if unit.move_target:
-            source_y, source_x = unit.move_target
-        else:
-            source_y, source_x = unit.y, unit.x
-
-        # Find all furniture within range 3
+        # Find all furniture within range 3 and in sight
         furniture_positions = []
-        for y in range(self.game.map.height):
-            for x in range(self.game.map.width):
-                terrain = self.game.map.get_terrain_at(y, x)
-                if terrain not in [TerrainType.LECTERN, TerrainType.COAT_RACK,
-                                 TerrainType.OTTOMAN, TerrainType.CONSOLE, TerrainType.CURIOSITY_SHELF,
-                                 TerrainType.TIFFANY_LAMP, TerrainType.EASEL, TerrainType.SCULPTURE,
-                                 TerrainType.BENCH, TerrainType.PODIUM, TerrainType.VASE,
-                                 TerrainType.WORKBENCH, TerrainType.COUCH, TerrainType.TOOLBOX,
-                                 TerrainType.COT, TerrainType.CONVEYOR, TerrainType.MINI_PUMPKIN,
-                                 TerrainType.POTPOURRI_BOWL]:
-                    continue
-
-                # Check range
-                distance = self.game.chess_distance(source_y, source_x, y, x)
-                if distance > skill.range:
-                    continue
-
-                # Check line of sight
-                if not self.game.has_line_of_sight(source_y, source_x, y, x):
-                    continue
+        candidates = skill_target_candidates(skill, unit, self.game, validate=False)
+        evaluator_stats.count(generated=len(candidates))
+        for y, x in candidates:
+            terrain = self.game.map.get_terrain_at(y, x)
+            if terrain not in [TerrainType.LECTERN, TerrainType.COAT_RACK,
+                             TerrainType.OTTOMAN, TerrainType.CONSOLE, TerrainType.CURIOSITY_SHELF,
+                             TerrainType.TIFFANY_LAMP, TerrainType.EASEL, TerrainType.SCULPTURE,
+                             TerrainType.BENCH, TerrainType.PODIUM, TerrainType.VASE,
+                             TerrainType.WORKBENCH, TerrainType.COUCH, TerrainType.TOOLBOX,
+                             TerrainType.COT, TerrainType.CONVEYOR, TerrainType.MINI_PUMPKIN,
+                             TerrainType.POTPOURRI_BOWL]:
+                continue
 
-                furniture_positions.append((y, x))
+            furniture_positions.append((y, x))
 
+        evaluator_stats.count(scored=len(furniture_positions))
         # Score each furniture piece as potential target
         for pos in furniture_positions:
             score = self._score_divine_depreciation_target(unit, pos, analysis, plan)
@@ -2490,6 +2448,7 @@ class TacticalEvaluator:
                                          analysis: 'BattlefieldAnalysis', plan: 'StrategicPlan') -> float:
         """Score a Divine Depreciation furniture target."""
         score = 0.0
+        w = self.weights
         y, x = pos
 
         # Count enemies in 7×7 area FIRST (must have at least 1 enemy to be worthwhile)
@@ -2516,7 +2475,7 @@ class TacticalEvaluator:
             return 0.0
 
         # Base score (only if there are enemies)
-        score += 50.0
+        score += w.divine_depreciation_base
 
         # Get astral value of target
         astral_value = self.game.map.get_cosmic_value(y, x, player=unit.player, game=self.game)
@@ -2525,15 +2484,15 @@ class TacticalEvaluator:
 
         # Bonus for high astral value (bigger implosion damage/pull)
         if astral_value >= 9:
-            score += 60.0  # Maximum chaos
+            score += w.divine_depreciation_astral_high  # Maximum chaos
         elif astral_value >= 7:
-            score += 40.0
+            score += w.divine_depreciation_astral_mid
         elif astral_value >= 5:
-            score += 20.0
+            score += w.divine_depreciation_astral_low
 
         # Massive bonus for hitting multiple enemies
-        score += enemies_in_area * 40.0
-        score += low_move_enemies * 20.0  # Extra for enemies that get pulled
+        score += enemies_in_area * w.divine_depreciation_per_enemy
+        score += low_move_enemies * w.divine_depreciation_per_pulled  # Extra for enemies that get pulled
 
         # Bonus for hitting focus targets
         for enemy in plan.focus_targets:
@@ -2541,11 +2500,11 @@ class TacticalEvaluator:
                 continue
             dist = self.game.chess_distance(y, x, enemy.y, enemy.x)
             if dist <= 3:  # In the 7×7 area
-                score += 50.0
+                score += w.divine_depreciation_focus
 
         # Count other furniture in 7×7 (reroll potential)
         other_furniture_count = self._count_nearby_furniture(y, x, radius=3) - 1  # Exclude target
-        score += other_furniture_count * 5.0  # Slight bonus for reroll potential
+        score += other_furniture_count * w.divine_depreciation_per_furniture  # Slight bonus for reroll potential
 
         return score
 
@@ -2612,6 +2571,7 @@ class TacticalEvaluator:
                     
                 valid_destinations.append((y, x))
         
+        evaluator_stats.count(generated=len(valid_destinations), scored=len(valid_destinations))
         # Score each destination
         for dest in valid_destinations:
             score = self._score_parallax_destination(unit, dest, anchor_pos, analysis, plan)
@@ -2627,19 +2587,20 @@ class TacticalEvaluator:
                                    analysis: 'BattlefieldAnalysis', plan: 'StrategicPlan') -> float:
         """Score a Parallax teleport destination."""
         score = 0.0
+        w = self.weights
         dest_y, dest_x = dest
         
         # Base score for using teleport
-        score += 60.0
+        score += w.parallax_base
         
         # High bonus if destination is NOT in threat map (safe positioning)
         if dest not in analysis.threat_map:
-            score += 50.0
+            score += w.parallax_safe
         else:
             # Penalty if dangerous
             threat = analysis.threat_map[dest]
             if threat.threat_level >= unit.hp * 0.5:
-                score -= 40.0  # Dangerous destination
+                score -= w.parallax_danger_penalty  # Dangerous destination
         
         # Bonus for getting closer to enemies (offensive positioning)
         min_enemy_dist_before = 999
@@ -2658,13 +2619,13 @@ class TacticalEvaluator:
         # Bonus for aggressive positioning (getting closer to enemies)
         if min_enemy_dist_after < min_enemy_dist_before:
             improvement = min_enemy_dist_before - min_enemy_dist_after
-            score += improvement * 15.0
+            score += improvement * w.parallax_per_tile_closed
             
             # Extra bonus if we can attack after teleporting
             stats = unit.get_effective_stats()
             attack_range = stats['attack_range']
             if min_enemy_dist_after <= attack_range:
-                score += 40.0  # Can attack immediately after teleport
+                score += w.parallax_attack_ready  # Can attack immediately after teleport
         
         # Bonus for supporting allies (getting closer to allies)
         nearby_allies = 0
@@ -2673,7 +2634,7 @@ class TacticalEvaluator:
             if dist <= 2:
                 nearby_allies += 1
         
-        score += nearby_allies * 10.0
+        score += nearby_allies * w.parallax_per_ally
         
         # Bonus for focus targets in range after teleport
         for enemy in plan.focus_targets:
@@ -2681,14 +2642,14 @@ class TacticalEvaluator:
                 continue
             dist = self.game.chess_distance(dest_y, dest_x, enemy.y, enemy.x)
             if dist <= 3:
-                score += 30.0
+                score += w.parallax_focus
         
         # Distance from current position (prefer meaningful teleports)
         teleport_distance = self.game.chess_distance(unit.y, unit.x, dest_y, dest_x)
         if teleport_distance >= 3:
-            score += 20.0  # Bonus for significant repositioning
+            score += w.parallax_long_hop  # Bonus for significant repositioning
         elif teleport_distance <= 1:
-            score -= 30.0  # Penalty for trivial teleports
+            score -= w.parallax_short_hop_penalty  # Penalty for trivial teleports
         
         return score
 
@@ -2697,30 +2658,11 @@ class TacticalEvaluator:
         """Evaluate Scalar Node trap placement (INTERFERER)."""
         actions = []
         
-        # Get source position
-        if unit.move_target:
-            source_y, source_x = unit.move_target
-        else:
-            source_y, source_x = unit.y, unit.x
-        
         # Find valid trap positions (empty, passable, within range 3)
-        valid_positions = []
-        for y in range(self.game.map.height):
-            for x in range(self.game.map.width):
-                if not self.game.is_valid_position(y, x):
-                    continue
-                if not self.game.map.is_passable(y, x):
-                    continue
-                if self.game.get_unit_at(y, x) is not None:
-                    continue
-                
-                distance = self.game.chess_distance(source_y, source_x, y, x)
-                if distance > skill.range:
-                    continue
-                
-                valid_positions.append((y, x))
+        valid_positions = skill_target_candidates(skill, unit, self.game, validate=False)
         
         # Score each position
+        evaluator_stats.count(generated=len(valid_positions), scored=len(valid_positions))
         for pos in valid_positions:
             score = self._score_scalar_node_placement(unit, pos, analysis, plan)
             if score > 0:
@@ -2734,6 +2676,7 @@ class TacticalEvaluator:
                                      analysis: 'BattlefieldAnalysis', plan: 'StrategicPlan') -> float:
         """Score a Scalar Node trap placement."""
         score = 0.0
+        w = self.weights
         y, x = pos
 
         # Engagement gate: a trap only matters if an enemy might actually walk into it
@@ -2746,7 +2689,7 @@ class TacticalEvaluator:
             return 0.0
 
         # Base score
-        score += 30.0
+        score += w.scalar_node_base
 
         # Score based on enemy proximity and likely movement
         for enemy in analysis.enemy_units:
@@ -2757,11 +2700,11 @@ class TacticalEvaluator:
 
             # High bonus for tiles adjacent to enemies (likely to move here)
             if enemy_dist == 1:
-                score += 60.0
+                score += w.scalar_node_adjacent
             elif enemy_dist == 2:
-                score += 30.0
+                score += w.scalar_node_two_tiles
             elif enemy_dist == 3:
-                score += 10.0
+                score += w.scalar_node_three_tiles
         
         # Bonus for focus target movement paths
         for enemy in plan.focus_targets:
@@ -2769,7 +2712,7 @@ class TacticalEvaluator:
                 continue
             dist = self.game.chess_distance(y, x, enemy.y, enemy.x)
             if dist <= 2:
-                score += 40.0
+                score += w.scalar_node_focus
         
         # Bonus for choke points (few passable neighbors)
         passable_neighbors = 0
@@ -2780,7 +2723,7 @@ class TacticalEvaluator:
                 passable_neighbors += 1
         
         if passable_neighbors <= 2:
-            score += 25.0  # Choke point
+            score += w.scalar_node_choke  # Choke point
 
         return score
 
@@ -2837,10 +2780,11 @@ class TacticalEvaluator:
         if skills_on_cd == 0:
             return 0.0
 
-        bonus = skills_on_cd * 5.0
+        w = self.weights
+        bonus = skills_on_cd * w.landscaper_per_cooldown
         cd_reduced = min(expected_damage, total_cd_remaining)
-        bonus += cd_reduced * 2.0
-        return min(bonus, 40.0)
+        bonus += cd_reduced * w.landscaper_per_cooldown_turn
+        return min(bonus, w.landscaper_cycling_cap)
 
     def _evaluate_landscaper_skills(self, unit: 'Unit', analysis: 'BattlefieldAnalysis',
                                      plan: 'StrategicPlan') -> List[Action]:
@@ -2886,6 +2830,8 @@ class TacticalEvaluator:
         from boneglaive.game.skills.landscaper import DIRECTION_VECTORS, DRAG_DIRECTION_CCW
 
         actions = []
+        w = self.weights
+        evaluator_stats.count(generated=len(DIRECTION_VECTORS))
 
         for dir_name, (dy, dx) in DIRECTION_VECTORS.items():
             # Find terrain in this direction using the skill's own method
@@ -2913,21 +2859,22 @@ class TacticalEvaluator:
             slag_tiles = drag_tiles[:-1] if len(drag_tiles) > 1 else []
             all_affected_tiles = drag_tiles  # Slag + deposit
 
+            evaluator_stats.count(scored=1)
             # Score this direction
-            score = 30.0
+            score = w.hornswoggle_base
             combat_relevant = False  # did this cast actually affect/setup against an enemy?
 
             # Enemy displacement at slag/deposit tiles
             for ty, tx in all_affected_tiles:
                 displaced_unit = self.game.get_unit_at(ty, tx)
                 if displaced_unit and displaced_unit.is_alive() and displaced_unit.player != unit.player:
-                    score += 25.0
+                    score += w.hornswoggle_displace
                     combat_relevant = True
                     if displaced_unit in plan.focus_targets:
-                        score += 15.0
+                        score += w.hornswoggle_displace_focus
 
             # Slag wall creation value
-            score += len(slag_tiles) * 10.0
+            score += len(slag_tiles) * w.hornswoggle_per_slag
 
             # Combo setup: deposit position near enemies (future Dissonance target)
             dep_y, dep_x = deposit_pos
@@ -2936,17 +2883,17 @@ class TacticalEvaluator:
                     continue
                 dist = self.game.chess_distance(dep_y, dep_x, enemy.y, enemy.x)
                 if dist <= 2:
-                    score += 20.0
+                    score += w.hornswoggle_deposit_near
                     combat_relevant = True
                 elif dist <= 4:
-                    score += 10.0
+                    score += w.hornswoggle_deposit_far
                     combat_relevant = True
 
             # Grabbing an enemy topiary (dragging immobilized enemy)
             if hasattr(self.game, 'topiary_units') and (grab_y, grab_x) in self.game.topiary_units:
                 topiary_data = self.game.topiary_units[(grab_y, grab_x)]
                 if topiary_data['unit'].player != unit.player:
-                    score += 35.0
+                    score += w.hornswoggle_topiary
                     combat_relevant = True
 
             # Engagement gate: terrain manipulation with no enemy displaced, no enemy
@@ -2958,7 +2905,7 @@ class TacticalEvaluator:
 
             # Strategy bonus
             if plan.strategy.value in ["aggressive_push", "desperate_rush"]:
-                score += 15.0
+                score += w.hornswoggle_aggressive
 
             # Penalty: removing terrain that shields allies
             for ally in analysis.ai_units:
@@ -2971,10 +2918,10 @@ class TacticalEvaluator:
                     ally_dist_to_grab = self.game.chess_distance(ally.y, ally.x, grab_y, grab_x)
                     enemy_dist_to_grab = self.game.chess_distance(enemy.y, enemy.x, grab_y, grab_x)
                     if ally_dist_to_grab <= 2 and enemy_dist_to_grab <= 3:
-                        score -= 15.0
+                        score -= w.hornswoggle_shield_penalty
                         break  # Only penalize once per ally
 
-            if score < 25:
+            if score < w.hornswoggle_threshold:
                 continue
 
             target_pos = (unit.y + dy, unit.x + dx)
@@ -2992,6 +2939,8 @@ class TacticalEvaluator:
         from boneglaive.game.skills.landscaper import DIRECTION_VECTORS, _get_cone_tiles
 
         actions = []
+        w = self.weights
+        evaluator_stats.count(generated=len(DIRECTION_VECTORS))
 
         for dir_name, (dy, dx) in DIRECTION_VECTORS.items():
             cone_tiles, _ = _get_cone_tiles(unit.y, unit.x, dir_name, self.game)
@@ -3019,48 +2968,49 @@ class TacticalEvaluator:
             if not enemies_caught:
                 continue
 
+            evaluator_stats.count(scored=1)
             score = 0.0
 
             # Enemy value
             for enemy in enemies_caught:
-                score += 50.0
+                score += w.topiary_breath_per_enemy
                 # Priority target bonus
                 for pt, ps in analysis.priority_targets[:3]:
                     if pt == enemy:
-                        score += 30.0
+                        score += w.topiary_breath_priority
                         break
                 # Focus target bonus
                 if enemy in plan.focus_targets:
-                    score += 20.0
+                    score += w.topiary_breath_focus
                 # Threat neutralization value
                 enemy_pos = (enemy.y, enemy.x)
                 if enemy_pos in analysis.threat_map:
                     threat = analysis.threat_map[enemy_pos]
-                    score += min(threat.threat_level * 2, 30.0)
+                    score += min(threat.threat_level * w.topiary_breath_threat_factor, w.topiary_breath_threat_cap)
 
             # Multi-enemy bonus
             if len(enemies_caught) >= 2:
-                score += 30.0
+                score += w.topiary_breath_two_enemies
             if len(enemies_caught) >= 3:
-                score += 25.0
+                score += w.topiary_breath_three_enemies
 
             # Ally penalty — catastrophic
             for ally in allies_caught:
-                score -= 80.0
+                score -= w.topiary_breath_ally_penalty
                 if ally.hp > ally.max_hp * 0.5:
-                    score -= 20.0
+                    score -= w.topiary_breath_healthy_ally_penalty
 
             # Strategy bonus
             if plan.strategy.value in ["aggressive_push", "desperate_rush"]:
-                score += 20.0
+                score += w.topiary_breath_aggressive
 
             # Combo setup: Dissonance available soon
             for s in unit.active_skills:
                 if s.name == "Dissonance" and s.current_cooldown <= 2:
-                    score += len(enemies_caught) * 15.0
+                    score += len(enemies_caught) * w.topiary_breath_dissonance_combo
                     break
 
-            if score < 40:
+            if score < w.topiary_breath_threshold:
                 continue
 
             target_pos = (unit.y + dy, unit.x + dx)
@@ -3080,6 +3030,7 @@ class TacticalEvaluator:
         from boneglaive.game.skills.landscaper import DIRECTION_VECTORS
 
         actions = []
+        w = self.weights
         source_y, source_x = unit.y, unit.x
         shrapnel_damage = 5
         shrapnel_range = 2
@@ -3089,6 +3040,7 @@ class TacticalEvaluator:
             for x in range(max(0, source_x - 4), min(self.game.map.width, source_x + 5)):
                 if self.game.chess_distance(source_y, source_x, y, x) > 4:
                     continue
+                evaluator_stats.count(generated=1)
 
                 is_terrain = not self.game.map.is_passable(y, x) or self.game.map.is_furniture(y, x)
                 is_topiary = hasattr(self.game, 'topiary_units') and (y, x) in self.game.topiary_units
@@ -3113,6 +3065,7 @@ class TacticalEvaluator:
                                 hit_unit.type != UnitType.HEINOUS_VAPOR):
                             enemies_hit.add(hit_unit)
 
+                evaluator_stats.count(scored=1)
                 score = 0.0
 
                 # Topiary handling
@@ -3121,37 +3074,37 @@ class TacticalEvaluator:
                     if topiary_data:
                         topiary_unit = topiary_data['unit']
                         if topiary_unit.player == unit.player:
-                            score += 70.0  # Freeing an ally!
+                            score += w.dissonance_free_ally  # Freeing an ally!
                         elif not enemies_hit:
-                            score -= 30.0  # Freeing enemy with no shrapnel value
+                            score -= w.dissonance_free_enemy_penalty  # Freeing enemy with no shrapnel value
 
                 # Shrapnel damage value
                 for enemy in enemies_hit:
-                    score += shrapnel_damage * 3  # 15 per hit
+                    score += w.dissonance_per_hit
                     if enemy.hp <= shrapnel_damage:
-                        score += 40.0
+                        score += w.dissonance_kill
                     for pt, ps in analysis.priority_targets[:3]:
                         if pt == enemy:
-                            score += 25.0
+                            score += w.dissonance_priority
                             break
                     if enemy in plan.focus_targets:
-                        score += 20.0
+                        score += w.dissonance_focus
 
                 # Multi-hit bonus
                 if len(enemies_hit) >= 2:
-                    score += 25.0
+                    score += w.dissonance_two_enemies
                 if len(enemies_hit) >= 3:
-                    score += 20.0
+                    score += w.dissonance_three_enemies
 
                 # Strategy bonus
                 if plan.strategy.value in ["aggressive_push", "desperate_rush"]:
-                    score += 15.0
+                    score += w.dissonance_aggressive
 
                 # Slight reluctance to destroy own slag walls
                 if hasattr(self.game, 'slag_wall_tiles') and (y, x) in self.game.slag_wall_tiles:
-                    score -= 5.0
+                    score -= w.dissonance_slag_penalty
 
-                if score < 30:
+                if score < w.dissonance_threshold:
                     continue
 
                 target_pos = (y, x)
@@ -3188,22 +3141,23 @@ class TacticalEvaluator:
         global low-HP priority bias. The single building block every bomb-planting
         sub-scorer shares so the graft and drone converge on the same big body."""
         from boneglaive.game.skills.ordnance_graft import bomb_pct
+        w = self.weights
 
         # Immune bodies (GRAYMAN/Stasiality, etc.) can't hold bombs at all -> a strike on
         # them seeds nothing, so they are near-worthless as a bomb target. Collapse early.
         if enemy.is_immune_to_effects():
-            return 5.0
+            return w.ordnance_immune_value
 
         per_stack = max(1, int(round(enemy.max_hp * bomb_pct(enemy))))  # 1 (18HP) .. 7 (24HP)
-        value = 30.0 + per_stack * 8.0                                  # anti-tank core: 38 .. 86
+        value = w.ordnance_value_base + per_stack * w.ordnance_value_per_stack  # anti-tank core: 38 .. 86
 
         if enemy in plan.focus_targets:
-            value += 12.0
+            value += w.ordnance_value_focus
         if any(enemy is t for t, _ in analysis.priority_targets[:3]):
-            value += 8.0
+            value += w.ordnance_value_priority
         # De-emphasise tiny squishies — the kit barely scratches an 18-HP body.
         if per_stack <= 1:
-            value -= 20.0
+            value -= w.ordnance_small_body_penalty
 
         return max(0.0, value)
 
@@ -3289,29 +3243,33 @@ class TacticalEvaluator:
         concentrate ramp is suppressed once the target's fused cluster is already lethal
         (plant nothing more — Harvest should fire) so it never out-bids a lethal detonation."""
         actions = []
-        for enemy in self._ordnance_targetable_enemies(unit, analysis):
+        w = self.weights
+        targets = self._ordnance_targetable_enemies(unit, analysis)
+        evaluator_stats.count(generated=len(targets))
+        for enemy in targets:
             try:
                 if not skill.can_use(unit, (enemy.y, enemy.x), self.game):
                     continue
             except Exception:
                 continue
 
+            evaluator_stats.count(scored=1)
             tv = self._ordnance_target_value(enemy, analysis, plan)
             if tv <= 0:
                 continue
 
-            score = 40.0 + tv * 0.6
+            score = w.inoculant_base + tv * w.inoculant_value_share
 
             # Concentrate fire: build one body toward a lethal cluster. Bounded ramp, and
             # only while detonating now would NOT already kill it (else: stop planting).
             if not self._ordnance_fused_is_lethal(enemy):
                 existing = len(enemy.bombs)
                 if existing >= 1:
-                    score += 10.0
+                    score += w.inoculant_stack_bonus
                 if existing >= 2:
-                    score += 10.0
+                    score += w.inoculant_stack_bonus
                 if existing >= 3:
-                    score += 10.0
+                    score += w.inoculant_stack_bonus
 
             action = Action("skill", target=(skill, enemy), priority=score)
             actions.append(action)
@@ -3332,16 +3290,19 @@ class TacticalEvaluator:
         except Exception:
             return []
 
+        w = self.weights
         total_score = 0.0
         kills = 0
         fused_targets = 0
         worthwhile = False  # something beyond a lone 1-stack 1-dmg body is present
 
+        evaluator_stats.count(generated=len(analysis.enemy_units))
         for enemy in analysis.enemy_units:
             f = fused_count(enemy)
             if f <= 0:
                 continue
             fused_targets += 1
+            evaluator_stats.count(scored=1)
             per_stack = max(1, int(round(enemy.max_hp * bomb_pct(enemy))))
             raw = per_stack * f
             faithful = max(0, raw - enemy.get_effective_prt())  # PRT applies; DEF does not
@@ -3349,11 +3310,11 @@ class TacticalEvaluator:
                 continue
             if (raw - enemy.get_effective_prt()) >= enemy.hp:
                 kills += 1
-                total_score += 80.0
+                total_score += w.harvest_kill
                 worthwhile = True
             else:
                 pct_of_bar = faithful / max(1, enemy.max_hp)
-                total_score += pct_of_bar * 60.0
+                total_score += pct_of_bar * w.harvest_bar
                 if not (f <= 1 and per_stack <= 1):
                     worthwhile = True
 
@@ -3364,11 +3325,11 @@ class TacticalEvaluator:
         if kills == 0 and not worthwhile:
             return []
 
-        score = 30.0 + total_score
+        score = w.harvest_base + total_score
         if fused_targets >= 2:
-            score += 20.0
+            score += w.harvest_multi_target
         if kills >= 2:
-            score += 30.0
+            score += w.harvest_multi_kill
 
         return [Action("skill", target=(skill, unit), priority=score)]
 
@@ -3379,6 +3340,7 @@ class TacticalEvaluator:
         every enemy within Chebyshev 1 of the landing. Score by the AoE seed value, plus a
         defensive component to escape a high-threat tile. Gated on a living drone."""
         actions = []
+        w = self.weights
 
         drone = getattr(unit, 'drone', None)
         if not (drone and drone.is_alive()):
@@ -3394,6 +3356,7 @@ class TacticalEvaluator:
             for x in range(self.game.map.width):
                 if self.game.chess_distance(src[0], src[1], y, x) > search_range:
                     continue
+                evaluator_stats.count(generated=1)
                 try:
                     if not skill.can_use(unit, (y, x), self.game):
                         continue
@@ -3404,18 +3367,19 @@ class TacticalEvaluator:
                 if (y, x) in analysis.threat_map:
                     land_threat = analysis.threat_map[(y, x)].threat_level
 
-                score = 25.0
+                evaluator_stats.count(scored=1)
+                score = w.skyhook_base
                 struck = 0
                 for enemy in self._ordnance_targetable_enemies(unit, analysis):
                     if self.game.chess_distance(y, x, enemy.y, enemy.x) <= 1:
                         struck += 1
-                        score += self._ordnance_target_value(enemy, analysis, plan) * 0.5
+                        score += self._ordnance_target_value(enemy, analysis, plan) * w.slam_value_share
                 if struck >= 2:
-                    score += 25.0
+                    score += w.slam_multi_bonus
 
                 # Defensive escape: reward landing out of danger when currently exposed.
                 if cur_threat > 0:
-                    score += max(0, cur_threat - land_threat) * 1.5
+                    score += max(0, cur_threat - land_threat) * w.slam_escape
 
                 # Skip pointless/suicidal hops: nobody struck and no threat reduction.
                 if struck == 0 and land_threat >= cur_threat:
@@ -3437,6 +3401,7 @@ class TacticalEvaluator:
         the slam AoE at that landing (mirroring the Skyhook value math, slightly lower base
         since it's the weaker tool). Gated implicitly by can_use (LOS + range + valid anchor)."""
         actions = []
+        w = self.weights
 
         src = unit.move_target if unit.move_target else (unit.y, unit.x)
         cur_threat = 0
@@ -3458,6 +3423,7 @@ class TacticalEvaluator:
                 if self.game.map.blocks_line_of_sight(y, x) or not self.game.map.is_passable(y, x):
                     anchors.add((y, x))
 
+        evaluator_stats.count(generated=len(anchors))
         for (ay, ax) in anchors:
             if self.game.chess_distance(src[0], src[1], ay, ax) > search_range:
                 continue
@@ -3475,18 +3441,19 @@ class TacticalEvaluator:
             if (ly, lx) in analysis.threat_map:
                 land_threat = analysis.threat_map[(ly, lx)].threat_level
 
-            score = 20.0  # a touch below Skyhook's 25 base — the weaker leap
+            evaluator_stats.count(scored=1)
+            score = w.jaunt_base  # a touch below Skyhook's base — the weaker leap
             struck = 0
             for enemy in self._ordnance_targetable_enemies(unit, analysis):
                 if self.game.chess_distance(ly, lx, enemy.y, enemy.x) <= 1:
                     struck += 1
-                    score += self._ordnance_target_value(enemy, analysis, plan) * 0.5
+                    score += self._ordnance_target_value(enemy, analysis, plan) * w.slam_value_share
             if struck >= 2:
-                score += 25.0
+                score += w.slam_multi_bonus
 
             # Defensive escape: reward reeling out of danger when currently exposed.
             if cur_threat > 0:
-                score += max(0, cur_threat - land_threat) * 1.5
+                score += max(0, cur_threat - land_threat) * w.slam_escape
 
             # Skip pointless/suicidal pulls: nobody struck and no threat reduction.
             if struck == 0 and land_threat >= cur_threat:
@@ -3526,6 +3493,7 @@ class TacticalEvaluator:
         global best anti-tank target. Penalised for stranding the 6-HP drone in danger —
         its death grounds the graft's Skyhook."""
         actions = []
+        w = self.weights
 
         # Resolve the graft's queued focus this turn via the owner back-ref.
         creator = getattr(unit, 'creator', None)
@@ -3542,27 +3510,30 @@ class TacticalEvaluator:
         if (unit.y, unit.x) in analysis.threat_map:
             plant_threat = analysis.threat_map[(unit.y, unit.x)].threat_level
 
-        for enemy in self._ordnance_targetable_enemies(unit, analysis):
+        targets = self._ordnance_targetable_enemies(unit, analysis)
+        evaluator_stats.count(generated=len(targets))
+        for enemy in targets:
             try:
                 if not skill.can_use(unit, (enemy.y, enemy.x), self.game):
                     continue
             except Exception:
                 continue
 
+            evaluator_stats.count(scored=1)
             tv = self._ordnance_target_value(enemy, analysis, plan)
             if tv <= 0:
                 continue
 
-            score = 40.0 + tv * 0.6
+            score = w.inoculant_base + tv * w.inoculant_value_share
             if focus is not None and enemy is focus:
                 # Coordination: the graft already chose this body — pile onto it so the two
                 # bodies stack one cluster toward a Harvest one-shot. Sized to decisively
                 # beat the anti-tank value spread across the roster (an 18->24 HP gap is
                 # ~40 pts of tv*0.6), so the drone follows the focus even onto a smaller
                 # body, per the "full coordination" design.
-                score += 70.0
+                score += w.drone_focus_bonus
             if plant_threat >= unit.hp:
-                score -= 40.0  # don't trade the drone (and the graft's Skyhook) for a plant
+                score -= w.drone_danger_penalty  # don't trade the drone (and the graft's Skyhook) for a plant
 
             action = Action("skill", target=(skill, enemy), priority=score)
             actions.append(action)
@@ -0,0 +1,528 @@
+#!/usr/bin/env python3
+"""
+Round-robin tournaments between Smart AI configurations.
+
+Every pair of entrants meets on every map, for a number of seeds, with each side
+assignment; games run concurrently on a process pool. Each game goes through the
+real setup phase with a random roster and placement per side, drawn from its
+seed, so both assignments of a seed field the same two setups. Each finished game is
+appended to a JSONL results file as soon as it completes, so an interrupted run
+resumes by re-running the same command: games already in the file are skipped.
+
+The report ranks entrants by Elo (a Bradley-Terry maximum-likelihood fit with
+bootstrap confidence intervals) next to their CPU cost per turn, and breaks win
+rates down per map and per unit type.
+
+An entrant varies SmartAI's difficulty level (the ai_difficulty presets), its
+joint-plan beam width, its per-turn search budget (child states the planner may
+simulate before finishing greedily) and its scoring weights. Budgets count
+nodes rather than seconds so games stay reproducible across machines; the CPU
+column shows what each budget costs. Evaluator versions are not an option: a
+process imports one checkout's evaluator, so two versions cannot meet in one
+tournament. Capture what a version changes in a weights file where possible;
+otherwise rate each checkout against the same reference entrants.
+
+    python -m boneglaive.ai.tournament --entrant easy:difficulty=easy --entrant medium \\
+        --entrant tight:budget=40 --entrant tuned:beam=4,weights=tuned_weights.json \\
+        --games 4 --results tournament.jsonl
+"""
+
+import json
+import math
+import os
+import random
+import sys
+from concurrent.futures import FIRST_COMPLETED, Executor, ProcessPoolExecutor, wait
+from dataclasses import asdict, dataclass
+from itertools import combinations
+from typing import Dict, Iterable, List, Optional, Tuple
+from boneglaive.utils.debug import logger
+
+# Elo fit: every pair of entrants is credited one virtual draw so ratings stay
+# finite when one side never scores, and the fit is anchored on a mean of 1500.
+ELO_ANCHOR = 1500.0
+ELO_PRIOR_DRAWS = 1.0
+ELO_ITERATIONS = 200
+BOOTSTRAP_SAMPLES = 200
+CONFIDENCE = 0.95
+
+DEFAULT_TOURNAMENT_TURNS = 300
+
+
+@dataclass(frozen=True)
+class Entrant:
+    """One AI configuration taking part in a tournament."""
+    name: str
+    beam_width: Optional[int] = None   # None keeps the difficulty's (or SmartAI's) default
+    weights: Optional[str] = None      # Path to an AIWeights JSON file (None = defaults)
+    difficulty: Optional[str] = None   # ai_difficulty preset (None = SmartAI's defaults)
+    budget: Optional[int] = None       # Planner nodes per turn (None = unlimited)
+
+    @classmethod
+    def parse(cls, text: str) -> 'Entrant':
+        """
+        Parse 'name[:beam=N][,weights=FILE][,difficulty=LEVEL][,budget=N]'.
+
+        Raises:
+            ValueError: If an option is unknown or malformed
+        """
+        from boneglaive.ai.smart_ai import difficulty_options
+
+        name, _, options = text.partition(":")
+        if not name:
+            raise ValueError(f"Entrant '{text}' has no name")
+        beam_width, weights, difficulty, budget = None, None, None, None
+        for option in filter(None, options.split(",")):
+            key, _, value = option.partition("=")
+            if key == "beam":
+                beam_width = int(value)
+            elif key == "weights":
+                weights = value
+            elif key == "difficulty":
+                difficulty_options(value)
+                difficulty = value
+            elif key == "budget":
+                budget = int(value)
+                if budget < 1:
+                    raise ValueError(f"Entrant budget must be positive in '{text}'")
+            else:
+                raise ValueError(f"Unknown entrant option '{key}' in '{text}'")
+        return cls(name, beam_width, weights, difficulty, budget)
+
+    def factory(self):
+        """ControllerFactory for this configuration."""
+        from boneglaive.ai.selfplay import smart_ai_factory
+        from boneglaive.ai.weights import AIWeights
+        weights = AIWeights.load(self.weights) if self.weights else None
+        return smart_ai_factory(self.beam_width, weights, self.difficulty, self.budget)
+
+
+def available_maps() -> List[str]:
+    """Map names from the bundled maps/ directory, falling back to the built-in maps."""
+    from boneglaive.ai.selfplay import MAPS
+    from boneglaive.utils.paths import asset_path
+    maps_dir = asset_path("maps")
+    if os.path.isdir(maps_dir):
+        names = sorted(f[:-5] for f in os.listdir(maps_dir) if f.endswith(".json"))
+        if names:
+            return names
+    return list(MAPS)
+
+
+def schedule(entrants: List[Entrant], maps: Iterable[str],
+             games: int) -> List[Dict[str, object]]:
+    """
+    Every game of a round robin, in a fixed order.
+
+    Each unordered pair plays `games` seeds per map, and every seed is played
+    twice with the sides swapped, so neither entrant profits from moving first.
+
+    Returns:
+        Game specs with a unique 'key'
+    """
+    specs = []
+    for map_name in maps:
+        for a, b in combinations(entrants, 2):
+            for seed in range(games):
+                for first, second in ((a, b), (b, a)):
+                    specs.append({
+                        'key': f"{map_name}|{seed}|{first.name}|{second.name}",
+                        'map': map_name,
+                        'seed': seed,
+                        'player1': asdict(first),
+                        'player2': asdict(second),
+                    })
+    return specs
+
+
+def _play_game(task: Tuple[Dict[str, object], int]) -> Dict[str, object]:
+    """Worker: play one scheduled game and return its result record."""
+    import logging
+    from boneglaive.utils.message_log import message_log
+    from boneglaive.ai.selfplay import play_headless_game
+
+    spec, max_turns = task
+    logging.disable(logging.CRITICAL)
+    player1 = Entrant(**spec['player1'])
+    player2 = Entrant(**spec['player2'])
+    with message_log.suppressed():
+        result = play_headless_game(spec['map'], spec['seed'], player1.factory(),
+                                    player2.factory(), max_turns, random_rosters=True)
+    return {
+        'key': spec['key'],
+        'map': spec['map'],
+        'seed': spec['seed'],
+        'player1': player1.name,
+        'player2': player2.name,
+        'winner': result.winner,
+        'turns': result.turns,
+        'gp': [result.player1_gp, result.player2_gp],
+        'units': {str(player): types for player, types in result.units.items()},
+        'think_time': {str(player): round(t, 4) for player, t in result.think_time.items()},
+        'elapsed': round(result.elapsed, 3),
+    }
+
+
+class Tournament:
+    """A round robin whose results stream to (and resume from) a JSONL file."""
+
+    def __init__(self, entrants: List[Entrant], maps: List[str], games: int = 2,
+                 max_turns: int = DEFAULT_TOURNAMENT_TURNS, results_path: Optional[str] = None):
+        """
+        Args:
+            entrants: Configurations to pair up (names must be unique)
+            maps: Maps every pair plays on
+            games: Seeds per pair per map (each played from both sides)
+            max_turns: Turn limit per game (reaching it is a draw)
+            results_path: JSONL file results are appended to and resumed from
+
+        Raises:
+            ValueError: With fewer than two entrants, duplicate names, or a results
+                        file written by a tournament with different entrants
+        """
+        if len(entrants) < 2:
+            raise ValueError("A tournament needs at least two entrants")
+        if len({e.name for e in entrants}) != len(entrants):
+            raise ValueError("Entrant names must be unique")
+        self.entrants = entrants
+        self.maps = maps
+        self.games = games
+        self.max_turns = max_turns
+        self.results_path = results_path
+        self.records: List[Dict[str, object]] = []
+        if results_path and os.path.exists(results_path):
+            self._load()
+
+    def _header(self) -> Dict[str, object]:
+        return {'tournament': {'entrants': [asdict(e) for e in self.entrants],
+                               'max_turns': self.max_turns}}
+
+    def _load(self) -> None:
+        with open(self.results_path, 'rb') as f:
+            raw_lines = f.readlines()
+        lines = []
+        offset = 0
+        for index, raw in enumerate(raw_lines):
+            if raw.strip():
+                try:
+                    lines.append(json.loads(raw))
+                except ValueError:
+                    if index != len(raw_lines) - 1:
+                        raise
+                    # A run killed mid-write leaves a partial last line: cut it off so
+                    # the next result is appended on a line of its own
+                    logger.warning(f"Dropping truncated last line of {self.results_path}")
+                    with open(self.results_path, 'r+b') as f:
+                        f.truncate(offset)
+                    break
+            offset += len(raw)
+        if lines and 'tournament' in lines[0]:
+            header = lines.pop(0)['tournament']
+            known = {e['name']: e for e in header['entrants']}
+            for entrant in self.entrants:
+                # Headers written before an option existed simply lack it
+                if entrant.name in known and Entrant(**known[entrant.name]) != entrant:
+                    raise ValueError(f"Entrant '{entrant.name}' in {self.results_path} was "
+                                     f"configured differently: {known[entrant.name]}")
+            if header.get('max_turns') != self.max_turns:
+                raise ValueError(f"{self.results_path} was played with max_turns "
+                                 f"{header.get('max_turns')}, not {self.max_turns}")
+        self.records = lines
+        logger.info(f"Resuming tournament: {len(self.records)} games in {self.results_path}")
+
+    def pending(self) -> List[Dict[str, object]]:
+        """Scheduled games that have no result yet."""
+        done = {record['key'] for record in self.records}
+        return [spec for spec in schedule(self.entrants, self.maps, self.games)
+                if spec['key'] not in done]
+
+    def run(self, executor: Optional[Executor] = None, progress=None) -> List[Dict[str, object]]:
+        """
+        Play every pending game, appending each result as it completes.
+
+        Args:
+            executor: Pool to play games on (None plays them in this process)
+            progress: Optional callback(record, done, total) after each game
+
+        Returns:
+            All records of this tournament, including resumed ones
+        """
+        pending = self.pending()
+        total = len(self.records) + len(pending)
+        out = None
+        if self.results_path:
+            new_file = not os.path.exists(self.results_path) or os.path.getsize(self.results_path) == 0
+            out = open(self.results_path, 'a')
+            if new_file:
+                out.write(json.dumps(self._header()) + "\n")
+                out.flush()
+
+        def finish(record):
+            self.records.append(record)
+            if out is not None:
+                out.write(json.dumps(record) + "\n")
+                out.flush()
+            if progress:
+                progress(record, len(self.records), total)
+
+        tasks = [(spec, self.max_turns) for spec in pending]
+        try:
+            if executor is None:
+                for task in tasks:
+                    finish(_play_game(task))
+            else:
+                futures = {executor.submit(_play_game, task) for task in tasks}
+                try:
+                    while futures:
+                        finished, futures = wait(futures, return_when=FIRST_COMPLETED)
+                        for future in finished:
+                            finish(future.result())
+                except BaseException:
+                    # Interrupted: drop queued games; finished ones are already on disk
+                    for future in futures:
+                        future.cancel()
+                    raise
+        finally:
+            if out is not None:
+                out.close()
+        return self.records
+
+    def stats(self) -> 'TournamentStats':
+        return TournamentStats(self.records, [e.name for e in self.entrants])
+
+
+def _game_scores(record: Dict[str, object]) -> Tuple[float, float]:
+    """(player 1 score, player 2 score) of a record: 1 win, 0.5 draw, 0 loss."""
+    winner = record['winner']
+    if winner is None:
+        return 0.5, 0.5
+    return (1.0, 0.0) if winner == 1 else (0.0, 1.0)
+
+
+def fit_elo(records: List[Dict[str, object]], names: List[str]) -> Dict[str, float]:
+    """
+    Bradley-Terry maximum-likelihood ratings on the Elo scale.
+
+    Draws count as half a win for each side. Solved with the minorization-
+    maximization iteration; every pair gets ELO_PRIOR_DRAWS virtual draws.
+
+    Returns:
+        Entrant name -> rating, with the mean rating at ELO_ANCHOR
+    """
+    index = {name: i for i, name in enumerate(names)}
+    n = len(names)
+    wins = [0.0] * n
+    meetings = [[0.0] * n for _ in range(n)]
+    for i in range(n):
+        for j in range(n):
+            if i != j:
+                meetings[i][j] = ELO_PRIOR_DRAWS
+        wins[i] = ELO_PRIOR_DRAWS * (n - 1) / 2.0
+    for record in records:
+        a, b = index.get(record['player1']), index.get(record['player2'])
+        if a is None or b is None:
+            continue
+        score_a, score_b = _game_scores(record)
+        wins[a] += score_a
+        wins[b] += score_b
+        meetings[a][b] += 1
+        meetings[b][a] += 1
+
+    strength = [1.0] * n
+    for _ in range(ELO_ITERATIONS):
+        updated = []
+        for i in range(n):
+            denominator = sum(meetings[i][j] / (strength[i] + strength[j]) for j in range(n) if j != i)
+            updated.append(wins[i] / denominator if denominator else strength[i])
+        log_mean = sum(math.log(s) for s in updated) / n
+        updated = [s / math.exp(log_mean) for s in updated]
+        converged = max(abs(u - s) for u, s in zip(updated, strength)) < 1e-9
+        strength = updated
+        if converged:
+            break
+    return {name: ELO_ANCHOR + 400.0 * math.log10(strength[index[name]]) for name in names}
+
+
+class TournamentStats:
+    """Standings and breakdowns computed from tournament records."""
+
+    def __init__(self, records: List[Dict[str, object]], names: List[str]):
+        self.records = records
+        self.names = names
+
+    def elo(self, bootstrap: int = BOOTSTRAP_SAMPLES,
+            seed: int = 0) -> Dict[str, Tuple[float, float, float]]:
+        """
+        Elo ratings with a percentile bootstrap confidence interval.
+
+        Args:
+            bootstrap: Resamples of the game list (0 skips the interval)
+            seed: Seed for the resampling
+
+        Returns:
+            Entrant name -> (rating, low, high)
+        """
+        ratings = fit_elo(self.records, self.names)
+        if not bootstrap or not self.records:
+            return {name: (r, r, r) for name, r in ratings.items()}
+        rng = random.Random(seed)
+        samples = {name: [] for name in self.names}
+        for _ in range(bootstrap):
+            resampled = [rng.choice(self.records) for _ in self.records]
+            for name, rating in fit_elo(resampled, self.names).items():
+                samples[name].append(rating)
+        tail = (1.0 - CONFIDENCE) / 2.0
+        intervals = {}
+        for name, values in samples.items():
+            values.sort()
+            low = values[int(tail * (len(values) - 1))]
+            high = values[int(math.ceil((1.0 - tail) * (len(values) - 1)))]
+            intervals[name] = (ratings[name], low, high)
+        return intervals
+
+    def _sides(self):
+        """(entrant, player number, score, record) for both sides of every game."""
+        for record in self.records:
+            scores = _game_scores(record)
+            yield record['player1'], 1, scores[0], record
+            yield record['player2'], 2, scores[1], record
+
+    def scores(self) -> Dict[str, Tuple[float, int]]:
+        """Entrant -> (points, games)."""
+        table = {name: [0.0, 0] for name in self.names}
+        for name, _, score, _ in self._sides():
+            if name in table:
+                table[name][0] += score
+                table[name][1] += 1
+        return {name: (points, games) for name, (points, games) in table.items()}
+
+    def per_map(self) -> Dict[str, Dict[str, Tuple[float, int]]]:
+        """Entrant -> map -> (points, games)."""
+        table: Dict[str, Dict[str, List[float]]] = {name: {} for name in self.names}
+        for name, _, score, record in self._sides():
+            if name in table:
+                cell = table[name].setdefault(record['map'], [0.0, 0])
+                cell[0] += score
+                cell[1] += 1
+        return {name: {m: (p, g) for m, (p, g) in maps.items()} for name, maps in table.items()}
+
+    def per_unit_type(self) -> Dict[str, Tuple[float, int]]:
+        """
+        Unit type -> (points, games) of the sides that fielded it.
+
+        A side fielding two units of one type counts once for that type.
+        """
+        table: Dict[str, List[float]] = {}
+        for _, player, score, record in self._sides():
+            for unit_type in set(record.get('units', {}).get(str(player), [])):
+                cell = table.setdefault(unit_type, [0.0, 0])
+                cell[0] += score
+                cell[1] += 1
+        return {t: (p, g) for t, (p, g) in table.items()}
+
+    def think_time_per_turn(self) -> Dict[str, float]:
+        """Entrant -> mean CPU seconds per own turn."""
+        totals = {name: [0.0, 0] for name in self.names}
+        for name, player, _, record in self._sides():
+            if name in totals:
+                totals[name][0] += record.get('think_time', {}).get(str(player), 0.0)
+                # Player 1 moves first, so on odd turn counts it had the extra turn
+                totals[name][1] += (record['turns'] + (player == 1)) // 2
+        return {name: (t / turns if turns else 0.0) for name, (t, turns) in totals.items()}
+
+    def format_report(self) -> str:
+        """Human-readable standings and breakdowns."""
+        elo = self.elo()
+        scores = self.scores()
+        cpu = self.think_time_per_turn()
+        ranked = sorted(self.names, key=lambda n: -elo[n][0])
+        pct = int(CONFIDENCE * 100)
+
+        lines = [f"{len(self.records)} games",
+                 "",
+                 f"{'entrant':<20} {'elo':>6} {str(pct) + '% CI':>15} {'score':>11} {'ms/turn':>9}"]
+        for name in ranked:
+            rating, low, high = elo[name]
+            points, games = scores[name]
+            rate = f"{points / games:.1%}" if games else "-"
+            lines.append(f"{name:<20} {rating:>6.0f} {f'[{low:.0f}, {high:.0f}]':>15} "
+                         f"{rate:>11} {cpu[name] * 1000:>9.1f}")
+
+        per_map = self.per_map()
+        maps = sorted({record['map'] for record in self.records})
+        if maps:
+            lines += ["", "win rate by map",
+                      f"{'entrant':<20} " + " ".join(f"{m[:15]:>15}" for m in maps)]
+            for name in ranked:
+                cells = []
+                for map_name in maps:
+                    points, games = per_map[name].get(map_name, (0.0, 0))
+                    cells.append(f"{points / games:>15.1%}" if games else f"{'-':>15}")
+                lines.append(f"{name:<20} " + " ".join(cells))
+
+        per_unit = self.per_unit_type()
+        if per_unit:
+            lines += ["", "win rate by unit type fielded",
+                      f"{'unit type':<20} {'rate':>7} {'games':>7}"]
+            for unit_type, (points, games) in sorted(per_unit.items(),
+                                                     key=lambda item: -item[1][0] / item[1][1]):
+                lines.append(f"{unit_type:<20} {points / games:>7.1%} {games:>7}")
+        return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    """Run (or resume) a round-robin tournament and print the report."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Round-robin tournament between Smart AI configurations")
+    parser.add_argument("--entrant", action="append", required=True,
+                        help="name[:beam=N][,weights=FILE][,difficulty=easy|medium|hard][,budget=N]; "
+                             "give at least two")
+    parser.add_argument("--maps", nargs="+", default=None, help="maps to play (default: all in maps/)")
+    parser.add_argument("--games", type=int, default=2,
+                        help="seeds per pair per map (each played from both sides)")
+    parser.add_argument("--max-turns", type=int, default=DEFAULT_TOURNAMENT_TURNS)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="game processes (1 plays in this process)")
+    parser.add_argument("--results", default="tournament.jsonl",
+                        help="JSONL file results stream to; rerun to resume")
+    parser.add_argument("--report-only", action="store_true", help="report on existing results")
+    args = parser.parse_args(argv)
+
+    try:
+        entrants = [Entrant.parse(text) for text in args.entrant]
+        tournament = Tournament(entrants, args.maps or available_maps(), args.games,
+                                args.max_turns, args.results)
+    except ValueError as e:
+        parser.error(str(e))
+
+    if not args.report_only:
+        pending = len(tournament.pending())
+        if tournament.records:
+            print(f"Resuming: {len(tournament.records)} games done, {pending} to play")
+
+        def progress(record, done, total):
+            print(f"game {done}/{total}: {record['player1']} vs {record['player2']} on {record['map']}, "
+                  f"winner {record['winner']}, {record['turns']} turns, {record['elapsed']:.1f}s")
+
+        executor = ProcessPoolExecutor(args.workers) if args.workers > 1 else None
+        try:
+            tournament.run(executor, progress)
+        except KeyboardInterrupt:
+            print(f"\nInterrupted; {len(tournament.records)} games saved to {args.results}")
+            return 1
+        finally:
+            if executor is not None:
+                if sys.version_info >= (3, 9):
+                    executor.shutdown(cancel_futures=True)
+                else:
+                    # run() has already cancelled the queued games
+                    executor.shutdown()
+
+    print()
+    print(tournament.stats().format_report())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
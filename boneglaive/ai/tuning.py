@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Self-play tuning of Smart AI scoring weights.
+
+Runs SPSA (simultaneous perturbation stochastic approximation) over AIWeights:
+every iteration perturbs all weights at once in a random +/- direction, plays
+the two perturbed sets against each other in seeded headless games spread over
+a process pool, and steps the weights toward whichever side won more. Weights
+are tuned as multiples of their defaults, so every parameter moves on the same
+relative scale regardless of its magnitude.
+
+Match games go through the real setup phase with a random roster and placement
+per side, drawn from the game seed. Each seed is played with both side
+assignments, so both weight sets face the same two setups.
+
+Progress is checkpointed to JSON after every iteration; re-running with the same
+checkpoint path resumes where it stopped. Iterations are reproducible: the
+perturbation and game seeds derive from (seed, iteration) alone.
+
+    python -m boneglaive.ai.tuning --iterations 200 --workers 32 --checkpoint tuning.json
+
+The game plays the saved weights when the ai_weights_file config key names the file.
+"""
+
+import json
+import math
+import os
+import random
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+from boneglaive.utils.debug import logger
+from boneglaive.ai.weights import AIWeights, DEFAULT_WEIGHTS
+
+
+# --- SPSA schedule -------------------------------------------------------------
+# Gain sequences follow Spall's recommended exponents. The perturbation size c_k
+# shrinks slowly so late iterations still see a measurable win-rate difference;
+# the step a_k shrinks faster so the weights settle. Both act on weight *scales*
+# (1.0 = the hand-tuned default).
+SPSA_A = 0.5             # step size numerator
+SPSA_C = 0.2             # perturbation size numerator (+/-20% at iteration 0)
+SPSA_STABILITY = 10      # iterations added to k in the step denominator
+SPSA_ALPHA = 0.602
+SPSA_GAMMA = 0.101
+SCALE_BOUNDS = (0.25, 4.0)   # weights stay within this multiple of their default
+
+DEFAULT_GAMES_PER_SIDE = 2   # seeds per map, each played with both side assignments
+DEFAULT_TUNING_TURNS = 200   # turn limit for tuning games (draws carry no gradient)
+
+
+def _play_match(task: Tuple[Dict[str, float], Dict[str, float], str, int, int, Optional[int], int]) -> float:
+    """
+    Worker: play one seeded game and return side A's score (1 win, 0.5 draw, 0 loss).
+
+    Module-level (and fed plain data) so it can run in a process pool.
+    """
+    import logging
+    from boneglaive.utils.message_log import message_log
+    from boneglaive.ai.selfplay import play_headless_game, smart_ai_factory
+
+    weights_a, weights_b, map_name, seed, a_player, beam_width, max_turns = task
+    logging.disable(logging.CRITICAL)
+    side_a = smart_ai_factory(beam_width, AIWeights.from_dict(weights_a))
+    side_b = smart_ai_factory(beam_width, AIWeights.from_dict(weights_b))
+    players = (side_a, side_b) if a_player == 1 else (side_b, side_a)
+
+    with message_log.suppressed():
+        result = play_headless_game(map_name, seed, players[0], players[1], max_turns,
+                                    random_rosters=True)
+    if result.winner is None:
+        return 0.5
+    return 1.0 if result.winner == a_player else 0.0
+
+
+class SelfPlayMatch:
+    """Plays two weight sets against each other over maps, seeds and both sides."""
+
+    def __init__(self, maps: Sequence[str], games_per_side: int = DEFAULT_GAMES_PER_SIDE,
+                 beam_width: Optional[int] = 0, max_turns: int = DEFAULT_TUNING_TURNS,
+                 executor: Optional[Executor] = None):
+        """
+        Args:
+            maps: Maps every pairing is played on
+            games_per_side: Seeds per map; each seed (its rosters and placements) is played
+                            with A as player 1 and as player 2
+            beam_width: SmartAI beam width for both sides (0 = greedy, cheapest)
+            max_turns: Turn limit per game
+            executor: Pool to run games on (None plays them in this process)
+        """
+        self.maps = list(maps)
+        self.games_per_side = games_per_side
+        self.beam_width = beam_width
+        self.max_turns = max_turns
+        self.executor = executor
+
+    def score(self, a: AIWeights, b: AIWeights, seed: int) -> float:
+        """
+        Side A's mean score against side B.
+
+        Args:
+            a: Weights of side A
+            b: Weights of side B
+            seed: Base seed for the games of this pairing
+
+        Returns:
+            Mean score in [0, 1]
+        """
+        tasks = []
+        for map_index, map_name in enumerate(self.maps):
+            for game in range(self.games_per_side):
+                game_seed = seed * 1000 + map_index * self.games_per_side + game
+                for a_player in (1, 2):
+                    tasks.append((a.to_dict(), b.to_dict(), map_name, game_seed, a_player,
+                                  self.beam_width, self.max_turns))
+        if self.executor is None:
+            scores = [_play_match(task) for task in tasks]
+        else:
+            scores = list(self.executor.map(_play_match, tasks))
+        return sum(scores) / len(scores)
+
+
+class SPSATuner:
+    """SPSA over AIWeights scales, with a JSON checkpoint."""
+
+    def __init__(self, match: SelfPlayMatch, checkpoint_path: Optional[str] = None,
+                 seed: int = 0, names: Optional[Sequence[str]] = None):
+        """
+        Args:
+            match: Pairing runner used to compare perturbed weights
+            checkpoint_path: JSON file progress is saved to and resumed from
+            seed: Base seed for perturbations and games
+            names: Weights to tune (default: all of them)
+        """
+        self.match = match
+        self.checkpoint_path = checkpoint_path
+        self.seed = seed
+        self.names = list(names) if names else AIWeights.names()
+        self.defaults = DEFAULT_WEIGHTS.to_dict()
+
+        self.iteration = 0
+        self.scales: Dict[str, float] = {name: 1.0 for name in self.names}
+        self.history: List[Dict[str, object]] = []
+
+        if checkpoint_path and os.path.exists(checkpoint_path):
+            self._load_checkpoint()
+
+    # -- weights <-> scales --------------------------------------------------------
+
+    def weights_for(self, scales: Dict[str, float]) -> AIWeights:
+        """Weights with the given scales applied to the defaults."""
+        values = dict(self.defaults)
+        for name, scale in scales.items():
+            values[name] = self.defaults[name] * scale
+        return AIWeights.from_dict(values)
+
+    @property
+    def weights(self) -> AIWeights:
+        """Current best estimate."""
+        return self.weights_for(self.scales)
+
+    # -- SPSA ----------------------------------------------------------------------
+
+    def step(self) -> Dict[str, object]:
+        """
+        Run one SPSA iteration and checkpoint it.
+
+        Returns:
+            The iteration's history record
+        """
+        k = self.iteration
+        a_k = SPSA_A / (k + 1 + SPSA_STABILITY) ** SPSA_ALPHA
+        c_k = SPSA_C / (k + 1) ** SPSA_GAMMA
+        rng = random.Random(f"{self.seed}:{k}")
+        delta = {name: rng.choice((-1.0, 1.0)) for name in self.names}
+
+        plus = {name: self._clip(self.scales[name] + c_k * delta[name]) for name in self.names}
+        minus = {name: self._clip(self.scales[name] - c_k * delta[name]) for name in self.names}
+
+        start = time.perf_counter()
+        plus_score = self.match.score(self.weights_for(plus), self.weights_for(minus),
+                                      seed=self.seed * 100003 + k)
+        elapsed = time.perf_counter() - start
+
+        # Win-rate difference between the two sides, per unit of perturbation
+        gradient = (2.0 * plus_score - 1.0) / (2.0 * c_k)
+        for name in self.names:
+            self.scales[name] = self._clip(self.scales[name] + a_k * gradient * delta[name])
+
+        record = {'iteration': k, 'plus_score': plus_score, 'a_k': a_k, 'c_k': c_k,
+                  'elapsed': round(elapsed, 2)}
+        self.history.append(record)
+        self.iteration += 1
+        self.save_checkpoint()
+        logger.info(f"SPSA iteration {k}: plus side scored {plus_score:.3f} in {elapsed:.1f}s")
+        return record
+
+    def run(self, iterations: int, eval_every: int = 0) -> AIWeights:
+        """
+        Run until `iterations` total iterations have been completed.
+
+        Args:
+            iterations: Total iteration count (a resumed run continues toward it)
+            eval_every: Every N iterations, also score the current weights against
+                        the defaults and record it (0 disables)
+
+        Returns:
+            The tuned weights
+        """
+        while self.iteration < iterations:
+            record = self.step()
+            print(f"iteration {record['iteration'] + 1}/{iterations}: "
+                  f"plus {record['plus_score']:.3f}, {record['elapsed']:.1f}s")
+            if eval_every and self.iteration % eval_every == 0:
+                vs_default = self.match.score(self.weights, DEFAULT_WEIGHTS, seed=-self.iteration)
+                record['vs_default'] = vs_default
+                self.save_checkpoint()
+                print(f"  current vs defaults: {vs_default:.3f}")
+        return self.weights
+
+    @staticmethod
+    def _clip(scale: float) -> float:
+        low, high = SCALE_BOUNDS
+        return min(high, max(low, scale))
+
+    # -- checkpoint ----------------------------------------------------------------
+
+    def save_checkpoint(self) -> None:
+        """Atomically write the tuner state to the checkpoint path."""
+        if not self.checkpoint_path:
+            return
+        state = {
+            'seed': self.seed,
+            'iteration': self.iteration,
+            'names': self.names,
+            'scales': self.scales,
+            'weights': self.weights.to_dict(),
+            'history': self.history,
+        }
+        tmp_path = self.checkpoint_path + ".tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(state, f, indent=2)
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def _load_checkpoint(self) -> None:
+        with open(self.checkpoint_path) as f:
+            state = json.load(f)
+        self.seed = state.get('seed', self.seed)
+        self.iteration = state.get('iteration', 0)
+        self.names = [n for n in state.get('names', self.names) if n in self.defaults]
+        self.scales = {name: float(state.get('scales', {}).get(name, 1.0)) for name in self.names}
+        self.history = state.get('history', [])
+        logger.info(f"Resumed SPSA tuning from {self.checkpoint_path} at iteration {self.iteration}")
+
+
+def main(argv=None) -> int:
+    """Tune AIWeights by parallel self-play."""
+    import argparse
+    from boneglaive.ai.selfplay import MAPS
+
+    parser = argparse.ArgumentParser(description="Tune Smart AI weights with SPSA self-play")
+    parser.add_argument("--iterations", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="game processes (1 plays in this process)")
+    parser.add_argument("--games-per-side", type=int, default=DEFAULT_GAMES_PER_SIDE,
+                        help="seeds per map per iteration (each played from both sides)")
+    parser.add_argument("--maps", nargs="+", default=list(MAPS))
+    parser.add_argument("--beam", type=int, default=0, help="beam width for both sides")
+    parser.add_argument("--max-turns", type=int, default=DEFAULT_TUNING_TURNS)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--weights", nargs="+", default=None, help="tune only these weights")
+    parser.add_argument("--eval-every", type=int, default=10,
+                        help="score against the defaults every N iterations (0 disables)")
+    parser.add_argument("--checkpoint", default="tuning_checkpoint.json")
+    parser.add_argument("--out", default="tuned_weights.json", help="where to save the final weights")
+    args = parser.parse_args(argv)
+
+    executor = ProcessPoolExecutor(args.workers) if args.workers > 1 else None
+    try:
+        match = SelfPlayMatch(args.maps, args.games_per_side, args.beam, args.max_turns, executor)
+        tuner = SPSATuner(match, args.checkpoint, seed=args.seed, names=args.weights)
+        if tuner.iteration:
+            print(f"Resuming at iteration {tuner.iteration} from {args.checkpoint}")
+        weights = tuner.run(args.iterations, eval_every=args.eval_every)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    weights.save(args.out)
+    print(f"\nSaved tuned weights to {args.out} (set ai_weights_file in config.json to play them)")
+    for name, default, tuned in DEFAULT_WEIGHTS.diff(weights):
+        change = tuned / default if default else math.inf
+        print(f"  {name:<36} {default:>8.2f} -> {tuned:>8.2f}  (x{change:.2f})")
+    return 0
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(main())
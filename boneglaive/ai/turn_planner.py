@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+"""
+Turn Planner for Smart AI.
+Searches combinations of actions across all of a player's units with beam search.
+"""
+
+import random
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+from boneglaive.utils.debug import logger
+from boneglaive.utils.constants import UnitType
+from boneglaive.utils.message_log import message_log
+from boneglaive.game.actions import UnitAction, queue_unit_action
+from boneglaive.ai.battlefield_analyzer import BattlefieldAnalyzer
+from boneglaive.ai.strategic_planner import StrategicPlanner
+from boneglaive.ai.tactical_evaluator import TacticalEvaluator, Action
+from boneglaive.ai.weights import AIWeights, DEFAULT_WEIGHTS
+
+if TYPE_CHECKING:
+    from boneglaive.game.engine import Game
+    from boneglaive.game.units import Unit
+    from boneglaive.ai.battlefield_analyzer import BattlefieldAnalysis
+    from boneglaive.ai.strategic_planner import StrategicPlan
+
+
+# --- Search budget -------------------------------------------------------------
+# Each AI unit is one layer of the search. From every partial plan kept in the
+# beam, the unit's best BRANCHING actions are applied to a cloned state; the
+# BEAM_WIDTH highest-scoring children survive to the next unit. Width 1 is a
+# greedy pass that still sees the board each earlier unit left behind; wider
+# beams find focus fire and drone-plus-graft stacking at a linear CPU cost.
+# A node budget caps the child states simulated per turn: once it is spent, the
+# remaining units are planned greedily from the best partial plan. Counting nodes
+# rather than seconds keeps seeded games reproducible.
+DEFAULT_BEAM_WIDTH = 4   # partial plans kept after each unit is expanded
+DEFAULT_BRANCHING = 4    # best actions per unit tried from each partial plan
+
+
+def search_rng(game: 'Game', player: int, purpose: str) -> random.Random:
+    """
+    Generator for chance outcomes on a search clone (Game.clone(rng=...)).
+
+    Seeded from the position rather than drawn from the live game's stream, so a
+    search never advances the global random state and thinking on the worker
+    thread resolves exactly what thinking on the main thread would.
+
+    Args:
+        game: Game being searched
+        player: Player the search is for
+        purpose: Name of the search, so different searches get different streams
+    """
+    return random.Random(f"{purpose}:{player}:{game.turn}:{game.player1_gp}:{game.player2_gp}")
+
+
+def candidate_actions(evaluator: TacticalEvaluator, unit: 'Unit',
+                      analysis: 'BattlefieldAnalysis', plan: 'StrategicPlan') -> List[Action]:
+    """
+    Scored actions a unit may take this turn, best first.
+
+    Applies the per-unit restrictions the controller has always honoured:
+    topiary and Neural Shunt units do not plan, Jawline units may only attack.
+
+    Args:
+        evaluator: Tactical evaluator bound to the game the unit lives in
+        unit: Unit to generate actions for
+        analysis: Battlefield analysis of that game
+        plan: Strategic plan for that game
+
+    Returns:
+        List of actions sorted by priority (highest first)
+    """
+    # Topiary units cannot act
+    if getattr(unit, 'is_topiary', False):
+        return []
+
+    # Neural Shunt units will act randomly — skip AI planning
+    if getattr(unit, 'neural_shunt_affected', False):
+        return []
+
+    # Jawline-affected units cannot move or use skills (can still attack)
+    if getattr(unit, 'jawline_affected', False):
+        attacks = [a for a in evaluator._evaluate_attacks(unit, analysis, plan) if a.target]
+        for attack in attacks:
+            attack.data['attack_only'] = True
+        attacks.sort(key=lambda a: a.priority, reverse=True)
+        return attacks
+
+    return evaluator.evaluate_unit_actions(unit, analysis, plan)
+
+
+def queue_action(game: 'Game', unit: 'Unit', action: Action,
+                 evaluator: Optional[TacticalEvaluator] = None) -> None:
+    """
+    Queue a chosen action on a unit exactly as a player would.
+
+    Args:
+        game: Game the unit belongs to (live or cloned)
+        unit: Unit performing the action
+        action: Action to queue
+        evaluator: Evaluator used for the DERELICTIONIST retreat fallback
+    """
+    if action.data.get('attack_only'):
+        # Jawline: only the attack target may be set
+        unit.attack_target = (action.target.y, action.target.x)
+        return
+
+    if action.type == "attack":
+        target = action.target
+        unit.attack_target = (target.y, target.x)
+
+        # DERELICTIONIST: activate Severance and set retreat move to maximize damage
+        if unit.type == UnitType.DERELICTIONIST:
+            unit.can_move_post_skill = True
+            unit.used_skill_this_turn = True
+            unit.severance_active = True
+            unit.severance_duration = 1
+            unit.attack_queued_from = (unit.y, unit.x)
+            # Use pre-computed retreat position if available, otherwise compute it
+            if 'severance_move' in action.data:
+                retreat_pos = action.data['severance_move']
+            else:
+                if evaluator is None:
+                    evaluator = TacticalEvaluator(game, unit.player)
+                retreat_pos = evaluator._derelictionist_best_retreat(unit, target)
+            if retreat_pos != (unit.y, unit.x):
+                unit.move_target = retreat_pos
+
+    elif action.type == "move":
+        unit.move_target = action.target
+
+    elif action.type == "skill":
+        skill, target = action.target
+
+        # Convert target to position tuple
+        if hasattr(target, 'y'):  # It's a unit
+            target_pos = (target.y, target.x)
+        else:  # It's a position
+            target_pos = target
+
+        # IMPORTANT: Call skill.use() to properly queue the skill AND set cooldown
+        # Previously this just set unit.selected_skill directly, bypassing cooldown logic
+        skill.use(unit, target_pos, game)
+
+    elif action.type == "move_attack":
+        move_pos, attack_target = action.target
+        unit.move_target = move_pos
+        unit.attack_target = (attack_target.y, attack_target.x)
+
+    elif action.type == "unit_action":
+        # Complete orders from the endgame solver (a UnitAction, possibly remapped to a plain tuple)
+        queue_unit_action(game, unit, UnitAction(*action.target))
+
+
+def _remap(value, mapping: Dict[int, object]):
+    """Swap an action target (or a tuple of them) through an id -> object mapping."""
+    if isinstance(value, tuple):
+        return tuple(_remap(v, mapping) for v in value)
+    return mapping.get(id(value), value)
+
+
+def _resolvable(value, mapping: Dict[int, object]) -> bool:
+    """True if every unit/skill inside an action target has a mapped counterpart."""
+    if isinstance(value, tuple):
+        return all(_resolvable(v, mapping) for v in value)
+    if value is None or isinstance(value, (int, float, str)):
+        return True
+    return id(value) in mapping
+
+
+def remap_action(action: Action, mapping: Dict[int, object]) -> Action:
+    """Copy an action with its unit and skill references swapped through a mapping."""
+    remapped = Action(action.type, target=_remap(action.target, mapping),
+                      priority=action.priority)
+    remapped.data = {k: _remap(v, mapping) for k, v in action.data.items()}
+    return remapped
+
+
+def translate_action(action: Action, mapping: Dict[int, object]) -> Optional[Action]:
+    """
+    Translate an action scored on one game into another game's objects.
+
+    Args:
+        action: Action whose target references objects of the source game
+        mapping: id(source object) -> matching object in the destination game
+
+    Returns:
+        The translated action, or None if its target only exists in the source
+        game (e.g. a unit summoned earlier in a hypothetical plan)
+    """
+    if not _resolvable(action.target, mapping):
+        return None
+    return remap_action(action, mapping)
+
+
+class PlanNode:
+    """A partial joint plan: the hypothetical state its actions produce, and their score."""
+
+    def __init__(self, state: 'Game', pairs: List[Tuple[object, object]],
+                 steps: List[Tuple['Unit', Action]], score: float,
+                 analysis: Optional['BattlefieldAnalysis'] = None):
+        self.state = state      # Cloned game with this plan's actions applied
+        self.pairs = pairs      # (live object, state object) for every unit and skill
+        self.steps = steps      # (live unit, live-space action) in queue order
+        self.score = score      # Sum of the evaluator's priorities along the plan
+        self.analysis = analysis  # Analysis of state; brought up to date lazily on expansion
+
+    def to_state(self) -> Dict[int, object]:
+        """Map id(live object) -> the matching object in this node's state."""
+        return {id(live): copy for live, copy in self.pairs}
+
+    def to_live(self) -> Dict[int, object]:
+        """Map id(state object) -> the matching live object."""
+        return {id(copy): live for live, copy in self.pairs}
+
+
+class TurnPlanner:
+    """
+    Plans a whole turn for one player by searching joint unit actions.
+
+    Every partial plan is applied to its own cloned game, so each later unit is
+    scored against the board earlier units leave behind (wounded targets, planted
+    bombs, vacated tiles) rather than the stale start-of-turn snapshot.
+    """
+
+    def __init__(self, game: 'Game', ai_player: int,
+                 beam_width: int = DEFAULT_BEAM_WIDTH, branching: int = DEFAULT_BRANCHING,
+                 weights: AIWeights = DEFAULT_WEIGHTS, node_budget: Optional[int] = None):
+        """
+        Initialize the turn planner.
+
+        Args:
+            game: The live game instance
+            ai_player: The AI's player number
+            beam_width: Partial plans kept per unit (CPU vs coordination)
+            branching: Best actions per unit expanded from each partial plan
+            weights: Scoring weights used to evaluate each partial plan
+            node_budget: Child states simulated per turn before the search turns
+                         greedy (None = no limit)
+        """
+        self.game = game
+        self.ai_player = ai_player
+        self.beam_width = max(1, beam_width)
+        self.branching = max(1, branching)
+        self.weights = weights
+        self.node_budget = node_budget
+        self.nodes = 0  # Child states simulated by the most recent plan_turn()
+
+    def _budget_left(self) -> bool:
+        """Whether the node budget still allows the full beam and branching."""
+        return self.node_budget is None or self.nodes < self.node_budget
+
+    def plan_turn(self, units: List['Unit'],
+                  analysis: Optional['BattlefieldAnalysis'] = None) -> List[Tuple['Unit', Action]]:
+        """
+        Search for the best joint plan for this turn.
+
+        Args:
+            units: Live units to plan for, in the order they act
+            analysis: Start-of-turn analysis of the live game, if the caller already
+                      has one (saves rebuilding it for the search root)
+
+        Returns:
+            (live unit, action) pairs in the order they should be queued
+        """
+        self.nodes = 0
+        with message_log.suppressed():
+            beam = [self._root_node(analysis)]
+
+            for live_unit in units:
+                children = []
+                for node in beam:
+                    children.extend(self._expand(node, live_unit))
+                # Keep the best partial plans; stable sort keeps earlier (greedier) ties first
+                children.sort(key=lambda n: n.score, reverse=True)
+                beam = children[:self.beam_width if self._budget_left() else 1]
+
+        best = beam[0]
+        logger.info(f"Turn plan: {len(best.steps)} actions, score {best.score:.1f} "
+                    f"(beam {self.beam_width}, branching {self.branching}, {self.nodes} nodes)")
+        return best.steps
+
+    def _root_node(self, analysis: Optional['BattlefieldAnalysis'] = None) -> PlanNode:
+        """Clone the live game (and its analysis, if given) into the search root."""
+        memo = {}
+        state = self.game.clone(memo, rng=search_rng(self.game, self.ai_player, "plan"))
+        state_analysis = analysis.copy(memo) if analysis is not None else None
+        return PlanNode(state, self._pair_objects(self._live_objects(), memo), [], 0.0,
+                        state_analysis)
+
+    def _live_objects(self) -> List[object]:
+        """Live units and their skills — everything an action can reference."""
+        objects = []
+        for unit in self.game.units:
+            objects.append(unit)
+            objects.extend(getattr(unit, 'active_skills', []) or [])
+        return objects
+
+    @staticmethod
+    def _pair_objects(live_objects, memo) -> List[Tuple[object, object]]:
+        """Pair each live object with its copy recorded in a deepcopy memo."""
+        pairs = []
+        for live in live_objects:
+            copy = memo.get(id(live))
+            if copy is not None:
+                pairs.append((live, copy))
+        return pairs
+
+    def _expand(self, node: PlanNode, live_unit: 'Unit') -> List[PlanNode]:
+        """
+        Expand one partial plan with the next unit's best actions.
+
+        Args:
+            node: Partial plan to extend
+            live_unit: The live unit being planned
+
+        Returns:
+            Child plans (or the node itself when the unit has nothing to do)
+        """
+        unit = node.to_state().get(id(live_unit))
+        if unit is None or not unit.is_alive():
+            return [node]
+
+        # Fresh analysis and plan of this partial plan's board. The analysis is
+        # patched from the parent's rather than rebuilt (see BattlefieldAnalyzer.update)
+        evaluator = TacticalEvaluator(node.state, self.ai_player, self.weights)
+        analyzer = BattlefieldAnalyzer(node.state, self.ai_player)
+        if node.analysis is None:
+            node.analysis = analyzer.analyze()
+        else:
+            analyzer.update(node.analysis)
+        state_analysis = node.analysis
+        state_plan = StrategicPlanner(node.state, self.ai_player, self.weights).plan(state_analysis)
+
+        # Reset unit targets (mirrors the live controller)
+        unit.move_target = None
+        unit.attack_target = None
+        unit.skill_target = None
+        unit.selected_skill = None
+
+        try:
+            actions = candidate_actions(evaluator, unit, state_analysis, state_plan)
+        except Exception as e:
+            logger.error(f"Error planning actions for {unit.get_display_name()}: {e}")
+            return [node]
+
+        if not actions:
+            return [node]
+
+        to_live = node.to_live()
+        children = []
+        for action in actions[:self.branching if self._budget_left() else 1]:
+            live_action = translate_action(action, to_live)
+            if live_action is None:
+                continue
+            child = self._apply(node, unit, action)
+            child.steps = node.steps + [(live_unit, live_action)]
+            child.score = node.score + action.priority
+            children.append(child)
+
+        return children or [node]
+
+    def _apply(self, node: PlanNode, unit: 'Unit', action: Action) -> PlanNode:
+        """
+        Clone a node's state and apply one unit's action to the copy.
+
+        Args:
+            node: Parent partial plan
+            unit: Acting unit in the parent's state
+            action: Action scored against the parent's state
+
+        Returns:
+            A child node (steps and score are filled in by the caller)
+        """
+        self.nodes += 1
+        memo = {}
+        state = node.state.clone(memo)
+        pairs = [(live, memo.get(id(copy), copy)) for live, copy in node.pairs]
+        child_unit = memo[id(unit)]
+        child_action = remap_action(action, memo)
+        child_analysis = node.analysis.copy(memo) if node.analysis is not None else None
+
+        try:
+            queue_action(state, child_unit, child_action)
+            # Resolve through the engine's per-unit pipeline, as execute_turn and
+            # forecast() do, so PRT, passives, deaths and GP all apply. Queued
+            # targets stay in place for later units to read (the QUADCOPTER reads
+            # its graft's focus from skill_target)
+            state._pre_establish_marrow_dike_tracking([child_unit])
+            state._execute_unit_action(child_unit)
+        except Exception as e:
+            logger.debug(f"Planner could not resolve {action.type} for {child_unit.get_display_name()}: {e}")
+
+        return PlanNode(state, pairs, [], 0.0, child_analysis)
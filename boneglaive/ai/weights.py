@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""
+Scoring weights for Smart AI.
+
+The scoring terms of TacticalEvaluator (attacks, moves, move+attack combos,
+generic and skill-specific skill scorers) and the strategy thresholds of
+StrategicPlanner live in one parameter set so they can be tuned by self-play
+(see boneglaive.ai.tuning) instead of by hand. The defaults are the hand-tuned
+values the AI has always used. The game loads a tuned set from the file named by
+the ai_weights_file config key.
+"""
+
+import json
+from dataclasses import asdict, dataclass, fields, replace
+from typing import Dict, List, Tuple
+
+
+# --- Action score budget -----------------------------------------------------
+# The AI picks the single highest-scored action. To stop units from idling far
+# from the enemy while wasting skills on empty tiles, three score tiers must hold:
+#   * A skill that affects NO enemy (cast into empty space) must score BELOW the
+#     approach gradient, so closing the distance always wins over a do-nothing cast.
+#   * The approach gradient (moving toward the nearest enemy) is a smooth, non-
+#     clipping pull that stays meaningfully positive across the whole map, but is
+#     capped so it never beats a real in-range combat action.
+#   * A real attack / a skill that actually hits an enemy keeps its existing
+#     50+ score and continues to dominate when a target is in range.
+ENGAGEMENT_RANGE = 4          # within this many tiles of an enemy, idle self/utility
+                              # skills regain their standalone value
+# Approach gradient = BASELINE + SCALE * (1 - min_enemy_distance / max_map_distance).
+# Non-clipping: even at maximum map separation the pull stays above IDLE_SKILL_FAR_SCORE,
+# so a far-away unit always prefers advancing to wasting a skill on nothing. Capped well
+# below the 50+ score of a real in-range attack/skill so it never overrides actual combat.
+APPROACH_BASELINE = 6.0       # floor pull when an enemy exists (any distance), non-aggressive
+APPROACH_SCALE = 14.0         # additional distance-scaled pull, non-aggressive
+APPROACH_BASELINE_AGGRO = 8.0 # floor pull, aggressive_push / desperate_rush
+APPROACH_SCALE_AGGRO = 22.0   # additional distance-scaled pull, aggressive
+IDLE_SKILL_FAR_SCORE = 4.0    # value of a standalone self-buff with no enemy in range
+                              # (deliberately below the far end of the approach gradient)
+
+
+@dataclass(frozen=True)
+class AIWeights:
+    """One complete set of tunable scoring weights (defaults = hand-tuned values)."""
+
+    # Attacks (TacticalEvaluator._score_attack / _is_attack_safe)
+    attack_damage: float = 2.0               # score per point of expected damage
+    kill_bonus: float = 50.0
+    aggressive_kill_bonus: float = 20.0      # extra kill bonus under aggressive strategies
+    focus_target_bonus: float = 30.0
+    priority_target_factor: float = 0.5     # share of the analyzer's target priority
+    lethal_counter_penalty: float = 40.0     # attacker stands on a tile that can kill it
+    trade_refund: float = 20.0               # ...partly refunded for kills / desperate rush
+    unsafe_attack_penalty: float = 30.0      # defensive_hold attacking from an unsafe tile
+    safe_attack_threat_ratio: float = 0.4    # threat below this share of HP counts as safe
+
+    # Moves (TacticalEvaluator._score_move_position)
+    lethal_tile_penalty: float = 100.0
+    threat_penalty: float = 50.0             # scaled by threat / HP
+    defensive_safe_bonus: float = 20.0
+    defensive_safe_threat_ratio: float = 0.3
+    approach_baseline: float = APPROACH_BASELINE
+    approach_scale: float = APPROACH_SCALE
+    approach_baseline_aggro: float = APPROACH_BASELINE_AGGRO
+    approach_scale_aggro: float = APPROACH_SCALE_AGGRO
+    attack_position_bonus: float = 15.0      # destination puts an enemy in range
+    attack_position_bonus_aggro: float = 30.0
+    center_pull: float = 10.0                # secure_position: max bonus at the center
+    support_ally_bonus: float = 10.0         # per vulnerable ally within 3 tiles
+    isolation_penalty: float = 15.0          # average ally distance above isolation_distance
+    isolation_distance: float = 6.0
+
+    # Move + attack combos
+    combo_bonus: float = 10.0
+
+    # Unit-targeted skills (TacticalEvaluator._score_skill_use)
+    skill_base: float = 50.0
+    skill_focus_bonus: float = 30.0
+    skill_aggressive_bonus: float = 20.0
+    skill_low_hp_bonus: float = 25.0         # target below 40% HP
+    skill_high_hp_bonus: float = 15.0        # target above 70% HP
+    skill_standoff_bonus: float = 20.0       # target beyond basic attack range
+    skill_priority_bonus: float = 20.0
+
+    # Self-centred AOE skills (TacticalEvaluator._score_aoe_skill_use)
+    aoe_per_enemy: float = 40.0
+    aoe_two_enemy_bonus: float = 50.0
+    aoe_three_enemy_bonus: float = 30.0
+    aoe_aggressive_bonus: float = 20.0
+
+    # Idle self-buffs and AREA repositioning (TacticalEvaluator._evaluate_skills /
+    # _score_area_skill_at_tile)
+    self_buff_near_score: float = 30.0       # Infuse / Karrier Rave / Ossify near combat
+    area_in_range_base: float = 40.0         # teleport lands with an enemy in attack range
+    area_advance_step: float = 0.5           # ...plus this per tile closed (up to 8)
+    area_lethal_penalty: float = 25.0
+    area_threat_penalty: float = 10.0        # scaled by threat / HP
+    area_close_step: float = 2.0             # out of range: per tile closed
+    area_close_cap: float = 25.0
+
+    # Site Inspection
+    site_inspection_new_ally: float = 30.0
+    site_inspection_upgrade: float = 15.0    # partial buff upgraded to full
+    site_inspection_refresh: float = 5.0
+    site_inspection_two_allies: float = 20.0
+    site_inspection_three_allies: float = 15.0
+    site_inspection_terrain_penalty: float = 10.0
+    site_inspection_aggressive: float = 15.0
+    site_inspection_defensive: float = 10.0
+    site_inspection_focus: float = 10.0
+    site_inspection_threshold: float = 20.0  # cast only above this score
+
+    # Marrow Dike
+    marrow_dike_endangered_ally: float = 40.0
+    marrow_dike_trap_enemy: float = 50.0
+    marrow_dike_priority: float = 30.0
+    marrow_dike_low_hp: float = 20.0
+    marrow_dike_crowding_penalty: float = 15.0  # per ally walled in with no enemy
+    marrow_dike_center: float = 10.0
+    marrow_dike_defensive: float = 25.0
+    marrow_dike_aggressive: float = 20.0
+    marrow_dike_self_low_hp: float = 20.0
+    marrow_dike_threshold: float = 40.0
+
+    # Gaussian Dusk (per direction)
+    gaussian_dusk_per_enemy: float = 50.0
+    gaussian_dusk_kill: float = 30.0
+    gaussian_dusk_priority: float = 40.0
+    gaussian_dusk_two_enemies: float = 25.0
+    gaussian_dusk_three_enemies: float = 20.0
+    gaussian_dusk_aggressive: float = 20.0
+    gaussian_dusk_low_hp: float = 15.0
+
+    # Vagal Run
+    vagal_run_per_status: float = 40.0
+    vagal_run_critical: float = 60.0         # per trapped / mired / jawline status
+    vagal_run_damage_ok: float = 10.0        # close-range damage is acceptable with statuses
+    vagal_run_heal: float = 2.0              # per HP healed
+    vagal_run_endangered: float = 40.0
+    vagal_run_focus: float = 30.0
+    vagal_run_threshold: float = 30.0
+
+    # Derelict
+    derelict_rescue: float = 80.0
+    derelict_escape: float = 15.0            # per enemy near the ally now
+    derelict_landing_penalty: float = 20.0   # per extra enemy near the landing tile
+    derelict_heal: float = 3.0               # per HP healed
+    derelict_safe_landing: float = 30.0
+    derelict_immobile_penalty: float = 40.0
+    derelict_focus: float = 25.0
+    derelict_defensive: float = 20.0
+    derelict_threshold: float = 40.0
+
+    # Partition
+    partition_endangered: float = 100.0
+    partition_low_hp: float = 50.0
+    partition_focus: float = 60.0
+    partition_self: float = 40.0
+    partition_support: float = 40.0
+    partition_per_block: float = 5.0         # per estimated hit blocked
+    partition_defensive: float = 25.0
+    partition_waste_penalty: float = 30.0    # full HP ally in a safe spot
+    partition_engaging: float = 15.0
+    partition_threshold: float = 40.0
+
+    # GAS_MACHINIST vapors (Broaching Gas, Saft-E-Gas, Diverge)
+    gas_base: float = 30.0
+    gas_four_charges: float = 40.0
+    gas_three_charges: float = 20.0
+    gas_low_charge_penalty: float = 10.0
+    broaching_gas_per_enemy: float = 25.0
+    broaching_gas_per_cleanse: float = 20.0
+    broaching_gas_focus: float = 30.0
+    saft_e_gas_per_heal: float = 15.0
+    saft_e_gas_per_ally: float = 10.0
+    saft_e_gas_endangered: float = 25.0
+    diverge_self_base: float = 50.0
+    diverge_self_four_charges: float = 80.0
+    diverge_self_three_charges: float = 30.0
+    diverge_self_position: float = 40.0
+    diverge_vapor_base: float = 40.0
+    diverge_vapor_four_charges: float = 60.0
+    diverge_vapor_three_charges: float = 20.0
+    diverge_vapor_refresh: float = 50.0
+    diverge_vapor_split: float = 20.0
+
+    # DELPHIC_APPRAISER (Auction Curse, Market Futures, Divine Depreciation, Parallax)
+    auction_curse_per_furniture: float = 10.0
+    market_futures_base: float = 40.0
+    market_futures_astral_high: float = 50.0     # astral value 9+
+    market_futures_astral_mid: float = 30.0      # 7+
+    market_futures_astral_low: float = 15.0      # 5+
+    market_futures_per_ally: float = 20.0
+    market_futures_safe: float = 25.0
+    market_futures_anchor_penalty: float = 30.0  # per existing anchor within 5 tiles
+    divine_depreciation_base: float = 50.0
+    divine_depreciation_astral_high: float = 60.0
+    divine_depreciation_astral_mid: float = 40.0
+    divine_depreciation_astral_low: float = 20.0
+    divine_depreciation_per_enemy: float = 40.0
+    divine_depreciation_per_pulled: float = 20.0
+    divine_depreciation_focus: float = 50.0
+    divine_depreciation_per_furniture: float = 5.0
+    parallax_base: float = 60.0
+    parallax_safe: float = 50.0
+    parallax_danger_penalty: float = 40.0
+    parallax_per_tile_closed: float = 15.0
+    parallax_attack_ready: float = 40.0
+    parallax_per_ally: float = 10.0
+    parallax_focus: float = 30.0
+    parallax_long_hop: float = 20.0
+    parallax_short_hop_penalty: float = 30.0
+
+    # Scalar Node
+    scalar_node_base: float = 30.0
+    scalar_node_adjacent: float = 60.0       # per enemy adjacent to the trap
+    scalar_node_two_tiles: float = 30.0
+    scalar_node_three_tiles: float = 10.0
+    scalar_node_focus: float = 40.0
+    scalar_node_choke: float = 25.0
+
+    # LANDSCAPER (Translative Stroke cycling, Hornswoggle, Topiary Breath, Dissonance)
+    landscaper_per_cooldown: float = 5.0
+    landscaper_per_cooldown_turn: float = 2.0
+    landscaper_cycling_cap: float = 40.0
+    hornswoggle_base: float = 30.0
+    hornswoggle_displace: float = 25.0
+    hornswoggle_displace_focus: float = 15.0
+    hornswoggle_per_slag: float = 10.0
+    hornswoggle_deposit_near: float = 20.0
+    hornswoggle_deposit_far: float = 10.0
+    hornswoggle_topiary: float = 35.0
+    hornswoggle_aggressive: float = 15.0
+    hornswoggle_shield_penalty: float = 15.0
+    hornswoggle_threshold: float = 25.0
+    topiary_breath_per_enemy: float = 50.0
+    topiary_breath_priority: float = 30.0
+    topiary_breath_focus: float = 20.0
+    topiary_breath_threat_factor: float = 2.0
+    topiary_breath_threat_cap: float = 30.0
+    topiary_breath_two_enemies: float = 30.0
+    topiary_breath_three_enemies: float = 25.0
+    topiary_breath_ally_penalty: float = 80.0
+    topiary_breath_healthy_ally_penalty: float = 20.0
+    topiary_breath_aggressive: float = 20.0
+    topiary_breath_dissonance_combo: float = 15.0  # per enemy, Dissonance ready soon
+    topiary_breath_threshold: float = 40.0
+    dissonance_free_ally: float = 70.0
+    dissonance_free_enemy_penalty: float = 30.0
+    dissonance_per_hit: float = 15.0
+    dissonance_kill: float = 40.0
+    dissonance_priority: float = 25.0
+    dissonance_focus: float = 20.0
+    dissonance_two_enemies: float = 25.0
+    dissonance_three_enemies: float = 20.0
+    dissonance_aggressive: float = 15.0
+    dissonance_slag_penalty: float = 5.0
+    dissonance_threshold: float = 30.0
+
+    # ORDNANCE_GRAFT and its drone (Inoculant, Harvest, Skyhook, Jaunt)
+    ordnance_immune_value: float = 5.0
+    ordnance_value_base: float = 30.0
+    ordnance_value_per_stack: float = 8.0    # per HP one bomb stack deals
+    ordnance_value_focus: float = 12.0
+    ordnance_value_priority: float = 8.0
+    ordnance_small_body_penalty: float = 20.0
+    inoculant_base: float = 40.0
+    inoculant_value_share: float = 0.6       # share of the target value
+    inoculant_stack_bonus: float = 10.0      # per existing bomb, up to three
+    harvest_kill: float = 80.0
+    harvest_bar: float = 60.0                # scaled by share of max HP removed
+    harvest_base: float = 30.0
+    harvest_multi_target: float = 20.0
+    harvest_multi_kill: float = 30.0
+    skyhook_base: float = 25.0
+    jaunt_base: float = 20.0
+    slam_value_share: float = 0.5            # share of each struck enemy's target value
+    slam_multi_bonus: float = 25.0
+    slam_escape: float = 1.5                 # per point of threat escaped
+    drone_focus_bonus: float = 70.0          # drone joins the graft's target
+    drone_danger_penalty: float = 40.0
+
+    # Strategy selection (StrategicPlanner._choose_strategy)
+    desperate_gp_diff: float = -2.0
+    desperate_hp_ratio: float = 0.6
+    desperate_unit_ratio: float = 0.7
+    winning_gp_diff: float = 2.0
+    winning_hp_ratio: float = 1.3
+    defensive_vulnerable_count: float = 2.0
+    poor_center_control: float = 0.35
+
+    @classmethod
+    def names(cls) -> List[str]:
+        """Weight names in declaration order (the order of to_vector())."""
+        return [f.name for f in fields(cls)]
+
+    def to_vector(self) -> List[float]:
+        return [float(getattr(self, name)) for name in self.names()]
+
+    @classmethod
+    def from_vector(cls, values: List[float]) -> 'AIWeights':
+        return cls(**dict(zip(cls.names(), values)))
+
+    def to_dict(self) -> Dict[str, float]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, float]) -> 'AIWeights':
+        """Build from a dict, ignoring unknown keys (older/newer weight files)."""
+        known = set(cls.names())
+        return cls(**{k: float(v) for k, v in data.items() if k in known})
+
+    def updated(self, **changes) -> 'AIWeights':
+        return replace(self, **changes)
+
+    def diff(self, other: 'AIWeights') -> List[Tuple[str, float, float]]:
+        """(name, self value, other value) for every weight that differs."""
+        return [(name, a, b) for name, a, b in zip(self.names(), self.to_vector(), other.to_vector())
+                if a != b]
+
+    def save(self, path: str) -> None:
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2, sort_keys=True)
+
+    @classmethod
+    def load(cls, path: str) -> 'AIWeights':
+        with open(path) as f:
+            return cls.from_dict(json.load(f))
+
+
+DEFAULT_WEIGHTS = AIWeights()
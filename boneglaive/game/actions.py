@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Compact unit actions for Boneglaive.
+
+A UnitAction is everything one unit can be ordered to do in a turn: an optional
+move, then either a basic attack or a skill. Callers outside the renderer
+(forecasts, the AI, playouts, tests) build these tuples and queue them with
+queue_unit_action(), which sets the same unit fields the renderer sets when a
+player clicks. legal_actions() enumerates every such tuple a unit may issue.
+"""
+
+from typing import Iterator, List, NamedTuple, Optional, Tuple, TYPE_CHECKING
+from boneglaive.utils.constants import UnitType
+from boneglaive.game.targeting import skill_target_candidates
+
+if TYPE_CHECKING:
+    from boneglaive.game.engine import Game
+    from boneglaive.game.units import Unit
+    from boneglaive.game.skills.core import Skill
+
+
+class UnitAction(NamedTuple):
+    """One unit's orders for a turn. Positions are (y, x)."""
+    move: Optional[Tuple[int, int]] = None       # Move destination
+    attack: Optional[Tuple[int, int]] = None     # Basic attack target tile
+    skill: Optional['Skill'] = None              # Skill to use (one of the unit's active skills)
+    target: Optional[Tuple[int, int]] = None     # Skill target tile
+
+    @property
+    def kind(self) -> str:
+        """'move', 'attack', 'skill', 'move_attack', 'move_skill' or 'wait'."""
+        parts = []
+        if self.move is not None:
+            parts.append("move")
+        if self.attack is not None:
+            parts.append("attack")
+        if self.skill is not None:
+            parts.append("skill")
+        return "_".join(parts) or "wait"
+
+
+def queue_unit_action(game: 'Game', unit: 'Unit', action: UnitAction) -> bool:
+    """
+    Validate an action and queue it on a unit the way the renderer does.
+
+    The move is queued first so the attack or skill is validated from the
+    planned destination.
+
+    Args:
+        game: Game the unit belongs to (live or cloned)
+        unit: Unit receiving the orders
+        action: Orders to queue
+
+    Returns:
+        True if every part of the action was legal and has been queued
+    """
+    if action.attack is not None and action.skill is not None:
+        return False
+
+    if action.move is not None and tuple(action.move) != (unit.y, unit.x):
+        if unit.move_target or not game.can_move_to(unit, action.move[0], action.move[1]):
+            return False
+        unit.move_target = tuple(action.move)
+        unit.took_no_actions = False
+        unit.action_timestamp = game.action_counter
+        game.action_counter += 1
+
+    if action.attack is not None:
+        if not game.can_attack(unit, action.attack[0], action.attack[1], from_pos=unit.move_target):
+            return False
+        unit.attack_target = tuple(action.attack)
+        unit.took_no_actions = False
+
+        # DERELICTIONIST: issuing an attack activates Severance just like a skill
+        if unit.type == UnitType.DERELICTIONIST:
+            unit.can_move_post_skill = True
+            unit.used_skill_this_turn = True
+            unit.severance_active = True
+            unit.severance_duration = 1
+            unit.attack_queued_from = unit.move_target or (unit.y, unit.x)
+
+        unit.action_timestamp = game.action_counter
+        game.action_counter += 1
+
+    if action.skill is not None:
+        if not action.skill.use(unit, tuple(action.target) if action.target else None, game):
+            return False
+        unit.took_no_actions = False
+
+    return True
+
+
+def legal_actions(game: 'Game', unit: 'Unit', include_wait: bool = True) -> Iterator[UnitAction]:
+    """
+    Lazily yield every action a unit with nothing queued may legally take.
+
+    Order: wait, then for the unit's own tile followed by each reachable tile
+    (row-major): the move alone, move+attack for each target, move+skill for
+    each skill target. Reachable tiles are computed once per call; attack
+    targets and skill targets are computed per destination only when the
+    caller iterates that far, the latter from the game's cached target masks.
+
+    Args:
+        game: Game the unit belongs to
+        unit: Unit to enumerate actions for
+        include_wait: Also yield the empty action (do nothing)
+
+    Yields:
+        UnitAction tuples accepted by queue_unit_action()
+    """
+    if include_wait:
+        yield UnitAction()
+
+    for move in [None] + game.get_possible_moves(unit):
+        if move is not None:
+            yield UnitAction(move=move)
+        for target in game.get_possible_attacks(unit, move):
+            yield UnitAction(move=move, attack=target)
+        for skill, target in _skill_targets(game, unit, move):
+            yield UnitAction(move=move, skill=skill, target=target)
+
+
+def _skill_targets(game: 'Game', unit: 'Unit',
+                   move: Optional[Tuple[int, int]]) -> List[Tuple['Skill', Tuple[int, int]]]:
+    """Every (skill, target) usable after an optional move, evaluated eagerly."""
+    # can_use() reads move_target for the cast origin; set it only while
+    # evaluating so a caller that stops iterating never sees it changed
+    queued_move = unit.move_target
+    unit.move_target = move
+    try:
+        return [(skill, target)
+                for skill in unit.active_skills if skill.current_cooldown == 0
+                for target in skill_target_candidates(skill, unit, game)]
+    finally:
+        unit.move_target = queued_move
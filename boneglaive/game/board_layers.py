@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Whole-board array layers for Boneglaive.
+
+Respawn placement (the respawn window's highlights and SmartAI's spawn choice)
+asks the same question of every tile: passable and unoccupied? This module
+keeps terrain passability as a boolean array, rebuilt only when the map's
+version changes, and builds occupancy from the unit grid. Their difference is
+the respawn mask. The same coordinate grids give distance layers, so a scorer
+can weigh every tile with a few array operations instead of a per-tile loop.
+"""
+
+from typing import Iterable, List, Tuple, TYPE_CHECKING
+import numpy as np
+
+if TYPE_CHECKING:
+    from boneglaive.game.engine import Game
+
+
+class BoardLayers:
+    """Per-game cache of board masks as (height, width) numpy arrays."""
+
+    def __init__(self, game: 'Game'):
+        self.game = game
+        height, width = game.map.height, game.map.width
+        self.rows, self.cols = np.indices((height, width))
+        self._passable = None
+        self._passable_version = None
+
+    def passable(self) -> np.ndarray:
+        """Boolean mask of passable terrain (cached per map version; do not modify)."""
+        game_map = self.game.map
+        if self._passable is None or self._passable_version != game_map.version:
+            self._passable = np.array([[game_map.is_passable(y, x) for x in range(game_map.width)]
+                                       for y in range(game_map.height)], dtype=bool)
+            self._passable_version = game_map.version
+        return self._passable
+
+    def occupied(self) -> np.ndarray:
+        """Boolean mask of tiles holding a living unit."""
+        mask = np.zeros(self.rows.shape, dtype=bool)
+        tiles = [pos for pos, unit in self.game.unit_grid.items() if unit.is_alive()]
+        if tiles:
+            ys, xs = zip(*tiles)
+            mask[list(ys), list(xs)] = True
+        return mask
+
+    def respawn_mask(self) -> np.ndarray:
+        """Tiles a unit may respawn on: passable and unoccupied."""
+        return self.passable() & ~self.occupied()
+
+    def respawn_tiles(self) -> List[Tuple[int, int]]:
+        """Respawn tiles as (y, x) tuples in row-major order."""
+        return [(int(y), int(x)) for y, x in np.argwhere(self.respawn_mask())]
+
+    def chess_distance(self, points: Iterable[Tuple[int, int]]) -> np.ndarray:
+        """
+        Chess (Chebyshev) distance from every tile to the nearest of some points.
+
+        Args:
+            points: (y, x) positions (must not be empty)
+
+        Returns:
+            Integer array of distances
+        """
+        ys, xs = np.array(list(points)).reshape(-1, 2).T
+        dy = np.abs(self.rows[None, :, :] - ys[:, None, None])
+        dx = np.abs(self.cols[None, :, :] - xs[:, None, None])
+        return np.maximum(dy, dx).min(axis=0)
@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 """Core game engine — state machine, combat resolution, and turn flow."""
+import random
 import time
 from boneglaive.utils.constants import (UnitType, HEIGHT, WIDTH, CRITICAL_HEALTH_PERCENT,
                                         MAX_UNITS, RESPAWN_TIMER, UPGRADE_POINT_THRESHOLDS)
@@ -46,6 +47,10 @@ class Game:
         # Action ordering
         self.action_counter = 0  # Track order of unit actions
 
+        # Source of chance outcomes while resolving turns. A live game draws from the
+        # global random module; AI clones get a random.Random of their own (see clone())
+        self.rng = random
+
         # Track current attacker for damage modifiers (Demilune debuff)
         self.current_attacker = None
 
@@ -148,8 +153,8 @@ class Game:
                 valid_positions, formation, "full_map")
 
         # Check if we're in VS_AI mode
-        from boneglaive.utils.config import ConfigManager, GameMode
-        config = ConfigManager()
+        from boneglaive.utils.config import GameMode, get_config
+        config = get_config()
         is_vs_ai_mode = config.get('game_mode') == GameMode.VS_AI.value
         
         if is_vs_ai_mode and player == 2:
@@ -166,7 +171,8 @@ class Game:
 
                 import random
 
-                # Add units with random selection
+                # Pick the roster with random selection
+                placement = []
                 for i, (y, x) in enumerate(valid_positions[:3]):
                     # Filter available types to those with count < 1 (no duplicates)
                     valid_types = [t for t in available_types if unit_counts.get(t, 0) < 1]
@@ -179,9 +185,18 @@ class Game:
                         # Random selection from valid types
                         unit_type = random.choice(valid_types)
                         unit_counts[unit_type] = unit_counts.get(unit_type, 0) + 1
+                        placement.append((unit_type, y, x))
 
-                        self.add_unit(unit_type, player, y, x)
-                        logger.info(f"Added VS_AI mode {unit_type.name} for player {player} at ({y}, {x})")
+                # Prefer the opening book's tested placement for this roster over the random formation
+                from boneglaive.game.opening_book import opening_book
+                book_placement = opening_book.placement_for(self, player, [t for t, _, _ in placement])
+                if book_placement:
+                    logger.info(f"AI spawn: opening book placement for {self.map_name}")
+                    placement = book_placement
+
+                for unit_type, y, x in placement:
+                    self.add_unit(unit_type, player, y, x)
+                    logger.info(f"Added VS_AI mode {unit_type.name} for player {player} at ({y}, {x})")
 
                 # Return early since we've added all units
                 return
@@ -368,8 +383,8 @@ class Game:
         self.units = []
         
         # Check if we're in VS_AI mode - we need to handle this specifically
-        from boneglaive.utils.config import ConfigManager, GameMode
-        config = ConfigManager()
+        from boneglaive.utils.config import GameMode, get_config
+        config = get_config()
         is_vs_ai_mode = config.get('game_mode') == GameMode.VS_AI.value
         
         # Print debug info
@@ -528,8 +543,8 @@ class Game:
             emergency_p2_positions = [(2, 8, 1), (2, 8, 2), (2, 8, 3)]
             
             # Check if we're in VS_AI mode
-            from boneglaive.utils.config import ConfigManager, GameMode
-            config = ConfigManager()
+            from boneglaive.utils.config import GameMode, get_config
+            config = get_config()
             is_vs_ai_mode = config.get('game_mode') == GameMode.VS_AI.value
             
             # For VS_AI mode, add random unit types for player 2 with max 2 of each
@@ -1063,18 +1078,8 @@ class Game:
         Returns:
             List of (y, x) tuples representing valid respawn positions
         """
-        valid_tiles = []
-
         # Allow respawning on entire map - any passable, unoccupied tile
-        for y in range(HEIGHT):
-            for x in range(WIDTH):
-                # Check if position is valid, passable, and not occupied
-                if (self.is_valid_position(y, x) and
-                    self.map.is_passable(y, x) and
-                    self.get_unit_at(y, x) is None):
-                    valid_tiles.append((y, x))
-
-        return valid_tiles
+        return self.board_layers.respawn_tiles()
 
     def queue_respawn(self, dead_unit, position):
         """
@@ -1280,7 +1285,6 @@ class Game:
         Searches in expanding rings up to max_distance away.
         Returns a random candidate from the nearest ring with valid tiles.
         """
-        import random
 
         # Try the original position first
         if (self.is_valid_position(y, x) and
@@ -1306,7 +1310,7 @@ class Game:
                         candidates.append((check_y, check_x))
 
             if candidates:
-                return random.choice(candidates)
+                return self.rng.choice(candidates)
 
         return None
 
@@ -1666,7 +1670,93 @@ class Game:
     def set_ui_reference(self, ui):
         """Store a reference to the game UI for animations."""
         self.ui = ui
-    
+
+    @property
+    def targeting(self):
+        """Cached skill-target masks for this game (see boneglaive.game.targeting)."""
+        if getattr(self, '_targeting', None) is None:
+            from boneglaive.game.targeting import TargetingCache
+            self._targeting = TargetingCache(self)
+        return self._targeting
+
+    @property
+    def board_layers(self):
+        """Cached whole-board masks for this game (see boneglaive.game.board_layers)."""
+        if getattr(self, '_board_layers', None) is None:
+            from boneglaive.game.board_layers import BoardLayers
+            self._board_layers = BoardLayers(self)
+        return self._board_layers
+
+    def clone(self, memo=None, rng=None):
+        """
+        Return a detached deep copy of this game for hypothetical play (AI search).
+
+        The UI reference and the graphical callbacks are never copied — the clone
+        is headless — so resolving actions on it cannot touch the renderer.
+
+        Args:
+            memo: Optional dict passed to copy.deepcopy. After the call it maps
+                  id(original object) -> its copy, letting callers translate
+                  units and skills between the live game and the clone.
+            rng: random.Random the clone resolves chance outcomes with. Searches
+                 running off the main thread must pass one; without it the clone
+                 keeps drawing from this game's source (the global random module
+                 for a live game, a copy of the generator for a clone).
+
+        Returns:
+            A new Game instance sharing no mutable state with this one
+        """
+        import copy
+        if memo is None:
+            memo = {}
+        for attached in (getattr(self, 'ui', None), self.pre_status_clear_callback,
+                         self.post_passive_application_callback,
+                         self.map.terrain_change_callback):
+            if attached is not None:
+                memo[id(attached)] = None
+        # The clone builds its own target masks and board layers on demand
+        for cache in (getattr(self, '_targeting', None), getattr(self, '_board_layers', None)):
+            if cache is not None:
+                memo[id(cache)] = None
+        # Modules cannot be copied; a live game's clone shares the global generator
+        memo[id(random)] = random
+        clone = copy.deepcopy(self, memo)
+        if rng is not None:
+            clone.rng = rng
+        return clone
+
+    def forecast(self, unit, action):
+        """
+        Preview one unit's action without changing this game.
+
+        The action is resolved on a clone by the real per-unit pipeline, so the
+        result includes PRT, Partition, bombs, Autoclave, retching and kills.
+
+        Args:
+            unit: Unit performing the action
+            action: UnitAction (boneglaive.game.actions) with the unit's orders
+
+        Returns:
+            Forecast (boneglaive.game.forecast) with per-unit HP/position deltas
+        """
+        from boneglaive.game.forecast import forecast_action
+        return forecast_action(self, unit, action)
+
+    def legal_actions(self, unit, include_wait=True):
+        """
+        Lazily yield every action the unit may legally take this turn.
+
+        Args:
+            unit: Unit with nothing queued yet
+            include_wait: Also yield the empty action
+
+        Yields:
+            UnitAction tuples (boneglaive.game.actions): move, attack, skill,
+            move+attack and move+skill with their targets
+        """
+        from boneglaive.game.actions import legal_actions
+        return legal_actions(self, unit, include_wait)
+
     @measure_perf
     def check_critical_health(self, unit, attacker=None, previous_hp=None, ui=None):
         """
@@ -2927,9 +3017,20 @@ class Game:
                 units_with_actions.append(unit)
         
         # Sort units by action timestamp (lower numbers = earlier actions)
-        # If timestamps are equal, sort by random order to avoid MARROW_CONDENSER always going first
-        import random
-        units_with_actions.sort(key=lambda unit: (unit.action_timestamp, random.random()))
+        # If timestamps are equal, shuffle them to avoid MARROW_CONDENSER always going first.
+        # Only ties draw from the generator, so a turn without them involves no chance
+        units_with_actions.sort(key=lambda unit: unit.action_timestamp)
+        start = 0
+        while start < len(units_with_actions):
+            end = start + 1
+            while (end < len(units_with_actions) and
+                   units_with_actions[end].action_timestamp == units_with_actions[start].action_timestamp):
+                end += 1
+            if end - start > 1:
+                tied = units_with_actions[start:end]
+                self.rng.shuffle(tied)
+                units_with_actions[start:end] = tied
+            start = end
         
         logger.info(f"Executing {len(units_with_actions)} actions in timestamp order")
         
@@ -2948,916 +3049,127 @@ class Game:
         
         # Process each unit's actions in timestamp order
         for unit in units_with_actions:
-            # Log the unit and its action
-            logger.debug(f"Processing unit {unit.get_display_name()} with timestamp {unit.action_timestamp}")
-            
-            # Flag to track if this is a MANDIBLE_FOREMAN taking an action that should release trapped units
-            is_foreman_taking_action = False
-            
-            # Check if this is a MANDIBLE_FOREMAN
-            if unit.type == UnitType.MANDIBLE_FOREMAN:
-                # Movement and attacks always release trapped units
-                if unit.move_target is not None or unit.attack_target is not None:
-                    is_foreman_taking_action = True
-                # Some skills release trapped units, but not all
-                elif unit.skill_target is not None and unit.selected_skill:
-                    # Discharge doesn't automatically release trapped units
-                    # as the Discharge skill itself handles the release
-                    if unit.selected_skill.name != "Discharge":
-                        is_foreman_taking_action = True
-            
-            # If this is a MANDIBLE_FOREMAN taking an action that should release trapped units
-            if is_foreman_taking_action:
-                # Find all units trapped by this FOREMAN
-                trapped_units = [u for u in self.units if u.is_alive() and u.trapped_by == unit]
-                if trapped_units:
-                    logger.debug(f"MANDIBLE_FOREMAN {unit.get_display_name()} is taking action, releasing trapped units")
-                    
-                    # Release trapped units before the FOREMAN's action is executed
-                    for trapped_unit in trapped_units:
-                        
-                        # Release the unit
-                        trapped_unit.trapped_by = None
-                        message_log.add_message(
-                            f"{trapped_unit.get_display_name()} is released from mechanical jaws",
-                            MessageType.ABILITY,
-                            target_name=trapped_unit.get_display_name()
-                        )
-                    
-                    # Redraw the board to show the updated state
-                    if ui:
-                        ui.draw_board(show_cursor=False, show_selection=False, show_attack_targets=False)
-                        time.sleep(0.2)  # Short pause after release
-            
-            # EXECUTE MOVE if unit has a move target
-            if unit.move_target:
-                y, x = unit.move_target
-                if self.can_move_to(unit, y, x):  # Double-check the move is still valid
-                    # Mark that this unit took an action (won't regenerate HP)
-                    unit.took_no_actions = False
-                    logger.debug(f"Moving {unit.get_display_name()} from ({unit.y},{unit.x}) to ({y},{x})")
-                    
-                    # Save original position
-                    start_y, start_x = unit.y, unit.x
-                    
-                    # DERELICTIONIST Severance: Remove SEVERANCE status when movement is executed
-                    if (unit.type == UnitType.DERELICTIONIST and 
-                        hasattr(unit, 'severance_active') and unit.severance_active):
-                        
-                        # Remove SEVERANCE status effect when movement is used
-                        unit.severance_active = False
-                        unit.severance_duration = 0
-                        unit.can_move_post_skill = False  # Consumed the post-skill move
-                        
-                        logger.info(f"SEVERANCE: {unit.get_display_name()} consumes enhanced movement - Severance status expires")
-                        
-                        from boneglaive.utils.message_log import message_log, MessageType
-                        message_log.add_message(
-                            f"{unit.get_display_name()}'s Severance expires after movement",
-                            MessageType.ABILITY,
-                            player=unit.player
-                        )
-                    
-                    # Update unit position ATOMICALLY. Do NOT use `unit.y, unit.x = y, x`:
-                    # that assigns y then x through the property setters, so the unit
-                    # transiently occupies the intermediate corner (y, old_x). If another
-                    # unit is on that corner — e.g. an ORDNANCE_GRAFT's leashed QUADCOPTER,
-                    # which sits adjacent to him — the grid's collision safety net restores
-                    # _y to old_y, but the following `x` assignment still runs, stranding
-                    # the unit at (old_y, x): a tile that was never validated and may be
-                    # impassable (a pylon). Writing both axes then updating the grid once
-                    # moves the entry straight from the real old tile to the validated
-                    # final tile, never touching a corner. (Trap-release + anchor updates
-                    # are handled explicitly below, so bypassing the setters loses nothing.)
-                    unit._y, unit._x = y, x
-                    self._update_unit_grid(unit, start_y, start_x)
-
-                    # Check for terrain-specific interactions
-                    current_terrain = self.map.get_terrain_at(y, x)
-                    
-                    # Leaf pit rustling message
-                    if current_terrain == TerrainType.LEAF_PIT:
-                        from boneglaive.utils.message_log import message_log, MessageType
-                        message_log.add_message(
-                            f"{unit.get_display_name()} rustles through the cold mulchy pit",
-                            MessageType.ABILITY,
-                            player=unit.player
-                        )
-                    
-                    # Mini pumpkin collection
-                    elif current_terrain == TerrainType.MINI_PUMPKIN:
-                        from boneglaive.utils.message_log import message_log, MessageType
-                        # Apply Pumped Up status effect
-                        unit.pumped_up_active = True
-                        unit.pumped_up_duration = 3
-                        
-                        # Remove the mini pumpkin from the map (replace with canyon floor)
-                        self.map.set_terrain_at(y, x, TerrainType.CANYON_FLOOR)
-                        
-                        # Show collection message
-                        message_log.add_message(
-                            f"{unit.get_display_name()} snatches up the mini pumpkin",
-                            MessageType.ABILITY,
-                            player=unit.player
-                        )
-                    
-                    # Show movement animation if UI is provided
-                    if ui:
-                        
-                        # Update anchor status effects after position change
-                        self.update_anchor_status_effects()
-                        
-                        # Check for trap release due to position change
-                        self._check_position_change_trap_release(unit, start_y, start_x)
-                        
-                        # Redraw to show unit in new position without UI elements during animation
-                        ui.draw_board(show_cursor=False, show_selection=False, show_attack_targets=False)
-                        
-                        # Log movement
-                        message_log.add_message(
-                            f"{unit.get_display_name()} moved from ({start_y},{start_x}) to ({y},{x})",
-                            MessageType.MOVEMENT,
-                            player=unit.player,
-                            # Include unit name for coloring
-                            attacker_name=unit.get_display_name()
-                        )
-                        time.sleep(0.3)  # Short delay after each unit moves
-                    else:
-                        # Position is already set above. Just reconcile state.
-                        # Update anchor status effects after position change
-                        self.update_anchor_status_effects()
+            self._execute_unit_action(unit, ui)
 
-                        # Check for trap release due to position change
-                        self._check_position_change_trap_release(unit, start_y, start_x)
+            # Advance the spinner between units' actions
+            if ui:
+                ui.advance_spinner()
+                # Graphical mode reconstructs timing from state diffs and needs no artificial pause
+                if not (hasattr(ui, '__class__') and ui.__class__.__name__ == 'GraphicalUIAdapter'):
+                    time.sleep(0.2)
+        
+        # Apply trap damage for all trapped units
+        self._apply_trap_damage()
 
-                    # After unit moves, check if any LIVING_AEROSOL needs to follow
-                    self._move_leashed_aerosols(unit, start_y, start_x, ui)
-                    # And any ORDNANCE_DRONE leashed to an ORDNANCE_GRAFT
-                    self._move_leashed_drones(unit, start_y, start_x, ui)
-                else:
-                    logger.warning(f"Invalid move target ({y},{x}) for unit at ({unit.y},{unit.x})")
+        # Execute pending respawns
+        self._execute_respawns(ui)
 
-            # EXECUTE ATTACK if unit has an attack target
-            if unit.attack_target:
-                from boneglaive.utils.message_log import message_log, MessageType
-                y, x = unit.attack_target
-                target = self.get_unit_at(y, x)
-                
-                # Mark that this unit took an action (won't regenerate HP)
-                unit.took_no_actions = False
-                
-                # Calculate attacking position (either unit's current position or move target)
-                # DERELICTIONIST Severance attack: validate from where attack was queued (pre-move),
-                # since the unit may have moved away after queuing the attack.
-                if (unit.type == UnitType.DERELICTIONIST and
-                        hasattr(unit, 'attack_queued_from') and unit.attack_queued_from):
-                    attacking_pos = unit.attack_queued_from
-                else:
-                    attacking_pos = (unit.y, unit.x)  # Unit's position is already updated if it moved
+        # Process HEINOUS_VAPOR effects for current player's vapors only
+        vapor_units = [unit for unit in self.units if unit.is_alive() and 
+                      unit.type == UnitType.HEINOUS_VAPOR and 
+                      hasattr(unit, 'vapor_type') and unit.vapor_type and
+                      unit.player == self.current_player]  # Only include current player's vapors
+        
+        # Process each vapor's area effects
+        for vapor_unit in vapor_units:
+            # Mark that this vapor just applied effects (for graphical animation triggering)
+            vapor_unit.just_applied_aoe = True
 
-                # Verify attack is within range from the attacking position
-                attack_distance = self.chess_distance(attacking_pos[0], attacking_pos[1], y, x)
-                
-                # Get the unit's effective attack range from their stats
-                effective_stats = unit.get_effective_stats()
-                effective_attack_range = effective_stats['attack_range']
-                
-                # Line of sight check for ranged attacks (range > 1)
-                los_check = True
-                if effective_attack_range > 1:
-                    los_check = self.has_line_of_sight(attacking_pos[0], attacking_pos[1], y, x)
-                    if not los_check:
-                        message_log.add_message(
-                            f"{unit.get_display_name()}'s attack is blocked by terrain",
-                            MessageType.COMBAT,
-                            player=unit.player
-                        )
+            # Apply the vapor's area effects only on owner's turn
+            vapor_unit.apply_vapor_effects(self, ui)
+            
+            # Decrement vapor duration for current player's vapors
+            if hasattr(vapor_unit, 'vapor_duration'):
+                vapor_unit.vapor_duration -= 1
+                logger.debug(f"Vapor {vapor_unit.get_display_name()} duration decremented to {vapor_unit.vapor_duration}")
                 
-
-                # Check Selenic Backdraft: attacker cannot basic attack the POTPOURRIST who applied it
-                if (hasattr(unit, 'selenic_backdraft') and unit.selenic_backdraft and
-                    hasattr(unit, 'selenic_backdraft_by') and target and
-                    unit.selenic_backdraft_by == target):
-                    logger.debug(f"Attack cancelled: {unit.get_display_name()} is blinded by Selenic Backdraft")
+                # If duration reached zero, the vapor expires
+                if vapor_unit.vapor_duration <= 0:
+                    logger.debug(f"Vapor {vapor_unit.get_display_name()} expires")
+                    
+                    # Clear protection from units if this is a SAFETY type vapor
+                    if hasattr(vapor_unit, 'vapor_type') and vapor_unit.vapor_type == "SAFETY":
+                        # Find all units that were being protected by this vapor
+                        for protected_unit in self.units:
+                            if (hasattr(protected_unit, 'protected_by_safety_gas') and 
+                                protected_unit.protected_by_safety_gas):  # Check if it's a non-empty list
+                                # Make a copy of the list to avoid modification issues
+                                protection_list = protected_unit.protected_by_safety_gas.copy()
+                                
+                                # Clean up dead or removed vapors
+                                for vapor in protection_list:
+                                    if vapor not in self.units or not vapor.is_alive() or vapor == vapor_unit:
+                                        if vapor in protected_unit.protected_by_safety_gas:
+                                            protected_unit.protected_by_safety_gas.remove(vapor)
+                                            logger.debug(f"{protected_unit.get_display_name()} is no longer protected by expired or removed vapor")
+                                
+                                # If there are no more protecting vapors, clean up the attribute
+                                if not protected_unit.protected_by_safety_gas:
+                                    logger.debug(f"{protected_unit.get_display_name()} is no longer protected by any safety gas")
+                                    delattr(protected_unit, 'protected_by_safety_gas')
+                    
+                    # Log the expiration
                     message_log.add_message(
-                        f"{unit.get_display_name()}'s attack is repelled by the selenic backdraft",
-                        MessageType.COMBAT,
-                        player=unit.player
+                        f"{vapor_unit.get_display_name()} dissipates...",
+                        MessageType.ABILITY,
+                        player=vapor_unit.player
                     )
-                    continue  # Skip this attack and go to next unit
-
-                # Check for Marrow Dike wall tiles that can be targeted
-                wall_target = None
-                if not target and (y, x) in self.marrow_dike_tiles:
-                    # Allow targeting both ally and enemy walls
-                    wall_info = self.marrow_dike_tiles[(y, x)]
-                    if attack_distance <= effective_attack_range and los_check:
-                        wall_target = (y, x)  # Mark this as a valid wall target
-
-                # Check if attack is valid
-                valid_attack = (target and
-                               target.player != unit.player and
-                               attack_distance <= effective_attack_range and
-                               los_check)
-                               
-                if valid_attack or wall_target:  # Valid attack on unit or wall
-                    # Mark that this attack was executed (for animation detection in graphical mode)
-                    unit.last_executed_attack = unit.attack_target
-
-                    # Handle damage calculation first
-                    if wall_target:
-                        # Get the wall information
-                        wall_y, wall_x = wall_target
-                        wall_info = self.marrow_dike_tiles[wall_target]
-
-                        # Check if attacker is ally (same player as wall owner)
-                        is_ally_attack = (wall_info['owner'].player == unit.player)
-
-                        if is_ally_attack:
-                            # Allies always destroy walls in 1 hit
-                            damage = wall_info['hp']  # Deal exactly enough damage to destroy
-                            wall_info['hp'] = 0
-                        else:
-                            # Enemy walls take 1 damage per attack
-                            damage = 1
-                            wall_info['hp'] = max(0, wall_info['hp'] - damage)
-
-                        # Log the attack on the wall
-                        message_log.add_message(
-                            f"{unit.get_display_name()} attacks a Marrow Dike wall",
-                            MessageType.COMBAT,
-                            player=unit.player
-                        )
-
-                        # Handle wall destruction
-                        if wall_info['hp'] <= 0:
-                            # Restore original terrain
-                            original_terrain = wall_info.get('original_terrain', TerrainType.EMPTY)
-                            self.map.set_terrain_at(wall_y, wall_x, original_terrain)
+                    
+                    # Check if this vapor was from a diverged user
+                    if hasattr(vapor_unit, 'diverged_user') and vapor_unit.diverged_user:
+                        # Check if this is the last vapor to expire
+                        other_vapors = [u for u in self.units if u != vapor_unit and 
+                                      u.is_alive() and u.type == UnitType.HEINOUS_VAPOR and 
+                                      hasattr(u, 'diverged_user') and u.diverged_user == vapor_unit.diverged_user]
+                        
+                        # If no other vapors from this user, the user reforms
+                        if not other_vapors:
+                            gas_machinist = vapor_unit.diverged_user
 
-                            # Remove from tracking
-                            owner = wall_info['owner']
-                            del self.marrow_dike_tiles[wall_target]
+                            # CRITICAL: Remove vapor from grid BEFORE moving GAS_MACHINIST to that position
+                            # This prevents collision detection from blocking the placement
+                            self._remove_from_unit_grid(vapor_unit)
 
-                            # Log the destruction
-                            message_log.add_message(
-                                f"{unit.get_display_name()} breaks through a section of {owner.get_display_name()}'s Marrow Dike",
-                                MessageType.COMBAT,
-                                player=unit.player
-                            )
+                            # Return the Gas Machinist to the vapor's position
+                            gas_machinist.y = vapor_unit.y
+                            gas_machinist.x = vapor_unit.x
 
-                        # No XP or further processing for wall attacks - skip to next unit
-                        continue
-                    else:
-                        # Normal unit-vs-unit combat
-                        
-                        # Check for Market Futures maturation - do this RIGHT before the attack
-                        # This ensures the maturation message appears before the attack message
-                        if hasattr(unit, 'market_futures_needs_maturation') and unit.market_futures_needs_maturation:
-                            # Apply Market Futures maturation right before attack
-                            old_maturity = unit.market_futures_maturity
-                            unit.market_futures_maturity += 1
-                            
-                            # Update the attack bonus (remove old bonus and add new one)
-                            unit.attack_bonus = unit.attack_bonus - old_maturity + unit.market_futures_maturity
+                            # Reset the diverge flags
+                            gas_machinist.diverge_return_position = False
                             
-                            # Log the investment maturation before attack
+                            # Log the return
                             message_log.add_message(
-                                f"{unit.get_display_name()}'s investment matures to +{unit.market_futures_maturity} ATK",
+                                f"{gas_machinist.get_display_name()} reforms at ({vapor_unit.y}, {vapor_unit.x})",
                                 MessageType.ABILITY,
-                                player=unit.player
+                                player=gas_machinist.player
                             )
                             
-                            # Clear the flag
-                            unit.market_futures_needs_maturation = False
-                            
-                            # Check if this is the final maturation before expiry
-                            if hasattr(unit, 'market_futures_final_maturation'):
-                                # Show expiration message AFTER maturation
-                                message_log.add_message(
-                                    f"{unit.get_display_name()}'s investment effect expires after 3 turns.",
-                                    MessageType.ABILITY,
-                                    player=unit.player
-                                )
-                                
-                                # Remove the attack bonus after this attack
-                                unit.market_futures_will_expire_after_attack = True
-                                
-                                # Clear the flag
-                                delattr(unit, 'market_futures_final_maturation')
-                            
-                        # Calculate base attack damage FIRST (before animation so we can show correct damage)
-                        effective_stats = unit.get_effective_stats()
-                        effective_attack = effective_stats['attack']
-
-                        # DERELICTIONIST: distance-based attack (pure chess/Chebyshev distance)
-                        # Uses move_target if Severance move is planned, so post-move distance is used
-                        if unit.type == UnitType.DERELICTIONIST:
-                            source_y, source_x = (unit.move_target[0], unit.move_target[1]) if unit.move_target else (unit.y, unit.x)
-                            attack_distance = self.chess_distance(source_y, source_x, target.y, target.x)
-                            effective_attack += attack_distance
-
-                        # Check for Granite Geas attack reduction (attacking POTPOURRIST)
-                        if (target.type == UnitType.POTPOURRIST and
-                            hasattr(unit, 'geas_attack_reduction') and unit.geas_attack_reduction and
-                            hasattr(unit, 'taunted_by') and unit.taunted_by == target):
-                            # Attacker's attack is treated as 2 when attacking this POTPOURRIST
-                            effective_attack = 2
-
-                        # Get effective defense
-                        effective_defense = target.get_effective_stats()['defense']
-
-                        # Calculate damage with defense (PRT handled automatically by HP setter)
-                        raw_damage = effective_attack
-
-                        # Apply defense to damage
-                        # DERELICTIONIST's attacks bypass defense
-                        # LANDSCAPER with upgraded Translative Stroke bypasses defense
-                        from boneglaive.game.upgrades import UpgradeManager
-                        if unit.type == UnitType.DERELICTIONIST:
-                            damage = raw_damage
-                        elif (unit.type == UnitType.LANDSCAPER and
-                              UpgradeManager.is_skill_upgraded(unit, "Translative Stroke")):
-                            damage = raw_damage
-                        else:
-                            damage = max(1, raw_damage - effective_defense)
-                        
-                        # Store previous HP to check for status changes
-                        previous_hp = target.hp
-                        critical_threshold = int(target.max_hp * CRITICAL_HEALTH_PERCENT)
-
-                        # LANDSCAPER: Translative Stroke — 4 hits instead of 1
-                        if unit.type == UnitType.LANDSCAPER:
-                            total_damage = 0
-                            for hit_num in range(4):
-                                if target.hp <= 0:
-                                    break
-                                old_hp = target.hp
-                                self.current_attacker = unit
-                                target.hp = max(0, target.hp - damage)
-                                self.current_attacker = None
-                                hit_damage = old_hp - target.hp
-                                total_damage += hit_damage
-
-                                message_log.add_combat_message(
-                                    attacker_name=unit.get_display_name(),
-                                    target_name=target.get_display_name(),
-                                    damage=hit_damage,
-                                    attacker_player=unit.player,
-                                    target_player=target.player
-                                )
+                    
+                    # Kill the vapor using expire() to bypass invulnerability
+                    vapor_unit._expired_summon = True
+                    vapor_unit.expire()
 
-                                if ui:
-                                    ui.show_attack_animation(unit, target, hit_damage)
-                            actual_damage = total_damage
+        # Process doppelganger expiration AFTER all actions have been executed
+        # This ensures doppelganger attacks complete before the doppelganger dies
+        for unit in list(self.units):  # Create a copy of the list to safely modify during iteration
+            if unit.is_alive() and unit.is_doppelganger and unit.player == self.current_player:
+                # Only decrement duration on the owner's turn
+                unit.doppelganger_duration -= 1
+                logger.debug(f"Doppelganger {unit.get_display_name()} duration decremented to {unit.doppelganger_duration}")
 
-                            # Reduce all skill cooldowns by total damage dealt
-                            for skill in unit.active_skills:
-                                if skill.current_cooldown > 0:
-                                    skill.current_cooldown = max(0, skill.current_cooldown - total_damage)
+                # If duration reached zero, the doppelganger expires
+                if unit.doppelganger_duration <= 0:
+                    logger.debug(f"Doppelganger {unit.get_display_name()} expires after actions completed")
 
-                            if total_damage > 0:
-                                message_log.add_message(
-                                    f"Translative Stroke: cooldowns reduced by {total_damage}",
-                                    MessageType.ABILITY,
-                                    player=unit.player
-                                )
-                        else:
-                            # Standard single-hit attack
-                            old_hp = target.hp
-                            # Set current attacker for Demilune damage halving in hp setter
-                            self.current_attacker = unit
-                            target.hp = max(0, target.hp - damage)
-                            self.current_attacker = None
-                            actual_damage = old_hp - target.hp
+                    # Trigger explosion effect (deals damage to adjacent enemies)
+                    self._trigger_doppelganger_death_effect(unit, ui)
 
-                            # Show attack animation with actual damage
-                            if ui:
-                                ui.show_attack_animation(unit, target, actual_damage)
-
-                        # Check for upgraded Ossify reflect damage (MARROW_CONDENSER)
-                        if (target.type == UnitType.MARROW_CONDENSER and
-                            hasattr(target, 'ossify_active') and target.ossify_active and
-                            target.hp > 0 and actual_damage > 0):
-                            # Check if Ossify is manually upgraded
-                            from boneglaive.game.upgrades import UpgradeManager
-                            if UpgradeManager.is_skill_upgraded(target, "Ossify"):
-                                # Reflect all damage back to attacker
-                                reflect_damage = actual_damage
-
-                                attacker_previous_hp = unit.hp
-                                unit.hp = max(0, unit.hp - reflect_damage)
-
-                                # Log the reflect
-                                message_log.add_message(
-                                    f"{target.get_display_name()}'s hardened bones splinter back at {unit.get_display_name()} for {reflect_damage} damage",
-                                    MessageType.ABILITY,
-                                    player=target.player,
-                                    target_name=unit.get_display_name()
-                                )
-
-                                # Check if attacker died from reflect damage
-                                if unit.hp <= 0 and attacker_previous_hp > 0:
-                                    self.handle_unit_death(unit, target, cause="ossify_reflect", ui=ui)
-
-                        # Check for taunt response (Granite Geas)
-                        if (hasattr(unit, 'taunted_by') and unit.taunted_by and
-                            unit.taunted_by == target):
-                            # Attacker attacked the unit that taunted them
-                            unit.taunt_responded_this_turn = True
-                            logger.debug(f"TAUNT RESPONSE: {unit.get_display_name()} responded to {target.get_display_name()}'s taunt")
-
-                    # Check if attacker is a MANDIBLE_FOREMAN with the Viseroy passive
-                    # If so, trap the target unit
-                    if unit.type == UnitType.MANDIBLE_FOREMAN and unit.passive_skill and \
-                       unit.passive_skill.name == "Viseroy" and target.hp > 0:
-                        # Check if target is immune to being trapped
-                        if target.is_immune_to_trap():  # Changed to is_immune_to_trap
-                            message_log.add_message(
-                                f"{target.get_display_name()} is immune to Viseroy due to Stasiality",
-                                MessageType.ABILITY,
-                                player=target.player,  # Use target's player color
-                                target_name=target.get_display_name()
-                            )
-                        else:
-                            # Only trap if the target is still alive and not immune
-                            target.trapped_by = unit
-                            target.trap_duration = 0  # Initialize trap duration for incremental damage
-
-                            # Log the trapping (using MessageType.COMBAT for yellow coloring)
-                            message_log.add_message(
-                                f"{target.get_display_name()} is trapped in mechanical jaws",
-                                MessageType.WARNING,  # WARNING messages are explicitly colored yellow
-                                player=unit.player,
-                                target_name=target.get_display_name()
-                            )
-
-                            # Check for Viseroy upgrade - apply disarm if available
-                            from boneglaive.game.upgrades import UpgradeManager
-                            if UpgradeManager.is_skill_upgraded(unit, "Viseroy") and unit.viseroy_disarm_cooldown == 0:
-                                # Apply disarm effect as a proper status effect
-                                target.status_disarmed = True
-                                target.status_disarmed_duration = 1
-                                unit.viseroy_disarm_cooldown = 3  # 3 turn cooldown
-
-                                message_log.add_message(
-                                    f"{target.get_display_name()} is disarmed by enhanced mechanical jaws",
-                                    MessageType.WARNING,
-                                    player=unit.player,
-                                    target=target.player,
-                                    target_name=target.get_display_name()
-                                )
-
-
-                    # Only log combat messages and handle unit death for unit targets (not walls)
-                    if target:
-                        # Log combat message with actual damage dealt
-                        # LANDSCAPER logs per-hit messages above, skip the combined message
-                        if unit.type != UnitType.LANDSCAPER:
-                            message_log.add_combat_message(
-                                attacker_name=unit.get_display_name(),
-                                target_name=target.get_display_name(),
-                                damage=actual_damage,
-                                attacker_player=unit.player,
-                                target_player=target.player
-                            )
-
-                        # Handle INTERFERER attack mechanics
-                        if unit.type == UnitType.INTERFERER:
-                            # Check for Karrier Rave triple strike (active during phasing)
-                            if hasattr(unit, 'carrier_rave_active') and unit.carrier_rave_active:
-                                # Trigger radiation for the first strike of Karrier Rave
-                                if unit.passive_skill and unit.passive_skill.name == "Radio Effulgent":
-                                    unit.passive_skill.trigger_radiation(unit, (target.y, target.x), self, ui)
-                                
-                                # Apply two additional strikes
-                                for strike in range(2):
-                                    if target.hp > 0:  # Only continue if target is still alive
-                                        additional_damage = max(1, effective_attack - effective_defense)
-                                        old_target_hp = target.hp
-                                        # Set current attacker for Lunacy damage halving
-                                        self.current_attacker = unit
-                                        target.hp = max(0, target.hp - additional_damage)
-                                        self.current_attacker = None
-                                        actual_additional_damage = old_target_hp - target.hp
-                                        
-                                        message_log.add_combat_message(
-                                            attacker_name=unit.get_display_name(),
-                                            target_name=target.get_display_name(),
-                                            damage=actual_additional_damage,
-                                            ability=f"Karrier Rave Strike {strike + 2}",
-                                            attacker_player=unit.player,
-                                            target_player=target.player
-                                        )
-
-                                        # Show additional damage animation with actual damage
-                                        if ui:
-                                            ui.show_attack_animation(unit, target, actual_additional_damage)
-                                            
-                                        # Trigger radiation immediately after each additional strike
-                                        if unit.passive_skill and unit.passive_skill.name == "Radio Effulgent":
-                                            unit.passive_skill.trigger_radiation(unit, (target.y, target.x), self, ui)
-                                
-                                # End Karrier Rave effect after using triple strike
-                                unit.carrier_rave_active = False
-                                unit.carrier_rave_duration = 0
-                                
-                                message_log.add_message(
-                                    f"{unit.get_display_name()} phases back into reality after the devastating strike",
-                                    MessageType.ABILITY,
-                                    player=unit.player
-                                )
-                            else:
-                                # Normal single attack - trigger Radio Effulgent if available
-                                if unit.passive_skill and unit.passive_skill.name == "Radio Effulgent":
-                                    # Trigger radiation effect (only applies if enemies are in range)
-                                    unit.passive_skill.trigger_radiation(unit, (target.y, target.x), self, ui)
-                        
-                        # Handle removal of Market Futures effect after attack if it's expiring
-                        if hasattr(unit, 'market_futures_will_expire_after_attack') and unit.market_futures_will_expire_after_attack:
-                            # Remove the attack bonus based on current maturity level
-                            if hasattr(unit, 'market_futures_maturity'):
-                                unit.attack_bonus -= unit.market_futures_maturity
-                            
-                            # Remove range bonus
-                            unit.attack_range_bonus -= 1
-                            
-                            # Reset all flags
-                            unit.market_futures_bonus_applied = False
-                            unit.market_futures_will_expire_after_attack = False
-                            if hasattr(unit, 'has_investment_effect'):
-                                unit.has_investment_effect = False
-                            if hasattr(unit, 'market_futures_range_bonus_active'):
-                                unit.market_futures_range_bonus_active = False
-                        
-                        # No need to format with player info anymore - just use the unit's display name
-                        # Check if target was defeated
-                        if target.hp <= 0:
-                            # Use centralized death handling
-                            self.handle_unit_death(target, unit, cause="combat", ui=ui)
-                        else:
-                            # Check for critical health (retching) using centralized logic
-                            if not self.check_critical_health(target, unit, previous_hp, ui):
-                                continue  # Skip to next unit if processing should stop
-                else:
-                    # Log invalid attack attempts for debugging
-                    if not target:
-                        logger.warning(f"Attack failed: no target at ({y},{x})")
-                    elif target.player == unit.player:
-                        logger.warning(f"Attack failed: cannot attack allied unit")
-                    elif attack_distance > unit.attack_range:
-                        logger.warning(f"Attack failed: target out of range (distance={attack_distance}, range={unit.attack_range})")
-                    else:
-                        logger.warning(f"Attack failed: unknown reason")
-                
-                # Add a slight pause between actions for a unit and update spinner
-                if ui:
-                    ui.advance_spinner()
-                    # Graphical mode reconstructs timing from state diffs and needs no artificial pause
-                    if not (hasattr(ui, '__class__') and ui.__class__.__name__ == 'GraphicalUIAdapter'):
-                        time.sleep(0.15)
-            
-            # EXECUTE SKILL if unit has a skill target
-            if unit.skill_target and unit.selected_skill:
-                # Mark that this unit took an action (won't regenerate HP)
-                # Exception: INTERFERER using SCALAR NODE can still regenerate to obscure deployment
-                if unit.type == UnitType.INTERFERER and unit.selected_skill.name == "Scalar Node":
-                    # Allow INTERFERER to regenerate after using SCALAR NODE for stealth
-                    pass  # Don't set took_no_actions = False
-                else:
-                    unit.took_no_actions = False
-                
-                # Execute the skill
-                skill = unit.selected_skill
-                target_pos = unit.skill_target
-
-                # Execute the skill if it has an execute method
-                if hasattr(skill, 'execute'):
-                    # Set current attacker context for Demilune damage reduction
-                    self.current_attacker = unit
-                    skill.execute(unit, target_pos, self, ui)
-                    self.current_attacker = None
-
-                    # Best-effort sweep for collateral kills a skill left at hp <= 0 without
-                    # routing through handle_unit_death (so the on-death effects in
-                    # handle_unit_death fire). NOTE: this only catches victims still present
-                    # in self.units. A unit killed via deal_damage / the hp setter has already
-                    # run Unit._handle_death (GP + respawn) which REMOVES it from self.units,
-                    # so it will NOT be found here — such kills must call handle_unit_death at
-                    # the damage site themselves (see ordnance_graft.detonate_fused). The
-                    # _engine_death_handled guard prevents double-processing either way.
-                    skill_cause = skill.name.lower().replace(' ', '_')
-                    for check_unit in list(self.units):
-                        if (check_unit != unit and check_unit.hp <= 0 and
-                                not getattr(check_unit, '_engine_death_handled', False)):
-                            check_unit._engine_death_handled = True
-                            self.handle_unit_death(check_unit, unit, cause=skill_cause, ui=ui)
-
-                    # Note: Cooldown is set in skill.use() to allow for upgrade modifications
-                    # Don't override it here
-
-                    # If unit is under Neural Shunt effects, the cooldown was already set
-                    if (hasattr(unit, 'neural_shunt_affected') and unit.neural_shunt_affected):
-                        logger.debug(f"Neural Shunt: {unit.get_display_name()}'s {skill.name} placed on cooldown ({skill.current_cooldown} turns)")
-                else:
-                    logger.warning(f"Skill {skill.name} has no execute method")
-
-                # Check for taunt response (Granite Geas) - if skill targeted taunting unit
-                if hasattr(unit, 'taunted_by') and unit.taunted_by:
-                    # Check if the skill targeted the unit that taunted them
-                    target_unit = self.get_unit_at(target_pos[0], target_pos[1])
-                    if (target_unit and unit.taunted_by == target_unit):
-                        # Unit used skill on the unit that taunted them
-                        unit.taunt_responded_this_turn = True
-                        logger.debug(f"TAUNT RESPONSE (skill): {unit.get_display_name()} responded to {target_unit.get_display_name()}'s taunt with skill")
-
-                # Add a slight pause after the skill and update spinner
-                if ui:
-                    ui.advance_spinner()
-                    # Graphical mode reconstructs timing from state diffs and needs no artificial pause
-                    if not (hasattr(ui, '__class__') and ui.__class__.__name__ == 'GraphicalUIAdapter'):
-                        time.sleep(0.15)
-            
-            # EXECUTE VISEROY TRAP DAMAGE if this is a MANDIBLE_FOREMAN with trapped units
-            elif hasattr(unit, 'auction_curse_dot_action') and unit.auction_curse_dot_action:
-                # This is a special action but still counts as an action for health regeneration
-                unit.took_no_actions = False
-                # Process Auction Curse DOT effect
-                from boneglaive.utils.message_log import message_log, MessageType
-                
-                
-                # Apply the damage
-                damage = 1
-                old_hp = unit.hp
-                unit.hp = max(0, unit.hp - damage)
-                actual_damage = old_hp - unit.hp
-                
-                
-                # Get the opposing player (caster of the Auction Curse)
-                caster_player = 3 - unit.player  # If unit.player is 1, this gives 2; if 2, gives 1
-                
-                # Find a DELPHIC_APPRAISER unit from the caster's player to attribute the damage to
-                appraiser_unit = None
-                for u in self.units:
-                    if u.is_alive() and u.player == caster_player and u.type == UnitType.DELPHIC_APPRAISER:
-                        appraiser_unit = u
-                        break
-                
-                # Use the found DELPHIC_APPRAISER or a generic name if none found
-                attacker_name = appraiser_unit.get_display_name() if appraiser_unit else f"DELPHIC APPRAISER Player {caster_player}"
-                
-                # Log the damage using standard combat message format - this ensures proper color formatting
-                message_log.add_combat_message(
-                    attacker_name=attacker_name,
-                    target_name=unit.get_display_name(),
-                    damage=damage,
-                    ability="Auction Curse",
-                    attacker_player=caster_player,
-                    target_player=unit.player
-                )
-                
-                # Inflate astral values of furniture AND appraised enemies within 2 tiles of cursed unit
-                # Check if Valuation Oracle upgrade is active
-                from boneglaive.game.upgrades import UpgradeManager
-                valuation_oracle_upgraded = False
-                if appraiser_unit and UpgradeManager.is_skill_upgraded(appraiser_unit, "Valuation Oracle"):
-                    valuation_oracle_upgraded = True
-
-                furniture_inflated = 0
-                enemies_inflated = 0
-                for dy in range(-2, 3):  # -2 to +2
-                    for dx in range(-2, 3):  # -2 to +2
-                        check_y = unit.y + dy
-                        check_x = unit.x + dx
-
-                        # Skip if out of bounds
-                        if not self.is_valid_position(check_y, check_x):
-                            continue
-
-                        # Check if this position has furniture
-                        if self.map.is_furniture(check_y, check_x):
-                            # Get furniture type name
-                            furniture_terrain = self.map.get_terrain_at(check_y, check_x)
-                            furniture_name = furniture_terrain.name.replace('_', ' ').title()
-
-                            # Get current astral value for the caster's player (defaulting to 1 if none exists)
-                            if caster_player not in self.map.cosmic_values:
-                                self.map.cosmic_values[caster_player] = {}
-                            current_value = self.map.cosmic_values[caster_player].get((check_y, check_x), 1)
-                            # Increase by 1, capped at 14
-                            new_value = min(current_value + 1, 14)
-                            self.map.cosmic_values[caster_player][(check_y, check_x)] = new_value
-                            furniture_inflated += 1
-
-                        # With Valuation Oracle upgrade: Also inflate appraised enemy astral values
-                        if valuation_oracle_upgraded and appraiser_unit:
-                            enemy_unit = self.get_unit_at(check_y, check_x)
-                            if enemy_unit and enemy_unit.is_alive() and enemy_unit.player != caster_player:
-                                # Get appraiser's passive skill to access enemy astral values
-                                if hasattr(appraiser_unit, 'passive_skill') and appraiser_unit.passive_skill:
-                                    # Get current enemy astral value
-                                    current_value = appraiser_unit.passive_skill._get_enemy_astral_value(
-                                        self, caster_player, enemy_unit
-                                    )
-                                    # Increase by 1, capped at 9 (enemy values are 1-9)
-                                    new_value = min(current_value + 1, 9)
-                                    appraiser_unit.passive_skill._set_enemy_astral_value(
-                                        self, caster_player, enemy_unit, new_value
-                                    )
-                                    enemies_inflated += 1
-
-                                    # If enemy is imbued, also update their imbued cosmic value
-                                    if (hasattr(enemy_unit, 'status_imbued') and
-                                        enemy_unit.status_imbued and
-                                        enemy_unit.status_imbued_player == caster_player):
-                                        enemy_unit.status_imbued_cosmic_value = new_value
-
-                # Log furniture/enemy value inflation if any occurred
-                if furniture_inflated > 0 or enemies_inflated > 0:
-                    if furniture_inflated > 0 and enemies_inflated > 0:
-                        message_log.add_message(
-                            f"{unit.get_display_name()}'s Auction Curse inflates the astral value of nearby furniture and enemies",
-                            MessageType.WARNING,
-                            player=caster_player
-                        )
-                    elif furniture_inflated > 0:
-                        message_log.add_message(
-                            f"{unit.get_display_name()}'s Auction Curse inflates the astral value of nearby furniture",
-                            MessageType.WARNING,
-                            player=caster_player
-                        )
-                    else:
-                        message_log.add_message(
-                            f"{unit.get_display_name()}'s Auction Curse inflates the astral value of nearby enemies",
-                            MessageType.WARNING,
-                            player=caster_player
-                        )
-
-                # Decrement the duration
-                unit.auction_curse_dot_duration -= 1
-                logger.debug(f"{unit.get_display_name()}'s Auction Curse DOT duration: {unit.auction_curse_dot_duration}")
-                
-                # Check if unit died from the DOT
-                if unit.hp <= 0:
-                    # Use consistent format for death messages
-                    # NOTE: Auction Curse upgrade bonus GP is handled in handle_unit_death()
-                    # — do not award it here to avoid double GP
-                    message_log.add_message(
-                        f"{unit.get_display_name()} perishes!",
-                        MessageType.COMBAT,
-                        player=unit.player
-                    )
-                    caster_ref = unit.auction_curse_caster if hasattr(unit, 'auction_curse_caster') else None
-                    self.handle_unit_death(unit, killer_unit=caster_ref, cause="auction_curse", ui=ui)
-                
-                # Check if the DOT effect has expired
-                if unit.auction_curse_dot_duration <= 0:
-                    # Remove the DOT effect
-                    unit.auction_curse_dot = False
-                    
-                    # Remove healing prevention flag
-                    if hasattr(unit, 'auction_curse_no_heal'):
-                        unit.auction_curse_no_heal = False
-                    
-                    # Log the expiration - use attacker_name for consistent display
-                    message_log.add_message(
-                        f"Auction Curse fades from {unit.get_display_name()}.",
-                        MessageType.ABILITY,
-                        player=caster_player,
-                        attacker_name=attacker_name,
-                        target_name=unit.get_display_name()
-                    )
-                
-                # Clear the DOT action flag
-                unit.auction_curse_dot_action = False
-                
-            elif hasattr(unit, 'viseroy_trap_action') and unit.viseroy_trap_action:
-                # This is a special action but still counts as an action for health regeneration
-                unit.took_no_actions = False
-
-                # Trap damage to trapped units is handled centrally in _apply_trap_damage.
-                # Clean up the special flag
-                unit.viseroy_trap_action = False
-            
-            # Advance the spinner between units' actions
-            if ui:
-                ui.advance_spinner()
-                # Graphical mode reconstructs timing from state diffs and needs no artificial pause
-                if not (hasattr(ui, '__class__') and ui.__class__.__name__ == 'GraphicalUIAdapter'):
-                    time.sleep(0.2)
-        
-        # Apply trap damage for all trapped units
-        self._apply_trap_damage()
-
-        # Execute pending respawns
-        self._execute_respawns(ui)
-
-        # Process HEINOUS_VAPOR effects for current player's vapors only
-        vapor_units = [unit for unit in self.units if unit.is_alive() and 
-                      unit.type == UnitType.HEINOUS_VAPOR and 
-                      hasattr(unit, 'vapor_type') and unit.vapor_type and
-                      unit.player == self.current_player]  # Only include current player's vapors
-        
-        # Process each vapor's area effects
-        for vapor_unit in vapor_units:
-            # Mark that this vapor just applied effects (for graphical animation triggering)
-            vapor_unit.just_applied_aoe = True
-
-            # Apply the vapor's area effects only on owner's turn
-            vapor_unit.apply_vapor_effects(self, ui)
-            
-            # Decrement vapor duration for current player's vapors
-            if hasattr(vapor_unit, 'vapor_duration'):
-                vapor_unit.vapor_duration -= 1
-                logger.debug(f"Vapor {vapor_unit.get_display_name()} duration decremented to {vapor_unit.vapor_duration}")
-                
-                # If duration reached zero, the vapor expires
-                if vapor_unit.vapor_duration <= 0:
-                    logger.debug(f"Vapor {vapor_unit.get_display_name()} expires")
-                    
-                    # Clear protection from units if this is a SAFETY type vapor
-                    if hasattr(vapor_unit, 'vapor_type') and vapor_unit.vapor_type == "SAFETY":
-                        # Find all units that were being protected by this vapor
-                        for protected_unit in self.units:
-                            if (hasattr(protected_unit, 'protected_by_safety_gas') and 
-                                protected_unit.protected_by_safety_gas):  # Check if it's a non-empty list
-                                # Make a copy of the list to avoid modification issues
-                                protection_list = protected_unit.protected_by_safety_gas.copy()
-                                
-                                # Clean up dead or removed vapors
-                                for vapor in protection_list:
-                                    if vapor not in self.units or not vapor.is_alive() or vapor == vapor_unit:
-                                        if vapor in protected_unit.protected_by_safety_gas:
-                                            protected_unit.protected_by_safety_gas.remove(vapor)
-                                            logger.debug(f"{protected_unit.get_display_name()} is no longer protected by expired or removed vapor")
-                                
-                                # If there are no more protecting vapors, clean up the attribute
-                                if not protected_unit.protected_by_safety_gas:
-                                    logger.debug(f"{protected_unit.get_display_name()} is no longer protected by any safety gas")
-                                    delattr(protected_unit, 'protected_by_safety_gas')
-                    
-                    # Log the expiration
-                    message_log.add_message(
-                        f"{vapor_unit.get_display_name()} dissipates...",
-                        MessageType.ABILITY,
-                        player=vapor_unit.player
-                    )
-                    
-                    # Check if this vapor was from a diverged user
-                    if hasattr(vapor_unit, 'diverged_user') and vapor_unit.diverged_user:
-                        # Check if this is the last vapor to expire
-                        other_vapors = [u for u in self.units if u != vapor_unit and 
-                                      u.is_alive() and u.type == UnitType.HEINOUS_VAPOR and 
-                                      hasattr(u, 'diverged_user') and u.diverged_user == vapor_unit.diverged_user]
-                        
-                        # If no other vapors from this user, the user reforms
-                        if not other_vapors:
-                            gas_machinist = vapor_unit.diverged_user
-
-                            # CRITICAL: Remove vapor from grid BEFORE moving GAS_MACHINIST to that position
-                            # This prevents collision detection from blocking the placement
-                            self._remove_from_unit_grid(vapor_unit)
-
-                            # Return the Gas Machinist to the vapor's position
-                            gas_machinist.y = vapor_unit.y
-                            gas_machinist.x = vapor_unit.x
-
-                            # Reset the diverge flags
-                            gas_machinist.diverge_return_position = False
-                            
-                            # Log the return
-                            message_log.add_message(
-                                f"{gas_machinist.get_display_name()} reforms at ({vapor_unit.y}, {vapor_unit.x})",
-                                MessageType.ABILITY,
-                                player=gas_machinist.player
-                            )
-                            
-                    
-                    # Kill the vapor using expire() to bypass invulnerability
-                    vapor_unit._expired_summon = True
-                    vapor_unit.expire()
-
-        # Process doppelganger expiration AFTER all actions have been executed
-        # This ensures doppelganger attacks complete before the doppelganger dies
-        for unit in list(self.units):  # Create a copy of the list to safely modify during iteration
-            if unit.is_alive() and unit.is_doppelganger and unit.player == self.current_player:
-                # Only decrement duration on the owner's turn
-                unit.doppelganger_duration -= 1
-                logger.debug(f"Doppelganger {unit.get_display_name()} duration decremented to {unit.doppelganger_duration}")
-
-                # If duration reached zero, the doppelganger expires
-                if unit.doppelganger_duration <= 0:
-                    logger.debug(f"Doppelganger {unit.get_display_name()} expires after actions completed")
-
-                    # Trigger explosion effect (deals damage to adjacent enemies)
-                    self._trigger_doppelganger_death_effect(unit, ui)
-
-                    # Kill the doppelganger and remove from game
-                    unit._expired_summon = True
-                    unit.hp = 0
-                    if unit in self.units:
-                        self.units.remove(unit)
-                    self._remove_from_unit_grid(unit)
+                    # Kill the doppelganger and remove from game
+                    unit._expired_summon = True
+                    unit.hp = 0
+                    if unit in self.units:
+                        self.units.remove(unit)
+                    self._remove_from_unit_grid(unit)
 
         # Clear all actions and update skill cooldowns
         # Note: last_executed_attack is now set during attack execution (line 3246),
@@ -4258,6 +3570,808 @@ class Game:
         # This catches any edge cases where units ended up stacked on each other
         self._resolve_collision_conflicts()
 
+    def _execute_unit_action(self, unit, ui=None):
+        """
+        Resolve one unit's queued move, attack and skill (the body of execute_turn's
+        per-unit loop). Also used by forecast() to resolve a single action on a clone.
+
+        Args:
+            unit: Unit whose queued actions are resolved
+            ui: Optional UI reference for animations
+        """
+        from boneglaive.utils.message_log import message_log, MessageType
+
+        # Log the unit and its action
+        logger.debug(f"Processing unit {unit.get_display_name()} with timestamp {unit.action_timestamp}")
+        
+        # Flag to track if this is a MANDIBLE_FOREMAN taking an action that should release trapped units
+        is_foreman_taking_action = False
+        
+        # Check if this is a MANDIBLE_FOREMAN
+        if unit.type == UnitType.MANDIBLE_FOREMAN:
+            # Movement and attacks always release trapped units
+            if unit.move_target is not None or unit.attack_target is not None:
+                is_foreman_taking_action = True
+            # Some skills release trapped units, but not all
+            elif unit.skill_target is not None and unit.selected_skill:
+                # Discharge doesn't automatically release trapped units
+                # as the Discharge skill itself handles the release
+                if unit.selected_skill.name != "Discharge":
+                    is_foreman_taking_action = True
+        
+        # If this is a MANDIBLE_FOREMAN taking an action that should release trapped units
+        if is_foreman_taking_action:
+            # Find all units trapped by this FOREMAN
+            trapped_units = [u for u in self.units if u.is_alive() and u.trapped_by == unit]
+            if trapped_units:
+                logger.debug(f"MANDIBLE_FOREMAN {unit.get_display_name()} is taking action, releasing trapped units")
+                
+                # Release trapped units before the FOREMAN's action is executed
+                for trapped_unit in trapped_units:
+                    
+                    # Release the unit
+                    trapped_unit.trapped_by = None
+                    message_log.add_message(
+                        f"{trapped_unit.get_display_name()} is released from mechanical jaws",
+                        MessageType.ABILITY,
+                        target_name=trapped_unit.get_display_name()
+                    )
+                
+                # Redraw the board to show the updated state
+                if ui:
+                    ui.draw_board(show_cursor=False, show_selection=False, show_attack_targets=False)
+                    time.sleep(0.2)  # Short pause after release
+        
+        # EXECUTE MOVE if unit has a move target
+        if unit.move_target:
+            y, x = unit.move_target
+            if self.can_move_to(unit, y, x):  # Double-check the move is still valid
+                # Mark that this unit took an action (won't regenerate HP)
+                unit.took_no_actions = False
+                logger.debug(f"Moving {unit.get_display_name()} from ({unit.y},{unit.x}) to ({y},{x})")
+                
+                # Save original position
+                start_y, start_x = unit.y, unit.x
+                
+                # DERELICTIONIST Severance: Remove SEVERANCE status when movement is executed
+                if (unit.type == UnitType.DERELICTIONIST and 
+                    hasattr(unit, 'severance_active') and unit.severance_active):
+                    
+                    # Remove SEVERANCE status effect when movement is used
+                    unit.severance_active = False
+                    unit.severance_duration = 0
+                    unit.can_move_post_skill = False  # Consumed the post-skill move
+                    
+                    logger.info(f"SEVERANCE: {unit.get_display_name()} consumes enhanced movement - Severance status expires")
+                    
+                    from boneglaive.utils.message_log import message_log, MessageType
+                    message_log.add_message(
+                        f"{unit.get_display_name()}'s Severance expires after movement",
+                        MessageType.ABILITY,
+                        player=unit.player
+                    )
+                
+                # Update unit position ATOMICALLY. Do NOT use `unit.y, unit.x = y, x`:
+                # that assigns y then x through the property setters, so the unit
+                # transiently occupies the intermediate corner (y, old_x). If another
+                # unit is on that corner — e.g. an ORDNANCE_GRAFT's leashed QUADCOPTER,
+                # which sits adjacent to him — the grid's collision safety net restores
+                # _y to old_y, but the following `x` assignment still runs, stranding
+                # the unit at (old_y, x): a tile that was never validated and may be
+                # impassable (a pylon). Writing both axes then updating the grid once
+                # moves the entry straight from the real old tile to the validated
+                # final tile, never touching a corner. (Trap-release + anchor updates
+                # are handled explicitly below, so bypassing the setters loses nothing.)
+                unit._y, unit._x = y, x
+                self._update_unit_grid(unit, start_y, start_x)
+
+                # Check for terrain-specific interactions
+                current_terrain = self.map.get_terrain_at(y, x)
+                
+                # Leaf pit rustling message
+                if current_terrain == TerrainType.LEAF_PIT:
+                    from boneglaive.utils.message_log import message_log, MessageType
+                    message_log.add_message(
+                        f"{unit.get_display_name()} rustles through the cold mulchy pit",
+                        MessageType.ABILITY,
+                        player=unit.player
+                    )
+                
+                # Mini pumpkin collection
+                elif current_terrain == TerrainType.MINI_PUMPKIN:
+                    from boneglaive.utils.message_log import message_log, MessageType
+                    # Apply Pumped Up status effect
+                    unit.pumped_up_active = True
+                    unit.pumped_up_duration = 3
+                    
+                    # Remove the mini pumpkin from the map (replace with canyon floor)
+                    self.map.set_terrain_at(y, x, TerrainType.CANYON_FLOOR)
+                    
+                    # Show collection message
+                    message_log.add_message(
+                        f"{unit.get_display_name()} snatches up the mini pumpkin",
+                        MessageType.ABILITY,
+                        player=unit.player
+                    )
+                
+                # Show movement animation if UI is provided
+                if ui:
+                    
+                    # Update anchor status effects after position change
+                    self.update_anchor_status_effects()
+                    
+                    # Check for trap release due to position change
+                    self._check_position_change_trap_release(unit, start_y, start_x)
+                    
+                    # Redraw to show unit in new position without UI elements during animation
+                    ui.draw_board(show_cursor=False, show_selection=False, show_attack_targets=False)
+                    
+                    # Log movement
+                    message_log.add_message(
+                        f"{unit.get_display_name()} moved from ({start_y},{start_x}) to ({y},{x})",
+                        MessageType.MOVEMENT,
+                        player=unit.player,
+                        # Include unit name for coloring
+                        attacker_name=unit.get_display_name()
+                    )
+                    time.sleep(0.3)  # Short delay after each unit moves
+                else:
+                    # Position is already set above. Just reconcile state.
+                    # Update anchor status effects after position change
+                    self.update_anchor_status_effects()
+
+                    # Check for trap release due to position change
+                    self._check_position_change_trap_release(unit, start_y, start_x)
+
+                # After unit moves, check if any LIVING_AEROSOL needs to follow
+                self._move_leashed_aerosols(unit, start_y, start_x, ui)
+                # And any ORDNANCE_DRONE leashed to an ORDNANCE_GRAFT
+                self._move_leashed_drones(unit, start_y, start_x, ui)
+            else:
+                logger.warning(f"Invalid move target ({y},{x}) for unit at ({unit.y},{unit.x})")
+
+        # EXECUTE ATTACK if unit has an attack target
+        if unit.attack_target:
+            from boneglaive.utils.message_log import message_log, MessageType
+            y, x = unit.attack_target
+            target = self.get_unit_at(y, x)
+            
+            # Mark that this unit took an action (won't regenerate HP)
+            unit.took_no_actions = False
+            
+            # Calculate attacking position (either unit's current position or move target)
+            # DERELICTIONIST Severance attack: validate from where attack was queued (pre-move),
+            # since the unit may have moved away after queuing the attack.
+            if (unit.type == UnitType.DERELICTIONIST and
+                    hasattr(unit, 'attack_queued_from') and unit.attack_queued_from):
+                attacking_pos = unit.attack_queued_from
+            else:
+                attacking_pos = (unit.y, unit.x)  # Unit's position is already updated if it moved
+
+            # Verify attack is within range from the attacking position
+            attack_distance = self.chess_distance(attacking_pos[0], attacking_pos[1], y, x)
+            
+            # Get the unit's effective attack range from their stats
+            effective_stats = unit.get_effective_stats()
+            effective_attack_range = effective_stats['attack_range']
+            
+            # Line of sight check for ranged attacks (range > 1)
+            los_check = True
+            if effective_attack_range > 1:
+                los_check = self.has_line_of_sight(attacking_pos[0], attacking_pos[1], y, x)
+                if not los_check:
+                    message_log.add_message(
+                        f"{unit.get_display_name()}'s attack is blocked by terrain",
+                        MessageType.COMBAT,
+                        player=unit.player
+                    )
+            
+
+            # Check Selenic Backdraft: attacker cannot basic attack the POTPOURRIST who applied it
+            if (hasattr(unit, 'selenic_backdraft') and unit.selenic_backdraft and
+                hasattr(unit, 'selenic_backdraft_by') and target and
+                unit.selenic_backdraft_by == target):
+                logger.debug(f"Attack cancelled: {unit.get_display_name()} is blinded by Selenic Backdraft")
+                message_log.add_message(
+                    f"{unit.get_display_name()}'s attack is repelled by the selenic backdraft",
+                    MessageType.COMBAT,
+                    player=unit.player
+                )
+                return  # Skip this attack and go to next unit
+
+            # Check for Marrow Dike wall tiles that can be targeted
+            wall_target = None
+            if not target and (y, x) in self.marrow_dike_tiles:
+                # Allow targeting both ally and enemy walls
+                wall_info = self.marrow_dike_tiles[(y, x)]
+                if attack_distance <= effective_attack_range and los_check:
+                    wall_target = (y, x)  # Mark this as a valid wall target
+
+            # Check if attack is valid
+            valid_attack = (target and
+                           target.player != unit.player and
+                           attack_distance <= effective_attack_range and
+                           los_check)
+                           
+            if valid_attack or wall_target:  # Valid attack on unit or wall
+                # Mark that this attack was executed (for animation detection in graphical mode)
+                unit.last_executed_attack = unit.attack_target
+
+                # Handle damage calculation first
+                if wall_target:
+                    # Get the wall information
+                    wall_y, wall_x = wall_target
+                    wall_info = self.marrow_dike_tiles[wall_target]
+
+                    # Check if attacker is ally (same player as wall owner)
+                    is_ally_attack = (wall_info['owner'].player == unit.player)
+
+                    if is_ally_attack:
+                        # Allies always destroy walls in 1 hit
+                        damage = wall_info['hp']  # Deal exactly enough damage to destroy
+                        wall_info['hp'] = 0
+                    else:
+                        # Enemy walls take 1 damage per attack
+                        damage = 1
+                        wall_info['hp'] = max(0, wall_info['hp'] - damage)
+
+                    # Log the attack on the wall
+                    message_log.add_message(
+                        f"{unit.get_display_name()} attacks a Marrow Dike wall",
+                        MessageType.COMBAT,
+                        player=unit.player
+                    )
+
+                    # Handle wall destruction
+                    if wall_info['hp'] <= 0:
+                        # Restore original terrain
+                        original_terrain = wall_info.get('original_terrain', TerrainType.EMPTY)
+                        self.map.set_terrain_at(wall_y, wall_x, original_terrain)
+
+                        # Remove from tracking
+                        owner = wall_info['owner']
+                        del self.marrow_dike_tiles[wall_target]
+
+                        # Log the destruction
+                        message_log.add_message(
+                            f"{unit.get_display_name()} breaks through a section of {owner.get_display_name()}'s Marrow Dike",
+                            MessageType.COMBAT,
+                            player=unit.player
+                        )
+
+                    # No XP or further processing for wall attacks - skip to next unit
+                    return
+                else:
+                    # Normal unit-vs-unit combat
+                    
+                    # Check for Market Futures maturation - do this RIGHT before the attack
+                    # This ensures the maturation message appears before the attack message
+                    if hasattr(unit, 'market_futures_needs_maturation') and unit.market_futures_needs_maturation:
+                        # Apply Market Futures maturation right before attack
+                        old_maturity = unit.market_futures_maturity
+                        unit.market_futures_maturity += 1
+                        
+                        # Update the attack bonus (remove old bonus and add new one)
+                        unit.attack_bonus = unit.attack_bonus - old_maturity + unit.market_futures_maturity
+                        
+                        # Log the investment maturation before attack
+                        message_log.add_message(
+                            f"{unit.get_display_name()}'s investment matures to +{unit.market_futures_maturity} ATK",
+                            MessageType.ABILITY,
+                            player=unit.player
+                        )
+                        
+                        # Clear the flag
+                        unit.market_futures_needs_maturation = False
+                        
+                        # Check if this is the final maturation before expiry
+                        if hasattr(unit, 'market_futures_final_maturation'):
+                            # Show expiration message AFTER maturation
+                            message_log.add_message(
+                                f"{unit.get_display_name()}'s investment effect expires after 3 turns.",
+                                MessageType.ABILITY,
+                                player=unit.player
+                            )
+                            
+                            # Remove the attack bonus after this attack
+                            unit.market_futures_will_expire_after_attack = True
+                            
+                            # Clear the flag
+                            delattr(unit, 'market_futures_final_maturation')
+                        
+                    # Calculate base attack damage FIRST (before animation so we can show correct damage)
+                    effective_stats = unit.get_effective_stats()
+                    effective_attack = effective_stats['attack']
+
+                    # DERELICTIONIST: distance-based attack (pure chess/Chebyshev distance)
+                    # Uses move_target if Severance move is planned, so post-move distance is used
+                    if unit.type == UnitType.DERELICTIONIST:
+                        source_y, source_x = (unit.move_target[0], unit.move_target[1]) if unit.move_target else (unit.y, unit.x)
+                        attack_distance = self.chess_distance(source_y, source_x, target.y, target.x)
+                        effective_attack += attack_distance
+
+                    # Check for Granite Geas attack reduction (attacking POTPOURRIST)
+                    if (target.type == UnitType.POTPOURRIST and
+                        hasattr(unit, 'geas_attack_reduction') and unit.geas_attack_reduction and
+                        hasattr(unit, 'taunted_by') and unit.taunted_by == target):
+                        # Attacker's attack is treated as 2 when attacking this POTPOURRIST
+                        effective_attack = 2
+
+                    # Get effective defense
+                    effective_defense = target.get_effective_stats()['defense']
+
+                    # Calculate damage with defense (PRT handled automatically by HP setter)
+                    raw_damage = effective_attack
+
+                    # Apply defense to damage
+                    # DERELICTIONIST's attacks bypass defense
+                    # LANDSCAPER with upgraded Translative Stroke bypasses defense
+                    from boneglaive.game.upgrades import UpgradeManager
+                    if unit.type == UnitType.DERELICTIONIST:
+                        damage = raw_damage
+                    elif (unit.type == UnitType.LANDSCAPER and
+                          UpgradeManager.is_skill_upgraded(unit, "Translative Stroke")):
+                        damage = raw_damage
+                    else:
+                        damage = max(1, raw_damage - effective_defense)
+                    
+                    # Store previous HP to check for status changes
+                    previous_hp = target.hp
+                    critical_threshold = int(target.max_hp * CRITICAL_HEALTH_PERCENT)
+
+                    # LANDSCAPER: Translative Stroke — 4 hits instead of 1
+                    if unit.type == UnitType.LANDSCAPER:
+                        total_damage = 0
+                        for hit_num in range(4):
+                            if target.hp <= 0:
+                                break
+                            old_hp = target.hp
+                            self.current_attacker = unit
+                            target.hp = max(0, target.hp - damage)
+                            self.current_attacker = None
+                            hit_damage = old_hp - target.hp
+                            total_damage += hit_damage
+
+                            message_log.add_combat_message(
+                                attacker_name=unit.get_display_name(),
+                                target_name=target.get_display_name(),
+                                damage=hit_damage,
+                                attacker_player=unit.player,
+                                target_player=target.player
+                            )
+
+                            if ui:
+                                ui.show_attack_animation(unit, target, hit_damage)
+                        actual_damage = total_damage
+
+                        # Reduce all skill cooldowns by total damage dealt
+                        for skill in unit.active_skills:
+                            if skill.current_cooldown > 0:
+                                skill.current_cooldown = max(0, skill.current_cooldown - total_damage)
+
+                        if total_damage > 0:
+                            message_log.add_message(
+                                f"Translative Stroke: cooldowns reduced by {total_damage}",
+                                MessageType.ABILITY,
+                                player=unit.player
+                            )
+                    else:
+                        # Standard single-hit attack
+                        old_hp = target.hp
+                        # Set current attacker for Demilune damage halving in hp setter
+                        self.current_attacker = unit
+                        target.hp = max(0, target.hp - damage)
+                        self.current_attacker = None
+                        actual_damage = old_hp - target.hp
+
+                        # Show attack animation with actual damage
+                        if ui:
+                            ui.show_attack_animation(unit, target, actual_damage)
+
+                    # Check for upgraded Ossify reflect damage (MARROW_CONDENSER)
+                    if (target.type == UnitType.MARROW_CONDENSER and
+                        hasattr(target, 'ossify_active') and target.ossify_active and
+                        target.hp > 0 and actual_damage > 0):
+                        # Check if Ossify is manually upgraded
+                        from boneglaive.game.upgrades import UpgradeManager
+                        if UpgradeManager.is_skill_upgraded(target, "Ossify"):
+                            # Reflect all damage back to attacker
+                            reflect_damage = actual_damage
+
+                            attacker_previous_hp = unit.hp
+                            unit.hp = max(0, unit.hp - reflect_damage)
+
+                            # Log the reflect
+                            message_log.add_message(
+                                f"{target.get_display_name()}'s hardened bones splinter back at {unit.get_display_name()} for {reflect_damage} damage",
+                                MessageType.ABILITY,
+                                player=target.player,
+                                target_name=unit.get_display_name()
+                            )
+
+                            # Check if attacker died from reflect damage
+                            if unit.hp <= 0 and attacker_previous_hp > 0:
+                                self.handle_unit_death(unit, target, cause="ossify_reflect", ui=ui)
+
+                    # Check for taunt response (Granite Geas)
+                    if (hasattr(unit, 'taunted_by') and unit.taunted_by and
+                        unit.taunted_by == target):
+                        # Attacker attacked the unit that taunted them
+                        unit.taunt_responded_this_turn = True
+                        logger.debug(f"TAUNT RESPONSE: {unit.get_display_name()} responded to {target.get_display_name()}'s taunt")
+
+                # Check if attacker is a MANDIBLE_FOREMAN with the Viseroy passive
+                # If so, trap the target unit
+                if unit.type == UnitType.MANDIBLE_FOREMAN and unit.passive_skill and \
+                   unit.passive_skill.name == "Viseroy" and target.hp > 0:
+                    # Check if target is immune to being trapped
+                    if target.is_immune_to_trap():  # Changed to is_immune_to_trap
+                        message_log.add_message(
+                            f"{target.get_display_name()} is immune to Viseroy due to Stasiality",
+                            MessageType.ABILITY,
+                            player=target.player,  # Use target's player color
+                            target_name=target.get_display_name()
+                        )
+                    else:
+                        # Only trap if the target is still alive and not immune
+                        target.trapped_by = unit
+                        target.trap_duration = 0  # Initialize trap duration for incremental damage
+
+                        # Log the trapping (using MessageType.COMBAT for yellow coloring)
+                        message_log.add_message(
+                            f"{target.get_display_name()} is trapped in mechanical jaws",
+                            MessageType.WARNING,  # WARNING messages are explicitly colored yellow
+                            player=unit.player,
+                            target_name=target.get_display_name()
+                        )
+
+                        # Check for Viseroy upgrade - apply disarm if available
+                        from boneglaive.game.upgrades import UpgradeManager
+                        if UpgradeManager.is_skill_upgraded(unit, "Viseroy") and unit.viseroy_disarm_cooldown == 0:
+                            # Apply disarm effect as a proper status effect
+                            target.status_disarmed = True
+                            target.status_disarmed_duration = 1
+                            unit.viseroy_disarm_cooldown = 3  # 3 turn cooldown
+
+                            message_log.add_message(
+                                f"{target.get_display_name()} is disarmed by enhanced mechanical jaws",
+                                MessageType.WARNING,
+                                player=unit.player,
+                                target=target.player,
+                                target_name=target.get_display_name()
+                            )
+
+
+                # Only log combat messages and handle unit death for unit targets (not walls)
+                if target:
+                    # Log combat message with actual damage dealt
+                    # LANDSCAPER logs per-hit messages above, skip the combined message
+                    if unit.type != UnitType.LANDSCAPER:
+                        message_log.add_combat_message(
+                            attacker_name=unit.get_display_name(),
+                            target_name=target.get_display_name(),
+                            damage=actual_damage,
+                            attacker_player=unit.player,
+                            target_player=target.player
+                        )
+
+                    # Handle INTERFERER attack mechanics
+                    if unit.type == UnitType.INTERFERER:
+                        # Check for Karrier Rave triple strike (active during phasing)
+                        if hasattr(unit, 'carrier_rave_active') and unit.carrier_rave_active:
+                            # Trigger radiation for the first strike of Karrier Rave
+                            if unit.passive_skill and unit.passive_skill.name == "Radio Effulgent":
+                                unit.passive_skill.trigger_radiation(unit, (target.y, target.x), self, ui)
+                            
+                            # Apply two additional strikes
+                            for strike in range(2):
+                                if target.hp > 0:  # Only continue if target is still alive
+                                    additional_damage = max(1, effective_attack - effective_defense)
+                                    old_target_hp = target.hp
+                                    # Set current attacker for Lunacy damage halving
+                                    self.current_attacker = unit
+                                    target.hp = max(0, target.hp - additional_damage)
+                                    self.current_attacker = None
+                                    actual_additional_damage = old_target_hp - target.hp
+                                    
+                                    message_log.add_combat_message(
+                                        attacker_name=unit.get_display_name(),
+                                        target_name=target.get_display_name(),
+                                        damage=actual_additional_damage,
+                                        ability=f"Karrier Rave Strike {strike + 2}",
+                                        attacker_player=unit.player,
+                                        target_player=target.player
+                                    )
+
+                                    # Show additional damage animation with actual damage
+                                    if ui:
+                                        ui.show_attack_animation(unit, target, actual_additional_damage)
+                                        
+                                    # Trigger radiation immediately after each additional strike
+                                    if unit.passive_skill and unit.passive_skill.name == "Radio Effulgent":
+                                        unit.passive_skill.trigger_radiation(unit, (target.y, target.x), self, ui)
+                            
+                            # End Karrier Rave effect after using triple strike
+                            unit.carrier_rave_active = False
+                            unit.carrier_rave_duration = 0
+                            
+                            message_log.add_message(
+                                f"{unit.get_display_name()} phases back into reality after the devastating strike",
+                                MessageType.ABILITY,
+                                player=unit.player
+                            )
+                        else:
+                            # Normal single attack - trigger Radio Effulgent if available
+                            if unit.passive_skill and unit.passive_skill.name == "Radio Effulgent":
+                                # Trigger radiation effect (only applies if enemies are in range)
+                                unit.passive_skill.trigger_radiation(unit, (target.y, target.x), self, ui)
+                    
+                    # Handle removal of Market Futures effect after attack if it's expiring
+                    if hasattr(unit, 'market_futures_will_expire_after_attack') and unit.market_futures_will_expire_after_attack:
+                        # Remove the attack bonus based on current maturity level
+                        if hasattr(unit, 'market_futures_maturity'):
+                            unit.attack_bonus -= unit.market_futures_maturity
+                        
+                        # Remove range bonus
+                        unit.attack_range_bonus -= 1
+                        
+                        # Reset all flags
+                        unit.market_futures_bonus_applied = False
+                        unit.market_futures_will_expire_after_attack = False
+                        if hasattr(unit, 'has_investment_effect'):
+                            unit.has_investment_effect = False
+                        if hasattr(unit, 'market_futures_range_bonus_active'):
+                            unit.market_futures_range_bonus_active = False
+                    
+                    # No need to format with player info anymore - just use the unit's display name
+                    # Check if target was defeated
+                    if target.hp <= 0:
+                        # Use centralized death handling
+                        self.handle_unit_death(target, unit, cause="combat", ui=ui)
+                    else:
+                        # Check for critical health (retching) using centralized logic
+                        if not self.check_critical_health(target, unit, previous_hp, ui):
+                            return  # Skip to next unit if processing should stop
+            else:
+                # Log invalid attack attempts for debugging
+                if not target:
+                    logger.warning(f"Attack failed: no target at ({y},{x})")
+                elif target.player == unit.player:
+                    logger.warning(f"Attack failed: cannot attack allied unit")
+                elif attack_distance > unit.attack_range:
+                    logger.warning(f"Attack failed: target out of range (distance={attack_distance}, range={unit.attack_range})")
+                else:
+                    logger.warning(f"Attack failed: unknown reason")
+            
+            # Add a slight pause between actions for a unit and update spinner
+            if ui:
+                ui.advance_spinner()
+                # Graphical mode reconstructs timing from state diffs and needs no artificial pause
+                if not (hasattr(ui, '__class__') and ui.__class__.__name__ == 'GraphicalUIAdapter'):
+                    time.sleep(0.15)
+        
+        # EXECUTE SKILL if unit has a skill target
+        if unit.skill_target and unit.selected_skill:
+            # Mark that this unit took an action (won't regenerate HP)
+            # Exception: INTERFERER using SCALAR NODE can still regenerate to obscure deployment
+            if unit.type == UnitType.INTERFERER and unit.selected_skill.name == "Scalar Node":
+                # Allow INTERFERER to regenerate after using SCALAR NODE for stealth
+                pass  # Don't set took_no_actions = False
+            else:
+                unit.took_no_actions = False
+            
+            # Execute the skill
+            skill = unit.selected_skill
+            target_pos = unit.skill_target
+
+            # Execute the skill if it has an execute method
+            if hasattr(skill, 'execute'):
+                # Set current attacker context for Demilune damage reduction
+                self.current_attacker = unit
+                skill.execute(unit, target_pos, self, ui)
+                self.current_attacker = None
+
+                # Best-effort sweep for collateral kills a skill left at hp <= 0 without
+                # routing through handle_unit_death (so the on-death effects in
+                # handle_unit_death fire). NOTE: this only catches victims still present
+                # in self.units. A unit killed via deal_damage / the hp setter has already
+                # run Unit._handle_death (GP + respawn) which REMOVES it from self.units,
+                # so it will NOT be found here — such kills must call handle_unit_death at
+                # the damage site themselves (see ordnance_graft.detonate_fused). The
+                # _engine_death_handled guard prevents double-processing either way.
+                skill_cause = skill.name.lower().replace(' ', '_')
+                for check_unit in list(self.units):
+                    if (check_unit != unit and check_unit.hp <= 0 and
+                            not getattr(check_unit, '_engine_death_handled', False)):
+                        check_unit._engine_death_handled = True
+                        self.handle_unit_death(check_unit, unit, cause=skill_cause, ui=ui)
+
+                # Note: Cooldown is set in skill.use() to allow for upgrade modifications
+                # Don't override it here
+
+                # If unit is under Neural Shunt effects, the cooldown was already set
+                if (hasattr(unit, 'neural_shunt_affected') and unit.neural_shunt_affected):
+                    logger.debug(f"Neural Shunt: {unit.get_display_name()}'s {skill.name} placed on cooldown ({skill.current_cooldown} turns)")
+            else:
+                logger.warning(f"Skill {skill.name} has no execute method")
+
+            # Check for taunt response (Granite Geas) - if skill targeted taunting unit
+            if hasattr(unit, 'taunted_by') and unit.taunted_by:
+                # Check if the skill targeted the unit that taunted them
+                target_unit = self.get_unit_at(target_pos[0], target_pos[1])
+                if (target_unit and unit.taunted_by == target_unit):
+                    # Unit used skill on the unit that taunted them
+                    unit.taunt_responded_this_turn = True
+                    logger.debug(f"TAUNT RESPONSE (skill): {unit.get_display_name()} responded to {target_unit.get_display_name()}'s taunt with skill")
+
+            # Add a slight pause after the skill and update spinner
+            if ui:
+                ui.advance_spinner()
+                # Graphical mode reconstructs timing from state diffs and needs no artificial pause
+                if not (hasattr(ui, '__class__') and ui.__class__.__name__ == 'GraphicalUIAdapter'):
+                    time.sleep(0.15)
+        
+        # EXECUTE VISEROY TRAP DAMAGE if this is a MANDIBLE_FOREMAN with trapped units
+        elif hasattr(unit, 'auction_curse_dot_action') and unit.auction_curse_dot_action:
+            # This is a special action but still counts as an action for health regeneration
+            unit.took_no_actions = False
+            # Process Auction Curse DOT effect
+            from boneglaive.utils.message_log import message_log, MessageType
+            
+            
+            # Apply the damage
+            damage = 1
+            old_hp = unit.hp
+            unit.hp = max(0, unit.hp - damage)
+            actual_damage = old_hp - unit.hp
+            
+            
+            # Get the opposing player (caster of the Auction Curse)
+            caster_player = 3 - unit.player  # If unit.player is 1, this gives 2; if 2, gives 1
+            
+            # Find a DELPHIC_APPRAISER unit from the caster's player to attribute the damage to
+            appraiser_unit = None
+            for u in self.units:
+                if u.is_alive() and u.player == caster_player and u.type == UnitType.DELPHIC_APPRAISER:
+                    appraiser_unit = u
+                    break
+            
+            # Use the found DELPHIC_APPRAISER or a generic name if none found
+            attacker_name = appraiser_unit.get_display_name() if appraiser_unit else f"DELPHIC APPRAISER Player {caster_player}"
+            
+            # Log the damage using standard combat message format - this ensures proper color formatting
+            message_log.add_combat_message(
+                attacker_name=attacker_name,
+                target_name=unit.get_display_name(),
+                damage=damage,
+                ability="Auction Curse",
+                attacker_player=caster_player,
+                target_player=unit.player
+            )
+            
+            # Inflate astral values of furniture AND appraised enemies within 2 tiles of cursed unit
+            # Check if Valuation Oracle upgrade is active
+            from boneglaive.game.upgrades import UpgradeManager
+            valuation_oracle_upgraded = False
+            if appraiser_unit and UpgradeManager.is_skill_upgraded(appraiser_unit, "Valuation Oracle"):
+                valuation_oracle_upgraded = True
+
+            furniture_inflated = 0
+            enemies_inflated = 0
+            for dy in range(-2, 3):  # -2 to +2
+                for dx in range(-2, 3):  # -2 to +2
+                    check_y = unit.y + dy
+                    check_x = unit.x + dx
+
+                    # Skip if out of bounds
+                    if not self.is_valid_position(check_y, check_x):
+                        continue
+
+                    # Check if this position has furniture
+                    if self.map.is_furniture(check_y, check_x):
+                        # Get furniture type name
+                        furniture_terrain = self.map.get_terrain_at(check_y, check_x)
+                        furniture_name = furniture_terrain.name.replace('_', ' ').title()
+
+                        # Get current astral value for the caster's player (defaulting to 1 if none exists)
+                        if caster_player not in self.map.cosmic_values:
+                            self.map.cosmic_values[caster_player] = {}
+                        current_value = self.map.cosmic_values[caster_player].get((check_y, check_x), 1)
+                        # Increase by 1, capped at 14
+                        new_value = min(current_value + 1, 14)
+                        self.map.cosmic_values[caster_player][(check_y, check_x)] = new_value
+                        furniture_inflated += 1
+
+                    # With Valuation Oracle upgrade: Also inflate appraised enemy astral values
+                    if valuation_oracle_upgraded and appraiser_unit:
+                        enemy_unit = self.get_unit_at(check_y, check_x)
+                        if enemy_unit and enemy_unit.is_alive() and enemy_unit.player != caster_player:
+                            # Get appraiser's passive skill to access enemy astral values
+                            if hasattr(appraiser_unit, 'passive_skill') and appraiser_unit.passive_skill:
+                                # Get current enemy astral value
+                                current_value = appraiser_unit.passive_skill._get_enemy_astral_value(
+                                    self, caster_player, enemy_unit
+                                )
+                                # Increase by 1, capped at 9 (enemy values are 1-9)
+                                new_value = min(current_value + 1, 9)
+                                appraiser_unit.passive_skill._set_enemy_astral_value(
+                                    self, caster_player, enemy_unit, new_value
+                                )
+                                enemies_inflated += 1
+
+                                # If enemy is imbued, also update their imbued cosmic value
+                                if (hasattr(enemy_unit, 'status_imbued') and
+                                    enemy_unit.status_imbued and
+                                    enemy_unit.status_imbued_player == caster_player):
+                                    enemy_unit.status_imbued_cosmic_value = new_value
+
+            # Log furniture/enemy value inflation if any occurred
+            if furniture_inflated > 0 or enemies_inflated > 0:
+                if furniture_inflated > 0 and enemies_inflated > 0:
+                    message_log.add_message(
+                        f"{unit.get_display_name()}'s Auction Curse inflates the astral value of nearby furniture and enemies",
+                        MessageType.WARNING,
+                        player=caster_player
+                    )
+                elif furniture_inflated > 0:
+                    message_log.add_message(
+                        f"{unit.get_display_name()}'s Auction Curse inflates the astral value of nearby furniture",
+                        MessageType.WARNING,
+                        player=caster_player
+                    )
+                else:
+                    message_log.add_message(
+                        f"{unit.get_display_name()}'s Auction Curse inflates the astral value of nearby enemies",
+                        MessageType.WARNING,
+                        player=caster_player
+                    )
+
+            # Decrement the duration
+            unit.auction_curse_dot_duration -= 1
+            logger.debug(f"{unit.get_display_name()}'s Auction Curse DOT duration: {unit.auction_curse_dot_duration}")
+            
+            # Check if unit died from the DOT
+            if unit.hp <= 0:
+                # Use consistent format for death messages
+                # NOTE: Auction Curse upgrade bonus GP is handled in handle_unit_death()
+                # — do not award it here to avoid double GP
+                message_log.add_message(
+                    f"{unit.get_display_name()} perishes!",
+                    MessageType.COMBAT,
+                    player=unit.player
+                )
+                caster_ref = unit.auction_curse_caster if hasattr(unit, 'auction_curse_caster') else None
+                self.handle_unit_death(unit, killer_unit=caster_ref, cause="auction_curse", ui=ui)
+            
+            # Check if the DOT effect has expired
+            if unit.auction_curse_dot_duration <= 0:
+                # Remove the DOT effect
+                unit.auction_curse_dot = False
+                
+                # Remove healing prevention flag
+                if hasattr(unit, 'auction_curse_no_heal'):
+                    unit.auction_curse_no_heal = False
+                
+                # Log the expiration - use attacker_name for consistent display
+                message_log.add_message(
+                    f"Auction Curse fades from {unit.get_display_name()}.",
+                    MessageType.ABILITY,
+                    player=caster_player,
+                    attacker_name=attacker_name,
+                    target_name=unit.get_display_name()
+                )
+            
+            # Clear the DOT action flag
+            unit.auction_curse_dot_action = False
+            
+        elif hasattr(unit, 'viseroy_trap_action') and unit.viseroy_trap_action:
+            # This is a special action but still counts as an action for health regeneration
+            unit.took_no_actions = False
+
+            # Trap damage to trapped units is handled centrally in _apply_trap_damage.
+            # Clean up the special flag
+            unit.viseroy_trap_action = False
+
     def _resolve_collision_conflicts(self):
         """
         Post-turn collision sweep to detect and resolve any units occupying the same position.
@@ -4391,8 +4505,7 @@ class Game:
         
         # Move DERELICTIONIST to the closest available position
         if possible_positions:
-            import random
-            chosen_pos = random.choice(possible_positions)
+            chosen_pos = self.rng.choice(possible_positions)
 
             # Mark as pending teleport for graphical animation system
             derelictionist.pending_teleport_defection = True
@@ -4526,7 +4639,6 @@ class Game:
         Returns:
             bool: True if Wretched Decension triggered, False otherwise
         """
-        import random
         from boneglaive.utils.debug import logger
         from boneglaive.utils.message_log import message_log, MessageType
         from boneglaive.utils.constants import UnitType, CRITICAL_HEALTH_PERCENT
@@ -4584,7 +4696,7 @@ class Game:
             logger.debug(f"Fallback trigger chance: {trigger_chance}")
         
         # Roll for trigger
-        roll = random.random()
+        roll = self.rng.random()
         logger.debug(f"Random roll: {roll}, trigger threshold: {trigger_chance}")
         
         if roll <= trigger_chance:
@@ -5489,7 +5601,6 @@ class Game:
         Process Neural Shunt random action effects for affected units.
         Units affected by Neural Shunt perform random actions during their turn.
         """
-        import random
         from boneglaive.utils.debug import logger
         
         # Find all units belonging to current player that are affected by Neural Shunt
@@ -5511,7 +5622,7 @@ class Game:
             unit.selected_skill = None
             
             # Generate random action (33% chance each: move, attack, skill)
-            action_type = random.choice(['move', 'attack', 'skill'])
+            action_type = self.rng.choice(['move', 'attack', 'skill'])
             
             if action_type == 'move':
                 self._generate_random_move_action(unit)
@@ -5522,7 +5633,6 @@ class Game:
     
     def _generate_random_move_action(self, unit):
         """Generate a random movement action for Neural Shunt."""
-        import random
         from boneglaive.utils.debug import logger
         
         # Get all valid movement positions within range
@@ -5549,7 +5659,7 @@ class Game:
                         valid_moves.append((target_y, target_x))
         
         if valid_moves:
-            target = random.choice(valid_moves)
+            target = self.rng.choice(valid_moves)
             unit.move_target = target
             logger.debug(f"Neural Shunt random move: {unit.get_display_name()} -> {target}")
         else:
@@ -5557,7 +5667,6 @@ class Game:
     
     def _generate_random_attack_action(self, unit):
         """Generate a random attack action for Neural Shunt."""
-        import random
         from boneglaive.utils.debug import logger
         
         # Get all valid attack targets within range
@@ -5575,7 +5684,7 @@ class Game:
                     valid_targets.append((target_unit.y, target_unit.x))
         
         if valid_targets:
-            target = random.choice(valid_targets)
+            target = self.rng.choice(valid_targets)
             unit.attack_target = target
             logger.debug(f"Neural Shunt random attack: {unit.get_display_name()} -> {target}")
         else:
@@ -5583,7 +5692,6 @@ class Game:
     
     def _generate_random_skill_action(self, unit):
         """Generate a random skill action for Neural Shunt."""
-        import random
         from boneglaive.utils.debug import logger
         
         # Get available skills that are not on cooldown
@@ -5594,7 +5702,7 @@ class Game:
             return
             
         # Pick a random skill
-        selected_skill = random.choice(available_skills)
+        selected_skill = self.rng.choice(available_skills)
         unit.selected_skill = selected_skill
         
         # Try to find a valid target for the skill
@@ -5622,7 +5730,7 @@ class Game:
                     continue
         
         if valid_targets:
-            target = random.choice(valid_targets)
+            target = self.rng.choice(valid_targets)
             unit.skill_target = target
             # Set cooldown — normally done by skill.use(), which we bypass
             selected_skill.current_cooldown = selected_skill.cooldown
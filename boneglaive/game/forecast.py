@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Action forecasts for Boneglaive.
+
+Game.forecast(unit, action) answers "what would this do?" with the real
+resolution code rather than an approximation: the action is queued on a clone
+of the game and resolved by the same per-unit pipeline execute_turn() uses, so
+PRT, Partition, Demilune, bombs, Autoclave, critical-health retching and every
+skill's own rules apply. The live game, its message log and the global random
+stream are left exactly as they were: chance outcomes on the clone are drawn
+from a generator of its own, so forecasts are reproducible and safe to run off
+the main thread.
+
+A forecast resolves the one action in isolation: other queued actions, status
+ticks and end-of-turn upkeep are not part of it.
+"""
+
+import random
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+from boneglaive.utils.debug import logger
+from boneglaive.utils.message_log import message_log
+from boneglaive.game.actions import UnitAction, queue_unit_action
+
+if TYPE_CHECKING:
+    from boneglaive.game.engine import Game
+    from boneglaive.game.units import Unit
+
+# Seed of the generator a forecast clone resolves chance outcomes with
+FORECAST_SEED = 0
+
+
+@dataclass
+class UnitDelta:
+    """How one live unit would change."""
+    unit: 'Unit'
+    hp_before: int
+    hp_after: int
+    position_before: Tuple[int, int]
+    position_after: Tuple[int, int]
+    killed: bool = False
+
+    @property
+    def damage(self) -> int:
+        """HP lost (0 if the unit was healed or untouched)."""
+        return max(0, self.hp_before - self.hp_after)
+
+    @property
+    def healed(self) -> int:
+        """HP gained (0 if the unit was damaged or untouched)."""
+        return max(0, self.hp_after - self.hp_before)
+
+    @property
+    def moved(self) -> bool:
+        return self.position_before != self.position_after
+
+
+@dataclass
+class Forecast:
+    """The resolved outcome of one unit's action."""
+    unit: 'Unit'
+    action: UnitAction
+    legal: bool = True
+    deltas: List[UnitDelta] = field(default_factory=list)  # Only units that changed
+    spawned: int = 0  # Units created by the action (drones, vapors, echoes...)
+
+    def delta_for(self, unit: 'Unit') -> Optional[UnitDelta]:
+        """The change to a live unit, or None if it is unaffected."""
+        for delta in self.deltas:
+            if delta.unit is unit:
+                return delta
+        return None
+
+    @property
+    def kills(self) -> List['Unit']:
+        """Live units the action would kill."""
+        return [delta.unit for delta in self.deltas if delta.killed]
+
+    def damage_to(self, player: int) -> int:
+        """Total HP a player's units would lose."""
+        return sum(delta.damage for delta in self.deltas if delta.unit.player == player)
+
+    def healing_to(self, player: int) -> int:
+        """Total HP a player's units would gain."""
+        return sum(delta.healed for delta in self.deltas if delta.unit.player == player)
+
+
+def forecast_action(game: 'Game', unit: 'Unit', action: UnitAction) -> Forecast:
+    """
+    Resolve one unit's action on a clone and report what it changes.
+
+    Args:
+        game: Live game
+        unit: Live unit performing the action
+        action: Orders to forecast; its skill is one of the live unit's skills
+
+    Returns:
+        Forecast with per-unit deltas (legal=False and no deltas if the action
+        cannot be queued)
+    """
+    try:
+        with message_log.suppressed():
+            memo: Dict[int, object] = {}
+            state = game.clone(memo, rng=random.Random(FORECAST_SEED))
+            actor = memo[id(unit)]
+
+            # Resolve the action in isolation
+            for other in state.units:
+                other.move_target = None
+                other.attack_target = None
+                other.skill_target = None
+                other.selected_skill = None
+
+            skill = memo.get(id(action.skill), action.skill) if action.skill is not None else None
+            if not queue_unit_action(state, actor, action._replace(skill=skill)):
+                return Forecast(unit, action, legal=False)
+
+            state._pre_establish_marrow_dike_tracking([actor])
+            state._execute_unit_action(actor)
+
+            forecast = Forecast(unit, action)
+            clones = set()
+            for live in game.units:
+                twin = memo.get(id(live))
+                if twin is None:
+                    continue
+                clones.add(id(twin))
+                killed = live.is_alive() and (not twin.is_alive() or twin not in state.units)
+                delta = UnitDelta(live, live.hp, max(0, twin.hp), (live.y, live.x), (twin.y, twin.x),
+                                  killed=killed)
+                if delta.killed or delta.hp_before != delta.hp_after or delta.moved:
+                    forecast.deltas.append(delta)
+            forecast.spawned = sum(1 for u in state.units if id(u) not in clones)
+            return forecast
+    except Exception as e:
+        logger.error(f"Error forecasting {action.kind} for {unit.get_display_name()}: {e}")
+        return Forecast(unit, action, legal=False)
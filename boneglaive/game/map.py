@@ -77,6 +77,9 @@ class GameMap:
         # Callback for terrain changes (used by graphical renderer to mark tiles dirty)
         self.terrain_change_callback = None
 
+        # Bumped on every terrain change so cached board queries can tell they're stale
+        self.version = 0
+
         # Generate an empty map by default
         self.reset_to_empty()
 
@@ -86,6 +89,7 @@ class GameMap:
         for y in range(self.height):
             for x in range(self.width):
                 self.terrain[(y, x)] = TerrainType.EMPTY
+        self.version = getattr(self, 'version', 0) + 1
 
         # Reset astral values
         self.cosmic_values = {}
@@ -97,6 +101,7 @@ class GameMap:
     def set_terrain_at(self, y: int, x: int, terrain_type: TerrainType) -> None:
         """Set terrain type at the given coordinates."""
         self.terrain[(y, x)] = terrain_type
+        self.version += 1
 
         # Notify renderer if callback is set (for graphical mode)
         # Note: renderer.mark_tile_dirty expects (x, y) while this method receives (y, x)
@@ -165,8 +170,7 @@ class GameMap:
 
         # Generate value if not already set for this player
         if (y, x) not in self.cosmic_values[player]:
-            import random
-            self.cosmic_values[player][(y, x)] = random.randint(1, 9)
+            self.cosmic_values[player][(y, x)] = game.rng.randint(1, 9)
 
         # Return the astral value for this player
         return self.cosmic_values[player].get((y, x))
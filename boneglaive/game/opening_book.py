@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Opening book of AI unit placements.
+
+Maps (map name, player, roster) to the placement that did best in offline
+headless playouts (see boneglaive.ai.placement). The AI's setup path looks its
+roster up here and only falls back to a random formation when the book has no
+entry or the entry no longer fits the map.
+
+The book is a compact JSON file at the project root:
+    {"version": 1,
+     "entries": {"lime_foyer": {"2": {"GLAIVEMAN|GRAYMAN|LANDSCAPER":
+         {"placements": [["GLAIVEMAN", 3, 4], ...], "score": 0.62, "games": 24}}}}}
+"""
+
+import json
+import os
+from typing import Dict, Iterable, List, Optional, Tuple, TYPE_CHECKING
+from boneglaive.utils.constants import UnitType
+from boneglaive.utils.debug import logger
+from boneglaive.utils.paths import asset_path
+
+if TYPE_CHECKING:
+    from boneglaive.game.engine import Game
+
+BOOK_VERSION = 1
+BOOK_FILE = "opening_book.json"
+
+Placement = List[Tuple[UnitType, int, int]]
+
+
+def roster_key(unit_types: Iterable[UnitType]) -> str:
+    """Order-independent key for a roster, e.g. 'GLAIVEMAN|GRAYMAN|LANDSCAPER'."""
+    return "|".join(sorted(t.name for t in unit_types))
+
+
+class OpeningBook:
+    """Best known placements keyed by map, player and roster."""
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Args:
+            path: Book file (default: opening_book.json at the project root)
+        """
+        self.path = path or asset_path(BOOK_FILE)
+        self.entries: Dict[str, Dict[str, Dict[str, dict]]] = {}
+        self._loaded = False
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable opening book {self.path}: {e}")
+            return
+        if data.get("version") != BOOK_VERSION:
+            logger.warning(f"Ignoring opening book {self.path}: version {data.get('version')}")
+            return
+        self.entries = data.get("entries", {})
+
+    def lookup(self, map_name: str, player: int, unit_types: Iterable[UnitType]) -> Optional[Placement]:
+        """
+        Book placement for a roster.
+
+        Args:
+            map_name: Map being played
+            player: Player placing the units
+            unit_types: The roster, in any order
+
+        Returns:
+            [(unit type, y, x), ...] or None if the roster is not in the book
+        """
+        self._ensure_loaded()
+        entry = self.entries.get(map_name, {}).get(str(player), {}).get(roster_key(unit_types))
+        if entry is None:
+            return None
+        try:
+            return [(UnitType[name], int(y), int(x)) for name, y, x in entry["placements"]]
+        except (KeyError, TypeError, ValueError):
+            logger.warning(f"Malformed opening book entry for {map_name}/{player}")
+            return None
+
+    def placement_for(self, game: 'Game', player: int, unit_types: Iterable[UnitType]) -> Optional[Placement]:
+        """
+        Book placement for a roster, if it is still legal on this game's map.
+
+        Returns:
+            The placement, or None when absent or when a tile is no longer placeable
+        """
+        placement = self.lookup(game.map_name, player, unit_types)
+        if placement is None:
+            return None
+        tiles = [(y, x) for _, y, x in placement]
+        if len(set(tiles)) != len(tiles) or not all(
+                game.is_valid_position(y, x) and game.map.can_place_unit(y, x) for y, x in tiles):
+            logger.warning(f"Opening book placement for {game.map_name} no longer fits the map")
+            return None
+        return placement
+
+    def record(self, map_name: str, player: int, placement: Placement, score: float, games: int) -> None:
+        """Store (or replace) the entry for the placement's roster."""
+        self._ensure_loaded()
+        self.entries.setdefault(map_name, {}).setdefault(str(player), {})[
+            roster_key(t for t, _, _ in placement)] = {
+            "placements": [[t.name, y, x] for t, y, x in placement],
+            "score": round(score, 4),
+            "games": games,
+        }
+
+    def has(self, map_name: str, player: int, unit_types: Iterable[UnitType]) -> bool:
+        self._ensure_loaded()
+        return roster_key(unit_types) in self.entries.get(map_name, {}).get(str(player), {})
+
+    def save(self, path: Optional[str] = None) -> None:
+        """Atomically write the book (one line per map keeps diffs readable)."""
+        self._ensure_loaded()
+        path = path or self.path
+        lines = [f"  {json.dumps(name)}: {json.dumps(self.entries[name], sort_keys=True, separators=(',', ':'))}"
+                 for name in sorted(self.entries)]
+        body = "\n" + ",\n".join(lines) + "\n" if lines else ""
+        text = f'{{"version": {BOOK_VERSION}, "entries": {{{body}}}}}\n'
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+
+
+# Global opening book instance, loaded on first lookup
+opening_book = OpeningBook()
@@ -4,13 +4,18 @@ Core skill classes and types for the Boneglaive skill system.
 This module provides the foundation for all skill implementations.
 """
 
-import random
+import itertools
 from enum import Enum, auto
 from typing import Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from boneglaive.game.units import Unit
     from boneglaive.game.engine import Game
+    from boneglaive.game.targeting import TargetGeometry
+
+# Skill ids; a counter rather than a random draw, so summoning during an AI
+# search never touches the global random stream
+_skill_ids = itertools.count(1)
 
 class SkillType(Enum):
     """Types of skills available to units."""
@@ -27,6 +32,14 @@ class TargetType(Enum):
 
 class Skill:
     """Base class for all skills."""
+
+    # Board requirements on the target tile, shared with the cached candidate
+    # generator (boneglaive.game.targeting). Only declare what can_use() itself
+    # enforces: the AI and the range overlay pre-filter tiles with these.
+    target_shape = None               # TargetShape (None = AREA)
+    target_requires_passable = False
+    target_requires_empty = False
+    target_requires_line_of_sight = False
     
     def __init__(self, 
                  name: str, 
@@ -52,7 +65,7 @@ class Skill:
         # None, the icon is derived from the display name.
         self.icon_name = icon_name
 
-        self.id = f"{name}-{random.randint(1000, 9999)}"
+        self.id = f"{name}-{next(_skill_ids)}"
 
     def get_icon_name(self) -> str:
         """The skill-icon filename stem (without extension). Uses icon_name if set,
@@ -99,6 +112,31 @@ class Skill:
         # Additional checks can be implemented in subclasses
         return True
         
+    def get_target_range(self, user: 'Unit', game: Optional['Game'] = None) -> int:
+        """The skill's current range, honouring dynamic range methods."""
+        if hasattr(self, 'get_skill_range') and callable(self.get_skill_range):
+            return self.get_skill_range(user, game)
+        if hasattr(self, 'get_range') and callable(self.get_range):
+            return self.get_range(user)
+        return self.range
+
+    def target_geometry(self, user: 'Unit', game: Optional['Game'] = None) -> 'TargetGeometry':
+        """Range, shape and tile requirements used to generate target candidates."""
+        from boneglaive.game.targeting import TargetGeometry, TargetShape
+        return TargetGeometry(range=self.get_target_range(user, game),
+                              shape=self.target_shape or TargetShape.AREA,
+                              passable=self.target_requires_passable,
+                              empty=self.target_requires_empty,
+                              line_of_sight=self.target_requires_line_of_sight)
+
+    def target_in_reach(self, user: 'Unit', target_pos: tuple, game: 'Game') -> bool:
+        """
+        Shared geometry check for can_use(): range from the cast origin plus the
+        declared tile requirements, answered from the game's cached masks.
+        """
+        from boneglaive.game.targeting import skill_origin
+        return game.targeting.contains(skill_origin(user), self.target_geometry(user, game), target_pos)
+
     def use(self, user: 'Unit', target_pos: Optional[tuple] = None, game: Optional['Game'] = None) -> bool:
         """Use the skill. Return True if successful."""
         if not self.can_use(user, target_pos, game):
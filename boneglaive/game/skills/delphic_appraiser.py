@@ -5,7 +5,6 @@ This module contains all passive and active abilities for DELPHIC_APPRAISER unit
 """
 
 
-import random
 from typing import Optional, Tuple, TYPE_CHECKING
 
 from boneglaive.game.skills.core import PassiveSkill, ActiveSkill, TargetType
@@ -39,7 +38,7 @@ class ValuationOracle(PassiveSkill):
         key = (appraiser_player, id(enemy_unit))
         if key not in game.enemy_astral_values:
             # Assign new random value (1-9)
-            game.enemy_astral_values[key] = random.randint(1, 9)
+            game.enemy_astral_values[key] = game.rng.randint(1, 9)
 
         return game.enemy_astral_values[key]
 
@@ -212,6 +211,8 @@ class MarketFuturesSkill(ActiveSkill):
     Active skill for DELPHIC_APPRAISER.
     Infuses furniture with temporal investment energy for teleportation.
     """
+
+    target_requires_line_of_sight = True
     
     def __init__(self):
         super().__init__(
@@ -261,19 +262,8 @@ class MarketFuturesSkill(ActiveSkill):
         if not is_furniture and not is_valid_enemy:
             return False
 
-        # If the unit has a move_target, use that position for range calculation
-        if user.move_target:
-            source_y, source_x = user.move_target
-        else:
-            source_y, source_x = user.y, user.x
-
-        # Check if target is within range of current or planned position
-        distance = game.chess_distance(source_y, source_x, target_pos[0], target_pos[1])
-        if distance > self.range:
-            return False
-
-        # Check line of sight to target
-        if not game.has_line_of_sight(source_y, source_x, target_pos[0], target_pos[1]):
+        # Within range of the current or planned position, in line of sight
+        if not self.target_in_reach(user, target_pos, game):
             return False
 
         return True
@@ -341,7 +331,7 @@ class MarketFuturesSkill(ActiveSkill):
                 if hasattr(user, 'passive_skill') and user.passive_skill:
                     cosmic_value = user.passive_skill._get_enemy_astral_value(game, user.player, target_unit)
                 else:
-                    cosmic_value = random.randint(1, 9)
+                    cosmic_value = game.rng.randint(1, 9)
 
                 # Apply imbued status effect
                 target_unit.status_imbued = True
@@ -360,7 +350,7 @@ class MarketFuturesSkill(ActiveSkill):
             # Get the astral value (will be generated if it doesn't exist)
             cosmic_value = game.map.get_cosmic_value(target_pos[0], target_pos[1], player=user.player, game=game)
             if cosmic_value is None:
-                cosmic_value = random.randint(1, 9)  # Fallback
+                cosmic_value = game.rng.randint(1, 9)  # Fallback
 
             # Get the furniture name for messages
             target_terrain = game.map.get_terrain_at(target_pos[0], target_pos[1])
@@ -571,6 +561,8 @@ class AuctionCurseSkill(ActiveSkill):
     Forces enemy into unwilling appraisal that inflates surrounding furniture values while draining their life.
     """
 
+    target_requires_line_of_sight = True
+
     def __init__(self):
         super().__init__(
             name="Auction Curse",
@@ -601,19 +593,8 @@ class AuctionCurseSkill(ActiveSkill):
         if not target_unit or target_unit.player == user.player:
             return False
 
-        # If the unit has a move_target, use that position for range calculation
-        if user.move_target:
-            source_y, source_x = user.move_target
-        else:
-            source_y, source_x = user.y, user.x
-
-        # Check if target is within range of current or planned position
-        distance = game.chess_distance(source_y, source_x, target_pos[0], target_pos[1])
-        if distance > self.range:
-            return False
-
-        # Check line of sight to target
-        if not game.has_line_of_sight(source_y, source_x, target_pos[0], target_pos[1]):
+        # Within range of the current or planned position, in line of sight
+        if not self.target_in_reach(user, target_pos, game):
             return False
 
         return True
@@ -764,6 +745,8 @@ class DivineDrepreciationSkill(ActiveSkill):
     Reappraises a furniture piece as cosmically worthless, creating a reality distortion.
     """
 
+    target_requires_line_of_sight = True
+
     def __init__(self):
         super().__init__(
             name="Divine Depreciation",
@@ -844,19 +827,8 @@ class DivineDrepreciationSkill(ActiveSkill):
         if not is_furniture and not is_valid_enemy:
             return False
 
-        # If the unit has a move_target, use that position for range calculation
-        if user.move_target:
-            source_y, source_x = user.move_target
-        else:
-            source_y, source_x = user.y, user.x
-
-        # Check if target is within range of current or planned position
-        distance = game.chess_distance(source_y, source_x, target_pos[0], target_pos[1])
-        if distance > self.range:
-            return False
-
-        # Check line of sight to target
-        if not game.has_line_of_sight(source_y, source_x, target_pos[0], target_pos[1]):
+        # Within range of the current or planned position, in line of sight
+        if not self.target_in_reach(user, target_pos, game):
             return False
 
         return True
@@ -903,7 +875,7 @@ class DivineDrepreciationSkill(ActiveSkill):
         if is_furniture:
             original_cosmic_value = game.map.get_cosmic_value(target_pos[0], target_pos[1], player=user.player, game=game)
             if original_cosmic_value is None:
-                original_cosmic_value = random.randint(1, 9)  # Fallback
+                original_cosmic_value = game.rng.randint(1, 9)  # Fallback
             furniture_name = self._get_furniture_name(target_terrain)
             target_name = furniture_name
         else:
@@ -913,7 +885,7 @@ class DivineDrepreciationSkill(ActiveSkill):
             if hasattr(user, 'passive_skill') and user.passive_skill:
                 original_cosmic_value = user.passive_skill._get_enemy_astral_value(game, user.player, target_enemy)
             else:
-                original_cosmic_value = random.randint(1, 9)  # Fallback
+                original_cosmic_value = game.rng.randint(1, 9)  # Fallback
             target_name = target_enemy.get_display_name()
             furniture_name = target_name  # Use for messages
 
@@ -1070,7 +1042,7 @@ class DivineDrepreciationSkill(ActiveSkill):
         for pos in other_furniture:
 
             # Generate a new random astral value (1-9) for this player
-            new_value = random.randint(1, 9)
+            new_value = game.rng.randint(1, 9)
             game.map.set_cosmic_value(pos[0], pos[1], new_value, user.player)
             rerolled_values[pos] = new_value
 
@@ -1079,7 +1051,7 @@ class DivineDrepreciationSkill(ActiveSkill):
             for pos, enemy_unit in appraised_enemies:
 
                 # Generate a new random astral value (1-9) for this enemy
-                new_value = random.randint(1, 9)
+                new_value = game.rng.randint(1, 9)
                 user.passive_skill._set_enemy_astral_value(game, user.player, enemy_unit, new_value)
                 rerolled_values[pos] = new_value
 
@@ -1501,7 +1473,7 @@ class DeftRerollSkill(ActiveSkill):
         for pos in furniture_to_reroll:
 
             # Generate new cosmic value
-            new_value = random.randint(1, 14)
+            new_value = game.rng.randint(1, 14)
             game.map.set_cosmic_value(pos[0], pos[1], new_value, user.player)
             rerolled_values[pos] = new_value
 
@@ -1510,7 +1482,7 @@ class DeftRerollSkill(ActiveSkill):
             for pos, enemy_unit in appraised_enemies:
 
                 # Generate a new random astral value (1-14) for this enemy
-                new_value = random.randint(1, 14)
+                new_value = game.rng.randint(1, 14)
                 user.passive_skill._set_enemy_astral_value(game, user.player, enemy_unit, new_value)
                 rerolled_values[pos] = new_value
 
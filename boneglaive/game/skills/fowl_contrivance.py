@@ -7,6 +7,7 @@ Reworked as a mechanical peacock rail artillery platform.
 
 from typing import Optional, TYPE_CHECKING, List, Tuple
 from boneglaive.game.skills.core import PassiveSkill, ActiveSkill, TargetType
+from boneglaive.game.targeting import TargetShape
 from boneglaive.game.map import TerrainType
 from boneglaive.utils.message_log import message_log, MessageType
 from boneglaive.utils.constants import UnitType
@@ -125,6 +126,8 @@ class GaussianDuskSkill(ActiveSkill):
     Can only fire in cardinal directions (N, S, E, W).
     """
 
+    target_shape = TargetShape.CARDINAL
+
     def __init__(self):
         super().__init__(
             name="Gaussian Dusk",
@@ -578,8 +581,6 @@ class BigArcSkill(ActiveSkill):
 
             # Apply the "imprint" effect at second explosion site
             if first_explosion_enemy_offsets:
-                import random
-
                 destructible_terrain = [
                     TerrainType.LIMESTONE, TerrainType.PILLAR, TerrainType.MARROW_WALL,
                     TerrainType.LECTERN, TerrainType.COAT_RACK, TerrainType.OTTOMAN,
@@ -704,7 +705,7 @@ class BigArcSkill(ActiveSkill):
                                     displacement_attempts.append((check_y, check_x))
 
                         if displacement_attempts:
-                            new_y, new_x = random.choice(displacement_attempts)
+                            new_y, new_x = game.rng.choice(displacement_attempts)
                             orig_y, orig_x = unit_at_target.y, unit_at_target.x
                             unit_at_target.y = new_y
                             unit_at_target.x = new_x
@@ -93,6 +93,10 @@ class EnbroachmentGasSkill(ActiveSkill):
     and deals damage to enemies.
     """
 
+    target_requires_passable = True
+    target_requires_empty = True
+    target_requires_line_of_sight = True
+
     def __init__(self):
         super().__init__(
             name="Broaching Gas",
@@ -113,31 +117,8 @@ class EnbroachmentGasSkill(ActiveSkill):
         if not game or not target_pos:
             return False
 
-        # Check if the target position is valid and passable
-        if not game.is_valid_position(target_pos[0], target_pos[1]):
-            return False
-
-        # Target position must be passable terrain
-        if not game.map.is_passable(target_pos[0], target_pos[1]):
-            return False
-
-        # Target position must be empty (no unit)
-        if game.get_unit_at(target_pos[0], target_pos[1]) is not None:
-            return False
-
-        # If the unit has a move_target, use that position for range calculation
-        if user.move_target:
-            source_y, source_x = user.move_target
-        else:
-            source_y, source_x = user.y, user.x
-
-        # Check if target is within range of current or planned position
-        distance = game.chess_distance(source_y, source_x, target_pos[0], target_pos[1])
-        if distance > self.range:
-            return False
-
-        # Check line of sight
-        if not game.has_line_of_sight(source_y, source_x, target_pos[0], target_pos[1]):
+        # Empty, passable, within range of the current or planned position, in line of sight
+        if not self.target_in_reach(user, target_pos, game):
             return False
 
         return True
@@ -240,6 +221,10 @@ class SaftEGasSkill(ActiveSkill):
     Summons a HEINOUS VAPOR that disrupts ranged attacks and heals allies.
     """
 
+    target_requires_passable = True
+    target_requires_empty = True
+    target_requires_line_of_sight = True
+
     def __init__(self):
         super().__init__(
             name="Saft-E-Gas",
@@ -260,31 +245,8 @@ class SaftEGasSkill(ActiveSkill):
         if not game or not target_pos:
             return False
 
-        # Check if the target position is valid and passable
-        if not game.is_valid_position(target_pos[0], target_pos[1]):
-            return False
-
-        # Target position must be passable terrain
-        if not game.map.is_passable(target_pos[0], target_pos[1]):
-            return False
-
-        # Target position must be empty (no unit)
-        if game.get_unit_at(target_pos[0], target_pos[1]) is not None:
-            return False
-
-        # If the unit has a move_target, use that position for range calculation
-        if user.move_target:
-            source_y, source_x = user.move_target
-        else:
-            source_y, source_x = user.y, user.x
-
-        # Check if target is within range of current or planned position
-        distance = game.chess_distance(source_y, source_x, target_pos[0], target_pos[1])
-        if distance > self.range:
-            return False
-
-        # Check line of sight
-        if not game.has_line_of_sight(source_y, source_x, target_pos[0], target_pos[1]):
+        # Empty, passable, within range of the current or planned position, in line of sight
+        if not self.target_in_reach(user, target_pos, game):
             return False
 
         return True
@@ -631,10 +593,9 @@ class DivergeSkill(ActiveSkill):
 
         # Create the gases
         from boneglaive.game.units import Unit
-        import random
 
         # Randomly shuffle valid positions to avoid predictable placement
-        random.shuffle(valid_positions)
+        game.rng.shuffle(valid_positions)
 
         # Create Coolant Gas
         coolant_gas = Unit(UnitType.HEINOUS_VAPOR, user.player, valid_positions[0][0], valid_positions[0][1])
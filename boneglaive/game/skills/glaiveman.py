@@ -541,6 +541,9 @@ class VaultSkill(ActiveSkill):
     Vault allows the GLAIVEMAN to leap over obstacles and enemies,
     landing in an empty space within range.
     """
+
+    target_requires_passable = True
+    target_requires_empty = True
     
     def __init__(self):
         super().__init__(
@@ -552,14 +555,17 @@ class VaultSkill(ActiveSkill):
             range_=2
         )
         self.landing_damage = 4  # Damage to adjacent enemies on landing (when upgraded)
+
+    def get_skill_range(self, user: 'Unit', game: Optional['Game'] = None) -> int:
+        """Vault reaches 3 tiles when upgraded, 2 otherwise."""
+        from boneglaive.game.upgrades import UpgradeManager
+        return 3 if UpgradeManager.is_skill_upgraded(user, "Vault") else 2
     
     def can_use(self, user: 'Unit', target_pos: Optional[tuple] = None, game: Optional['Game'] = None) -> bool:
         """Check if Vault can be used on the target position."""
         # Check for upgrade and update range dynamically
         if game:
-            from boneglaive.game.upgrades import UpgradeManager
-            is_upgraded = UpgradeManager.is_skill_upgraded(user, "Vault")
-            self.range = 3 if is_upgraded else 2
+            self.range = self.get_skill_range(user, game)
 
         # Basic validation
         if not super().can_use(user, target_pos, game):
@@ -567,28 +573,11 @@ class VaultSkill(ActiveSkill):
         if not game or not target_pos:
             return False
 
-        # Check if the target position is valid and passable
-        if not game.is_valid_position(target_pos[0], target_pos[1]):
-            return False
-
-        # Target position must be passable terrain
-        if not game.map.is_passable(target_pos[0], target_pos[1]):
+        # Target must be empty, passable and within range of the vault origin
+        # (the planned move destination if any - execute() clears move_target)
+        if not self.target_in_reach(user, target_pos, game):
             return False
 
-        # Target position must be empty (no unit)
-        if game.get_unit_at(target_pos[0], target_pos[1]) is not None:
-            return False
-
-        # Calculate vault starting position (current or planned move destination)
-        # This is used for range validation
-        from_y = user.y
-        from_x = user.x
-
-        # If unit has a planned move, vault from that position instead
-        # NOTE: This is just for validation - the actual execute() will clear move_target
-        if user.move_target:
-            from_y, from_x = user.move_target
-
         # NOTE: Vault is an acrobatic leap that ignores pathing restrictions.
         # It does NOT check intermediate positions - that's the whole point!
         # The unit jumps OVER obstacles and other units.
@@ -610,11 +599,6 @@ class VaultSkill(ActiveSkill):
                     # Position is already targeted by another unit's teleport
                     return False
 
-        # Check if target is within range (from_y, from_x already calculated above)
-        distance = game.chess_distance(from_y, from_x, target_pos[0], target_pos[1])
-        if distance > self.range:
-            return False
-
         return True
             
     def use(self, user: 'Unit', target_pos: Optional[tuple] = None, game: Optional['Game'] = None) -> bool:
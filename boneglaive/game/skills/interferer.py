@@ -344,6 +344,9 @@ class ScalarNodeSkill(ActiveSkill):
     Active skill for INTERFERER.
     Places invisible traps that deal damage when triggered.
     """
+
+    target_requires_passable = True
+    target_requires_empty = True
     
     def __init__(self):
         super().__init__(
@@ -369,22 +372,8 @@ class ScalarNodeSkill(ActiveSkill):
         if not game or not target_pos:
             return False
             
-        # Must target empty, passable terrain
-        if not game.is_valid_position(target_pos[0], target_pos[1]):
-            return False
-        if not game.map.is_passable(target_pos[0], target_pos[1]):
-            return False
-        if game.get_unit_at(target_pos[0], target_pos[1]) is not None:
-            return False
-            
-        # Check range
-        from_y = user.y
-        from_x = user.x
-        if user.move_target:
-            from_y, from_x = user.move_target
-            
-        distance = game.chess_distance(from_y, from_x, target_pos[0], target_pos[1])
-        if distance > self.get_range(user):
+        # Must target empty, passable terrain within range
+        if not self.target_in_reach(user, target_pos, game):
             return False
 
         return True
@@ -12,6 +12,7 @@ shrapnel damage.
 from typing import Optional, TYPE_CHECKING
 
 from boneglaive.game.skills.core import PassiveSkill, ActiveSkill, TargetType
+from boneglaive.game.targeting import TargetShape
 from boneglaive.utils.message_log import message_log, MessageType
 from boneglaive.utils.debug import logger
 from boneglaive.utils.constants import INVULNERABLE_PRT
@@ -226,6 +227,8 @@ class HornswoggleSkill(ActiveSkill):
     it hits and drags it 90° CCW, depositing slag walls along the drag path.
     """
 
+    target_shape = TargetShape.ADJACENT
+
     WAVE_RANGE = 4
     DRAG_RANGE = 4
     SLAG_DURATION = 3
@@ -604,6 +607,8 @@ class TopiaryBreathSkill(ActiveSkill):
     Lasts 1 turn.
     """
 
+    target_shape = TargetShape.ADJACENT
+
     def __init__(self):
         super().__init__(
             name="Topiary Breath",
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Skill-target candidate generation for Boneglaive.
+
+Skills, the AI evaluators and the renderer's skill-range overlay all need the
+same answer to "which tiles can this skill reach from here": tiles within range,
+optionally passable, unoccupied and in line of sight. This module computes that
+once per (origin, geometry) and caches it until the board changes (a unit
+enters or leaves a tile, or terrain changes), so repeated queries within a turn
+and across the AI's evaluators cost a set lookup.
+
+Skill-specific rules (furniture targets, teleport-collision checks, charges...)
+stay in each skill's can_use(); the masks here are only the shared geometry.
+"""
+
+from dataclasses import dataclass
+from enum import Enum, auto
+from typing import Dict, FrozenSet, List, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from boneglaive.game.engine import Game
+    from boneglaive.game.units import Unit
+    from boneglaive.game.skills.core import Skill
+
+
+class TargetShape(Enum):
+    """How a skill's range is laid out around its origin."""
+    AREA = auto()       # Every tile within chess distance `range`
+    CARDINAL = auto()   # Straight lines N/S/E/W to the map edge
+    ADJACENT = auto()   # The 8 surrounding tiles (direction selectors)
+
+
+@dataclass(frozen=True)
+class TargetGeometry:
+    """The board-level requirements a skill places on its target tile."""
+    range: int
+    shape: TargetShape = TargetShape.AREA
+    passable: bool = False        # Tile terrain must be passable
+    empty: bool = False           # No unit may stand on the tile
+    line_of_sight: bool = False   # Origin must see the tile
+
+
+class TargetingCache:
+    """
+    Per-game cache of target masks.
+
+    Masks are keyed by (origin, geometry) and are valid for one board version;
+    the version advances whenever unit occupancy or terrain changes.
+    """
+
+    def __init__(self, game: 'Game'):
+        self.game = game
+        self.board_version = 0
+        self._board_key = None
+        self._masks: Dict[Tuple[Tuple[int, int], TargetGeometry], FrozenSet[Tuple[int, int]]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _check_board(self) -> None:
+        """Drop every mask if occupancy or terrain changed since they were built."""
+        key = (self.game.map.version, frozenset(self.game.unit_grid))
+        if key != self._board_key:
+            self._board_key = key
+            self.board_version += 1
+            self._masks.clear()
+
+    def tiles(self, origin: Tuple[int, int], geometry: TargetGeometry) -> FrozenSet[Tuple[int, int]]:
+        """
+        All tiles satisfying a geometry from an origin.
+
+        Args:
+            origin: (y, x) the skill is cast from
+            geometry: Range/shape/tile requirements
+
+        Returns:
+            Frozen set of (y, x) tiles
+        """
+        self._check_board()
+        key = (origin, geometry)
+        mask = self._masks.get(key)
+        if mask is not None:
+            self.hits += 1
+            return mask
+
+        self.misses += 1
+        mask = frozenset(self._build(origin, geometry))
+        self._masks[key] = mask
+        return mask
+
+    def contains(self, origin: Tuple[int, int], geometry: TargetGeometry,
+                 target: Tuple[int, int]) -> bool:
+        """Whether a target tile satisfies a geometry from an origin."""
+        return tuple(target) in self.tiles(origin, geometry)
+
+    def _build(self, origin: Tuple[int, int], geometry: TargetGeometry) -> List[Tuple[int, int]]:
+        """Enumerate a mask (row-major) without the cache."""
+        game = self.game
+        oy, ox = origin
+        height, width = game.map.height, game.map.width
+
+        if geometry.shape == TargetShape.CARDINAL:
+            reach = []
+            for dy, dx in ((0, 1), (0, -1), (1, 0), (-1, 0)):
+                y, x = oy + dy, ox + dx
+                while 0 <= y < height and 0 <= x < width:
+                    reach.append((y, x))
+                    y, x = y + dy, x + dx
+        else:
+            radius = 1 if geometry.shape == TargetShape.ADJACENT else geometry.range
+            reach = [(y, x)
+                     for y in range(max(0, oy - radius), min(height, oy + radius + 1))
+                     for x in range(max(0, ox - radius), min(width, ox + radius + 1))
+                     if geometry.shape == TargetShape.AREA or (y, x) != (oy, ox)]
+
+        tiles = []
+        for y, x in reach:
+            if not game.is_valid_position(y, x):
+                continue
+            if geometry.passable and not game.map.is_passable(y, x):
+                continue
+            if geometry.empty and game.get_unit_at(y, x) is not None:
+                continue
+            if geometry.line_of_sight and not game.has_line_of_sight(oy, ox, y, x):
+                continue
+            tiles.append((y, x))
+        return sorted(tiles)
+
+
+def skill_origin(unit: 'Unit') -> Tuple[int, int]:
+    """Where a unit casts from: its planned move destination, else its tile."""
+    if unit.move_target:
+        return tuple(unit.move_target)
+    return (unit.y, unit.x)
+
+
+def skill_target_candidates(skill: 'Skill', unit: 'Unit', game: 'Game',
+                            validate: bool = True) -> List[Tuple[int, int]]:
+    """
+    Tiles a skill may target, in row-major order.
+
+    The cached geometry mask narrows the board first; with validate=True each
+    remaining tile is confirmed with the skill's own can_use().
+
+    Args:
+        skill: Skill being targeted
+        unit: Unit using it
+        game: Game instance
+        validate: Also require skill.can_use() for each tile
+
+    Returns:
+        List of (y, x) tiles
+    """
+    tiles = sorted(game.targeting.tiles(skill_origin(unit), skill.target_geometry(unit, game)))
+    if not validate:
+        return tiles
+    return [pos for pos in tiles if skill.can_use(unit, pos, game)]
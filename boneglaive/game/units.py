@@ -1271,8 +1271,6 @@ class Unit:
 
                 elif unit.player == self.player and unit != self:
                     # Ally unit - cleanse ONE random negative status effect
-                    import random
-
                     # Build list of available effects to cleanse (name, clear_function pairs)
                     available_effects = []
 
@@ -1449,7 +1447,7 @@ class Unit:
 
                     # If any effects are available, randomly pick ONE to cleanse
                     if available_effects:
-                        effect_name, clear_function = random.choice(available_effects)
+                        effect_name, clear_function = game.rng.choice(available_effects)
                         clear_function()
 
                         # Log the single cleansed effect
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Animation Timeline
+One scheduler for the renderer's animation objects, with per-animation cost.
+
+Skill animations, projectiles and persistent zones are objects with
+update(delta_time) -> still_active and draw(surface). The renderer used to
+keep them in two ad-hoc lists, each updated by its own loop in three
+places. AnimationTimeline owns those lists as named tracks:
+
+    background   persistent zones and environmental effects, drawn first and
+                 never blocking the turn flow
+    active       skill animations the turn waits for
+
+Tracks are plain lists that are only ever changed in place, so code that
+appends to renderer.active_animations keeps working. Every update() and
+draw() call is timed and charged to the animation's class, so the report
+shows which effects cost the frame its time. An animation the timeline drops
+has its scratch surfaces released.
+"""
+
+import time
+from typing import Callable, Dict, List, Optional
+from boneglaive.utils.debug import logger
+from boneglaive.graphical.animations.scratch_surfaces import release_scratch
+
+# Track names, in draw order
+TRACKS = ("background", "active")
+
+# A single update() or draw() call slower than this is logged (ms)
+ANIMATION_HITCH_MS = 4.0
+
+
+class AnimationCost:
+    """Accumulated cost of one animation class."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.finished = 0        # Instances that ran to completion
+        self.updates = 0         # update() calls across all instances
+        self.update_ms = 0.0
+        self.draws = 0
+        self.draw_ms = 0.0
+        self.worst_ms = 0.0      # Slowest single update or draw call
+
+    @property
+    def total_ms(self) -> float:
+        return self.update_ms + self.draw_ms
+
+    def summary(self) -> str:
+        update_avg = self.update_ms / self.updates if self.updates else 0.0
+        draw_avg = self.draw_ms / self.draws if self.draws else 0.0
+        return (f"{self.name}: {self.total_ms:.1f} ms over {self.updates} frames "
+                f"(update {update_avg:.3f} ms, draw {draw_avg:.3f} ms per frame, "
+                f"worst {self.worst_ms:.2f} ms), {self.finished} finished")
+
+
+class AnimationTimeline:
+    """Named animation tracks updated and drawn in one place."""
+
+    def __init__(self):
+        self.tracks: Dict[str, List] = {name: [] for name in TRACKS}
+        self.costs: Dict[str, AnimationCost] = {}
+
+    def track(self, name: str) -> List:
+        """The live list of a track (changed in place, safe to keep)."""
+        return self.tracks[name]
+
+    def play(self, animation, track: str = "active") -> None:
+        """Schedule an animation on a track."""
+        self.tracks[track].append(animation)
+
+    def is_playing(self, track: str = "active") -> bool:
+        return bool(self.tracks[track])
+
+    def clear(self) -> None:
+        """Drop every scheduled animation."""
+        for animations in self.tracks.values():
+            for animation in animations:
+                release_scratch(animation)
+            animations.clear()
+
+    def _cost(self, animation) -> AnimationCost:
+        name = type(animation).__name__
+        cost = self.costs.get(name)
+        if cost is None:
+            cost = self.costs[name] = AnimationCost(name)
+        return cost
+
+    def update(self, delta_time: float, track: str = "active",
+               after: Optional[Callable[[object, bool], None]] = None) -> None:
+        """
+        Advance every animation on a track and drop the finished ones.
+
+        Args:
+            delta_time: Seconds since the last frame
+            track: Track to advance
+            after: Called with (animation, still_active) after each update; it
+                may schedule more animations, which are advanced this frame too
+        """
+        animations = self.tracks[track]
+        survivors = []
+        i = 0
+        while i < len(animations):
+            animation = animations[i]
+            i += 1
+            start = time.perf_counter()
+            still_active = animation.update(delta_time)
+            elapsed = (time.perf_counter() - start) * 1000.0
+
+            cost = self._cost(animation)
+            cost.updates += 1
+            cost.update_ms += elapsed
+            if elapsed > cost.worst_ms:
+                cost.worst_ms = elapsed
+            if elapsed > ANIMATION_HITCH_MS:
+                logger.debug(f"Animation hitch: {cost.name}.update took {elapsed:.1f} ms")
+
+            if after is not None:
+                after(animation, still_active)
+            if still_active:
+                survivors.append(animation)
+            else:
+                cost.finished += 1
+                release_scratch(animation)
+        animations[:] = survivors
+
+    def draw(self, surface) -> None:
+        """Draw every track, background first."""
+        for name in TRACKS:
+            for animation in self.tracks[name]:
+                start = time.perf_counter()
+                animation.draw(surface)
+                elapsed = (time.perf_counter() - start) * 1000.0
+
+                cost = self._cost(animation)
+                cost.draws += 1
+                cost.draw_ms += elapsed
+                if elapsed > cost.worst_ms:
+                    cost.worst_ms = elapsed
+                if elapsed > ANIMATION_HITCH_MS:
+                    logger.debug(f"Animation hitch: {cost.name}.draw took {elapsed:.1f} ms")
+
+    def most_expensive(self, count: int = 5) -> List[AnimationCost]:
+        """The animation classes that cost the most time overall."""
+        return sorted(self.costs.values(), key=lambda cost: cost.total_ms, reverse=True)[:count]
+
+    def summary(self, count: int = 5) -> str:
+        """Cost report of the most expensive animation classes."""
+        if not self.costs:
+            return "Animations: none played"
+        total = sum(cost.total_ms for cost in self.costs.values())
+        lines = [f"Animations: {len(self.costs)} kinds, {total:.1f} ms total"]
+        lines.extend("  " + cost.summary() for cost in self.most_expensive(count))
+        return "\n".join(lines)
@@ -13,6 +13,9 @@ from .core import (
     StatusIconFlash
 )
 
+from .particle_pool import ParticlePool
+from .scratch_surfaces import ScratchSurfaces
+
 from .core_animations import (
     RespawnAnimation,
 )
@@ -123,6 +126,8 @@ __all__ = [
     # Core
     'Particle',
     'ParticleEmitter',
+    'ParticlePool',
+    'ScratchSurfaces',
     'AnimatedUnit',
     'FloatingText',
     'DebrisParticle',
@@ -3,8 +3,12 @@
 import pygame
 import random
 import math
-from typing import List, Tuple
-from boneglaive.utils.paths import load_svg
+import numpy as np
+from typing import Tuple
+from boneglaive.utils.paths import asset_path
+from boneglaive.graphical.asset_manager import asset_manager, STATUS_ICON_SIZE, STATUS_POPUP_ICON_SIZE
+from boneglaive.graphical.animations.particle_pool import PARTICLE_CAPACITY, ParticlePool
+from boneglaive.graphical.ui.font_utils import get_font, render_text
 
 
 # Constants (shared across all modules)
@@ -12,8 +16,8 @@ from boneglaive.utils.paths import load_svg
 # Import it from the renderer to stay in sync
 def _get_tile_size():
     """Get dynamic tile size from config-based calculations."""
-    from boneglaive.utils.config import ConfigManager
-    config = ConfigManager()
+    from boneglaive.utils.config import get_config
+    config = get_config()
     screen_width = config.get('window_width', 1280)
     left_panel_ratio = 0.21875  # 280/1280
     game_board_width = screen_width * (1 - 2 * left_panel_ratio)
@@ -75,99 +79,107 @@ class Particle:
         surface.blit(particle_surf, (int(self.x - self.size), int(self.y - self.size)))
 
 
+class PooledParticles:
+    """
+    List-like view of a ParticleEmitter's pool.
+
+    Animations add their own Particle objects with append(); the particle is
+    copied into the pool, so change it before appending, not after.
+    """
+    def __init__(self, pool: ParticlePool):
+        self.pool = pool
+
+    def append(self, particle: Particle) -> None:
+        self.pool.spawn(particle.x, particle.y, particle.vx, particle.vy, particle.color,
+                        particle.size, particle.lifetime, particle.gravity, particle.fade,
+                        particle.max_lifetime)
+
+    def extend(self, particles) -> None:
+        for particle in particles:
+            self.append(particle)
+
+    def __len__(self) -> int:
+        return self.pool.count
+
+    def __iter__(self):
+        """Snapshots of the live particles (changing them does not affect the pool)."""
+        for i in range(self.pool.count):
+            x, y, vx, vy, color, size, life, max_life, gravity, fade = self.pool.row(i)
+            particle = Particle(x, y, vx, vy, color, size, max_life)
+            particle.lifetime = life
+            particle.gravity = gravity
+            particle.fade = fade
+            yield particle
+
+
 class ParticleEmitter:
-    """Manages particle effects."""
-    def __init__(self):
-        self.particles: List[Particle] = []
+    """Manages particle effects, stored in a fixed-capacity ParticlePool."""
+    def __init__(self, capacity: int = PARTICLE_CAPACITY):
+        self.pool = ParticlePool(capacity)
+        self.particles = PooledParticles(self.pool)
+
+    def _radial(self, count, speed_min, speed_max):
+        """Velocities of count particles thrown in random directions."""
+        rng = self.pool.rng
+        angle = rng.uniform(0, 2 * math.pi, count)
+        speed = rng.uniform(speed_min, speed_max, count)
+        return np.cos(angle) * speed, np.sin(angle) * speed
 
     def emit_burst(self, x, y, color, count=20):
         """Emit a burst of particles (explosions, impacts)."""
-        for _ in range(count):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(50, 150)
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed
-            size = random.uniform(2, 5)
-            lifetime = random.uniform(0.3, 0.8)
-            particle = Particle(x, y, vx, vy, color, size, lifetime)
-            particle.gravity = 200
-            self.particles.append(particle)
+        rng = self.pool.rng
+        vx, vy = self._radial(count, 50, 150)
+        self.pool.spawn_many(x, y, vx, vy, color, rng.uniform(2, 5, count), rng.uniform(0.3, 0.8, count),
+                             gravity=200)
 
     def emit_trail(self, x, y, color, count=5):
         """Emit trailing particles (movement trails)."""
-        for _ in range(count):
-            vx = random.uniform(-20, 20)
-            vy = random.uniform(-20, 20)
-            size = random.uniform(1, 3)
-            lifetime = random.uniform(0.2, 0.5)
-            self.particles.append(Particle(x, y, vx, vy, color, size, lifetime))
+        rng = self.pool.rng
+        self.pool.spawn_many(x, y, rng.uniform(-20, 20, count), rng.uniform(-20, 20, count), color,
+                             rng.uniform(1, 3, count), rng.uniform(0.2, 0.5, count))
 
     def emit_float(self, x, y, color, count=10):
         """Emit floating particles (healing, buffs)."""
-        for _ in range(count):
-            vx = random.uniform(-10, 10)
-            vy = random.uniform(-60, -20)
-            size = random.uniform(2, 4)
-            lifetime = random.uniform(0.5, 1.5)
-            self.particles.append(Particle(x, y, vx, vy, color, size, lifetime))
+        rng = self.pool.rng
+        self.pool.spawn_many(x, y, rng.uniform(-10, 10, count), rng.uniform(-60, -20, count), color,
+                             rng.uniform(2, 4, count), rng.uniform(0.5, 1.5, count))
 
     def emit_beam(self, x1, y1, x2, y2, color, count=30):
         """Emit particles along a beam (ranged attacks)."""
-        for i in range(count):
-            t = i / count
-            x = x1 + (x2 - x1) * t
-            y = y1 + (y2 - y1) * t
-            vx = random.uniform(-5, 5)
-            vy = random.uniform(-5, 5)
-            size = random.uniform(2, 4)
-            lifetime = random.uniform(0.1, 0.3)
-            self.particles.append(Particle(x, y, vx, vy, color, size, lifetime))
+        rng = self.pool.rng
+        t = np.arange(count) / count
+        self.pool.spawn_many(x1 + (x2 - x1) * t, y1 + (y2 - y1) * t,
+                             rng.uniform(-5, 5, count), rng.uniform(-5, 5, count), color,
+                             rng.uniform(2, 4, count), rng.uniform(0.1, 0.3, count))
 
     def emit_blood_explosion(self, x, y, count=80):
         """Emit a blood explosion (death animation)."""
+        rng = self.pool.rng
         # Blood color palette (various shades of red/crimson)
-        blood_colors = [
+        blood_colors = np.array([
             (180, 0, 0),    # Dark red
             (220, 20, 20),  # Blood red
             (160, 10, 10),  # Deep crimson
             (200, 30, 30),  # Bright blood
             (140, 0, 0),    # Very dark red
-        ]
+        ])
 
-        for _ in range(count):
-            angle = random.uniform(0, 2 * math.pi)
-            # Explosive outward burst with variation
-            speed = random.uniform(100, 300)
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed
-            # Varied particle sizes for chunky blood splatter
-            size = random.uniform(3, 8)
-            lifetime = random.uniform(0.5, 1.2)
-            color = random.choice(blood_colors)
-            particle = Particle(x, y, vx, vy, color, size, lifetime)
-            # Heavy gravity for realistic blood drops
-            particle.gravity = 400
-            self.particles.append(particle)
+        # Explosive outward burst with variation, chunky varied sizes,
+        # heavy gravity for realistic blood drops
+        vx, vy = self._radial(count, 100, 300)
+        self.pool.spawn_many(x, y, vx, vy, blood_colors[rng.integers(0, len(blood_colors), count)],
+                             rng.uniform(3, 8, count), rng.uniform(0.5, 1.2, count), gravity=400)
 
         # Add some slower drifting blood mist
-        for _ in range(20):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(20, 60)
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed
-            size = random.uniform(2, 4)
-            lifetime = random.uniform(0.8, 1.5)
-            color = (120, 0, 0)  # Darker mist
-            particle = Particle(x, y, vx, vy, color, size, lifetime)
-            particle.gravity = 100
-            self.particles.append(particle)
+        vx, vy = self._radial(20, 20, 60)
+        self.pool.spawn_many(x, y, vx, vy, (120, 0, 0), rng.uniform(2, 4, 20), rng.uniform(0.8, 1.5, 20),
+                             gravity=100)
 
     def update(self, delta_time):
-        self.particles = [p for p in self.particles if p.update(delta_time)]
+        self.pool.update(delta_time)
 
     def draw(self, surface):
-        for particle in self.particles:
-            particle.draw(surface)
+        self.pool.draw(surface)
 
 
 class VaporParticleCloud:
@@ -409,7 +421,7 @@ class AnimatedUnit:
 
         # Load sprite if path provided
         if sprite_path:
-            self.sprite = load_svg(sprite_path, TILE_SIZE, TILE_SIZE)
+            self.sprite = asset_manager.surface(sprite_path, TILE_SIZE, TILE_SIZE)
             if self.sprite is None:
                 # Fallback: create a colored circle placeholder
                 self.sprite = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
@@ -663,9 +675,9 @@ class AnimatedUnit:
         if effect_name in self._status_icon_cache:
             return self._status_icon_cache[effect_name]
 
-        icon_size = 64
-        icon_path = f"graphics/status_icons/{effect_name}.svg"
-        icon_surface = load_svg(icon_path, icon_size, icon_size)
+        icon_size = STATUS_ICON_SIZE
+        icon_path = asset_path(f"graphics/status_icons/{effect_name}.svg")
+        icon_surface = asset_manager.surface(icon_path, icon_size, icon_size)
         if icon_surface is None:
             # Fallback: colored circle placeholder
             icon_surface = pygame.Surface((icon_size, icon_size), pygame.SRCALPHA)
@@ -677,14 +689,58 @@ class AnimatedUnit:
         self._status_icon_cache[effect_name] = icon_surface
         return icon_surface
 
-    def draw(self, surface, font):
-        # Calculate final position
+    def _draw_position(self):
+        """Centre draw() puts the sprite at: position plus shake, hop and respawn offsets."""
         final_x = int(self.x + self.shake_x)
         final_y = int(self.y + self.shake_y - self.hop_offset)
-
-        # Apply respawn animation offset (if active)
         if hasattr(self, 'respawn_y_offset') and self.respawn_y_offset > 0:
             final_y += int(self.respawn_y_offset)
+        return final_x, final_y
+
+    def draw_state(self):
+        """
+        Everything draw() depends on, to tell whether the unit looks different from last frame.
+
+        Returns:
+            A comparable tuple, or None while the unit changes every frame on its own
+            (aura, vapor cloud, Karrier Rave scan lines)
+        """
+        game_unit = self.game_unit
+        if (self.potpourri_aura_active or self.vapor_cloud
+                or getattr(game_unit, 'carrier_rave_active', False)):
+            return None
+
+        has_attack = bool(getattr(game_unit, 'attack_target', None))
+        has_skill = bool(getattr(game_unit, 'skill_target', None))
+        banished = getattr(game_unit, 'banished_unit', None)
+        return (
+            self._draw_position(), int(self.x), int(self.y), id(self.sprite), self.color,
+            getattr(self, 'wind_up_rotation', 0), getattr(self, 'respawn_rotation', 0),
+            # The orbiting glaives and tools turn every frame while shown
+            has_attack and self.glaive_rotation, has_skill and not has_attack and self.tool_orbit_angle,
+            getattr(game_unit, 'is_doppelganger', False), banished and banished.type,
+            self.status_flash_timer, id(self.status_flash_icon),
+        )
+
+    def draw_bounds(self) -> pygame.Rect:
+        """Screen rect covering everything draw() can paint this frame."""
+        final_x, final_y = self._draw_position()
+        # Rotated tile sprite, orbiting 24 px glaives/tools, centre glow, status icon
+        reach = max(int(TILE_SIZE * 0.75), self.radius + 15 + 18, 30, STATUS_ICON_SIZE // 2, self.radius * 2)
+        if self.vapor_cloud:
+            reach = max(reach, TILE_SIZE)
+        bounds = pygame.Rect(final_x - reach, final_y - reach, reach * 2, reach * 2)
+        # Player outline on the unit's tile
+        bounds.union_ip(pygame.Rect(int(self.x) - TILE_SIZE // 2, int(self.y) - TILE_SIZE // 2, TILE_SIZE, TILE_SIZE))
+        for particle in self.potpourri_aura_particles:
+            extent = int(particle['size']) + 5
+            bounds.union_ip(pygame.Rect(int(particle['x']) - extent, int(particle['y']) - extent,
+                                        extent * 2, extent * 2))
+        return bounds.inflate(4, 4)
+
+    def draw(self, surface, font):
+        # Calculate final position (shake, hop and respawn offsets applied)
+        final_x, final_y = self._draw_position()
 
         # Draw potpourri aura particles (behind unit)
         if self.potpourri_aura_active:
@@ -896,8 +952,8 @@ class AnimatedUnit:
                             doppelganger_base_sprite = getattr(self, base_cache_key)
                         else:
                             # Load the sprite ONCE and cache it
-                            sprite_path = f"graphics/units/{banished_unit_type_name}.svg"
-                            loaded_sprite = load_svg(sprite_path, TILE_SIZE, TILE_SIZE)
+                            sprite_path = asset_path(f"graphics/units/{banished_unit_type_name}.svg")
+                            loaded_sprite = asset_manager.surface(sprite_path, TILE_SIZE, TILE_SIZE)
                             if loaded_sprite:
                                 doppelganger_base_sprite = loaded_sprite
                                 # Cache the loaded base sprite
@@ -1103,12 +1159,8 @@ class FloatingText:
         oscillation = math.sin(self.timer * 10) * 5
         display_y = int(self.y + oscillation)
 
-        # Create larger, bolder font (matching Autoclave style)
-        font_size = 48
-        try:
-            display_font = pygame.font.Font(None, font_size)
-        except:
-            display_font = pygame.font.SysFont('Arial', font_size, bold=True)
+        # Larger, bolder font (matching Autoclave style), shared across frames
+        display_font = get_font(None, 48)
 
         # Calculate outline color that flashes (dark to bright)
         outline_base_dark = (
@@ -1129,15 +1181,13 @@ class FloatingText:
         )
 
         # Draw 4-corner outline/shadow with flashing effect
-        outline_surf = display_font.render(self.text, True, outline_color)
-        outline_surf.set_alpha(alpha)
+        outline_surf = render_text(display_font, self.text, True, outline_color, alpha=alpha)
         for dx, dy in [(-2, -2), (2, -2), (-2, 2), (2, 2)]:
             outline_rect = outline_surf.get_rect(center=(int(self.x + dx), display_y + dy))
             surface.blit(outline_surf, outline_rect)
 
         # Draw main text
-        text_surf = display_font.render(self.text, True, self.color)
-        text_surf.set_alpha(alpha)
+        text_surf = render_text(display_font, self.text, True, self.color, alpha=alpha)
         text_rect = text_surf.get_rect(center=(int(self.x), display_y))
         surface.blit(text_surf, text_rect)
 
@@ -1245,10 +1295,10 @@ class StatusIconFlash:
 
         # Load icon
         self.icon_surface = None
-        self.icon_size = 96  # Icon size in pixels
-        icon_path = f"graphics/status_icons/{effect_name}.svg"
+        self.icon_size = STATUS_POPUP_ICON_SIZE  # Icon size in pixels
+        icon_path = asset_path(f"graphics/status_icons/{effect_name}.svg")
 
-        self.icon_surface = load_svg(icon_path, self.icon_size, self.icon_size)
+        self.icon_surface = asset_manager.surface(icon_path, self.icon_size, self.icon_size)
         if self.icon_surface is None:
             # Fallback: create colored circle as placeholder
             self.icon_surface = pygame.Surface((self.icon_size, self.icon_size), pygame.SRCALPHA)
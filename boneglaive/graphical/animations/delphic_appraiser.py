@@ -7,6 +7,7 @@ import pygame
 import random
 import math
 from .core import TILE_SIZE
+from .scratch_surfaces import ScratchSurfaces
 from boneglaive.graphical.sound_helper import play_sound
 
 
@@ -16,6 +17,7 @@ class FractureLines:
     White cracks spreading outward in a web pattern.
     """
     def __init__(self, center_x, center_y, camera):
+        self.scratch = ScratchSurfaces()
         self.center_x = center_x  # Already in screen/world space
         self.center_y = center_y  # Already in screen/world space
         self.camera = camera
@@ -67,9 +69,8 @@ class FractureLines:
                 color = (44, 44, 44, alpha)  # Dark gray curse energy
 
                 # Draw line with alpha
-                fracture_surf = pygame.Surface((abs(int(end_x - screen_x)) + 2,
-                                               abs(int(end_y - screen_y)) + 2),
-                                              pygame.SRCALPHA)
+                fracture_surf = self.scratch.get("fracture_surf", (abs(int(end_x - screen_x)) + 2,
+                                               abs(int(end_y - screen_y)) + 2))
                 local_start = (min(0, int(end_x - screen_x)), min(0, int(end_y - screen_y)))
                 local_end = (max(0, int(end_x - screen_x)), max(0, int(end_y - screen_y)))
                 pygame.draw.line(fracture_surf, color, local_start, local_end, 2)
@@ -82,6 +83,7 @@ class VortexEffect:
     Gold particles getting sucked into the center.
     """
     def __init__(self, center_x, center_y, camera, particle_emitter):
+        self.scratch = ScratchSurfaces()
         self.center_x = center_x  # Already in screen/world space
         self.center_y = center_y  # Already in screen/world space
         self.camera = camera
@@ -145,7 +147,7 @@ class VortexEffect:
 
             # Draw particle
             if p['size'] > 0.5:
-                particle_surf = pygame.Surface((int(p['size'] * 2), int(p['size'] * 2)), pygame.SRCALPHA)
+                particle_surf = self.scratch.get("particle_surf", (int(p['size'] * 2), int(p['size'] * 2)))
                 pygame.draw.circle(particle_surf, color, (int(p['size']), int(p['size'])), int(p['size']))
                 surface.blit(particle_surf, (int(px - p['size']), int(py - p['size'])))
 
@@ -156,6 +158,7 @@ class ShockwaveRing:
     Multiple rings create implosion effect.
     """
     def __init__(self, center_x, center_y, camera, delay=0):
+        self.scratch = ScratchSurfaces()
         self.center_x = center_x
         self.center_y = center_y
         self.camera = camera
@@ -188,7 +191,7 @@ class ShockwaveRing:
 
         # Draw ring
         if radius > 0:
-            ring_surf = pygame.Surface((radius * 2 + 10, radius * 2 + 10), pygame.SRCALPHA)
+            ring_surf = self.scratch.get("ring_surf", (radius * 2 + 10, radius * 2 + 10))
             pygame.draw.circle(ring_surf, color, (radius + 5, radius + 5), radius, 4)
             surface.blit(ring_surf, (int(screen_x - radius - 5), int(screen_y - radius - 5)))
 
@@ -364,6 +367,7 @@ class DivineDrepreciationAnimation:
             game: Game instance to access map/furniture data
             Other args standard from AnimationFactory
         """
+        self.scratch = ScratchSurfaces()
         self.caster = caster_unit
         self.target_pos = target_pos  # (grid_y, grid_x) furniture position
         self.camera = camera
@@ -578,7 +582,7 @@ class DivineDrepreciationAnimation:
             alpha = int(self.glow_intensity * 150)
 
             # Draw glow circle
-            glow_surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            glow_surf = self.scratch.get("glow_surf", (radius * 2, radius * 2))
             pygame.draw.circle(glow_surf, (*color, alpha), (radius, radius), radius)
             surface.blit(glow_surf, (int(screen_x - radius), int(screen_y - radius)))
 
@@ -602,7 +606,7 @@ class DivineDrepreciationAnimation:
             overlay_size = TILE_SIZE * 7
             alpha = int(self.glow_intensity * 60)  # Faint overlay
 
-            overlay_surf = pygame.Surface((overlay_size, overlay_size), pygame.SRCALPHA)
+            overlay_surf = self.scratch.get("overlay_surf", (overlay_size, overlay_size))
             pygame.draw.rect(overlay_surf, (42, 42, 42, alpha), overlay_surf.get_rect())  # Dark curse aftermath
             surface.blit(overlay_surf, (int(screen_x - overlay_size // 2), int(screen_y - overlay_size // 2)))
 
@@ -616,6 +620,7 @@ class PodiumRise:
     Brown wooden podium rising from the ground with dust particles and ground cracks.
     """
     def __init__(self, x, y, camera, start_delay=0.0):
+        self.scratch = ScratchSurfaces()
         self.x = x
         self.y = y
         self.camera = camera
@@ -672,7 +677,7 @@ class PodiumRise:
 
         if podium_height > 0:
             # Create trapezoid shape for podium
-            podium_surf = pygame.Surface((base_width, podium_height), pygame.SRCALPHA)
+            podium_surf = self.scratch.get("podium_surf", (base_width, podium_height))
 
             # Draw main body with enhanced wood grain
             for i in range(podium_height):
@@ -705,7 +710,7 @@ class PodiumRise:
                 alpha = int(140 * (0.6 - progress) / 0.6)  # Fade as podium rises
                 if alpha > 0:
                     size = random.choice([2, 3, 4])
-                    dust_surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+                    dust_surf = self.scratch.get("dust_surf", (size * 2, size * 2))
                     pygame.draw.circle(dust_surf, (101, 67, 33, alpha), (size, size), size)
                     surface.blit(dust_surf, (int(px - size), int(py - size)))
 
@@ -718,7 +723,7 @@ class PodiumRise:
                 px = screen_x + math.cos(angle) * dist
                 py = screen_y - progress * 8
 
-                debris_surf = pygame.Surface((5, 5), pygame.SRCALPHA)
+                debris_surf = self.scratch.get("debris_surf", (5, 5))
                 pygame.draw.rect(debris_surf, (76, 50, 25, debris_alpha), (0, 0, 4, 4))
                 surface.blit(debris_surf, (int(px), int(py)))
 
@@ -728,6 +733,7 @@ class AuctioneerGhost:
     Dark ghostly auctioneer figure with detailed skull, cloak, and wispy trails.
     """
     def __init__(self, x, y, camera, start_delay=0.0):
+        self.scratch = ScratchSurfaces()
         self.x = x
         self.y = y
         self.camera = camera
@@ -777,12 +783,12 @@ class AuctioneerGhost:
                 wisp_x = screen_x + math.cos(angle) * radius
                 wisp_y = auctioneer_y + 10 + math.sin(angle) * radius
 
-                wisp_surf = pygame.Surface((6, 6), pygame.SRCALPHA)
+                wisp_surf = self.scratch.get("wisp_surf", (6, 6))
                 pygame.draw.circle(wisp_surf, (42, 42, 52, wisp_alpha), (3, 3), 3)
                 surface.blit(wisp_surf, (int(wisp_x - 3), int(wisp_y - 3)))
 
         # Draw ghostly cloak (flowing shape below skull)
-        cloak_surf = pygame.Surface((32, 40), pygame.SRCALPHA)
+        cloak_surf = self.scratch.get("cloak_surf", (32, 40))
         cloak_alpha = int(alpha * 0.7)
 
         # Cloak billows slightly
@@ -800,7 +806,7 @@ class AuctioneerGhost:
         surface.blit(cloak_surf, (int(screen_x - 16), int(auctioneer_y + 5)))
 
         # Draw skull with more detail
-        skull_surf = pygame.Surface((24, 28), pygame.SRCALPHA)
+        skull_surf = self.scratch.get("skull_surf", (24, 28))
 
         # Skull main shape (oval)
         pygame.draw.ellipse(skull_surf, bone_color, (2, 0, 20, 24))
@@ -859,6 +865,7 @@ class GavelSlam:
     Impact rings and visual effects when gavel slams down.
     """
     def __init__(self, x, y):
+        self.scratch = ScratchSurfaces()
         self.x = x
         self.y = y
         self.timer = 0
@@ -885,7 +892,7 @@ class GavelSlam:
             alpha = int(180 * (1 - ring_progress))
 
             if alpha > 0 and radius < 40:
-                ring_surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+                ring_surf = self.scratch.get("ring_surf", (radius * 2, radius * 2))
                 # Gold/brown impact rings
                 pygame.draw.circle(ring_surf, (218, 165, 32, alpha), (radius, radius), radius, 3)
                 surface.blit(ring_surf, (int(self.x - radius), int(self.y - radius)))
@@ -896,6 +903,7 @@ class CurseBeam:
     Twisted crimson curse energy beam with spiral pattern and particles.
     """
     def __init__(self, start_x, start_y, target_x, target_y, camera, start_delay=0.0):
+        self.scratch = ScratchSurfaces()
         self.start_x = start_x
         self.start_y = start_y
         self.target_x = target_x
@@ -992,7 +1000,7 @@ class CurseBeam:
 
                         particle_alpha = int(180 * (1 - t) * progress)
                         if particle_alpha > 0:
-                            particle_surf = pygame.Surface((4, 4), pygame.SRCALPHA)
+                            particle_surf = self.scratch.get("particle_surf", (4, 4))
                             pygame.draw.circle(particle_surf, (42, 42, 42, particle_alpha), (2, 2), 2)
                             surface.blit(particle_surf, (int(px - 2), int(py - 2)))
 
@@ -1040,6 +1048,7 @@ class AuctionCurseAnimation:
             target_pos: (grid_y, grid_x) - the cursed enemy unit
             game: Game instance to access map/furniture data
         """
+        self.scratch = ScratchSurfaces()
         self.caster = caster_unit
         self.target_unit = target_unit
         self.target_pos = target_pos
@@ -1239,14 +1248,14 @@ class AuctionCurseAnimation:
             # Inner golden aura
             if base_alpha > 0:
                 inner_radius = int(25 + 8 * pulse)
-                inner_surf = pygame.Surface((inner_radius * 2, inner_radius * 2), pygame.SRCALPHA)
+                inner_surf = self.scratch.get("inner_surf", (inner_radius * 2, inner_radius * 2))
                 pygame.draw.circle(inner_surf, (218, 165, 32, base_alpha), (inner_radius, inner_radius), inner_radius)
                 surface.blit(inner_surf, (int(self.target_x - inner_radius), int(self.target_y - inner_radius)))
 
                 # Outer golden expanding ring
                 outer_radius = int(35 + 12 * pulse)
                 outer_alpha = int(base_alpha * 0.6)
-                outer_surf = pygame.Surface((outer_radius * 2, outer_radius * 2), pygame.SRCALPHA)
+                outer_surf = self.scratch.get("outer_surf", (outer_radius * 2, outer_radius * 2))
                 pygame.draw.circle(outer_surf, (255, 215, 0, outer_alpha), (outer_radius, outer_radius), outer_radius, 3)
                 surface.blit(outer_surf, (int(self.target_x - outer_radius), int(self.target_y - outer_radius)))
 
@@ -1258,7 +1267,7 @@ class AuctionCurseAnimation:
                     ring_alpha = int(base_alpha * (1 - ring_progress) * 0.5)
 
                     if ring_alpha > 0:
-                        ring_surf = pygame.Surface((ring_radius * 2, ring_radius * 2), pygame.SRCALPHA)
+                        ring_surf = self.scratch.get("ring_surf", (ring_radius * 2, ring_radius * 2))
                         pygame.draw.circle(ring_surf, (44, 44, 44, ring_alpha), (ring_radius, ring_radius), ring_radius, 2)
                         surface.blit(ring_surf, (int(self.target_x - ring_radius), int(self.target_y - ring_radius)))
 
@@ -1298,7 +1307,7 @@ class AuctionCurseAnimation:
 
                                 spark_alpha = int(120 * (1 - spark_progress) * (1 - aftermath_progress))
                                 if spark_alpha > 0:
-                                    spark_surf = pygame.Surface((6, 6), pygame.SRCALPHA)
+                                    spark_surf = self.scratch.get("spark_surf", (6, 6))
                                     pygame.draw.circle(spark_surf, (139, 69, 19, spark_alpha), (3, 3), 3)
                                     surface.blit(spark_surf, (int(spark_x - 3), int(spark_y - 3)))
 
@@ -1309,7 +1318,7 @@ class AuctionCurseAnimation:
                         furniture_alpha = int(100 * furniture_pulse * (1 - aftermath_progress))
 
                         if furniture_alpha > 0:
-                            furniture_surf = pygame.Surface((20, 20), pygame.SRCALPHA)
+                            furniture_surf = self.scratch.get("furniture_surf", (20, 20))
                             pygame.draw.circle(furniture_surf, (58, 58, 58, furniture_alpha), (10, 10), 8)
                             surface.blit(furniture_surf, (int(fx - 10), int(fy - 10)))
 
@@ -1323,6 +1332,7 @@ class GoldenScannerBeam:
     Golden appraiser beam that sweeps across the furniture during assessment phase.
     """
     def __init__(self, center_x, center_y, angle, delay=0):
+        self.scratch = ScratchSurfaces()
         self.center_x = center_x
         self.center_y = center_y
         self.angle = angle
@@ -1358,7 +1368,7 @@ class GoldenScannerBeam:
 
         # Bright point at end
         if beam_length > 10:
-            point_surf = pygame.Surface((8, 8), pygame.SRCALPHA)
+            point_surf = self.scratch.get("point_surf", (8, 8))
             pygame.draw.circle(point_surf, (255, 235, 100, alpha), (4, 4), 4)
             surface.blit(point_surf, (int(end_x - 4), int(end_y - 4)))
 
@@ -1368,6 +1378,7 @@ class TemporalRift:
     Swirling golden portal/rift opening with clock particles and temporal distortion.
     """
     def __init__(self, center_x, center_y):
+        self.scratch = ScratchSurfaces()
         self.center_x = center_x
         self.center_y = center_y
         self.timer = 0
@@ -1412,7 +1423,7 @@ class TemporalRift:
                 else:
                     color = (218, 165, 32, alpha)
 
-                ring_surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+                ring_surf = self.scratch.get("ring_surf", (radius * 2, radius * 2))
                 pygame.draw.circle(ring_surf, color, (radius, radius), radius, 3)
                 surface.blit(ring_surf, (int(self.center_x - radius), int(self.center_y - radius)))
 
@@ -1429,7 +1440,7 @@ class TemporalRift:
                 alpha = int(220 * progress)
 
                 # Draw arrow based on symbol
-                arrow_surf = pygame.Surface((6, 6), pygame.SRCALPHA)
+                arrow_surf = self.scratch.get("arrow_surf", (6, 6))
                 if p['symbol'] == 0:  # Up arrow
                     points = [(3, 1), (1, 4), (5, 4)]
                 elif p['symbol'] == 1:  # Right arrow
@@ -1448,6 +1459,7 @@ class InvestmentAnchor:
     Golden anchor symbol that materializes and embeds into furniture.
     """
     def __init__(self, center_x, center_y):
+        self.scratch = ScratchSurfaces()
         self.center_x = center_x
         self.center_y = center_y
         self.timer = 0
@@ -1473,7 +1485,7 @@ class InvestmentAnchor:
         anchor_y = self.center_y + y_offset
 
         # Draw anchor symbol (T shape)
-        anchor_surf = pygame.Surface((20, 20), pygame.SRCALPHA)
+        anchor_surf = self.scratch.get("anchor_surf", (20, 20))
 
         # Horizontal bar
         pygame.draw.line(anchor_surf, (255, 215, 0, alpha),
@@ -1501,7 +1513,7 @@ class InvestmentAnchor:
             wave_radius = int(20 + embed_progress * 25)
             wave_alpha = int(150 * (1 - embed_progress))
 
-            wave_surf = pygame.Surface((wave_radius * 2, wave_radius * 2), pygame.SRCALPHA)
+            wave_surf = self.scratch.get("wave_surf", (wave_radius * 2, wave_radius * 2))
             pygame.draw.circle(wave_surf, (255, 215, 0, wave_alpha),
                              (wave_radius, wave_radius), wave_radius, 2)
             surface.blit(wave_surf, (int(self.center_x - wave_radius),
@@ -1591,6 +1603,7 @@ class MarketFuturesAnimation:
             game: Game instance to access map/furniture data
             Other args standard from AnimationFactory
         """
+        self.scratch = ScratchSurfaces()
         self.caster = caster_unit
         self.target_pos = target_pos  # (grid_y, grid_x) furniture position
         self.camera = camera
@@ -1731,14 +1744,14 @@ class MarketFuturesAnimation:
             # Gold color
             color = (255, 215, 0)
 
-            glow_surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            glow_surf = self.scratch.get("glow_surf", (radius * 2, radius * 2))
             pygame.draw.circle(glow_surf, (*color, alpha), (radius, radius), radius)
             surface.blit(glow_surf, (int(self.target_x - radius), int(self.target_y - radius)))
 
             # Outer ring
             outer_radius = int(radius * 1.3)
             outer_alpha = int(alpha * 0.5)
-            outer_surf = pygame.Surface((outer_radius * 2, outer_radius * 2), pygame.SRCALPHA)
+            outer_surf = self.scratch.get("outer_surf", (outer_radius * 2, outer_radius * 2))
             pygame.draw.circle(outer_surf, (218, 165, 32, outer_alpha),
                              (outer_radius, outer_radius), outer_radius, 3)
             surface.blit(outer_surf, (int(self.target_x - outer_radius),
@@ -1770,7 +1783,7 @@ class MarketFuturesAnimation:
                                   (0.5 + 0.5 * math.sin(self.timer * 8 + i)))
 
                 if sparkle_alpha > 0:
-                    sparkle_surf = pygame.Surface((4, 4), pygame.SRCALPHA)
+                    sparkle_surf = self.scratch.get("sparkle_surf", (4, 4))
                     pygame.draw.circle(sparkle_surf, (255, 235, 100, sparkle_alpha), (2, 2), 2)
                     surface.blit(sparkle_surf, (int(sx - 2), int(sy - 2)))
 
@@ -1896,6 +1909,7 @@ class MarketFuturesTeleportAnimation:
             camera: Camera instance for coordinate conversion
             Other args standard from AnimationFactory
         """
+        self.scratch = ScratchSurfaces()
         self.caster = caster_unit
         self.target_pos = target_pos  # (grid_y, grid_x) destination
         self.camera = camera
@@ -2046,7 +2060,7 @@ class MarketFuturesTeleportAnimation:
         if self.anchor_x and self.anchor_y and self.phase in ["anchor_glow", "dissolve"]:
             radius = int(40 + 10 * math.sin(self.timer * 8))
             alpha = int(self.glow_intensity * 150)
-            glow_surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            glow_surf = self.scratch.get("glow_surf", (radius * 2, radius * 2))
             pygame.draw.circle(glow_surf, (255, 215, 0, alpha), (radius, radius), radius)
             surface.blit(glow_surf, (int(self.anchor_x - radius), int(self.anchor_y - radius)))
 
@@ -2056,7 +2070,7 @@ class MarketFuturesTeleportAnimation:
             radius = int(35 + 8 * math.sin(self.timer * 6))
             alpha = int(self.glow_intensity * 120)
             if alpha > 0:
-                glow_surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+                glow_surf = self.scratch.get("glow_surf", (radius * 2, radius * 2))
                 pygame.draw.circle(glow_surf, (255, 215, 0, alpha), (radius, radius), radius)
                 surface.blit(glow_surf, (int(self.start_x - radius), int(self.start_y - radius)))
 
@@ -2064,7 +2078,7 @@ class MarketFuturesTeleportAnimation:
             # Glow at end position (brightening)
             radius = int(40 + 10 * math.sin(self.timer * 7))
             alpha = int(self.glow_intensity * 160)
-            glow_surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            glow_surf = self.scratch.get("glow_surf", (radius * 2, radius * 2))
             pygame.draw.circle(glow_surf, (255, 215, 0, alpha), (radius, radius), radius)
             surface.blit(glow_surf, (int(self.end_x - radius), int(self.end_y - radius)))
 
@@ -2095,6 +2109,7 @@ class CurseSeethingEffect:
     Particles orbit and pulse with malevolent energy.
     """
     def __init__(self, center_x, center_y):
+        self.scratch = ScratchSurfaces()
         self.center_x = center_x
         self.center_y = center_y
         self.timer = 0
@@ -2132,7 +2147,7 @@ class CurseSeethingEffect:
         aura_alpha = int(140 * progress)
 
         if aura_alpha > 0:
-            aura_surf = pygame.Surface((aura_radius * 2, aura_radius * 2), pygame.SRCALPHA)
+            aura_surf = self.scratch.get("aura_surf", (aura_radius * 2, aura_radius * 2))
             pygame.draw.circle(aura_surf, (44, 44, 44, aura_alpha), (aura_radius, aura_radius), aura_radius)
             surface.blit(aura_surf, (int(self.center_x - aura_radius), int(self.center_y - aura_radius)))
 
@@ -2151,7 +2166,7 @@ class CurseSeethingEffect:
             alpha = int(200 * progress)
 
             if size > 0.5 and alpha > 0:
-                particle_surf = pygame.Surface((int(size * 2), int(size * 2)), pygame.SRCALPHA)
+                particle_surf = self.scratch.get("particle_surf", (int(size * 2), int(size * 2)))
                 pygame.draw.circle(particle_surf, (42, 42, 42, alpha), (int(size), int(size)), int(size))
                 surface.blit(particle_surf, (int(px - size), int(py - size)))
 
@@ -2162,6 +2177,7 @@ class CurseRadiationWave:
     Shows corruption spreading outward to furniture.
     """
     def __init__(self, center_x, center_y, delay=0):
+        self.scratch = ScratchSurfaces()
         self.center_x = center_x
         self.center_y = center_y
         self.timer = -delay
@@ -2185,7 +2201,7 @@ class CurseRadiationWave:
         alpha = int(180 * (1.0 - progress * 0.7))  # Fade as expanding
 
         if radius > 0 and alpha > 0:
-            ring_surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            ring_surf = self.scratch.get("ring_surf", (radius * 2, radius * 2))
             # Dark gray curse color
             pygame.draw.circle(ring_surf, (44, 44, 44, alpha), (radius, radius), radius, 4)
             surface.blit(ring_surf, (int(self.center_x - radius), int(self.center_y - radius)))
@@ -2263,6 +2279,7 @@ class FurnitureCorruptionFlash:
     Shows corruption affecting the furniture.
     """
     def __init__(self, center_x, center_y, delay=0):
+        self.scratch = ScratchSurfaces()
         self.center_x = center_x
         self.center_y = center_y
         self.timer = -delay
@@ -2299,7 +2316,7 @@ class FurnitureCorruptionFlash:
             pulse = (math.sin(self.timer * 15) + 1) / 2
             radius = int(25 + 8 * pulse)
 
-            glow_surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            glow_surf = self.scratch.get("glow_surf", (radius * 2, radius * 2))
             pygame.draw.circle(glow_surf, color, (radius, radius), radius)
             surface.blit(glow_surf, (int(self.center_x - radius), int(self.center_y - radius)))
 
@@ -2591,6 +2608,7 @@ class DelphicAppraiserAstralAttack:
             particle_emitter: ParticleEmitter for effects
             screen_shake_callback: Function(intensity, duration)
         """
+        self.scratch = ScratchSurfaces()
         self.attacker = attacker_unit
         self.target = target_unit
         self.particle_emitter = particle_emitter
@@ -2743,7 +2761,7 @@ class DelphicAppraiserAstralAttack:
             coin_y = int(self.attacker.y - 12 * progress)
             radius = 5
 
-            coin_surf = pygame.Surface((radius * 2 + 4, radius * 2 + 4), pygame.SRCALPHA)
+            coin_surf = self.scratch.get("coin_surf", (radius * 2 + 4, radius * 2 + 4))
             pygame.draw.circle(coin_surf, (*self.color_gold, int(220 * progress)),
                                (radius + 2, radius + 2), radius)
             pygame.draw.circle(coin_surf, (*self.color_white_gold, int(180 * progress)),
@@ -2761,7 +2779,7 @@ class DelphicAppraiserAstralAttack:
             scale_x = max(1, int(7 * abs(math.cos(self.coin_angle))))
             scale_y = 7
 
-            coin_surf = pygame.Surface((scale_x * 2 + 4, scale_y * 2 + 4), pygame.SRCALPHA)
+            coin_surf = self.scratch.get("coin_surf", (scale_x * 2 + 4, scale_y * 2 + 4))
             cx_s = scale_x + 2
             cy_s = scale_y + 2
 
@@ -2781,9 +2799,6 @@ class DelphicAppraiserAstralAttack:
             # Faint glint trail
             if self.coin_progress > 0.05:
                 prev_x, prev_y = self._coin_arc_position(max(0.0, self.coin_progress - 0.12))
-                trail_surf = pygame.Surface((
-                    abs(int(prev_x) - coin_x) + 4,
-                    abs(int(prev_y) - coin_y) + 4), pygame.SRCALPHA)
                 pygame.draw.line(surface, (*self.color_light_gold, 60),
                                  (int(prev_x), int(prev_y)), (coin_x, coin_y), 2)
 
@@ -2794,7 +2809,7 @@ class DelphicAppraiserAstralAttack:
                 flash_alpha = int(220 * (1.0 - progress / 0.5))
                 flash_radius = int(20 * (1.0 + progress))
 
-                flash_surf = pygame.Surface((flash_radius * 2, flash_radius * 2), pygame.SRCALPHA)
+                flash_surf = self.scratch.get("flash_surf", (flash_radius * 2, flash_radius * 2))
                 pygame.draw.circle(flash_surf, (*self.color_gold, flash_alpha),
                                    (flash_radius, flash_radius), flash_radius)
                 center_r = max(1, int(flash_radius * 0.5))
@@ -2835,6 +2850,7 @@ class DeftRerollAnimation:
             game: Game instance to access distortion area
             camera: Camera for coordinate conversion
         """
+        self.scratch = ScratchSurfaces()
         self.caster = caster_unit
         self.camera = camera
         self.particle_emitter = particle_emitter
@@ -2944,7 +2960,7 @@ class DeftRerollAnimation:
             radius = int(30 + 8 * math.sin(self.timer * 8))
             alpha = int(self.glow_intensity * 180)
             if alpha > 0:
-                glow_surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+                glow_surf = self.scratch.get("glow_surf", (radius * 2, radius * 2))
                 pygame.draw.circle(glow_surf, (*self.color_gold, alpha),
                                    (radius, radius), radius)
                 surface.blit(glow_surf, (int(self.caster_x - radius),
@@ -2958,7 +2974,7 @@ class DeftRerollAnimation:
             border_alpha = int(self.glow_intensity * 120)
             if border_alpha > 0:
                 for x, y, _ in self.reroll_positions:
-                    highlight_surf = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
+                    highlight_surf = self.scratch.get("highlight_surf", (TILE_SIZE, TILE_SIZE))
                     pygame.draw.rect(highlight_surf, (*self.color_gold, border_alpha),
                                      highlight_surf.get_rect(), 2)
                     surface.blit(highlight_surf, (int(x - TILE_SIZE // 2),
@@ -2982,6 +2998,7 @@ class DeftRerollAnimation:
 class SoulParticle:
     """Golden soul particle that emerges from corpse and streams to auctioneers."""
     def __init__(self, start_x, start_y, target_x, target_y):
+        self.scratch = ScratchSurfaces()
         self.x = start_x
         self.y = start_y
         self.start_x = start_x
@@ -3015,7 +3032,7 @@ class SoulParticle:
         color = (*self.color, alpha)
         pygame.draw.circle(surface, color, (int(self.x), int(self.y)), int(self.size))
         # Glow
-        glow_surf = pygame.Surface((int(self.size * 6), int(self.size * 6)), pygame.SRCALPHA)
+        glow_surf = self.scratch.get("glow_surf", (int(self.size * 6), int(self.size * 6)))
         pygame.draw.circle(glow_surf, (*self.color, alpha // 4),
                          (int(self.size * 3), int(self.size * 3)), int(self.size * 3))
         surface.blit(glow_surf, (int(self.x - self.size * 3), int(self.y - self.size * 3)))
@@ -3045,6 +3062,7 @@ class AuctionCurseSoulCollectionAnimation:
             camera: Camera for coordinate conversion
             game: Game instance to access map data
         """
+        self.scratch = ScratchSurfaces()
         self.caster = caster_unit
         self.target_unit = target_unit
         self.target_pos = target_pos
@@ -3214,7 +3232,7 @@ class AuctionCurseSoulCollectionAnimation:
             alpha = int(180 * (1.0 - progress))
             if alpha > 0:
                 glow_size = int(40 + progress * 20)
-                glow_surf = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
+                glow_surf = self.scratch.get("glow_surf", (glow_size * 2, glow_size * 2))
                 pygame.draw.circle(glow_surf, (255, 215, 0, alpha),
                                  (glow_size, glow_size), glow_size)
                 surface.blit(glow_surf, (int(self.corpse_x - glow_size),
@@ -7,6 +7,7 @@ import pygame
 import random
 import math
 from .core import TILE_SIZE, Particle, WalkIn
+from .scratch_surfaces import ScratchSurfaces
 from boneglaive.graphical.sound_helper import play_sound
 
 
@@ -29,6 +30,9 @@ class DeltaConfigAnimation:
             game: Game instance for checking upgrade status
             units_list: List of all AnimatedUnits (for enemy abduction)
         """
+        self.scratch = ScratchSurfaces()
+        # The arrival flash grows to 80 px; its surface is sized for that once
+        self.scratch.reserve("flash_surf", (160, 160))
         self.caster_unit = caster_unit
         # NOTE: target_pos is (grid_y, grid_x) format from renderer - UNPACK CORRECTLY!
         self.target_grid_y, self.target_grid_x = target_pos
@@ -347,7 +351,7 @@ class DeltaConfigAnimation:
 
             # Pulsing outer glow
             glow_radius = int(20 + 10 * math.sin(self.timer * 15))
-            glow_surf = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
+            glow_surf = self.scratch.get("glow_surf", (glow_radius * 2, glow_radius * 2))
             pygame.draw.circle(glow_surf, (*self.color_outer, int(120 * progress)),
                              (glow_radius, glow_radius), glow_radius)
             surface.blit(glow_surf, (int(self.source_x - glow_radius),
@@ -355,7 +359,7 @@ class DeltaConfigAnimation:
 
             # Inner glow
             inner_radius = int(glow_radius * 0.6)
-            glow_surf2 = pygame.Surface((inner_radius * 2, inner_radius * 2), pygame.SRCALPHA)
+            glow_surf2 = self.scratch.get("glow_surf2", (inner_radius * 2, inner_radius * 2))
             pygame.draw.circle(glow_surf2, (*self.color_inner, int(180 * progress)),
                              (inner_radius, inner_radius), inner_radius)
             surface.blit(glow_surf2, (int(self.source_x - inner_radius),
@@ -380,7 +384,7 @@ class DeltaConfigAnimation:
                     # Expanding circles on each adjacent tile
                     well_radius = int(TILE_SIZE * 0.3 * well_progress)
                     if well_radius > 2:
-                        well_surf = pygame.Surface((well_radius * 2, well_radius * 2), pygame.SRCALPHA)
+                        well_surf = self.scratch.get("well_surf", (well_radius * 2, well_radius * 2))
                         alpha = int(100 * well_progress)
                         pygame.draw.circle(well_surf, (*self.color_outer, alpha),
                                          (well_radius, well_radius), well_radius, 2)
@@ -390,7 +394,7 @@ class DeltaConfigAnimation:
             # Draw pulsing energy at source
             pulse = 0.8 + 0.2 * math.sin(self.timer * 20)
             glow_radius = int(15 * pulse)
-            glow_surf = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
+            glow_surf = self.scratch.get("glow_surf", (glow_radius * 2, glow_radius * 2))
             pygame.draw.circle(glow_surf, (*self.color_inner, 150),
                              (glow_radius, glow_radius), glow_radius)
             surface.blit(glow_surf, (int(self.source_x - glow_radius),
@@ -429,7 +433,7 @@ class DeltaConfigAnimation:
 
                     # Draw pulsing energy at enemy source
                     enemy_glow_radius = int(12 * pulse)
-                    enemy_glow_surf = pygame.Surface((enemy_glow_radius * 2, enemy_glow_radius * 2), pygame.SRCALPHA)
+                    enemy_glow_surf = self.scratch.get("enemy_glow_surf", (enemy_glow_radius * 2, enemy_glow_radius * 2))
                     pygame.draw.circle(enemy_glow_surf, (*self.color_outer, 120),
                                      (enemy_glow_radius, enemy_glow_radius), enemy_glow_radius)
                     surface.blit(enemy_glow_surf, (int(enemy_source_x - enemy_glow_radius),
@@ -457,7 +461,7 @@ class DeltaConfigAnimation:
                     # Draw small glow at enemy target
                     enemy_target_glow = int(8 * self.pull_progress)
                     if enemy_target_glow > 2:
-                        enemy_target_glow_surf = pygame.Surface((enemy_target_glow * 2, enemy_target_glow * 2), pygame.SRCALPHA)
+                        enemy_target_glow_surf = self.scratch.get("enemy_target_glow_surf", (enemy_target_glow * 2, enemy_target_glow * 2))
                         pygame.draw.circle(enemy_target_glow_surf, (*self.color_outer, 100),
                                          (enemy_target_glow, enemy_target_glow), enemy_target_glow)
                         surface.blit(enemy_target_glow_surf, (int(enemy_target_x - enemy_target_glow),
@@ -499,7 +503,7 @@ class DeltaConfigAnimation:
                     pygame.draw.polygon(surface, (*self.color_outer, alpha), hex_points, 2)
 
                     # Inner glow
-                    inner_glow_surf = pygame.Surface((hex_radius * 2, hex_radius * 2), pygame.SRCALPHA)
+                    inner_glow_surf = self.scratch.get("inner_glow_surf", (hex_radius * 2, hex_radius * 2))
                     pygame.draw.circle(inner_glow_surf, (*self.color_inner, 60),
                                      (hex_radius, hex_radius), hex_radius)
                     surface.blit(inner_glow_surf, (int(interp_x - hex_radius), int(interp_y - hex_radius)))
@@ -507,7 +511,7 @@ class DeltaConfigAnimation:
             # Draw small glow at target
             target_glow = int(10 * self.pull_progress)
             if target_glow > 2:
-                glow_surf3 = pygame.Surface((target_glow * 2, target_glow * 2), pygame.SRCALPHA)
+                glow_surf3 = self.scratch.get("glow_surf3", (target_glow * 2, target_glow * 2))
                 pygame.draw.circle(glow_surf3, (*self.color_outer, 120),
                                  (target_glow, target_glow), target_glow)
                 surface.blit(glow_surf3, (int(self.target_x - target_glow),
@@ -536,7 +540,7 @@ class DeltaConfigAnimation:
             pulse = 0.7 + 0.3 * math.sin(self.timer * 30)
             for x, y in [(self.source_x, self.source_y), (self.target_x, self.target_y)]:
                 glow_radius = int(15 * pulse)
-                glow_surf = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
+                glow_surf = self.scratch.get("glow_surf", (glow_radius * 2, glow_radius * 2))
                 pygame.draw.circle(glow_surf, (*self.color_bright, 200),
                                  (glow_radius, glow_radius), glow_radius)
                 surface.blit(glow_surf, (int(x - glow_radius), int(y - glow_radius)))
@@ -547,7 +551,7 @@ class DeltaConfigAnimation:
                     for x, y in [(enemy_chain_data['source_x'], enemy_chain_data['source_y']),
                                  (enemy_chain_data['target_x'], enemy_chain_data['target_y'])]:
                         glow_radius = int(12 * pulse)
-                        glow_surf = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
+                        glow_surf = self.scratch.get("glow_surf", (glow_radius * 2, glow_radius * 2))
                         pygame.draw.circle(glow_surf, (*self.color_inner, 150),
                                          (glow_radius, glow_radius), glow_radius)
                         surface.blit(glow_surf, (int(x - glow_radius), int(y - glow_radius)))
@@ -573,7 +577,7 @@ class DeltaConfigAnimation:
                     # Pulsing nodes at both ends
                     for pos_x, pos_y in [(source_tile_x, source_tile_y), (target_tile_x, target_tile_y)]:
                         node_radius = int(8 * pulse)
-                        node_surf = pygame.Surface((node_radius * 2, node_radius * 2), pygame.SRCALPHA)
+                        node_surf = self.scratch.get("node_surf", (node_radius * 2, node_radius * 2))
                         pygame.draw.circle(node_surf, (*self.color_bright, 180),
                                          (node_radius, node_radius), node_radius)
                         surface.blit(node_surf, (int(pos_x - node_radius), int(pos_y - node_radius)))
@@ -585,7 +589,7 @@ class DeltaConfigAnimation:
                 flash_alpha = int(255 * (1.0 - progress / 0.5))
                 flash_radius = int(40 * (1.0 + progress * 2))
 
-                flash_surf = pygame.Surface((flash_radius * 2, flash_radius * 2), pygame.SRCALPHA)
+                flash_surf = self.scratch.get("flash_surf", (flash_radius * 2, flash_radius * 2))
                 pygame.draw.circle(flash_surf, (*self.color_bright, flash_alpha),
                                  (flash_radius, flash_radius), flash_radius)
                 surface.blit(flash_surf, (int(self.target_x - flash_radius),
@@ -621,7 +625,7 @@ class DeltaConfigAnimation:
                     # Collapsing circle effect (shrinks from full size to nothing)
                     collapse_radius = int(TILE_SIZE * 0.4 * (1.0 - collapse_progress))
                     if collapse_radius > 2:
-                        collapse_surf = pygame.Surface((collapse_radius * 2, collapse_radius * 2), pygame.SRCALPHA)
+                        collapse_surf = self.scratch.get("collapse_surf", (collapse_radius * 2, collapse_radius * 2))
                         alpha = int(150 * (1.0 - collapse_progress))  # Fades as it shrinks
                         pygame.draw.circle(collapse_surf, (*self.color_outer, alpha),
                                          (collapse_radius, collapse_radius), collapse_radius, 2)
@@ -647,7 +651,7 @@ class DeltaConfigAnimation:
                             dest_tile_x = self.target_x + dx * TILE_SIZE
                             dest_tile_y = self.target_y + dy * TILE_SIZE
 
-                        shockwave_surf = pygame.Surface((shockwave_radius * 2, shockwave_radius * 2), pygame.SRCALPHA)
+                        shockwave_surf = self.scratch.get("shockwave_surf", (shockwave_radius * 2, shockwave_radius * 2))
                         pygame.draw.circle(shockwave_surf, (*self.color_bright, 100),
                                          (shockwave_radius, shockwave_radius), shockwave_radius, 3)
                         surface.blit(shockwave_surf, (int(dest_tile_x - shockwave_radius),
@@ -671,6 +675,7 @@ class GraeExchangeAnimation:
             game: Game instance (optional)
             units_list: List of units (optional)
         """
+        self.scratch = ScratchSurfaces()
         self.caster_unit = caster_unit
         # NOTE: target_pos is (grid_y, grid_x) format from renderer - UNPACK CORRECTLY!
         self.target_grid_y, self.target_grid_x = target_pos
@@ -959,7 +964,7 @@ class GraeExchangeAnimation:
 
             # Cane (fading out as cube forms)
             cane_alpha = int(200 * (1.0 - progress * 0.5))
-            cane_surf = pygame.Surface((80, 60), pygame.SRCALPHA)
+            cane_surf = self.scratch.get("cane_surf", (80, 60))
             pygame.draw.line(cane_surf, (*self.color_cane_shaft, cane_alpha),
                            (40, 60), (40, 20), 3)
             pygame.draw.circle(cane_surf, (*self.color_skin, cane_alpha), (40, 20), 5)
@@ -1136,6 +1141,10 @@ class EstrangeBeam:
     """
 
     def __init__(self, source_x, source_y, target_x, target_y, particle_emitter):
+        self.scratch = ScratchSurfaces()
+        # The impact flash grows to 35 * 1.3 px, the inner flash to 0.6 of that
+        self.scratch.reserve("flash_surf", (90, 90))
+        self.scratch.reserve("flash_surf2", (54, 54))
         self.source_x = source_x
         self.source_y = source_y
         self.target_x = target_x
@@ -1260,7 +1269,7 @@ class EstrangeBeam:
         surf_height = max(int(max_y - min_y), 1)
 
         # Create alpha surface
-        alpha_surf = pygame.Surface((surf_width, surf_height), pygame.SRCALPHA)
+        alpha_surf = self.scratch.get("alpha_surf", (surf_width, surf_height))
         local_x1 = int(x1 - min_x)
         local_y1 = int(y1 - min_y)
         local_x2 = int(x2 - min_x)
@@ -1417,7 +1426,7 @@ class EstrangeBeam:
 
             # Outer glow (largest, most transparent)
             if glow_radius > 0:
-                glow_surf = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
+                glow_surf = self.scratch.get("glow_surf", (glow_radius * 2, glow_radius * 2))
                 pygame.draw.circle(glow_surf, (*self.color_outer, int(60 * progress)),
                                  (glow_radius, glow_radius), glow_radius)
                 surface.blit(glow_surf, (int(self.source_x - glow_radius),
@@ -1426,7 +1435,7 @@ class EstrangeBeam:
             # Middle glow
             mid_radius = int(glow_radius * 0.7)
             if mid_radius > 0:
-                glow_surf2 = pygame.Surface((mid_radius * 2, mid_radius * 2), pygame.SRCALPHA)
+                glow_surf2 = self.scratch.get("glow_surf2", (mid_radius * 2, mid_radius * 2))
                 pygame.draw.circle(glow_surf2, (*self.color_outer, int(120 * progress)),
                                  (mid_radius, mid_radius), mid_radius)
                 surface.blit(glow_surf2, (int(self.source_x - mid_radius),
@@ -1435,7 +1444,7 @@ class EstrangeBeam:
             # Inner glow
             inner_radius = int(glow_radius * 0.4)
             if inner_radius > 0:
-                glow_surf3 = pygame.Surface((inner_radius * 2, inner_radius * 2), pygame.SRCALPHA)
+                glow_surf3 = self.scratch.get("glow_surf3", (inner_radius * 2, inner_radius * 2))
                 pygame.draw.circle(glow_surf3, (*self.color_inner, int(200 * progress)),
                                  (inner_radius, inner_radius), inner_radius)
                 surface.blit(glow_surf3, (int(self.source_x - inner_radius),
@@ -1521,7 +1530,7 @@ class EstrangeBeam:
                                 height = max(int(max_y - min_y) + 4, 4)
 
                                 # Create surface for alpha blending
-                                tendril_surf = pygame.Surface((width, height), pygame.SRCALPHA)
+                                tendril_surf = self.scratch.get("tendril_surf", (width, height))
                                 # Draw line relative to surface origin
                                 local_base_x = int(base_x - min_x + 2)
                                 local_base_y = int(base_y - min_y + 2)
@@ -1534,7 +1543,7 @@ class EstrangeBeam:
 
                                 # Draw tiny glow at tendril tip
                                 tip_radius = 2
-                                tip_surf = pygame.Surface((tip_radius * 2, tip_radius * 2), pygame.SRCALPHA)
+                                tip_surf = self.scratch.get("tip_surf", (tip_radius * 2, tip_radius * 2))
                                 pygame.draw.circle(tip_surf, color,
                                                  (tip_radius, tip_radius), tip_radius)
                                 surface.blit(tip_surf, (int(end_x - tip_radius),
@@ -1548,7 +1557,7 @@ class EstrangeBeam:
                 flash_radius = int(35 * (1.0 + flash_progress))
 
                 # Outer flash
-                flash_surf = pygame.Surface((flash_radius * 2, flash_radius * 2), pygame.SRCALPHA)
+                flash_surf = self.scratch.get("flash_surf", (flash_radius * 2, flash_radius * 2))
                 pygame.draw.circle(flash_surf, (*self.color_outer, flash_alpha // 2),
                                  (flash_radius, flash_radius), flash_radius)
                 surface.blit(flash_surf, (int(self.target_x - flash_radius),
@@ -1556,7 +1565,7 @@ class EstrangeBeam:
 
                 # Inner flash
                 inner_flash_radius = int(flash_radius * 0.6)
-                flash_surf2 = pygame.Surface((inner_flash_radius * 2, inner_flash_radius * 2), pygame.SRCALPHA)
+                flash_surf2 = self.scratch.get("flash_surf2", (inner_flash_radius * 2, inner_flash_radius * 2))
                 pygame.draw.circle(flash_surf2, (*self.color_bright, flash_alpha),
                                  (inner_flash_radius, inner_flash_radius), inner_flash_radius)
                 surface.blit(flash_surf2, (int(self.target_x - inner_flash_radius),
@@ -1573,12 +1582,14 @@ class TileExplosionBurst:
     Purple expanding circle with fade.
     """
     def __init__(self, tile_x, tile_y, delay=0):
+        self.scratch = ScratchSurfaces()
         self.tile_x = tile_x
         self.tile_y = tile_y
         self.timer = -delay
         self.duration = 0.6
         self.active = True
         self.max_radius = 35
+        self.scratch.reserve("burst_surf", (self.max_radius * 2 + 20, self.max_radius * 2 + 20))
 
         # Purple colors
         self.color_outer = (170, 119, 255)
@@ -1615,7 +1626,7 @@ class TileExplosionBurst:
         if alpha < 20 or radius < 2:
             return
 
-        burst_surf = pygame.Surface((radius * 2 + 20, radius * 2 + 20), pygame.SRCALPHA)
+        burst_surf = self.scratch.get("burst_surf", (radius * 2 + 20, radius * 2 + 20))
         center = radius + 10
 
         # Outer purple ring
@@ -1642,12 +1653,14 @@ class PsychicWave:
     Shows the explosion propagating outward.
     """
     def __init__(self, center_x, center_y):
+        self.scratch = ScratchSurfaces()
         self.center_x = center_x
         self.center_y = center_y
         self.timer = 0
         self.duration = 0.5
         self.active = True
         self.max_radius = TILE_SIZE * 2  # Covers 3x3 area
+        self.scratch.reserve("ring_surf", (self.max_radius * 2 + 20, self.max_radius * 2 + 20))
 
         # Purple colors
         self.color_outer = (170, 119, 255)
@@ -1682,7 +1695,7 @@ class PsychicWave:
             return
 
         # Draw expanding ring
-        ring_surf = pygame.Surface((radius * 2 + 20, radius * 2 + 20), pygame.SRCALPHA)
+        ring_surf = self.scratch.get("ring_surf", (radius * 2 + 20, radius * 2 + 20))
         center = radius + 10
 
         # Outer ring
@@ -1701,6 +1714,7 @@ class ExplosionParticles:
     Particles spreading outward from center during explosion.
     """
     def __init__(self, center_x, center_y):
+        self.scratch = ScratchSurfaces()
         self.center_x = center_x
         self.center_y = center_y
         self.timer = 0
@@ -1760,7 +1774,7 @@ class ExplosionParticles:
             color = (*self.colors[particle['color_type']], alpha)
 
             # Draw particle
-            particle_surf = pygame.Surface((particle['size'] * 2, particle['size'] * 2), pygame.SRCALPHA)
+            particle_surf = self.scratch.get("particle_surf", (particle['size'] * 2, particle['size'] * 2))
             pygame.draw.circle(particle_surf, color,
                              (particle['size'], particle['size']), particle['size'])
 
@@ -1792,6 +1806,7 @@ class GraymanEchoDeathExplosionAnimation:
             screen_shake_callback: Callback for screen shake
         """
         # Store references
+        self.scratch = ScratchSurfaces()
         self.caster = caster_unit
         self.camera = camera
         self.particle_emitter = particle_emitter
@@ -1927,7 +1942,7 @@ class GraymanEchoDeathExplosionAnimation:
             radius = int(self.charge_glow_radius * pulse)
 
             if radius > 2 and alpha > 20:
-                glow_surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+                glow_surf = self.scratch.get("glow_surf", (radius * 2, radius * 2))
 
                 # Outer glow
                 pygame.draw.circle(glow_surf, (*self.color_outer, alpha // 2),
@@ -1970,6 +1985,9 @@ class GraymanPsychicAttack:
             particle_emitter: ParticleEmitter for effects
             screen_shake_callback: Function(intensity, duration)
         """
+        self.scratch = ScratchSurfaces()
+        # The impact flash grows to 35 * 1.4 px
+        self.scratch.reserve("flash_surf", (98, 98))
         self.attacker = attacker_unit
         self.target = target_unit
         self.particle_emitter = particle_emitter
@@ -2118,7 +2136,7 @@ class GraymanPsychicAttack:
             glow_radius = int(20 * progress)
 
             if glow_radius > 3:
-                glow_surf = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
+                glow_surf = self.scratch.get("glow_surf", (glow_radius * 2, glow_radius * 2))
                 pygame.draw.circle(glow_surf, (*self.color_outer, int(120 * progress)),
                                  (glow_radius, glow_radius), glow_radius)
                 surface.blit(glow_surf, (int(self.attacker.x - glow_radius),
@@ -2127,7 +2145,7 @@ class GraymanPsychicAttack:
                 # Inner glow
                 inner_radius = int(glow_radius * 0.6)
                 if inner_radius > 2:
-                    inner_surf = pygame.Surface((inner_radius * 2, inner_radius * 2), pygame.SRCALPHA)
+                    inner_surf = self.scratch.get("inner_surf", (inner_radius * 2, inner_radius * 2))
                     pygame.draw.circle(inner_surf, (*self.color_inner, int(180 * progress)),
                                      (inner_radius, inner_radius), inner_radius)
                     surface.blit(inner_surf, (int(self.attacker.x - inner_radius),
@@ -2165,7 +2183,7 @@ class GraymanPsychicAttack:
             # Draw the wave as filled polygon with transparency
             if len(points) >= 3:
                 # Create transparent surface for wave
-                wave_surf = pygame.Surface((int(self.distance + 100), int(wave_width * 3)), pygame.SRCALPHA)
+                wave_surf = self.scratch.get("wave_surf", (int(self.distance + 100), int(wave_width * 3)))
 
                 # Transform points to local coordinates
                 min_x = min(p[0] for p in points)
@@ -2203,7 +2221,7 @@ class GraymanPsychicAttack:
                 flash_alpha = int(255 * (1.0 - progress / 0.4))
                 flash_radius = int(35 * (1.0 + progress))
 
-                flash_surf = pygame.Surface((flash_radius * 2, flash_radius * 2), pygame.SRCALPHA)
+                flash_surf = self.scratch.get("flash_surf", (flash_radius * 2, flash_radius * 2))
                 pygame.draw.circle(flash_surf, (*self.color_bright, flash_alpha),
                                  (flash_radius, flash_radius), flash_radius)
                 surface.blit(flash_surf, (int(self.target.x - flash_radius),
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Particle Pool
+Structure-of-arrays storage for the renderer's particle effects.
+
+A death alone used to create 100 Particle objects, each updated by its own
+method call, the live list rebuilt every frame, and each one drawn by
+clearing a surface, drawing a circle and blitting it. ParticlePool keeps
+every particle attribute in a preallocated NumPy column of fixed capacity:
+spawns write into the next free row, update() advances all of them with a
+handful of array operations and compacts the survivors in place, and draw()
+sends the whole pool to one Surface.blits() call.
+
+Particles are drawn from pre-rendered stamps: one circle per (radius, colour,
+alpha level), with the fade quantized to ALPHA_LEVELS steps so a few stamps
+cover a particle's whole life.
+"""
+
+from typing import Dict, Optional, Sequence, Tuple
+import numpy as np
+import pygame
+
+# Particles the pool holds; spawns beyond this are dropped (and counted)
+PARTICLE_CAPACITY = 4096
+
+# Distinct alpha levels a fading particle is drawn at
+ALPHA_LEVELS = 32
+
+# Stamps kept before the stamp cache is cleared (bounds per-colour growth)
+STAMP_CACHE_LIMIT = 4096
+
+
+class ParticlePool:
+    """Fixed-capacity particle columns with vectorized update and batched draw."""
+
+    def __init__(self, capacity: int = PARTICLE_CAPACITY):
+        """
+        Args:
+            capacity: Maximum live particles
+        """
+        self.capacity = capacity
+        self.count = 0
+        self.dropped = 0
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.vx = np.zeros(capacity, dtype=np.float32)
+        self.vy = np.zeros(capacity, dtype=np.float32)
+        self.gravity = np.zeros(capacity, dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.float32)
+        self.max_life = np.ones(capacity, dtype=np.float32)
+        self.size = np.zeros(capacity, dtype=np.float32)
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
+        self.fade = np.ones(capacity, dtype=bool)
+        self.rng = np.random.default_rng()
+        self._stamps: Dict[int, pygame.Surface] = {}
+
+    def __len__(self) -> int:
+        return self.count
+
+    def clear(self) -> None:
+        """Remove every particle."""
+        self.count = 0
+
+    # ------------------------------------------------------------------ #
+    # Spawning
+    # ------------------------------------------------------------------ #
+    def spawn(self, x: float, y: float, vx: float, vy: float, color: Sequence[int],
+              size: float, lifetime: float, gravity: float = 0.0, fade: bool = True,
+              max_lifetime: Optional[float] = None) -> bool:
+        """
+        Add one particle.
+
+        Args:
+            max_lifetime: Lifetime the fade is measured against (default: lifetime)
+
+        Returns:
+            False if the pool is full and the particle was dropped
+        """
+        i = self.count
+        if i >= self.capacity:
+            self.dropped += 1
+            return False
+        self.x[i] = x
+        self.y[i] = y
+        self.vx[i] = vx
+        self.vy[i] = vy
+        self.gravity[i] = gravity
+        self.life[i] = lifetime
+        self.max_life[i] = max_lifetime if max_lifetime else lifetime
+        self.size[i] = size
+        self.color[i] = color[:3]
+        self.fade[i] = fade
+        self.count = i + 1
+        return True
+
+    def spawn_many(self, x, y, vx, vy, color, size, lifetime, gravity=0.0, fade: bool = True) -> int:
+        """
+        Add particles from arrays (scalars broadcast).
+
+        Args:
+            color: One (r, g, b) for all, or an (n, 3) array
+
+        Returns:
+            Number of particles added (the rest were dropped)
+        """
+        n = int(np.broadcast(np.asarray(x), np.asarray(y), np.asarray(vx), np.asarray(vy),
+                             np.asarray(size), np.asarray(lifetime)).size)
+        room = min(n, self.capacity - self.count)
+        self.dropped += n - room
+        if room <= 0:
+            return 0
+        rows = slice(self.count, self.count + room)
+        for column, values in ((self.x, x), (self.y, y), (self.vx, vx), (self.vy, vy),
+                               (self.gravity, gravity), (self.life, lifetime),
+                               (self.max_life, lifetime), (self.size, size)):
+            column[rows] = np.broadcast_to(values, (n,))[:room]
+        self.color[rows] = np.broadcast_to(np.asarray(color, dtype=np.int64)[..., :3], (n, 3))[:room]
+        self.fade[rows] = fade
+        self.count += room
+        return room
+
+    # ------------------------------------------------------------------ #
+    # Simulation
+    # ------------------------------------------------------------------ #
+    def update(self, delta_time: float) -> None:
+        """Advance every particle and drop the expired ones, keeping spawn order."""
+        n = self.count
+        if not n:
+            return
+        vy = self.vy[:n]
+        self.x[:n] += self.vx[:n] * delta_time
+        self.y[:n] += vy * delta_time
+        vy += self.gravity[:n] * delta_time
+        life = self.life[:n]
+        life -= delta_time
+
+        alive = life > 0
+        live = int(np.count_nonzero(alive))
+        if live == n:
+            return
+        for column in (self.x, self.y, self.vx, self.vy, self.gravity, self.life,
+                       self.max_life, self.size, self.color, self.fade):
+            column[:live] = column[:n][alive]
+        self.count = live
+
+    # ------------------------------------------------------------------ #
+    # Drawing
+    # ------------------------------------------------------------------ #
+    def draw(self, surface: pygame.Surface) -> int:
+        """
+        Draw every particle in one batched blit.
+
+        Returns:
+            Number of particles drawn
+        """
+        n = self.count
+        if not n:
+            return 0
+        radius = self.size[:n].astype(np.int64)
+        top = ALPHA_LEVELS - 1
+        level = np.where(self.fade[:n],
+                         np.rint(self.life[:n] / self.max_life[:n] * top).astype(np.int64), top)
+        visible = (radius > 0) & (level > 0)
+        if not visible.all():
+            indices = np.flatnonzero(visible)
+            if not len(indices):
+                return 0
+        else:
+            indices = slice(None)
+        radius = radius[indices]
+        color = self.color[:n][indices].astype(np.int64)
+
+        # One integer per (radius, alpha level, colour): the stamp it is drawn with
+        codes = ((radius * ALPHA_LEVELS + np.clip(level[indices], 0, top)) << 24) | \
+                (color[:, 0] << 16) | (color[:, 1] << 8) | color[:, 2]
+        unique, inverse = np.unique(codes, return_inverse=True)
+        stamps = [self._stamp(int(code)) for code in unique]
+
+        # Stamps are blitted at the particle's top-left, truncated like Particle.draw
+        left = (self.x[:n][indices] - self.size[:n][indices]).astype(np.int64)
+        upper = (self.y[:n][indices] - self.size[:n][indices]).astype(np.int64)
+        batch = list(zip([stamps[i] for i in inverse.ravel().tolist()], zip(left.tolist(), upper.tolist())))
+        surface.blits(batch, doreturn=False)
+        return len(batch)
+
+    def _stamp(self, code: int) -> pygame.Surface:
+        stamp = self._stamps.get(code)
+        if stamp is None:
+            if len(self._stamps) >= STAMP_CACHE_LIMIT:
+                self._stamps.clear()
+            radius, level = divmod(code >> 24, ALPHA_LEVELS)
+            alpha = level * 255 // (ALPHA_LEVELS - 1)
+            color = ((code >> 16) & 0xFF, (code >> 8) & 0xFF, code & 0xFF, alpha)
+            stamp = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(stamp, color, (radius, radius), radius)
+            self._stamps[code] = stamp
+        return stamp
+
+    def stamp_count(self) -> int:
+        """Stamps currently cached."""
+        return len(self._stamps)
+
+    def row(self, i: int) -> Tuple:
+        """(x, y, vx, vy, color, size, life, max_life, gravity, fade) of live particle i."""
+        return (float(self.x[i]), float(self.y[i]), float(self.vx[i]), float(self.vy[i]),
+                tuple(int(c) for c in self.color[i]), float(self.size[i]), float(self.life[i]),
+                float(self.max_life[i]), float(self.gravity[i]), bool(self.fade[i]))
@@ -7,6 +7,7 @@ import pygame
 import random
 import math
 from .core import TILE_SIZE
+from .scratch_surfaces import ScratchSurfaces
 from boneglaive.graphical.sound_helper import play_sound
 
 
@@ -16,6 +17,7 @@ class LunacyEffect:
     A crescent moon appears above the unit, eclipsing their strength.
     """
     def __init__(self, target_x, target_y, target_unit):
+        self.scratch = ScratchSurfaces()
         self.target_x = target_x
         self.target_y = target_y
         self.target = target_unit
@@ -131,13 +133,13 @@ class LunacyEffect:
 
         # Create surface for the eclipse effect
         effect_size = 80
-        eclipse_surf = pygame.Surface((effect_size, effect_size), pygame.SRCALPHA)
+        eclipse_surf = self.scratch.get("eclipse_surf", (effect_size, effect_size))
         center = effect_size // 2
 
         # Draw dark aura around the unit (weakening effect)
         aura_alpha = int(40 * fade)
         if aura_alpha > 0:
-            aura_surf = pygame.Surface((100, 100), pygame.SRCALPHA)
+            aura_surf = self.scratch.get("aura_surf", (100, 100))
             pygame.draw.circle(aura_surf, (60, 50, 80, aura_alpha), (50, 50), 50)
             pygame.draw.circle(aura_surf, (40, 30, 60, aura_alpha // 2), (50, 50), 60)
             surface.blit(aura_surf, (int(base_x - 50), int(base_y - 50)))
@@ -168,7 +170,7 @@ class LunacyEffect:
         crescent_alpha = int(220 * fade)
         if crescent_alpha > 0:
             # Outer crescent arc
-            crescent_surf = pygame.Surface((40, 40), pygame.SRCALPHA)
+            crescent_surf = self.scratch.get("crescent_surf", (40, 40))
             pygame.draw.circle(crescent_surf, (240, 230, 200, crescent_alpha), (20, 20), 14, 3)
 
             # Draw "(" shape by covering the right side
@@ -195,6 +197,7 @@ class LunacyEffect:
 class PedestalStrike:
     """Impact effects for POTPOURRIST's pedestal strike (shockwave, debris, crater)."""
     def __init__(self, target_x, target_y, target_unit):
+        self.scratch = ScratchSurfaces()
         self.target_x = target_x
         self.target_y = target_y
         self.target = target_unit
@@ -317,7 +320,7 @@ class PedestalStrike:
         if self.phase == "shockwave" or self.phase == "crater":
             alpha = int(255 * (1.0 - (self.shockwave_radius / 80)))
             if alpha > 0:
-                shockwave_surf = pygame.Surface((int(self.shockwave_radius * 2), int(self.shockwave_radius * 2)), pygame.SRCALPHA)
+                shockwave_surf = self.scratch.get("shockwave_surf", (int(self.shockwave_radius * 2), int(self.shockwave_radius * 2)))
                 pygame.draw.circle(shockwave_surf, (200, 100, 200, alpha),
                                  (int(self.shockwave_radius), int(self.shockwave_radius)),
                                  int(self.shockwave_radius), 4)
@@ -329,7 +332,7 @@ class PedestalStrike:
             alpha = int(255 * (particle['lifetime'] / 0.8))
             if alpha > 0:
                 color = (*particle['color'], alpha)
-                particle_surf = pygame.Surface((int(particle['size'] * 2), int(particle['size'] * 2)), pygame.SRCALPHA)
+                particle_surf = self.scratch.get("particle_surf", (int(particle['size'] * 2), int(particle['size'] * 2)))
                 pygame.draw.circle(particle_surf, color,
                                  (int(particle['size']), int(particle['size'])),
                                  int(particle['size']))
@@ -340,7 +343,7 @@ class PedestalStrike:
             alpha = int(150 * (particle['lifetime'] / 1.0))
             if alpha > 0:
                 color = (*particle['color'], alpha)
-                particle_surf = pygame.Surface((int(particle['size'] * 2), int(particle['size'] * 2)), pygame.SRCALPHA)
+                particle_surf = self.scratch.get("particle_surf", (int(particle['size'] * 2), int(particle['size'] * 2)))
                 pygame.draw.circle(particle_surf, color,
                                  (int(particle['size']), int(particle['size'])),
                                  int(particle['size']))
@@ -350,6 +353,7 @@ class PedestalStrike:
 class InfuseEffect:
     """INFUSE - POTPOURRIST creates aromatic potpourri with swirling petals and fragrance."""
     def __init__(self, caster_x, caster_y, caster_unit):
+        self.scratch = ScratchSurfaces()
         self.caster_x = caster_x
         self.caster_y = caster_y
         self.caster = caster_unit
@@ -498,7 +502,7 @@ class InfuseEffect:
         for wave in self.fragrance_waves:
             alpha = int(150 * (wave['lifetime'] / 0.8))
             if alpha > 0 and wave['radius'] > 0:
-                wave_surf = pygame.Surface((int(wave['radius'] * 2), int(wave['radius'] * 2)), pygame.SRCALPHA)
+                wave_surf = self.scratch.get("wave_surf", (int(wave['radius'] * 2), int(wave['radius'] * 2)))
                 color = (*wave['color'], alpha)
                 pygame.draw.circle(wave_surf, color,
                                  (int(wave['radius']), int(wave['radius'])),
@@ -512,7 +516,7 @@ class InfuseEffect:
                 radius = self.core_glow_radius + i * 8
                 alpha = int(100 - i * 30)
                 if alpha > 0:
-                    glow_surf = pygame.Surface((int(radius * 2), int(radius * 2)), pygame.SRCALPHA)
+                    glow_surf = self.scratch.get("glow_surf", (int(radius * 2), int(radius * 2)))
                     pygame.draw.circle(glow_surf, (220, 20, 60, alpha),  # Crimson #dc143c
                                      (int(radius), int(radius)), int(radius))
                     glow_rect = glow_surf.get_rect(center=(int(self.caster_x), int(self.caster_y)))
@@ -524,7 +528,7 @@ class InfuseEffect:
                 alpha = int(255 * min(1.0, petal['lifetime']))
                 if alpha > 0:
                     color = (*petal['color'], alpha)
-                    petal_surf = pygame.Surface((int(petal['size'] * 2), int(petal['size'] * 2)), pygame.SRCALPHA)
+                    petal_surf = self.scratch.get("petal_surf", (int(petal['size'] * 2), int(petal['size'] * 2)))
 
                     # Draw petal as a rounded shape
                     pygame.draw.circle(petal_surf, color,
@@ -546,6 +550,7 @@ class GraniteGeasEffect:
     Shows oil mark and magical chains/runes on target.
     """
     def __init__(self, target_x, target_y, target_unit, infused=False):
+        self.scratch = ScratchSurfaces()
         self.target_x = target_x
         self.target_y = target_y
         self.target = target_unit
@@ -740,7 +745,7 @@ class GraniteGeasEffect:
         # Draw impact flash
         if self.impact_flash > 0:
             flash_alpha = int(200 * self.impact_flash)
-            flash_surf = pygame.Surface((80, 80), pygame.SRCALPHA)
+            flash_surf = self.scratch.get("flash_surf", (80, 80))
             pygame.draw.circle(flash_surf, (255, 200, 100, flash_alpha), (40, 40), 40)
             pygame.draw.circle(flash_surf, (255, 255, 255, flash_alpha // 2), (40, 40), 30)
             surface.blit(flash_surf, (int(target_x - 40), int(target_y - 40)))
@@ -748,7 +753,7 @@ class GraniteGeasEffect:
         # Draw geas mark (after strike phase)
         if self.phase in ["mark_appear", "binding", "fading"] and self.mark_alpha > 0:
             mark_size = 60
-            mark_surf = pygame.Surface((mark_size, mark_size), pygame.SRCALPHA)
+            mark_surf = self.scratch.get("mark_surf", (mark_size, mark_size))
             center = mark_size // 2
 
             # Base color - tropical flowers for infused, gray stone for normal
@@ -813,7 +818,7 @@ class GraniteGeasEffect:
             if drip['lifetime'] > 0:
                 alpha = int(200 * min(1.0, drip['lifetime']))
                 if alpha > 0:
-                    drip_surf = pygame.Surface((int(drip['size'] * 2), int(drip['size'] * 2)), pygame.SRCALPHA)
+                    drip_surf = self.scratch.get("drip_surf", (int(drip['size'] * 2), int(drip['size'] * 2)))
                     pygame.draw.circle(drip_surf, (*drip['color'], alpha),
                                      (int(drip['size']), int(drip['size'])), int(drip['size']))
                     surface.blit(drip_surf, (int(drip['x'] - drip['size']), int(drip['y'] - drip['size'])))
@@ -829,7 +834,7 @@ class GraniteGeasEffect:
 
                 if alpha > 0:
                     rune_size = int(rune['size'])
-                    rune_surf = pygame.Surface((rune_size * 2, rune_size * 2), pygame.SRCALPHA)
+                    rune_surf = self.scratch.get("rune_surf", (rune_size * 2, rune_size * 2))
                     center = rune_size
 
                     # Draw wispy semi-transparent background glow (fume)
@@ -889,6 +894,7 @@ class GeasBreakHeal:
     Fumes travel from the marked target to POTPOURRIST who inhales them for healing.
     """
     def __init__(self, target_x, target_y, caster_x, caster_y, caster_unit, heal_amount=4):
+        self.scratch = ScratchSurfaces()
         self.target_x = target_x
         self.target_y = target_y
         self.caster_x = caster_x
@@ -1086,7 +1092,7 @@ class GeasBreakHeal:
                 alpha = int(180 * (particle['lifetime'] / 0.6))
                 if alpha > 0:
                     size = int(particle['size'])
-                    particle_surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+                    particle_surf = self.scratch.get("particle_surf", (size * 2, size * 2))
 
                     # Wispy cloud
                     for i in range(3):
@@ -1108,7 +1114,7 @@ class GeasBreakHeal:
                 for ring_idx, ring_offset in enumerate([0, -5, -10]):
                     radius = int(self.shockwave_radius + ring_offset)
                     if radius > 0:
-                        ring_surf = pygame.Surface((radius * 2 + 20, radius * 2 + 20), pygame.SRCALPHA)
+                        ring_surf = self.scratch.get("ring_surf", (radius * 2 + 20, radius * 2 + 20))
                         center = radius + 10
 
                         # Use pre-selected color for this ring
@@ -1130,7 +1136,7 @@ class GeasBreakHeal:
 
                 if alpha > 0:
                     size = int(fume['size'])
-                    fume_surf = pygame.Surface((size * 3, size * 3), pygame.SRCALPHA)
+                    fume_surf = self.scratch.get("fume_surf", (size * 3, size * 3))
                     center = int(size * 1.5)
 
                     # Layered wispy fume
@@ -1147,6 +1153,7 @@ class DemiluneSwing:
     """DEMILUNE - Heavy arc swing of granite pedestal with stone impact effects."""
     def __init__(self, caster_x, caster_y, caster_unit, target_x, target_y, infused=False, upgraded=False, targets=None,
                  caster_grid_pos=None, target_grid_pos=None, camera=None):
+        self.scratch = ScratchSurfaces()
         self.caster_x = caster_x
         self.caster_y = caster_y
         self.caster = caster_unit
@@ -1644,7 +1651,7 @@ class DemiluneSwing:
                     if alpha > 0:
                         size = int(fume['size'])
                         surf_size = size * 3
-                        fume_surf = pygame.Surface((surf_size, surf_size), pygame.SRCALPHA)
+                        fume_surf = self.scratch.get("fume_surf", (surf_size, surf_size))
                         center = surf_size // 2
 
                         is_sparkle = (fume['color'] == self.backdraft_color_sparkle)
@@ -1677,7 +1684,7 @@ class DemiluneSwing:
                 if flash_alpha > 0:
                     for tile_y, tile_x in self.back_arc_tiles:
                         flash_size = TILE_SIZE
-                        flash_surf = pygame.Surface((flash_size, flash_size), pygame.SRCALPHA)
+                        flash_surf = self.scratch.get("flash_surf", (flash_size, flash_size))
                         pygame.draw.rect(flash_surf, (*self.backdraft_color_mid, flash_alpha),
                                        (0, 0, flash_size, flash_size))
                         surface.blit(flash_surf, (int(tile_x - flash_size // 2), int(tile_y - flash_size // 2)))
@@ -1778,7 +1785,7 @@ class DemiluneSwing:
                                 if alpha > 0:
                                     blur_w = int(36 * width_factor)
                                     blur_h = int(36 * width_factor * stretch)
-                                    blur_surf = pygame.Surface((blur_w, blur_h), pygame.SRCALPHA)
+                                    blur_surf = self.scratch.get("blur_surf", (blur_w, blur_h))
                                     pygame.draw.ellipse(blur_surf, (255, 105, 180, alpha), (0, 0, blur_w, blur_h))  # Hot pink #ff69b4
 
                                     # Rotate to align with motion direction
@@ -1791,7 +1798,7 @@ class DemiluneSwing:
                                 if alpha > 0:
                                     blur_w = int(20 * width_factor)
                                     blur_h = int(20 * width_factor * stretch)
-                                    blur_surf = pygame.Surface((blur_w, blur_h), pygame.SRCALPHA)
+                                    blur_surf = self.scratch.get("blur_surf", (blur_w, blur_h))
                                     pygame.draw.ellipse(blur_surf, (255, 215, 0, alpha), (0, 0, blur_w, blur_h))  # Gold #ffd700
 
                                     rotated = pygame.transform.rotate(blur_surf, math.degrees(-angle + math.pi/2))
@@ -1805,7 +1812,7 @@ class DemiluneSwing:
                                     spark_y = py + perp_y * streak_dist * random.choice([-1, 1])
                                     spark_alpha = int(100 * fade)
                                     if spark_alpha > 0:
-                                        spark_surf = pygame.Surface((8, 8), pygame.SRCALPHA)
+                                        spark_surf = self.scratch.get("spark_surf", (8, 8))
                                         spark_color = random.choice([
                                             (255, 99, 71),   # Tomato #ff6347
                                             (255, 165, 0),   # Orange #ffa500
@@ -1832,7 +1839,7 @@ class DemiluneSwing:
                                 if alpha > 0:
                                     blur_w = int(28 * width_factor)
                                     blur_h = int(28 * width_factor * stretch)
-                                    blur_surf = pygame.Surface((blur_w, blur_h), pygame.SRCALPHA)
+                                    blur_surf = self.scratch.get("blur_surf", (blur_w, blur_h))
                                     pygame.draw.ellipse(blur_surf, (180, 180, 180, alpha), (0, 0, blur_w, blur_h))
 
                                     # Rotate to align with motion direction
@@ -1870,7 +1877,7 @@ class DemiluneSwing:
                         if alpha > 0:
                             blur_w = int(40 * width_factor)
                             blur_h = int(40 * width_factor * stretch)
-                            blur_surf = pygame.Surface((blur_w, blur_h), pygame.SRCALPHA)
+                            blur_surf = self.scratch.get("blur_surf", (blur_w, blur_h))
                             pygame.draw.ellipse(blur_surf, (255, 105, 180, alpha), (0, 0, blur_w, blur_h))  # Hot pink #ff69b4
 
                             rotated = pygame.transform.rotate(blur_surf, math.degrees(-current_angle + math.pi/2))
@@ -1882,7 +1889,7 @@ class DemiluneSwing:
                         if alpha > 0:
                             blur_w = int(24 * width_factor)
                             blur_h = int(24 * width_factor * stretch)
-                            blur_surf = pygame.Surface((blur_w, blur_h), pygame.SRCALPHA)
+                            blur_surf = self.scratch.get("blur_surf", (blur_w, blur_h))
                             pygame.draw.ellipse(blur_surf, (255, 215, 0, alpha), (0, 0, blur_w, blur_h))  # Gold #ffd700
 
                             rotated = pygame.transform.rotate(blur_surf, math.degrees(-current_angle + math.pi/2))
@@ -1903,7 +1910,7 @@ class DemiluneSwing:
                         if alpha > 0:
                             blur_w = int(32 * width_factor)
                             blur_h = int(32 * width_factor * stretch)
-                            blur_surf = pygame.Surface((blur_w, blur_h), pygame.SRCALPHA)
+                            blur_surf = self.scratch.get("blur_surf", (blur_w, blur_h))
                             pygame.draw.ellipse(blur_surf, (180, 180, 180, alpha), (0, 0, blur_w, blur_h))
 
                             rotated = pygame.transform.rotate(blur_surf, math.degrees(-current_angle + math.pi/2))
@@ -1915,7 +1922,7 @@ class DemiluneSwing:
             alpha = int(255 * (debris['lifetime'] / 1.0))
             if alpha > 0:
                 color = (*debris['color'], alpha)
-                debris_surf = pygame.Surface((int(debris['size'] * 2), int(debris['size'] * 2)), pygame.SRCALPHA)
+                debris_surf = self.scratch.get("debris_surf", (int(debris['size'] * 2), int(debris['size'] * 2)))
                 pygame.draw.circle(debris_surf, color,
                                  (int(debris['size']), int(debris['size'])),
                                  int(debris['size']))
@@ -1928,7 +1935,7 @@ class DemiluneSwing:
                     alpha = int(220 * (particle['lifetime'] / 1.5))  # Brighter alpha
                     if alpha > 0:
                         color = (*particle['color'], alpha)
-                        particle_surf = pygame.Surface((int(particle['size'] * 3), int(particle['size'] * 3)), pygame.SRCALPHA)
+                        particle_surf = self.scratch.get("particle_surf", (int(particle['size'] * 3), int(particle['size'] * 3)))
 
                         # Draw layered glow for more vibrant petals
                         glow_size = particle['size'] + 6
@@ -1961,7 +1968,7 @@ class DemiluneSwing:
                     alpha = int(120 * fume['alpha_mod'] * (fume['lifetime'] / 2.0))  # Slightly more visible
                     if alpha > 0:
                         color = (*fume['color'], alpha)
-                        fume_surf = pygame.Surface((int(fume['size'] * 2.5), int(fume['size'] * 2.5)), pygame.SRCALPHA)
+                        fume_surf = self.scratch.get("fume_surf", (int(fume['size'] * 2.5), int(fume['size'] * 2.5)))
 
                         # Draw multiple overlapping circles for wispy cloud effect
                         center = fume['size'] * 1.25
@@ -2008,6 +2015,7 @@ class MelangeEminenceHealAnimation:
                  particle_emitter, debris_list, screen_shake_callback,
                  screen_flash_callback, units_list, camera, game=None, heal_amount=1):
         """Initialize normal Melange Eminence healing animation."""
+        self.scratch = ScratchSurfaces()
         self.caster = caster_unit
         self.target_unit = target_unit
         self.target_pos = target_pos
@@ -2156,7 +2164,7 @@ class MelangeEminenceHealAnimation:
             if self.aura_intensity > 0:
                 aura_alpha = int(120 * self.aura_intensity)
                 if aura_alpha > 0:
-                    aura_surf = pygame.Surface((int(self.aura_radius * 2), int(self.aura_radius * 2)), pygame.SRCALPHA)
+                    aura_surf = self.scratch.get("aura_surf", (int(self.aura_radius * 2), int(self.aura_radius * 2)))
                     # Warm golden/purple aura instead of green
                     pygame.draw.circle(aura_surf, (200, 150, 100, aura_alpha),
                                      (int(self.aura_radius), int(self.aura_radius)),
@@ -2171,7 +2179,7 @@ class MelangeEminenceHealAnimation:
 
             if alpha > 0:
                 size = particle['size']
-                particle_surf = pygame.Surface((int(size * 2), int(size * 2)), pygame.SRCALPHA)
+                particle_surf = self.scratch.get("particle_surf", (int(size * 2), int(size * 2)))
                 pygame.draw.circle(particle_surf, (*particle['color'], alpha),
                                  (int(size), int(size)), int(size))
                 surface.blit(particle_surf, (int(particle['x'] - size), int(particle['y'] - size)))
@@ -2219,6 +2227,7 @@ class MelangeEminenceInfusedHealAnimation:
                  particle_emitter, debris_list, screen_shake_callback,
                  screen_flash_callback, units_list, camera, game=None, heal_amount=2):
         """Initialize infused Melange Eminence healing animation."""
+        self.scratch = ScratchSurfaces()
         self.caster = caster_unit
         self.target_unit = target_unit
         self.target_pos = target_pos
@@ -2409,7 +2418,7 @@ class MelangeEminenceInfusedHealAnimation:
 
                 aura_alpha = int(150 * self.aura_intensity)
                 if aura_alpha > 0:
-                    aura_surf = pygame.Surface((int(self.aura_radius * 2), int(self.aura_radius * 2)), pygame.SRCALPHA)
+                    aura_surf = self.scratch.get("aura_surf", (int(self.aura_radius * 2), int(self.aura_radius * 2)))
                     pygame.draw.circle(aura_surf, (*blended_color, aura_alpha),
                                      (int(self.aura_radius), int(self.aura_radius)),
                                      int(self.aura_radius))
@@ -2427,7 +2436,7 @@ class MelangeEminenceInfusedHealAnimation:
 
             if alpha > 0:
                 size = particle['size']
-                petal_surf = pygame.Surface((int(size * 3), int(size * 3)), pygame.SRCALPHA)
+                petal_surf = self.scratch.get("petal_surf", (int(size * 3), int(size * 3)))
                 center = size * 1.5
 
                 # Draw petal shape
@@ -2485,6 +2494,7 @@ class PotpourristAromaticAttack:
             particle_emitter: ParticleEmitter for effects
             screen_shake_callback: Function(intensity, duration)
         """
+        self.scratch = ScratchSurfaces()
         self.attacker = attacker_unit
         self.target = target_unit
         self.particle_emitter = particle_emitter
@@ -2617,7 +2627,7 @@ class PotpourristAromaticAttack:
             glow_radius = int(15 * progress)
 
             if glow_radius > 2:
-                glow_surf = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
+                glow_surf = self.scratch.get("glow_surf", (glow_radius * 2, glow_radius * 2))
                 pygame.draw.circle(glow_surf, (128, 128, 128, int(80 * progress)),
                                  (glow_radius, glow_radius), glow_radius)
                 surface.blit(glow_surf, (int(self.attacker.x - glow_radius),
@@ -2676,7 +2686,7 @@ class PotpourristAromaticAttack:
 
                     layer_radius = int(flash_radius * (1.0 - i * 0.08))
                     if layer_radius > 2:
-                        flash_surf = pygame.Surface((layer_radius * 2, layer_radius * 2), pygame.SRCALPHA)
+                        flash_surf = self.scratch.get("flash_surf", (layer_radius * 2, layer_radius * 2))
                         pygame.draw.circle(flash_surf, (*color, flash_alpha // (i + 1)),
                                          (layer_radius, layer_radius), layer_radius)
                         surface.blit(flash_surf, (int(self.target.x - layer_radius + offset_x),
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Scratch Surfaces
+Per-animation reuse of the temporary alpha surfaces effects draw into.
+
+The Delphic Appraiser, Grayman and Potpourrist effects draw most of their
+glows, rings and trails into a temporary SRCALPHA surface that is blitted
+once and thrown away, so every frame of a running effect allocated a fresh
+surface for each of them. Each of those animations now owns a
+ScratchSurfaces with one named slot per temporary surface. A slot keeps a
+single surface at the largest size asked of it and hands out a cleared
+subsurface of the size requested, so a glow that pulses or a ring that grows
+draws into the same pixels every frame.
+
+Memory is bounded by the animation's slots: one surface each, grown by at
+least half its size at a time, and reserve() sizes a slot for its largest
+use up front. The AnimationTimeline calls release_scratch() when it drops an
+animation, which frees the animation's slots and those of the effects it
+holds.
+"""
+
+from typing import Dict, Tuple
+import pygame
+
+# A slot that has to grow grows by at least this factor, so a ring that gets
+# a pixel wider every frame reallocates a handful of times, not every frame
+GROWTH_FACTOR = 1.5
+
+TRANSPARENT = (0, 0, 0, 0)
+
+
+class ScratchSurfaces:
+    """Named, reusable SRCALPHA surfaces owned by one animation."""
+
+    def __init__(self):
+        self._slots: Dict[str, pygame.Surface] = {}
+        self.allocations = 0  # Surfaces created, for tests and profiling
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def reserve(self, slot: str, size: Tuple[int, int]) -> None:
+        """Size a slot for the largest surface it will be asked for."""
+        self._surface(slot, max(0, int(size[0])), max(0, int(size[1])))
+
+    def get(self, slot: str, size: Tuple[int, int]) -> pygame.Surface:
+        """
+        A transparent surface of the given size, drawn into and blitted this frame.
+
+        The surface shares its pixels with the slot, so the next get() on the
+        same slot overwrites it; use a different slot for surfaces that must
+        exist at the same time.
+        """
+        width = max(0, int(size[0]))
+        height = max(0, int(size[1]))
+        surface = self._surface(slot, width, height)
+        area = pygame.Rect(0, 0, width, height)
+        surface.fill(TRANSPARENT, area)
+        return surface.subsurface(area)
+
+    def release(self) -> None:
+        """Free every slot (they are allocated again on next use)."""
+        self._slots.clear()
+
+    def _surface(self, slot: str, width: int, height: int) -> pygame.Surface:
+        surface = self._slots.get(slot)
+        if surface is not None:
+            have_width, have_height = surface.get_size()
+            if width <= have_width and height <= have_height:
+                return surface
+            if width > have_width:
+                width = max(width, int(have_width * GROWTH_FACTOR))
+            if height > have_height:
+                height = max(height, int(have_height * GROWTH_FACTOR))
+            width = max(width, have_width)
+            height = max(height, have_height)
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        self._slots[slot] = surface
+        self.allocations += 1
+        return surface
+
+
+def release_scratch(animation) -> None:
+    """Free the scratch surfaces of an animation and of the effects it holds."""
+    owners = [animation]
+    for value in vars(animation).values() if hasattr(animation, "__dict__") else ():
+        if isinstance(value, (list, tuple)):
+            owners.extend(value)
+        else:
+            owners.append(value)
+    for owner in owners:
+        scratch = getattr(owner, "scratch", None)
+        if isinstance(scratch, ScratchSurfaces):
+            scratch.release()
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Asset Manager
+One place the render thread gets its SVG surfaces from, with background prefetch.
+
+Sprites, terrain tiles, skill icons and status icons used to be loaded by each
+drawing site the first time it needed them, on the render thread, which
+hitched the frame where a skill or status first appeared. surface() caches
+every (path, width, height) once for all sites. prefetch() hands the assets a
+game can show to a background thread: it rasterizes them (through the raster
+cache) into raw RGBA buffers and preloads sounds, so by the time the render
+thread asks, only a cheap frombuffer() conversion is left.
+
+The renderer tells the manager what a game can show with prefetch_for_game():
+the map's terrain, every recruitable unit's sprite during setup, then each
+fielded unit type's skill icons, status icons and skill sounds.
+
+Surfaces returned by surface() are shared between callers: blit them, copy
+them before drawing on them.
+"""
+
+import os
+import queue
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+import pygame
+from boneglaive.utils.debug import logger
+from boneglaive.utils.paths import asset_path, load_svg, rasterize_svg
+
+# (svg path, width, height)
+AssetKey = Tuple[str, int, int]
+
+# A synchronous load on the render thread slower than this counts as a hitch (ms)
+HITCH_THRESHOLD_MS = 4.0
+
+# Sizes the unit animations draw status icons at (cycling icon, application popup)
+STATUS_ICON_SIZE = 64
+STATUS_POPUP_ICON_SIZE = 96
+
+# Size the lock-out-tag-out overlays are rasterized at
+LOTO_ICON_SIZE = 64
+LOTO_ICONS = ("loto_chain", "loto_lock", "loto_tag")
+
+
+class AssetReport:
+    """How render-thread asset requests were served."""
+
+    def __init__(self):
+        self.hits = 0              # Already-converted surface
+        self.prefetched = 0        # Converted from a buffer the background thread prepared
+        self.misses = 0            # Loaded synchronously on the render thread
+        self.hitches = 0           # Misses slower than HITCH_THRESHOLD_MS
+        self.miss_ms = 0.0         # Render-thread time spent on misses
+        self.worst_ms = 0.0
+        self.worst_asset = ""
+        self.background_loads = 0  # SVGs and sounds loaded by the background thread
+
+    def summary(self) -> str:
+        return (f"Assets: {self.hits} hits, {self.prefetched} prefetched, {self.misses} misses "
+                f"({self.miss_ms:.1f} ms), {self.hitches} hitches over {HITCH_THRESHOLD_MS:.0f} ms "
+                f"(worst {self.worst_ms:.1f} ms {self.worst_asset}), "
+                f"{self.background_loads} background loads")
+
+
+class AssetManager:
+    """Shared SVG surface cache with a background prefetch thread."""
+
+    def __init__(self):
+        self.report = AssetReport()
+        self._surfaces: Dict[AssetKey, Optional[pygame.Surface]] = {}
+        # Raw buffers finished by the background thread, waiting for conversion
+        self._ready: Dict[AssetKey, Optional[Tuple[bytes, Tuple[int, int]]]] = {}
+        self._requested: Set = set()
+        self._queue: "queue.Queue" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._status_icons: Optional[List[str]] = None
+
+    # ------------------------------------------------------------------ #
+    # Render thread
+    # ------------------------------------------------------------------ #
+    def surface(self, path: str, width: int, height: int) -> Optional[pygame.Surface]:
+        """
+        The SVG at path rasterized to width x height, or None if it can't be loaded.
+
+        Loads synchronously (and records the miss) when no prefetch has finished it.
+        """
+        key = (path, width, height)
+        if key in self._surfaces:
+            self.report.hits += 1
+            return self._surfaces[key]
+
+        if key in self._ready:
+            raster = self._ready.pop(key)
+            surface = None
+            if raster is not None:
+                try:
+                    surface = pygame.image.frombuffer(raster[0], raster[1], 'RGBA').convert_alpha()
+                except pygame.error:
+                    surface = None
+            self.report.prefetched += 1
+            self._surfaces[key] = surface
+            return surface
+
+        start = time.perf_counter()
+        surface = load_svg(path, width, height)
+        elapsed = (time.perf_counter() - start) * 1000.0
+        self._record_miss(key, elapsed)
+        self._surfaces[key] = surface
+        return surface
+
+    def _record_miss(self, key: AssetKey, elapsed_ms: float) -> None:
+        report = self.report
+        report.misses += 1
+        report.miss_ms += elapsed_ms
+        if elapsed_ms > HITCH_THRESHOLD_MS:
+            report.hitches += 1
+            logger.debug(f"Asset hitch: {os.path.basename(key[0])} at {key[1]}x{key[2]} took {elapsed_ms:.1f} ms")
+        if elapsed_ms > report.worst_ms:
+            report.worst_ms = elapsed_ms
+            report.worst_asset = f"{os.path.basename(key[0])}@{key[1]}"
+
+    # ------------------------------------------------------------------ #
+    # Prefetch
+    # ------------------------------------------------------------------ #
+    def prefetch(self, svgs: Iterable[AssetKey] = (), sounds: Iterable[str] = ()) -> int:
+        """
+        Queue SVGs and sound keys for the background thread.
+
+        Anything already requested, converted or missing on disk is skipped.
+
+        Returns:
+            Number of items queued
+        """
+        queued = queued_sounds = 0
+        for key in svgs:
+            if key in self._requested or key in self._surfaces:
+                continue
+            self._requested.add(key)
+            if os.path.exists(key[0]):
+                self._queue.put(("svg", key))
+                queued += 1
+        for sound_key in sounds:
+            if not sound_key or ("sound", sound_key) in self._requested:
+                continue
+            if queued_sounds == 0:
+                # Create the sound manager (and mixer) here rather than on the worker thread
+                from boneglaive.graphical.sound_manager import get_sound_manager
+                get_sound_manager()
+            queued_sounds += 1
+            self._requested.add(("sound", sound_key))
+            self._queue.put(("sound", sound_key))
+            queued += 1
+
+        if queued and (self._thread is None or not self._thread.is_alive()):
+            self._thread = threading.Thread(target=self._worker, name="asset-prefetch", daemon=True)
+            self._thread.start()
+        return queued
+
+    def wait_until_idle(self, timeout: float = 5.0) -> bool:
+        """Block until every queued item is loaded; False on timeout."""
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if time.monotonic() > deadline:
+                return False
+            time.sleep(0.005)
+        return True
+
+    def _worker(self) -> None:
+        while True:
+            kind, item = self._queue.get()
+            try:
+                if kind == "svg":
+                    # rasterize_svg needs no display and goes through the disk cache
+                    self._ready[item] = rasterize_svg(*item)
+                else:
+                    from boneglaive.graphical.sound_manager import get_sound_manager
+                    get_sound_manager().load_sound(item)
+                self.report.background_loads += 1
+            except Exception as e:
+                logger.debug(f"Asset prefetch of {item} failed: {e}")
+            finally:
+                self._queue.task_done()
+
+    def prefetch_for_game(self, game, terrain_paths: Dict, tile_size: int) -> int:
+        """
+        Queue what this game can show next (see game_assets()).
+
+        Returns:
+            Number of items queued
+        """
+        return self.prefetch(*self.game_assets(game, terrain_paths, tile_size))
+
+    def game_assets(self, game, terrain_paths: Dict, tile_size: int) -> Tuple[List[AssetKey], List[str]]:
+        """
+        SVGs and sound keys a game can show from its current state.
+
+        Args:
+            game: The Game being rendered
+            terrain_paths: TerrainType -> SVG path (the renderer's terrain map)
+            tile_size: Board tile size in pixels
+        """
+        from boneglaive.game.recruitment import RECRUITMENT_ORDER
+
+        svgs: List[AssetKey] = []
+        game_map = getattr(game, "map", None)
+        if game_map is not None:
+            present = set(game_map.terrain.values())
+            svgs.extend((terrain_paths[t], tile_size, tile_size) for t in present if t in terrain_paths)
+
+        # During setup either side may field any recruitable type; afterwards only the fielded ones
+        unit_types = {unit.type for unit in getattr(game, "units", [])}
+        if getattr(game, "setup_phase", False):
+            svgs.extend((self.unit_sprite_path(t), tile_size, tile_size) for t in RECRUITMENT_ORDER)
+
+        roster_svgs, sounds = self.roster_assets(unit_types, tile_size)
+        return svgs + roster_svgs, sounds
+
+    def roster_assets(self, unit_types: Iterable, tile_size: int) -> Tuple[List[AssetKey], List[str]]:
+        """SVGs and sound keys the given unit types can put on screen."""
+        from boneglaive.game.skills.registry import UNIT_SKILLS
+        from boneglaive.graphical.sound_registry import get_sound_for_skill
+        from boneglaive.graphical.ui import skill_bar, unit_status_bar
+
+        svgs: List[AssetKey] = []
+        sounds: List[str] = []
+        unit_types = list(unit_types)
+        for unit_type in unit_types:
+            sprite = self.unit_sprite_path(unit_type)
+            svgs.append((sprite, tile_size, tile_size))
+            svgs.append((sprite, unit_status_bar.SPRITE_SIZE, unit_status_bar.SPRITE_SIZE))
+            skills = UNIT_SKILLS.get(unit_type, {})
+            for skill in skills.get("active", []):
+                icon_name = ''.join(c for c in skill.get_icon_name() if c not in r'\/:*?"<>|()')
+                icon_path = asset_path(f"graphics/skill_icons/{icon_name}.svg")
+                svgs.append((icon_path, skill_bar.SKILL_ICON_SIZE, skill_bar.SKILL_ICON_SIZE))
+                sounds.append(get_sound_for_skill(skill.name))
+            if "passive" in skills:
+                sounds.append(get_sound_for_skill(skills["passive"].name))
+
+        if unit_types:
+            for path in self.status_icon_paths():
+                svgs.append((path, STATUS_ICON_SIZE, STATUS_ICON_SIZE))
+                svgs.append((path, STATUS_POPUP_ICON_SIZE, STATUS_POPUP_ICON_SIZE))
+            for name in LOTO_ICONS:
+                svgs.append((asset_path(f"graphics/ui/{name}.svg"), LOTO_ICON_SIZE, LOTO_ICON_SIZE))
+        return svgs, sounds
+
+    @staticmethod
+    def unit_sprite_path(unit_type) -> str:
+        return asset_path(f"graphics/units/{str(unit_type).split('.')[-1].lower()}.svg")
+
+    def status_icon_paths(self) -> List[str]:
+        """Every status icon SVG (listed once)."""
+        if self._status_icons is None:
+            directory = asset_path("graphics/status_icons")
+            names = sorted(os.listdir(directory)) if os.path.isdir(directory) else []
+            self._status_icons = [os.path.join(directory, n) for n in names if n.endswith('.svg')]
+        return self._status_icons
+
+
+# Global manager shared by the renderer, animations and UI components
+asset_manager = AssetManager()
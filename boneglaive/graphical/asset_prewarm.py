@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Asset Prewarm
+Rasterizes the SVGs a screen is about to load, in parallel, before it loads them.
+
+When the raster cache is cold (first launch, new resolution, cache format bump)
+every load_svg() call runs cairosvg serially on the main thread. prewarm() takes
+the (path, width, height) jobs a screen will ask for, skips those already in
+the raster cache, and fans the rest out over a process pool. Workers return raw
+RGBA buffers; the main process writes them to the raster cache and keeps them
+in memory, so the screen's own load_svg() calls are all hits.
+
+Small batches are rasterized in-process: starting spawn workers costs more than
+a handful of icons.
+"""
+
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional, Tuple
+from boneglaive.utils.debug import logger
+from boneglaive.utils.paths import render_svg_pixels
+from boneglaive.utils.raster_cache import RasterCache
+
+# (svg path, width, height)
+RasterJob = Tuple[str, int, int]
+
+# Upper bound on worker processes
+PREWARM_MAX_WORKERS = 8
+
+# Fewer uncached jobs than this are rasterized in-process
+PARALLEL_THRESHOLD = 6
+
+
+class PrewarmReport:
+    """What a prewarm found in the cache and what it had to rasterize."""
+
+    def __init__(self, label: str = "assets"):
+        self.label = label
+        self.total = 0
+        self.cached = 0
+        self.rasterized = 0
+        self.failed = 0
+        self.workers = 0
+        self.seconds = 0.0             # Wall time of the whole prewarm
+        self.rasterize_seconds = 0.0   # Summed rasterization time across workers
+
+    def summary(self) -> str:
+        where = f"{self.workers} workers" if self.workers else "in-process"
+        return (f"Prewarmed {self.total} {self.label}: {self.cached} cached, "
+                f"{self.rasterized} rasterized, {self.failed} failed ({where}) "
+                f"in {self.seconds * 1000:.0f} ms, {self.rasterize_seconds * 1000:.0f} ms rasterizing")
+
+
+def _rasterize_job(svg_bytes: bytes, job: RasterJob):
+    """Worker: rasterize one job. Returns (raster or None, seconds)."""
+    start = time.perf_counter()
+    raster = render_svg_pixels(svg_bytes, *job)
+    return raster, time.perf_counter() - start
+
+
+def default_workers() -> int:
+    """Worker processes to use: all cores but one, at most PREWARM_MAX_WORKERS."""
+    return max(1, min(PREWARM_MAX_WORKERS, (os.cpu_count() or 2) - 1))
+
+
+def prewarm(jobs: List[RasterJob], workers: Optional[int] = None,
+            progress: Optional[Callable[[int, int], None]] = None,
+            cache: Optional[RasterCache] = None,
+            label: str = "assets") -> Tuple[Dict[RasterJob, Tuple[bytes, Tuple[int, int]]], PrewarmReport]:
+    """
+    Make sure every job is in the raster cache, rasterizing misses in parallel.
+
+    Args:
+        jobs: (svg path, width, height) to prepare; duplicates and missing files are skipped
+        workers: Worker processes (default: default_workers()); 0 rasterizes in-process
+        progress: Called with (done, total) as jobs finish
+        cache: Raster cache to fill (default: the global one used by load_svg)
+        label: What the jobs are, for the report
+
+    Returns:
+        (raw buffers of the jobs rasterized now, report)
+    """
+    if cache is None:
+        from boneglaive.utils import raster_cache as raster_cache_module
+        cache = raster_cache_module.raster_cache
+
+    start = time.perf_counter()
+    report = PrewarmReport(label)
+    pending = []   # (job, svg bytes, key)
+    for job in dict.fromkeys(jobs):
+        try:
+            with open(job[0], 'rb') as f:
+                svg_bytes = f.read()
+        except OSError:
+            continue
+        report.total += 1
+        key = RasterCache.key(svg_bytes, job[1], job[2])
+        if cache.contains(key):
+            report.cached += 1
+        else:
+            pending.append((job, svg_bytes, key))
+
+    done = report.cached
+    if progress:
+        progress(done, report.total)
+
+    buffers = {}
+    finished = set()
+
+    def finish(job, key, raster, seconds):
+        nonlocal done
+        finished.add(job)
+        report.rasterize_seconds += seconds
+        if raster is None:
+            report.failed += 1
+        else:
+            report.rasterized += 1
+            cache.put(key, *raster)
+            cache.remember(key, *raster)
+            buffers[job] = raster
+        done += 1
+        if progress:
+            progress(done, report.total)
+
+    if workers is None:
+        workers = default_workers()
+    if workers > 0 and len(pending) >= PARALLEL_THRESHOLD:
+        report.workers = min(workers, len(pending))
+        try:
+            # Spawn, not fork: the parent already holds a display connection
+            context = multiprocessing.get_context('spawn')
+            with ProcessPoolExecutor(max_workers=report.workers, mp_context=context) as executor:
+                futures = {executor.submit(_rasterize_job, svg_bytes, job): (job, key)
+                           for job, svg_bytes, key in pending}
+                for future in as_completed(futures):
+                    job, key = futures.pop(future)
+                    finish(job, key, *future.result())
+            pending = []
+        except Exception as e:
+            # Broken pool (no fork/spawn support, worker crash): finish in-process
+            logger.warning(f"Parallel prewarm failed, rasterizing in-process: {e}")
+            pending = [entry for entry in pending if entry[0] not in finished]
+
+    for job, svg_bytes, key in pending:
+        finish(job, key, *_rasterize_job(svg_bytes, job))
+
+    report.seconds = time.perf_counter() - start
+    logger.info(report.summary())
+    return buffers, report
+
+
+def prewarm_with_loading_screen(screen, font, jobs: List[RasterJob],
+                                label: str = "assets") -> PrewarmReport:
+    """
+    prewarm() while drawing a progress bar on screen.
+
+    The bar is only drawn once something has to be rasterized, so a warm
+    cache shows no loading screen at all.
+    """
+    from boneglaive.graphical.ui.loading_screen import LoadingScreen
+
+    loading_screen = LoadingScreen(screen, font)
+
+    def progress(done, total):
+        if done < total or loading_screen.shown:
+            loading_screen.draw(done, total, f"Preparing {label}")
+
+    _, report = prewarm(jobs, progress=progress, label=label)
+    return report
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Frame Compositor
+Layers the game frame and repaints only the parts of the screen that changed.
+
+The frame is built in three layers:
+    static       background and terrain grid, cached until terrain changes
+    semi-static  panels, combat log, skill bar, units at rest, selection and
+                 range overlays
+    dynamic      animations, particles, floating text, anything pulsing
+
+The static layer is one cached surface. The finished frame is kept between
+frames, so it doubles as the cache of the semi-static layers: a panel or a
+unit that did not change is neither redrawn nor sent to the display.
+
+Draw sites report what they change. mark_dirty() covers an area that changed
+since the last frame (a unit that moved, a status icon that appeared);
+animate() covers an area that changes on its own (a pulsing highlight, a
+spinning gear), which is repainted every frame for as long as it is reported.
+begin_frame() merges the reports into the rects to repaint, and the renderer
+redraws its layers clipped to each of them. A whole frame is drawn and flipped
+when the renderer asks for one (shake, flash, animations, input, game state
+changes), when too much changed for rects to pay off, or when the display has
+to be repainted (first frame, mode switch, window exposed).
+
+Setting verify makes the renderer draw every partial frame a second time in
+full and compare the two; blocks that differ are logged as missed dirty rects.
+The comparison is a debug check only: it costs a full draw and a pixel diff.
+"""
+
+from typing import List, Optional, Sequence, Tuple
+import numpy as np
+import pygame
+
+# When the rects to repaint cover this fraction of the screen, one full frame is cheaper
+FULL_UPDATE_FRACTION = 0.6
+
+# More merged rects than this are repainted as their bounding box
+MAX_DIRTY_RECTS = 8
+
+# Side of the square blocks the verify check compares frames in (pixels)
+VERIFY_BLOCK_SIZE = 64
+
+
+class PresentStats:
+    """Counts of how frames reached the display."""
+
+    def __init__(self):
+        self.frames = 0
+        self.full = 0          # Frames drawn whole and sent with display.flip()
+        self.partial = 0       # Frames repainted in rects and sent with display.update(rects)
+        self.skipped = 0       # Frames with nothing to repaint
+        self.rects = 0         # Rects sent by partial updates
+        self.pixels = 0        # Pixels sent, full and partial
+        self.missed = 0        # Partial frames the verify check found stale
+
+    def summary(self) -> str:
+        text = (f"{self.frames} frames: {self.full} full, {self.partial} partial "
+                f"({self.rects} rects), {self.skipped} unchanged")
+        if self.missed:
+            text += f", {self.missed} stale"
+        return text
+
+
+class FrameCompositor:
+    """Owns the static layer, collects dirty rects and presents finished frames."""
+
+    def __init__(self, full_update_fraction: float = FULL_UPDATE_FRACTION,
+                 max_rects: int = MAX_DIRTY_RECTS, verify: bool = False):
+        """
+        Args:
+            full_update_fraction: Repainted-area fraction at which a full frame is drawn
+            max_rects: Merged rects above which their bounding box is repainted instead
+            verify: Compare each partial frame with a full redraw (debug)
+        """
+        self.full_update_fraction = full_update_fraction
+        self.max_rects = max_rects
+        self.verify = verify
+        self.stats = PresentStats()
+
+        # Static layer: background with the terrain grid on top
+        self._static_layer: Optional[pygame.Surface] = None
+        self._static_valid = False
+
+        # Reports for the coming frame: changed areas, and areas that keep changing
+        self._dirty: List[pygame.Rect] = []
+        self._animated: List[pygame.Rect] = []
+        self._full = True  # The display's contents are unknown
+
+    # ------------------------------------------------------------------ #
+    # Static layer
+    # ------------------------------------------------------------------ #
+    def static_layer(self, background: pygame.Surface, grid: pygame.Surface,
+                     grid_pos: Tuple[int, int], grid_changed: bool) -> pygame.Surface:
+        """
+        Background with the terrain grid, rebuilt only when something under it changed.
+
+        Args:
+            background: Full-screen background surface
+            grid: Rendered terrain grid
+            grid_pos: Screen position of the grid
+            grid_changed: Whether the grid surface was redrawn since the last call
+
+        Returns:
+            The cached static layer (do not draw on it)
+        """
+        if self._static_layer is None or self._static_layer.get_size() != background.get_size():
+            self._static_layer = pygame.Surface(background.get_size())
+            self._static_valid = False
+        if not self._static_valid:
+            self._static_layer.blit(background, (0, 0))
+            self._static_valid = True
+            self._full = True
+            grid_changed = True
+        if grid_changed:
+            self._static_layer.blit(grid, grid_pos)
+            self.mark_dirty(pygame.Rect(grid_pos, grid.get_size()))
+        return self._static_layer
+
+    def invalidate_static(self) -> None:
+        """Rebuild the static layer (background included) on next use."""
+        self._static_valid = False
+
+    # ------------------------------------------------------------------ #
+    # Dirty rects
+    # ------------------------------------------------------------------ #
+    def invalidate(self) -> None:
+        """Draw and send the whole next frame (the display's contents are unknown)."""
+        self._full = True
+
+    def mark_dirty(self, rect) -> None:
+        """Repaint an area that changed since the last frame."""
+        rect = pygame.Rect(rect)
+        if rect.width > 0 and rect.height > 0:
+            self._dirty.append(rect)
+
+    def animate(self, rect) -> None:
+        """Repaint an area next frame because it changes on its own (report it while drawing)."""
+        rect = pygame.Rect(rect)
+        if rect.width > 0 and rect.height > 0:
+            self._animated.append(rect)
+
+    def begin_frame(self, screen_rect: pygame.Rect, full: bool = False) -> Optional[List[pygame.Rect]]:
+        """
+        Take the reports collected since the last frame.
+
+        Args:
+            screen_rect: The display's rect
+            full: Draw the whole frame regardless of the reports
+
+        Returns:
+            The rects to repaint (empty when nothing changed), or None to draw the whole frame
+        """
+        reported = self._dirty + self._animated
+        self._dirty = []
+        self._animated = []
+        if full or self._full:
+            self._full = False
+            return None
+
+        rects = merge_rects([rect.clip(screen_rect) for rect in reported])
+        if len(rects) > self.max_rects:
+            rects = [rects[0].unionall(rects[1:])]
+        area = sum(rect.width * rect.height for rect in rects)
+        if area >= self.full_update_fraction * screen_rect.width * screen_rect.height:
+            return None
+        return rects
+
+    # ------------------------------------------------------------------ #
+    # Presenting
+    # ------------------------------------------------------------------ #
+    def present(self, screen: pygame.Surface, rects: Optional[Sequence[pygame.Rect]]) -> List[pygame.Rect]:
+        """
+        Send the finished frame to the display.
+
+        Args:
+            screen: The display surface
+            rects: What begin_frame() returned for this frame
+
+        Returns:
+            The rects sent to the display (empty when nothing changed)
+        """
+        self.stats.frames += 1
+        if rects is None:
+            pygame.display.flip()
+            self.stats.full += 1
+            self.stats.pixels += screen.get_width() * screen.get_height()
+            return [screen.get_rect()]
+        if not rects:
+            self.stats.skipped += 1
+            return []
+
+        pygame.display.update(rects)
+        self.stats.partial += 1
+        self.stats.rects += len(rects)
+        self.stats.pixels += sum(rect.width * rect.height for rect in rects)
+        return list(rects)
+
+    def stale_rects(self, partial: pygame.Surface, reference: pygame.Surface) -> List[pygame.Rect]:
+        """
+        Blocks where a partially repainted frame differs from the same frame drawn whole.
+
+        Used by the verify check; counts a stale frame in the stats.
+        """
+        size = VERIFY_BLOCK_SIZE
+        try:
+            # surfarray is indexed (x, y); transposed views are row-major like the pixels
+            a = pygame.surfarray.pixels2d(partial).T
+            b = pygame.surfarray.pixels2d(reference).T
+            changed = a != b
+            del a, b  # Release the surface locks
+        except (ValueError, pygame.error):
+            return []
+
+        height, width = changed.shape
+        rows = -(-height // size)
+        columns = -(-width // size)
+        padded = np.zeros((rows * size, columns * size), dtype=bool)
+        padded[:height, :width] = changed
+        blocks = padded.reshape(rows, size, columns, size).any(axis=(1, 3))
+
+        bounds = pygame.Rect(0, 0, width, height)
+        stale = [pygame.Rect(column * size, row * size, size, size).clip(bounds)
+                 for row, column in zip(*np.nonzero(blocks))]
+        if stale:
+            self.stats.missed += 1
+        return merge_rects(stale)
+
+
+def merge_rects(rects: Sequence[pygame.Rect]) -> List[pygame.Rect]:
+    """Union rects that overlap or touch until none do; empty rects are dropped."""
+    merged: List[pygame.Rect] = []
+    for rect in rects:
+        if rect.width <= 0 or rect.height <= 0:
+            continue
+        rect = pygame.Rect(rect)
+        # Absorb every merged rect this one touches; the union may touch others, so repeat
+        while True:
+            touching = rect.inflate(2, 2).collidelistall(merged)
+            if not touching:
+                break
+            for index in reversed(touching):
+                rect.union_ip(merged.pop(index))
+        merged.append(rect)
+    return merged
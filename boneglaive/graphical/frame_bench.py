@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Board drawing benchmark.
+
+Times the parts of a frame the board texture atlas batches, on a full board
+with trap overlays revealed:
+
+- a full grid rebuild tile by tile (one blit per texture) against the batched
+  layer-by-layer rebuild from the atlas
+- the revealed trap overlays blitted one by one against one atlas blits() call
+- full draw() frames, frames the compositor skips because nothing changed,
+  and frames that rebuild the whole grid
+
+Without the game's SVG art (or cairo) the tiles fail to load and there is
+nothing to batch; --synthetic-assets fills every terrain tile and overlay
+with generated images so the drawing cost can still be measured.
+
+    python -m boneglaive.graphical.frame_bench --synthetic-assets --frames 200
+"""
+
+import os
+import statistics
+import time
+from typing import Callable, Dict, List
+
+
+def synthetic_board_assets(renderer) -> int:
+    """
+    Give every terrain type and board overlay a generated tile.
+
+    Tiles are half transparent so blending cost matches the real art.
+
+    Returns:
+        Number of tiles added
+    """
+    import pygame
+    from boneglaive.graphical import renderer as renderer_module
+    from boneglaive.game.map import TerrainType
+
+    tile_size = renderer_module.TILE_SIZE
+
+    def tile(seed: int) -> pygame.Surface:
+        surface = pygame.Surface((tile_size, tile_size), pygame.SRCALPHA)
+        surface.fill((40 + seed * 37 % 200, 60 + seed * 53 % 180, 80 + seed * 71 % 160, 160))
+        pygame.draw.circle(surface, (230, 220, 200, 255), (tile_size // 2, tile_size // 2), tile_size // 3)
+        return surface.convert_alpha()
+
+    added = 0
+    for seed, terrain_type in enumerate(TerrainType):
+        if renderer.terrain_tiles.get(terrain_type) is None:
+            surface = tile(seed)
+            renderer.terrain_tiles[terrain_type] = surface
+            renderer.board_atlas.add(terrain_type, surface)
+            added += 1
+    for seed, name in enumerate(("rail_universal", "scalar_node_trap", "fragcrest_trap"), start=100):
+        if getattr(renderer, name) is None:
+            surface = tile(seed)
+            setattr(renderer, name, surface)
+            renderer.board_atlas.add(name, surface)
+            added += 1
+    renderer.mark_all_tiles_dirty()
+    return added
+
+
+def reveal_traps(renderer, every: int = 3) -> int:
+    """
+    Reveal a trap overlay on every `every`-th passable tile of the board.
+
+    Alternates scalar nodes and Fragcrest traps. Returns the number revealed.
+    """
+    from boneglaive.utils.constants import HEIGHT, WIDTH
+
+    game = renderer.game_adapter.game
+    if not hasattr(game, 'scalar_nodes'):
+        game.scalar_nodes = {}
+    if not hasattr(game, 'fragcrest_traps'):
+        game.fragcrest_traps = {}
+    passable = [(y, x) for y in range(HEIGHT) for x in range(WIDTH) if game.map.is_passable(y, x)]
+    revealed = 0
+    for i, pos in enumerate(passable[::every]):
+        if i % 2:
+            game.fragcrest_traps[pos] = {'revealed': True}
+        else:
+            renderer.game_adapter.revealed_scalar_nodes.add(pos)
+        revealed += 1
+    return revealed
+
+
+def time_ms(fn: Callable[[], None], repeats: int) -> List[float]:
+    """Wall time of each of `repeats` calls to fn, in milliseconds."""
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000.0)
+    return samples
+
+
+def describe(samples: List[float]) -> str:
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return f"mean {statistics.mean(samples):7.3f} ms  median {statistics.median(samples):7.3f} ms  p95 {p95:7.3f} ms"
+
+
+def run_benchmark(renderer, frames: int = 100) -> Dict[str, List[float]]:
+    """
+    Time per-tile against batched board drawing on renderer's current game.
+
+    Returns:
+        Benchmark name -> per-run milliseconds
+    """
+    import pygame
+    from boneglaive.graphical import renderer as renderer_module
+
+    grid_w = renderer_module.GRID_WIDTH
+    grid_h = renderer_module.GRID_HEIGHT
+    tile_size = renderer_module.TILE_SIZE
+    game = renderer.game_adapter.game
+    target = pygame.Surface((grid_w * tile_size, grid_h * tile_size))
+
+    def grid_per_tile():
+        for y in range(grid_h):
+            for x in range(grid_w):
+                renderer._render_single_tile(target, x, y, game.map)
+
+    def grid_batched():
+        renderer._render_all_tiles(target, game.map)
+
+    screen = renderer.screen
+
+    def overlays_per_blit():
+        offset_x, offset_y = renderer_module.GRID_OFFSET_X, renderer_module.GRID_OFFSET_Y
+        for y, x in renderer.game_adapter.revealed_scalar_nodes:
+            screen.blit(renderer.scalar_node_trap, (offset_x + x * tile_size, offset_y + y * tile_size))
+        for (y, x), trap_info in game.fragcrest_traps.items():
+            if trap_info.get('revealed', False):
+                screen.blit(renderer.fragcrest_trap, (offset_x + x * tile_size, offset_y + y * tile_size))
+
+    # Without the overlay images there is nothing to blit one by one
+    overlays_loaded = renderer.scalar_node_trap is not None and renderer.fragcrest_trap is not None
+
+    def overlays_batched():
+        renderer.draw_revealed_traps(screen)
+
+    def frame_skipped():
+        renderer.update(1 / 60)
+        renderer.draw()
+
+    def frame():
+        # A static board leaves the compositor nothing to redraw after warm-up
+        renderer.compositor.invalidate()
+        frame_skipped()
+
+    def frame_with_grid_rebuild():
+        renderer.mark_all_tiles_dirty()
+        frame()
+
+    # Warm up caches (fonts, static layers) before timing anything
+    for _ in range(3):
+        frame()
+
+    results = {}
+    repeats = max(5, frames // 4)
+    results["grid rebuild, per tile"] = time_ms(grid_per_tile, repeats)
+    results["grid rebuild, atlas batched"] = time_ms(grid_batched, repeats)
+    if overlays_loaded:
+        results["trap overlays, per blit"] = time_ms(overlays_per_blit, frames)
+    results["trap overlays, atlas batched"] = time_ms(overlays_batched, frames)
+    results["frame"] = time_ms(frame, frames)
+    results["frame, unchanged (skipped)"] = time_ms(frame_skipped, frames)
+    results["frame with grid rebuild"] = time_ms(frame_with_grid_rebuild, repeats)
+    return results
+
+
+def main(argv=None) -> int:
+    """Command-line entry point."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark batched board drawing on a full board")
+    parser.add_argument("--frames", type=int, default=100, help="frames to time per benchmark")
+    parser.add_argument("--synthetic-assets", action="store_true",
+                        help="draw generated tiles for every terrain and overlay (for trees without the art)")
+    parser.add_argument("--setup", action="store_true",
+                        help="benchmark the setup-phase board instead of a game in progress")
+    parser.add_argument("--headless", action="store_true", help="use SDL's dummy video driver")
+    args = parser.parse_args(argv)
+
+    if args.headless:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+    from boneglaive.graphical.game_state import GameStateAdapter
+    from boneglaive.graphical.renderer import GraphicalRenderer
+
+    adapter = GameStateAdapter()
+    adapter.initialize_game(skip_setup=not args.setup)
+    renderer = GraphicalRenderer(adapter)
+    renderer.sync_units_from_game()
+    if args.synthetic_assets:
+        synthetic_board_assets(renderer)
+    revealed = reveal_traps(renderer)
+
+    atlas = renderer.board_atlas
+    print(f"{getattr(adapter.game.map, 'name', 'Board')}: "
+          f"{len(renderer.units)} units, {revealed} trap overlays, "
+          f"{len(atlas)} images in {len(atlas.pages)} atlas pages")
+    if not len(atlas):
+        print("No board tiles loaded: nothing to batch (try --synthetic-assets)")
+        return 0
+
+    for name, samples in run_benchmark(renderer, args.frames).items():
+        print(f"{name:30s} {describe(samples)}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Frame Profiler
+Per-stage frame timing, with a percentile overlay and CSV export.
+
+The FPS counter says how slow a frame is, not where the time goes. With the
+profiler enabled (the Frame Profiler toggle in Interface Settings), the main
+loop times each stage of a frame:
+
+    handle_events, update     the loop's input and simulation steps
+    sync_state                game-state sync, wherever it is called from
+                              (so it is also part of the step that called it)
+    grid ... ui, overlay      the stages of draw(), in draw order
+    flip                      presenting the frame
+    frame                     the whole frame's work, excluding the wait
+
+Loop stages are laps: lap(name) charges the time since the previous lap to
+name, so a stage boundary is one call and draw() keeps its shape. Nested or
+scattered work is timed with stage() or the timed() decorator instead.
+
+The last PROFILE_WINDOW frames are kept. The overlay shows p50/p95/p99 per
+stage against the 60 fps budget, and export_csv() writes them one row per
+frame. While disabled every call returns at once.
+"""
+
+import csv
+import functools
+import math
+import time
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import pygame
+
+# Frames kept for percentiles and CSV export (ten seconds at 60 fps)
+PROFILE_WINDOW = 600
+
+# Frames between overlay refreshes (percentiles are re-sorted only then)
+OVERLAY_REFRESH_FRAMES = 30
+
+# Bar scale of the overlay: one 60 fps frame
+FRAME_BUDGET_MS = 1000.0 / 60
+
+# Stage names in report order; stages not listed follow in first-seen order
+STAGES = ("handle_events", "sync_state", "update",
+          "grid", "traps", "rail_junctions", "range_indicators", "highlights", "shadows",
+          "units", "animations", "particles", "ui", "overlay", "flip")
+
+# Whole-frame total
+FRAME = "frame"
+
+# Overlay layout and colours
+OVERLAY_BAR_WIDTH = 120
+OVERLAY_PADDING = 6
+COLOR_OVERLAY_BG = (20, 20, 20)
+COLOR_OVERLAY_TEXT = (100, 255, 100)
+COLOR_P50 = (90, 200, 90)
+COLOR_P95 = (220, 200, 70)
+COLOR_P99 = (220, 80, 70)
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of already sorted values (0.0 when empty)."""
+    if not sorted_values:
+        return 0.0
+    rank = math.ceil(fraction * len(sorted_values))
+    return sorted_values[min(len(sorted_values), max(1, rank)) - 1]
+
+
+class FrameProfiler:
+    """Times the stages of each frame and reports their percentiles."""
+
+    def __init__(self, window: int = PROFILE_WINDOW):
+        self.enabled = False
+        self.frames = deque(maxlen=window)  # One {stage: ms} dict per frame
+        self.frame_count = 0                # Frames recorded since the last clear()
+        self._stage_order = list(STAGES)
+        self._current: Optional[Dict[str, float]] = None
+        self._frame_start = 0.0
+        self._lap = 0.0
+
+        self._overlay: Optional[pygame.Surface] = None
+        self._overlay_frame = -OVERLAY_REFRESH_FRAMES
+
+    def clear(self) -> None:
+        """Drop all recorded frames."""
+        self.frames.clear()
+        self.frame_count = 0
+        self._current = None
+        self._overlay = None
+        self._overlay_frame = -OVERLAY_REFRESH_FRAMES
+
+    # ------------------------------------------------------------------ #
+    # Recording
+    # ------------------------------------------------------------------ #
+    def begin_frame(self) -> None:
+        """Start a frame; the first lap is timed from here."""
+        if not self.enabled:
+            return
+        self._current = {}
+        self._frame_start = self._lap = time.perf_counter()
+
+    def lap(self, name: str) -> None:
+        """Charge the time since the previous lap (or begin_frame) to a stage."""
+        if self._current is None:
+            return
+        now = time.perf_counter()
+        self._add(name, (now - self._lap) * 1000.0)
+        self._lap = now
+
+    @contextmanager
+    def stage(self, name: str):
+        """Time a block as a stage (adds up if it runs more than once a frame)."""
+        if self._current is None:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._add(name, (time.perf_counter() - start) * 1000.0)
+
+    def timed(self, name: str):
+        """Decorator timing every call of a function as a stage."""
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if self._current is None:
+                    return func(*args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self._add(name, (time.perf_counter() - start) * 1000.0)
+            return wrapper
+        return decorator
+
+    def end_frame(self) -> None:
+        """Finish the frame and record its stages."""
+        if self._current is None:
+            return
+        current = self._current
+        current[FRAME] = (time.perf_counter() - self._frame_start) * 1000.0
+        self.frames.append(current)
+        self.frame_count += 1
+        self._current = None
+
+    def _add(self, name: str, ms: float) -> None:
+        current = self._current
+        if name not in current and name not in self._stage_order:
+            self._stage_order.append(name)
+        current[name] = current.get(name, 0.0) + ms
+
+    # ------------------------------------------------------------------ #
+    # Reports
+    # ------------------------------------------------------------------ #
+    def stages(self) -> List[str]:
+        """Names of the stages recorded in the window, in report order, then the frame total."""
+        seen = set()
+        for frame in self.frames:
+            seen.update(frame)
+        return [name for name in self._stage_order if name in seen] + ([FRAME] if FRAME in seen else [])
+
+    def percentiles(self, name: str) -> Tuple[float, float, float]:
+        """(p50, p95, p99) of a stage over the window, in milliseconds (0 in frames it did not run)."""
+        values = sorted(frame.get(name, 0.0) for frame in self.frames)
+        return percentile(values, 0.50), percentile(values, 0.95), percentile(values, 0.99)
+
+    def export_csv(self, path: Optional[Path] = None) -> Path:
+        """
+        Write the window to a CSV file, one row per frame and one column per stage.
+
+        Args:
+            path: File to write; defaults to a timestamped file under the user config directory
+
+        Returns:
+            The path written
+        """
+        if path is None:
+            from boneglaive.utils.paths import user_config_dir
+            directory = user_config_dir() / "profiles"
+            directory.mkdir(parents=True, exist_ok=True)
+            path = directory / time.strftime("frame_profile_%Y%m%d_%H%M%S.csv")
+        path = Path(path)
+        names = self.stages()
+        first = self.frame_count - len(self.frames)
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["frame"] + [f"{name}_ms" for name in names])
+            for index, frame in enumerate(self.frames):
+                writer.writerow([first + index] + [f"{frame.get(name, 0.0):.3f}" for name in names])
+        return path
+
+    def summary(self) -> str:
+        """Percentile report of every stage."""
+        if not self.frames:
+            return "Frame profile: no frames recorded"
+        lines = [f"Frame profile: {len(self.frames)} frames (p50 / p95 / p99 ms)"]
+        for name in self.stages():
+            p50, p95, p99 = self.percentiles(name)
+            lines.append(f"  {name:16s} {p50:7.2f} {p95:7.2f} {p99:7.2f}")
+        return "\n".join(lines)
+
+    def overlay(self, font: pygame.font.Font) -> Optional[pygame.Surface]:
+        """
+        The overlay panel: p50/p95/p99 per stage as numbers and as bars against the frame budget.
+
+        Rebuilt every OVERLAY_REFRESH_FRAMES frames; None until a frame is recorded.
+        """
+        if not self.frames:
+            return None
+        if self._overlay is not None and self.frame_count - self._overlay_frame < OVERLAY_REFRESH_FRAMES:
+            return self._overlay
+
+        rows = [(name, self.percentiles(name)) for name in self.stages()]
+        labels = [font.render(name, True, COLOR_OVERLAY_TEXT) for name, _ in rows]
+        numbers = [font.render(f"{p50:6.2f} {p95:6.2f} {p99:6.2f}", True, COLOR_OVERLAY_TEXT)
+                   for _, (p50, p95, p99) in rows]
+        header = font.render(f"p50 / p95 / p99 ms, {len(self.frames)} frames", True, COLOR_OVERLAY_TEXT)
+
+        line_height = font.get_linesize()
+        label_width = max(label.get_width() for label in labels)
+        number_width = max(number.get_width() for number in numbers)
+        width = max(header.get_width(),
+                    label_width + number_width + OVERLAY_BAR_WIDTH + OVERLAY_PADDING * 2) + OVERLAY_PADDING * 2
+        height = line_height * (len(rows) + 1) + OVERLAY_PADDING * 2
+
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel.fill((*COLOR_OVERLAY_BG, 200))
+        panel.blit(header, (OVERLAY_PADDING, OVERLAY_PADDING))
+        bar_x = OVERLAY_PADDING * 3 + label_width + number_width
+        bar_height = max(2, line_height - 4)
+        for row, ((name, values), label, number) in enumerate(zip(rows, labels, numbers)):
+            y = OVERLAY_PADDING + line_height * (row + 1)
+            panel.blit(label, (OVERLAY_PADDING, y))
+            panel.blit(number, (OVERLAY_PADDING * 2 + label_width, y))
+            # Widest first, so each shorter percentile shows on top of the next
+            for value, color in zip(reversed(values), (COLOR_P99, COLOR_P95, COLOR_P50)):
+                bar_width = int(min(1.0, value / FRAME_BUDGET_MS) * OVERLAY_BAR_WIDTH)
+                if bar_width > 0:
+                    pygame.draw.rect(panel, color, (bar_x, y + 2, bar_width, bar_height))
+            pygame.draw.line(panel, COLOR_OVERLAY_TEXT, (bar_x + OVERLAY_BAR_WIDTH, y),
+                             (bar_x + OVERLAY_BAR_WIDTH, y + line_height - 1))
+
+        self._overlay = panel
+        self._overlay_frame = self.frame_count
+        return panel
+
+
+# Global profiler shared by the renderer and the game state adapter
+frame_profiler = FrameProfiler()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Frame Scheduler
+Decides when the main loop runs its next frame, and measures what frames cost.
+
+Adaptive mode moves between three states:
+    active   60 fps while animations, particles, shake/flash run, or input just arrived
+    ambient  30 fps while frames still change without them (pulsing highlights,
+             status icons, auras)
+    idle     once IDLE_AFTER_FRAMES frames in a row presented nothing new, the
+             loop sleeps in pygame.event.wait() until input arrives, waking every
+             IDLE_WAKEUP_SECONDS so clocks and timers keep moving
+
+"fixed" always ticks at 60 fps (the old behaviour); "benchmark" never waits, to
+measure how fast frames can be produced. Set with the frame_rate_mode config key.
+"""
+
+import time
+from collections import deque
+from typing import List, Tuple
+import pygame
+
+ACTIVE_FPS = 60
+AMBIENT_FPS = 30
+IDLE_WAKEUP_SECONDS = 0.25
+
+# Input keeps the loop at full rate this long (hover and press transitions)
+INPUT_GRACE_SECONDS = 0.5
+
+# Consecutive unchanged frames before the loop goes idle
+IDLE_AFTER_FRAMES = 3
+
+# Frames averaged for the CPU-time readout
+CPU_WINDOW = 60
+
+FRAME_RATE_MODES = ("adaptive", "fixed", "benchmark")
+
+
+class FrameScheduler:
+    """Paces the main loop and records main-thread CPU time per frame."""
+
+    ACTIVE = "active"
+    AMBIENT = "ambient"
+    IDLE = "idle"
+
+    def __init__(self, clock: pygame.time.Clock, mode: str = "adaptive"):
+        """
+        Args:
+            clock: The loop's pygame clock
+            mode: "adaptive", "fixed" or "benchmark"
+        """
+        self.clock = clock
+        self.mode = mode if mode in FRAME_RATE_MODES else "adaptive"
+        self.state = self.ACTIVE
+        self.unchanged_frames = 0
+        self.last_input = time.monotonic()
+
+        self._frame_start = 0.0
+        self._wall_start = 0.0
+        self._cpu_times = deque(maxlen=CPU_WINDOW)
+        self._work_times = deque(maxlen=CPU_WINDOW)
+        self._frame_ends = deque(maxlen=CPU_WINDOW + 1)
+        self.frames = {self.ACTIVE: 0, self.AMBIENT: 0, self.IDLE: 0}
+
+    def next_state(self, animating: bool) -> str:
+        """State for the coming frame."""
+        if self.mode != "adaptive":
+            return self.ACTIVE
+        if animating or time.monotonic() - self.last_input < INPUT_GRACE_SECONDS:
+            return self.ACTIVE
+        if self.unchanged_frames >= IDLE_AFTER_FRAMES:
+            return self.IDLE
+        return self.AMBIENT
+
+    def wait(self, animating: bool) -> Tuple[float, List[pygame.event.Event]]:
+        """
+        Sleep until the next frame is due.
+
+        Args:
+            animating: Whether anything on screen is moving this frame
+
+        Returns:
+            (seconds since the previous frame, events taken from the queue while waiting)
+        """
+        self.state = self.next_state(animating)
+        self.frames[self.state] += 1
+        events = []
+        if self.mode == "benchmark":
+            milliseconds = self.clock.tick()
+        elif self.state == self.IDLE:
+            event = pygame.event.wait(int(IDLE_WAKEUP_SECONDS * 1000))
+            if event.type != pygame.NOEVENT:
+                events.append(event)
+            milliseconds = self.clock.tick()
+        else:
+            milliseconds = self.clock.tick(ACTIVE_FPS if self.state == self.ACTIVE else AMBIENT_FPS)
+        return milliseconds / 1000.0, events
+
+    def begin_frame(self) -> None:
+        """Start timing the frame's work."""
+        self._frame_start = time.thread_time()
+        self._wall_start = time.perf_counter()
+
+    def end_frame(self, changed: bool, had_input: bool) -> None:
+        """
+        Finish timing the frame's work.
+
+        Args:
+            changed: Whether the frame presented anything new
+            had_input: Whether the frame handled any events
+        """
+        self._cpu_times.append(time.thread_time() - self._frame_start)
+        now = time.perf_counter()
+        self._work_times.append(now - self._wall_start)
+        self._frame_ends.append(now)
+        if had_input:
+            self.last_input = time.monotonic()
+        self.unchanged_frames = 0 if changed else self.unchanged_frames + 1
+
+    @property
+    def cpu_ms(self) -> float:
+        """Mean main-thread CPU time of recent frames, in milliseconds."""
+        if not self._cpu_times:
+            return 0.0
+        return sum(self._cpu_times) / len(self._cpu_times) * 1000.0
+
+    @property
+    def frame_ms(self) -> float:
+        """Mean wall-clock time of recent frames' work (excluding the wait), in milliseconds."""
+        if not self._work_times:
+            return 0.0
+        return sum(self._work_times) / len(self._work_times) * 1000.0
+
+    @property
+    def cpu_percent(self) -> float:
+        """Share of one core the main thread used over recent frames, waits included."""
+        if len(self._frame_ends) < 2:
+            return 0.0
+        elapsed = self._frame_ends[-1] - self._frame_ends[0]
+        if elapsed <= 0:
+            return 0.0
+        # The first frame end only opens the window; its CPU time lies before it
+        busy = sum(list(self._cpu_times)[-(len(self._frame_ends) - 1):])
+        return busy / elapsed * 100.0
@@ -13,6 +13,9 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 # Import actual game classes
 from boneglaive.game.engine import Game
+from boneglaive.graphical.frame_profiler import frame_profiler
+
+
 class AnimationEvent:
     """Represents an animation that needs to be played."""
     def __init__(self, event_type: str, source_unit, target_unit=None, **kwargs):
@@ -419,6 +422,7 @@ class GameStateAdapter:
                 # Clear the flag
                 unit.valuation_oracle_initial_application = False
 
+    @frame_profiler.timed("sync_state")
     def sync_state(self) -> List[AnimationEvent]:
         """
         Synchronize visual state with game state.
@@ -1390,79 +1394,13 @@ class GameStateAdapter:
         if not self.game or not game_unit or not skill:
             return []
 
-        skill_range_positions = []
-
-        # Get unit's position (or planned move position)
-        from_y = game_unit.y
-        from_x = game_unit.x
-        if game_unit.move_target:
-            from_y, from_x = game_unit.move_target
-
-        # Special case for Gaussian Dusk - only show cardinal direction lines
-        if skill.name == "Gaussian Dusk":
-            # Show four cardinal direction lines from unit position
-            directions = [(0, 1), (0, -1), (1, 0), (-1, 0)]  # East, West, South, North
-            for dy, dx in directions:
-                y, x = from_y, from_x
-                # Trace line in this direction across the map
-                while True:
-                    y += dy
-                    x += dx
-                    # Stop if we go off the map
-                    if not (0 <= y < self.game.map.height and 0 <= x < self.game.map.width):
-                        break
-                    # Convert to renderer coords and add
-                    skill_range_positions.append((x, y))
-
-        # Hornswoggle / Topiary Breath: show all 8 adjacent tiles as direction selectors
-        elif skill.name in ("Hornswoggle", "Topiary Breath"):
-            for dy in (-1, 0, 1):
-                for dx in (-1, 0, 1):
-                    if dy == 0 and dx == 0:
-                        continue
-                    adj_y = from_y + dy
-                    adj_x = from_x + dx
-                    if self.game.is_valid_position(adj_y, adj_x):
-                        skill_range_positions.append((adj_x, adj_y))
-        else:
-            # Special handling for Vault - check for upgrade before calculating range
-            if skill.name == "Vault":
-                from boneglaive.game.upgrades import UpgradeManager
-                is_upgraded = UpgradeManager.is_skill_upgraded(game_unit, "Vault")
-                skill.range = 3 if is_upgraded else 2
-
-            # Get skill range (check for dynamic range method first)
-            if hasattr(skill, 'get_skill_range') and callable(skill.get_skill_range):
-                skill_range = skill.get_skill_range(game_unit, self.game)
-            elif hasattr(skill, 'get_range') and callable(skill.get_range):
-                skill_range = skill.get_range(game_unit)
-            else:
-                skill_range = skill.range
-
-            # Check all positions within range
-            for y in range(max(0, from_y - skill_range), min(self.game.map.height, from_y + skill_range + 1)):
-                for x in range(max(0, from_x - skill_range), min(self.game.map.width, from_x + skill_range + 1)):
-                    # Calculate distance
-                    distance = self.game.chess_distance(from_y, from_x, y, x)
-                    if distance > skill_range:
-                        continue
-
-                    # Check if skill can be used on this position
-                    can_use_result = skill.can_use(game_unit, (y, x), self.game)
-
-                    # Debug logging for Diverge skill
-                    if skill.name == "Diverge":
-                        target_unit = self.game.get_unit_at(y, x)
-                        if target_unit:
-                            pass
-                        else:
-                            pass
-
-                    if can_use_result:
-                        # Convert to renderer coords
-                        skill_range_positions.append((x, y))
-
-        return skill_range_positions
+        from boneglaive.game.targeting import TargetShape, skill_target_candidates
+
+        # Gaussian Dusk shows its four cardinal lines; Hornswoggle / Topiary Breath show
+        # the 8 adjacent tiles as direction selectors. Everything else shows the tiles
+        # the skill can actually be used on.
+        validate = skill.target_shape not in (TargetShape.CARDINAL, TargetShape.ADJACENT)
+        return [(x, y) for y, x in skill_target_candidates(skill, game_unit, self.game, validate=validate)]
 
     def handle_player_action(self, action_type: str, **kwargs) -> bool:
         """
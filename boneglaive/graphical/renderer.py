@@ -11,7 +11,8 @@ import random
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 
-from boneglaive.utils.paths import asset_path, load_svg
+from boneglaive.utils.paths import asset_path
+from boneglaive.utils.debug import logger
 
 # Add parent directory to path to import animations
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
@@ -26,6 +27,13 @@ from .animations.core import (
 
 from .game_state import GameStateAdapter, AnimationEvent
 from .camera import Camera
+from .compositor import FrameCompositor
+from .frame_scheduler import FrameScheduler
+from .frame_profiler import frame_profiler
+from .asset_prewarm import prewarm_with_loading_screen
+from .asset_manager import asset_manager
+from .texture_atlas import TextureAtlas
+from .animation_timeline import AnimationTimeline
 from .ui.skill_bar import SkillBar
 from .ui.combat_log import CombatLog
 from .ui.message_log_window import MessageLogWindow
@@ -42,6 +50,7 @@ from .ui.setup_window import SetupWindow, SetupPlacementBar
 from .ui.setup_unit_help import SetupUnitHelp
 from .ui.game_over_window import GameOverWindow
 from .ui.concede_dialog import ConcedeDialog
+from .ui.font_utils import get_font, render_text, text_cache
 from .ui.setup_exit_dialog import SetupExitDialog
 from .ui_adapter import GraphicalUIAdapter
 
@@ -55,10 +64,10 @@ from boneglaive.utils.constants import UnitType
 from boneglaive.utils.message_log import message_log
 
 # Import config manager for UI layout settings and resolution
-from boneglaive.utils.config import ConfigManager
+from boneglaive.utils.config import get_config
 
 # Load resolution from config
-config = ConfigManager()
+config = get_config()
 
 # Screen constants (now dynamic from config)
 SCREEN_WIDTH = config.get('window_width', 1280)
@@ -114,12 +123,11 @@ class GraphicalRenderer:
     """
 
     def __init__(self, game_adapter: GameStateAdapter = None):
-        # Reload config and refresh module-level layout constants so that
-        # resolution changes made in the settings screen take effect here.
-        global config, SCREEN_WIDTH, SCREEN_HEIGHT
+        # Refresh module-level layout constants so that resolution changes
+        # made in the settings screen take effect here.
+        global SCREEN_WIDTH, SCREEN_HEIGHT
         global TOP_BAR_HEIGHT, BOTTOM_BAR_HEIGHT, LEFT_PANEL_WIDTH, RIGHT_PANEL_WIDTH
         global GAME_BOARD_WIDTH, TILE_SIZE, GAME_BOARD_HEIGHT, GRID_OFFSET_X, GRID_OFFSET_Y
-        config = ConfigManager()
         SCREEN_WIDTH = config.get('window_width', 1280)
         SCREEN_HEIGHT = config.get('window_height', 720)
         TOP_BAR_HEIGHT = int(SCREEN_HEIGHT * 0.0694)
@@ -132,10 +140,8 @@ class GraphicalRenderer:
         GRID_OFFSET_X = LEFT_PANEL_WIDTH
         GRID_OFFSET_Y = TOP_BAR_HEIGHT + ((SCREEN_HEIGHT - TOP_BAR_HEIGHT - BOTTOM_BAR_HEIGHT - GAME_BOARD_HEIGHT) // 2)
 
-        # Refresh scale_manager and all module-level constants in UI files
-        from boneglaive.graphical.ui.scale_utils import scale_manager, refresh_all_module_constants
-        scale_manager.config = config
-        scale_manager.update_scale()
+        # Refresh module-level constants in UI files (scale_manager follows the config itself)
+        from boneglaive.graphical.ui.scale_utils import refresh_all_module_constants
         refresh_all_module_constants()
 
         # Set SDL2 hints BEFORE pygame.init() for better icon support
@@ -164,6 +170,13 @@ class GraphicalRenderer:
         pygame.display.set_caption(SCREEN_TITLE)
         self.clock = pygame.time.Clock()
 
+        # Paces the main loop: full rate while animating, event-driven when idle
+        self.frame_scheduler = FrameScheduler(self.clock, config.get('frame_rate_mode', 'adaptive'))
+
+        # Per-stage frame timing overlay (F9 exports the recorded frames to CSV)
+        self.profiler = frame_profiler
+        self.profiler.enabled = config.get('show_frame_profiler', False)
+
         # Fonts - scale with resolution (base sizes for 800p height)
         # Scale fonts based on screen height to maintain readability
         font_scale = SCREEN_HEIGHT / 800.0
@@ -196,6 +209,10 @@ class GraphicalRenderer:
             tile_size=TILE_SIZE
         )
 
+        # Rasterize board tiles and unit sprites in parallel before anything loads them
+        self.prewarm_report = prewarm_with_loading_screen(
+            self.screen, self.font, self._board_svg_jobs(), label="board tiles")
+
         # Game state adapter
         self.game_adapter = game_adapter or GameStateAdapter()
 
@@ -206,12 +223,13 @@ class GraphicalRenderer:
         self.floating_texts: List[FloatingText] = []
         self.debris_particles: List[DebrisParticle] = []
 
+        # Animation tracks, updated, drawn and costed by one timeline
+        self.timeline = AnimationTimeline()
         # Active animations (skill animations, projectiles, etc.)
-        self.active_animations = []  # List of animation objects
-
+        self.active_animations = self.timeline.track("active")
         # Background animations (persistent zones, environmental effects - NON-BLOCKING)
         # These don't prevent pending animations from flushing
-        self.background_animations = []
+        self.background_animations = self.timeline.track("background")
 
         # Pending animation events (damage/heal numbers to show after animations finish)
         self.pending_animation_events = []
@@ -294,7 +312,9 @@ class GraphicalRenderer:
         self.ui_adapter = GraphicalUIAdapter(self)
 
         # Terrain and furniture tile cache
-        self.terrain_tiles: Dict[TerrainType, pygame.Surface] = {}
+        self.terrain_tiles: Dict[TerrainType, Optional[pygame.Surface]] = {}
+        # Tile-sized board images packed for batched blits (terrain, furniture, trap and rail overlays)
+        self.board_atlas = TextureAtlas()
         self._init_terrain_furniture_mapping()
 
         # Universal rail bomb overlay (single graphic for all rail tiles)
@@ -333,15 +353,33 @@ class GraphicalRenderer:
         self._dirty_tiles = set()  # Set of (x, y) tiles that need redrawing
         self._grid_fully_dirty = True  # Flag to force full redraw
 
+        # Layered frame composition and dirty-rectangle presentation
+        self.compositor = FrameCompositor(verify=config.get('verify_dirty_rects', False))
+        self._frame_changed = True  # Whether the last frame presented anything new
+        self._unit_draw_states = {}  # AnimatedUnit -> (draw state, screen bounds) from the last frame
+        self._last_frame_state = None  # _frame_state() of the last frame
+        self._was_busy = True  # Whether the last frame had to be drawn whole
+        self._input_seen = False  # Events handled since the last frame
+
+        # What the last asset prefetch was queued for (see sync_units_from_game)
+        self._prefetch_key = None
+
         # Terrain hiding for animations — tiles in this set render as empty
         # Animations add (grid_x, grid_y) to hide terrain and remove to reveal
         self.hidden_tiles = set()
 
         # FPS counter (for troubleshooting)
-        self.show_fps = False  # Set to True to show FPS counter
+        self.show_fps = config.get('show_fps', False)  # FPS and CPU-per-frame counter
         self.fps_values = []  # Rolling window of recent FPS values
         self.fps_display = 0  # Smoothed FPS to display
 
+        # Panel arrangement: "default" or "reversed"
+        self.ui_layout = config.get('ui_layout', 'default')
+
+        # Follow settings changed elsewhere or edited in the config file
+        config.subscribe(self._on_config_change,
+                         keys=('show_fps', 'show_frame_profiler', 'ui_layout', 'verify_dirty_rects'))
+
         # Cached surfaces for performance (avoid creating SRCALPHA surfaces every frame)
         self._selection_highlight_cache = None
         self._last_selection_alpha = None
@@ -349,6 +387,17 @@ class GraphicalRenderer:
         self.running = True
         self.paused = False
 
+    def _board_svg_jobs(self) -> List[Tuple[str, int, int]]:
+        """(path, width, height) of every SVG drawn at tile size: terrain, furniture, units, overlays."""
+        jobs = []
+        for dir_name in ("terrain", "furniture", "units"):
+            dir_path = asset_path(f"graphics/{dir_name}")
+            if os.path.isdir(dir_path):
+                jobs.extend((os.path.join(dir_path, filename), TILE_SIZE, TILE_SIZE)
+                            for filename in sorted(os.listdir(dir_path)) if filename.endswith('.svg'))
+        jobs.append((asset_path("graphics/ui/rail_junction_overlay.svg"), TILE_SIZE, TILE_SIZE))
+        return jobs
+
     def _init_terrain_furniture_mapping(self):
         """Initialize the mapping from TerrainType to SVG file paths."""
         # Mapping from TerrainType to SVG filename
@@ -405,7 +454,7 @@ class GraphicalRenderer:
     def _load_terrain_tile(self, terrain_type: TerrainType) -> Optional[pygame.Surface]:
         """
         Load a terrain/furniture tile from SVG file.
-        Caches the loaded surface for performance.
+        Caches the loaded surface (or the failure) and packs it into the board atlas.
 
         Args:
             terrain_type: TerrainType enum value
@@ -419,12 +468,12 @@ class GraphicalRenderer:
 
         # Get SVG path from mapping
         svg_path = self.terrain_svg_map.get(terrain_type)
-        if not svg_path or not os.path.exists(svg_path):
-            return None
-
-        surface = load_svg(svg_path, TILE_SIZE, TILE_SIZE)
+        surface = None
+        if svg_path and os.path.exists(svg_path):
+            surface = asset_manager.surface(svg_path, TILE_SIZE, TILE_SIZE)
         if surface:
-            self.terrain_tiles[terrain_type] = surface
+            self.board_atlas.add(terrain_type, surface)
+        self.terrain_tiles[terrain_type] = surface
         return surface
 
     def _load_rail_overlays(self) -> None:
@@ -434,9 +483,10 @@ class GraphicalRenderer:
         """
         svg_path = asset_path("graphics/terrain/rail_universal.svg")
 
-        surface = load_svg(svg_path, TILE_SIZE, TILE_SIZE)
+        surface = asset_manager.surface(svg_path, TILE_SIZE, TILE_SIZE)
         if surface:
             self.rail_universal = surface
+            self.board_atlas.add("rail_universal", surface)
 
     def _load_scalar_node_overlay(self) -> None:
         """
@@ -445,9 +495,10 @@ class GraphicalRenderer:
         """
         svg_path = asset_path("graphics/terrain/scalar_node_trap.svg")
 
-        surface = load_svg(svg_path, TILE_SIZE, TILE_SIZE)
+        surface = asset_manager.surface(svg_path, TILE_SIZE, TILE_SIZE)
         if surface:
             self.scalar_node_trap = surface
+            self.board_atlas.add("scalar_node_trap", surface)
 
     def _load_fragcrest_trap_overlay(self) -> None:
         """
@@ -457,9 +508,10 @@ class GraphicalRenderer:
         """
         svg_path = asset_path("graphics/terrain/fragcrest_trap.svg")
 
-        surface = load_svg(svg_path, TILE_SIZE, TILE_SIZE)
+        surface = asset_manager.surface(svg_path, TILE_SIZE, TILE_SIZE)
         if surface:
             self.fragcrest_trap = surface
+            self.board_atlas.add("fragcrest_trap", surface)
 
     def _load_rail_junction_overlay(self) -> None:
         """
@@ -468,7 +520,7 @@ class GraphicalRenderer:
         """
         svg_path = asset_path("graphics/ui/rail_junction_overlay.svg")
 
-        surface = load_svg(svg_path, TILE_SIZE, TILE_SIZE)
+        surface = asset_manager.surface(svg_path, TILE_SIZE, TILE_SIZE)
         if surface:
             self.rail_junction_overlay = surface
 
@@ -481,6 +533,15 @@ class GraphicalRenderer:
         if not self.game_adapter.game:
             return
 
+        # Queue what this game can show next (map tiles, roster skills and statuses) for background
+        # loading, whenever the game, its terrain or the unit types on the board change
+        game = self.game_adapter.game
+        prefetch_key = (game, game.map, getattr(game.map, 'version', 0), getattr(game, 'setup_phase', False),
+                        frozenset(unit.type for unit in game.units))
+        if prefetch_key != self._prefetch_key:
+            self._prefetch_key = prefetch_key
+            asset_manager.prefetch_for_game(game, self.terrain_svg_map, TILE_SIZE)
+
         # Get all alive game units
         alive_units = {}
         for game_unit in self.game_adapter.game.units:
@@ -691,12 +752,25 @@ class GraphicalRenderer:
         # No ghost found, check physical positions
         return self.get_unit_at_grid(grid_x, grid_y)
 
-    def handle_events(self):
-        """Handle pygame events."""
-        for event in pygame.event.get():
+    def handle_events(self, events=None):
+        """
+        Handle pygame events.
+
+        Args:
+            events: Events already taken from the queue (default: drain the queue)
+        """
+        events = pygame.event.get() if events is None else events
+        if events:
+            # Hover and press states follow input: draw the next frame whole
+            self._input_seen = True
+        for event in events:
             if event.type == pygame.QUIT:
                 self.running = False
 
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED):
+                # The window system lost our pixels: send the next frame whole
+                self.compositor.invalidate()
+
             elif event.type == pygame.MOUSEBUTTONUP:
                 # Handle scrollbar releases
                 if event.button == 1:
@@ -855,6 +929,14 @@ class GraphicalRenderer:
                 elif event.key == pygame.K_F11:
                     # Toggle fullscreen mode
                     self._toggle_fullscreen()
+                elif event.key == pygame.K_F9 and self.profiler.enabled:
+                    try:
+                        path = self.profiler.export_csv()
+                    except OSError as e:
+                        logger.error(f"Error saving frame profile: {e}")
+                        self.combat_log.add_message(f"Could not save frame profile: {e}", "system")
+                    else:
+                        self.combat_log.add_message(f"Frame profile saved to {path}", "system")
                 elif event.key == pygame.K_SPACE:
                     self.paused = not self.paused
                 elif event.key == pygame.K_TAB:
@@ -1801,6 +1883,12 @@ class GraphicalRenderer:
         self.flash_alpha = 255
         self.flash_duration = duration
 
+    def is_animating(self) -> bool:
+        """Whether anything on screen moves on its own and needs the full frame rate."""
+        return bool(self.has_active_animations() or self.screen_shake_intensity > 0 or self.flash_alpha > 0
+                    or self.particle_emitter.particles or self.floating_texts or self.debris_particles
+                    or self.imbued_sparkles or self.ai_turn_active)
+
     def has_active_animations(self) -> bool:
         """Check if any animations are currently active."""
         # Check for animation objects
@@ -2247,11 +2335,7 @@ class GraphicalRenderer:
             unit.update(delta_time)
 
         # Update particles
-        updated_particles = []
-        for particle in self.particle_emitter.particles:
-            if particle.update(delta_time):
-                updated_particles.append(particle)
-        self.particle_emitter.particles = updated_particles
+        self.particle_emitter.update(delta_time)
 
         # Update debris particles
         updated_debris = []
@@ -2261,12 +2345,7 @@ class GraphicalRenderer:
         self.debris_particles = updated_debris
 
         # Update active animations
-        updated_animations = []
-        for anim in self.active_animations:
-            still_active = anim.update(delta_time)
-            if still_active:
-                updated_animations.append(anim)
-        self.active_animations = updated_animations
+        self.timeline.update(delta_time, "active")
 
         # Collect hidden tiles from animations (for progressive terrain reveal)
         prev_hidden = self.hidden_tiles.copy()
@@ -2282,12 +2361,7 @@ class GraphicalRenderer:
             self._dirty_tiles.add((x, y))
 
         # Update background animations (non-blocking persistent effects like zones)
-        updated_background = []
-        for anim in self.background_animations:
-            still_active = anim.update(delta_time)
-            if still_active:
-                updated_background.append(anim)
-        self.background_animations = updated_background
+        self.timeline.update(delta_time, "background")
 
         # Update motor animation
         self.motor_animation.update(delta_time)
@@ -2326,11 +2400,7 @@ class GraphicalRenderer:
             self.particle_emitter.update(delta_time)
             self.floating_texts = [t for t in self.floating_texts if t.update(delta_time)]
 
-            updated_animations = []
-            for anim in self.active_animations:
-                if anim.update(delta_time):
-                    updated_animations.append(anim)
-            self.active_animations = updated_animations
+            self.timeline.update(delta_time, "active")
 
             return
 
@@ -2459,114 +2529,10 @@ class GraphicalRenderer:
         self.debris_particles = remaining_debris
 
         # Update active animations and check for impact effects
-        updated_animations = []
-        for anim in self.active_animations:
-            still_active = anim.update(delta_time)
-
-            # Check if animation triggered an impact effect
-            if hasattr(anim, 'trigger_impact') and anim.trigger_impact:
-                # Create impact effects at animation's target position
-                self.particle_emitter.emit_burst(anim.target_x, anim.target_y, (255, 215, 0), count=40)
-
-                # Additional sparkle particles
-                for _ in range(20):
-                    angle = random.uniform(0, 2 * math.pi)
-                    speed = random.uniform(100, 250)
-                    vx = math.cos(angle) * speed
-                    vy = math.sin(angle) * speed
-                    particle = Particle(anim.target_x, anim.target_y, vx, vy,
-                                      (255, 255, 200), random.uniform(3, 6), 0.5)
-                    self.particle_emitter.particles.append(particle)
-
-                # Check if this is a critical hit (Judgement)
-                is_critical = hasattr(anim, 'is_crit') and anim.is_crit
-
-                if is_critical:
-                    # DIVINE LIGHTNING STRIKE!
-                    lightning = LightningBolt(anim.target_x, anim.target_y)
-                    self.active_animations.append(lightning)
-
-                    # Golden/white screen flash
-                    self.flash_color = (255, 255, 255)
-                    self.flash_alpha = 255
-                    self.flash_duration = 0.2
-
-                    # "DIVINE JUDGMENT!" floating text
-                    judgment_text = FloatingText(anim.target_x, anim.target_y - 40,
-                                                "DIVINE JUDGMENT!", (255, 215, 0))
-                    self.floating_texts.append(judgment_text)
-
-                    # Extra screen shake for critical
-                    self.screen_shake_intensity = 15
-                    self.screen_shake_duration = 0.5
-
-                    # Extra electric particles
-                    for _ in range(30):
-                        angle = random.uniform(0, 2 * math.pi)
-                        speed = random.uniform(150, 300)
-                        vx = math.cos(angle) * speed
-                        vy = math.sin(angle) * speed
-                        particle = Particle(anim.target_x, anim.target_y, vx, vy,
-                                          (200, 220, 255), random.uniform(2, 5), 0.4)
-                        self.particle_emitter.particles.append(particle)
-                else:
-                    # Normal hit - regular debris and shake
-                    for _ in range(10):
-                        vx = random.uniform(-150, 150)
-                        vy = random.uniform(-200, -50)
-                        size = random.randint(3, 8)
-                        debris = DebrisParticle(anim.target_x, anim.target_y, vx, vy, size, color=(200, 200, 200))
-                        self.debris_particles.append(debris)
-
-                    self.screen_shake_intensity = 8
-                    self.screen_shake_duration = 0.3
-
-                anim.trigger_impact = False  # Reset flag
-
-            # Check if ExpediteRush animation just completed - trigger JawClamp on enemy
-            if hasattr(anim, 'foreman') and anim.foreman and not still_active:
-                # Animation completed, check if foreman hit an enemy during Expedite
-                # Find the game unit at the foreman's position using game.get_unit_at
-                foreman_grid_x = anim.foreman.grid_x
-                foreman_grid_y = anim.foreman.grid_y
-
-                # Look up the game unit at this position
-                game_unit = None
-                if self.game_adapter.game:
-                    game_unit = self.game_adapter.game.get_unit_at(foreman_grid_y, foreman_grid_x)
-
-                if game_unit and hasattr(game_unit, 'expedite_enemy_hit') and game_unit.expedite_enemy_hit:
-                    from boneglaive.graphical.animations.mandible_foreman import JawClamp
-
-                    enemy = game_unit.expedite_enemy_hit
-                    enemy_pos = game_unit.expedite_enemy_pos  # (y, x) format
-
-                    # Convert enemy position to screen coordinates
-                    jaw_x, jaw_y = self.camera.grid_to_screen(enemy_pos[1], enemy_pos[0])  # (x, y) = (col, row)
-
-
-                    jaw_animation = JawClamp(jaw_x, jaw_y)
-                    if jaw_animation:
-                        self.active_animations.append(jaw_animation)
-                    else:
-                        pass
-
-                    # Clear the expedite enemy hit flag
-                    game_unit.expedite_enemy_hit = None
-                    game_unit.expedite_enemy_pos = None
-
-            if still_active:
-                updated_animations.append(anim)
-
-        self.active_animations = updated_animations
+        self.timeline.update(delta_time, "active", after=self._on_animation_updated)
 
         # Update background animations (non-blocking persistent effects like zones)
-        updated_background = []
-        for anim in self.background_animations:
-            still_active = anim.update(delta_time)
-            if still_active:
-                updated_background.append(anim)
-        self.background_animations = updated_background
+        self.timeline.update(delta_time, "background")
 
         # Update motor animation
         self.motor_animation.update(delta_time)
@@ -2595,6 +2561,100 @@ class GraphicalRenderer:
                 if getattr(unit, 'teleport_hidden', False):
                     unit.teleport_hidden = False
 
+    def _on_animation_updated(self, anim, still_active: bool):
+        """Impact effects and follow-up animations an active animation triggers."""
+        # Check if animation triggered an impact effect
+        if hasattr(anim, 'trigger_impact') and anim.trigger_impact:
+            # Create impact effects at animation's target position
+            self.particle_emitter.emit_burst(anim.target_x, anim.target_y, (255, 215, 0), count=40)
+
+            # Additional sparkle particles
+            for _ in range(20):
+                angle = random.uniform(0, 2 * math.pi)
+                speed = random.uniform(100, 250)
+                vx = math.cos(angle) * speed
+                vy = math.sin(angle) * speed
+                particle = Particle(anim.target_x, anim.target_y, vx, vy,
+                                  (255, 255, 200), random.uniform(3, 6), 0.5)
+                self.particle_emitter.particles.append(particle)
+
+            # Check if this is a critical hit (Judgement)
+            is_critical = hasattr(anim, 'is_crit') and anim.is_crit
+
+            if is_critical:
+                # DIVINE LIGHTNING STRIKE!
+                lightning = LightningBolt(anim.target_x, anim.target_y)
+                self.active_animations.append(lightning)
+
+                # Golden/white screen flash
+                self.flash_color = (255, 255, 255)
+                self.flash_alpha = 255
+                self.flash_duration = 0.2
+
+                # "DIVINE JUDGMENT!" floating text
+                judgment_text = FloatingText(anim.target_x, anim.target_y - 40,
+                                            "DIVINE JUDGMENT!", (255, 215, 0))
+                self.floating_texts.append(judgment_text)
+
+                # Extra screen shake for critical
+                self.screen_shake_intensity = 15
+                self.screen_shake_duration = 0.5
+
+                # Extra electric particles
+                for _ in range(30):
+                    angle = random.uniform(0, 2 * math.pi)
+                    speed = random.uniform(150, 300)
+                    vx = math.cos(angle) * speed
+                    vy = math.sin(angle) * speed
+                    particle = Particle(anim.target_x, anim.target_y, vx, vy,
+                                      (200, 220, 255), random.uniform(2, 5), 0.4)
+                    self.particle_emitter.particles.append(particle)
+            else:
+                # Normal hit - regular debris and shake
+                for _ in range(10):
+                    vx = random.uniform(-150, 150)
+                    vy = random.uniform(-200, -50)
+                    size = random.randint(3, 8)
+                    debris = DebrisParticle(anim.target_x, anim.target_y, vx, vy, size, color=(200, 200, 200))
+                    self.debris_particles.append(debris)
+
+                self.screen_shake_intensity = 8
+                self.screen_shake_duration = 0.3
+
+            anim.trigger_impact = False  # Reset flag
+
+        # Check if ExpediteRush animation just completed - trigger JawClamp on enemy
+        if hasattr(anim, 'foreman') and anim.foreman and not still_active:
+            # Animation completed, check if foreman hit an enemy during Expedite
+            # Find the game unit at the foreman's position using game.get_unit_at
+            foreman_grid_x = anim.foreman.grid_x
+            foreman_grid_y = anim.foreman.grid_y
+
+            # Look up the game unit at this position
+            game_unit = None
+            if self.game_adapter.game:
+                game_unit = self.game_adapter.game.get_unit_at(foreman_grid_y, foreman_grid_x)
+
+            if game_unit and hasattr(game_unit, 'expedite_enemy_hit') and game_unit.expedite_enemy_hit:
+                from boneglaive.graphical.animations.mandible_foreman import JawClamp
+
+                enemy = game_unit.expedite_enemy_hit
+                enemy_pos = game_unit.expedite_enemy_pos  # (y, x) format
+
+                # Convert enemy position to screen coordinates
+                jaw_x, jaw_y = self.camera.grid_to_screen(enemy_pos[1], enemy_pos[0])  # (x, y) = (col, row)
+
+
+                jaw_animation = JawClamp(jaw_x, jaw_y)
+                if jaw_animation:
+                    self.active_animations.append(jaw_animation)
+                else:
+                    pass
+
+                # Clear the expedite enemy hit flag
+                game_unit.expedite_enemy_hit = None
+                game_unit.expedite_enemy_pos = None
+
     def handle_animation_event(self, event: AnimationEvent):
         """
         Create and queue visual animations based on game events.
@@ -3490,202 +3550,175 @@ class GraphicalRenderer:
         # Update camera shake offset (for animations that use camera)
         self.camera.set_shake(shake_offset_x, shake_offset_y)
 
-        # Reuse main surface (performance: avoid allocation)
+        # Reuse main surface (performance: avoid allocation). It keeps the last
+        # frame, so whatever is not repainted below stays as it was
         main_surface = self._main_surface
-        main_surface.blit(self._bg_surface, (0, 0))
-
-        # Draw grid
-        self.draw_grid(main_surface)
 
-        # Draw revealed scalar node traps (after grid, before range indicators)
-        self.draw_revealed_traps(main_surface)
-
-        # Draw Rail Genesis junction indicators (after grid, before range indicators)
-        self.draw_rail_junctions(main_surface)
+        # Static layer: background and terrain grid, cached until terrain changes
+        grid_changed = self._update_grid_cache()
+        static_layer = self.compositor.static_layer(
+            self._bg_surface, self._static_grid_surface, (GRID_OFFSET_X, GRID_OFFSET_Y), grid_changed)
+
+        # Draw the whole frame while things move or state changes; otherwise repaint
+        # only what the draw sites reported (units that changed, pulsing overlays)
+        full = self._needs_full_frame()
+        self._report_unit_changes()
+        rects = self.compositor.begin_frame(self.screen.get_rect(), full)
+
+        if rects is None:
+            self._draw_layers(main_surface, static_layer, None)
+
+            # Apply shake offset and blit to screen (the background fills the edges a shake exposes)
+            shake_offset = (int(shake_offset_x), int(shake_offset_y))
+            if shake_offset != (0, 0):
+                self.screen.blit(self._bg_surface, (0, 0))
+            self.screen.blit(main_surface, shake_offset)
+
+            # Draw flash overlay (performance: reuse surface)
+            if self.flash_alpha > 0:
+                self._flash_surface.set_alpha(int(self.flash_alpha))
+                self._flash_surface.fill(self.flash_color)
+                self.screen.blit(self._flash_surface, (0, 0))
+
+            self._draw_windows()
+        else:
+            for rect in rects:
+                self._draw_layers(main_surface, static_layer, rect)
+            for rect in rects:
+                self.screen.blit(main_surface, rect, rect)
+        self._draw_hud()
 
-        # Draw movement/target range indicators
-        self.draw_range_indicators(main_surface)
+        if rects and self.compositor.verify and self._verify_partial_frame(static_layer, rects):
+            rects = None  # Send the corrected frame whole
 
-        # Draw selection highlight (before units so it's behind them)
-        # Skip when in self-target skill mode so the purple pulse is visible
-        _self_target_active = (
-            self.show_skill_range and self.skill_positions
-            and len(self.skill_positions) == 1 and self.selected_unit
-            and self.skill_positions[0][0] == self.selected_unit.grid_x
-            and self.skill_positions[0][1] == self.selected_unit.grid_y
-        )
-        if self.selected_unit and not _self_target_active:
-            self.draw_selection_highlight(main_surface, self.selected_unit)
+        presented = self.compositor.present(self.screen, rects)
+        self._frame_changed = bool(presented)
+        self.profiler.lap("flip")
 
-        # Draw imbued furniture effects (Market Futures)
-        self.draw_imbued_furniture(main_surface)
+    def _draw_layers(self, main_surface: pygame.Surface, static_layer: pygame.Surface,
+                     clip: Optional[pygame.Rect]):
+        """
+        Draw the board, units, animations and panels onto the frame surface.
 
-        # Draw skill target indicator shadows (semi-transparent unit previews)
-        self.draw_skill_shadows(main_surface)
+        Args:
+            main_surface: Frame surface (keeps its pixels between frames)
+            static_layer: Cached background and terrain grid
+            clip: Screen rect to repaint, or None for the whole frame
+        """
+        profiler = self.profiler
+        main_surface.set_clip(clip)
+        if clip is None:
+            main_surface.blit(static_layer, (0, 0))
+        else:
+            main_surface.blit(static_layer, clip, clip)
+        profiler.lap("grid")
+
+        board_rect = pygame.Rect(GRID_OFFSET_X, GRID_OFFSET_Y, GRID_WIDTH * TILE_SIZE, GRID_HEIGHT * TILE_SIZE)
+        if clip is None or clip.colliderect(board_rect):
+            # Draw revealed scalar node traps (after grid, before range indicators)
+            self.draw_revealed_traps(main_surface)
+            profiler.lap("traps")
+
+            # Draw Rail Genesis junction indicators (after grid, before range indicators)
+            self.draw_rail_junctions(main_surface)
+            profiler.lap("rail_junctions")
+
+            # Draw movement/target range indicators
+            self.draw_range_indicators(main_surface)
+            profiler.lap("range_indicators")
+
+            # Draw selection highlight (before units so it's behind them)
+            # Skip when in self-target skill mode so the purple pulse is visible
+            _self_target_active = (
+                self.show_skill_range and self.skill_positions
+                and len(self.skill_positions) == 1 and self.selected_unit
+                and self.skill_positions[0][0] == self.selected_unit.grid_x
+                and self.skill_positions[0][1] == self.selected_unit.grid_y
+            )
+            if self.selected_unit and not _self_target_active:
+                self.draw_selection_highlight(main_surface, self.selected_unit)
 
-        # Draw units
-        for unit in self.units:
-            # Skip units that are hidden during teleport animation
-            if hasattr(unit, 'teleport_hidden') and unit.teleport_hidden:
-                continue
+            # Draw imbued furniture effects (Market Futures)
+            self.draw_imbued_furniture(main_surface)
+            profiler.lap("highlights")
 
-            # Skip units at off-map positions (e.g., GAS_MACHINIST during Diverge)
-            if unit.grid_x < 0 or unit.grid_y < 0 or unit.grid_x >= GRID_WIDTH or unit.grid_y >= GRID_HEIGHT:
-                continue
+            # Draw skill target indicator shadows (semi-transparent unit previews)
+            self.draw_skill_shadows(main_surface)
+            profiler.lap("shadows")
 
-            # During setup phase, hide opponent's units
-            if self.setup_mode and self.game_adapter.game and self.game_adapter.game.setup_phase:
-                setup_player = self.game_adapter.game.setup_player
-                # Get the game unit to check player
-                game_unit = self._get_game_unit(unit)
-                if game_unit and game_unit.player != setup_player:
-                    # Hide units from the other player during their setup
+            # Draw units (only those reaching into the repainted rect)
+            for unit in self.units:
+                drawn = self._unit_draw_states.get(unit)
+                if drawn is None or (clip is not None and not clip.colliderect(drawn[1])):
                     continue
 
-            # Topiary units: draw topiary terrain tile instead of unit sprite
-            game_unit = self._get_game_unit(unit)
-            if game_unit and getattr(game_unit, 'is_topiary', False):
-                tile_x = GRID_OFFSET_X + unit.grid_x * TILE_SIZE
-                tile_y = GRID_OFFSET_Y + unit.grid_y * TILE_SIZE
-                tile_rect = pygame.Rect(tile_x, tile_y, TILE_SIZE, TILE_SIZE)
-                topiary_surface = self._load_terrain_tile(TerrainType.TOPIARY)
-                if topiary_surface:
-                    main_surface.blit(topiary_surface, (tile_x, tile_y))
-                # Player-colored border
-                border_color = (0, 255, 100) if game_unit.player == 1 else (100, 150, 255)
-                pygame.draw.rect(main_surface, border_color, tile_rect, 2)
-                continue
+                # Topiary units: draw topiary terrain tile instead of unit sprite
+                if drawn[0] and drawn[0][0] == "topiary":
+                    game_unit = self._get_game_unit(unit)
+                    tile_x = GRID_OFFSET_X + unit.grid_x * TILE_SIZE
+                    tile_y = GRID_OFFSET_Y + unit.grid_y * TILE_SIZE
+                    tile_rect = pygame.Rect(tile_x, tile_y, TILE_SIZE, TILE_SIZE)
+                    topiary_surface = self._load_terrain_tile(TerrainType.TOPIARY)
+                    if topiary_surface:
+                        main_surface.blit(topiary_surface, (tile_x, tile_y))
+                    # Player-colored border
+                    border_color = (0, 255, 100) if game_unit.player == 1 else (100, 150, 255)
+                    pygame.draw.rect(main_surface, border_color, tile_rect, 2)
+                    continue
 
-            unit.draw(main_surface, self.small_font)
+                unit.draw(main_surface, self.small_font)
 
-        # Draw target indicator pips on all tiles
-        self.draw_target_pips(main_surface)
+            # Draw target indicator pips on all tiles
+            self.draw_target_pips(main_surface)
 
-        # Draw astral values if DELPHIC APPRAISER is selected (after units so they appear on top)
-        if self.show_astral_values:
-            self.draw_astral_values(main_surface)
+            # Draw astral values if DELPHIC APPRAISER is selected (after units so they appear on top)
+            if self.show_astral_values:
+                self.draw_astral_values(main_surface)
 
-        # Draw currency symbols on imbued enemies (after units so they appear on top)
-        if self.game_adapter.game:
-            # Calculate wave effect for currency symbol (same as furniture)
-            alpha = int(140 + math.sin(self.astral_value_pulse_time * 2.5) * 60)  # 80 to 200
-            wave_offset = math.sin(self.astral_value_pulse_time * 3) * 8  # Vertical wave amplitude
+            # Draw currency symbols on imbued enemies (after units so they appear on top)
+            self.draw_imbued_currency(main_surface)
+            profiler.lap("units")
 
-            for unit in self.units:
-                game_unit = self._get_game_unit(unit)
-                if game_unit and game_unit.is_alive():
-                    # Check if unit has imbued status (from Market Futures on enemies)
-                    if hasattr(game_unit, 'status_imbued') and game_unit.status_imbued:
-                        # Determine color based on which player imbued the unit
-                        imbued_player = getattr(game_unit, 'status_imbued_player', 1)
-                        if imbued_player == 1:
-                            symbol_color = (100, 255, 100)  # Green for Player 1
-                            sparkle_colors = [(100, 255, 150), (150, 255, 100)]
-                        else:
-                            symbol_color = (100, 150, 255)  # Blue for Player 2
-                            sparkle_colors = [(100, 150, 255), (150, 200, 255)]
-
-                        # Calculate screen position (center of unit's tile)
-                        tile_x = GRID_OFFSET_X + unit.grid_x * TILE_SIZE + TILE_SIZE // 2
-                        tile_y = GRID_OFFSET_Y + unit.grid_y * TILE_SIZE + TILE_SIZE // 2
-
-                        # Draw waving currency symbol (¤) - same as furniture
-                        font_size = 120
-                        currency_font = pygame.font.Font(None, font_size)
-                        currency_text = currency_font.render("¤", True, symbol_color)
-                        currency_text.set_alpha(alpha)
-
-                        # Apply wave offset to y position for undulating effect
-                        wave_y = tile_y + wave_offset
-
-                        # Center the symbol with wave offset
-                        text_rect = currency_text.get_rect(center=(tile_x, int(wave_y)))
-
-                        # Draw dark outline for visibility
-                        outline_font = pygame.font.Font(None, font_size + 2)
-                        outline_text = outline_font.render("¤", True, (0, 0, 0))
-                        outline_text.set_alpha(alpha // 2)
-                        outline_rect = outline_text.get_rect(center=(tile_x, int(wave_y)))
-                        main_surface.blit(outline_text, outline_rect)
-
-                        # Draw main currency symbol
-                        main_surface.blit(currency_text, text_rect)
-
-                        # Spawn sparkles around imbued enemies (same as furniture)
-                        if random.random() < 0.3:  # 30% chance per frame
-                            # Random position within tile bounds
-                            spawn_x = tile_x + random.uniform(-TILE_SIZE // 3, TILE_SIZE // 3)
-                            spawn_y = tile_y + random.uniform(-TILE_SIZE // 3, TILE_SIZE // 3)
-
-                            # Random velocity (upward with slight horizontal drift)
-                            vx = random.uniform(-10, 10)
-                            vy = random.uniform(-40, -60)
-
-                            # Random properties
-                            max_life = random.uniform(1.0, 1.5)
-                            sparkle_size = random.randint(2, 4)
-                            color = random.choice(sparkle_colors)  # Use player-specific colors
-
-                            self.imbued_sparkles.append({
-                                'x': spawn_x,
-                                'y': spawn_y,
-                                'vx': vx,
-                                'vy': vy,
-                                'life': 0,
-                                'max_life': max_life,
-                                'size': sparkle_size,
-                                'color': color
-                            })
-
-        # Draw background animations FIRST (zones, environmental effects - render below other animations)
+        # Draw background animations FIRST (zones, environmental effects), then active ones
+        self.timeline.draw(main_surface)
         for animation in self.background_animations:
-            animation.draw(main_surface)
-
-        # Draw active animations
-        for animation in self.active_animations:
-            animation.draw(main_surface)
+            # Persistent zones keep moving without holding up the frame rate
+            self.compositor.animate(self._background_animation_bounds(animation, board_rect))
+        profiler.lap("animations")
 
         # Draw particles
         self.particle_emitter.draw(main_surface)
         for text in self.floating_texts:
             text.draw(main_surface, self.font)
-        if len(self.debris_particles) > 0 and not hasattr(self, '_debris_draw_logged'):
-            pass
-            self._debris_draw_logged = True
         for debris in self.debris_particles:
             debris.draw(main_surface)
+        profiler.lap("particles")
 
-        # Draw skill bar (above map, below top bar) - only if show_skills is True
-        if self.show_skills:
-            self.skill_bar.draw(main_surface, SCREEN_WIDTH, SCREEN_HEIGHT, TOP_BAR_HEIGHT)
-
-        # Draw combat log (below map, matches game field width)
-        from boneglaive.graphical.ui.scale_utils import scale_manager
-        log_spacing = scale_manager.scale(10)
-
-        combat_log_x = GRID_OFFSET_X
-        combat_log_y = GRID_OFFSET_Y + GAME_BOARD_HEIGHT + log_spacing
-        combat_log_width = GRID_WIDTH * TILE_SIZE
+        if clip is None or not board_rect.contains(clip):
+            # Draw skill bar (above map, below top bar) - only if show_skills is True
+            if self.show_skills:
+                self.skill_bar.draw(main_surface, SCREEN_WIDTH, SCREEN_HEIGHT, TOP_BAR_HEIGHT)
 
-        # Height extends to match action menu panel bottom
-        action_bottom = getattr(self, '_action_menu_bottom_y', combat_log_y + scale_manager.scale(90, 'y'))
-        log_height = max(scale_manager.scale(90, 'y'), action_bottom - combat_log_y)
+            # Draw combat log (below map, matches game field width)
+            from boneglaive.graphical.ui.scale_utils import scale_manager
+            log_spacing = scale_manager.scale(10)
 
-        self.combat_log.draw(main_surface, combat_log_x, combat_log_y, height=log_height, width=combat_log_width)
+            combat_log_x = GRID_OFFSET_X
+            combat_log_y = GRID_OFFSET_Y + GAME_BOARD_HEIGHT + log_spacing
+            combat_log_width = GRID_WIDTH * TILE_SIZE
 
-        # Draw UI (includes all panels and components)
-        self.draw_ui(main_surface)
+            # Height extends to match action menu panel bottom
+            action_bottom = getattr(self, '_action_menu_bottom_y', combat_log_y + scale_manager.scale(90, 'y'))
+            log_height = max(scale_manager.scale(90, 'y'), action_bottom - combat_log_y)
 
-        # Apply shake offset and blit to screen
-        self.screen.blit(self._bg_surface, (0, 0))
-        self.screen.blit(main_surface, (int(shake_offset_x), int(shake_offset_y)))
+            self.combat_log.draw(main_surface, combat_log_x, combat_log_y, height=log_height, width=combat_log_width)
 
-        # Draw flash overlay (performance: reuse surface)
-        if self.flash_alpha > 0:
-            self._flash_surface.set_alpha(int(self.flash_alpha))
-            self._flash_surface.fill(self.flash_color)
-            self.screen.blit(self._flash_surface, (0, 0))
+            # Draw UI (includes all panels and components)
+            self.draw_ui(main_surface)
+        main_surface.set_clip(None)
 
+    def _draw_windows(self):
+        """Draw the windows and dialogs that go over the frame (whole frames only)."""
         # Draw help page overlay (must be drawn last, on top of everything)
         self.help_page.draw(self.screen, SCREEN_WIDTH, SCREEN_HEIGHT)
 
@@ -3744,10 +3777,21 @@ class GraphicalRenderer:
         if self.concede_dialog.visible:
             self.concede_dialog.draw(self.screen, SCREEN_WIDTH, SCREEN_HEIGHT)
 
+    def _windows_open(self) -> bool:
+        """Whether a window or dialog drawn by _draw_windows() is on screen."""
+        return bool(self.help_page.visible or self.game_over_window.visible
+                    or (self.setup_placing_unit and self.selected_unit_type)
+                    or self.message_log_window.visible or self.upgrade_window.visible
+                    or (self.respawn_mode and self.respawn_selecting_unit)
+                    or (self.setup_mode and self.setup_selecting_unit)
+                    or self.setup_exit_dialog.visible or self.concede_dialog.visible)
+
+    def _draw_hud(self):
+        """Draw the FPS counter and profiler overlay; both change every frame they are shown."""
         # Draw FPS counter (for troubleshooting)
         if self.show_fps:
-            fps_text = f"FPS: {self.fps_display:.1f}"
-            fps_surface = self.small_font.render(fps_text, True, (100, 255, 100))
+            fps_text = f"FPS: {self.fps_display:.1f}  CPU: {self.frame_scheduler.cpu_ms:.1f} ms"
+            fps_surface = render_text(self.small_font, fps_text, True, (100, 255, 100))
             # Position in top-right corner with small padding
             fps_x = SCREEN_WIDTH - fps_surface.get_width() - 10
             fps_y = 5
@@ -3759,8 +3803,141 @@ class GraphicalRenderer:
             self.screen.blit(bg_surface, (bg_rect.x, bg_rect.y))
             # Draw FPS text
             self.screen.blit(fps_surface, (fps_x, fps_y))
+            # The text width changes with the numbers: cover the widest reading too
+            self.compositor.animate(bg_rect.inflate(80, 0).move(-40, 0).clip(self.screen.get_rect()))
+        self.profiler.lap("ui")
+
+        # Draw per-stage frame timings (below the FPS counter)
+        if self.profiler.enabled:
+            panel = self.profiler.overlay(self.small_font)
+            if panel:
+                panel_pos = (SCREEN_WIDTH - panel.get_width() - 5, 30)
+                self.screen.blit(panel, panel_pos)
+                self.compositor.animate(pygame.Rect(panel_pos, panel.get_size()))
+            self.profiler.lap("overlay")
+
+    def _needs_full_frame(self) -> bool:
+        """
+        Whether this frame is drawn whole instead of repainted in dirty rects.
 
-        pygame.display.flip()
+        Whole frames are drawn while anything moves (animations, particles,
+        shake, the AI's turn), after input, while a window is open, and when
+        the state the panels and overlays are drawn from has changed, plus one
+        more frame after any of these so what they left behind is cleared.
+        """
+        state = self._frame_state()
+        changed = state != self._last_frame_state
+        self._last_frame_state = state
+        busy = bool(self.is_animating() or self._input_seen or self._windows_open()
+                    or self._imbued_effects_shown())
+        self._input_seen = False
+        full = busy or changed or self._was_busy
+        self._was_busy = busy or changed
+        return full
+
+    def _frame_state(self) -> tuple:
+        """What the panels and board overlays are drawn from (cheap to compare each frame)."""
+        game = self.game_adapter.game
+        game_state = None
+        if game:
+            game_state = (
+                game.turn, game.current_player, game.player1_gp, game.player2_gp, game.winner,
+                game.setup_phase, len(game.dead_units),
+                tuple((u.hp, u.y, u.x, u.move_target, u.attack_target, u.skill_target) for u in game.units),
+            )
+        messages = self.combat_log.messages
+        return (
+            game_state, id(self.selected_unit), self.selected_skill, self.current_action_mode,
+            self.show_movement_range, self.show_target_range, self.show_skill_range, self.show_skills,
+            self.show_astral_values, self.hovered_grid_pos, self.game_adapter.executing_turn,
+            len(messages), id(messages[-1]) if messages else None, self.combat_log.scroll_offset,
+        )
+
+    def _imbued_effects_shown(self) -> bool:
+        """Whether Market Futures symbols are on the board (they spawn sparkles as they draw)."""
+        game = self.game_adapter.game
+        if not game:
+            return False
+        if any(anchor.get('imbued', False) for anchor in getattr(game, 'teleport_anchors', {}).values()):
+            return True
+        return any(getattr(unit, 'status_imbued', False) and unit.is_alive() for unit in game.units)
+
+    def _unit_draw_mode(self, unit: AnimatedUnit) -> Optional[str]:
+        """How the units pass draws a unit: "sprite", "topiary", or None when hidden."""
+        # Skip units that are hidden during teleport animation
+        if hasattr(unit, 'teleport_hidden') and unit.teleport_hidden:
+            return None
+
+        # Skip units at off-map positions (e.g., GAS_MACHINIST during Diverge)
+        if unit.grid_x < 0 or unit.grid_y < 0 or unit.grid_x >= GRID_WIDTH or unit.grid_y >= GRID_HEIGHT:
+            return None
+
+        game_unit = self._get_game_unit(unit)
+
+        # During setup phase, hide opponent's units
+        if self.setup_mode and self.game_adapter.game and self.game_adapter.game.setup_phase:
+            if game_unit and game_unit.player != self.game_adapter.game.setup_player:
+                return None
+
+        if game_unit and getattr(game_unit, 'is_topiary', False):
+            return "topiary"
+        return "sprite"
+
+    def _report_unit_changes(self):
+        """Mark the old and new bounds of every unit that looks different from last frame."""
+        previous = self._unit_draw_states
+        current = {}
+        for unit in self.units:
+            mode = self._unit_draw_mode(unit)
+            if mode is None:
+                continue
+            if mode == "topiary":
+                state = (mode, unit.grid_x, unit.grid_y)
+                bounds = pygame.Rect(GRID_OFFSET_X + unit.grid_x * TILE_SIZE,
+                                     GRID_OFFSET_Y + unit.grid_y * TILE_SIZE, TILE_SIZE, TILE_SIZE)
+            else:
+                look = unit.draw_state()
+                state = None if look is None else (mode, look)
+                bounds = unit.draw_bounds()
+            current[unit] = (state, bounds)
+
+            old = previous.pop(unit, None)
+            if old is None or state is None or old[0] != state:
+                self.compositor.mark_dirty(bounds)
+                if old is not None:
+                    self.compositor.mark_dirty(old[1])
+        # Units that died, left the map or were hidden
+        for _, bounds in previous.values():
+            self.compositor.mark_dirty(bounds)
+        self._unit_draw_states = current
+
+    def _background_animation_bounds(self, animation, board_rect: pygame.Rect) -> pygame.Rect:
+        """Screen area a persistent zone draws in (its tiles when it says, else the board)."""
+        tiles = getattr(animation, 'building_tiles', None)
+        if not tiles:
+            return board_rect
+        bounds = [pygame.Rect(GRID_OFFSET_X + x * TILE_SIZE, GRID_OFFSET_Y + y * TILE_SIZE, TILE_SIZE, TILE_SIZE)
+                  for y, x in tiles]
+        return bounds[0].unionall(bounds[1:]).inflate(TILE_SIZE, TILE_SIZE)
+
+    def _verify_partial_frame(self, static_layer: pygame.Surface, rects: List[pygame.Rect]) -> bool:
+        """
+        Debug check: draw the frame whole and log where the partial repaint left stale pixels.
+
+        Returns:
+            Whether anything outside the repainted rects differed
+        """
+        partial = self.screen.copy()
+        self._draw_layers(self._main_surface, static_layer, None)
+        self.screen.blit(self._main_surface, (0, 0))
+        self._draw_hud()
+        # Inside the rects both frames were drawn; time-based pulses may differ by a step
+        for rect in rects:
+            partial.blit(self.screen, rect, rect)
+        stale = self.compositor.stale_rects(partial, self.screen)
+        if stale:
+            logger.warning(f"Dirty rects missed {len(stale)} area(s): {[tuple(rect) for rect in stale]}")
+        return bool(stale)
 
     def mark_tile_dirty(self, x: int, y: int):
         """Mark a tile as needing redraw. Call this when terrain/furniture changes."""
@@ -3820,13 +3997,16 @@ class GraphicalRenderer:
             # Default to empty for unknown maps
             return TerrainType.EMPTY
 
-    def _render_single_tile(self, surface: pygame.Surface, x: int, y: int, game_map):
-        """Render a single tile (used for dirty rectangle updates)."""
-        # Calculate tile position (relative to grid surface, not screen)
-        tile_x = x * TILE_SIZE
-        tile_y = y * TILE_SIZE
-        rect = pygame.Rect(tile_x, tile_y, TILE_SIZE, TILE_SIZE)
+    def _tile_layers(self, x: int, y: int, game_map):
+        """
+        What one grid tile is drawn from, bottom to top.
 
+        Returns:
+            (base color, textures, fallback color, outline color, rail overlay):
+            textures are the TerrainTypes blitted over the base color (base floor,
+            then terrain/furniture); fallback color fills the tile when the
+            terrain has no texture; outline color marks owned walls.
+        """
         # Get terrain type at this position
         terrain_type = TerrainType.EMPTY
         if game_map:
@@ -3852,73 +4032,119 @@ class GraphicalRenderer:
         if self.hovered_grid_pos == (x, y):
             base_color = tuple(min(255, c + 30) for c in base_color)
 
-        # Draw base tile
-        pygame.draw.rect(surface, base_color, rect)
+        textures = []
+        fallback_color = None
+        outline_color = None
 
         # Check if this is furniture, empty, or non-unit topiary - render base terrain first
         is_furniture = self._is_furniture(terrain_type)
         if (is_furniture or terrain_type == TerrainType.EMPTY or terrain_type == TerrainType.TOPIARY or terrain_type == TerrainType.PYLON) and game_map:
             # Get the base terrain for this map (position-aware for mixed-floor maps)
             base_terrain = self._get_base_terrain_for_map(game_map, x, y)
-            if base_terrain != TerrainType.EMPTY:
-                # Render base terrain texture underneath furniture/empty tiles
-                base_surface = self._load_terrain_tile(base_terrain)
-                if base_surface:
-                    surface.blit(base_surface, (tile_x, tile_y))
+            if base_terrain != TerrainType.EMPTY and self._load_terrain_tile(base_terrain):
+                # Base terrain texture underneath furniture/empty tiles
+                textures.append(base_terrain)
 
-        # Try to load and draw terrain/furniture SVG
+        # Terrain/furniture SVG
         if terrain_type != TerrainType.EMPTY:
-            terrain_surface = self._load_terrain_tile(terrain_type)
-            if terrain_surface:
-                surface.blit(terrain_surface, (tile_x, tile_y))
+            if self._load_terrain_tile(terrain_type):
+                textures.append(terrain_type)
 
-                # Add player-colored outline for MARROW_WALL
+                # Player-colored outline for MARROW_WALL and SLAG_WALL
+                wall_tiles = None
                 if terrain_type == TerrainType.MARROW_WALL:
-                    if hasattr(self.game_adapter.game, 'marrow_dike_tiles'):
-                        pos_tuple = (y, x)
-                        if pos_tuple in self.game_adapter.game.marrow_dike_tiles:
-                            wall_info = self.game_adapter.game.marrow_dike_tiles[pos_tuple]
-                            if 'owner' in wall_info and wall_info['owner']:
-                                if wall_info['owner'].player == 1:
-                                    outline_color = (0, 255, 100)
-                                else:
-                                    outline_color = (100, 150, 255)
-                                pygame.draw.rect(surface, outline_color, rect, 2)
-
-                # Add player-colored outline for SLAG_WALL
-                if terrain_type == TerrainType.SLAG_WALL:
-                    if hasattr(self.game_adapter.game, 'slag_wall_tiles'):
-                        pos_tuple = (y, x)
-                        if pos_tuple in self.game_adapter.game.slag_wall_tiles:
-                            wall_info = self.game_adapter.game.slag_wall_tiles[pos_tuple]
-                            if 'owner' in wall_info and wall_info['owner']:
-                                if wall_info['owner'].player == 1:
-                                    outline_color = (0, 255, 100)
-                                else:
-                                    outline_color = (100, 150, 255)
-                                pygame.draw.rect(surface, outline_color, rect, 2)
+                    wall_tiles = getattr(self.game_adapter.game, 'marrow_dike_tiles', None)
+                elif terrain_type == TerrainType.SLAG_WALL:
+                    wall_tiles = getattr(self.game_adapter.game, 'slag_wall_tiles', None)
+                if wall_tiles and (y, x) in wall_tiles:
+                    wall_info = wall_tiles[(y, x)]
+                    if 'owner' in wall_info and wall_info['owner']:
+                        if wall_info['owner'].player == 1:
+                            outline_color = (0, 255, 100)
+                        else:
+                            outline_color = (100, 150, 255)
             else:
-                # Fallback: draw colored rectangle
+                # Fallback: colored rectangle
                 if terrain_type in [TerrainType.LIMESTONE, TerrainType.PILLAR,
                                    TerrainType.STAINED_STONE, TerrainType.HYDRAULIC_PRESS]:
-                    pygame.draw.rect(surface, (80, 80, 90), rect)
+                    fallback_color = (80, 80, 90)
                 elif terrain_type in [TerrainType.DUST, TerrainType.CANYON_FLOOR, TerrainType.CONCRETE_FLOOR]:
-                    pygame.draw.rect(surface, (70, 75, 80), rect)
+                    fallback_color = (70, 75, 80)
                 else:
-                    pygame.draw.rect(surface, (100, 110, 120), rect)
+                    fallback_color = (100, 110, 120)
+
+        rail = bool(game_map and self.rail_universal and game_map.get_terrain_at(y, x) == TerrainType.RAIL)
+        return base_color, textures, fallback_color, outline_color, rail
+
+    def _render_single_tile(self, surface: pygame.Surface, x: int, y: int, game_map):
+        """Render a single tile (used for dirty rectangle updates)."""
+        # Calculate tile position (relative to grid surface, not screen)
+        tile_x = x * TILE_SIZE
+        tile_y = y * TILE_SIZE
+        rect = pygame.Rect(tile_x, tile_y, TILE_SIZE, TILE_SIZE)
+        base_color, textures, fallback_color, outline_color, rail = self._tile_layers(x, y, game_map)
+
+        # Draw base tile
+        pygame.draw.rect(surface, base_color, rect)
+        for terrain in textures:
+            surface.blit(self.terrain_tiles[terrain], (tile_x, tile_y))
+        if fallback_color:
+            pygame.draw.rect(surface, fallback_color, rect)
+        if outline_color:
+            pygame.draw.rect(surface, outline_color, rect, 2)
 
         # Draw grid lines
         pygame.draw.rect(surface, (30, 34, 42), rect, 1)
 
         # Draw rail overlay if needed
-        if game_map and self.rail_universal and game_map.get_terrain_at(y, x) == TerrainType.RAIL:
+        if rail:
             surface.blit(self.rail_universal, (tile_x, tile_y))
 
+    def _render_all_tiles(self, surface: pygame.Surface, game_map):
+        """
+        Render every tile, one layer at a time.
+
+        Tiles never overlap, so drawing layer by layer across the board gives
+        the same pixels as tile by tile, while the textures of each layer go
+        out as one batched blit from the board atlas.
+        """
+        layers = [[(x, y), self._tile_layers(x, y, game_map)]
+                  for y in range(GRID_HEIGHT) for x in range(GRID_WIDTH)]
+
+        for (x, y), (base_color, _, _, _, _) in layers:
+            surface.fill(base_color, (x * TILE_SIZE, y * TILE_SIZE, TILE_SIZE, TILE_SIZE))
+        depth = max(len(textures) for _, (_, textures, _, _, _) in layers)
+        for level in range(depth):
+            self.board_atlas.blits(surface, [(textures[level], (x * TILE_SIZE, y * TILE_SIZE))
+                                             for (x, y), (_, textures, _, _, _) in layers
+                                             if len(textures) > level])
+        for (x, y), (_, _, fallback_color, outline_color, _) in layers:
+            rect = pygame.Rect(x * TILE_SIZE, y * TILE_SIZE, TILE_SIZE, TILE_SIZE)
+            if fallback_color:
+                surface.fill(fallback_color, rect)
+            if outline_color:
+                pygame.draw.rect(surface, outline_color, rect, 2)
+            pygame.draw.rect(surface, (30, 34, 42), rect, 1)
+        self.board_atlas.blits(surface, [("rail_universal", (x * TILE_SIZE, y * TILE_SIZE))
+                                         for (x, y), (_, _, _, _, rail) in layers if rail])
+
     def draw_grid(self, surface: pygame.Surface):
         """
         Draw the game grid with terrain and furniture.
         OPTIMIZED: Uses dirty rectangle tracking to only redraw changed tiles.
         """
+        self._update_grid_cache()
+
+        # Blit cached grid to main surface
+        surface.blit(self._static_grid_surface, (GRID_OFFSET_X, GRID_OFFSET_Y))
+
+    def _update_grid_cache(self) -> bool:
+        """
+        Redraw dirty tiles into the cached grid surface.
+
+        Returns:
+            True if any tile was redrawn
+        """
         game_map = self.game_adapter.game.map if self.game_adapter.game else None
 
         # Full redraw if needed (first frame or major change)
@@ -3930,57 +4156,42 @@ class GraphicalRenderer:
                 self._static_grid_surface = pygame.Surface((grid_width, grid_height))
 
             # Render all tiles to cache
-            for y in range(GRID_HEIGHT):
-                for x in range(GRID_WIDTH):
-                    self._render_single_tile(self._static_grid_surface, x, y, game_map)
+            self._render_all_tiles(self._static_grid_surface, game_map)
 
             self._grid_fully_dirty = False
             self._dirty_tiles.clear()
+            return True
 
         # Update only dirty tiles
-        elif self._dirty_tiles:
+        if self._dirty_tiles:
             for x, y in self._dirty_tiles:
                 if 0 <= x < GRID_WIDTH and 0 <= y < GRID_HEIGHT:
                     self._render_single_tile(self._static_grid_surface, x, y, game_map)
             self._dirty_tiles.clear()
-
-        # Blit cached grid to main surface
-        surface.blit(self._static_grid_surface, (GRID_OFFSET_X, GRID_OFFSET_Y))
+            return True
+        return False
 
     def draw_revealed_traps(self, surface: pygame.Surface):
         """Draw revealed scalar node traps and Fragcrest traps on the map."""
-        # Draw revealed scalar node traps
-        if self.game_adapter.game and hasattr(self.game_adapter.game, 'scalar_nodes'):
-            # Get revealed nodes from game state adapter
-            revealed_nodes = getattr(self.game_adapter, 'revealed_scalar_nodes', set())
-
-            # If trap overlay loaded, draw each revealed trap
-            if self.scalar_node_trap:
-                for node_pos in revealed_nodes:
-                    y, x = node_pos
-
-                    # Calculate tile position
-                    tile_x = GRID_OFFSET_X + x * TILE_SIZE
-                    tile_y = GRID_OFFSET_Y + y * TILE_SIZE
-
-                    # Blit the scalar node trap overlay
-                    surface.blit(self.scalar_node_trap, (tile_x, tile_y))
+        game = self.game_adapter.game
+        if not game:
+            return
+        overlays = []
 
-        # Draw revealed Fragcrest traps
-        if self.game_adapter.game and hasattr(self.game_adapter.game, 'fragcrest_traps'):
-            # If trap overlay loaded, draw each revealed trap
-            if self.fragcrest_trap:
-                for trap_pos, trap_info in self.game_adapter.game.fragcrest_traps.items():
-                    # Only draw if trap is revealed
-                    if trap_info.get('revealed', False):
-                        y, x = trap_pos
+        # Revealed scalar node traps (tracked by the game state adapter)
+        if self.scalar_node_trap and hasattr(game, 'scalar_nodes'):
+            revealed_nodes = getattr(self.game_adapter, 'revealed_scalar_nodes', set())
+            for y, x in revealed_nodes:
+                overlays.append(("scalar_node_trap", (GRID_OFFSET_X + x * TILE_SIZE, GRID_OFFSET_Y + y * TILE_SIZE)))
 
-                        # Calculate tile position
-                        tile_x = GRID_OFFSET_X + x * TILE_SIZE
-                        tile_y = GRID_OFFSET_Y + y * TILE_SIZE
+        # Revealed Fragcrest traps
+        if self.fragcrest_trap and hasattr(game, 'fragcrest_traps'):
+            for (y, x), trap_info in game.fragcrest_traps.items():
+                if trap_info.get('revealed', False):
+                    overlays.append(("fragcrest_trap", (GRID_OFFSET_X + x * TILE_SIZE, GRID_OFFSET_Y + y * TILE_SIZE)))
 
-                        # Blit the Fragcrest trap overlay
-                        surface.blit(self.fragcrest_trap, (tile_x, tile_y))
+        # One batched blit from the board atlas
+        self.board_atlas.blits(surface, overlays)
 
     def draw_rail_junctions(self, surface: pygame.Surface):
         """Draw Rail Genesis junction indicators for upgraded FOWL_CONTRIVANCE."""
@@ -4031,6 +4242,7 @@ class GraphicalRenderer:
             tile_y = GRID_OFFSET_Y + y * TILE_SIZE
             center_x = tile_x + TILE_SIZE // 2
             center_y = tile_y + TILE_SIZE // 2
+            self.compositor.animate((tile_x, tile_y, TILE_SIZE, TILE_SIZE))
 
             # 8 sparks in a pinwheel pattern
             num_sparks = 8
@@ -4103,6 +4315,8 @@ class GraphicalRenderer:
                     fill_alpha = int(80 + 100 * pulse)
                     border_alpha = int(160 + 95 * pulse)
                     border_width = 3
+                    self.compositor.animate((GRID_OFFSET_X + grid_x * TILE_SIZE, GRID_OFFSET_Y + grid_y * TILE_SIZE,
+                                             TILE_SIZE, TILE_SIZE))
                     pygame.draw.rect(indicator_surf, (*skill_color, fill_alpha), indicator_rect)
                     pygame.draw.rect(indicator_surf, (*skill_color, border_alpha), indicator_rect, border_width)
                 else:
@@ -4125,7 +4339,7 @@ class GraphicalRenderer:
             sprite_path = self._get_sprite_path(self.selected_dead_unit.unit_type)
 
             # Try to load and display the sprite
-            sprite = load_svg(sprite_path, TILE_SIZE, TILE_SIZE) if sprite_path else None
+            sprite = asset_manager.surface(sprite_path, TILE_SIZE, TILE_SIZE) if sprite_path else None
 
             # Create ghost surface
             ghost_surf = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
@@ -4140,7 +4354,7 @@ class GraphicalRenderer:
                 ghost_surf.fill((100, 255, 150, 60))  # Green tint
                 if hasattr(self.selected_dead_unit, 'unit_type'):
                     unit_type_name = self.selected_dead_unit.unit_type.name if hasattr(self.selected_dead_unit.unit_type, 'name') else str(self.selected_dead_unit.unit_type)
-                    text = self.small_font.render(unit_type_name[:3], True, (255, 255, 255))
+                    text = render_text(self.small_font, unit_type_name[:3], True, (255, 255, 255))
                     text_rect = text.get_rect(center=(TILE_SIZE // 2, TILE_SIZE // 2))
                     ghost_surf.blit(text, text_rect)
 
@@ -4169,7 +4383,7 @@ class GraphicalRenderer:
                     sprite_path = self._get_sprite_path(dead_unit.unit_type)
 
                     # Try to load and display the sprite
-                    sprite = load_svg(sprite_path, TILE_SIZE, TILE_SIZE) if sprite_path else None
+                    sprite = asset_manager.surface(sprite_path, TILE_SIZE, TILE_SIZE) if sprite_path else None
 
                     # Create ghost surface
                     ghost_surf = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
@@ -4184,7 +4398,7 @@ class GraphicalRenderer:
                         ghost_surf.fill((100, 255, 150, 60))  # Green tint
                         if hasattr(dead_unit, 'unit_type'):
                             unit_type_name = dead_unit.unit_type.name if hasattr(dead_unit.unit_type, 'name') else str(dead_unit.unit_type)
-                            text = self.small_font.render(unit_type_name[:3], True, (255, 255, 255))
+                            text = render_text(self.small_font, unit_type_name[:3], True, (255, 255, 255))
                             text_rect = text.get_rect(center=(TILE_SIZE // 2, TILE_SIZE // 2))
                             ghost_surf.blit(text, text_rect)
 
@@ -4210,7 +4424,7 @@ class GraphicalRenderer:
             sprite_path = self._get_sprite_path(self.selected_unit_type)
 
             # Try to load and display the sprite
-            sprite = load_svg(sprite_path, TILE_SIZE, TILE_SIZE) if sprite_path else None
+            sprite = asset_manager.surface(sprite_path, TILE_SIZE, TILE_SIZE) if sprite_path else None
 
             # Create ghost surface
             ghost_surf = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
@@ -4227,7 +4441,7 @@ class GraphicalRenderer:
                 else:
                     ghost_surf.fill((255, 100, 100, 80))
                 unit_display_name = self.setup_window.unit_names.get(self.selected_unit_type, str(self.selected_unit_type))
-                text = self.small_font.render(unit_display_name[:3], True, (255, 255, 255))
+                text = render_text(self.small_font, unit_display_name[:3], True, (255, 255, 255))
                 text_rect = text.get_rect(center=(TILE_SIZE // 2, TILE_SIZE // 2))
                 ghost_surf.blit(text, text_rect)
 
@@ -4282,9 +4496,7 @@ class GraphicalRenderer:
         # Calculate available height for side panels
         panel_height = SCREEN_HEIGHT - TOP_BAR_HEIGHT - BOTTOM_BAR_HEIGHT
 
-        # Check UI layout setting from config
-        config = ConfigManager()
-        ui_layout = config.get('ui_layout', 'default')
+        ui_layout = self.ui_layout
 
         # === LEFT PANEL (Dedicated Space) ===
         left_panel_x = 0
@@ -4307,6 +4519,7 @@ class GraphicalRenderer:
             self.motor_animation.draw(surface, left_panel_x + panel_padding_lg, motor_y)
             action_menu_y = motor_y + motor_height_spacing
             self.action_menu.draw(surface, left_panel_x + panel_padding_lg, action_menu_y)
+            self._animate_panels(left_panel_x + panel_padding_lg, motor_y, action_menu_y)
         else:
             # Draw player indicator, unit status bar, and unit info on left panel
             player_y = left_panel_y + panel_padding_md
@@ -4338,6 +4551,7 @@ class GraphicalRenderer:
             self.motor_animation.draw(surface, right_panel_x + panel_padding_lg, motor_y)
             action_menu_y = motor_y + motor_height_spacing
             self.action_menu.draw(surface, right_panel_x + panel_padding_lg, action_menu_y)
+            self._animate_panels(right_panel_x + panel_padding_lg, motor_y, action_menu_y)
 
         # Store action menu bottom y for combat log alignment
         from boneglaive.graphical.ui.action_menu import BUTTON_HEIGHT, BUTTON_SPACING, MENU_PADDING as ACTION_MENU_PADDING
@@ -4345,6 +4559,20 @@ class GraphicalRenderer:
         action_panel_height = ACTION_MENU_PADDING * 2 + num_buttons * BUTTON_HEIGHT + (num_buttons - 1) * BUTTON_SPACING
         self._action_menu_bottom_y = action_menu_y + action_panel_height
 
+    def _animate_panels(self, x: int, motor_y: int, action_menu_y: int):
+        """Report the panel parts that change every frame on their own (drawn at x)."""
+        from boneglaive.graphical.ui.motor_animation import MOTOR_WIDTH, MOTOR_HEIGHT
+        from boneglaive.graphical.ui.action_menu import BUTTON_WIDTH, MENU_PADDING
+
+        if self.top_bar.is_animating():
+            self.compositor.animate((0, 0, SCREEN_WIDTH, TOP_BAR_HEIGHT))
+        if self.motor_animation.is_running:
+            self.compositor.animate((x, motor_y, MOTOR_WIDTH, MOTOR_HEIGHT))
+        if self.action_menu.is_animating():
+            # Button particles drift up to 40 px past the panel
+            menu_rect = pygame.Rect(x, action_menu_y, BUTTON_WIDTH + MENU_PADDING * 2, self.action_menu.get_height())
+            self.compositor.animate(menu_rect.inflate(80, 80))
+
     @staticmethod
     def _create_game_background(width: int, height: int) -> pygame.Surface:
         """Create the cached game background with gradient, dust texture, and vignette."""
@@ -4568,7 +4796,6 @@ class GraphicalRenderer:
 
                 # Draw frame
                 self.draw()
-                pygame.display.flip()
 
         # Capture status effects snapshot BEFORE turn execution
         # This allows us to detect status effects that are applied and then cleared during execute_turn
@@ -4642,19 +4869,20 @@ class GraphicalRenderer:
 
             self.combat_log.add_message("AI is thinking...", "system")
 
-            # Wait 3 seconds before AI processes its turn
-            # Keep rendering during the wait so the game doesn't freeze
+            # The AI thinks on a worker thread against a clone of the game while we
+            # keep rendering (at least 3 seconds, so the player can follow the turn)
+            ai_interface = self.game_adapter.ai_interface
+            ai_interface.start_background_turn()
             import time
             start_time = time.time()
-            while time.time() - start_time < 3.0:
+            while time.time() - start_time < 3.0 or not ai_interface.background_turn_ready():
                 delta_time = self.clock.tick(60) / 1000.0
+                pygame.event.pump()  # Keep the window responsive while we wait
                 self.update(delta_time)
                 self.draw()
-                pygame.display.flip()
-
 
-            # Process AI turn (this will set unit actions)
-            self.game_adapter.ai_interface.process_turn()
+            # Queue the AI's plan on the live game (main thread)
+            ai_interface.finish_background_turn()
 
             # Execute the AI's planned actions immediately
             self.execute_turn(_ai=True)
@@ -4762,6 +4990,7 @@ class GraphicalRenderer:
         tile_x = GRID_OFFSET_X + grid_x * TILE_SIZE
         tile_y = GRID_OFFSET_Y + grid_y * TILE_SIZE
         surface.blit(highlight_surf, (tile_x, tile_y))
+        self.compositor.animate((tile_x, tile_y, TILE_SIZE, TILE_SIZE))
 
         # If unit has a pending move, also highlight the ghost position
         game_unit = self._get_game_unit(unit)
@@ -4770,6 +4999,7 @@ class GraphicalRenderer:
             ghost_tile_x = GRID_OFFSET_X + ghost_x * TILE_SIZE
             ghost_tile_y = GRID_OFFSET_Y + ghost_y * TILE_SIZE
             surface.blit(highlight_surf, (ghost_tile_x, ghost_tile_y))
+            self.compositor.animate((ghost_tile_x, ghost_tile_y, TILE_SIZE, TILE_SIZE))
 
     def draw_astral_values(self, surface: pygame.Surface):
         """Draw pulsating golden astral values over furniture when DELPHIC APPRAISER is selected."""
@@ -4813,22 +5043,21 @@ class GraphicalRenderer:
                         outline_font = self._astral_value_font_cache[outline_size]
 
                         # Render the number
-                        value_text = value_font.render(str(astral_value), True, (255, 215, 0))  # Gold
-
-                        # Apply transparency
-                        value_text.set_alpha(alpha)
+                        value_text = render_text(value_font, str(astral_value), True, (255, 215, 0), alpha=alpha)  # Gold
 
                         # Center the text on the tile
                         text_rect = value_text.get_rect(center=(tile_x, tile_y))
 
                         # Add dark outline for readability
-                        outline_text = outline_font.render(str(astral_value), True, (0, 0, 0))
-                        outline_text.set_alpha(alpha // 2)
+                        outline_text = render_text(outline_font, str(astral_value), True, (0, 0, 0), alpha=alpha // 2)
                         outline_rect = outline_text.get_rect(center=(tile_x, tile_y))
                         surface.blit(outline_text, outline_rect)
 
                         # Draw the main golden number
                         surface.blit(value_text, text_rect)
+                        # The number swells with the pulse: cover it at full size
+                        self.compositor.animate(pygame.Rect(0, 0, TILE_SIZE * 2, TILE_SIZE * 2).move(
+                            tile_x - TILE_SIZE, tile_y - TILE_SIZE))
 
         # Check if Valuation Oracle is upgraded - if so, draw astral values on enemies
         # Get appraiser first and check passive skill exists BEFORE checking upgrade
@@ -4865,18 +5094,18 @@ class GraphicalRenderer:
                             outline_font = self._astral_value_font_cache[outline_size]
 
                             # Render the number
-                            value_text = value_font.render(str(enemy_value), True, (255, 215, 0))  # Gold
-                            value_text.set_alpha(alpha)
+                            value_text = render_text(value_font, str(enemy_value), True, (255, 215, 0), alpha=alpha)  # Gold
                             text_rect = value_text.get_rect(center=(tile_x, tile_y))
 
                             # Add dark outline for readability
-                            outline_text = outline_font.render(str(enemy_value), True, (0, 0, 0))
-                            outline_text.set_alpha(alpha // 2)
+                            outline_text = render_text(outline_font, str(enemy_value), True, (0, 0, 0), alpha=alpha // 2)
                             outline_rect = outline_text.get_rect(center=(tile_x, tile_y))
                             surface.blit(outline_text, outline_rect)
 
                             # Draw the main golden number
                             surface.blit(value_text, text_rect)
+                            self.compositor.animate(pygame.Rect(0, 0, TILE_SIZE * 2, TILE_SIZE * 2).move(
+                                tile_x - TILE_SIZE, tile_y - TILE_SIZE))
 
     def draw_skill_shadows(self, surface: pygame.Surface):
         """Draw semi-transparent ghost indicators of units at skill target indicator positions."""
@@ -4953,6 +5182,9 @@ class GraphicalRenderer:
                 # Convert grid position to screen coordinates (center of tile)
                 shadow_x = GRID_OFFSET_X + grid_x * TILE_SIZE + TILE_SIZE // 2
                 shadow_y = GRID_OFFSET_Y + grid_y * TILE_SIZE + TILE_SIZE // 2
+                shadow_size = max(TILE_SIZE, unit.radius * 2)
+                self.compositor.animate(pygame.Rect(0, 0, shadow_size, shadow_size).move(
+                    shadow_x - shadow_size // 2, shadow_y - shadow_size // 2))
 
                 # Check which type of indicator this is - use appropriate skill icon instead of unit sprite
                 is_market_futures = (hasattr(game_unit, 'market_futures_indicator') and
@@ -4973,7 +5205,7 @@ class GraphicalRenderer:
                         icon_filename = 'saft-e-gas.svg'
 
                     icon_path = asset_path(f"graphics/skill_icons/{icon_filename}")
-                    icon_surface = load_svg(icon_path, TILE_SIZE, TILE_SIZE)
+                    icon_surface = asset_manager.surface(icon_path, TILE_SIZE, TILE_SIZE)
 
                     if icon_surface:
                         # Use icon with transparency
@@ -5001,7 +5233,7 @@ class GraphicalRenderer:
                             fallback_text = "BG"
                         else:  # is_saft_e_gas
                             fallback_text = "SE"
-                        text_render = self.small_font.render(fallback_text, True, (255, 255, 255))
+                        text_render = render_text(self.small_font, fallback_text, True, (255, 255, 255))
                         text_rect = text_render.get_rect(center=(TILE_SIZE // 2, TILE_SIZE // 2))
                         fallback_surf.blit(text_render, text_rect)
                         surface.blit(fallback_surf, (shadow_x - TILE_SIZE // 2, shadow_y - TILE_SIZE // 2))
@@ -5034,6 +5266,79 @@ class GraphicalRenderer:
                     surface.blit(shadow_surface,
                                (shadow_x - unit.radius, shadow_y - unit.radius))
 
+    def draw_imbued_currency(self, surface: pygame.Surface):
+        """Draw waving currency symbols and sparkles on enemies imbued by Market Futures."""
+        if not self.game_adapter.game:
+            return
+
+        # Calculate wave effect for currency symbol (same as furniture)
+        alpha = int(140 + math.sin(self.astral_value_pulse_time * 2.5) * 60)  # 80 to 200
+        wave_offset = math.sin(self.astral_value_pulse_time * 3) * 8  # Vertical wave amplitude
+
+        for unit in self.units:
+            game_unit = self._get_game_unit(unit)
+            if game_unit and game_unit.is_alive():
+                # Check if unit has imbued status (from Market Futures on enemies)
+                if hasattr(game_unit, 'status_imbued') and game_unit.status_imbued:
+                    # Determine color based on which player imbued the unit
+                    imbued_player = getattr(game_unit, 'status_imbued_player', 1)
+                    if imbued_player == 1:
+                        symbol_color = (100, 255, 100)  # Green for Player 1
+                        sparkle_colors = [(100, 255, 150), (150, 255, 100)]
+                    else:
+                        symbol_color = (100, 150, 255)  # Blue for Player 2
+                        sparkle_colors = [(100, 150, 255), (150, 200, 255)]
+
+                    # Calculate screen position (center of unit's tile)
+                    tile_x = GRID_OFFSET_X + unit.grid_x * TILE_SIZE + TILE_SIZE // 2
+                    tile_y = GRID_OFFSET_Y + unit.grid_y * TILE_SIZE + TILE_SIZE // 2
+
+                    # Draw waving currency symbol (¤) - same as furniture
+                    font_size = 120
+                    currency_font = get_font(None, font_size)
+                    currency_text = render_text(currency_font, "¤", True, symbol_color, alpha=alpha)
+
+                    # Apply wave offset to y position for undulating effect
+                    wave_y = tile_y + wave_offset
+
+                    # Center the symbol with wave offset
+                    text_rect = currency_text.get_rect(center=(tile_x, int(wave_y)))
+
+                    # Draw dark outline for visibility
+                    outline_font = get_font(None, font_size + 2)
+                    outline_text = render_text(outline_font, "¤", True, (0, 0, 0), alpha=alpha // 2)
+                    outline_rect = outline_text.get_rect(center=(tile_x, int(wave_y)))
+                    surface.blit(outline_text, outline_rect)
+
+                    # Draw main currency symbol
+                    surface.blit(currency_text, text_rect)
+
+                    # Spawn sparkles around imbued enemies (same as furniture)
+                    if random.random() < 0.3:  # 30% chance per frame
+                        # Random position within tile bounds
+                        spawn_x = tile_x + random.uniform(-TILE_SIZE // 3, TILE_SIZE // 3)
+                        spawn_y = tile_y + random.uniform(-TILE_SIZE // 3, TILE_SIZE // 3)
+
+                        # Random velocity (upward with slight horizontal drift)
+                        vx = random.uniform(-10, 10)
+                        vy = random.uniform(-40, -60)
+
+                        # Random properties
+                        max_life = random.uniform(1.0, 1.5)
+                        sparkle_size = random.randint(2, 4)
+                        color = random.choice(sparkle_colors)  # Use player-specific colors
+
+                        self.imbued_sparkles.append({
+                            'x': spawn_x,
+                            'y': spawn_y,
+                            'vx': vx,
+                            'vy': vy,
+                            'life': 0,
+                            'max_life': max_life,
+                            'size': sparkle_size,
+                            'color': color
+                        })
+
     def draw_imbued_furniture(self, surface: pygame.Surface):
         """Draw glowing currency symbol and gold sparkles on furniture imbued by Market Futures."""
         if not self.game_adapter.game:
@@ -5075,9 +5380,8 @@ class GraphicalRenderer:
 
             # Draw waving currency symbol (¤) - 200% larger = 120pt (was 40pt)
             font_size = 120
-            currency_font = pygame.font.Font(None, font_size)
-            currency_text = currency_font.render("¤", True, symbol_color)
-            currency_text.set_alpha(alpha)
+            currency_font = get_font(None, font_size)
+            currency_text = render_text(currency_font, "¤", True, symbol_color, alpha=alpha)
 
             # Apply wave offset to y position for undulating effect
             wave_y = tile_y + wave_offset
@@ -5086,9 +5390,8 @@ class GraphicalRenderer:
             text_rect = currency_text.get_rect(center=(tile_x, int(wave_y)))
 
             # Draw dark outline for visibility
-            outline_font = pygame.font.Font(None, font_size + 2)
-            outline_text = outline_font.render("¤", True, (0, 0, 0))
-            outline_text.set_alpha(alpha // 2)
+            outline_font = get_font(None, font_size + 2)
+            outline_text = render_text(outline_font, "¤", True, (0, 0, 0), alpha=alpha // 2)
             outline_rect = outline_text.get_rect(center=(tile_x, int(wave_y)))
             surface.blit(outline_text, outline_rect)
 
@@ -5521,34 +5824,68 @@ class GraphicalRenderer:
             self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
             self.combat_log.add_message("Windowed mode enabled (F11 to toggle)", "system")
 
+        # The new window starts blank: send the next frame whole
+        self.compositor.invalidate()
+
+    def _on_config_change(self, key: str, value):
+        """Apply a changed setting."""
+        if key == 'show_fps':
+            self.show_fps = value
+            self.compositor.invalidate()
+        elif key == 'show_frame_profiler':
+            self.profiler.enabled = value
+            self.compositor.invalidate()
+        elif key == 'verify_dirty_rects':
+            self.compositor.verify = value
+        elif key == 'ui_layout':
+            self.ui_layout = value
+            # Panels swap sides: the whole frame changes
+            self.compositor.invalidate()
+
     def run(self):
         """Main game loop."""
-        while self.running:
-            delta_time = self.clock.tick(60) / 1000.0  # Convert to seconds
-
-            # Update FPS counter
-            if self.show_fps:
-                current_fps = self.clock.get_fps()
-                self.fps_values.append(current_fps)
-                # Keep only last 30 frames for smoothing
-                if len(self.fps_values) > 30:
-                    self.fps_values.pop(0)
-                # Calculate average FPS
-                if len(self.fps_values) > 0:
-                    self.fps_display = sum(self.fps_values) / len(self.fps_values)
-
-            self.handle_events()
-            self.update(delta_time)
-            self.draw()
+        scheduler = self.frame_scheduler
+        try:
+            while self.running:
+                # Full rate while animating; when idle, sleep until input arrives
+                delta_time, events = scheduler.wait(self.is_animating())
+                scheduler.begin_frame()
+                self.profiler.begin_frame()
+
+                # Update FPS counter
+                if self.show_fps:
+                    current_fps = self.clock.get_fps()
+                    self.fps_values.append(current_fps)
+                    # Keep only last 30 frames for smoothing
+                    if len(self.fps_values) > 30:
+                        self.fps_values.pop(0)
+                    # Calculate average FPS
+                    if len(self.fps_values) > 0:
+                        self.fps_display = sum(self.fps_values) / len(self.fps_values)
+
+                events += pygame.event.get()
+                self.handle_events(events)
+                config.poll()
+                self.profiler.lap("handle_events")
+                self.update(delta_time)
+                self.profiler.lap("update")
+                self.draw()
+                self.profiler.end_frame()
+                scheduler.end_frame(self._frame_changed, bool(events))
+        finally:
+            config.unsubscribe(self._on_config_change)
 
-        pass
+        logger.info(asset_manager.report.summary())
+        logger.info(self.timeline.summary())
+        logger.info(text_cache.stats.summary())
+        if self.profiler.enabled:
+            logger.info(self.profiler.summary())
 
 
 def main():
     """Entry point for graphical version."""
     # Load config to get selected map and game mode
-    from boneglaive.utils.config import ConfigManager
-    config = ConfigManager()
+    config = get_config()
     selected_map = config.get('selected_map', 'hard_pressed')
     game_mode = config.get('game_mode', 'single')
 
@@ -142,7 +142,8 @@ class SoundManager:
 
     def stop_all(self):
         """Stop all currently playing sounds."""
-        pygame.mixer.stop()
+        if pygame.mixer.get_init():
+            pygame.mixer.stop()
 
     def set_volume(self, category: str, volume: float):
         """
@@ -165,6 +166,16 @@ class SoundManager:
         self.enabled = False
         self.stop_all()
 
+    def on_config_change(self, key: str, value):
+        """Apply the sfx_volume and audio_enabled settings."""
+        if key == 'sfx_volume':
+            self.set_volume("master", value)
+        elif key == 'audio_enabled':
+            if value:
+                self.enable()
+            else:
+                self.disable()
+
 # Global sound manager instance (singleton pattern)
 _sound_manager_instance: Optional[SoundManager] = None
 
@@ -173,10 +184,16 @@ def get_sound_manager() -> SoundManager:
     """
     Get the global SoundManager instance (singleton).
 
+    The instance starts from the audio settings and follows their changes.
+
     Returns:
         SoundManager instance
     """
     global _sound_manager_instance
     if _sound_manager_instance is None:
-        _sound_manager_instance = SoundManager()
+        from boneglaive.utils.config import get_config
+        config = get_config()
+        _sound_manager_instance = SoundManager(enabled=config.get('audio_enabled', True))
+        _sound_manager_instance.set_volume("master", config.get('sfx_volume', 1.0))
+        config.subscribe(_sound_manager_instance.on_config_change, keys=('sfx_volume', 'audio_enabled'))
     return _sound_manager_instance
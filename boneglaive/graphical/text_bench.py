@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Text rendering benchmark.
+
+Times the text-heavy widgets with the shared text cache off (every label
+rasterized by font.render() each frame, as before the cache) and on:
+
+- the combat log and the open message log window, filled with messages
+- the game over window, the unit info panel and the turn counter
+- floating damage numbers
+- all of the above as one frame's worth of UI text, and full draw() frames
+
+    python -m boneglaive.graphical.text_bench --headless --frames 200
+"""
+
+import os
+from typing import Dict, List, Tuple
+
+from boneglaive.graphical.frame_bench import describe, time_ms
+
+
+def populate_text_ui(renderer, messages: int = 200, floating: int = 12) -> None:
+    """Fill the combat log, open the message log and game over windows, and add floating numbers."""
+    from boneglaive.graphical.animations.core import FloatingText
+
+    log = renderer.combat_log
+    for i in range(messages):
+        if i % 3 == 0:
+            log.add_message(f"GLAIVEMAN hits MARROW_CONDENSER for #DAMAGE_{i % 17 + 1}# damage", "combat", player=1)
+        elif i % 3 == 1:
+            log.add_message(f"GRAYMAN recovers #HEAL_{i % 5 + 1}# HP", "combat", player=2)
+        else:
+            log.add_message(f"Player {i % 2 + 1} moved a unit to ({i % 10}, {i % 20})", "system")
+    renderer.message_log_window.show(log.messages)
+    renderer.game_over_window.show(True, "Player 1", 120, "Player 2", 85, winner_player=1)
+
+    if renderer.units:
+        unit = renderer.units[0]
+        renderer.unit_info_panel.update(unit, renderer._get_game_unit(unit))
+
+    for i in range(floating):
+        text = FloatingText(100 + i * 40, 300, str(i * 3 + 1), (255, 80, 80))
+        text.update(0.1)
+        renderer.floating_texts.append(text)
+
+
+def run_benchmark(renderer, frames: int = 100) -> Dict[str, Tuple[List[float], List[float]]]:
+    """
+    Time the text widgets with the text cache disabled and enabled.
+
+    Returns:
+        Benchmark name -> (uncached per-run milliseconds, cached per-run milliseconds)
+    """
+    import pygame
+    from boneglaive.graphical import renderer as renderer_module
+    from boneglaive.graphical.ui.font_utils import text_cache
+
+    screen = renderer.screen
+    width, height = screen.get_size()
+    target = pygame.Surface((width, height))
+
+    def combat_log():
+        renderer.combat_log.draw(target, renderer_module.GRID_OFFSET_X, height - 200, height=180, width=900)
+
+    def message_log():
+        renderer.message_log_window.draw(target, width, height)
+
+    def game_over():
+        renderer.game_over_window.draw(target, width, height)
+
+    def unit_info():
+        renderer.unit_info_panel.draw(target, 20, 200)
+
+    def turn_counter():
+        renderer._draw_turn_counter(target, 0, 10)
+
+    def floating_texts():
+        for text in renderer.floating_texts:
+            text.draw(target, renderer.font)
+
+    widgets = [("combat log", combat_log), ("message log window", message_log),
+               ("game over window", game_over), ("unit info panel", unit_info),
+               ("turn counter", turn_counter), ("floating texts", floating_texts)]
+
+    def ui_text():
+        for _, draw in widgets:
+            draw()
+
+    def frame():
+        renderer.draw()
+
+    benchmarks = widgets + [("all UI text", ui_text), ("frame", frame)]
+    results = {}
+    for name, fn in benchmarks:
+        samples = []
+        for enabled in (False, True):
+            text_cache.enabled = enabled
+            text_cache.clear()
+            fn()  # Warm up fonts and (when enabled) the cache
+            samples.append(time_ms(fn, frames))
+        results[name] = (samples[0], samples[1])
+    text_cache.enabled = True
+    return results
+
+
+def main(argv=None) -> int:
+    """Command-line entry point."""
+    import argparse
+    import statistics
+
+    parser = argparse.ArgumentParser(description="Benchmark per-frame text rendering with and without the text cache")
+    parser.add_argument("--frames", type=int, default=100, help="frames to time per benchmark")
+    parser.add_argument("--messages", type=int, default=200, help="combat log messages to fill the logs with")
+    parser.add_argument("--headless", action="store_true", help="use SDL's dummy video driver")
+    args = parser.parse_args(argv)
+
+    if args.headless:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+    from boneglaive.graphical.game_state import GameStateAdapter
+    from boneglaive.graphical.renderer import GraphicalRenderer
+    from boneglaive.graphical.ui.font_utils import text_cache
+
+    adapter = GameStateAdapter()
+    adapter.initialize_game(skip_setup=True)
+    renderer = GraphicalRenderer(adapter)
+    renderer.sync_units_from_game()
+    populate_text_ui(renderer, messages=args.messages)
+
+    for name, (uncached, cached) in run_benchmark(renderer, args.frames).items():
+        speedup = statistics.mean(uncached) / max(statistics.mean(cached), 1e-9)
+        print(f"{name:20s} uncached {describe(uncached)}")
+        print(f"{'':20s} cached   {describe(cached)}  ({speedup:.1f}x)")
+    print(text_cache.stats.summary())
+    print(f"{len(text_cache)} cached texts, {text_cache.bytes / 1024:.0f} KiB")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Texture Atlas
+Packs many small fixed-size surfaces into a few large pages and draws them in batches.
+
+Terrain tiles, furniture and board overlays are all TILE_SIZE squares that are
+drawn dozens to hundreds of times per board redraw. Packed into atlas pages,
+a whole layer of them becomes one Surface.blits() call of (page, dest, area)
+triples instead of one Python-level blit per tile.
+
+Pages are filled shelf by shelf (rows as tall as their tallest image). Images
+are copied in with BLEND_RGBA_MAX onto the zeroed page, which copies
+per-pixel alpha exactly instead of blending it against the empty page.
+"""
+
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+import pygame
+
+# Side of a square atlas page in pixels
+ATLAS_PAGE_SIZE = 1024
+
+
+class TextureAtlas:
+    """Shelf-packed atlas pages with keyed regions."""
+
+    def __init__(self, page_size: int = ATLAS_PAGE_SIZE):
+        """
+        Args:
+            page_size: Side of each square page in pixels
+        """
+        self.page_size = page_size
+        self.pages: List[pygame.Surface] = []
+        self._regions: Dict[Hashable, Tuple[pygame.Surface, pygame.Rect]] = {}
+        # Packing cursor on the newest page
+        self._shelf_x = 0
+        self._shelf_y = 0
+        self._shelf_height = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._regions
+
+    def __len__(self) -> int:
+        return len(self._regions)
+
+    def add(self, key: Hashable, surface: pygame.Surface) -> bool:
+        """
+        Copy surface into the atlas under key (replacing nothing if key exists).
+
+        Returns:
+            False if the surface is larger than a page
+        """
+        if key in self._regions:
+            return True
+        width, height = surface.get_size()
+        if width > self.page_size or height > self.page_size:
+            return False
+
+        if not self.pages or self._shelf_x + width > self.page_size:
+            # Next shelf
+            self._shelf_y += self._shelf_height
+            self._shelf_x = 0
+            self._shelf_height = 0
+        if not self.pages or self._shelf_y + height > self.page_size:
+            self._new_page()
+
+        page = self.pages[-1]
+        rect = pygame.Rect(self._shelf_x, self._shelf_y, width, height)
+        page.blit(surface, rect.topleft, special_flags=pygame.BLEND_RGBA_MAX)
+        self._regions[key] = (page, rect)
+        self._shelf_x += width
+        self._shelf_height = max(self._shelf_height, height)
+        return True
+
+    def _new_page(self) -> None:
+        page = pygame.Surface((self.page_size, self.page_size), pygame.SRCALPHA)
+        if pygame.display.get_surface() is not None:
+            page = page.convert_alpha()
+        page.fill((0, 0, 0, 0))
+        self.pages.append(page)
+        self._shelf_x = self._shelf_y = self._shelf_height = 0
+
+    def region(self, key: Hashable) -> Optional[Tuple[pygame.Surface, pygame.Rect]]:
+        """(page, area) holding key, or None."""
+        return self._regions.get(key)
+
+    def subsurface(self, key: Hashable) -> Optional[pygame.Surface]:
+        """A surface sharing key's pixels in its page, for single blits."""
+        region = self._regions.get(key)
+        return region[0].subsurface(region[1]) if region else None
+
+    def blits(self, target: pygame.Surface, items: Iterable[Tuple[Hashable, Tuple[int, int]]]) -> int:
+        """
+        Draw many atlas images in one Surface.blits() call.
+
+        Args:
+            target: Surface to draw on
+            items: (key, destination) pairs, drawn in order; unknown keys are skipped
+
+        Returns:
+            Number of images drawn
+        """
+        regions = self._regions
+        batch = []
+        for key, dest in items:
+            region = regions.get(key)
+            if region is not None:
+                batch.append((region[0], dest, region[1]))
+        if batch:
+            target.blits(batch, doreturn=False)
+        return len(batch)
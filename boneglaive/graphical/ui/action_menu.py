@@ -779,6 +779,13 @@ class ActionMenu:
 
         return None
 
+    def is_animating(self) -> bool:
+        """Whether a button pulses (upgrade points, respawns, Severance), so the menu changes every frame."""
+        return any((button.action == "upgrade" and button.has_upgrade_points) or
+                   (button.action == "respawn" and button.has_respawns_available) or
+                   (button.action == "move" and button.severance_glow)
+                   for button in self.buttons)
+
     def get_height(self) -> int:
         """Calculate total height needed for this component."""
         num_buttons = len(self.buttons)
@@ -16,13 +16,12 @@ COLOR_TEXT_WARNING = (255, 255, 100)  # Yellow - warnings and debuffs
 COLOR_TEXT_DEATH = (150, 50, 50)  # Dark red - death messages
 COLOR_TEXT_WRETCH = (255, 100, 100)  # Bright red - wretch messages
 COLOR_TEXT_DOMINION = (255, 100, 255)  # Bright magenta - Dominion upgrade messages
-COLOR_TEXT_DAMAGE = (200, 100, 255)  # Magenta - damage numbers
-COLOR_TEXT_HEAL = (255, 255, 255)  # White - healing numbers
 COLOR_TEXT_PLAYER1 = (100, 255, 100)  # Green - Player 1 messages
 COLOR_TEXT_PLAYER2 = (100, 150, 255)  # Blue - Player 2 messages
 
 # Import scaling utilities
 from .scale_utils import scale_manager
+from .text_layout import layout_message, wrap_text
 
 # Scale log dimensions based on resolution
 LOG_WIDTH = scale_manager.scale(900, 'x')
@@ -30,11 +29,6 @@ LOG_HEIGHT = scale_manager.scale(90, 'y')
 LOG_PADDING = scale_manager.scale(8)
 LINE_HEIGHT = scale_manager.scale(16, 'y')
 
-# Pre-compile regex patterns for performance (don't recompile every frame!)
-import re
-DAMAGE_PATTERN = re.compile(r'#DAMAGE_(\d+)#')
-HEAL_PATTERN = re.compile(r'#HEAL_(\d+)#')
-
 
 class CombatLog:
     """Combat log UI component showing recent game events."""
@@ -224,8 +218,10 @@ class CombatLog:
 
         # Get most recent messages (truncate text to fit width)
         recent_messages = self.messages[-10:]  # Last 10 messages
+        max_width = log_width - (LOG_PADDING * 2)
 
-        # Draw messages bottom to top (most recent at bottom)
+        # Draw messages bottom to top (most recent at bottom); each is laid out
+        # once for this width and then drawn as a single blit
         text_y = y + log_height - LOG_PADDING - LINE_HEIGHT
         messages_drawn = 0
 
@@ -233,78 +229,8 @@ class CombatLog:
             if messages_drawn >= max_lines:
                 break
 
-            # Get color for message
-            color = self._get_message_color(message)
-
-            # Get text and check for special number placeholders
-            text = message['text']
-            max_width = log_width - (LOG_PADDING * 2)
-
-            # Check for damage or heal number placeholders (using pre-compiled patterns)
-            damage_match = DAMAGE_PATTERN.search(text)
-            heal_match = HEAL_PATTERN.search(text)
-
-            if damage_match:
-                # Split text around damage number
-                damage_num = damage_match.group(1)
-                parts = text.split(f'#DAMAGE_{damage_num}#')
-
-                # Render parts with different colors
-                pos_x = x + LOG_PADDING
-
-                # First part (before damage)
-                if parts[0]:
-                    part_surface = self.font.render(parts[0], True, color)
-                    surface.blit(part_surface, (pos_x, text_y))
-                    pos_x += part_surface.get_width()
-
-                # Damage number in magenta
-                damage_surface = self.font.render(damage_num, True, COLOR_TEXT_DAMAGE)
-                surface.blit(damage_surface, (pos_x, text_y))
-                pos_x += damage_surface.get_width()
-
-                # Remaining part (after damage)
-                if len(parts) > 1 and parts[1]:
-                    remaining_surface = self.font.render(parts[1], True, color)
-                    surface.blit(remaining_surface, (pos_x, text_y))
-
-            elif heal_match:
-                # Split text around heal number
-                heal_num = heal_match.group(1)
-                parts = text.split(f'#HEAL_{heal_num}#')
-
-                # Render parts with different colors
-                pos_x = x + LOG_PADDING
-
-                # First part (before heal)
-                if parts[0]:
-                    part_surface = self.font.render(parts[0], True, color)
-                    surface.blit(part_surface, (pos_x, text_y))
-                    pos_x += part_surface.get_width()
-
-                # Heal number in white
-                heal_surface = self.font.render(heal_num, True, COLOR_TEXT_HEAL)
-                surface.blit(heal_surface, (pos_x, text_y))
-                pos_x += heal_surface.get_width()
-
-                # Remaining part (after heal)
-                if len(parts) > 1 and parts[1]:
-                    remaining_surface = self.font.render(parts[1], True, color)
-                    surface.blit(remaining_surface, (pos_x, text_y))
-
-            else:
-                # No special numbers, render normally
-                text_surface = self.font.render(text, True, color)
-
-                # If text is too wide, truncate with ellipsis
-                if text_surface.get_width() > max_width:
-                    while text and self.font.render(text + "...", True, color).get_width() > max_width:
-                        text = text[:-1]
-                    text += "..."
-                    text_surface = self.font.render(text, True, color)
-
-                # Draw message
-                surface.blit(text_surface, (x + LOG_PADDING, text_y))
+            line = layout_message(message, self.font, max_width, self._get_message_color)[0]
+            surface.blit(line, (x + LOG_PADDING, text_y))
 
             text_y -= LINE_HEIGHT
             messages_drawn += 1
@@ -374,46 +300,7 @@ class CombatLog:
         Returns:
             List of wrapped lines
         """
-        if not text:
-            return [""]
-
-        # Estimate characters per line based on font size
-        # For 16px font, roughly 8-10 pixels per character
-        approx_chars_per_line = max_width // 8
-
-        # If text fits on one line, return it
-        test_surface = self.font.render(text, True, (255, 255, 255))
-        if test_surface.get_width() <= max_width:
-            return [text]
-
-        # Wrap text by words
-        words = text.split()
-        lines = []
-        current_line = ""
-
-        for word in words:
-            # Test if adding this word would exceed width
-            test_line = current_line + (" " if current_line else "") + word
-            test_surface = self.font.render(test_line, True, (255, 255, 255))
-
-            if test_surface.get_width() <= max_width:
-                current_line = test_line
-            else:
-                # Word doesn't fit, start new line
-                if current_line:
-                    lines.append(current_line)
-                    current_line = word
-                else:
-                    # Single word is too long, truncate it
-                    current_line = word[:approx_chars_per_line-3] + "..."
-                    lines.append(current_line)
-                    current_line = ""
-
-        # Add last line
-        if current_line:
-            lines.append(current_line)
-
-        return lines if lines else [""]
+        return wrap_text(self.font, text, max_width)
 
     def handle_scroll(self, direction: int):
         """
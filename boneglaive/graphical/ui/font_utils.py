@@ -1,11 +1,26 @@
 #!/usr/bin/env python3
 """
 Font Utilities
-Dynamic font sizing to fit text within UI element bounds.
+Dynamic font sizing to fit text within UI element bounds, and a shared cache
+of rendered text.
+
+Widgets redraw the same labels every frame, and font.render() rasterizes the
+glyphs again each time. render_text() takes the same arguments as
+font.render() but returns the surface from an LRU cache keyed by font, text,
+antialias and colours, bounded by the pixel memory it holds. Returned
+surfaces are shared: blit them, never draw on them (pass alpha= instead of
+calling set_alpha()).
 """
 import pygame
+from collections import OrderedDict
 from typing import Tuple, Optional
 
+# Pixel memory the text cache may hold before evicting the least recently used text (bytes)
+TEXT_CACHE_BUDGET_BYTES = 16 * 1024 * 1024
+
+# Fitted font choices remembered before the memo is cleared
+FITTED_FONT_CACHE_LIMIT = 2048
+
 
 class FontCache:
     """Cache for dynamically sized fonts to avoid recreation."""
@@ -38,9 +53,106 @@ class FontCache:
         return self._cache[key]
 
 
+class TextCacheStats:
+    """How text render requests were served."""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0        # Rendered and cached
+        self.uncached = 0      # Rendered but too large to cache
+        self.evictions = 0
+
+    def summary(self) -> str:
+        total = self.hits + self.misses + self.uncached
+        rate = 100.0 * self.hits / total if total else 0.0
+        return (f"Text cache: {total} renders, {self.hits} hits ({rate:.0f}%), "
+                f"{self.misses} misses, {self.uncached} uncached, {self.evictions} evicted")
+
+
+class TextCache:
+    """LRU cache of rendered text surfaces, bounded by pixel memory."""
+
+    def __init__(self, budget_bytes: int = TEXT_CACHE_BUDGET_BYTES):
+        self.budget_bytes = budget_bytes
+        self.enabled = True
+        self.bytes = 0
+        self.stats = TextCacheStats()
+        self._entries = OrderedDict()  # key -> (surface, alpha of a fresh render, bytes)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def render(self, font: pygame.font.Font, text: str, antialias: bool, color,
+               background=None, alpha: Optional[int] = None) -> pygame.Surface:
+        """
+        Rendered text, as font.render(text, antialias, color, background).
+
+        Args:
+            alpha: Surface alpha to draw the text with (default: as rendered)
+
+        Returns:
+            A shared surface; blit it but do not modify it
+        """
+        if not self.enabled:
+            surface = font.render(text, antialias, color, background)
+            if alpha is not None:
+                surface.set_alpha(alpha)
+            return surface
+
+        key = (font, text, bool(antialias), tuple(color),
+               tuple(background) if background is not None else None)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            surface, fresh_alpha, _ = entry
+        else:
+            surface = font.render(text, antialias, color, background)
+            fresh_alpha = surface.get_alpha()
+            size = surface.get_pitch() * surface.get_height()
+            if size * 4 > self.budget_bytes:
+                self.stats.uncached += 1
+            else:
+                self.stats.misses += 1
+                self._entries[key] = (surface, fresh_alpha, size)
+                self.bytes += size
+                while self.bytes > self.budget_bytes:
+                    _, (_, _, evicted_size) = self._entries.popitem(last=False)
+                    self.bytes -= evicted_size
+                    self.stats.evictions += 1
+
+        wanted = fresh_alpha if alpha is None else alpha
+        if surface.get_alpha() != wanted:
+            surface.set_alpha(wanted)
+        return surface
+
+    def clear(self) -> None:
+        """Drop every cached surface."""
+        self._entries.clear()
+        self.bytes = 0
+
+
 # Global font cache instance
 _font_cache = FontCache()
 
+# Global text cache shared by the UI widgets and animations
+text_cache = TextCache()
+
+# (text, constraints, font name) -> font chosen by get_fitted_font()
+_fitted_fonts = {}
+
+
+def get_font(font_name: Optional[str], size: int) -> pygame.font.Font:
+    """A shared font of the given name and size (None for pygame's default font)."""
+    return _font_cache.get_font(font_name, size)
+
+
+def render_text(font: pygame.font.Font, text: str, antialias: bool = True,
+                color=(255, 255, 255), background=None,
+                alpha: Optional[int] = None) -> pygame.Surface:
+    """Drop-in for font.render() in draw code: the rendered text from the shared cache."""
+    return text_cache.render(font, text, antialias, color, background, alpha)
+
 
 def get_fitted_font(text: str,
                    max_width: int,
@@ -71,21 +183,26 @@ def get_fitted_font(text: str,
     if max_width <= 0:
         return _font_cache.get_font(font_name, base_font_size)
 
+    key = (text, max_width, max_height, base_font_size, min_font_size, max_font_size, font_name)
+    font = _fitted_fonts.get(key)
+    if font is not None:
+        return font
+    if len(_fitted_fonts) >= FITTED_FONT_CACHE_LIMIT:
+        _fitted_fonts.clear()
+
     # Start with base size
     current_size = base_font_size
 
     # Try base size first
     font = _font_cache.get_font(font_name, current_size)
-    text_surface = font.render(text, True, (255, 255, 255))
-    width, height = text_surface.get_size()
+    width, height = font.size(text)
 
     # If text fits, try larger sizes up to max
     if width <= max_width and (max_height is None or height <= max_height):
         while current_size < max_font_size:
             test_size = current_size + 1
             test_font = _font_cache.get_font(font_name, test_size)
-            test_surface = test_font.render(text, True, (255, 255, 255))
-            test_width, test_height = test_surface.get_size()
+            test_width, test_height = test_font.size(text)
 
             if test_width <= max_width and (max_height is None or test_height <= max_height):
                 current_size = test_size
@@ -98,8 +215,7 @@ def get_fitted_font(text: str,
         while current_size > min_font_size:
             test_size = current_size - 1
             test_font = _font_cache.get_font(font_name, test_size)
-            test_surface = test_font.render(text, True, (255, 255, 255))
-            test_width, test_height = test_surface.get_size()
+            test_width, test_height = test_font.size(text)
 
             if test_width <= max_width and (max_height is None or test_height <= max_height):
                 current_size = test_size
@@ -109,6 +225,7 @@ def get_fitted_font(text: str,
                 current_size = test_size
                 font = test_font
 
+    _fitted_fonts[key] = font
     return font
 
 
@@ -148,4 +265,4 @@ def render_fitted_text(text: str,
         font_name=font_name
     )
 
-    return font.render(text, antialias, color)
+    return text_cache.render(font, text, antialias, color)
@@ -5,6 +5,7 @@ Modal window displayed when the game ends (victory or defeat).
 """
 import pygame
 from typing import Optional, Callable
+from .font_utils import render_text
 
 # Colors - matching bone/industrial theme
 COLOR_OVERLAY = (0, 0, 0, 200)  # Dark semi-transparent overlay
@@ -204,7 +205,7 @@ class GameOverWindow:
 
         # Title (Player X Victory)
         title_text = f"PLAYER {self.winner_player} VICTORY"
-        title_surface = self.font.render(title_text, True, winner_color)
+        title_surface = render_text(self.font, title_text, True, winner_color)
         screen.blit(title_surface, (text_x, text_y))
 
         # Winner and loser info - lay out sequentially, clipping if they would overflow
@@ -212,13 +213,13 @@ class GameOverWindow:
         score_y = text_y + (title_surface.get_height() - self.small_font.get_height()) // 2
 
         winner_text = f"{self.winner_name}: {self.winner_gp} GP"
-        winner_surface = self.small_font.render(winner_text, True, winner_color)
+        winner_surface = render_text(self.small_font, winner_text, True, winner_color)
         if score_x + winner_surface.get_width() <= text_max_x:
             screen.blit(winner_surface, (score_x, score_y))
             score_x += winner_surface.get_width() + 10
 
             loser_text = f"| {self.loser_name}: {self.loser_gp} GP"
-            loser_surface = self.small_font.render(loser_text, True, COLOR_TEXT_DIM)
+            loser_surface = render_text(self.small_font, loser_text, True, COLOR_TEXT_DIM)
             if score_x + loser_surface.get_width() <= text_max_x:
                 screen.blit(loser_surface, (score_x, score_y))
         button_y = bar_y + (scaled_bar_height - scaled_button_height) // 2
@@ -247,7 +248,7 @@ class GameOverWindow:
             border_color = COLOR_WINDOW_BORDER
         pygame.draw.rect(screen, border_color, details_button_rect, 2, border_radius=5)
         details_text = "Show Details (R)"
-        details_surface = self.small_font.render(details_text, True, COLOR_TEXT)
+        details_surface = render_text(self.small_font, details_text, True, COLOR_TEXT)
         details_text_x = button_x_start + (scaled_button_width - details_surface.get_width()) // 2
         details_text_y = button_y + (scaled_button_height - details_surface.get_height()) // 2
         screen.blit(details_surface, (details_text_x, details_text_y))
@@ -275,7 +276,7 @@ class GameOverWindow:
             border_color = COLOR_WINDOW_BORDER
         pygame.draw.rect(screen, border_color, menu_button_rect, 2, border_radius=5)
         menu_text = "Menu (M)"
-        menu_surface = self.small_font.render(menu_text, True, COLOR_TEXT)
+        menu_surface = render_text(self.small_font, menu_text, True, COLOR_TEXT)
         menu_text_x = menu_button_x + (scaled_button_width - menu_surface.get_width()) // 2
         menu_text_y = button_y + (scaled_button_height - menu_surface.get_height()) // 2
         screen.blit(menu_surface, (menu_text_x, menu_text_y))
@@ -303,7 +304,7 @@ class GameOverWindow:
             border_color = COLOR_WINDOW_BORDER
         pygame.draw.rect(screen, border_color, exit_button_rect, 2, border_radius=5)
         exit_text = "Exit (Q)"
-        exit_surface = self.small_font.render(exit_text, True, COLOR_TEXT)
+        exit_surface = render_text(self.small_font, exit_text, True, COLOR_TEXT)
         exit_text_x = exit_button_x + (scaled_button_width - exit_surface.get_width()) // 2
         exit_text_y = button_y + (scaled_button_height - exit_surface.get_height()) // 2
         screen.blit(exit_surface, (exit_text_x, exit_text_y))
@@ -343,7 +344,7 @@ class GameOverWindow:
 
         # Draw title text
         title_text = f"PLAYER {self.winner_player} VICTORY"
-        title_surface = self.large_font.render(title_text, True, title_color)
+        title_surface = render_text(self.large_font, title_text, True, title_color)
         title_x = window_x + (WINDOW_WIDTH - title_surface.get_width()) // 2
         title_y = window_y + (60 - title_surface.get_height()) // 2
         screen.blit(title_surface, (title_x, title_y))
@@ -354,14 +355,14 @@ class GameOverWindow:
         # Winner info - use player-specific color
         winner_color = COLOR_PLAYER1 if self.winner_player == 1 else COLOR_PLAYER2
         winner_text = f"{self.winner_name} wins with {self.winner_gp} GP!"
-        winner_surface = self.font.render(winner_text, True, winner_color)
+        winner_surface = render_text(self.font, winner_text, True, winner_color)
         winner_x = window_x + (WINDOW_WIDTH - winner_surface.get_width()) // 2
         screen.blit(winner_surface, (winner_x, content_y))
 
         # Loser info
         content_y += 40
         loser_text = f"{self.loser_name}: {self.loser_gp} GP"
-        loser_surface = self.small_font.render(loser_text, True, COLOR_TEXT_DIM)
+        loser_surface = render_text(self.small_font, loser_text, True, COLOR_TEXT_DIM)
         loser_x = window_x + (WINDOW_WIDTH - loser_surface.get_width()) // 2
         screen.blit(loser_surface, (loser_x, content_y))
 
@@ -399,7 +400,7 @@ class GameOverWindow:
         pygame.draw.rect(screen, border_color, minimize_button_rect, 2, border_radius=5)
 
         minimize_text = "Minimize (R)"
-        minimize_surface = self.small_font.render(minimize_text, True, COLOR_TEXT)
+        minimize_surface = render_text(self.small_font, minimize_text, True, COLOR_TEXT)
         minimize_text_x = minimize_button_x + (BUTTON_WIDTH - minimize_surface.get_width()) // 2
         minimize_text_y = button_y + (BUTTON_HEIGHT - minimize_surface.get_height()) // 2
         screen.blit(minimize_surface, (minimize_text_x, minimize_text_y))
@@ -428,7 +429,7 @@ class GameOverWindow:
         pygame.draw.rect(screen, border_color, menu_button_rect, 2, border_radius=5)
 
         menu_text = "Menu (M)"
-        menu_surface = self.small_font.render(menu_text, True, COLOR_TEXT)
+        menu_surface = render_text(self.small_font, menu_text, True, COLOR_TEXT)
         menu_text_x = menu_button_x + (BUTTON_WIDTH - menu_surface.get_width()) // 2
         menu_text_y = button_y + (BUTTON_HEIGHT - menu_surface.get_height()) // 2
         screen.blit(menu_surface, (menu_text_x, menu_text_y))
@@ -457,7 +458,7 @@ class GameOverWindow:
         pygame.draw.rect(screen, border_color, exit_button_rect, 2, border_radius=5)
 
         exit_text = "Exit (Q)"
-        exit_surface = self.small_font.render(exit_text, True, COLOR_TEXT)
+        exit_surface = render_text(self.small_font, exit_text, True, COLOR_TEXT)
         exit_text_x = exit_button_x + (BUTTON_WIDTH - exit_surface.get_width()) // 2
         exit_text_y = button_y + (BUTTON_HEIGHT - exit_surface.get_height()) // 2
         screen.blit(exit_surface, (exit_text_x, exit_text_y))
@@ -7,6 +7,7 @@ import pygame
 from typing import Optional, Dict, List, Tuple
 from boneglaive.utils.constants import UnitType
 from .scrollbar import Scrollbar
+from .font_utils import render_text
 from boneglaive.utils.paths import asset_path, load_svg
 
 # Colors
@@ -88,9 +89,7 @@ class HelpPage:
 
         for word in words:
             test_line = current_line + (" " if current_line else "") + word
-            test_surface = font.render(test_line, True, COLOR_TEXT)
-
-            if test_surface.get_width() <= max_width:
+            if font.size(test_line)[0] <= max_width:
                 current_line = test_line
             else:
                 if current_line:
@@ -310,11 +309,11 @@ class HelpPage:
         pygame.draw.rect(surface, (40, 44, 52), title_bar_rect)
         pygame.draw.line(surface, COLOR_BORDER, (panel_x, panel_y + 50), (panel_x + panel_width, panel_y + 50), 2)
 
-        title = self.font.render("UNIT HELP", True, COLOR_HEADING)
+        title = render_text(self.font, "UNIT HELP", True, COLOR_HEADING)
         surface.blit(title, (panel_x + 20, panel_y + 15))
 
         # Draw close instruction
-        close_text = self.small_font.render("[ESC] Close  [↑/↓] Scroll", True, COLOR_TEXT_DIM)
+        close_text = render_text(self.small_font, "[ESC] Close  [↑/↓] Scroll", True, COLOR_TEXT_DIM)
         surface.blit(close_text, (panel_x + panel_width - close_text.get_width() - 20, panel_y + 18))
 
         # Set up clipping region for scrollable content
@@ -2,6 +2,12 @@
 """
 Kaleidoscope Background for Main Menu
 Infinite scrolling grid of symmetrical patterns using game graphics.
+
+The pattern grid repeats every grid_cols x grid_rows cells, so it is
+composed once into a seamless tile and the scroll wraps that tile: each
+frame is two to four tile blits and one blit of the (equally static)
+vignette, instead of a copy and blit per visible icon and a vignette
+rebuilt from hundreds of rects.
 """
 import pygame
 import random
@@ -9,18 +15,19 @@ import os
 from typing import List, Tuple
 from boneglaive.utils.paths import asset_path, load_svg
 
+# Size of each grid cell (icons are drawn 10 px smaller)
+CELL_SIZE = 80
+
+# Opacity of the icons over the background colour
+ICON_ALPHA = 80
+
 
 class KaleidoscopeBackground:
     """Animated background with symmetrical scrolling icon patterns."""
 
     def __init__(self, width: int, height: int):
-        self.width = width
-        self.height = height
-
         # Grid settings
-        self.cell_size = 80  # Size of each grid cell
-        self.grid_cols = (width // self.cell_size) + 3  # Extra for scrolling
-        self.grid_rows = (height // self.cell_size) + 3
+        self.cell_size = CELL_SIZE  # Size of each grid cell
 
         # Scrolling offset
         self.scroll_x = 0
@@ -31,15 +38,32 @@ class KaleidoscopeBackground:
         # Load all available icons
         self.icons = self._load_icons()
 
+        # Background color (dark)
+        self.bg_color = (15, 10, 15)
+
+        self.width = 0
+        self.height = 0
+        self.resize(width, height)
+
+    def resize(self, width: int, height: int):
+        """Regenerate the pattern, its tile and the vignette for a new screen size."""
+        if (width, height) == (self.width, self.height):
+            return
+        self.width = width
+        self.height = height
+        self.grid_cols = (width // self.cell_size) + 3  # Extra for scrolling
+        self.grid_rows = (height // self.cell_size) + 3
+
         # Generate symmetrical pattern grid
         self.pattern_grid = self._generate_symmetrical_grid()
 
-        # Background color (dark)
-        self.bg_color = (15, 10, 15)
+        self.tile = self._build_tile()
+        self.vignette = self._build_vignette()
 
-    def _load_icons(self) -> List[pygame.Surface]:
-        """Load all unit, furniture, and skill icons."""
-        icons = []
+    @staticmethod
+    def icon_files() -> List[str]:
+        """Paths of the unit, furniture and skill icons, one per name (SVG preferred)."""
+        paths = []
 
         graphics_base = asset_path("graphics")
 
@@ -50,8 +74,6 @@ class KaleidoscopeBackground:
             "skill_icons",
         ]
 
-        icon_size = self.cell_size - 10
-
         for dir_name in icon_dirs:
             dir_path = os.path.join(graphics_base, dir_name)
             if os.path.exists(dir_path):
@@ -61,21 +83,35 @@ class KaleidoscopeBackground:
                     stem = filename.rsplit('.', 1)[0]
                     if stem in seen:
                         continue
-                    if filename.endswith('.svg'):
-                        seen.add(stem)
-                        filepath = os.path.join(dir_path, filename)
-                        icon = load_svg(filepath, icon_size, icon_size)
-                        if icon:
-                            icons.append(icon)
-                    elif filename.endswith('.png'):
+                    if filename.endswith('.svg') or filename.endswith('.png'):
                         seen.add(stem)
-                        filepath = os.path.join(dir_path, filename)
-                        try:
-                            icon = pygame.image.load(filepath)
-                            icon = pygame.transform.scale(icon, (icon_size, icon_size))
-                            icons.append(icon)
-                        except Exception:
-                            pass
+                        paths.append(os.path.join(dir_path, filename))
+        return paths
+
+    @classmethod
+    def svg_jobs(cls, cell_size: int = CELL_SIZE) -> List[Tuple[str, int, int]]:
+        """(path, width, height) of every SVG icon _load_icons() rasterizes."""
+        icon_size = cell_size - 10
+        return [(path, icon_size, icon_size) for path in cls.icon_files() if path.endswith('.svg')]
+
+    def _load_icons(self) -> List[pygame.Surface]:
+        """Load all unit, furniture, and skill icons."""
+        icons = []
+
+        icon_size = self.cell_size - 10
+
+        for filepath in self.icon_files():
+            if filepath.endswith('.svg'):
+                icon = load_svg(filepath, icon_size, icon_size)
+                if icon:
+                    icons.append(icon)
+            else:
+                try:
+                    icon = pygame.image.load(filepath)
+                    icon = pygame.transform.scale(icon, (icon_size, icon_size))
+                    icons.append(icon)
+                except Exception:
+                    pass
 
         # If no icons loaded, create placeholder patterns
         if not icons:
@@ -207,61 +243,45 @@ class KaleidoscopeBackground:
         self.scroll_y += self.scroll_speed_y * delta_time
 
         # Don't wrap - just keep accumulating for smooth infinite scroll
-        # The grid is large enough to handle wrapping visually
+        # draw() wraps the offset to the tile
 
-    def draw(self, surface: pygame.Surface):
-        """Draw the kaleidoscope background."""
-        # Fill background
-        surface.fill(self.bg_color)
-
-        # Calculate which cell we've scrolled to (for grid wrapping)
-        cell_offset_x = int(self.scroll_x // self.cell_size)
-        cell_offset_y = int(self.scroll_y // self.cell_size)
-
-        # Calculate position within current cell
-        pixel_offset_x = self.scroll_x % self.cell_size
-        pixel_offset_y = self.scroll_y % self.cell_size
-
-        # Draw enough tiles to cover screen with scrolling
-        start_col = -2
-        end_col = self.grid_cols + 1
-        start_row = -2
-        end_row = self.grid_rows + 1
-
-        for row in range(start_row, end_row):
-            for col in range(start_col, end_col):
-                # Calculate screen position
-                x = col * self.cell_size - pixel_offset_x
-                y = row * self.cell_size - pixel_offset_y
-
-                # Skip if off screen
-                if x + self.cell_size < 0 or x > self.width:
-                    continue
-                if y + self.cell_size < 0 or y > self.height:
-                    continue
-
-                # Wrap grid indices to create infinite tiling pattern
-                grid_col = (col + cell_offset_x) % self.grid_cols
-                grid_row = (row + cell_offset_y) % self.grid_rows
-
-                # Get icon from wrapped grid position
-                icon_idx, flip_h, flip_v = self.pattern_grid[grid_row][grid_col]
-                icon = self.icons[icon_idx]
+    def _build_tile(self) -> pygame.Surface:
+        """Compose one period of the pattern: every grid cell's icon over the background."""
+        tile = pygame.Surface((self.grid_cols * self.cell_size, self.grid_rows * self.cell_size))
+        if pygame.display.get_surface() is not None:
+            tile = tile.convert()
+        tile.fill(self.bg_color)
 
+        for row, grid_row in enumerate(self.pattern_grid):
+            for col, (icon_idx, flip_h, flip_v) in enumerate(grid_row):
                 # Draw with some transparency for subtle effect
-                icon_copy = icon.copy()
-                icon_copy.set_alpha(80)  # Semi-transparent
+                icon = self.icons[icon_idx].copy()
+                icon.set_alpha(ICON_ALPHA)
 
                 # Center icon in cell
-                icon_x = x + 5
-                icon_y = y + 5
-                surface.blit(icon_copy, (icon_x, icon_y))
+                tile.blit(icon, (col * self.cell_size + 5, row * self.cell_size + 5))
+        return tile
+
+    def draw(self, surface: pygame.Surface):
+        """Draw the kaleidoscope background."""
+        tile_width, tile_height = self.tile.get_size()
+
+        # The tile is at least a screen plus two cells across, so the wrapped
+        # scroll position needs at most one extra copy in each direction
+        offset_x = -(int(self.scroll_x) % tile_width)
+        offset_y = -(int(self.scroll_y) % tile_height)
+        for y in (offset_y, offset_y + tile_height):
+            if y >= self.height:
+                continue
+            for x in (offset_x, offset_x + tile_width):
+                if x < self.width:
+                    surface.blit(self.tile, (x, y))
 
         # Draw subtle vignette overlay
-        self._draw_vignette(surface)
+        surface.blit(self.vignette, (0, 0))
 
-    def _draw_vignette(self, surface: pygame.Surface):
-        """Draw dark vignette around edges."""
+    def _build_vignette(self) -> pygame.Surface:
+        """Dark vignette around the edges."""
         vignette = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
 
         # Dark gradient from edges to center
@@ -276,4 +296,6 @@ class KaleidoscopeBackground:
                 alpha = int((dist / max_dist) * 180)
                 pygame.draw.rect(vignette, (0, 0, 0, alpha), (x, y, 20, 20))
 
-        surface.blit(vignette, (0, 0))
+        if pygame.display.get_surface() is not None:
+            vignette = vignette.convert_alpha()
+        return vignette
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Loading Screen
+Progress bar shown while assets are rasterized at startup.
+"""
+import pygame
+from .menu_components import COLOR_BG_DARK, COLOR_BONE, COLOR_BORDER, COLOR_TEXT
+
+
+class LoadingScreen:
+    """Draws a centered label and progress bar straight to the display."""
+
+    def __init__(self, screen: pygame.Surface, font: pygame.font.Font):
+        self.screen = screen
+        self.font = font
+        self.shown = False
+
+    def draw(self, done: int, total: int, label: str) -> None:
+        """Draw progress and present it; also keeps the window responsive."""
+        # Keep the window responsive; queued input is left for the screen that loads next
+        pygame.event.pump()
+
+        width, height = self.screen.get_size()
+        self.screen.fill(COLOR_BG_DARK)
+
+        bar_width = max(200, width // 3)
+        bar_height = max(8, height // 60)
+        bar = pygame.Rect((width - bar_width) // 2, height // 2, bar_width, bar_height)
+        fraction = done / total if total else 1.0
+        pygame.draw.rect(self.screen, COLOR_BORDER, bar, 1)
+        pygame.draw.rect(self.screen, COLOR_BONE,
+                         (bar.x + 2, bar.y + 2, int((bar.width - 4) * fraction), bar.height - 4))
+
+        text = self.font.render(f"{label}... {done}/{total}", True, COLOR_TEXT)
+        self.screen.blit(text, text.get_rect(midbottom=(width // 2, bar.y - 10)))
+
+        pygame.display.flip()
+        self.shown = True
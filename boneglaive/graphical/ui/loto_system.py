@@ -5,7 +5,8 @@ Checks unit status effects to determine which actions are blocked.
 """
 from typing import Set
 import pygame
-from boneglaive.utils.paths import asset_path, load_svg
+from boneglaive.utils.paths import asset_path
+from boneglaive.graphical.asset_manager import asset_manager, LOTO_ICON_SIZE
 from boneglaive.utils.constants import UnitType
 
 
@@ -143,21 +144,21 @@ class LOTORenderer:
 
     def _load_icons(self):
         """Load LOTO SVG icons."""
-        icon_size = 64  # Base size for LOTO icons
+        icon_size = LOTO_ICON_SIZE  # Base size for LOTO icons
 
         chain_path = asset_path('graphics/ui/loto_chain.svg')
         lock_path = asset_path('graphics/ui/loto_lock.svg')
         tag_path = asset_path('graphics/ui/loto_tag.svg')
 
-        self.chain_icon = load_svg(chain_path, icon_size, icon_size)
+        self.chain_icon = asset_manager.surface(chain_path, icon_size, icon_size)
         if not self.chain_icon:
             self.chain_icon = self._create_fallback_chain()
 
-        self.lock_icon = load_svg(lock_path, icon_size, icon_size)
+        self.lock_icon = asset_manager.surface(lock_path, icon_size, icon_size)
         if not self.lock_icon:
             self.lock_icon = self._create_fallback_lock()
 
-        self.tag_icon = load_svg(tag_path, icon_size, icon_size)
+        self.tag_icon = asset_manager.surface(tag_path, icon_size, icon_size)
         if not self.tag_icon:
             self.tag_icon = self._create_fallback_tag()
 
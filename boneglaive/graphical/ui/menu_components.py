@@ -5,6 +5,7 @@ Core reusable components for the graphical menu system.
 """
 import pygame
 from typing import Optional, Callable, Tuple
+from .font_utils import render_text
 
 # Colors matching the bone/industrial theme
 COLOR_BG = (26, 26, 31)  # Dark background
@@ -213,11 +214,11 @@ class MenuPanel:
                            border_top_right_radius=self.corner_radius)
             surface.blit(title_surf, title_rect.topleft)
 
-            title_surface = font.render(self.title, True, COLOR_TITLE)
+            title_surface = render_text(font, self.title, True, COLOR_TITLE)
             title_text_rect = title_surface.get_rect(center=(title_rect.centerx, title_rect.centery))
 
             # Glow effect
-            glow_surface = font.render(self.title, True, COLOR_TITLE)
+            glow_surface = render_text(font, self.title, True, COLOR_TITLE)
             for offset in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
                 glow_rect = title_text_rect.copy()
                 glow_rect.x += offset[0]
@@ -380,14 +381,14 @@ class Button:
             surface.blit(scaled_image, (img_x, img_y))
 
             # Draw text to the right of image
-            text_surface = self.font.render(self.text, True, text_color)
+            text_surface = render_text(self.font, self.text, True, text_color)
             text_x = img_x + img_width + 15
             text_y = self.rect.centery
             text_rect = text_surface.get_rect(midleft=(text_x, text_y))
 
             # Text glow on hover
             if show_glow:
-                glow_surface = self.font.render(self.text, True, COLOR_BORDER_GLOW)
+                glow_surface = render_text(self.font, self.text, True, COLOR_BORDER_GLOW)
                 for offset in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
                     glow_rect = text_rect.copy()
                     glow_rect.x += offset[0]
@@ -397,12 +398,12 @@ class Button:
             surface.blit(text_surface, text_rect)
         else:
             # Draw text (left-aligned with glaive icon)
-            text_surface = self.font.render(self.text, True, text_color)
+            text_surface = render_text(self.font, self.text, True, text_color)
             text_rect = text_surface.get_rect(midleft=(self.rect.x + text_x_offset, self.rect.centery))
 
             # Text glow on hover
             if show_glow:
-                glow_surface = self.font.render(self.text, True, COLOR_BORDER_GLOW)
+                glow_surface = render_text(self.font, self.text, True, COLOR_BORDER_GLOW)
                 for offset in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
                     glow_rect = text_rect.copy()
                     glow_rect.x += offset[0]
@@ -487,7 +488,7 @@ class Slider:
         """Draw the slider."""
         # Draw label if provided
         if self.label and self.font:
-            label_surface = self.font.render(self.label, True, COLOR_TEXT)
+            label_surface = render_text(self.font, self.label, True, COLOR_TEXT)
             label_rect = label_surface.get_rect(midleft=(self.rect.x, self.rect.y - 20))
             surface.blit(label_surface, label_rect)
 
@@ -521,7 +522,7 @@ class Slider:
         if self.font:
             percentage = int(self.value * 100)
             value_text = f"{percentage}%"
-            value_surface = self.font.render(value_text, True, COLOR_TEXT)
+            value_surface = render_text(self.font, value_text, True, COLOR_TEXT)
             value_rect = value_surface.get_rect(midleft=(self.rect.right + 10, self.rect.centery))
             surface.blit(value_surface, value_rect)
 
@@ -589,7 +590,7 @@ class Checkbox:
             )
 
         # Draw label
-        label_surface = self.font.render(self.label, True, COLOR_TEXT)
+        label_surface = render_text(self.font, self.label, True, COLOR_TEXT)
         label_rect = label_surface.get_rect(midleft=(self.rect.right + 10, self.rect.centery))
         surface.blit(label_surface, label_rect)
 
@@ -607,6 +608,7 @@ class MenuScreen:
         self.buttons = []
         self.use_panel = True  # Whether to use a decorated panel
         self.panel = None  # Will be created if needed
+        self._cached_overlay = None  # Dimming overlay, rebuilt when the screen size changes
 
     def on_enter(self):
         """Called when screen becomes active."""
@@ -642,10 +644,13 @@ class MenuScreen:
         """Draw shared kaleidoscope background with dimmed overlay, or flat fill as fallback."""
         if hasattr(self, 'background') and self.background is not None:
             self.background.draw(surface)
-            overlay = pygame.Surface(
-                (surface.get_width(), surface.get_height()), pygame.SRCALPHA
-            )
-            overlay.fill((*BACKGROUND_DIM_COLOR, int(255 * (1.0 - BACKGROUND_DIM_ALPHA))))
+            overlay = self._cached_overlay
+            if overlay is None or overlay.get_size() != surface.get_size():
+                overlay = pygame.Surface(
+                    (surface.get_width(), surface.get_height()), pygame.SRCALPHA
+                )
+                overlay.fill((*BACKGROUND_DIM_COLOR, int(255 * (1.0 - BACKGROUND_DIM_ALPHA))))
+                self._cached_overlay = overlay
             surface.blit(overlay, (0, 0))
         else:
             surface.fill(COLOR_BG)
@@ -715,11 +720,11 @@ class MenuScreen:
 
     def _draw_title(self, surface: pygame.Surface):
         """Draw screen title (used when not using panel)."""
-        title_surface = self.large_font.render(self.title, True, COLOR_TITLE)
+        title_surface = render_text(self.large_font, self.title, True, COLOR_TITLE)
         title_rect = title_surface.get_rect(centerx=surface.get_width() // 2, top=40)
 
         # Title glow
-        glow_surface = self.large_font.render(self.title, True, COLOR_TITLE)
+        glow_surface = render_text(self.large_font, self.title, True, COLOR_TITLE)
         for offset in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
             glow_rect = title_rect.copy()
             glow_rect.x += offset[0]
@@ -817,7 +822,7 @@ class TextInputDialog:
         pygame.draw.rect(surface, COLOR_BORDER, dialog_rect, 2)
 
         # Draw prompt
-        prompt_surface = self.font.render(self.prompt, True, COLOR_TEXT)
+        prompt_surface = render_text(self.font, self.prompt, True, COLOR_TEXT)
         prompt_rect = prompt_surface.get_rect(centerx=width // 2, top=dialog_y + 30)
         surface.blit(prompt_surface, prompt_rect)
 
@@ -832,7 +837,7 @@ class TextInputDialog:
         pygame.draw.rect(surface, COLOR_BORDER, input_box_rect, 2)
 
         # Draw text
-        text_surface = self.font.render(self.text, True, COLOR_TEXT)
+        text_surface = render_text(self.font, self.text, True, COLOR_TEXT)
         text_rect = text_surface.get_rect(centery=input_box_y + input_box_height // 2, left=input_box_x + 10)
         surface.blit(text_surface, text_rect)
 
@@ -850,6 +855,6 @@ class TextInputDialog:
 
         # Draw instructions
         instructions = "(ENTER to confirm, ESC to cancel)"
-        instr_surface = self.font.render(instructions, True, (180, 180, 180))
+        instr_surface = render_text(self.font, instructions, True, (180, 180, 180))
         instr_rect = instr_surface.get_rect(centerx=width // 2, top=input_box_y + input_box_height + 20)
         surface.blit(instr_surface, instr_rect)
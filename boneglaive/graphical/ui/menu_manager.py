@@ -11,7 +11,9 @@ from .play_menu import PlaySubmenu, MapSelectionMenu
 from .settings_menu import SettingsSubmenu, DisplaySettingsScreen, SoundSettingsScreen, InterfaceSettingsScreen
 from .about_screen import AboutScreen
 from .how_to_play_screen import HowToPlayScreen
-from boneglaive.utils.config import ConfigManager
+from .font_utils import get_font, render_text
+from boneglaive.graphical.frame_scheduler import FrameScheduler
+from boneglaive.utils.config import get_config
 
 
 class MenuManager:
@@ -20,7 +22,7 @@ class MenuManager:
     """
 
     def __init__(self, screen_width: int = None, screen_height: int = None):
-        self.config = ConfigManager()
+        self.config = get_config()
 
         # Load resolution from config if not provided
         if screen_width is None or screen_height is None:
@@ -41,6 +43,9 @@ class MenuManager:
             self.screen = pygame.display.set_mode((screen_width, screen_height))
         pygame.display.set_caption("Boneglaive")
         self.clock = pygame.time.Clock()
+        self.frame_scheduler = FrameScheduler(self.clock, self.config.get('frame_rate_mode', 'adaptive'))
+        self.show_fps = self.config.get('show_fps', False)  # FPS, frame time and CPU counter
+        self.config.subscribe(self._on_config_change, keys=('show_fps',))
 
         # Fonts - scale with resolution
         font_scale = screen_height / 800.0
@@ -52,6 +57,10 @@ class MenuManager:
 
         # Shared kaleidoscope background for all menus (create once)
         from .kaleidoscope_background import KaleidoscopeBackground
+        from boneglaive.graphical.asset_prewarm import prewarm_with_loading_screen
+        # Rasterize its icons in parallel first; the backgrounds below then load from the cache
+        self.prewarm_report = prewarm_with_loading_screen(
+            self.screen, self.font, KaleidoscopeBackground.svg_jobs(), label="menu icons")
         self.shared_background = KaleidoscopeBackground(screen_width, screen_height)
 
         # Screen stack for navigation
@@ -168,9 +177,6 @@ class MenuManager:
 
     def _apply_display_settings(self):
         """Reinitialise the pygame display with settings just written to config."""
-        # Reload config from disk — DisplaySettingsScreen used its own ConfigManager
-        # instance to save, so self.config still holds the old values.
-        self.config = ConfigManager()
         new_width = self.config.get('window_width', 1280)
         new_height = self.config.get('window_height', 720)
         fullscreen = self.config.get('fullscreen', False)
@@ -184,10 +190,8 @@ class MenuManager:
         self.screen_width = new_width
         self.screen_height = new_height
 
-        # Refresh scale_manager and all module-level constants in UI files
-        from .scale_utils import scale_manager, refresh_all_module_constants
-        scale_manager.config = self.config
-        scale_manager.update_scale()
+        # Refresh module-level constants in UI files (scale_manager follows the config itself)
+        from .scale_utils import refresh_all_module_constants
         refresh_all_module_constants()
 
         # Rebuild fonts for new resolution
@@ -197,9 +201,8 @@ class MenuManager:
         self.font = pygame.font.Font(None, font_size)
         self.large_font = pygame.font.Font(None, large_font_size)
 
-        # Rebuild shared background at new size
-        from .kaleidoscope_background import KaleidoscopeBackground
-        self.shared_background = KaleidoscopeBackground(new_width, new_height)
+        # Regenerate shared background at new size
+        self.shared_background.resize(new_width, new_height)
 
         # Tear down the screen stack and restart from main menu so all
         # screens are recreated at the correct resolution.
@@ -207,8 +210,15 @@ class MenuManager:
             self.screen_stack.pop()
         self._push_screen(self._create_main_menu())
 
+    def _on_config_change(self, key: str, value):
+        """Follow settings changed elsewhere (or edited in the config file)."""
+        if key == 'show_fps':
+            self.show_fps = value
+
     def update(self, delta_time: float):
         """Update current screen."""
+        self.config.poll()
+
         # Get mouse state
         mouse_pos = pygame.mouse.get_pos()
         mouse_pressed = pygame.mouse.get_pressed()[0]  # Left button
@@ -234,20 +244,42 @@ class MenuManager:
         if self.text_input_dialog:
             self.text_input_dialog.draw(self.screen)
 
+        if self.show_fps:
+            self._draw_fps()
+
         # Update display
         pygame.display.flip()
 
+    def _draw_fps(self):
+        """Draw the FPS, frame time and CPU counter in the top-right corner."""
+        scheduler = self.frame_scheduler
+        fps_text = (f"FPS: {self.clock.get_fps():.1f}  Frame: {scheduler.frame_ms:.1f} ms"
+                    f"  CPU: {scheduler.cpu_ms:.1f} ms ({scheduler.cpu_percent:.0f}%)")
+        fps_surface = render_text(get_font(None, 24), fps_text, True, (100, 255, 100))
+        fps_x = self.screen_width - fps_surface.get_width() - 10
+        fps_y = 5
+        # Draw semi-transparent background
+        bg_surface = pygame.Surface((fps_surface.get_width() + 10, fps_surface.get_height() + 4))
+        bg_surface.set_alpha(180)
+        bg_surface.fill((20, 20, 20))
+        self.screen.blit(bg_surface, (fps_x - 5, fps_y - 2))
+        self.screen.blit(fps_surface, (fps_x, fps_y))
+
     def run(self):
         """Run the menu loop."""
+        scheduler = self.frame_scheduler
         while self.running:
-            delta_time = self.clock.tick(60) / 1000.0  # 60 FPS, convert to seconds
+            # The background always scrolls, so the menu runs at full rate
+            delta_time, _ = scheduler.wait(True)
+            scheduler.begin_frame()
 
             self.handle_events()
             self.update(delta_time)
             self.draw()
+            scheduler.end_frame(True, False)
 
         return self.result
 
     def cleanup(self):
         """Clean up pygame resources."""
-        pass
+        self.config.unsubscribe(self._on_config_change)
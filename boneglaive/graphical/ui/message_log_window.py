@@ -4,7 +4,7 @@ Expanded Message Log Window
 Full-screen scrollable message history viewer.
 """
 import pygame
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 
 # Colors - matching bone/industrial theme
 COLOR_BG_TOP = (42, 42, 47)  # Panel top
@@ -16,8 +16,6 @@ COLOR_TEXT_WARNING = (255, 255, 100)  # Yellow - warnings and debuffs
 COLOR_TEXT_DEATH = (150, 50, 50)  # Dark red - death messages
 COLOR_TEXT_WRETCH = (255, 100, 100)  # Bright red - wretch messages
 COLOR_TEXT_DOMINION = (255, 100, 255)  # Bright magenta - Dominion upgrade messages
-COLOR_TEXT_DAMAGE = (200, 100, 255)  # Magenta - damage numbers
-COLOR_TEXT_HEAL = (255, 255, 255)  # White - healing numbers
 COLOR_TEXT_PLAYER1 = (100, 255, 100)  # Green - Player 1 messages
 COLOR_TEXT_PLAYER2 = (100, 150, 255)  # Blue - Player 2 messages
 COLOR_SCROLLBAR = (80, 80, 80)
@@ -25,17 +23,14 @@ COLOR_SCROLLBAR_HANDLE = (120, 120, 120)
 
 # Import scaling utilities
 from .scale_utils import scale_manager
+from .font_utils import render_text
+from .text_layout import layout_message
 
 # Scale dimensions based on resolution
 LINE_HEIGHT = scale_manager.scale(20, 'y')
 PADDING = scale_manager.scale(20)
 SCROLLBAR_WIDTH = scale_manager.scale(12, 'x')
 
-# Pre-compile regex patterns for performance
-import re
-DAMAGE_PATTERN = re.compile(r'#DAMAGE_(\d+)#')
-HEAL_PATTERN = re.compile(r'#HEAL_(\d+)#')
-
 
 class MessageLogWindow:
     """Expanded message log window with full message history."""
@@ -45,12 +40,15 @@ class MessageLogWindow:
         self.small_font = small_font
         self.visible = False
         self.messages: List[Dict] = []
+        self.lines: List[Tuple[Dict, int]] = []  # (message, wrapped line index) for every line
         self.scroll_offset = 0  # Number of lines scrolled from bottom
         self.max_visible_lines = 30
 
-        # Cache overlay surface (only when visible)
+        # Cache overlay and window panel surfaces (only when visible)
         self._cached_overlay = None
         self._cached_overlay_size = None
+        self._cached_window = None
+        self._cached_window_size = None
 
     def show(self, messages: List[Dict]):
         """
@@ -61,14 +59,17 @@ class MessageLogWindow:
         """
         self.visible = True
         self.messages = messages.copy()
+        self.lines = [(msg, i) for msg in self.messages for i in range(len(msg['wrapped_lines']))]
         self.scroll_offset = 0  # Start at bottom
 
     def hide(self):
         """Hide the window."""
         self.visible = False
-        # Clear cached overlay to free memory when not visible
+        # Clear cached surfaces to free memory when not visible
         self._cached_overlay = None
         self._cached_overlay_size = None
+        self._cached_window = None
+        self._cached_window_size = None
 
     def handle_scroll(self, direction: int):
         """
@@ -77,14 +78,17 @@ class MessageLogWindow:
         Args:
             direction: -1 for up, 1 for down
         """
-        # Count total wrapped lines
-        total_lines = sum(len(msg['wrapped_lines']) for msg in self.messages)
+        total_lines = len(self.lines)
 
         if direction < 0:  # Scroll up
             self.scroll_offset = min(self.scroll_offset + 3, max(0, total_lines - self.max_visible_lines))
         else:  # Scroll down
             self.scroll_offset = max(0, self.scroll_offset - 3)
 
+    def _message_color(self, message: Dict) -> tuple:
+        """Get color for a message dict."""
+        return self._get_message_color(message['type'], message.get('player'), message['text'])
+
     def _get_message_color(self, msg_type: str, player: Optional[int], text: str = "") -> tuple:
         """Get color for message based on type, player, and content (matching message_log.py)."""
         # Content-based colors (highest priority - matches message_log.py)
@@ -154,14 +158,19 @@ class MessageLogWindow:
 
         surface.blit(self._cached_overlay, (0, 0))
 
-        # Draw window background with gradient
-        from .menu_components import draw_gradient_rect
-        window_rect = pygame.Rect(window_x, window_y, window_width, window_height)
-        draw_gradient_rect(surface, window_rect, COLOR_BG_TOP, COLOR_BG_BOTTOM)
-        pygame.draw.rect(surface, COLOR_BORDER, window_rect, 3, border_radius=8)
+        # Draw window background with gradient (cached)
+        if self._cached_window is None or self._cached_window_size != (window_width, window_height):
+            from .menu_components import draw_gradient_rect
+            self._cached_window = pygame.Surface((window_width, window_height))
+            temp_rect = pygame.Rect(0, 0, window_width, window_height)
+            draw_gradient_rect(self._cached_window, temp_rect, COLOR_BG_TOP, COLOR_BG_BOTTOM)
+            pygame.draw.rect(self._cached_window, COLOR_BORDER, temp_rect, 3, border_radius=8)
+            self._cached_window_size = (window_width, window_height)
+
+        surface.blit(self._cached_window, (window_x, window_y))
 
         # Draw title
-        title_text = self.font.render("Message Log (ESC to close, Arrow Keys to scroll)", True, (255, 255, 255))
+        title_text = render_text(self.font, "Message Log (ESC to close, Arrow Keys to scroll)", True, (255, 255, 255))
         title_x = window_x + (window_width - title_text.get_width()) // 2
         surface.blit(title_text, (title_x, window_y + PADDING))
 
@@ -174,79 +183,16 @@ class MessageLogWindow:
         content_width = window_width - PADDING * 2 - SCROLLBAR_WIDTH - scrollbar_margin
         self.max_visible_lines = content_height // LINE_HEIGHT
 
-        # Flatten all messages into lines with their colors
-        all_lines = []
-        for msg in self.messages:
-            color = self._get_message_color(msg['type'], msg.get('player'), msg['text'])
-            # Store original text for placeholder detection
-            for line in msg['wrapped_lines']:
-                all_lines.append({'text': line, 'color': color, 'original_text': msg['text']})
-
         # Calculate visible range (scroll from bottom)
-        total_lines = len(all_lines)
+        total_lines = len(self.lines)
         start_line = max(0, total_lines - self.max_visible_lines - self.scroll_offset)
         end_line = total_lines - self.scroll_offset
-        visible_lines = all_lines[start_line:end_line]
 
-        # Draw messages with special handling for damage/heal numbers
+        # Draw the visible lines; each message is laid out once, so this is one blit per line
         y = content_y
-
-        for line_data in visible_lines:
-            text = line_data['text']
-            color = line_data['color']
-
-            # Check for damage or heal number placeholders (using pre-compiled patterns)
-            damage_match = DAMAGE_PATTERN.search(text)
-            heal_match = HEAL_PATTERN.search(text)
-
-            pos_x = window_x + PADDING
-
-            if damage_match:
-                # Split text around damage number
-                damage_num = damage_match.group(1)
-                parts = text.split(f'#DAMAGE_{damage_num}#')
-
-                # First part (before damage)
-                if parts[0]:
-                    part_surface = self.small_font.render(parts[0], True, color)
-                    surface.blit(part_surface, (pos_x, y))
-                    pos_x += part_surface.get_width()
-
-                # Damage number in magenta
-                damage_surface = self.small_font.render(damage_num, True, COLOR_TEXT_DAMAGE)
-                surface.blit(damage_surface, (pos_x, y))
-                pos_x += damage_surface.get_width()
-
-                # Remaining part (after damage)
-                if len(parts) > 1 and parts[1]:
-                    remaining_surface = self.small_font.render(parts[1], True, color)
-                    surface.blit(remaining_surface, (pos_x, y))
-
-            elif heal_match:
-                # Split text around heal number
-                heal_num = heal_match.group(1)
-                parts = text.split(f'#HEAL_{heal_num}#')
-
-                # First part (before heal)
-                if parts[0]:
-                    part_surface = self.small_font.render(parts[0], True, color)
-                    surface.blit(part_surface, (pos_x, y))
-                    pos_x += part_surface.get_width()
-
-                # Heal number in white
-                heal_surface = self.small_font.render(heal_num, True, COLOR_TEXT_HEAL)
-                surface.blit(heal_surface, (pos_x, y))
-                pos_x += heal_surface.get_width()
-
-                # Remaining part (after heal)
-                if len(parts) > 1 and parts[1]:
-                    remaining_surface = self.small_font.render(parts[1], True, color)
-                    surface.blit(remaining_surface, (pos_x, y))
-
-            else:
-                # No special numbers, render normally
-                text_surface = self.small_font.render(text, True, color)
-                surface.blit(text_surface, (pos_x, y))
+        for msg, index in self.lines[start_line:end_line]:
+            line = layout_message(msg, self.small_font, content_width, self._message_color, wrapped=True)[index]
+            surface.blit(line, (window_x + PADDING, y))
 
             y += LINE_HEIGHT
 
@@ -273,6 +219,6 @@ class MessageLogWindow:
                            (scrollbar_x, handle_y, SCROLLBAR_WIDTH, handle_height))
 
         # Draw instructions at bottom
-        instructions = self.small_font.render("Use UP/DOWN arrows to scroll", True, (150, 150, 150))
+        instructions = render_text(self.small_font, "Use UP/DOWN arrows to scroll", True, (150, 150, 150))
         instr_x = window_x + (window_width - instructions.get_width()) // 2
         surface.blit(instructions, (instr_x, window_y + window_height - PADDING - 20))
@@ -9,7 +9,7 @@ from .menu_components import (
     MenuScreen, Button,     menu_button_width, menu_button_height, menu_button_spacing, menu_start_y,
     map_button_width, map_button_height
 )
-from boneglaive.utils.config import ConfigManager, GameMode
+from boneglaive.utils.config import GameMode, get_config
 from boneglaive.game.map import MapFactory
 from boneglaive.utils.paths import asset_path, load_svg
 
@@ -21,7 +21,7 @@ class PlaySubmenu(MenuScreen):
         super().__init__("Play Game", font, large_font)
         self.screen_width = screen_width
         self.screen_height = screen_height
-        self.config = ConfigManager()
+        self.config = get_config()
         self.background = shared_background
 
         button_w = menu_button_width(screen_width)
@@ -65,7 +65,7 @@ class MapSelectionMenu(MenuScreen):
         super().__init__("Select Map", font, large_font)
         self.screen_width = screen_width
         self.screen_height = screen_height
-        self.config = ConfigManager()
+        self.config = get_config()
         self.background = shared_background
 
         self.available_maps = MapFactory.list_available_maps()
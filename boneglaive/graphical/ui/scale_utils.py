@@ -3,7 +3,7 @@
 Scaling utilities for UI components
 Provides centralized scaling factors for all UI elements based on resolution.
 """
-from boneglaive.utils.config import ConfigManager
+from boneglaive.utils.config import get_config
 
 
 class ScaleManager:
@@ -15,9 +15,20 @@ class ScaleManager:
 
     def __init__(self):
         """Initialize scaling factors from current resolution."""
-        # Always create fresh config manager to get latest values
-        self.config = ConfigManager()
+        self.config = get_config()
         self.update_scale()
+        # Follow resolution changes
+        self.config.subscribe(self._on_config_change, keys=('window_width', 'window_height'))
+
+    def _on_config_change(self, key, value):
+        """Rescale when the resolution changes (once, even if both dimensions changed)."""
+        if (self.config.get('window_width', self.BASE_WIDTH),
+                self.config.get('window_height', self.BASE_HEIGHT)) != (self.screen_width, self.screen_height):
+            self.update_scale()
+
+    def cleanup(self):
+        """Stop following resolution changes."""
+        self.config.unsubscribe(self._on_config_change)
 
     def update_scale(self):
         """Update scaling factors based on current resolution in config."""
@@ -8,7 +8,7 @@ from typing import Optional
 from .menu_components import (
     MenuScreen, MenuPanel, Button, Slider, Checkbox,     menu_button_width, menu_button_height, menu_button_spacing, menu_start_y
 )
-from boneglaive.utils.config import ConfigManager
+from boneglaive.utils.config import get_config
 from boneglaive.graphical.sound_manager import get_sound_manager
 
 
@@ -59,7 +59,7 @@ class DisplaySettingsScreen(MenuScreen):
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.background = shared_background
-        self.config = ConfigManager()
+        self.config = get_config()
 
         self.resolutions = [
             (1280, 720), (1366, 768), (1480, 800),
@@ -118,9 +118,9 @@ class DisplaySettingsScreen(MenuScreen):
 
     def _apply_settings(self):
         current_res = self.resolutions[self.current_resolution_index]
-        self.config.set('window_width', current_res[0])
-        self.config.set('window_height', current_res[1])
-        self.config.set('fullscreen', self.fullscreen)
+        self.config.update({'window_width': current_res[0],
+                            'window_height': current_res[1],
+                            'fullscreen': self.fullscreen})
         self.config.save_config()
         self.original_resolution = current_res
         self.original_fullscreen = self.fullscreen
@@ -146,7 +146,7 @@ class InterfaceSettingsScreen(MenuScreen):
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.background = shared_background
-        self.config = ConfigManager()
+        self.config = get_config()
 
         current_layout = self.config.get('ui_layout', 'default')
         layout_label = self._get_layout_label(current_layout)
@@ -161,12 +161,17 @@ class InterfaceSettingsScreen(MenuScreen):
             start_x, start_y, button_w, button_h,
             f"UI Layout: {layout_label}", font, lambda: self._toggle_layout()
         )
-        self.back_button = Button(
+        self.profiler_button = Button(
             start_x, start_y + (button_h + spacing), button_w, button_h,
+            self._get_profiler_label(self.config.get('show_frame_profiler', False)), font,
+            lambda: self._toggle_profiler()
+        )
+        self.back_button = Button(
+            start_x, start_y + (button_h + spacing) * 2, button_w, button_h,
             "Back", font, lambda: self._set_action("back"), glaive_direction="left"
         )
 
-        self.buttons = [self.layout_button, self.back_button]
+        self.buttons = [self.layout_button, self.profiler_button, self.back_button]
         self._action_result = None
 
     def _get_layout_label(self, layout: str) -> str:
@@ -175,10 +180,19 @@ class InterfaceSettingsScreen(MenuScreen):
     def _toggle_layout(self):
         current_layout = self.config.get('ui_layout', 'default')
         new_layout = "reversed" if current_layout == "default" else "default"
-        setattr(self.config.config, 'ui_layout', new_layout)
+        self.config.set('ui_layout', new_layout)
         self.config.save_config()
         self.layout_button.text = f"UI Layout: {self._get_layout_label(new_layout)}"
 
+    def _get_profiler_label(self, enabled: bool) -> str:
+        return f"Frame Profiler: {'On' if enabled else 'Off'}"
+
+    def _toggle_profiler(self):
+        enabled = not self.config.get('show_frame_profiler', False)
+        self.config.set('show_frame_profiler', enabled)
+        self.config.save_config()
+        self.profiler_button.text = self._get_profiler_label(enabled)
+
     def _set_action(self, action: str):
         self._action_result = action
 
@@ -199,8 +213,8 @@ class SoundSettingsScreen(MenuScreen):
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.background = shared_background
-        self.config = ConfigManager()
-        self.sound_manager = get_sound_manager()
+        self.config = get_config()
+        self.sound_manager = get_sound_manager()  # Applies the settings below as they change
         self.use_panel = False
 
         current_volume = self.config.get('sfx_volume', 1.0)
@@ -249,16 +263,11 @@ class SoundSettingsScreen(MenuScreen):
     def _on_volume_change(self, value: float):
         self.config.set('sfx_volume', value)
         self.config.save_config()
-        self.sound_manager.set_volume("master", value)
 
     def _on_mute_change(self, muted: bool):
         audio_enabled = not muted
         self.config.set('audio_enabled', audio_enabled)
         self.config.save_config()
-        if audio_enabled:
-            self.sound_manager.enable()
-        else:
-            self.sound_manager.disable()
 
     def _set_action(self, action: str):
         self._action_result = action
@@ -14,6 +14,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 from boneglaive.utils.constants import UnitType, UNIT_DISPLAY_NAMES
 from boneglaive.game.recruitment import RECRUITMENT_ORDER
 from .scrollbar import Scrollbar
+from .font_utils import render_text
 
 # Colors
 COLOR_BG = (30, 34, 42)
@@ -548,9 +549,7 @@ class SetupUnitHelp:
 
         for word in words:
             test_line = ' '.join(current_line + [word])
-            test_surface = font.render(test_line, True, COLOR_TEXT)
-
-            if test_surface.get_width() <= max_width:
+            if font.size(test_line)[0] <= max_width:
                 current_line.append(word)
             else:
                 if current_line:
@@ -876,7 +875,7 @@ class SetupUnitHelp:
 
         if not self.unit_type:
             # Show "Click a unit" message
-            no_unit_text = self.font.render("Click a unit to view details", True, COLOR_TEXT_DIM)
+            no_unit_text = render_text(self.font, "Click a unit to view details", True, COLOR_TEXT_DIM)
             no_unit_rect = no_unit_text.get_rect(center=(x + width // 2, y + height // 2))
             screen.blit(no_unit_text, no_unit_rect)
             return panel_rect
@@ -888,7 +887,7 @@ class SetupUnitHelp:
                 # Check if full help data exists
                 if self.unit_type not in self.unit_help_data:
                     unit_name = self._get_unit_name(self.unit_type)
-                    error_text = self.small_font.render(f"No help data for {unit_name}", True, (255, 100, 100))
+                    error_text = render_text(self.small_font, f"No help data for {unit_name}", True, (255, 100, 100))
                     screen.blit(error_text, (x + 15, y + 15))
                     return panel_rect
                 self.content_surface = self._render_content(width)
@@ -896,7 +895,7 @@ class SetupUnitHelp:
                 # Check if simplified data exists
                 if self.unit_type not in self.simplified_info:
                     unit_name = self._get_unit_name(self.unit_type)
-                    error_text = self.small_font.render(f"No info for {unit_name}", True, (255, 100, 100))
+                    error_text = render_text(self.small_font, f"No info for {unit_name}", True, (255, 100, 100))
                     screen.blit(error_text, (x + 15, y + 15))
                     return panel_rect
                 self.content_surface = self._render_simplified_content(width)
@@ -919,7 +918,7 @@ class SetupUnitHelp:
             pygame.draw.rect(screen, (100, 150, 200), button_rect, 2, border_radius=5)
 
             # Button text
-            button_text = self.small_font.render("Advanced Details", True, COLOR_TEXT)
+            button_text = render_text(self.small_font, "Advanced Details", True, COLOR_TEXT)
             text_rect = button_text.get_rect(center=button_rect.center)
             screen.blit(button_text, text_rect)
 
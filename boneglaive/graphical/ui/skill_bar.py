@@ -7,7 +7,8 @@ import pygame
 from typing import Optional, List, Tuple, Dict
 from .font_utils import render_fitted_text
 from .loto_system import LOTORenderer
-from boneglaive.utils.paths import asset_path, load_svg
+from boneglaive.utils.paths import asset_path
+from boneglaive.graphical.asset_manager import asset_manager
 
 # Colors - matching bone/industrial theme from main menu
 COLOR_BG_TOP = (74, 74, 79)  # Metal gradient top
@@ -64,7 +65,7 @@ class SkillSlot:
 
         icon_path = asset_path(f"graphics/skill_icons/{skill_name}.svg")
 
-        icon_surface = load_svg(icon_path, SKILL_ICON_SIZE, SKILL_ICON_SIZE)
+        icon_surface = asset_manager.surface(icon_path, SKILL_ICON_SIZE, SKILL_ICON_SIZE)
         if icon_surface:
             self.icon_cache[skill_name] = icon_surface
         return icon_surface
@@ -357,6 +357,9 @@ class StatusEffectIcon:
             if trauma_debt > 0:
                 self.description += f" ({trauma_debt} damage stored)"
 
+        # Tooltip lines, wrapped on first hover (the description is fixed from here on)
+        self.description_lines: Optional[List[str]] = None
+
     def get_color(self) -> Tuple[int, int, int]:
         """Get color based on effect type."""
         if self.type == "buff":
@@ -501,8 +504,10 @@ class StatusEffectsPanel:
         if not self.hovered_effect:
             return
 
-        # Prepare text
-        desc_lines = self._wrap_text(self.hovered_effect.description, 40)
+        # Prepare text (wrapped once per effect, not every frame)
+        if self.hovered_effect.description_lines is None:
+            self.hovered_effect.description_lines = self._wrap_text(self.hovered_effect.description, 40)
+        desc_lines = self.hovered_effect.description_lines
 
         # Calculate tooltip size
         tooltip_width = PANEL_WIDTH
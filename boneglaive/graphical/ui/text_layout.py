@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Text Layout
+Laid-out message lines for the combat log and the message log window.
+
+Both widgets used to rebuild every visible message each frame: pick its
+colour from a long list of content checks, search it for #DAMAGE_n# and
+#HEAL_n# placeholders, split it and blit each part. A message never changes
+once logged, so layout_message() does that work once per message, font and
+width and stores the result in the message dict itself: one ready-to-blit
+surface per line, with the damage or heal number already highlighted.
+Drawing a message is then one blit per line, and a layout goes away with
+its message when the log drops it.
+"""
+import re
+from typing import Callable, Dict, List, Optional
+import pygame
+
+# Placeholders the message log puts around damage and heal numbers
+DAMAGE_PATTERN = re.compile(r'#DAMAGE_(\d+)#')
+HEAL_PATTERN = re.compile(r'#HEAL_(\d+)#')
+
+# Highlight colours for the numbers
+COLOR_TEXT_DAMAGE = (200, 100, 255)  # Magenta - damage numbers
+COLOR_TEXT_HEAL = (255, 255, 255)  # White - healing numbers
+
+
+def wrap_text(font: pygame.font.Font, text: str, max_width: int) -> List[str]:
+    """
+    Wrap text by words to fit within max_width pixels.
+
+    Words wider than a whole line are cut short with an ellipsis.
+
+    Args:
+        font: Font the text will be drawn with
+        text: Text to wrap
+        max_width: Maximum width in pixels
+
+    Returns:
+        List of wrapped lines
+    """
+    if not text:
+        return [""]
+
+    # If text fits on one line, return it
+    if font.size(text)[0] <= max_width:
+        return [text]
+
+    # Estimate characters per line for cutting overlong words (16px font: ~8 px per character)
+    approx_chars_per_line = max_width // 8
+
+    lines = []
+    current_line = ""
+    for word in text.split():
+        test_line = current_line + (" " if current_line else "") + word
+        if font.size(test_line)[0] <= max_width:
+            current_line = test_line
+        elif current_line:
+            # Word doesn't fit, start new line
+            lines.append(current_line)
+            current_line = word
+        else:
+            # Single word is too long, truncate it
+            lines.append(word[:approx_chars_per_line - 3] + "...")
+
+    if current_line:
+        lines.append(current_line)
+
+    return lines if lines else [""]
+
+
+def truncate_text(font: pygame.font.Font, text: str, max_width: int) -> str:
+    """Cut text short with an ellipsis so it fits within max_width pixels."""
+    if font.size(text)[0] <= max_width:
+        return text
+    while text and font.size(text + "...")[0] > max_width:
+        text = text[:-1]
+    return text + "..."
+
+
+def render_line(font: pygame.font.Font, text: str, color, max_width: Optional[int] = None) -> pygame.Surface:
+    """
+    One line of message text as a single surface.
+
+    A #DAMAGE_n# or #HEAL_n# placeholder is drawn as the bare number in its
+    highlight colour. Lines without one are cut to max_width (if given) with
+    an ellipsis; lines with one are drawn in full, as the log always has.
+    """
+    match = DAMAGE_PATTERN.search(text)
+    number_color = COLOR_TEXT_DAMAGE
+    if not match:
+        match = HEAL_PATTERN.search(text)
+        number_color = COLOR_TEXT_HEAL
+    if not match:
+        if max_width is not None:
+            text = truncate_text(font, text, max_width)
+        return font.render(text, True, color)
+
+    number = match.group(1)
+    parts = text.split(match.group(0))
+    segments = []
+    if parts[0]:
+        segments.append(font.render(parts[0], True, color))
+    segments.append(font.render(number, True, number_color))
+    if len(parts) > 1 and parts[1]:
+        segments.append(font.render(parts[1], True, color))
+
+    # Segments never overlap, so a MAX blend onto a cleared surface copies
+    # their pixels exactly and the line blits like the separate parts did
+    line = pygame.Surface((sum(s.get_width() for s in segments), max(s.get_height() for s in segments)),
+                          pygame.SRCALPHA)
+    x = 0
+    for segment in segments:
+        line.blit(segment, (x, 0), special_flags=pygame.BLEND_RGBA_MAX)
+        x += segment.get_width()
+    return line
+
+
+def layout_message(message: Dict, font: pygame.font.Font, max_width: int,
+                   color_for: Callable[[Dict], tuple], wrapped: bool = False) -> List[pygame.Surface]:
+    """
+    A message's rendered lines, laid out once and stored in the message.
+
+    Args:
+        message: Combat log message dict ('text', and 'wrapped_lines' when wrapped)
+        font: Font to draw with
+        max_width: Width the lines must fit (unwrapped lines are truncated to it)
+        color_for: Picks the message's colour; only called when laying out
+        wrapped: Lay out the message's wrapped lines instead of one truncated line
+
+    Returns:
+        One surface per line, top to bottom
+    """
+    layouts = message.get('layouts')
+    if layouts is None:
+        layouts = message['layouts'] = {}
+    key = (font, max_width, wrapped)
+    lines = layouts.get(key)
+    if lines is None:
+        color = color_for(message)
+        if wrapped:
+            lines = [render_line(font, text, color) for text in message['wrapped_lines']]
+        else:
+            lines = [render_line(font, message['text'], color, max_width)]
+        layouts[key] = lines
+    return lines
@@ -67,6 +67,10 @@ class TopBar:
         self.player1_name = game.get_player_name(1)
         self.player2_name = game.get_player_name(2)
 
+    def is_animating(self) -> bool:
+        """Whether the GP pulse is fading, so the bar changes every frame."""
+        return self.gp_pulse_time > 0 and time.time() - self.gp_pulse_time < 0.5
+
     def draw(self, surface: pygame.Surface, screen_width: int):
         """
         Draw the top bar.
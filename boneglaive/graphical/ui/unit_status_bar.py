@@ -7,7 +7,8 @@ import pygame
 from typing import List, Optional, Tuple, Dict
 from boneglaive.utils.constants import UNIT_SYMBOLS
 from .font_utils import render_fitted_text
-from boneglaive.utils.paths import asset_path, load_svg
+from boneglaive.utils.paths import asset_path
+from boneglaive.graphical.asset_manager import asset_manager
 
 # Colors - matching bone/industrial theme
 COLOR_BG_TOP = (42, 42, 47)  # Panel top
@@ -94,7 +95,7 @@ class UnitCard:
             unit_type_name = str(unit_type).split('.')[-1].lower()
             sprite_path = asset_path(f"graphics/units/{unit_type_name}.svg")
 
-            self.sprite_surface = load_svg(sprite_path, SPRITE_SIZE, SPRITE_SIZE)
+            self.sprite_surface = asset_manager.surface(sprite_path, SPRITE_SIZE, SPRITE_SIZE)
         except Exception as e:
             pass  # Sprite loading failed, will fall back to text-only
 
@@ -193,12 +193,9 @@ class GraphicalUIAdapter:
             if event.type == pygame.QUIT:
                 self.renderer.running = False
 
-        # Render one frame
+        # Render and present one frame
         self.renderer.draw()
 
-        # Update display
-        pygame.display.flip()
-
         # Wait
         time.sleep(duration * self.animation_speed)
 
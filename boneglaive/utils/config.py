@@ -2,13 +2,30 @@
 """
 Configuration management for the game.
 Handles loading/saving settings and provides defaults.
+
+get_config() returns the process-wide ConfigManager: the config file is
+read once and every later read comes from memory. set() notifies
+subscribers of the keys that changed, save_config() writes atomically
+after SAVE_DEBOUNCE_SECONDS without further saves (and at exit), and
+poll(), called from the main loops, reloads the file when it is edited
+outside the game.
 """
 
+import atexit
 import json
+import os
+import threading
+import time
 from dataclasses import asdict, dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Callable, Dict, List, Optional, Tuple
+
+# A save waits this long for further changes before writing (seconds)
+SAVE_DEBOUNCE_SECONDS = 0.5
+
+# poll() checks the config file for external edits at most this often (seconds)
+WATCH_INTERVAL_SECONDS = 1.0
 
 class GameMode(Enum):
     """Game mode options."""
@@ -23,6 +40,10 @@ class GameConfig:
     window_width: int = 800
     window_height: int = 600
     fullscreen: bool = False
+    frame_rate_mode: str = "adaptive"  # "adaptive", "fixed" (always 60 fps) or "benchmark" (uncapped)
+    show_fps: bool = False  # FPS and CPU-per-frame counter
+    show_frame_profiler: bool = False  # Per-stage frame timing overlay (F9 exports CSV)
+    verify_dirty_rects: bool = False  # Debug: check each partially repainted frame against a full redraw
     
     # Gameplay settings
     animation_speed: float = 1.0
@@ -35,6 +56,7 @@ class GameConfig:
 
     # AI settings
     ai_difficulty: str = "medium"  # easy, medium, hard
+    ai_weights_file: str = ""  # Tuned AIWeights JSON (boneglaive.ai.tuning --out); empty uses the defaults
     
     # Audio settings
     audio_enabled: bool = True
@@ -54,7 +76,12 @@ class GameConfig:
 class ConfigManager:
     """Manages loading, saving, and accessing game configuration."""
 
-    def __init__(self, config_path: Optional[str] = None):
+    def __init__(self, config_path: Optional[str] = None, save_delay: float = SAVE_DEBOUNCE_SECONDS):
+        """
+        Args:
+            config_path: User config file (default: config.json in the user config directory)
+            save_delay: Debounce for save_config(); 0 writes immediately
+        """
         from boneglaive.utils.paths import asset_path, user_config_dir
 
         # User config lives in a writable location (survives PyInstaller)
@@ -63,11 +90,20 @@ class ConfigManager:
         # Bundled default config (read-only inside _MEIPASS)
         self._default_config_path = Path(asset_path("config.json"))
 
+        self.save_delay = save_delay
+        self._subscribers: List[Tuple[Callable, Optional[frozenset]]] = []
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()  # A flush can race the debounce timer
+        self._save_timer: Optional[threading.Timer] = None
+        self._file_mtime = None  # mtime_ns of the user file as last read or written
+        self._next_watch = time.monotonic() + WATCH_INTERVAL_SECONDS
+
         self.config = GameConfig()
         self._load_config()
 
     def _load_config(self) -> None:
         """Load configuration: user file first, fall back to bundled default."""
+        self._file_mtime = self._user_file_mtime()
         for path in (self._user_config_path, self._default_config_path):
             try:
                 if path.exists():
@@ -80,21 +116,146 @@ class ConfigManager:
             except (json.JSONDecodeError, IOError):
                 pass
 
-    def save_config(self) -> None:
-        """Save current configuration to the user config file."""
+    def _user_file_mtime(self) -> Optional[int]:
         try:
-            self._user_config_path.parent.mkdir(parents=True, exist_ok=True)
-            config_dict = asdict(self.config)
-            with open(self._user_config_path, 'w') as f:
-                json.dump(config_dict, f, indent=2)
-        except IOError as e:
-            print(f"Error saving config: {e}")
-    
+            return os.stat(self._user_config_path).st_mtime_ns
+        except OSError:
+            return None
+
+    def save_config(self) -> None:
+        """Save the current configuration to the user config file once changes settle."""
+        if self.save_delay <= 0:
+            self._write()
+            return
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(self.save_delay, self._write)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def flush(self) -> None:
+        """Write a pending save now."""
+        with self._lock:
+            timer = self._save_timer
+            if timer is None:
+                return
+            timer.cancel()
+        self._write()
+
+    def _write(self) -> None:
+        """Write the configuration atomically: to a temporary file, then renamed over the old one."""
+        with self._write_lock:
+            with self._lock:
+                self._save_timer = None
+                config_dict = asdict(self.config)
+            temp_path = self._user_config_path.with_name(self._user_config_path.name + ".tmp")
+            try:
+                self._user_config_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(temp_path, 'w') as f:
+                    json.dump(config_dict, f, indent=2)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_path, self._user_config_path)
+                self._file_mtime = self._user_file_mtime()
+            except IOError as e:
+                print(f"Error saving config: {e}")
+
     def get(self, key: str, default=None):
         """Get a configuration value."""
         return getattr(self.config, key, default)
     
     def set(self, key: str, value) -> None:
-        """Set a configuration value."""
-        if hasattr(self.config, key):
-            setattr(self.config, key, value)
\ No newline at end of file
+        """Set a configuration value, notifying subscribers if it changed."""
+        self.update({key: value})
+
+    def update(self, values: Dict[str, object]) -> None:
+        """
+        Set several configuration values at once.
+
+        Subscribers are notified only after every value is set, so a listener
+        reacting to one key (say window_width) already sees the others
+        (window_height) and handles the change once.
+
+        Args:
+            values: Setting names and their new values; unknown names are ignored
+        """
+        changed = []
+        with self._lock:
+            for key, value in values.items():
+                if hasattr(self.config, key) and getattr(self.config, key) != value:
+                    setattr(self.config, key, value)
+                    changed.append(key)
+        self._notify(changed)
+
+    def subscribe(self, callback: Callable[[str, object], None], keys=None) -> None:
+        """
+        Call callback(key, value) whenever a setting changes.
+
+        Args:
+            callback: Receives each changed key and its new value
+            keys: Only report these keys (default: all)
+        """
+        self._subscribers.append((callback, frozenset(keys) if keys is not None else None))
+
+    def unsubscribe(self, callback: Callable[[str, object], None]) -> None:
+        """Stop calling a subscribed callback."""
+        self._subscribers = [entry for entry in self._subscribers if entry[0] != callback]
+
+    def _notify(self, keys: List[str]) -> None:
+        for callback, wanted in list(self._subscribers):
+            for key in keys:
+                if wanted is None or key in wanted:
+                    callback(key, getattr(self.config, key))
+
+    def poll(self) -> bool:
+        """
+        Reload the user config file if it was edited outside the game.
+
+        Cheap enough to call every frame: the file is only checked every
+        WATCH_INTERVAL_SECONDS. A pending save takes precedence over the edit.
+
+        Returns:
+            Whether any setting changed
+        """
+        now = time.monotonic()
+        if now < self._next_watch:
+            return False
+        self._next_watch = now + WATCH_INTERVAL_SECONDS
+        mtime = self._user_file_mtime()
+        if mtime is None or mtime == self._file_mtime or self._save_timer is not None:
+            return False
+        self._file_mtime = mtime
+        try:
+            with open(self._user_config_path, 'r') as f:
+                config_dict = json.load(f)
+        except (json.JSONDecodeError, IOError):
+            return False
+
+        changed = []
+        with self._lock:
+            for key, value in config_dict.items():
+                if hasattr(self.config, key) and getattr(self.config, key) != value:
+                    setattr(self.config, key, value)
+                    changed.append(key)
+        self._notify(changed)
+        return bool(changed)
+
+
+# Process-wide configuration (created on first use)
+_config_instance: Optional[ConfigManager] = None
+
+
+def get_config() -> ConfigManager:
+    """
+    Get the process-wide ConfigManager instance (singleton).
+
+    Returns:
+        ConfigManager instance
+    """
+    global _config_instance
+    if _config_instance is None:
+        _config_instance = ConfigManager()
+        # Write a pending debounced save before the process exits
+        atexit.register(_config_instance.flush)
+    return _config_instance
@@ -3,7 +3,9 @@
 Message log system for tracking and displaying game events and player messages.
 """
 
+import threading
 import time
+from contextlib import contextmanager
 from enum import Enum
 from typing import List, Dict, Optional, Tuple, Any
 
@@ -33,6 +35,7 @@ class MessageLog:
         self.filters: List[MessageType] = [MessageType.DEBUG]  # Always filter out DEBUG messages
         self.player_colors: Dict[int, int] = {1: 3, 2: 4}  # Player number to color mapping
         self.game_instance = None  # Reference to current game for PRT lookups
+        self._suppression = threading.local()  # Per-thread mute depth (see suppressed())
     
     def set_game_reference(self, game):
         """Set reference to game instance for PRT damage calculations."""
@@ -60,6 +63,10 @@ class MessageLog:
             target: Target player number for the message (optional)
             **kwargs: Additional data to store with the message
         """
+        # Hypothetical play (AI search on cloned games) must not leak into the log
+        if getattr(self._suppression, 'depth', 0):
+            return
+
         # Create message entry
         message = {
             'text': text,
@@ -404,6 +411,20 @@ class MessageLog:
         """Clear all message filters."""
         self.filters = []
     
+    @contextmanager
+    def suppressed(self):
+        """
+        Discard every message added by the current thread inside the block.
+
+        Used when resolving actions on a cloned game, so simulated combat never
+        reaches the player's log. Other threads keep logging normally.
+        """
+        self._suppression.depth = getattr(self._suppression, 'depth', 0) + 1
+        try:
+            yield
+        finally:
+            self._suppression.depth -= 1
+
     def clear_log(self) -> None:
         """Clear all messages from the log."""
         self.messages = []
@@ -6,7 +6,6 @@ Under a normal Python run, assets live relative to the project root.
 Under PyInstaller, files are unpacked to sys._MEIPASS at runtime.
 asset_path() resolves both cases transparently.
 """
-import os
 import sys
 from pathlib import Path
 
@@ -29,10 +28,71 @@ def asset_path(relative: str) -> str:
     return str(Path(base) / relative)
 
 
+def render_svg_pixels(svg_bytes: bytes, svg_path: str, width: int, height: int):
+    """
+    Rasterize SVG source to raw RGBA pixels with cairosvg, without the cache.
+
+    Needs no display, so it can run in worker processes and before the window exists.
+
+    Args:
+        svg_bytes: Contents of the .svg file
+        svg_path: Path of the .svg file (base for relative references)
+        width: Desired output width in pixels
+        height: Desired output height in pixels
+
+    Returns:
+        (RGBA bytes, (width, height)), or None if rasterizing failed
+    """
+    try:
+        import cairosvg
+        import pygame
+        from io import BytesIO
+        png_data = cairosvg.svg2png(bytestring=svg_bytes, url=svg_path,
+                                    output_width=width, output_height=height)
+        surface = pygame.image.load(BytesIO(png_data))
+        return pygame.image.tobytes(surface, 'RGBA'), surface.get_size()
+    except Exception:
+        return None
+
+
+def rasterize_svg(svg_path: str, width: int, height: int):
+    """
+    Rasterize an SVG to raw RGBA pixels, going through the on-disk raster cache.
+
+    Args:
+        svg_path: Absolute path to the .svg file
+        width: Desired output width in pixels
+        height: Desired output height in pixels
+
+    Returns:
+        (RGBA bytes, (width, height)), or None if loading failed
+    """
+    from boneglaive.utils.raster_cache import RasterCache, raster_cache
+
+    try:
+        with open(svg_path, 'rb') as f:
+            svg_bytes = f.read()
+    except OSError:
+        return None
+
+    key = RasterCache.key(svg_bytes, width, height)
+    cached = raster_cache.get(key)
+    if cached is not None:
+        return cached
+
+    raster = render_svg_pixels(svg_bytes, svg_path, width, height)
+    if raster is not None:
+        raster_cache.put(key, *raster)
+    return raster
+
+
 def load_svg(svg_path: str, width: int, height: int):
     """
     Load an SVG as a pygame Surface using cairosvg for full-fidelity rendering.
 
+    Rasterized pixels are cached on disk (see boneglaive.utils.raster_cache),
+    so each asset and size is only rasterized once per install.
+
     Args:
         svg_path: Absolute path to the .svg file
         width: Desired output width in pixels
@@ -43,13 +103,11 @@ def load_svg(svg_path: str, width: int, height: int):
     """
     import pygame
 
-    if os.path.exists(svg_path):
+    raster = rasterize_svg(svg_path, width, height)
+    if raster is not None:
         try:
-            import cairosvg
-            from io import BytesIO
-            png_data = cairosvg.svg2png(url=svg_path, output_width=width, output_height=height)
-            surface = pygame.image.load(BytesIO(png_data))
-            return surface.convert_alpha()
+            pixels, size = raster
+            return pygame.image.frombuffer(pixels, size, 'RGBA').convert_alpha()
         except Exception:
             pass
 
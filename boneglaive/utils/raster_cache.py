@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Raster Cache
+Keeps rasterized SVG assets on disk so cairosvg runs once per asset and size.
+
+Each entry is a raw RGBA pixel blob stored under user_config_dir()/raster_cache,
+named by a hash of the cache format version, the SVG's contents and the
+output size. A hit skips both cairosvg and PNG decoding: the blob goes straight
+into pygame.image.frombuffer().
+
+The key hashes the SVG's bytes rather than its path and mtime. PyInstaller
+one-file builds unpack assets to a new temporary directory with fresh mtimes on
+every launch, so a path/mtime key would never hit there. Hashing a few KB of
+SVG is negligible next to rasterizing it, and an edited SVG still gets a new key.
+
+Since every window size rasterizes a new set of blobs, the store is an LRU
+bounded by RASTER_CACHE_BUDGET_BYTES: a hit refreshes the entry's mtime, and
+writes evict the least recently used entries once the budget is exceeded.
+"""
+
+import hashlib
+import os
+import struct
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Tuple
+from boneglaive.utils.debug import logger
+
+# Bump when the blob layout or rasterization settings change; older entries are pruned
+CACHE_FORMAT_VERSION = 1
+
+# Disk space the cache may use before evicting the least recently used blobs (bytes)
+RASTER_CACHE_BUDGET_BYTES = 128 * 1024 * 1024
+
+# Prewarmed blobs held in memory awaiting their first get() (bytes); older ones are
+# dropped and read from disk instead
+RASTER_MEMORY_BUDGET_BYTES = 32 * 1024 * 1024
+
+# Blob header: magic, format version, width, height
+_MAGIC = b"BGRC"
+_HEADER = struct.Struct("<4sHII")
+
+
+class RasterCacheStats:
+    """Counts of cache lookups and writes."""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0     # Blobs deleted to stay within the disk budget
+        self.errors = 0        # Unreadable entries and failed writes
+
+    def summary(self) -> str:
+        return (f"{self.hits} hits, {self.misses} misses, {self.writes} writes, "
+                f"{self.evictions} evicted, {self.errors} errors")
+
+
+class RasterCache:
+    """Content-addressed LRU store of rasterized SVGs as RGBA blobs, bounded by disk use."""
+
+    def __init__(self, directory: Optional[Path] = None, enabled: bool = True,
+                 budget_bytes: int = RASTER_CACHE_BUDGET_BYTES,
+                 memory_budget_bytes: int = RASTER_MEMORY_BUDGET_BYTES):
+        """
+        Args:
+            directory: Where blobs are stored (default: user_config_dir()/raster_cache)
+            enabled: When False every lookup misses and nothing is written
+            budget_bytes: Disk use above which the least recently used blobs are deleted
+            memory_budget_bytes: Limit on prewarmed blobs held in memory
+        """
+        self._directory = Path(directory) if directory else None
+        self.enabled = enabled
+        self.budget_bytes = budget_bytes
+        self.memory_budget_bytes = memory_budget_bytes
+        self.stats = RasterCacheStats()
+        self._pruned = False
+        # key -> file size, least recently used first; built from the directory on first write
+        self._index: Optional[OrderedDict] = None
+        self.bytes = 0
+        # Blobs handed over by the startup prewarm, served once without a disk read
+        self._memory = OrderedDict()
+        self._memory_bytes = 0
+
+    @property
+    def directory(self) -> Path:
+        if self._directory is None:
+            from boneglaive.utils.paths import user_config_dir
+            self._directory = user_config_dir() / "raster_cache"
+        return self._directory
+
+    @staticmethod
+    def key(svg_bytes: bytes, width: int, height: int) -> str:
+        """Cache key for an SVG's contents rasterized at a size."""
+        digest = hashlib.sha1(svg_bytes)
+        digest.update(struct.pack("<II", width, height))
+        return f"v{CACHE_FORMAT_VERSION}-{digest.hexdigest()}"
+
+    def _entry_path(self, key: str) -> Path:
+        return self.directory / f"{key}.rgba"
+
+    def get(self, key: str) -> Optional[Tuple[bytes, Tuple[int, int]]]:
+        """
+        Look up a blob.
+
+        Returns:
+            (RGBA bytes, (width, height)), or None on a miss
+        """
+        if not self.enabled:
+            self.stats.misses += 1
+            return None
+        remembered = self._memory.pop(key, None)
+        if remembered is not None:
+            self._memory_bytes -= len(remembered[0])
+            self._touch(key)
+            self.stats.hits += 1
+            return remembered
+        path = self._entry_path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            self.stats.misses += 1
+            return None
+
+        if len(data) >= _HEADER.size:
+            magic, version, width, height = _HEADER.unpack_from(data)
+            pixels = data[_HEADER.size:]
+            if magic == _MAGIC and version == CACHE_FORMAT_VERSION and len(pixels) == width * height * 4:
+                self._touch(key)
+                self.stats.hits += 1
+                return pixels, (width, height)
+
+        # Truncated or foreign file: treat as a miss and let put() replace it
+        logger.debug(f"Discarding corrupt raster cache entry {key}")
+        self.stats.errors += 1
+        self.stats.misses += 1
+        return None
+
+    def contains(self, key: str) -> bool:
+        """Whether a blob is stored for key (checked without reading it)."""
+        return self.enabled and (key in self._memory or self._entry_path(key).exists())
+
+    def remember(self, key: str, pixels: bytes, size: Tuple[int, int]) -> None:
+        """Keep a blob in memory until its first get(), in addition to put() on disk."""
+        if not self.enabled:
+            return
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= len(previous[0])
+        self._memory[key] = (pixels, size)
+        self._memory_bytes += len(pixels)
+        while self._memory_bytes > self.memory_budget_bytes and self._memory:
+            _, (dropped, _) = self._memory.popitem(last=False)
+            self._memory_bytes -= len(dropped)
+
+    def put(self, key: str, pixels: bytes, size: Tuple[int, int]) -> None:
+        """Store a blob. Failures are logged and otherwise ignored."""
+        if not self.enabled:
+            return
+        width, height = size
+        path = self._entry_path(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._prune_stale()
+            with open(tmp_path, "wb") as f:
+                f.write(_HEADER.pack(_MAGIC, CACHE_FORMAT_VERSION, width, height))
+                f.write(pixels)
+            # Atomic, so a concurrent reader never sees half a blob
+            os.replace(tmp_path, path)
+            self.stats.writes += 1
+            self._track(key, _HEADER.size + len(pixels))
+        except OSError as e:
+            logger.debug(f"Could not write raster cache entry {key}: {e}")
+            self.stats.errors += 1
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+
+    def _prune_stale(self) -> None:
+        """Once per run, delete entries written by other cache format versions."""
+        if self._pruned:
+            return
+        self._pruned = True
+        prefix = f"v{CACHE_FORMAT_VERSION}-"
+        for entry in self.directory.glob("*.rgba"):
+            if not entry.name.startswith(prefix):
+                try:
+                    entry.unlink()
+                except OSError:
+                    pass
+
+    def _load_index(self) -> OrderedDict:
+        """The entries on disk, least recently used (oldest mtime) first."""
+        if self._index is None:
+            entries = []
+            for entry in self.directory.glob("*.rgba"):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, entry.stem, stat.st_size))
+            entries.sort()
+            self._index = OrderedDict((key, size) for _, key, size in entries)
+            self.bytes = sum(self._index.values())
+        return self._index
+
+    def _touch(self, key: str) -> None:
+        """Mark an entry as just used, in the index and (for later runs) in its mtime."""
+        if self._index is not None and key in self._index:
+            self._index.move_to_end(key)
+        try:
+            os.utime(self._entry_path(key))
+        except OSError:
+            pass
+
+    def _track(self, key: str, size: int) -> None:
+        """Record a written entry and evict the least recently used ones over budget."""
+        index = self._load_index()
+        self.bytes += size - index.pop(key, 0)
+        index[key] = size
+        while self.bytes > self.budget_bytes and len(index) > 1:
+            evicted, evicted_size = index.popitem(last=False)
+            self.bytes -= evicted_size
+            try:
+                self._entry_path(evicted).unlink()
+                self.stats.evictions += 1
+            except OSError:
+                pass
+
+    def clear(self) -> None:
+        """Delete every cached blob."""
+        self._memory.clear()
+        self._memory_bytes = 0
+        self._index = None
+        self.bytes = 0
+        for entry in self.directory.glob("*.rgba"):
+            try:
+                entry.unlink()
+            except OSError:
+                pass
+
+
+# Global cache used by load_svg()
+raster_cache = RasterCache()
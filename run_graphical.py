@@ -8,7 +8,9 @@ Usage:
 """
 import sys
 import os
+import time
 import argparse
+import multiprocessing
 
 # Ensure we can import boneglaive modules
 from pathlib import Path
@@ -22,7 +24,17 @@ sys.path.insert(0, str(script_dir))
 from boneglaive.graphical.ui import MenuManager
 from boneglaive.graphical.renderer import GraphicalRenderer
 from boneglaive.graphical.game_state import GameStateAdapter
-from boneglaive.utils.config import ConfigManager
+from boneglaive.utils.config import get_config
+from boneglaive.utils.debug import logger
+
+
+def log_startup_timing(stages):
+    """Log how long each startup stage took, plus asset prewarm details."""
+    parts = [f"{name} {seconds * 1000:.0f} ms" for name, seconds, _ in stages]
+    logger.info("Startup timing: " + ", ".join(parts))
+    for name, _, report in stages:
+        if report is not None:
+            logger.info(f"  {name}: {report.summary()}")
 
 
 def check_cairo():
@@ -68,7 +80,7 @@ def check_cairo():
 
 def run_game():
     """Run the game after menu configuration."""
-    config = ConfigManager()
+    config = get_config()
 
     # Get selected map from config
     selected_map = config.get('selected_map', 'hard_pressed')
@@ -78,7 +90,9 @@ def run_game():
 
     # Create renderer first (needed for AI animations)
     print("Initializing Boneglaive Graphical Renderer...")
+    start = time.perf_counter()
     renderer = GraphicalRenderer(adapter)
+    log_startup_timing([("renderer", time.perf_counter() - start, renderer.prewarm_report)])
 
     # Create UI adapter for animations
     from boneglaive.graphical.ui_adapter import GraphicalUIAdapter
@@ -147,18 +161,28 @@ def main():
     args = parser.parse_args()
 
     import pygame
+    start = time.perf_counter()
     pygame.init()
+    stages = [("pygame init", time.perf_counter() - start, None)]
+    start = time.perf_counter()
     check_cairo()
+    stages.append(("cairo check", time.perf_counter() - start, None))
 
     if args.skip_menu:
         # Skip menu, go directly to game
         print("Skipping menu...")
+        log_startup_timing(stages)
         run_game()
     else:
         # Show menu first
         while True:
             print("Starting Boneglaive Menu...")
+            start = time.perf_counter()
             menu_manager = MenuManager()
+            if stages:
+                stages.append(("menu", time.perf_counter() - start, menu_manager.prewarm_report))
+                log_startup_timing(stages)
+                stages = []
             result = menu_manager.run()
             menu_manager.cleanup()
 
@@ -179,4 +203,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Asset prewarm workers re-enter this script in frozen builds
+    multiprocessing.freeze_support()
     main()
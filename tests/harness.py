@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""Shared check harness for the script-style tests.
+
+Each test module imports this first, so the repository is importable and
+pygame runs headless before anything from boneglaive is loaded:
+
+    from harness import check, run_checks
+
+check() records a named result and raises AssertionError when it fails, so
+the same test functions fail properly under pytest. Run as a script, a module
+hands its test functions to run_checks(), which keeps going past a failing
+function and prints the PASS/FAIL report the other tests in this directory
+print.
+"""
+import os
+import sys
+import logging
+import traceback
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+logging.disable(logging.CRITICAL)
+
+results = []
+
+
+def check(name, cond, note=""):
+    """Record a named check; raise AssertionError if it failed."""
+    results.append((name, bool(cond), note))
+    if not cond:
+        raise AssertionError(f"{name}: {note}" if note else name)
+
+
+def run_checks(title, tests):
+    """
+    Run test functions and print their checks.
+
+    Args:
+        title: Report heading
+        tests: Test functions, run in order
+
+    Returns:
+        Process exit status: 0 if every check passed and no test raised
+    """
+    del results[:]
+    for test in tests:
+        try:
+            test()
+        except AssertionError:
+            pass  # Already recorded by check()
+        except Exception as e:
+            traceback.print_exc()
+            results.append((test.__name__, False, f"raised {type(e).__name__}: {e}"))
+
+    print(f"\n==== {title} ====")
+    allok = True
+    for name, ok, note in results:
+        allok &= ok
+        flag = "PASS" if ok else "FAIL"
+        line = f"  [{flag}] {name}"
+        if note:
+            line += f"  ({note})"
+        print(line)
+    print("==== " + ("ALL PASS" if allok else "SOME FAILED") + " ====")
+    return 0 if allok else 1
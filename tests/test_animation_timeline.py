@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""Animation timeline: boneglaive.graphical.animation_timeline.
+
+The renderer schedules skill animations and persistent zones on an
+AnimationTimeline. Covered here: track order, finished animations leaving a
+track that stays the same list object, animations scheduled from the
+after-update hook running the same frame, and per-class cost accounting.
+Scratch surfaces are reused from their slot, come back transparent, grow in
+bounded steps, and are released when the timeline drops their animation.
+
+Run with: SDL_VIDEODRIVER=dummy SDL_AUDIODRIVER=dummy python tests/test_animation_timeline.py
+"""
+import sys
+
+from harness import check, run_checks
+
+import pygame
+
+from boneglaive.graphical.animation_timeline import AnimationTimeline
+from boneglaive.graphical.animations.scratch_surfaces import ScratchSurfaces
+
+
+class Countdown:
+    """Animation stub that lives for a number of frames and records its draws."""
+
+    def __init__(self, label, frames, log):
+        self.label = label
+        self.frames = frames
+        self.log = log
+
+    def update(self, delta_time):
+        self.frames -= 1
+        return self.frames > 0
+
+    def draw(self, surface):
+        self.log.append(self.label)
+
+
+class Spark(Countdown):
+    pass
+
+
+# --------------------------------------------------------------------------- #
+# (a) Timeline
+# --------------------------------------------------------------------------- #
+def test_tracks():
+    log = []
+    timeline = AnimationTimeline()
+    active = timeline.track("active")
+    timeline.play(Countdown("zone", 3, log), track="background")
+    timeline.play(Countdown("short", 1, log))
+    active.append(Countdown("long", 2, log))
+    check("is_playing", timeline.is_playing() and timeline.is_playing("background"))
+
+    timeline.draw(None)
+    check("background_first", log == ["zone", "short", "long"], str(log))
+
+    timeline.update(0.016)
+    check("finished_dropped", [a.label for a in active] == ["long"])
+    check("track_same_list", timeline.track("active") is active)
+
+    seen = []
+
+    def after(animation, still_active):
+        seen.append((animation.label, still_active))
+        if animation.label == "long":
+            timeline.play(Spark("spark", 2, log))
+
+    timeline.update(0.016, after=after)
+    check("after_sees_result", seen[0] == ("long", False), str(seen))
+    check("appended_run_same_frame", [a.label for a in active] == ["spark"] and active[0].frames == 1
+          and seen[-1] == ("spark", True), str(seen))
+
+    timeline.clear()
+    check("clear", not timeline.is_playing() and not timeline.is_playing("background"))
+
+
+def test_costs():
+    timeline = AnimationTimeline()
+    for _ in range(2):
+        timeline.play(Countdown("c", 3, []))
+    timeline.play(Spark("s", 1, []))
+    for _ in range(3):
+        timeline.draw(None)
+        timeline.update(0.016)
+    countdown = timeline.costs["Countdown"]
+    spark = timeline.costs["Spark"]
+    check("update_counts", countdown.updates == 6 and spark.updates == 1)
+    check("draw_counts", countdown.draws == 6 and spark.draws == 1)
+    check("finished_counts", countdown.finished == 2 and spark.finished == 1)
+    check("totals", countdown.total_ms == countdown.update_ms + countdown.draw_ms and countdown.worst_ms >= 0)
+    summary = timeline.summary()
+    check("summary", summary.startswith("Animations: 2 kinds") and "Countdown:" in summary, summary.splitlines()[0])
+    check("summary_empty", AnimationTimeline().summary() == "Animations: none played")
+
+
+# --------------------------------------------------------------------------- #
+# (b) Scratch surfaces
+# --------------------------------------------------------------------------- #
+class Glow(Countdown):
+    """Animation stub that draws into a scratch surface and holds a child effect."""
+
+    def __init__(self, frames, child=None):
+        super().__init__("glow", frames, [])
+        self.scratch = ScratchSurfaces()
+        self.children = [child] if child is not None else []
+
+    def draw(self, surface):
+        glow = self.scratch.get("glow", (8, 8))
+        pygame.draw.circle(glow, (255, 255, 255, 128), (4, 4), 4)
+        surface.blit(glow, (0, 0))
+
+
+def test_scratch_slots():
+    scratch = ScratchSurfaces()
+    first = scratch.get("glow", (20, 10))
+    first.fill((255, 0, 0, 255))
+    second = scratch.get("glow", (12, 8))
+    check("slot_size", first.get_size() == (20, 10) and second.get_size() == (12, 8))
+    check("slot_shared", first.get_at((5, 5)) == (0, 0, 0, 0) and scratch.allocations == 1)
+    check("slot_cleared", second.get_at((5, 5)) == (0, 0, 0, 0) and second.get_flags() & pygame.SRCALPHA)
+
+    # A ring growing from 20 to 398 px reallocates in steps, not once per size
+    for radius in range(10, 200):
+        scratch.get("ring", (radius * 2, radius * 2))
+    ring = scratch.get("ring", (10, 10)).get_parent()
+    check("growth_bounded", scratch.allocations - 1 <= 10 and ring.get_width() < 398 * 1.5,
+          f"{scratch.allocations - 1} allocations, {ring.get_size()}")
+
+    scratch.reserve("flash", (160, 160))
+    allocations = scratch.allocations
+    for radius in range(40, 81):
+        scratch.get("flash", (radius * 2, radius * 2))
+    check("reserved_no_alloc", scratch.allocations == allocations and len(scratch) == 3)
+    check("empty_size", scratch.get("empty", (0, -3)).get_size() == (0, 0))
+
+    scratch.release()
+    check("release", len(scratch) == 0)
+
+
+def test_scratch_release():
+    from boneglaive.graphical.animations.grayman import PsychicWave
+
+    wave = PsychicWave(100, 100)
+    target = pygame.Surface((400, 400), pygame.SRCALPHA)
+    while wave.update(0.02):
+        wave.draw(target)
+    check("grayman_ring_reserved", wave.scratch.allocations == 1 and len(wave.scratch) == 1)
+
+    timeline = AnimationTimeline()
+    child = Glow(5)
+    parent = Glow(1, child)
+    timeline.play(parent)
+    timeline.play(Glow(5), track="background")
+    timeline.draw(target)
+    child.draw(target)
+    check("held_while_playing", len(parent.scratch) == 1 and len(child.scratch) == 1)
+    timeline.update(0.016)
+    check("released_on_drop", len(parent.scratch) == 0 and len(child.scratch) == 0)
+    background = timeline.track("background")[0]
+    timeline.clear()
+    check("released_on_clear", len(background.scratch) == 0)
+
+
+def main():
+    return run_checks("ANIMATION TIMELINE", [
+        test_tracks,
+        test_costs,
+        test_scratch_slots,
+        test_scratch_release,
+    ])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""Lazy asset loading with background prefetch: boneglaive.graphical.asset_manager.
+
+The renderer, unit animations, skill bar, unit status bar and LOTO overlays
+get their SVG surfaces from one AssetManager, which the renderer feeds with
+what the current game can show so a background thread loads it ahead of use.
+Hits, misses and hitches are counted; a prefetched asset reaches the render
+thread without a synchronous load; duplicate prefetches are dropped. A
+setup-phase game and a roster ask for the expected assets, and the renderer
+re-queues them only when the game, its terrain or its roster changes.
+
+Run with: SDL_VIDEODRIVER=dummy SDL_AUDIODRIVER=dummy python tests/test_asset_manager.py
+"""
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+from harness import check, run_checks
+
+import pygame
+
+from boneglaive.graphical import asset_manager as am
+from boneglaive.graphical.asset_manager import AssetManager
+from boneglaive.utils import raster_cache as rc
+from boneglaive.utils.raster_cache import RasterCache
+
+
+def warm_svgs(directory, count, size):
+    """count SVG files with their rasters already in the (swapped-in) global raster cache."""
+    paths = []
+    for i in range(count):
+        path = Path(directory) / f"asset_{i}.svg"
+        path.write_text(f'<svg xmlns="http://www.w3.org/2000/svg"><rect fill="#{i:02x}0000"/></svg>')
+        rc.raster_cache.put(RasterCache.key(path.read_bytes(), size, size),
+                            bytes((i, 0, 0, 255)) * (size * size), (size, size))
+        paths.append(str(path))
+    return paths
+
+
+class swapped_raster_cache:
+    """Point load_svg()/rasterize_svg() at a throwaway raster cache."""
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    def __enter__(self):
+        self.saved = rc.raster_cache
+        rc.raster_cache = RasterCache(Path(self.directory) / "cache")
+
+    def __exit__(self, *exc):
+        rc.raster_cache = self.saved
+
+
+# --------------------------------------------------------------------------- #
+# (a) Render-thread requests
+# --------------------------------------------------------------------------- #
+def test_hits_and_misses():
+    pygame.display.init()
+    pygame.display.set_mode((64, 64))
+    with tempfile.TemporaryDirectory() as tmp, swapped_raster_cache(tmp):
+        path, = warm_svgs(tmp, 1, 8)
+        manager = AssetManager()
+
+        first = manager.surface(path, 8, 8)
+        check("miss_loads", first is not None and first.get_size() == (8, 8) and manager.report.misses == 1)
+        second = manager.surface(path, 8, 8)
+        check("hit_shared", second is first and manager.report.hits == 1)
+
+        absent = manager.surface(str(Path(tmp) / "absent.svg"), 8, 8)
+        manager.surface(str(Path(tmp) / "absent.svg"), 8, 8)
+        check("missing_cached_as_none", absent is None and manager.report.misses == 2 and manager.report.hits == 2)
+
+        saved = am.HITCH_THRESHOLD_MS
+        am.HITCH_THRESHOLD_MS = -1.0
+        try:
+            manager.surface(path, 16, 16)
+        finally:
+            am.HITCH_THRESHOLD_MS = saved
+        check("slow_miss_is_hitch", manager.report.hitches == 1 and "16" in manager.report.worst_asset,
+              manager.report.summary())
+
+
+# --------------------------------------------------------------------------- #
+# (b) Background prefetch
+# --------------------------------------------------------------------------- #
+def test_prefetch():
+    with tempfile.TemporaryDirectory() as tmp, swapped_raster_cache(tmp):
+        paths = warm_svgs(tmp, 4, 8)
+        manager = AssetManager()
+        jobs = [(p, 8, 8) for p in paths]
+
+        queued = manager.prefetch(jobs + [(str(Path(tmp) / "absent.svg"), 8, 8)])
+        check("queued_existing_only", queued == 4)
+        check("drained", manager.wait_until_idle() and manager.report.background_loads == 4)
+        check("dedupe", manager.prefetch(jobs) == 0)
+
+        surfaces = [manager.surface(*job) for job in jobs]
+        check("served_prefetched", manager.report.prefetched == 4 and manager.report.misses == 0,
+              manager.report.summary())
+        check("pixels_intact", tuple(surfaces[3].get_at((0, 0))) == (3, 0, 0, 255))
+        manager.surface(*jobs[0])
+        check("then_hits", manager.report.hits == 1)
+
+
+# --------------------------------------------------------------------------- #
+# (c) What a game asks for
+# --------------------------------------------------------------------------- #
+def test_game_assets():
+    from boneglaive.game.engine import Game
+    from boneglaive.game.recruitment import RECRUITMENT_ORDER
+    from boneglaive.utils.constants import UnitType
+    from boneglaive.graphical.ui import skill_bar
+
+    manager = AssetManager()
+    sprite = manager.unit_sprite_path(UnitType.GLAIVEMAN)
+    svgs, sounds = manager.roster_assets([UnitType.GLAIVEMAN], 40)
+    check("roster_sprite", (sprite, 40, 40) in svgs)
+    icons = [k for k in svgs if "skill_icons" in k[0]]
+    check("roster_skill_icons", len(icons) == 3 and all(k[1] == skill_bar.SKILL_ICON_SIZE for k in icons),
+          str([os.path.basename(k[0]) for k in icons]))
+    check("roster_sounds", {"pry", "vault", "judgement", "autoclave"} <= set(sounds), str(sounds))
+    check("no_roster_no_statuses", manager.roster_assets([], 40) == ([], []))
+
+    game = Game(skip_setup=False)
+    terrain_paths = {terrain: f"/tiles/{terrain.name.lower()}.svg" for terrain in set(game.map.terrain.values())}
+    svgs, _ = manager.game_assets(game, terrain_paths, 40)
+    check("setup_all_sprites", all((manager.unit_sprite_path(t), 40, 40) in svgs for t in RECRUITMENT_ORDER))
+    check("map_tiles", all((path, 40, 40) in svgs for path in terrain_paths.values()))
+
+
+# --------------------------------------------------------------------------- #
+# (d) The renderer re-queues only when the game changes
+# --------------------------------------------------------------------------- #
+def test_renderer_prefetches_on_change():
+    from boneglaive.graphical.game_state import GameStateAdapter
+    from boneglaive.graphical.renderer import GraphicalRenderer
+    from boneglaive.utils.config import get_config
+    from boneglaive.utils.constants import UnitType
+
+    adapter = GameStateAdapter()
+    adapter.initialize_game(skip_setup=True)
+    renderer = GraphicalRenderer(adapter)
+    calls = []
+    shared = am.asset_manager
+    shared.prefetch_for_game = lambda game, *args: calls.append(game)
+    try:
+        for _ in range(3):
+            renderer.sync_units_from_game()
+        check("prefetch_once_while_idle", len(calls) == 1, str(len(calls)))
+
+        game = adapter.game
+        new_type = next(t for t in UnitType if t not in {unit.type for unit in game.units})
+        y, x = next((y, x) for y in range(game.map.height) for x in range(game.map.width)
+                    if game.map.can_place_unit(y, x) and game.get_unit_at(y, x) is None)
+        game.add_unit(new_type, 1, y, x)
+        renderer.sync_units_from_game()
+        renderer.sync_units_from_game()
+        check("prefetch_on_roster_change", len(calls) == 2, str(len(calls)))
+    finally:
+        del shared.prefetch_for_game
+        get_config().unsubscribe(renderer._on_config_change)
+
+
+def main():
+    return run_checks("ASSET MANAGER", [
+        test_hits_and_misses,
+        test_prefetch,
+        test_game_assets,
+        test_renderer_prefetches_on_change,
+    ])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
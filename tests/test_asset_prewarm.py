@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Parallel SVG prewarm at startup: boneglaive.graphical.asset_prewarm.
+
+Before the menu and the board load their SVGs, prewarm() rasterizes the ones
+missing from the raster cache across a process pool. Cached, duplicate and
+missing jobs are skipped; progress runs from the cached count to the total;
+large batches go through the pool while small ones stay in-process; the
+rasterized buffers land in the cache; a warm cache never shows the loading
+screen.
+
+Run with: SDL_VIDEODRIVER=dummy SDL_AUDIODRIVER=dummy python tests/test_asset_prewarm.py
+"""
+import sys
+import tempfile
+from pathlib import Path
+
+from harness import check, run_checks
+
+import pygame
+
+from boneglaive.graphical import asset_prewarm
+from boneglaive.graphical.asset_prewarm import prewarm, prewarm_with_loading_screen
+from boneglaive.utils import raster_cache as rc
+from boneglaive.utils.raster_cache import RasterCache
+
+
+def write_svgs(directory, count):
+    """count distinct small SVG files; returns their paths."""
+    paths = []
+    for i in range(count):
+        path = Path(directory) / f"icon_{i}.svg"
+        path.write_text(f'<svg xmlns="http://www.w3.org/2000/svg" width="8" height="8">'
+                        f'<rect width="8" height="8" fill="#{i:02x}0000"/></svg>')
+        paths.append(str(path))
+    return paths
+
+
+def warm(cache, path, size):
+    """Store a blob for path at size, as a previous run would have."""
+    svg_bytes = Path(path).read_bytes()
+    cache.put(RasterCache.key(svg_bytes, size, size), bytes(size * size * 4), (size, size))
+
+
+# --------------------------------------------------------------------------- #
+# (a) Job bookkeeping
+# --------------------------------------------------------------------------- #
+def test_skips_and_progress():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = RasterCache(Path(tmp) / "cache")
+        paths = write_svgs(tmp, 3)
+        warm(cache, paths[0], 16)
+        warm(cache, paths[1], 16)
+
+        jobs = [(p, 16, 16) for p in paths] + [(paths[2], 16, 16), (str(Path(tmp) / "absent.svg"), 16, 16)]
+        calls = []
+        buffers, report = prewarm(jobs, workers=0, cache=cache, progress=lambda d, t: calls.append((d, t)))
+        check("total_deduped", report.total == 3 and report.cached == 2, report.summary())
+        check("miss_handled", report.rasterized + report.failed == 1 and report.workers == 0)
+        check("progress_from_cached", calls[0] == (2, 3) and calls[-1] == (3, 3), str(calls))
+        check("buffers_match_report", len(buffers) == report.rasterized)
+        if report.rasterized:
+            check("rasterized_cached", cache.contains(RasterCache.key(Path(paths[2]).read_bytes(), 16, 16)))
+
+        _, report = prewarm([(p, 32, 32) for p in paths[:2]], workers=0, cache=cache)
+        check("size_is_part_of_key", report.cached == 0)
+
+
+def test_pool_for_large_batches():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = RasterCache(Path(tmp) / "cache")
+        count = asset_prewarm.PARALLEL_THRESHOLD + 2
+        jobs = [(p, 12, 12) for p in write_svgs(tmp, count)]
+
+        done = []
+        _, report = prewarm(jobs, workers=2, cache=cache, progress=lambda d, t: done.append(d))
+        check("pool_used", report.workers == 2, report.summary())
+        check("pool_all_done", report.rasterized + report.failed == count and done[-1] == count)
+        check("pool_timed", report.seconds > 0)
+
+        # Whatever rasterized is now cached; a rerun only repeats the failures
+        _, rerun = prewarm(jobs, workers=2, cache=cache)
+        check("rerun_cached", rerun.cached == report.rasterized, rerun.summary())
+
+        _, small = prewarm(jobs[:asset_prewarm.PARALLEL_THRESHOLD - 1], workers=4,
+                           cache=RasterCache(Path(tmp) / "other"))
+        check("small_batch_in_process", small.workers == 0)
+
+
+# --------------------------------------------------------------------------- #
+# (b) Loading screen
+# --------------------------------------------------------------------------- #
+def test_loading_screen():
+    from boneglaive.graphical.ui.loading_screen import LoadingScreen
+    from boneglaive.graphical.ui.menu_components import COLOR_BONE
+
+    pygame.init()
+    screen = pygame.display.set_mode((320, 200))
+    font = pygame.font.Font(None, 20)
+
+    loading = LoadingScreen(screen, font)
+    loading.draw(1, 2, "Preparing icons")
+    bar_y = 100 + max(8, 200 // 60) // 2
+    check("bar_drawn", loading.shown and tuple(screen.get_at((110, bar_y)))[:3] == COLOR_BONE)
+    check("bar_half", tuple(screen.get_at((210, bar_y)))[:3] != COLOR_BONE)
+
+    saved = rc.raster_cache
+    with tempfile.TemporaryDirectory() as tmp:
+        rc.raster_cache = RasterCache(Path(tmp) / "cache")
+        try:
+            paths = write_svgs(tmp, 2)
+            for path in paths:
+                warm(rc.raster_cache, path, 16)
+            screen.fill((1, 2, 3))
+            report = prewarm_with_loading_screen(screen, font, [(p, 16, 16) for p in paths], label="icons")
+            check("warm_cache_no_loading_screen", report.cached == 2
+                  and tuple(screen.get_at((0, 0)))[:3] == (1, 2, 3), report.summary())
+        finally:
+            rc.raster_cache = saved
+
+
+def main():
+    return run_checks("ASSET PREWARM", [
+        test_skips_and_progress,
+        test_pool_for_large_batches,
+        test_loading_screen,
+    ])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
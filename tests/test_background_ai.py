@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""Background AI turns: think on a worker thread against a clone, apply on the main thread.
+
+The renderer starts a BackgroundTurn through AIInterface, keeps drawing while the worker
+runs, then applies the decision. The live game must stay untouched while the worker runs,
+and applying the decision must queue exactly what a synchronous SmartAI.process_turn()
+would have queued.
+
+Run with: SDL_VIDEODRIVER=dummy SDL_AUDIODRIVER=dummy python tests/test_background_ai.py
+"""
+import sys
+import time
+import random
+
+from harness import check, run_checks
+
+from boneglaive.game.engine import Game
+from boneglaive.utils.message_log import message_log
+from boneglaive.ai.smart_ai import SmartAI
+from boneglaive.ai.background import BackgroundTurn
+from boneglaive.ai.ai_interface import AIInterface
+
+
+MAPS = ("lime_foyer", "stained_stones", "hard_pressed", "verdant_terrace")
+
+
+def ai_game(map_name, seed):
+    random.seed(seed)
+    g = Game(skip_setup=True, map_name=map_name)
+    g.current_player = 2
+    return g
+
+
+def queued(g):
+    return [(u.y, u.x, u.move_target, u.attack_target, u.skill_target,
+             getattr(u.selected_skill, 'name', None),
+             tuple(s.current_cooldown for s in u.active_skills)) for u in g.units]
+
+
+# ---------------------------------------------------------------------------
+# (a) Background decision == synchronous decision, on every map.
+# ---------------------------------------------------------------------------
+def test_background_matches_synchronous():
+    mismatches = []
+    for map_name in MAPS:
+        for seed in range(2):
+            sync_game = ai_game(map_name, seed)
+            random.seed(99)
+            SmartAI(sync_game).process_turn()
+
+            bg_game = ai_game(map_name, seed)
+            random.seed(99)
+            BackgroundTurn(SmartAI(bg_game)).start().apply()
+
+            if queued(sync_game) != queued(bg_game):
+                mismatches.append((map_name, seed))
+    check("background_matches_synchronous", not mismatches, f"mismatches={mismatches}")
+
+
+# ---------------------------------------------------------------------------
+# (b) The worker never touches the live game or its message log.
+# ---------------------------------------------------------------------------
+def test_worker_leaves_live_game_alone():
+    g = ai_game("stained_stones", 0)
+    before = queued(g)
+    log_len = len(message_log.messages)
+    turn = BackgroundTurn(SmartAI(g)).start()
+    check("worker_finishes", turn.wait(30.0), "worker joined")
+    check("worker_live_state_untouched", queued(g) == before, "no targets/cooldowns before apply")
+    check("worker_log_untouched", len(message_log.messages) == log_len,
+          f"log grew by {len(message_log.messages) - log_len}")
+    check("worker_decision_live_units",
+          turn.decision is not None and all(u in g.units for u, _ in turn.decision.steps),
+          "decision references live units")
+
+    # The worker and its searches draw from their own seeded generators, never
+    # the global stream the main thread's animations use
+    g = ai_game("stained_stones", 0)
+    random.seed(7)
+    state = random.getstate()
+    turn = BackgroundTurn(SmartAI(g))
+    check("worker_own_rng", isinstance(turn._state.rng, random.Random))
+    turn.start().wait(30.0)
+    check("worker_global_random_untouched", random.getstate() == state)
+
+
+# ---------------------------------------------------------------------------
+# (c) AIInterface drives the start / poll / finish cycle the renderer uses,
+#     and the main thread keeps getting time slices while the worker thinks.
+# ---------------------------------------------------------------------------
+def test_interface_cycle_keeps_main_thread_ticking():
+    g = ai_game("hard_pressed", 1)
+    ai = AIInterface()
+    ai.initialize(g)
+    check("interface_started", ai.start_background_turn(), "worker started")
+
+    frames = 0
+    while not ai.background_turn_ready():
+        time.sleep(1 / 60)  # stand-in for clock.tick(60) + draw
+        frames += 1
+    check("interface_finished", ai.finish_background_turn() is True, "plan queued")
+    queued_units = sum(1 for u in g.units if u.player == 2 and
+                       (u.move_target or u.attack_target or u.skill_target))
+    check("interface_queued_actions", queued_units > 0, f"queued={queued_units} frames={frames}")
+    check("interface_ready_when_idle", ai.background_turn_ready(), "no turn pending")
+
+
+def main():
+    return run_checks("BACKGROUND AI", [
+        test_background_matches_synchronous,
+        test_worker_leaves_live_game_alone,
+        test_interface_cycle_keeps_main_thread_ticking,
+    ])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""Incremental BattlefieldAnalysis updates must match a full rebuild.
+
+BattlefieldAnalyzer.update() patches an existing analysis after units move, take damage
+or die, recomputing only the threat footprints that can have changed. Whatever it skips,
+the result has to be indistinguishable from analyze() on the same board — otherwise the
+turn planner would score later units against a subtly wrong threat map.
+
+Run with: SDL_VIDEODRIVER=dummy SDL_AUDIODRIVER=dummy python tests/test_battlefield_analysis_update.py
+"""
+import sys
+import random
+
+from harness import check, run_checks
+
+from boneglaive.game.engine import Game
+from boneglaive.utils.constants import HEIGHT, WIDTH
+from boneglaive.ai.battlefield_analyzer import BattlefieldAnalyzer
+
+
+AI_PLAYER = 2
+MAPS = ("lime_foyer", "stained_stones", "hard_pressed", "verdant_terrace")
+
+
+def free_tiles(g):
+    return [(y, x) for y in range(HEIGHT) for x in range(WIDTH)
+            if g.map.can_place_unit(y, x) and g.get_unit_at(y, x) is None]
+
+
+def signature(a):
+    """Everything the AI reads from an analysis, in comparable form."""
+    threat = {pos: (zone.threat_level, sorted(id(u) for u in zone.threatening_units))
+              for pos, zone in a.threat_map.items()}
+    return (threat,
+            [id(u) for u in a.ai_units], [id(u) for u in a.enemy_units],
+            [(id(u), round(s, 6)) for u, s in a.priority_targets],
+            [(id(u), round(s, 6)) for u, s in a.vulnerable_allies],
+            a.ai_total_hp, a.enemy_total_hp,
+            round(a.ai_avg_hp_percent, 6), round(a.enemy_avg_hp_percent, 6),
+            round(a.ai_center_control, 6), a.gp_difference)
+
+
+# ---------------------------------------------------------------------------
+# (a) Random moves, hits and kills: update() == analyze() after every change.
+# ---------------------------------------------------------------------------
+def test_update_matches_rebuild():
+    mismatches = []
+    for map_name in MAPS:
+        for seed in range(8):
+            rnd = random.Random(seed)
+            random.seed(seed)  # Game() places its units from the global random stream
+            g = Game(skip_setup=True, map_name=map_name)
+            analyzer = BattlefieldAnalyzer(g, AI_PLAYER)
+            analysis = analyzer.analyze()
+            for step in range(6):
+                if not g.units:
+                    break
+                unit = rnd.choice(g.units)
+                if rnd.random() < 0.6:
+                    g._relocate_unit(unit, *rnd.choice(free_tiles(g)))
+                else:
+                    unit.hp = max(0, unit.hp - rnd.randint(1, 30))
+                analyzer.update(analysis)
+                if signature(analysis) != signature(analyzer.analyze()):
+                    mismatches.append((map_name, seed, step))
+    check("update_matches_rebuild", not mismatches, f"mismatches={mismatches[:3]}")
+
+
+# ---------------------------------------------------------------------------
+# (b) No change -> no work; the analysis object is returned untouched.
+# ---------------------------------------------------------------------------
+def test_update_without_changes_is_noop():
+    random.seed(0)
+    g = Game(skip_setup=True, map_name="lime_foyer")
+    analyzer = BattlefieldAnalyzer(g, AI_PLAYER)
+    analysis = analyzer.analyze()
+    zones = dict(analysis.threat_map)
+    analyzer.update(analysis)
+    check("noop_keeps_zones", all(analysis.threat_map[p] is z for p, z in zones.items())
+          and len(zones) == len(analysis.threat_map), "zones untouched")
+
+
+# ---------------------------------------------------------------------------
+# (c) copy(memo) follows a Game.clone: updates on the copy track the clone and
+#     leave the original analysis alone.
+# ---------------------------------------------------------------------------
+def test_copy_follows_clone():
+    random.seed(0)
+    g = Game(skip_setup=True, map_name="stained_stones")
+    analysis = BattlefieldAnalyzer(g, AI_PLAYER).analyze()
+    before = signature(analysis)
+
+    memo = {}
+    clone = g.clone(memo)
+    copied = analysis.copy(memo)
+    check("copy_units_translated", all(u._game is clone for u in copied.enemy_units + copied.ai_units),
+          "copied analysis refers to the clone's units")
+
+    enemy = copied.enemy_units[0]
+    clone._relocate_unit(enemy, *free_tiles(clone)[-1])
+    analyzer = BattlefieldAnalyzer(clone, AI_PLAYER)
+    analyzer.update(copied)
+    check("copy_update_matches_rebuild", signature(copied) == signature(analyzer.analyze()),
+          "update on the clone")
+    check("original_untouched", signature(analysis) == before, "original analysis unchanged")
+
+
+def main():
+    return run_checks("BATTLEFIELD ANALYSIS UPDATE", [
+        test_update_matches_rebuild,
+        test_update_without_changes_is_noop,
+        test_copy_follows_clone,
+    ])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""Process-wide configuration: boneglaive.utils.config.
+
+get_config() returns one ConfigManager for the whole process: the config
+file is read once, reads come from memory, changes are published to
+subscribers (the renderer, the scale manager and the sound manager), saves
+are debounced and atomic, and poll() picks up edits made outside the game.
+Each of those is checked against temporary config files, so the user's own
+config is never written.
+
+Run with: SDL_VIDEODRIVER=dummy SDL_AUDIODRIVER=dummy python tests/test_config_service.py
+"""
+import os
+import sys
+import json
+import atexit
+import time
+import tempfile
+from pathlib import Path
+
+from harness import check, run_checks
+
+from boneglaive.utils.config import ConfigManager, get_config
+
+
+def read(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+# --------------------------------------------------------------------------- #
+# (a) Reads and change events
+# --------------------------------------------------------------------------- #
+def test_reads_and_events():
+    check("shared_instance", get_config() is get_config())
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "config.json"
+        path.write_text(json.dumps({"window_width": 1600, "ui_layout": "reversed"}))
+        config = ConfigManager(path, save_delay=0)
+        path.unlink()
+        check("served_from_memory", config.get('window_width') == 1600 and config.get('ui_layout') == "reversed")
+
+        seen = []
+        layout_only = []
+        config.subscribe(lambda key, value: seen.append((key, value)))
+        config.subscribe(lambda key, value: layout_only.append(value), keys=('ui_layout',))
+        config.set('window_width', 1920)
+        config.set('ui_layout', "default")
+        config.set('ui_layout', "default")
+        config.set('no_such_key', 1)
+        check("events", seen == [('window_width', 1920), ('ui_layout', "default")], str(seen))
+        check("key_filter", layout_only == ["default"], str(layout_only))
+
+        def listener(key, value):
+            seen.append(key)
+
+        config.subscribe(listener)
+        config.unsubscribe(listener)
+        config.set('fullscreen', True)
+        check("unsubscribe", seen[-1] == ('fullscreen', True))
+
+        # A batch is fully applied before anyone hears about it
+        sizes = []
+        config.subscribe(lambda key, value: sizes.append((key, config.get('window_width'), config.get('window_height'))),
+                         keys=('window_width', 'window_height'))
+        config.update({'window_width': 2560, 'window_height': 1440, 'no_such_key': 1})
+        check("update_batched", sizes == [('window_width', 2560, 1440), ('window_height', 2560, 1440)], str(sizes))
+
+    # Only the shared instance flushes at exit; throwaway instances are not kept alive
+    callbacks = atexit._ncallbacks()
+    with tempfile.TemporaryDirectory() as tmp:
+        ConfigManager(Path(tmp) / "config.json")
+    check("no_atexit_per_instance", atexit._ncallbacks() == callbacks)
+
+
+# --------------------------------------------------------------------------- #
+# (b) Saving
+# --------------------------------------------------------------------------- #
+def test_debounced_atomic_save():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "config.json"
+        config = ConfigManager(path, save_delay=0.2)
+        writes = []
+        original_write = config._write
+
+        def counting_write():
+            writes.append(time.monotonic())
+            original_write()
+
+        config._write = counting_write
+        for volume in (0.1, 0.2, 0.3, 0.4):
+            config.set('sfx_volume', volume)
+            config.save_config()
+        check("save_deferred", not path.exists())
+        time.sleep(0.5)
+        check("one_write", len(writes) == 1, str(len(writes)))
+        check("latest_saved", path.exists() and read(path)['sfx_volume'] == 0.4)
+        check("no_temp_left", sorted(p.name for p in Path(tmp).iterdir()) == ["config.json"])
+
+        config.set('sfx_volume', 0.9)
+        config.save_config()
+        config.flush()
+        check("flush_writes_now", read(path)['sfx_volume'] == 0.9 and len(writes) == 2)
+        config.flush()
+        check("flush_idempotent", len(writes) == 2)
+
+
+# --------------------------------------------------------------------------- #
+# (c) File watch
+# --------------------------------------------------------------------------- #
+def test_file_watch():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "config.json"
+        config = ConfigManager(path, save_delay=0)
+        config.save_config()
+        seen = []
+        config.subscribe(lambda key, value: seen.append((key, value)))
+
+        config._next_watch = 0
+        check("own_write_ignored", not config.poll() and not seen)
+
+        data = read(path)
+        data['show_fps'] = True
+        data['ui_layout'] = "reversed"
+        path.write_text(json.dumps(data))
+        os.utime(path, ns=(time.time_ns(), time.time_ns() + 10 ** 9))
+        check("throttled", not config.poll())
+        config._next_watch = 0
+        check("external_edit", config.poll() and config.get('show_fps') is True)
+        check("edit_events", sorted(seen) == [('show_fps', True), ('ui_layout', "reversed")], str(seen))
+        config._next_watch = 0
+        check("edit_once", not config.poll())
+
+
+# --------------------------------------------------------------------------- #
+# (d) Subscribers
+# --------------------------------------------------------------------------- #
+def test_subscribers():
+    from boneglaive.graphical.sound_manager import SoundManager
+    from boneglaive.graphical.ui.scale_utils import scale_manager
+
+    with tempfile.TemporaryDirectory() as tmp:
+        config = ConfigManager(Path(tmp) / "config.json", save_delay=0)
+        sounds = SoundManager(sounds_dir=tmp, enabled=False)
+        config.subscribe(sounds.on_config_change, keys=('sfx_volume', 'audio_enabled'))
+        config.set('sfx_volume', 0.25)
+        config.set('audio_enabled', False)
+        check("sound_follows", sounds.volumes['master'] == 0.25 and not sounds.enabled)
+
+    shared = get_config()
+    width = shared.get('window_width')
+    try:
+        shared.set('window_width', 2560)
+        check("scale_follows", scale_manager.screen_width == 2560 and scale_manager.scale_x == 2.0)
+    finally:
+        shared.set('window_width', width)
+    check("scale_restored", scale_manager.screen_width == width)
+
+    height = shared.get('window_height')
+    rescales = []
+    original_update = scale_manager.update_scale
+
+    def counting_update():
+        rescales.append((shared.get('window_width'), shared.get('window_height')))
+        original_update()
+
+    scale_manager.update_scale = counting_update
+    try:
+        shared.update({'window_width': 2560, 'window_height': 1440})
+        check("scale_once", rescales == [(2560, 1440)] and scale_manager.scale_y == 2.0, str(rescales))
+    finally:
+        shared.update({'window_width': width, 'window_height': height})
+        del scale_manager.update_scale
+    check("scale_batch_restored", (scale_manager.screen_width, scale_manager.screen_height) == (width, height))
+
+    from boneglaive.graphical.game_state import GameStateAdapter
+    from boneglaive.graphical.renderer import GraphicalRenderer
+
+    renderer = GraphicalRenderer(GameStateAdapter())
+    layout = shared.get('ui_layout')
+    screen_rect = renderer.screen.get_rect()
+    renderer.compositor.begin_frame(screen_rect)  # The first frame is always whole
+    try:
+        shared.set('ui_layout', "reversed" if layout == "default" else "default")
+        check("renderer_follows", renderer.ui_layout == shared.get('ui_layout'))
+        check("layout_redraws", renderer.compositor.begin_frame(screen_rect) is None)
+    finally:
+        shared.set('ui_layout', layout)
+        shared.unsubscribe(renderer._on_config_change)
+
+    # A main loop that dies still stops listening
+    renderer = GraphicalRenderer(GameStateAdapter())
+
+    def crash(events):
+        raise RuntimeError("crash")
+
+    renderer.handle_events = crash
+    try:
+        renderer.run()
+    except RuntimeError:
+        pass
+    check("run_unsubscribes", all(entry[0] != renderer._on_config_change for entry in shared._subscribers))
+
+
+def main():
+    return run_checks("CONFIG SERVICE", [
+        test_reads_and_events,
+        test_debounced_atomic_save,
+        test_file_watch,
+        test_subscribers,
+    ])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""Endgame solver: boneglaive.ai.endgame.
+
+With few units left, SmartAI on the hard difficulty searches for a forced
+win before planning as usual. The solver should find a one-turn win, search
+the full depth within the default budget when there is none, skip positions
+where the remaining enemies cannot yield enough GP, and count only roster
+units. Lines that depend on a roll or let the opponent respawn are not wins.
+It must leave the live game and the random stream alone, and SmartAI must
+queue the plan it finds.
+
+Run with: SDL_VIDEODRIVER=dummy SDL_AUDIODRIVER=dummy python tests/test_endgame.py
+"""
+import sys
+import random
+
+from harness import check, run_checks
+
+from boneglaive.game.engine import DeadUnit, Game
+from boneglaive.utils.constants import HEIGHT, UnitType, WIDTH
+from boneglaive.utils.message_log import message_log
+from boneglaive.ai.endgame import (ENDGAME_MAX_DEPTH, ENDGAME_NODE_BUDGET, EndgameSolver,
+                                   position_key, live_unit_count)
+from boneglaive.ai.smart_ai import SmartAI, difficulty_options
+
+
+def endgame(gp_short):
+    """Player 1's glaiveman next to a one-HP enemy, one more enemy far away."""
+    random.seed(0)
+    g = Game(skip_setup=True, map_name="lime_foyer")
+    g.units = []
+    tiles = [(y, x) for y in range(HEIGHT) for x in range(WIDTH) if g.map.can_place_unit(y, x)]
+    y, x = next((y, x) for y, x in tiles if (y, x + 1) in tiles)
+    g.add_unit(UnitType.GLAIVEMAN, 1, y, x)
+    g.add_unit(UnitType.GLAIVEMAN, 2, y, x + 1)
+    g.add_unit(UnitType.GLAIVEMAN, 2, *max(tiles, key=lambda t: abs(t[0] - y) + abs(t[1] - x)))
+    victim = g.units[1]
+    victim.hp = 1
+    g.current_player = 1
+    g.player1_gp = g.gp_win_threshold - gp_short
+    return g, victim
+
+
+# ---------------------------------------------------------------------------
+# (a) A kill that reaches the GP threshold is found and proven.
+# ---------------------------------------------------------------------------
+def test_finds_forced_win():
+    g, victim = endgame(1)
+    result = EndgameSolver(g, 1).solve()
+    check("forced_win_found", result.solved and result.turns_to_win == 1,
+          f"solved={result.solved} nodes={result.nodes}")
+    _, move, attack, _, target = result.plan[0] if result.plan else (None,) * 5
+    check("forced_win_hits_victim", (victim.y, victim.x) in (attack, target), f"plan={result.plan}")
+
+
+def test_full_depth_within_budget():
+    g, _ = endgame(2)   # one kill is not enough and the second enemy is out of reach
+    result = EndgameSolver(g, 1).solve()
+    check("full_depth_searched", not result.solved and result.depth == ENDGAME_MAX_DEPTH
+          and result.nodes <= ENDGAME_NODE_BUDGET, f"depth={result.depth} nodes={result.nodes}")
+
+
+# ---------------------------------------------------------------------------
+# (b) Positions where the enemies cannot yield enough GP cost nothing.
+# ---------------------------------------------------------------------------
+def test_unreachable_win_is_cut():
+    g, _ = endgame(5)   # two enemies can yield at most four GP
+    result = EndgameSolver(g, 1).solve()
+    check("unreachable_cut", not result.solved and result.nodes == 0, f"nodes={result.nodes}")
+
+
+def test_summons_not_counted():
+    g, _ = endgame(1)
+    y, x = next((y, x) for y in range(HEIGHT) for x in range(WIDTH)
+                if g.map.can_place_unit(y, x) and g.get_unit_at(y, x) is None)
+    g.add_unit(UnitType.HEINOUS_VAPOR, 2, y, x)
+    check("summons_not_counted", live_unit_count(g) == 3, f"count={live_unit_count(g)}")
+
+
+# ---------------------------------------------------------------------------
+# (c) Only forced wins count: not when the opponent can respawn, not when a
+#     roll decided the line.
+# ---------------------------------------------------------------------------
+def test_respawn_ready_is_not_won():
+    def after_opponent_turn(respawn_ready):
+        """Opponent to move; its only unit is topiary and dies to next turn's hit."""
+        g, victim = endgame(1)
+        del g.units[2]
+        g._rebuild_unit_grid()
+        victim.is_topiary = True
+        if respawn_ready:
+            dead = DeadUnit(UnitType.GRAYMAN, 2, g.turn, "x")
+            dead.ready_for_respawn = True
+            g.dead_units.append(dead)
+        solver = EndgameSolver(g, 1)
+        solver._deadline = float("inf")
+        with message_log.suppressed():
+            state = g.clone(rng=solver.rng)
+            state.current_player = 2
+            return solver._search(state, 2)[0]
+
+    check("win_without_respawn", after_opponent_turn(False))
+    check("respawn_ready_not_won", not after_opponent_turn(True))
+
+
+def test_rolled_turn_is_not_won():
+    g, _ = endgame(1)
+    solver = EndgameSolver(g, 1)
+    real_finish = EndgameSolver._finish_turn
+
+    def finish_with_roll(state):
+        state.rng.random()
+        real_finish(state)
+
+    try:
+        EndgameSolver._finish_turn = staticmethod(finish_with_roll)
+        result = solver.solve()
+    finally:
+        EndgameSolver._finish_turn = staticmethod(real_finish)
+    check("rolled_win_not_counted", not result.solved, f"plan={result.plan}")
+
+
+# ---------------------------------------------------------------------------
+# (d) Solving leaves the game and the global random stream untouched.
+# ---------------------------------------------------------------------------
+def test_solver_is_side_effect_free():
+    g, _ = endgame(2)
+    before = position_key(g)
+    random.seed(42)
+    expected = random.random()
+    random.seed(42)
+    EndgameSolver(g, 1, node_budget=60).solve()
+    check("game_untouched", position_key(g) == before)
+    check("random_untouched", random.random() == expected)
+    check("key_ignores_identity", position_key(g.clone()) == before)
+
+
+# ---------------------------------------------------------------------------
+# (e) SmartAI on hard switches to the solver with few units and plays the win;
+#     the other difficulties never run it.
+# ---------------------------------------------------------------------------
+def test_smart_ai_plays_forced_win():
+    g, _ = endgame(1)
+    ai = SmartAI(g, player_number=1, **dict(difficulty_options("hard"), beam_width=0))
+    with message_log.suppressed():
+        ai.process_turn()
+        solved = ai.last_endgame is not None and ai.last_endgame.solved
+        g.execute_turn(ui=None)
+        g.check_game_over()
+    check("smart_ai_uses_solver", solved and live_unit_count(g) <= 2 and g.winner == 1,
+          f"winner={g.winner}")
+
+    for difficulty in ("easy", "medium"):
+        other = SmartAI(endgame(1)[0], player_number=1, **difficulty_options(difficulty))
+        with message_log.suppressed():
+            other.process_turn()
+        check(f"solver_off_on_{difficulty}", other.last_endgame is None)
+
+
+def main():
+    return run_checks("ENDGAME", [
+        test_finds_forced_win,
+        test_full_depth_within_budget,
+        test_unreachable_win_is_cut,
+        test_summons_not_counted,
+        test_respawn_ready_is_not_won,
+        test_rolled_turn_is_not_won,
+        test_solver_is_side_effect_free,
+        test_smart_ai_plays_forced_win,
+    ])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
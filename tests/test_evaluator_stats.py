@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""Evaluator instrumentation: per-turn timing and candidate counts for TacticalEvaluator.
+
+Every TacticalEvaluator._evaluate_* method is wrapped by evaluator_stats.instrument. While
+stats are disabled the wrappers must be inert; while enabled, each SmartAI turn must be
+collected as its own record set, with self time (excluding nested evaluators) never
+exceeding inclusive time. Candidate counts come from evaluator_stats.count hooks at the
+enumeration and scoring sites, credited to the innermost running evaluator.
+
+Run with: SDL_VIDEODRIVER=dummy SDL_AUDIODRIVER=dummy python tests/test_evaluator_stats.py
+"""
+import sys
+
+from harness import check, run_checks
+
+from boneglaive.game.engine import Game
+from boneglaive.ai.smart_ai import SmartAI
+from boneglaive.ai.evaluator_stats import evaluator_stats, instrument_evaluators
+from boneglaive.ai.selfplay import play_headless_game, smart_ai_factory
+
+
+def ai_turn(beam_width=0):
+    g = Game(skip_setup=True, map_name="lime_foyer")
+    g.current_player = 2
+    SmartAI(g, beam_width=beam_width).process_turn()
+    return g
+
+
+# ---------------------------------------------------------------------------
+# (a) Disabled (the default): nothing is recorded.
+# ---------------------------------------------------------------------------
+def test_disabled_records_nothing():
+    evaluator_stats.reset()
+    evaluator_stats.enabled = False
+    ai_turn()
+    check("disabled_no_totals", not evaluator_stats.totals, f"totals={list(evaluator_stats.totals)}")
+    check("disabled_no_turns", not evaluator_stats.turns, f"turns={len(evaluator_stats.turns)}")
+
+
+# ---------------------------------------------------------------------------
+# (b) Enabled: one record set per AI turn, consistent counts and times.
+# ---------------------------------------------------------------------------
+def test_enabled_records_per_turn():
+    evaluator_stats.reset()
+    evaluator_stats.enabled = True
+    try:
+        ai_turn(beam_width=0)
+        ai_turn(beam_width=2)
+    finally:
+        evaluator_stats.enabled = False
+
+    check("two_turns_recorded", len(evaluator_stats.turns) == 2, f"turns={len(evaluator_stats.turns)}")
+    check("core_evaluators_seen",
+          {"_evaluate_attacks", "_evaluate_moves", "_evaluate_skills"} <= set(evaluator_stats.totals),
+          f"seen={sorted(evaluator_stats.totals)}")
+
+    totals = evaluator_stats.totals
+    consistent = all(r.self_time <= r.total_time + 1e-9 and r.scored <= r.generated and r.calls > 0
+                     for r in totals.values())
+    check("records_consistent", consistent, "self<=total, scored<=generated")
+    moves = totals["_evaluate_moves"]
+    check("moves_counted_at_source", moves.generated > 0 and moves.scored == moves.returned,
+          f"gen={moves.generated} scored={moves.scored} returned={moves.returned}")
+
+    # Per-turn records add up to the session totals
+    calls = {}
+    for _, records in evaluator_stats.turns:
+        for name, record in records.items():
+            calls[name] = calls.get(name, 0) + record.calls
+    check("turns_sum_to_totals", calls == {n: r.calls for n, r in totals.items()}, "call counts")
+
+    report = evaluator_stats.format_report(5)
+    check("report_ranks_by_self_time", "2 AI turns" in report and len(report.splitlines()) <= 7,
+          report.splitlines()[0])
+    ranked = [record.generated for _, record in evaluator_stats.ranking('generated')]
+    check("ranking_by_generated", ranked == sorted(ranked, reverse=True) and
+          "ranked by generated" in evaluator_stats.format_report(5, 'generated'), f"{ranked[:5]}")
+
+
+# ---------------------------------------------------------------------------
+# (c) count() credits the innermost running evaluator, even when it returns nothing.
+# ---------------------------------------------------------------------------
+@instrument_evaluators
+class _Probe:
+    def _evaluate_outer(self):
+        evaluator_stats.count(generated=3)
+        inner = self._evaluate_inner()
+        evaluator_stats.count(scored=1)
+        return inner
+
+    def _evaluate_inner(self):
+        evaluator_stats.count(generated=10, scored=4)
+        return []
+
+
+def test_count_hook():
+    evaluator_stats.reset()
+    evaluator_stats.count(generated=5)  # Disabled: ignored
+    evaluator_stats.enabled = True
+    try:
+        evaluator_stats.count(generated=5)  # No running evaluator: ignored
+        _Probe()._evaluate_outer()
+    finally:
+        evaluator_stats.enabled = False
+
+    outer = evaluator_stats.totals["_evaluate_outer"]
+    inner = evaluator_stats.totals["_evaluate_inner"]
+    check("count_outer_frame", (outer.generated, outer.scored, outer.returned) == (3, 1, 0),
+          f"outer={outer.generated}/{outer.scored}/{outer.returned}")
+    check("count_inner_frame", (inner.generated, inner.scored, inner.returned) == (10, 4, 0),
+          f"inner={inner.generated}/{inner.scored}/{inner.returned}")
+
+
+# ---------------------------------------------------------------------------
+# (d) The headless runner used by the report plays a bounded game.
+# ---------------------------------------------------------------------------
+def test_headless_runner():
+    result = play_headless_game("lime_foyer", seed=1, player1=smart_ai_factory(0),
+                                player2=smart_ai_factory(0), max_turns=4)
+    check("headless_runner_bounded", result.turns <= 4 and result.elapsed > 0,
+          f"turns={result.turns} winner={result.winner}")
+
+
+def main():
+    return run_checks("EVALUATOR STATS", [
+        test_disabled_records_nothing,
+        test_enabled_records_per_turn,
+        test_count_hook,
+        test_headless_runner,
+    ])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""Dry-run action forecasts: Game.forecast(unit, action).
+
+A forecast resolves one unit's move/attack/skill on a clone with the real
+per-unit pipeline. Its HP predictions are compared with what execute_turn()
+actually does to every unit; the live game (units, message log, global random
+stream) is checked for leaks; kills and illegal orders must be reported.
+
+Run with: SDL_VIDEODRIVER=dummy SDL_AUDIODRIVER=dummy python tests/test_forecast.py
+"""
+import sys
+import random
+
+from harness import check, run_checks
+
+from boneglaive.game.engine import Game
+from boneglaive.game.actions import UnitAction, queue_unit_action
+from boneglaive.game.targeting import skill_target_candidates
+from boneglaive.utils.message_log import message_log
+
+
+MAPS = ("lime_foyer", "stained_stones", "hard_pressed", "verdant_terrace")
+
+
+def fresh_game(map_name, seed):
+    random.seed(seed)
+    g = Game(skip_setup=True, map_name=map_name)
+    g.current_player = 1
+    return g
+
+
+def sample_actions(g, unit, limit, seed):
+    """A random sample of legal move/attack/skill orders for a unit."""
+    actions = []
+    for move in [None] + g.get_possible_moves(unit):
+        for target in g.get_possible_attacks(unit, move):
+            actions.append(UnitAction(move=move, attack=target))
+        unit.move_target = move
+        for skill in unit.active_skills:
+            if skill.current_cooldown == 0:
+                for target in skill_target_candidates(skill, unit, g)[:3]:
+                    actions.append(UnitAction(move=move, skill=skill, target=target))
+        unit.move_target = None
+    random.Random(seed).shuffle(actions)
+    return actions[:limit]
+
+
+def resolved_hp(g, unit, action):
+    """HP of every unit right after execute_turn() resolves the action on a clone."""
+    memo = {}
+    state = g.clone(memo)
+    snapshot = {}
+    state.pre_status_clear_callback = lambda: snapshot.update(
+        {id(u): max(0, u.hp) for u in state.units})
+    with message_log.suppressed():
+        skill = memo.get(id(action.skill)) if action.skill is not None else None
+        queue_unit_action(state, memo[id(unit)], action._replace(skill=skill))
+        state.execute_turn()
+    return {live: snapshot.get(id(memo[id(live)]), 0) for live in g.units}
+
+
+def live_snapshot(g):
+    return [(u.y, u.x, u.hp, u.move_target, u.attack_target, u.skill_target,
+             tuple(s.current_cooldown for s in u.active_skills)) for u in g.units]
+
+
+# ---------------------------------------------------------------------------
+# (a) Forecast HP == execute_turn() HP for every unit, across maps and orders.
+# ---------------------------------------------------------------------------
+def test_forecast_matches_resolution():
+    mismatches = []
+    compared = 0
+    for map_name in MAPS:
+        g = fresh_game(map_name, 2)
+        for unit in [u for u in g.units if u.player == 1]:
+            for action in sample_actions(g, unit, 8, compared):
+                forecast = g.forecast(unit, action)
+                actual = resolved_hp(g, unit, action)
+                for live in g.units:
+                    delta = forecast.delta_for(live)
+                    predicted = delta.hp_after if delta else live.hp
+                    if predicted != actual[live]:
+                        mismatches.append((map_name, unit.type.name, action.kind, live.type.name))
+                        break
+                compared += 1
+    check("forecast_matches_resolution", not mismatches and compared > 0,
+          f"compared={compared} mismatches={mismatches[:4]}")
+
+
+# ---------------------------------------------------------------------------
+# (b) The live game, message log and random stream are untouched.
+# ---------------------------------------------------------------------------
+def test_forecast_leaves_live_state_alone():
+    g = fresh_game("stained_stones", 4)
+    unit = next(u for u in g.units if u.player == 1)
+    before = live_snapshot(g)
+    log_len = len(message_log.messages)
+    random.seed(11)
+    expected_draw = random.Random(11).random()
+    for action in sample_actions(g, unit, 10, 4):
+        g.forecast(unit, action)
+    check("forecast_live_units_untouched", live_snapshot(g) == before, "positions/HP/targets/cooldowns")
+    check("forecast_log_untouched", len(message_log.messages) == log_len,
+          f"log grew by {len(message_log.messages) - log_len}")
+    check("forecast_random_stream_untouched", random.random() == expected_draw, "global RNG state restored")
+
+
+# ---------------------------------------------------------------------------
+# (c) Lethal attacks are reported as kills; illegal orders as not legal.
+# ---------------------------------------------------------------------------
+def test_forecast_kills_and_illegal():
+    g = fresh_game("lime_foyer", 0)
+    attacker, action = None, None
+    for unit in [u for u in g.units if u.player == 1]:
+        for move in [None] + g.get_possible_moves(unit):
+            targets = g.get_possible_attacks(unit, move)
+            if targets:
+                attacker, action = unit, UnitAction(move=move, attack=targets[0])
+                break
+        if action:
+            break
+    victim = g.get_unit_at(*action.attack)
+    victim._hp = 1
+    forecast = g.forecast(attacker, action)
+    check("forecast_reports_kill", forecast.legal and victim in forecast.kills,
+          f"kind={action.kind} damage={forecast.damage_to(victim.player)}")
+    check("forecast_kill_leaves_victim", victim.is_alive() and victim in g.units, "live victim still alive")
+
+    illegal = g.forecast(attacker, UnitAction(attack=(attacker.y, attacker.x)))
+    check("forecast_illegal_action", not illegal.legal and not illegal.deltas, "self-attack rejected")
+
+
+def main():
+    return run_checks("FORECAST", [
+        test_forecast_matches_resolution,
+        test_forecast_leaves_live_state_alone,
+        test_forecast_kills_and_illegal,
+    ])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""Layered compositor and dirty-rectangle presentation: boneglaive.graphical.compositor.
+
+Draw sites report the areas they change; the compositor merges the reports
+into the rects the renderer repaints, and the frame kept between frames
+serves as the cache of everything else. These tests cover rect merging and
+the fall-backs to a whole frame (first frame, forced, too much changed,
+invalidated), the verify check's stale-block search, and the renderer: an
+idle board repaints nothing, a selected unit repaints only its pulsing tile,
+a unit that changes repaints its old and new bounds, and input or shake
+draws the whole frame. Partial frames are checked against full redraws.
+
+Run with: SDL_VIDEODRIVER=dummy SDL_AUDIODRIVER=dummy python tests/test_frame_compositor.py
+"""
+import sys
+
+from harness import check, run_checks
+
+import pygame
+
+from boneglaive.graphical.compositor import FrameCompositor
+
+
+def rects_of(rects):
+    return sorted(tuple(r) for r in rects)
+
+
+# --------------------------------------------------------------------------- #
+# (a) Compositor on a small display
+# --------------------------------------------------------------------------- #
+def test_rects():
+    pygame.display.init()
+    screen = pygame.display.set_mode((320, 200))
+    screen_rect = screen.get_rect()
+    comp = FrameCompositor(max_rects=3)
+
+    comp.mark_dirty((10, 10, 5, 5))
+    check("first_frame_full", comp.begin_frame(screen_rect) is None)
+    check("nothing_reported", comp.begin_frame(screen_rect) == [])
+
+    comp.mark_dirty((10, 10, 20, 20))
+    comp.mark_dirty((25, 25, 20, 20))    # Overlaps the first
+    comp.mark_dirty((30, 45, 10, 10))    # Touches the union's bottom edge
+    comp.mark_dirty((200, 100, 10, 10))
+    comp.mark_dirty((0, 0, 0, 10))       # Empty: dropped
+    rects = comp.begin_frame(screen_rect)
+    check("overlapping_merge", rects_of(rects) == [(10, 10, 35, 45), (200, 100, 10, 10)], str(rects))
+    check("reports_consumed", comp.begin_frame(screen_rect) == [])
+
+    # Animated areas come back every frame for as long as they are reported
+    comp.animate((300, 190, 40, 40))
+    check("animated_clipped", rects_of(comp.begin_frame(screen_rect)) == [(300, 190, 20, 10)])
+    check("animated_stops", comp.begin_frame(screen_rect) == [])
+
+    for x in range(0, 200, 40):
+        comp.mark_dirty((x, 0, 10, 10))
+    check("many_rects_bounded", rects_of(comp.begin_frame(screen_rect)) == [(0, 0, 170, 10)])
+
+    comp.mark_dirty((0, 0, 250, 200))
+    check("mostly_changed_full", comp.begin_frame(screen_rect) is None)
+    comp.mark_dirty((0, 0, 10, 10))
+    check("forced_full", comp.begin_frame(screen_rect, full=True) is None)
+    comp.invalidate()
+    check("invalidate_full", comp.begin_frame(screen_rect) is None)
+
+    check("present_full", rects_of(comp.present(screen, None)) == [(0, 0, 320, 200)])
+    check("present_partial", rects_of(comp.present(screen, [pygame.Rect(5, 5, 10, 10)])) == [(5, 5, 10, 10)])
+    check("present_nothing", comp.present(screen, []) == [])
+    check("stats", comp.stats.full == 1 and comp.stats.partial == 1 and comp.stats.skipped == 1
+          and comp.stats.rects == 1, comp.stats.summary())
+
+
+def test_stale_rects():
+    comp = FrameCompositor()
+    partial = pygame.Surface((320, 200))
+    reference = partial.copy()
+    check("same_frames_clean", comp.stale_rects(partial, reference) == [] and comp.stats.missed == 0)
+
+    reference.fill((200, 0, 0), (70, 10, 5, 5))
+    reference.fill((200, 0, 0), (130, 10, 5, 5))
+    reference.fill((0, 0, 200), (300, 195, 5, 5))
+    stale = comp.stale_rects(partial, reference)
+    check("stale_blocks", rects_of(stale) == [(64, 0, 128, 64), (256, 192, 64, 8)], str(stale))
+    check("stale_counted", comp.stats.missed == 1)
+
+
+def test_static_layer():
+    background = pygame.Surface((128, 128))
+    background.fill((5, 5, 5))
+    grid = pygame.Surface((32, 32))
+    grid.fill((50, 50, 50))
+    comp = FrameCompositor()
+
+    layer = comp.static_layer(background, grid, (16, 16), grid_changed=False)
+    check("static_has_grid", layer.get_at((20, 20))[:3] == (50, 50, 50) and layer.get_at((0, 0))[:3] == (5, 5, 5))
+    comp.begin_frame(background.get_rect())
+
+    grid.fill((90, 90, 90))
+    layer = comp.static_layer(background, grid, (16, 16), grid_changed=False)
+    check("static_cached", layer.get_at((20, 20))[:3] == (50, 50, 50))
+    layer = comp.static_layer(background, grid, (16, 16), grid_changed=True)
+    check("static_follows_grid", layer.get_at((20, 20))[:3] == (90, 90, 90))
+    check("grid_change_dirty", rects_of(comp.begin_frame(background.get_rect())) == [(16, 16, 32, 32)])
+
+
+# --------------------------------------------------------------------------- #
+# (b) Renderer frames
+# --------------------------------------------------------------------------- #
+def test_renderer_frames():
+    from boneglaive.graphical.game_state import GameStateAdapter
+    from boneglaive.graphical.renderer import GraphicalRenderer
+
+    adapter = GameStateAdapter()
+    adapter.initialize_game(skip_setup=True)
+    renderer = GraphicalRenderer(adapter)
+    renderer.sync_units_from_game()
+    renderer.compositor.verify = True
+    stats = renderer.compositor.stats
+
+    def frames(count):
+        before = (stats.full, stats.partial, stats.skipped, stats.rects)
+        for _ in range(count):
+            renderer.update(0.016)
+            renderer.draw()
+        return tuple(now - then for now, then in zip((stats.full, stats.partial, stats.skipped, stats.rects), before))
+
+    check("idle_repaints_nothing", frames(10) == (2, 0, 8, 0), stats.summary())
+
+    presented = []
+    original_present = renderer.compositor.present
+
+    def record(screen, rects):
+        presented.append(rects)
+        return original_present(screen, rects)
+    renderer.compositor.present = record
+
+    # The selection highlight pulses: only its tile is repainted
+    unit = renderer.units[0]
+    renderer.selected_unit = unit
+    frames(3)
+    del presented[:]
+    frames(3)
+    tile = unit.draw_bounds()
+    check("selection_tile_only", all(rects and len(rects) == 1 and tile.contains(rects[0]) for rects in presented),
+          str(presented))
+
+    # A unit that looks different repaints its old and new bounds, and nothing else
+    renderer.selected_unit = None
+    frames(3)
+    other = renderer.units[1]
+    old_bounds = other.draw_bounds()
+    other.x += 3
+    del presented[:]
+    frames(1)
+    rects = presented[0]
+    check("unit_change_partial", rects is not None and len(rects) == 1
+          and rects[0] == old_bounds.union(other.draw_bounds()).clip(renderer.screen.get_rect()), str(rects))
+    renderer.compositor.present = original_present
+
+    # Input draws the whole frame, then one more to clear what it left behind
+    renderer.handle_events([pygame.event.Event(pygame.MOUSEMOTION, pos=(1, 1), rel=(0, 0), buttons=(0, 0, 0))])
+    check("input_full", frames(3)[0] == 2, stats.summary())
+
+    renderer.screen_shake_intensity = 5
+    renderer.screen_shake_duration = 0.05
+    check("shake_full", frames(1)[0] == 1, stats.summary())
+    check("partial_frames_match_full", stats.missed == 0, stats.summary())
+
+
+def main():
+    return run_checks("FRAME COMPOSITOR", [
+        test_rects,
+        test_stale_rects,
+        test_static_layer,
+        test_renderer_frames,
+    ])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
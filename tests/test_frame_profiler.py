@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""Per-stage frame timing: boneglaive.graphical.frame_profiler.
+
+With the frame profiler enabled, the main loop times handle_events, update,
+sync_state and each stage of draw(), shows p50/p95/p99 per stage in an
+overlay and exports recorded frames to CSV. Checked: lap and stage
+accounting, a disabled profiler recording nothing, nearest-rank percentiles
+over a bounded window, the CSV layout, overlay refresh, the renderer's main
+loop recording its stages, and a failed F9 export landing in the combat log
+instead of raising.
+
+Run with: SDL_VIDEODRIVER=dummy SDL_AUDIODRIVER=dummy python tests/test_frame_profiler.py
+"""
+import sys
+import csv
+import time
+import tempfile
+from pathlib import Path
+
+from harness import check, run_checks
+
+import pygame
+
+from boneglaive.graphical import frame_profiler as fp
+from boneglaive.graphical.frame_profiler import FRAME, FrameProfiler, frame_profiler, percentile
+
+
+def busy(ms):
+    end = time.perf_counter() + ms / 1000.0
+    while time.perf_counter() < end:
+        pass
+
+
+# --------------------------------------------------------------------------- #
+# (a) Recording
+# --------------------------------------------------------------------------- #
+def test_laps_and_stages():
+    profiler = FrameProfiler()
+    profiler.begin_frame()
+    profiler.lap("grid")
+    check("disabled_records_nothing", not profiler.frames and profiler._current is None)
+
+    profiler.enabled = True
+
+    @profiler.timed("sync_state")
+    def sync():
+        busy(2)
+        return "events"
+
+    profiler.begin_frame()
+    busy(3)
+    profiler.lap("handle_events")
+    check("timed_returns", sync() == "events")
+    sync()
+    profiler.lap("update")
+    with profiler.stage("custom"):
+        busy(1)
+    profiler.lap("units")
+    profiler.end_frame()
+
+    frame = profiler.frames[-1]
+    check("lap_timed", 3 <= frame["handle_events"] < 30, f"{frame['handle_events']:.2f} ms")
+    check("timed_adds_up", 4 <= frame["sync_state"] < 40 and frame["update"] >= frame["sync_state"],
+          f"{frame['sync_state']:.2f} ms")
+    check("stage_timed", 1 <= frame["custom"] < 20)
+    check("frame_total", abs(frame[FRAME] - (frame["handle_events"] + frame["update"] + frame["units"])) < 0.5)
+    check("report_order", profiler.stages() == ["handle_events", "sync_state", "update", "units", "custom", FRAME],
+          str(profiler.stages()))
+
+    profiler.lap("after_end")
+    check("no_lap_outside_frame", "after_end" not in profiler.frames[-1])
+
+
+def test_percentiles():
+    values = list(range(1, 101))
+    check("nearest_rank", (percentile(values, 0.5), percentile(values, 0.95), percentile(values, 0.99))
+          == (50, 95, 99))
+    check("empty_zero", percentile([], 0.5) == 0.0)
+
+    profiler = FrameProfiler(window=100)
+    profiler.enabled = True
+    for i in range(150):
+        profiler.begin_frame()
+        profiler._add("draw", float(i))
+        profiler.end_frame()
+    check("window_bounded", len(profiler.frames) == 100 and profiler.frame_count == 150)
+    check("window_percentiles", profiler.percentiles("draw") == (99.0, 144.0, 148.0), str(profiler.percentiles("draw")))
+    check("summary", profiler.summary().startswith("Frame profile: 100 frames") and "draw" in profiler.summary())
+    profiler.clear()
+    check("clear", profiler.summary() == "Frame profile: no frames recorded")
+
+
+# --------------------------------------------------------------------------- #
+# (b) Export and overlay
+# --------------------------------------------------------------------------- #
+def test_export_and_overlay():
+    pygame.font.init()
+    profiler = FrameProfiler(window=3)
+    profiler.enabled = True
+    for i in range(5):
+        profiler.begin_frame()
+        profiler._add("grid", 1.0 + i)
+        if i % 2:
+            profiler._add("sync_state", 0.5)
+        profiler.end_frame()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = profiler.export_csv(Path(directory) / "profile.csv")
+        with open(path, newline="") as f:
+            rows = list(csv.reader(f))
+    check("csv_header", rows[0] == ["frame", "sync_state_ms", "grid_ms", "frame_ms"], str(rows[0]))
+    check("csv_rows", [row[0] for row in rows[1:]] == ["2", "3", "4"] and rows[1][2] == "3.000"
+          and rows[1][1] == "0.000" and rows[2][1] == "0.500", str(rows[1:]))
+
+    font = pygame.font.Font(None, 16)
+    panel = profiler.overlay(font)
+    check("overlay_rows", panel is not None and panel.get_height() >= font.get_linesize() * 4)
+    profiler.begin_frame()
+    profiler.end_frame()
+    check("overlay_cached", profiler.overlay(font) is panel)
+    for _ in range(fp.OVERLAY_REFRESH_FRAMES):
+        profiler.begin_frame()
+        profiler.end_frame()
+    check("overlay_refreshed", profiler.overlay(font) is not panel)
+    check("overlay_empty", FrameProfiler().overlay(font) is None)
+
+
+# --------------------------------------------------------------------------- #
+# (c) Renderer main loop
+# --------------------------------------------------------------------------- #
+def test_renderer_stages():
+    from boneglaive.graphical.game_state import GameStateAdapter
+    from boneglaive.graphical.renderer import GraphicalRenderer
+
+    adapter = GameStateAdapter()
+    adapter.initialize_game(skip_setup=True)
+    renderer = GraphicalRenderer(adapter)
+    renderer.sync_units_from_game()
+    check("shared_profiler", renderer.profiler is frame_profiler)
+
+    frame_profiler.clear()
+    frame_profiler.enabled = True
+    try:
+        renderer.frame_scheduler.mode = "fixed"
+        renderer._force_sync = True
+        pygame.event.clear()
+        pygame.time.set_timer(pygame.QUIT, 500, loops=1)
+        renderer.run()
+    finally:
+        frame_profiler.enabled = False
+
+    stages = frame_profiler.stages()
+    expected = ["handle_events", "sync_state", "update", "grid", "traps", "rail_junctions", "range_indicators",
+                "highlights", "shadows", "units", "animations", "particles", "ui", "overlay", "flip", FRAME]
+    check("all_stages", stages == expected, str(stages))
+    check("frames_recorded", len(frame_profiler.frames) > 5, str(len(frame_profiler.frames)))
+    frame = frame_profiler.frames[-1]
+    parts = sum(frame.get(name, 0) for name in expected if name not in ("sync_state", FRAME))
+    check("stages_cover_frame", parts <= frame[FRAME] and parts > 0.9 * frame[FRAME],
+          f"{parts:.2f} of {frame[FRAME]:.2f} ms")
+
+    # F9 into a directory that cannot be written reports the error instead of raising
+    def unwritable(path=None):
+        raise PermissionError("read-only file system")
+
+    frame_profiler.enabled = True
+    frame_profiler.export_csv = unwritable
+    try:
+        renderer.handle_events([pygame.event.Event(pygame.KEYDOWN, key=pygame.K_F9, mod=0, unicode="")])
+        exported = True
+    except OSError:
+        exported = False
+    finally:
+        del frame_profiler.export_csv
+        frame_profiler.enabled = False
+    last = renderer.combat_log.messages[-1]['text'] if renderer.combat_log.messages else ""
+    check("export_error_reported", exported and last.startswith("Could not save frame profile"), last)
+
+
+def main():
+    return run_checks("FRAME PROFILER", [
+        test_laps_and_stages,
+        test_percentiles,
+        test_export_and_overlay,
+        test_renderer_stages,
+    ])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Adaptive main-loop pacing: boneglaive.graphical.frame_scheduler.
+
+The main loop runs at 60 fps while anything animates, slows to 30 fps while
+frames still change on their own, and sleeps until input once frames stop
+changing. The state transitions are exercised, along with an idle wait that
+ends (and hands over the event) as soon as input arrives, the fixed and
+benchmark modes, and the CPU-time readout. An idle board must run far fewer
+frames than the old fixed 60 fps.
+
+Run with: SDL_VIDEODRIVER=dummy SDL_AUDIODRIVER=dummy python tests/test_frame_scheduler.py
+"""
+import sys
+import time
+
+from harness import check, run_checks
+
+import pygame
+
+from boneglaive.graphical import frame_scheduler as fs
+from boneglaive.graphical.frame_scheduler import FrameScheduler
+
+
+def settled(mode="adaptive"):
+    """A scheduler whose last input is long past."""
+    scheduler = FrameScheduler(pygame.time.Clock(), mode)
+    scheduler.last_input = time.monotonic() - 10
+    return scheduler
+
+
+# --------------------------------------------------------------------------- #
+# (a) States
+# --------------------------------------------------------------------------- #
+def test_states():
+    check("starts_active", FrameScheduler(pygame.time.Clock()).next_state(False) == FrameScheduler.ACTIVE)
+
+    scheduler = settled()
+    check("changing_frames_ambient", scheduler.next_state(False) == FrameScheduler.AMBIENT)
+    for _ in range(fs.IDLE_AFTER_FRAMES):
+        scheduler.begin_frame()
+        scheduler.end_frame(changed=False, had_input=False)
+    check("unchanged_frames_idle", scheduler.next_state(False) == FrameScheduler.IDLE)
+    check("animation_wakes", scheduler.next_state(True) == FrameScheduler.ACTIVE)
+
+    scheduler.end_frame(changed=False, had_input=True)
+    check("input_wakes", scheduler.next_state(False) == FrameScheduler.ACTIVE)
+    scheduler.last_input = time.monotonic() - 10
+    scheduler.end_frame(changed=True, had_input=False)
+    check("change_leaves_idle", scheduler.next_state(False) == FrameScheduler.AMBIENT)
+
+    for mode in ("fixed", "benchmark"):
+        scheduler = settled(mode)
+        scheduler.unchanged_frames = 100
+        check(f"{mode}_never_idles", scheduler.next_state(False) == FrameScheduler.ACTIVE)
+    check("unknown_mode_adaptive", FrameScheduler(pygame.time.Clock(), "warp").mode == "adaptive")
+
+
+# --------------------------------------------------------------------------- #
+# (b) Waiting
+# --------------------------------------------------------------------------- #
+def test_idle_wait():
+    pygame.display.init()
+    pygame.display.set_mode((64, 64))
+    pygame.event.clear()
+    scheduler = settled()
+    scheduler.unchanged_frames = fs.IDLE_AFTER_FRAMES
+
+    start = time.monotonic()
+    delta, events = scheduler.wait(False)
+    waited = time.monotonic() - start
+    check("idle_wakeup_timeout", events == [] and 0.15 < waited < 0.6, f"{waited:.3f}s")
+    check("delta_covers_sleep", delta >= 0.15, f"{delta:.3f}")
+
+    pygame.event.post(pygame.event.Event(pygame.USEREVENT, tag="poke"))
+    start = time.monotonic()
+    _, events = scheduler.wait(False)
+    check("event_ends_wait", time.monotonic() - start < 0.1 and len(events) == 1
+          and getattr(events[0], "tag", None) == "poke")
+
+    scheduler = settled("benchmark")
+    start = time.monotonic()
+    for _ in range(20):
+        scheduler.wait(False)
+    check("benchmark_uncapped", time.monotonic() - start < 0.1, f"{time.monotonic() - start:.3f}s")
+
+
+def test_cpu_readout():
+    scheduler = settled()
+    check("cpu_zero_before_frames", scheduler.cpu_ms == 0.0)
+    scheduler.begin_frame()
+    total = sum(i * i for i in range(200000))
+    scheduler.end_frame(changed=True, had_input=False)
+    check("cpu_measured", total > 0 and scheduler.cpu_ms > 0.0, f"{scheduler.cpu_ms:.2f} ms")
+
+
+# --------------------------------------------------------------------------- #
+# (c) Main loop on an idle board
+# --------------------------------------------------------------------------- #
+def test_idle_board_frame_count():
+    from boneglaive.graphical.game_state import GameStateAdapter
+    from boneglaive.graphical.renderer import GraphicalRenderer
+
+    adapter = GameStateAdapter()
+    adapter.initialize_game(skip_setup=True)
+    renderer = GraphicalRenderer(adapter)
+    renderer.sync_units_from_game()
+    renderer.frame_scheduler.last_input = time.monotonic() - 10
+    pygame.event.clear()
+
+    pygame.time.set_timer(pygame.QUIT, 1500, loops=1)
+    start = time.monotonic()
+    renderer.run()
+    elapsed = time.monotonic() - start
+    frames = renderer.compositor.stats.frames
+    states = renderer.frame_scheduler.frames
+    check("idle_board_sleeps", frames < 0.25 * 60 * elapsed and states["idle"] > 0,
+          f"{frames} frames in {elapsed:.2f}s, {states}")
+
+
+def main():
+    return run_checks("FRAME SCHEDULER", [
+        test_states,
+        test_idle_wait,
+        test_cpu_readout,
+        test_idle_board_frame_count,
+    ])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
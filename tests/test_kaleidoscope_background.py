@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""Pre-rendered menu background: boneglaive.graphical.ui.kaleidoscope_background.
+
+The kaleidoscope composes its symmetric pattern once into a seamless tile
+and scrolls by wrapping that tile, and the menu loop reports its frame time
+and CPU use in the FPS overlay. The tile has to repeat with the pattern's
+period, and a frame has to take at most four tile blits while matching a
+cell-by-cell draw pixel for pixel. Resizing regenerates the tile and the
+vignette; the scheduler's frame-time and CPU readouts are checked last.
+
+Run with: SDL_VIDEODRIVER=dummy SDL_AUDIODRIVER=dummy python tests/test_kaleidoscope_background.py
+"""
+import sys
+import time
+
+from harness import check, run_checks
+
+import pygame
+
+from boneglaive.graphical.frame_scheduler import FrameScheduler
+from boneglaive.graphical.ui.kaleidoscope_background import ICON_ALPHA, KaleidoscopeBackground
+
+
+class CountingSurface(pygame.Surface):
+    """Surface that counts the blits drawn onto it."""
+
+    blits = 0
+
+    def blit(self, *args, **kwargs):
+        self.blits += 1
+        return super().blit(*args, **kwargs)
+
+
+def cell_by_cell(background, width, height):
+    """The background as the old per-cell loop drew it."""
+    surface = pygame.Surface((width, height))
+    surface.fill(background.bg_color)
+    cell = background.cell_size
+    cell_offset_x = int(background.scroll_x // cell)
+    cell_offset_y = int(background.scroll_y // cell)
+    for row in range(-2, background.grid_rows + 1):
+        for col in range(-2, background.grid_cols + 1):
+            x = col * cell - background.scroll_x % cell
+            y = row * cell - background.scroll_y % cell
+            icon_idx, _, _ = background.pattern_grid[(row + cell_offset_y) % background.grid_rows][
+                (col + cell_offset_x) % background.grid_cols]
+            icon = background.icons[icon_idx].copy()
+            icon.set_alpha(ICON_ALPHA)
+            surface.blit(icon, (x + 5, y + 5))
+    surface.blit(background.vignette, (0, 0))
+    return pygame.image.tobytes(surface, "RGB")
+
+
+def setup():
+    pygame.display.init()
+    pygame.display.set_mode((640, 360))
+
+
+# --------------------------------------------------------------------------- #
+# (a) Tile
+# --------------------------------------------------------------------------- #
+def test_tile():
+    setup()
+    background = KaleidoscopeBackground(640, 360)
+    tile_width, tile_height = background.tile.get_size()
+    check("tile_is_period", (tile_width, tile_height) == (background.grid_cols * background.cell_size,
+                                                          background.grid_rows * background.cell_size))
+    check("tile_covers_screen", tile_width >= 640 + 2 * background.cell_size
+          and tile_height >= 360 + 2 * background.cell_size)
+
+    def frame(scroll_x, scroll_y):
+        background.scroll_x, background.scroll_y = scroll_x, scroll_y
+        target = pygame.Surface((640, 360))
+        background.draw(target)
+        return pygame.image.tobytes(target, "RGB")
+
+    check("seamless", frame(130, 70) == frame(130 + tile_width, 70 + 3 * tile_height))
+    for scroll in ((0, 0), (37, 13), (tile_width - 3, tile_height - 1), (5555, 4444)):
+        drawn = frame(*scroll)
+        check(f"matches_cells_{scroll[0]}_{scroll[1]}", drawn == cell_by_cell(background, 640, 360))
+
+
+def test_blit_count():
+    setup()
+    background = KaleidoscopeBackground(640, 360)
+    tile_width, tile_height = background.tile.get_size()
+    counts = []
+    for scroll in ((0, 0), (tile_width - 10, 0), (0, tile_height - 10), (tile_width - 10, tile_height - 10)):
+        background.scroll_x, background.scroll_y = scroll
+        target = CountingSurface((640, 360))
+        background.draw(target)
+        counts.append(target.blits)
+    # Tile copies plus the vignette
+    check("two_to_four_tiles", counts == [2, 3, 3, 5], str(counts))
+
+    background.scroll_x, background.scroll_y = 0, 0
+    background.update(1.0)
+    check("scrolls", (background.scroll_x, background.scroll_y) == (15, 10))
+
+
+def test_resize():
+    setup()
+    background = KaleidoscopeBackground(640, 360)
+    tile = background.tile
+    background.resize(640, 360)
+    check("same_size_kept", background.tile is tile)
+    background.resize(1280, 720)
+    check("tile_regenerated", background.tile is not tile
+          and background.tile.get_width() == background.grid_cols * background.cell_size
+          and len(background.pattern_grid) == background.grid_rows == 720 // background.cell_size + 3)
+    check("vignette_resized", background.vignette.get_size() == (1280, 720))
+    background.scroll_x, background.scroll_y = 321, 123
+    target = pygame.Surface((1280, 720))
+    background.draw(target)
+    check("resized_matches_cells", pygame.image.tobytes(target, "RGB") == cell_by_cell(background, 1280, 720))
+
+
+# --------------------------------------------------------------------------- #
+# (b) Menu frame readouts
+# --------------------------------------------------------------------------- #
+def test_frame_readouts():
+    scheduler = FrameScheduler(pygame.time.Clock(), "benchmark")
+    check("empty_readouts", scheduler.frame_ms == 0.0 and scheduler.cpu_percent == 0.0)
+    for _ in range(5):
+        scheduler.wait(True)
+        scheduler.begin_frame()
+        end = time.perf_counter() + 0.004
+        while time.perf_counter() < end:
+            pass
+        scheduler.end_frame(True, False)
+        time.sleep(0.004)
+    check("frame_ms", 3.5 <= scheduler.frame_ms <= 40, f"{scheduler.frame_ms:.1f} ms")
+    check("cpu_percent", 10 <= scheduler.cpu_percent <= 95, f"{scheduler.cpu_percent:.0f}%")
+
+
+def main():
+    return run_checks("KALEIDOSCOPE BACKGROUND", [
+        test_tile,
+        test_blit_count,
+        test_resize,
+        test_frame_readouts,
+    ])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""Legal action generation: Game.legal_actions(unit).
+
+The generator streams every move / attack / skill combination a unit may issue
+as UnitAction tuples. Every yielded action must be accepted by
+queue_unit_action() and nothing legal may be missed; the stream is lazy and
+leaves the unit untouched when the caller stops early.
+
+Run with: SDL_VIDEODRIVER=dummy SDL_AUDIODRIVER=dummy python tests/test_legal_actions.py
+"""
+import sys
+import random
+from itertools import islice
+
+from harness import check, run_checks
+
+from boneglaive.game.engine import Game
+from boneglaive.game.actions import UnitAction, queue_unit_action
+from boneglaive.game.skills.core import TargetType
+from boneglaive.game.targeting import TargetShape
+from boneglaive.utils.constants import HEIGHT, WIDTH
+from boneglaive.utils.message_log import message_log
+
+
+MAPS = ("lime_foyer", "stained_stones", "hard_pressed", "verdant_terrace")
+
+
+def fresh_game(map_name):
+    random.seed(0)
+    g = Game(skip_setup=True, map_name=map_name)
+    g.current_player = 1
+    return g
+
+
+def queues_on_clone(g, unit, action):
+    memo = {}
+    state = g.clone(memo)
+    skill = memo.get(id(action.skill)) if action.skill is not None else None
+    with message_log.suppressed():
+        return queue_unit_action(state, memo[id(unit)], action._replace(skill=skill))
+
+
+# ---------------------------------------------------------------------------
+# (a) Every yielded action is legal and appears once.
+# ---------------------------------------------------------------------------
+def test_actions_are_legal():
+    rejected = []
+    duplicates = 0
+    sampled = 0
+    for map_name in MAPS:
+        g = fresh_game(map_name)
+        for unit in list(g.units):
+            actions = list(g.legal_actions(unit))
+            duplicates += len(actions) - len(set(actions))
+            for action in random.Random(sampled).sample(actions, min(12, len(actions))):
+                if not queues_on_clone(g, unit, action):
+                    rejected.append((map_name, unit.type.name, action.kind))
+                sampled += 1
+    check("actions_are_legal", not rejected and sampled > 0, f"sampled={sampled} rejected={rejected[:4]}")
+    check("actions_unique", duplicates == 0, f"duplicates={duplicates}")
+
+
+# ---------------------------------------------------------------------------
+# (b) Nothing legal is missed: brute force over the board from every origin.
+# ---------------------------------------------------------------------------
+def test_actions_complete():
+    missing = []
+    for map_name in MAPS[:2]:
+        g = fresh_game(map_name)
+        for unit in [u for u in g.units if u.player == 1]:
+            actions = set(g.legal_actions(unit))
+            for move in [None] + g.get_possible_moves(unit):
+                if move is not None and UnitAction(move=move) not in actions:
+                    missing.append((unit.type.name, "move", move))
+                for y in range(HEIGHT):
+                    for x in range(WIDTH):
+                        if (g.get_unit_at(y, x) is not None and g.get_unit_at(y, x).player != unit.player
+                                and g.can_attack(unit, y, x, from_pos=move)
+                                and UnitAction(move=move, attack=(y, x)) not in actions):
+                            missing.append((unit.type.name, "attack", move, (y, x)))
+                unit.move_target = move
+                for skill in unit.active_skills:
+                    if (skill.current_cooldown or skill.target_type in (TargetType.SELF, TargetType.NONE)
+                            or skill.target_shape not in (None, TargetShape.AREA)):
+                        continue
+                    for y in range(HEIGHT):
+                        for x in range(WIDTH):
+                            if (skill.can_use(unit, (y, x), g)
+                                    and UnitAction(move=move, skill=skill, target=(y, x)) not in actions):
+                                missing.append((unit.type.name, skill.name, move, (y, x)))
+                unit.move_target = None
+    check("actions_complete", not missing, f"missing={missing[:4]}")
+
+
+# ---------------------------------------------------------------------------
+# (c) The stream is lazy and stopping early leaves the unit untouched.
+# ---------------------------------------------------------------------------
+def test_actions_lazy():
+    g = fresh_game("hard_pressed")
+    unit = next(u for u in g.units if u.player == 1)
+    calls = []
+    original = g.get_possible_attacks
+    g.get_possible_attacks = lambda *args, **kwargs: calls.append(args) or original(*args, **kwargs)
+
+    stream = g.legal_actions(unit)
+    first = list(islice(stream, 2))
+    check("actions_lazy", first[0] == UnitAction() and len(calls) <= 1,
+          f"attack scans after 2 actions={len(calls)}")
+
+    list(islice(stream, 50))
+    del stream
+    check("actions_early_stop_clean", unit.move_target is None and unit.skill_target is None,
+          "no targets left queued")
+
+
+def main():
+    return run_checks("LEGAL ACTIONS", [
+        test_actions_are_legal,
+        test_actions_complete,
+        test_actions_lazy,
+    ])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""Opening book and placement optimizer: boneglaive.game.opening_book, boneglaive.ai.placement.
+
+The AI's vs-AI setup looks its roster up in the opening book before falling
+back to a random formation. The book must round-trip, key rosters regardless
+of order and reject stale entries, and the engine must place from it. A tiny
+optimizer run plays through the real setup phase and records its best
+candidate, but only when it wins more often than random formations.
+
+Run with: SDL_VIDEODRIVER=dummy SDL_AUDIODRIVER=dummy python tests/test_opening_book.py
+"""
+import os
+import sys
+import random
+import tempfile
+
+from harness import check, run_checks
+
+from boneglaive.game.engine import Game
+from boneglaive.game import opening_book as book_module
+from boneglaive.game.opening_book import OpeningBook
+from boneglaive.utils.config import ConfigManager, GameMode
+from boneglaive.utils.constants import HEIGHT, UnitType, WIDTH
+from boneglaive.utils.message_log import message_log
+from boneglaive.ai.placement import (PlacementOptimizer, all_rosters, candidate_placements, random_formations,
+                                     setup_game)
+
+
+ROSTER = [UnitType.GLAIVEMAN, UnitType.GRAYMAN, UnitType.LANDSCAPER]
+
+
+def placeable(map_name="lime_foyer"):
+    g = Game(skip_setup=False, map_name=map_name)
+    return [(y, x) for y in range(HEIGHT) for x in range(WIDTH) if g.map.can_place_unit(y, x)]
+
+
+# --------------------------------------------------------------------------- #
+# (a) Book round trip
+# --------------------------------------------------------------------------- #
+def test_round_trip():
+    with tempfile.TemporaryDirectory() as tmp:
+        tiles = placeable()[:3]
+        placement = [(t, y, x) for t, (y, x) in zip(ROSTER, tiles)]
+        path = os.path.join(tmp, "book.json")
+        book = OpeningBook(path)
+        book.record("lime_foyer", 2, placement, 0.625, 16)
+        book.save()
+
+        reloaded = OpeningBook(path)
+        shuffled = list(reversed(ROSTER))
+        check("lookup_any_roster_order", reloaded.lookup("lime_foyer", 2, shuffled) == placement)
+        check("has_entry", reloaded.has("lime_foyer", 2, ROSTER))
+        check("other_player_absent", reloaded.lookup("lime_foyer", 1, ROSTER) is None)
+        check("other_map_absent", reloaded.lookup("stained_stones", 2, ROSTER) is None)
+        check("missing_file_is_empty", OpeningBook(os.path.join(tmp, "none.json")).lookup("lime_foyer", 2, ROSTER) is None)
+
+
+# --------------------------------------------------------------------------- #
+# (b) Stale entries
+# --------------------------------------------------------------------------- #
+def test_rejects_stale_entry():
+    with tempfile.TemporaryDirectory() as tmp:
+        g = Game(skip_setup=False, map_name="lime_foyer")
+        blocked = next((y, x) for y in range(HEIGHT) for x in range(WIDTH) if not g.map.can_place_unit(y, x))
+        tiles = placeable()[:2] + [blocked]
+        book = OpeningBook(os.path.join(tmp, "stale.json"))
+        book.record("lime_foyer", 2, [(t, y, x) for t, (y, x) in zip(ROSTER, tiles)], 1.0, 1)
+        check("blocked_tile_rejected", book.placement_for(g, 2, ROSTER) is None)
+
+        tile = placeable()[0]
+        book.record("lime_foyer", 2, [(t, tile[0], tile[1]) for t in ROSTER], 1.0, 1)
+        check("shared_tile_rejected", book.placement_for(g, 2, ROSTER) is None)
+
+
+# --------------------------------------------------------------------------- #
+# (c) The engine's vs-AI setup uses the book
+# --------------------------------------------------------------------------- #
+def test_engine_uses_book():
+    with tempfile.TemporaryDirectory() as tmp:
+        original_get = ConfigManager.get
+        original_book = book_module.opening_book
+        try:
+            ConfigManager.get = lambda self, key, default=None: (
+                GameMode.VS_AI.value if key == 'game_mode' else original_get(self, key, default))
+
+            # Whatever roster the AI draws, the book has a placement for it on the same tiles
+            tiles = placeable()[-3:]
+            book = OpeningBook(os.path.join(tmp, "engine.json"))
+            for roster in all_rosters():
+                book.record("lime_foyer", 2, [(t, y, x) for t, (y, x) in zip(roster, tiles)], 1.0, 1)
+            book_module.opening_book = book
+
+            g = Game(skip_setup=False, map_name="lime_foyer")
+            g._place_default_units_for_player(2)
+            placed = sorted((u.y, u.x) for u in g.units if u.player == 2)
+            check("book_placement_used", placed == sorted(tiles), f"{placed} vs {sorted(tiles)}")
+        finally:
+            ConfigManager.get = original_get
+            book_module.opening_book = original_book
+
+
+# --------------------------------------------------------------------------- #
+# (d) Optimizer
+# --------------------------------------------------------------------------- #
+def test_setup_game():
+    tiles = placeable()
+    p1 = [(t, y, x) for t, (y, x) in zip(ROSTER, tiles[:3])]
+    p2 = [(t, y, x) for t, (y, x) in zip(ROSTER, tiles[-3:])]
+    with message_log.suppressed():
+        g = setup_game("lime_foyer", 1, {1: p1, 2: p2})
+    check("setup_phase_complete", not g.setup_phase and g.current_player == 1)
+    check("both_players_placed", sorted(u.player for u in g.units) == [1, 1, 1, 2, 2, 2])
+
+
+def test_candidates():
+    state = random.getstate()
+    first = candidate_placements("lime_foyer", ROSTER, 6)
+    check("random_state_restored", random.getstate() == state)
+    check("candidates_distinct", len({frozenset(c) for c in first}) == len(first) > 1, f"{len(first)}")
+    check("candidates_reproducible", candidate_placements("lime_foyer", ROSTER, 6) == first)
+    legal = set(placeable())
+    check("candidates_legal", all({t for t, _, _ in c} == set(ROSTER)
+                                  and all((y, x) in legal for _, y, x in c) for c in first))
+
+
+def test_random_formations():
+    state = random.getstate()
+    baselines = random_formations("lime_foyer", ROSTER, 4)
+    check("baseline_random_state_restored", random.getstate() == state)
+    check("baseline_reproducible", random_formations("lime_foyer", ROSTER, 4) == baselines)
+    legal = set(placeable())
+    check("baseline_legal", len(baselines) == 4 and all(
+        {t for t, _, _ in b} == set(ROSTER) and len({(y, x) for _, y, x in b}) == 3
+        and all((y, x) in legal for _, y, x in b) for b in baselines))
+
+
+def test_optimizer_records_best():
+    with tempfile.TemporaryDirectory() as tmp:
+        book = OpeningBook(os.path.join(tmp, "opt.json"))
+        optimizer = PlacementOptimizer(book, player=2, candidates=2, playouts=1, beam_width=0, max_turns=20)
+        result = optimizer.optimize("lime_foyer", ROSTER)
+        if result is None:
+            check("nothing_recorded_without_beating_baseline", not book.has("lime_foyer", 2, ROSTER))
+        else:
+            best, score = result
+            check("best_recorded", book.lookup("lime_foyer", 2, ROSTER) == best)
+            check("best_is_candidate", best in candidate_placements("lime_foyer", ROSTER, 2))
+            check("score_in_range", 0.0 < score <= 1.0, f"{score}")
+
+
+def test_optimizer_requires_beating_baseline():
+    """Candidates that only match the random-formation baseline are not recorded."""
+    import boneglaive.ai.placement as placement_module
+    original = placement_module._playout
+    with tempfile.TemporaryDirectory() as tmp:
+        try:
+            book = OpeningBook(os.path.join(tmp, "baseline.json"))
+            optimizer = PlacementOptimizer(book, player=2, candidates=2, playouts=2)
+            placement_module._playout = lambda task: (0.5, 0)
+            check("tie_not_recorded", optimizer.optimize("lime_foyer", ROSTER) is None
+                  and not book.has("lime_foyer", 2, ROSTER))
+
+            placement_module._playout = lambda task: (0.0, 5)
+            check("gp_lead_alone_not_recorded", optimizer.optimize("lime_foyer", ROSTER) is None)
+
+            # Only the first candidate's tiles win
+            first = candidate_placements("lime_foyer", ROSTER, 2)[0]
+            first_tiles = [(t.name, y, x) for t, y, x in first]
+            placement_module._playout = lambda task: (float(task[2] == first_tiles), 0)
+            best, score = optimizer.optimize("lime_foyer", ROSTER)
+            check("winner_recorded", best == first and score == 1.0
+                  and book.lookup("lime_foyer", 2, ROSTER) == first)
+        finally:
+            placement_module._playout = original
+
+
+def main():
+    return run_checks("OPENING BOOK", [
+        test_round_trip,
+        test_rejects_stale_entry,
+        test_engine_uses_book,
+        test_setup_game,
+        test_candidates,
+        test_random_formations,
+        test_optimizer_records_best,
+        test_optimizer_requires_beating_baseline,
+    ])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
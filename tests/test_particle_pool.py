@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""Structure-of-arrays particles: boneglaive.graphical.animations.particle_pool.
+
+The renderer's ParticleEmitter keeps its particles in a fixed-capacity
+ParticlePool of NumPy columns, and animations still add Particle objects
+through emitter.particles.append(). The vectorized update is compared with
+Particle.update step for step. Expired particles are compacted out in spawn
+order, spawns past capacity are dropped and counted, the stamp-batched draw
+lands where Particle.draw would, and the emit_* helpers fill the pool.
+
+Run with: SDL_VIDEODRIVER=dummy SDL_AUDIODRIVER=dummy python tests/test_particle_pool.py
+"""
+import sys
+
+from harness import check, run_checks
+
+import pygame
+
+from boneglaive.graphical.animations.core import Particle, ParticleEmitter
+from boneglaive.graphical.animations.particle_pool import ParticlePool
+
+# --------------------------------------------------------------------------- #
+# (a) Simulation
+# --------------------------------------------------------------------------- #
+def test_update_matches_particle():
+    reference = Particle(10.0, 20.0, 30.0, -40.0, (1, 2, 3), 4.0, 1.0)
+    reference.gravity = 200
+    pool = ParticlePool(capacity=8)
+    pool.spawn(10.0, 20.0, 30.0, -40.0, (1, 2, 3), 4.0, 1.0, gravity=200)
+    for _ in range(10):
+        reference.update(0.05)
+        pool.update(0.05)
+    x, y, vx, vy, _, _, life, _, _, _ = pool.row(0)
+    check("same_motion", abs(x - reference.x) < 1e-3 and abs(y - reference.y) < 1e-3
+          and abs(vy - reference.vy) < 1e-3 and abs(life - reference.lifetime) < 1e-5,
+          f"{x:.3f},{y:.3f} vs {reference.x:.3f},{reference.y:.3f}")
+
+    pool = ParticlePool(capacity=8)
+    for i, lifetime in enumerate((0.5, 0.1, 0.5, 0.1, 0.5)):
+        pool.spawn(i, 0, 0, 0, (i, 0, 0), 2, lifetime)
+    pool.update(0.2)
+    check("expired_compacted", len(pool) == 3 and [pool.row(i)[0] for i in range(3)] == [0.0, 2.0, 4.0])
+    check("columns_follow", [pool.row(i)[4] for i in range(3)] == [(0, 0, 0), (2, 0, 0), (4, 0, 0)])
+
+
+def test_capacity():
+    pool = ParticlePool(capacity=5)
+    added = pool.spawn_many([0, 1, 2, 3], 0, 0, 0, (9, 9, 9), 2, 1.0)
+    check("many_added", added == 4 and len(pool) == 4)
+    check("single_dropped", pool.spawn(0, 0, 0, 0, (0, 0, 0), 2, 1.0) and not pool.spawn(0, 0, 0, 0, (0, 0, 0), 2, 1.0))
+    check("many_dropped", pool.spawn_many(0, 0, 0, [1, 2, 3], (0, 0, 0), 2, 1.0) == 0 and pool.dropped == 4)
+    pool.update(2.0)
+    check("room_after_expiry", len(pool) == 0 and pool.spawn(0, 0, 0, 0, (0, 0, 0), 2, 1.0))
+
+
+# --------------------------------------------------------------------------- #
+# (b) Drawing
+# --------------------------------------------------------------------------- #
+def test_draw_matches_particle():
+    pygame.display.init()
+    pygame.display.set_mode((64, 64))
+
+    reference = Particle(20.6, 30.2, 0, 0, (200, 40, 10), 5.0, 1.0)
+    expected = pygame.Surface((64, 64))
+    expected.fill((0, 0, 60))
+    reference.draw(expected)
+
+    pool = ParticlePool()
+    pool.spawn(20.6, 30.2, 0, 0, (200, 40, 10), 5.0, 1.0)
+    drawn = pygame.Surface((64, 64))
+    drawn.fill((0, 0, 60))
+    count = pool.draw(drawn)
+    same = all(drawn.get_at((x, y)) == expected.get_at((x, y)) for x in range(64) for y in range(64))
+    check("fresh_particle_exact", count == 1 and same)
+
+    # Half-faded: alpha is quantized, so allow a couple of levels of difference
+    reference.lifetime = pool.life[0] = 0.5
+    expected.fill((0, 0, 60))
+    reference.draw(expected)
+    drawn.fill((0, 0, 60))
+    pool.draw(drawn)
+    diff = max(abs(a - b) for a, b in zip(drawn.get_at((20, 30)), expected.get_at((20, 30))))
+    check("faded_close", diff <= 6, f"max channel diff {diff}")
+
+    pool.spawn(5, 5, 0, 0, (200, 40, 10), 0.5, 1.0)   # Radius 0: nothing to draw
+    pool.spawn(40, 40, 0, 0, (200, 40, 10), 5.0, 1.0)
+    check("shared_stamp", pool.draw(drawn) == 2 and pool.stamp_count() == 2, str(pool.stamp_count()))
+
+
+# --------------------------------------------------------------------------- #
+# (c) Emitter
+# --------------------------------------------------------------------------- #
+def test_emitter():
+    emitter = ParticleEmitter(capacity=500)
+    emitter.emit_blood_explosion(100, 100)
+    check("blood_count", len(emitter.particles) == 100)
+    emitter.emit_burst(0, 0, (255, 215, 0, 128), count=10)
+    emitter.emit_trail(0, 0, (1, 1, 1))
+    emitter.emit_float(0, 0, (1, 1, 1))
+    emitter.emit_beam(0, 0, 90, 0, (1, 1, 1), count=30)
+    check("emit_helpers", len(emitter.particles) == 155)
+    beam_x = sorted(row[0] for row in (emitter.pool.row(i) for i in range(125, 155)))
+    check("beam_spread", beam_x[0] == 0 and beam_x[-1] == 87.0, str(beam_x[-1]))
+
+    particle = Particle(1, 2, 3, 4, (5, 6, 7, 255), 3, 0.8)
+    particle.lifetime = 0.4
+    particle.gravity = -20
+    particle.fade = False
+    emitter.particles.append(particle)
+    last = list(emitter.particles)[-1]
+    check("append_copies", abs(last.lifetime - 0.4) < 1e-6 and abs(last.max_lifetime - 0.8) < 1e-6
+          and last.gravity == -20 and last.fade is False and last.color == (5, 6, 7))
+
+    emitter.update(2.0)
+    check("all_expire", not emitter.particles and len(emitter.particles) == 0)
+
+
+def main():
+    return run_checks("PARTICLE POOL", [
+        test_update_matches_particle,
+        test_capacity,
+        test_draw_matches_particle,
+        test_emitter,
+    ])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
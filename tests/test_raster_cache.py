@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""On-disk SVG raster cache: boneglaive.utils.raster_cache.
+
+load_svg() keeps rasterized SVGs as raw RGBA blobs under the user config
+directory, keyed by cache format version, SVG contents and output size.
+Covered: the key and the blob round trip; damaged or foreign entries counting
+as misses; pruning of other format versions; least-recently-used eviction
+within the disk and memory budgets; and load_svg() building its surface from
+a cached blob without rasterizing.
+
+Run with: SDL_VIDEODRIVER=dummy SDL_AUDIODRIVER=dummy python tests/test_raster_cache.py
+"""
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+from harness import check, run_checks
+
+import pygame
+
+from boneglaive.utils import raster_cache as rc
+from boneglaive.utils.raster_cache import RasterCache
+
+
+SVG = b'<svg xmlns="http://www.w3.org/2000/svg" width="4" height="2"><rect width="4" height="2" fill="red"/></svg>'
+
+
+def red_pixels(width, height):
+    return bytes((255, 0, 0, 255)) * (width * height)
+
+
+# --------------------------------------------------------------------------- #
+# (a) Keys and blobs
+# --------------------------------------------------------------------------- #
+def test_keys():
+    key = RasterCache.key(SVG, 32, 32)
+    check("key_stable", key == RasterCache.key(SVG, 32, 32))
+    check("key_versioned", key.startswith(f"v{rc.CACHE_FORMAT_VERSION}-"))
+    check("key_size", key != RasterCache.key(SVG, 32, 64) and key != RasterCache.key(SVG, 64, 32))
+    check("key_contents", key != RasterCache.key(SVG.replace(b"red", b"blue"), 32, 32))
+
+
+def test_round_trip():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = RasterCache(Path(tmp))
+        key = RasterCache.key(SVG, 4, 2)
+        check("cold_miss", cache.get(key) is None and cache.stats.misses == 1)
+
+        cache.put(key, red_pixels(4, 2), (4, 2))
+        check("written", cache.stats.writes == 1 and list(Path(tmp).glob("*.tmp")) == [])
+        entry = cache.get(key)
+        check("hit", entry == (red_pixels(4, 2), (4, 2)) and cache.stats.hits == 1)
+
+        # A new cache over the same directory (the next launch) still hits
+        check("persists", RasterCache(Path(tmp)).get(key) is not None)
+
+        path = Path(tmp) / f"{key}.rgba"
+        path.write_bytes(path.read_bytes()[:-3])
+        check("truncated_misses", cache.get(key) is None and cache.stats.errors == 1)
+        path.write_bytes(b"not a blob")
+        check("foreign_misses", cache.get(key) is None)
+        cache.put(key, red_pixels(4, 2), (4, 2))
+        check("rewritten", cache.get(key) is not None)
+
+        disabled = RasterCache(Path(tmp), enabled=False)
+        check("disabled_misses", disabled.get(key) is None)
+
+        cache.clear()
+        check("cleared", list(Path(tmp).glob("*.rgba")) == [])
+
+
+def test_prune_other_versions():
+    with tempfile.TemporaryDirectory() as tmp:
+        stale = Path(tmp) / f"v{rc.CACHE_FORMAT_VERSION + 1}-abc.rgba"
+        stale.write_bytes(b"old")
+        cache = RasterCache(Path(tmp))
+        cache.put(RasterCache.key(SVG, 4, 2), red_pixels(4, 2), (4, 2))
+        check("stale_version_pruned", not stale.exists() and len(list(Path(tmp).glob("*.rgba"))) == 1)
+
+
+# --------------------------------------------------------------------------- #
+# (b) Budgets
+# --------------------------------------------------------------------------- #
+def test_lru_budget():
+    entry_bytes = rc._HEADER.size + len(red_pixels(4, 2))
+    keys = [RasterCache.key(SVG, 4, 2 + i) for i in range(4)]
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = RasterCache(Path(tmp), budget_bytes=3 * entry_bytes)
+        for key in keys[:3]:
+            cache.put(key, red_pixels(4, 2), (4, 2))
+        check("within_budget_kept", len(list(Path(tmp).glob("*.rgba"))) == 3 and cache.stats.evictions == 0)
+
+        cache.get(keys[0])
+        cache.put(keys[3], red_pixels(4, 2), (4, 2))
+        stored = {path.stem for path in Path(tmp).glob("*.rgba")}
+        check("lru_evicted", stored == {keys[0], keys[2], keys[3]} and cache.stats.evictions == 1,
+              cache.stats.summary())
+        check("bytes_bounded", cache.bytes == 3 * entry_bytes)
+
+        # The next launch orders entries by mtime, which a hit refreshes
+        for age, key in enumerate((keys[3], keys[2], keys[0])):
+            os.utime(Path(tmp) / f"{key}.rgba", (1000 - age, 1000 - age))
+        relaunched = RasterCache(Path(tmp), budget_bytes=3 * entry_bytes)
+        relaunched.put(keys[1], red_pixels(4, 2), (4, 2))
+        stored = {path.stem for path in Path(tmp).glob("*.rgba")}
+        check("lru_across_runs", stored == {keys[1], keys[2], keys[3]}, str(relaunched.stats.summary()))
+
+        remembering = RasterCache(Path(tmp), memory_budget_bytes=2 * len(red_pixels(4, 2)))
+        for key in keys[:3]:
+            remembering.remember(key, red_pixels(4, 2), (4, 2))
+        check("memory_bounded", list(remembering._memory) == keys[1:3]
+              and remembering._memory_bytes == 2 * len(red_pixels(4, 2)))
+
+
+# --------------------------------------------------------------------------- #
+# (c) load_svg from a warm cache
+# --------------------------------------------------------------------------- #
+def test_load_svg_hit():
+    from boneglaive.utils import paths
+
+    pygame.display.init()
+    pygame.display.set_mode((64, 64))
+    saved = rc.raster_cache
+    with tempfile.TemporaryDirectory() as tmp:
+        svg_path = Path(tmp) / "tile.svg"
+        svg_path.write_bytes(SVG)
+        rc.raster_cache = RasterCache(Path(tmp) / "cache")
+        try:
+            rc.raster_cache.put(RasterCache.key(SVG, 4, 2), red_pixels(4, 2), (4, 2))
+            surface = paths.load_svg(str(svg_path), 4, 2)
+            check("surface_from_blob", surface is not None and surface.get_size() == (4, 2)
+                  and tuple(surface.get_at((3, 1))) == (255, 0, 0, 255))
+            check("hit_counted", rc.raster_cache.stats.hits == 1 and rc.raster_cache.stats.misses == 0,
+                  rc.raster_cache.stats.summary())
+            check("missing_file_none", paths.load_svg(str(Path(tmp) / "absent.svg"), 4, 2) is None)
+        finally:
+            rc.raster_cache = saved
+
+
+def main():
+    return run_checks("RASTER CACHE", [
+        test_keys,
+        test_round_trip,
+        test_prune_other_versions,
+        test_lru_budget,
+        test_load_svg_hit,
+    ])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
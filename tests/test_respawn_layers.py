@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""Board layers and vectorized respawn scoring: boneglaive.game.board_layers.
+
+Respawn tiles come from a cached passability mask minus the occupancy mask, and
+SmartAI scores every tile at once from threat and ally-distance layers. Both
+are compared with the per-tile loops they replaced (same tiles, same order,
+same chosen spawn). The passability cache has to follow terrain changes, and
+a clone has to build its own layers.
+
+Run with: SDL_VIDEODRIVER=dummy SDL_AUDIODRIVER=dummy python tests/test_respawn_layers.py
+"""
+import sys
+import time
+import random
+
+from harness import check, run_checks
+
+from boneglaive.game.engine import Game
+from boneglaive.game.map import TerrainType
+from boneglaive.utils.constants import HEIGHT, UnitType, WIDTH
+from boneglaive.ai.battlefield_analyzer import BattlefieldAnalyzer
+from boneglaive.ai.smart_ai import SmartAI
+
+
+MAPS = ("lime_foyer", "stained_stones", "hard_pressed", "verdant_terrace")
+
+
+def reference_tiles(game):
+    """The per-tile loop respawn tiles used to come from."""
+    return [(y, x) for y in range(HEIGHT) for x in range(WIDTH)
+            if game.is_valid_position(y, x) and game.map.is_passable(y, x)
+            and game.get_unit_at(y, x) is None]
+
+
+def reference_spawn(game, analysis):
+    """The per-tile spawn scorer SmartAI used before the score layer."""
+    best_pos, best_score = None, float('-inf')
+    for pos in reference_tiles(game):
+        score = 0.0
+        if pos not in analysis.threat_map:
+            score += 30
+        else:
+            score -= analysis.threat_map[pos].threat_level
+        if analysis.ai_units:
+            d = min(game.chess_distance(pos[0], pos[1], a.y, a.x) for a in analysis.ai_units)
+            if 3 <= d <= 5:
+                score += 20
+            elif d < 3:
+                score += 5
+            else:
+                score -= d
+        if score > best_score:
+            best_score, best_pos = score, pos
+    return best_pos
+
+
+def scattered_game(map_name, seed, per_side):
+    """A game with `per_side` units per player on random placeable tiles."""
+    random.seed(seed)
+    g = Game(skip_setup=True, map_name=map_name)
+    g.units = []
+    g.unit_grid.clear()
+    tiles = [(y, x) for y in range(HEIGHT) for x in range(WIDTH) if g.map.can_place_unit(y, x)]
+    types = [UnitType.GLAIVEMAN, UnitType.MANDIBLE_FOREMAN, UnitType.GRAYMAN]
+    for i, (y, x) in enumerate(random.sample(tiles, per_side * 2)):
+        g.add_unit(types[i % len(types)], 1 + i % 2, y, x)
+    return g
+
+
+# --------------------------------------------------------------------------- #
+# (a) Respawn tiles
+# --------------------------------------------------------------------------- #
+def test_respawn_tiles_match():
+    for map_name in MAPS:
+        for seed in range(3):
+            g = scattered_game(map_name, seed, 3)
+            check(f"tiles_{map_name}_{seed}", g.get_valid_respawn_tiles(1) == reference_tiles(g))
+
+
+def test_passable_cache_follows_terrain():
+    g = scattered_game("lime_foyer", 0, 1)
+    tiles = g.get_valid_respawn_tiles(1)
+    y, x = tiles[0]
+    g.map.set_terrain_at(y, x, TerrainType.PILLAR)
+    after = g.get_valid_respawn_tiles(1)
+    check("terrain_change_seen", (y, x) not in after and after == reference_tiles(g))
+
+    unit = g.units[0]
+    old = (unit.y, unit.x)
+    unit.hp = 0
+    check("dead_unit_frees_tile", old in g.get_valid_respawn_tiles(1))
+
+
+def test_clone_has_own_layers():
+    g = scattered_game("lime_foyer", 1, 2)
+    g.get_valid_respawn_tiles(1)
+    clone = g.clone()
+    check("clone_layers_fresh", clone.board_layers is not g.board_layers
+          and clone.board_layers.game is clone)
+
+
+# --------------------------------------------------------------------------- #
+# (b) SmartAI spawn choice
+# --------------------------------------------------------------------------- #
+def test_spawn_choice_matches():
+    mismatches = []
+    loop_time = layer_time = 0.0
+    for map_name in MAPS:
+        for seed in range(5):
+            g = scattered_game(map_name, seed, 1 + seed % 3)
+            for player in (1, 2):
+                analysis = BattlefieldAnalyzer(g, player).analyze()
+                ai = SmartAI(g, player_number=player)
+                start = time.perf_counter()
+                expected = reference_spawn(g, analysis)
+                loop_time += time.perf_counter() - start
+                start = time.perf_counter()
+                chosen = ai._find_respawn_location(None, ai._score_spawn_layer(analysis))
+                layer_time += time.perf_counter() - start
+                if chosen != expected:
+                    mismatches.append((map_name, seed, player, chosen, expected))
+    check("spawn_choice_unchanged", not mismatches, f"{mismatches[:3]}")
+    print(f"  spawn choice: per-tile {loop_time * 1000:.1f} ms, layers {layer_time * 1000:.1f} ms (40 decisions)")
+
+
+def test_full_board_has_no_spawn():
+    g = scattered_game("lime_foyer", 2, 1)
+    analysis = BattlefieldAnalyzer(g, 2).analyze()
+    ai = SmartAI(g, player_number=2)
+    for y in range(HEIGHT):
+        for x in range(WIDTH):
+            g.map.terrain[(y, x)] = TerrainType.PILLAR
+    g.map.version += 1
+    check("no_tile_no_spawn", ai._find_respawn_location(None, ai._score_spawn_layer(analysis)) is None)
+
+
+def main():
+    return run_checks("RESPAWN LAYERS", [
+        test_respawn_tiles_match,
+        test_passable_cache_follows_terrain,
+        test_clone_has_own_layers,
+        test_spawn_choice_matches,
+        test_full_board_has_no_spawn,
+    ])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
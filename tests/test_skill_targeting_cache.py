@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""Shared skill-target candidate generation (boneglaive.game.targeting).
+
+Skills declare their board-level target requirements (range, shape, passable,
+empty, line of sight); the game caches one mask per (origin, geometry) until a
+unit moves or terrain changes. The cached candidates are compared with the
+tiles can_use() accepts, the cache is changed under its feet to check
+invalidation, and the renderer's skill-range overlay must come out the same.
+
+Run with: SDL_VIDEODRIVER=dummy SDL_AUDIODRIVER=dummy python tests/test_skill_targeting_cache.py
+"""
+import sys
+import random
+
+from harness import check, run_checks
+
+from boneglaive.game.engine import Game
+from boneglaive.game.map import TerrainType
+from boneglaive.game.skills.core import TargetType
+from boneglaive.game.targeting import TargetShape, skill_target_candidates
+from boneglaive.utils.constants import UnitType, HEIGHT, WIDTH
+from boneglaive.graphical.game_state import GameStateAdapter
+
+
+MAPS = ("lime_foyer", "stained_stones", "hard_pressed", "verdant_terrace")
+PLAYABLE = [t for t in UnitType if t not in (UnitType.HEINOUS_VAPOR, UnitType.ORDNANCE_DRONE)]
+
+
+def free_tiles(g):
+    return [(y, x) for y in range(HEIGHT) for x in range(WIDTH)
+            if g.map.can_place_unit(y, x) and g.get_unit_at(y, x) is None]
+
+
+def mixed_game(map_name, seed):
+    """Every playable unit type on the board, split between both players."""
+    random.seed(seed)
+    g = Game(skip_setup=True, map_name=map_name)
+    g.units = []
+    g.unit_grid = {}
+    tiles = free_tiles(g)
+    random.shuffle(tiles)
+    for i, utype in enumerate(PLAYABLE * 2):
+        y, x = tiles[i]
+        g.add_unit(utype, 1 + i % 2, y, x)
+    return g
+
+
+def brute_force(skill, unit, g):
+    """Every tile on the board can_use() accepts, row-major."""
+    return [(y, x) for y in range(HEIGHT) for x in range(WIDTH) if skill.can_use(unit, (y, x), g)]
+
+
+def legacy_overlay(skill, unit, g):
+    """The skill-range overlay as GameStateAdapter computed it before the shared masks."""
+    from_y, from_x = unit.move_target if unit.move_target else (unit.y, unit.x)
+    if skill.name == "Gaussian Dusk":
+        return sorted((x, y) for y in range(HEIGHT) for x in range(WIDTH)
+                      if (y == from_y) != (x == from_x))
+    if skill.name in ("Hornswoggle", "Topiary Breath"):
+        return [(from_x + dx, from_y + dy) for dy in (-1, 0, 1) for dx in (-1, 0, 1)
+                if (dy or dx) and g.is_valid_position(from_y + dy, from_x + dx)]
+    reach = skill.get_target_range(unit, g)
+    return [(x, y) for y in range(HEIGHT) for x in range(WIDTH)
+            if g.chess_distance(from_y, from_x, y, x) <= reach and skill.can_use(unit, (y, x), g)]
+
+
+# ---------------------------------------------------------------------------
+# (a) Cached candidates == brute-force can_use() for every tile-targeted skill
+#     with an AREA geometry, from the unit's tile and from a planned move.
+#     (Self-cast skills accept any target_pos, so they have no candidate set.)
+# ---------------------------------------------------------------------------
+def test_candidates_match_brute_force():
+    mismatches = []
+    compared = 0
+    for map_name in MAPS:
+        g = mixed_game(map_name, 3)
+        for unit in list(g.units):
+            for skill in unit.active_skills:
+                if skill.target_shape not in (None, TargetShape.AREA):
+                    continue
+                if skill.target_type in (TargetType.SELF, TargetType.NONE):
+                    continue
+                for move in (None, next(iter(free_tiles(g)), None)):
+                    unit.move_target = move
+                    if skill_target_candidates(skill, unit, g) != brute_force(skill, unit, g):
+                        mismatches.append((map_name, unit.type.name, skill.name, move))
+                    compared += 1
+                unit.move_target = None
+    check("candidates_match_brute_force", not mismatches and compared > 0,
+          f"compared={compared} mismatches={mismatches[:4]}")
+
+
+# ---------------------------------------------------------------------------
+# (b) Masks are reused until occupancy or terrain changes.
+# ---------------------------------------------------------------------------
+def test_cache_invalidation():
+    g = mixed_game("lime_foyer", 5)
+    gm = next(u for u in g.units if u.type == UnitType.GAS_MACHINIST)
+    skill = next(s for s in gm.active_skills if s.target_requires_empty)
+    geometry = skill.target_geometry(gm, g)
+    origin = (gm.y, gm.x)
+
+    first = g.targeting.tiles(origin, geometry)
+    misses = g.targeting.misses
+    g.targeting.tiles(origin, geometry)
+    check("cache_hit_on_repeat", g.targeting.misses == misses and g.targeting.hits > 0,
+          f"hits={g.targeting.hits} misses={g.targeting.misses}")
+
+    # A unit stepping onto a candidate tile removes it from an "empty" mask
+    target = next(iter(sorted(first)))
+    mover = next(u for u in g.units if u is not gm)
+    del g.unit_grid[(mover.y, mover.x)]
+    mover.y, mover.x = target
+    g.unit_grid[target] = mover
+    moved = g.targeting.tiles(origin, geometry)
+    check("cache_invalidates_on_move", target not in moved and g.targeting.misses == misses + 1,
+          f"target={target} in_mask={target in moved}")
+
+    # Terrain turning impassable removes it from a "passable" mask
+    tile = next(t for t in sorted(moved) if t != target)
+    g.map.set_terrain_at(tile[0], tile[1], TerrainType.LIMESTONE)
+    walled = g.targeting.tiles(origin, geometry)
+    check("cache_invalidates_on_terrain", tile not in walled, f"tile={tile}")
+
+    # A clone starts with its own cache
+    clone = g.clone()
+    check("clone_has_fresh_cache", clone.targeting is not g.targeting and clone.targeting.misses == 0,
+          "independent TargetingCache")
+
+
+# ---------------------------------------------------------------------------
+# (c) The renderer's skill-range overlay is unchanged.
+# ---------------------------------------------------------------------------
+def test_overlay_unchanged():
+    adapter = GameStateAdapter()
+    mismatches = []
+    compared = 0
+    for map_name in MAPS:
+        g = mixed_game(map_name, 7)
+        adapter.game = g
+        for unit in list(g.units):
+            for skill in unit.active_skills:
+                got = adapter.get_skill_range(unit, skill)
+                if sorted(got) != sorted(legacy_overlay(skill, unit, g)):
+                    mismatches.append((map_name, unit.type.name, skill.name))
+                compared += 1
+    check("overlay_unchanged", not mismatches and compared > 0,
+          f"compared={compared} mismatches={mismatches[:4]}")
+
+
+def main():
+    return run_checks("SKILL TARGETING CACHE", [
+        test_candidates_match_brute_force,
+        test_cache_invalidation,
+        test_overlay_unchanged,
+    ])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""Shared text render cache: boneglaive.graphical.ui.font_utils.
+
+UI widgets, floating numbers and the renderer's overlays draw their labels
+through render_text(), which hands back cached surfaces instead of
+rasterizing the text again every frame. Cached text has to match
+font.render() pixel for pixel, with a key covering font, text, antialias and
+colours, and the alpha argument must not leak between callers. The cache
+keeps to its byte budget in LRU order, and widgets draw the same pixels with
+it on and off.
+
+Run with: SDL_VIDEODRIVER=dummy SDL_AUDIODRIVER=dummy python tests/test_text_cache.py
+"""
+import sys
+
+from harness import check, run_checks
+
+import pygame
+
+pygame.font.init()
+
+from boneglaive.graphical.ui.font_utils import (
+    TextCache, get_fitted_font, get_font, render_fitted_text, text_cache
+)
+
+# --------------------------------------------------------------------------- #
+# (a) Cache
+# --------------------------------------------------------------------------- #
+def test_hits_and_keys():
+    font = get_font(None, 20)
+    cache = TextCache()
+    first = cache.render(font, "Bone", True, (200, 100, 50))
+    again = cache.render(font, "Bone", True, pygame.Color(200, 100, 50))
+    check("hit_same_surface", first is cache.render(font, "Bone", True, (200, 100, 50))
+          and cache.stats.hits == 1, cache.stats.summary())
+    check("color_object_key", again is not first and len(cache) == 2)
+
+    cache.render(font, "Bone", False, (200, 100, 50))
+    cache.render(get_font(None, 21), "Bone", True, (200, 100, 50))
+    cache.render(font, "Bone", True, (200, 100, 50), (0, 0, 0))
+    check("key_fields", len(cache) == 5 and cache.stats.misses == 5)
+
+    expected = font.render("Bone", True, (200, 100, 50))
+    check("pixels_match", pygame.image.tobytes(first, "RGBA") == pygame.image.tobytes(expected, "RGBA"))
+    check("shared_fonts", get_font(None, 20) is font)
+
+
+def test_alpha():
+    font = get_font(None, 24)
+    cache = TextCache()
+    faded = cache.render(font, "Fade", True, (255, 255, 255), alpha=60)
+    check("alpha_applied", faded.get_alpha() == 60)
+    plain = cache.render(font, "Fade", True, (255, 255, 255))
+    check("alpha_restored", plain is faded and plain.get_alpha() == font.render("Fade", True, (0, 0, 0)).get_alpha())
+
+    aliased = cache.render(font, "Fade", False, (255, 255, 255), alpha=30)
+    check("aliased_alpha", aliased.get_alpha() == 30
+          and cache.render(font, "Fade", False, (255, 255, 255)).get_alpha() is None)
+
+
+def test_budget():
+    font = get_font(None, 20)
+    sample = font.render("AAAA", True, (1, 1, 1))
+    one = sample.get_pitch() * sample.get_height()
+    cache = TextCache(budget_bytes=one * 4)
+    for shade in (1, 2, 3, 4):
+        cache.render(font, "AAAA", True, (shade, 0, 0))
+    cache.render(font, "AAAA", True, (1, 0, 0))       # Most recently used again
+    cache.render(font, "AAAA", True, (5, 0, 0))
+    kept = sorted(key[3][0] for key in cache._entries)
+    check("lru_evicted", kept == [1, 3, 4, 5] and cache.stats.evictions == 1, str(kept))
+    check("within_budget", cache.bytes == one * 4)
+
+    cache.render(font, "A much longer line of text than the budget allows", True, (1, 1, 1))
+    check("large_uncached", cache.stats.uncached == 1 and cache.bytes <= cache.budget_bytes)
+
+    cache.clear()
+    check("clear", len(cache) == 0 and cache.bytes == 0)
+
+    cache.enabled = False
+    first = cache.render(font, "AAAA", True, (1, 1, 1))
+    check("disabled_renders", first is not cache.render(font, "AAAA", True, (1, 1, 1)) and len(cache) == 0)
+
+
+# --------------------------------------------------------------------------- #
+# (b) Fitted text
+# --------------------------------------------------------------------------- #
+def test_fitted():
+    font = get_fitted_font("TURN 12", max_width=80, max_height=25, base_font_size=20,
+                           min_font_size=16, max_font_size=24)
+    width, height = font.size("TURN 12")
+    check("fits", width <= 80 and height <= 25, f"{width}x{height}")
+    chosen = next(size for size in range(16, 25) if get_font("arial", size) is font)
+    check("largest_that_fits", chosen == 24 or get_font("arial", chosen + 1).size("TURN 12")[0] > 80
+          or get_font("arial", chosen + 1).size("TURN 12")[1] > 25, str(chosen))
+    check("memoized", get_fitted_font("TURN 12", max_width=80, max_height=25, base_font_size=20,
+                                      min_font_size=16, max_font_size=24) is font)
+
+    surface = render_fitted_text("TURN 12", max_width=80, max_height=25, base_font_size=20,
+                                 min_font_size=16, max_font_size=24)
+    check("fitted_cached", surface is render_fitted_text("TURN 12", max_width=80, max_height=25, base_font_size=20,
+                                                         min_font_size=16, max_font_size=24))
+
+
+# --------------------------------------------------------------------------- #
+# (c) Widgets
+# --------------------------------------------------------------------------- #
+def test_widgets_match():
+    pygame.display.init()
+    pygame.display.set_mode((1280, 720))
+    from boneglaive.graphical.ui.combat_log import CombatLog
+    from boneglaive.graphical.ui.message_log_window import MessageLogWindow
+
+    log = CombatLog(get_font(None, 18))
+    for i in range(30):
+        log.add_message(f"Unit {i} takes #DAMAGE_{i}# damage", "combat", player=1 + i % 2)
+        log.add_message(f"Unit {i} recovers #HEAL_{i}# HP and a very long tail of words to truncate " * 3, "system")
+    window = MessageLogWindow(get_font(None, 24), get_font(None, 18))
+    window.show(log.messages)
+
+    def draw():
+        target = pygame.Surface((1280, 720))
+        log.draw(target, 10, 500, height=180, width=900)
+        window.draw(target, 1280, 720)
+        return pygame.image.tobytes(target, "RGB")
+
+    try:
+        text_cache.enabled = False
+        uncached = draw()
+        text_cache.enabled = True
+        draw()
+        hits = text_cache.stats.hits
+        cached = draw()
+    finally:
+        text_cache.enabled = True
+    check("widgets_same_pixels", uncached == cached)
+    check("widgets_hit_cache", text_cache.stats.hits > hits, text_cache.stats.summary())
+
+
+def main():
+    return run_checks("TEXT CACHE", [
+        test_hits_and_keys,
+        test_alpha,
+        test_budget,
+        test_fitted,
+        test_widgets_match,
+    ])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
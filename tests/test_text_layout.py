@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""Cached message layout: boneglaive.graphical.ui.text_layout.
+
+The combat log and the message log window lay each message out once per
+font and width, storing the rendered line surfaces in the message, and then
+draw it with one blit per line. Word wrapping and truncation come first;
+then a highlighted damage/heal line is compared with blitting its parts
+separately, layouts are shown to be computed once per width, and both
+widgets draw and scroll a full history from them.
+
+Run with: SDL_VIDEODRIVER=dummy SDL_AUDIODRIVER=dummy python tests/test_text_layout.py
+"""
+import sys
+
+from harness import check, run_checks
+
+import pygame
+
+from boneglaive.graphical.ui.text_layout import (
+    COLOR_TEXT_DAMAGE, layout_message, render_line, truncate_text, wrap_text
+)
+
+
+def font(size=18):
+    pygame.display.init()
+    pygame.font.init()
+    return pygame.font.Font(None, size)
+
+
+# --------------------------------------------------------------------------- #
+# (a) Wrapping and lines
+# --------------------------------------------------------------------------- #
+def test_wrap():
+    log_font = font()
+    check("fits_one_line", wrap_text(log_font, "short line", 500) == ["short line"])
+    lines = wrap_text(log_font, "one two three four five six seven eight nine ten", 80)
+    check("wrapped_fit", len(lines) > 1 and all(log_font.size(line)[0] <= 80 for line in lines), str(lines))
+    check("words_kept", " ".join(lines) == "one two three four five six seven eight nine ten")
+    long_word = wrap_text(log_font, "x" * 200, 80)
+    check("long_word_cut", long_word == ["x" * 7 + "..."], str(long_word))
+    check("empty", wrap_text(log_font, "", 80) == [""])
+
+    cut = truncate_text(log_font, "a fairly long sentence that will not fit", 100)
+    check("truncated", cut.endswith("...") and log_font.size(cut)[0] <= 100, cut)
+
+
+def test_render_line():
+    log_font = font()
+    text = "Alpha hits Beta for #DAMAGE_12# damage"
+    line = render_line(log_font, text, (100, 255, 100))
+
+    expected = pygame.Surface((400, 30))
+    expected.fill((30, 20, 10))
+    x = 5
+    for part, color in (("Alpha hits Beta for ", (100, 255, 100)), ("12", COLOR_TEXT_DAMAGE),
+                        (" damage", (100, 255, 100))):
+        rendered = log_font.render(part, True, color)
+        expected.blit(rendered, (x, 5))
+        x += rendered.get_width()
+    drawn = pygame.Surface((400, 30))
+    drawn.fill((30, 20, 10))
+    drawn.blit(line, (5, 5))
+    check("highlight_exact", pygame.image.tobytes(drawn, "RGB") == pygame.image.tobytes(expected, "RGB"))
+    check("highlight_width", line.get_width() == x - 5)
+
+    heal = render_line(log_font, "Heals for #HEAL_3# HP", (1, 2, 3))
+    check("heal_number", heal.get_width() == log_font.size("Heals for 3 HP")[0], str(heal.get_width()))
+    plain = render_line(log_font, "plain text " * 20, (1, 2, 3), max_width=120)
+    check("plain_truncated", plain.get_width() <= 120)
+
+
+# --------------------------------------------------------------------------- #
+# (b) Layout cache
+# --------------------------------------------------------------------------- #
+def test_layout_cache():
+    log_font = font()
+    calls = []
+
+    def color_for(message):
+        calls.append(message['text'])
+        return (200, 200, 200)
+
+    message = {'text': "GLAIVEMAN moved", 'type': 'movement', 'player': 1,
+               'wrapped_lines': ["GLAIVEMAN", "moved"]}
+    first = layout_message(message, log_font, 300, color_for)
+    check("laid_out_once", layout_message(message, log_font, 300, color_for) is first and len(calls) == 1)
+    wrapped = layout_message(message, log_font, 300, color_for, wrapped=True)
+    check("wrapped_lines", len(wrapped) == 2 and len(calls) == 2)
+    layout_message(message, log_font, 100, color_for)
+    check("per_width", len(message['layouts']) == 3 and len(calls) == 3)
+
+
+# --------------------------------------------------------------------------- #
+# (c) Widgets
+# --------------------------------------------------------------------------- #
+def test_widgets():
+    from boneglaive.graphical.ui.combat_log import CombatLog
+    from boneglaive.graphical.ui.message_log_window import MessageLogWindow
+    from boneglaive.graphical.ui.status_effects import StatusEffectIcon, StatusEffectsPanel
+
+    log_font = font()
+    pygame.display.set_mode((1280, 720))
+    log = CombatLog(log_font)
+    for i in range(500):
+        log.add_message(f"Unit {i} takes #DAMAGE_{i}# damage " + "and a long tail " * (i % 15), "combat", player=1)
+    check("history_capped", len(log.messages) == log.max_messages)
+
+    target = pygame.Surface((1280, 720))
+    log.draw(target, 10, 500, height=180, width=900)
+    laid_out = [m for m in log.messages if 'layouts' in m]
+    check("only_visible_laid_out", 0 < len(laid_out) <= 10, str(len(laid_out)))
+
+    window = MessageLogWindow(font(24), font(16))
+    window.show(log.messages)
+    total = sum(len(m['wrapped_lines']) for m in log.messages)
+    check("window_lines", len(window.lines) == total, f"{len(window.lines)} of {total}")
+    window.draw(target, 1280, 720)
+    for _ in range(1000):
+        window.handle_scroll(-1)
+    check("scroll_to_top", window.scroll_offset == total - window.max_visible_lines, str(window.scroll_offset))
+    window.draw(target, 1280, 720)
+    check("scrolled_laid_out", 'layouts' in log.messages[0])
+
+    class Unit:
+        pass
+
+    icon = StatusEffectIcon("test", {"name": "Test", "type": "debuff", "icon": "T",
+                                     "description": "word " * 30}, Unit())
+    panel = StatusEffectsPanel(log_font, log_font)
+    panel.effects = [icon]
+    panel.hovered_effect = icon
+    panel._draw_tooltip(target, 0, 0)
+    lines = icon.description_lines
+    panel._draw_tooltip(target, 0, 0)
+    check("tooltip_wrapped_once", lines and icon.description_lines is lines, str(len(lines or [])))
+
+
+def main():
+    return run_checks("TEXT LAYOUT", [
+        test_wrap,
+        test_render_line,
+        test_layout_cache,
+        test_widgets,
+    ])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Board texture atlas and batched tile drawing: boneglaive.graphical.texture_atlas.
+
+Terrain tiles and board overlays are packed into atlas pages so the renderer
+redraws the grid layer by layer with one Surface.blits() per layer. Shelf
+packing and page overflow are exercised, packed pixels (alpha included) are
+compared with the source images, and the batched grid rebuild and trap
+overlays must draw what the per-tile path draws.
+
+Run with: SDL_VIDEODRIVER=dummy SDL_AUDIODRIVER=dummy python tests/test_texture_atlas.py
+"""
+import sys
+
+from harness import check, run_checks
+
+import pygame
+
+from boneglaive.graphical.texture_atlas import TextureAtlas
+
+
+def image(size, color):
+    surface = pygame.Surface(size, pygame.SRCALPHA)
+    surface.fill(color)
+    return surface
+
+
+# --------------------------------------------------------------------------- #
+# (a) Packing
+# --------------------------------------------------------------------------- #
+def test_packing():
+    atlas = TextureAtlas(page_size=64)
+    for i in range(4):
+        atlas.add(i, image((30, 20), (i, 0, 0, 255)))
+    rects = [tuple(atlas.region(i)[1]) for i in range(4)]
+    check("shelves", rects == [(0, 0, 30, 20), (30, 0, 30, 20), (0, 20, 30, 20), (30, 20, 30, 20)], str(rects))
+    check("one_page", len(atlas.pages) == 1 and len(atlas) == 4)
+
+    check("same_key_kept", atlas.add(0, image((30, 20), (99, 0, 0, 255)))
+          and tuple(atlas.subsurface(0).get_at((0, 0))) == (0, 0, 0, 255))
+    check("too_large_refused", not atlas.add("big", image((65, 8), (0, 0, 0, 255))) and "big" not in atlas)
+
+    for i in range(4, 8):
+        atlas.add(i, image((30, 20), (i, 0, 0, 255)))
+    page, rect = atlas.region(7)
+    check("overflow_new_page", len(atlas.pages) == 2 and page is atlas.pages[1], str(tuple(rect)))
+    check("region_missing", atlas.region("absent") is None and atlas.subsurface("absent") is None)
+
+
+def test_pixels():
+    pygame.display.init()
+    pygame.display.set_mode((64, 64))
+    source = pygame.Surface((8, 8), pygame.SRCALPHA)
+    source.fill((10, 200, 30, 77))
+    source.fill((0, 0, 0, 0), (0, 0, 4, 8))
+    atlas = TextureAtlas(page_size=32)
+    atlas.add("a", image((5, 5), (255, 255, 255, 255)))
+    atlas.add("b", source)
+    packed = atlas.subsurface("b")
+    check("alpha_exact", tuple(packed.get_at((6, 3))) == (10, 200, 30, 77)
+          and packed.get_at((1, 1)).a == 0, str(packed.get_at((6, 3))))
+
+    expected = pygame.Surface((20, 20))
+    expected.fill((50, 60, 70))
+    expected.blit(source, (3, 4))
+    expected.blit(source, (11, 9))
+    drawn = pygame.Surface((20, 20))
+    drawn.fill((50, 60, 70))
+    count = atlas.blits(drawn, [("b", (3, 4)), ("absent", (0, 0)), ("b", (11, 9))])
+    same = all(drawn.get_at((x, y)) == expected.get_at((x, y)) for x in range(20) for y in range(20))
+    check("blits_match_blit", count == 2 and same)
+
+
+# --------------------------------------------------------------------------- #
+# (b) Renderer board
+# --------------------------------------------------------------------------- #
+def test_batched_board():
+    from boneglaive.graphical import renderer as renderer_module
+    from boneglaive.graphical.frame_bench import reveal_traps, synthetic_board_assets
+    from boneglaive.graphical.game_state import GameStateAdapter
+    from boneglaive.graphical.renderer import GraphicalRenderer
+
+    adapter = GameStateAdapter()
+    adapter.initialize_game(skip_setup=True)
+    renderer = GraphicalRenderer(adapter)
+    renderer.sync_units_from_game()
+    renderer._update_grid_cache()
+    shown = {t for t in adapter.game.map.terrain.values() if t in renderer.terrain_svg_map}
+    check("tiles_cached_loaded_or_not", shown and shown <= set(renderer.terrain_tiles), str(len(shown)))
+    synthetic_board_assets(renderer)
+    renderer.hovered_grid_pos = (2, 3)
+
+    tile = renderer_module.TILE_SIZE
+    size = (renderer_module.GRID_WIDTH * tile, renderer_module.GRID_HEIGHT * tile)
+    per_tile = pygame.Surface(size)
+    for y in range(renderer_module.GRID_HEIGHT):
+        for x in range(renderer_module.GRID_WIDTH):
+            renderer._render_single_tile(per_tile, x, y, adapter.game.map)
+    batched = pygame.Surface(size)
+    renderer._render_all_tiles(batched, adapter.game.map)
+    check("grid_matches_per_tile", pygame.image.tobytes(per_tile, "RGB") == pygame.image.tobytes(batched, "RGB"))
+
+    revealed = reveal_traps(renderer)
+    screen = pygame.Surface(renderer.screen.get_size())
+    renderer.draw_revealed_traps(screen)
+    x, y = next(iter(adapter.revealed_scalar_nodes))[::-1]
+    centre = (renderer_module.GRID_OFFSET_X + x * tile + tile // 2, renderer_module.GRID_OFFSET_Y + y * tile + tile // 2)
+    check("traps_drawn", revealed > 0 and screen.get_at(centre) == renderer.scalar_node_trap.get_at((tile // 2, tile // 2)),
+          f"{revealed} revealed")
+
+
+def main():
+    return run_checks("TEXTURE ATLAS", [
+        test_packing,
+        test_pixels,
+        test_batched_board,
+    ])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""Round-robin AI tournaments: boneglaive.ai.tournament.
+
+The tournament runner pairs AI configurations on every map, streams each game
+to a JSONL file and reports Elo with confidence intervals. Checked here: a
+fair schedule, entrant options (difficulty presets and search budgets), the
+rating and breakdown maths on hand-built records, resuming an interrupted run
+without replaying games (even from a file whose last line was cut short), random
+rosters per seed, and map discovery.
+
+Run with: SDL_VIDEODRIVER=dummy SDL_AUDIODRIVER=dummy python tests/test_tournament.py
+"""
+import os
+import sys
+import json
+import tempfile
+from collections import Counter
+
+from harness import check, run_checks
+
+from boneglaive.ai.tournament import (Entrant, Tournament, TournamentStats, available_maps, fit_elo,
+                                    schedule)
+
+
+def record(p1, p2, winner, map_name="lime_foyer", units=None, turns=10):
+    return {'key': f"{map_name}|{p1}|{p2}|{winner}", 'map': map_name, 'seed': 0,
+            'player1': p1, 'player2': p2, 'winner': winner, 'turns': turns,
+            'units': units or {}, 'think_time': {'1': 0.5, '2': 1.0}}
+
+
+# ---------------------------------------------------------------------------
+# (a) Every pair meets on every map, equally often from each side.
+# ---------------------------------------------------------------------------
+def test_schedule_is_round_robin():
+    entrants = [Entrant.parse("a:beam=0"), Entrant.parse("b"), Entrant.parse("c:beam=2,weights=w.json")]
+    specs = schedule(entrants, ["lime_foyer", "hard_pressed"], games=2)
+    sides = Counter((s['map'], s['player1']['name'], s['player2']['name']) for s in specs)
+    check("schedule_size", len(specs) == 2 * 3 * 2 * 2, f"games={len(specs)}")
+    check("schedule_both_sides", set(sides.values()) == {2} and len(sides) == 2 * 6,
+          f"orientations={len(sides)}")
+    check("schedule_keys_unique", len({s['key'] for s in specs}) == len(specs))
+    check("entrant_parse", entrants[2] == Entrant("c", 2, "w.json") and entrants[1].beam_width is None)
+
+
+def test_entrant_options():
+    from boneglaive.game.engine import Game
+
+    entrant = Entrant.parse("e:difficulty=easy,budget=30")
+    check("entrant_difficulty_budget", entrant == Entrant("e", difficulty="easy", budget=30))
+    for bad in ("x:difficulty=nightmare", "x:budget=0", "x:depth=3"):
+        try:
+            Entrant.parse(bad)
+            rejected = False
+        except ValueError:
+            rejected = True
+        check(f"entrant_rejects_{bad.split(':')[1].split('=')[0]}", rejected, bad)
+
+    game = Game(skip_setup=True, map_name="lime_foyer")
+    easy = entrant.factory()(game, 2)
+    check("difficulty_easy", easy.beam_width == 0 and easy.endgame_threshold == 0 and easy.plan_budget == 30)
+    hard = Entrant.parse("h:difficulty=hard,beam=2,budget=30").factory()(game, 2)
+    check("difficulty_then_overrides", hard.beam_width == 2 and hard.turn_planner.node_budget == 30)
+
+
+# ---------------------------------------------------------------------------
+# (b) Ratings and breakdowns from hand-built records.
+# ---------------------------------------------------------------------------
+def test_ratings_and_breakdowns():
+    records = ([record("strong", "weak", 1) for _ in range(8)]
+               + [record("weak", "strong", 2, map_name="hard_pressed") for _ in range(6)]
+               + [record("weak", "strong", 1, map_name="hard_pressed") for _ in range(2)])
+    elo = fit_elo(records, ["strong", "weak"])
+    check("elo_orders_entrants", elo["strong"] > elo["weak"] + 200, f"{elo}")
+    check("elo_anchored", abs(sum(elo.values()) / 2 - 1500) < 1e-6)
+    even = fit_elo([record("a", "b", 1), record("b", "a", 1)], ["a", "b"])
+    check("elo_even_split", abs(even["a"] - even["b"]) < 1e-6, f"{even}")
+
+    stats = TournamentStats(records, ["strong", "weak"])
+    rating, low, high = stats.elo(bootstrap=50)["strong"]
+    check("elo_interval_brackets", low <= rating <= high and high > low, f"{low:.0f} <= {rating:.0f} <= {high:.0f}")
+    per_map = stats.per_map()
+    check("per_map_rates", per_map["strong"]["lime_foyer"] == (8.0, 8)
+          and per_map["strong"]["hard_pressed"] == (6.0, 8), f"{per_map['strong']}")
+
+    units = {'1': ["GLAIVEMAN", "GLAIVEMAN", "GRAYMAN"], '2': ["GRAYMAN", "MARROW_CONDENSER"]}
+    unit_stats = TournamentStats([record("a", "b", 1, units=units), record("b", "a", None, units=units)],
+                                 ["a", "b"]).per_unit_type()
+    check("per_unit_type_rates", unit_stats == {"GLAIVEMAN": (1.5, 2), "GRAYMAN": (2.0, 4),
+                                                "MARROW_CONDENSER": (0.5, 2)}, f"{unit_stats}")
+    cpu = stats.think_time_per_turn()
+    check("think_time_per_turn", abs(cpu["strong"] - (8 * 0.5 + 8 * 1.0) / 80) < 1e-9, f"{cpu}")
+
+
+# ---------------------------------------------------------------------------
+# (c) Results stream to disk and a rerun only plays what is missing.
+# ---------------------------------------------------------------------------
+def test_resume():
+    entrants = [Entrant("greedy", 0), Entrant("planner", 1)]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "results.jsonl")
+        first = Tournament(entrants, ["lime_foyer"], games=1, max_turns=2, results_path=path)
+        check("pending_before", len(first.pending()) == 2)
+
+        def interrupt(rec, done, total):
+            raise KeyboardInterrupt
+
+        try:
+            first.run(progress=interrupt)
+        except KeyboardInterrupt:
+            pass
+        with open(path) as f:
+            lines = [json.loads(line) for line in f]
+        check("streamed_before_interrupt", len(lines) == 2 and 'tournament' in lines[0],
+              f"lines={len(lines)}")
+
+        resumed = Tournament(entrants, ["lime_foyer"], games=1, max_turns=2, results_path=path)
+        played = []
+        resumed.run(progress=lambda rec, done, total: played.append(rec['key']))
+        check("resume_plays_missing_only", len(played) == 1 and len(resumed.records) == 2
+              and not resumed.pending(), f"played={played}")
+
+        # Both sides of a seed field the same random setups, not the fixed default roster
+        rosters = [rec['units'] for rec in resumed.records]
+        check("random_rosters_per_seed", rosters[0] == rosters[1]
+              and rosters[0]['1'] != ["GLAIVEMAN"] * len(rosters[0]['1'])
+              and all(len(set(types)) == len(types) for types in rosters[0].values()),
+              f"rosters={rosters}")
+
+        try:
+            Tournament([Entrant("greedy", 3), Entrant("planner", 1)], ["lime_foyer"],
+                       games=1, max_turns=2, results_path=path)
+            mismatch_rejected = False
+        except ValueError:
+            mismatch_rejected = True
+        check("resume_rejects_changed_entrant", mismatch_rejected)
+
+        # Headers written before the difficulty and budget options still match
+        with open(path) as f:
+            old = f.read().splitlines()
+        header = json.loads(old[0])
+        for e in header['tournament']['entrants']:
+            del e['difficulty'], e['budget']
+        with open(path, 'w') as f:
+            f.write("\n".join([json.dumps(header)] + old[1:]) + "\n")
+        check("resume_accepts_older_header",
+              len(Tournament(entrants, ["lime_foyer"], games=1, max_turns=2, results_path=path).records) == 2)
+
+        # A run killed mid-write leaves a partial last line
+        with open(path) as f:
+            complete = f.read()
+        with open(path, 'a') as f:
+            f.write('{"key": "lime_foyer/0/greedy/pla')
+        truncated = Tournament(entrants, ["lime_foyer"], games=1, max_turns=2, results_path=path)
+        with open(path) as f:
+            repaired = f.read()
+        check("resume_drops_truncated_line", len(truncated.records) == 2 and repaired == complete,
+              f"records={len(truncated.records)}")
+
+
+# ---------------------------------------------------------------------------
+# (d) Maps are found in the package, wherever the tournament is run from.
+# ---------------------------------------------------------------------------
+def test_available_maps():
+    cwd = os.getcwd()
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            os.chdir(tmp)
+            maps = available_maps()
+    finally:
+        os.chdir(cwd)
+    check("maps_from_package", "lime_foyer" in maps and "stained_stones" in maps, str(maps))
+
+
+def main():
+    return run_checks("TOURNAMENT", [
+        test_schedule_is_round_robin,
+        test_entrant_options,
+        test_ratings_and_breakdowns,
+        test_resume,
+        test_available_maps,
+    ])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
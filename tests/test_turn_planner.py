@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""Joint turn planner tests — beam search over all of the AI's units at once.
+
+The TurnPlanner applies each partial plan to a cloned game (Game.clone), so later
+units are scored against the board earlier units leave behind. The live controller
+relies on a clone that is fully detached and on planning that never touches the live
+game or its message log. Every returned action must reference LIVE units/skills, the
+queued plan must survive a real execute_turn(ui=None), planned actions must resolve as
+the engine resolves them, and a node budget must cap the search.
+
+Run with: SDL_VIDEODRIVER=dummy SDL_AUDIODRIVER=dummy python tests/test_turn_planner.py
+"""
+import sys
+
+from harness import check, run_checks
+
+from boneglaive.game.engine import Game
+from boneglaive.utils.constants import UnitType, HEIGHT, WIDTH
+from boneglaive.utils.message_log import message_log
+from boneglaive.ai.smart_ai import SmartAI
+from boneglaive.ai.turn_planner import TurnPlanner, queue_action
+from boneglaive.ai.tactical_evaluator import Action
+
+
+AI_PLAYER = 2
+
+
+def fresh_game(map_name="lime_foyer"):
+    g = Game(skip_setup=True, map_name=map_name)
+    g.units = []
+    g.unit_grid = {}
+    return g
+
+
+def free_tiles(g, n):
+    out = []
+    for y in range(HEIGHT):
+        for x in range(WIDTH):
+            if g.map.can_place_unit(y, x) and g.get_unit_at(y, x) is None:
+                out.append((y, x))
+                if len(out) >= n:
+                    return out
+    return out
+
+
+def place(g, utype, player, y, x):
+    g.add_unit(utype, player, y, x)
+    return g.get_unit_at(y, x)
+
+
+def skirmish():
+    """Two AI GLAIVEMEN flanking one wounded enemy, plus a second enemy further off."""
+    g = fresh_game()
+    ts = free_tiles(g, 60)
+    ey, ex = ts[25]
+    enemy = place(g, UnitType.POTPOURRIST, 1, ey, ex)
+    flank = [(y, x) for (y, x) in ts
+             if max(abs(y - ey), abs(x - ex)) == 2 and g.get_unit_at(y, x) is None]
+    a = place(g, UnitType.GLAIVEMAN, AI_PLAYER, *flank[0])
+    b = place(g, UnitType.GLAIVEMAN, AI_PLAYER, *flank[-1])
+    far = place(g, UnitType.GRAYMAN, 1, *ts[-1])
+    g.current_player = AI_PLAYER
+    return g, enemy, far, a, b
+
+
+def snapshot(g):
+    return [(u.y, u.x, u.hp, u.move_target, u.attack_target, u.skill_target,
+             tuple(s.current_cooldown for s in u.active_skills)) for u in g.units]
+
+
+# ---------------------------------------------------------------------------
+# (a) Game.clone is detached: mutations on the copy never reach the live game.
+# ---------------------------------------------------------------------------
+def test_clone_is_detached():
+    g, enemy, far, a, b = skirmish()
+    g.set_ui_reference(object())
+    memo = {}
+    c = g.clone(memo)
+    ce = memo[id(enemy)]
+    ce.hp = 1
+    c._relocate_unit(memo[id(a)], *free_tiles(c, 1)[0])
+    check("clone_hp_detached", enemy.hp == enemy.max_hp and ce.hp == 1,
+          f"live={enemy.hp} clone={ce.hp}")
+    check("clone_grid_detached", g.get_unit_at(a.y, a.x) is a, "live grid still holds the unit")
+    check("clone_drops_ui", getattr(c, 'ui', None) is None, "clone is headless")
+    check("clone_units_rebound", all(u._game is c for u in c.units), "clone units point at the clone")
+
+
+# ---------------------------------------------------------------------------
+# (b) Planning leaves the live game and message log untouched.
+# ---------------------------------------------------------------------------
+def test_planning_is_side_effect_free():
+    g, enemy, far, a, b = skirmish()
+    before = snapshot(g)
+    log_len = len(message_log.messages)
+    steps = TurnPlanner(g, AI_PLAYER, beam_width=3).plan_turn([a, b])
+    check("planning_state_untouched", snapshot(g) == before, "positions/hp/targets/cooldowns")
+    check("planning_log_untouched", len(message_log.messages) == log_len,
+          f"log grew by {len(message_log.messages) - log_len}")
+    check("planning_returns_steps", len(steps) == 2, f"steps={len(steps)}")
+
+
+# ---------------------------------------------------------------------------
+# (c) Every planned action references live objects, never clone copies.
+# ---------------------------------------------------------------------------
+def test_plan_references_live_objects():
+    g, enemy, far, a, b = skirmish()
+    live_ids = {id(u) for u in g.units}
+    live_ids |= {id(s) for u in g.units for s in u.active_skills}
+    steps = TurnPlanner(g, AI_PLAYER, beam_width=3).plan_turn([a, b])
+
+    def refs(value):
+        if isinstance(value, tuple):
+            return [r for v in value for r in refs(v)]
+        if value is None or isinstance(value, (int, float, str)):
+            return []
+        return [value]
+
+    stray = [r for unit, action in steps for r in [unit] + refs(action.target)
+             if id(r) not in live_ids]
+    check("plan_references_live_objects", not stray, f"stray={len(stray)}")
+
+
+# ---------------------------------------------------------------------------
+# (d) The second unit is scored against the board the first one left behind:
+#     once the first GLAIVEMAN's hit is applied, the second sees a wounded target
+#     and follows up on it (focus fire) instead of ignoring it.
+# ---------------------------------------------------------------------------
+def test_second_unit_sees_first_units_damage():
+    g, enemy, far, a, b = skirmish()
+    enemy.hp = 7  # one GLAIVEMAN hit (5 ATK - 0 DEF) leaves it at 2
+    steps = TurnPlanner(g, AI_PLAYER, beam_width=4).plan_turn([a, b])
+
+    def hits(action):
+        tgt = action.target
+        if action.type == "move_attack":
+            tgt = tgt[1]
+        elif action.type == "skill":
+            tgt = tgt[1]
+        return tgt is enemy
+
+    focus = [hits(action) for _, action in steps]
+    check("focus_fire_on_wounded_target", len(focus) == 2 and all(focus),
+          f"actions={[act.type for _, act in steps]} focus={focus}")
+
+
+# ---------------------------------------------------------------------------
+# (e) Without a beam, SmartAI still scores each unit after the previous one
+#     acted: nobody follows up on a target that is already dead, and two units
+#     never head for the same tile.
+# ---------------------------------------------------------------------------
+def test_greedy_units_see_earlier_actions():
+    g, enemy, far, a, b = skirmish()
+    enemy.hp = 1  # any hit kills it
+    SmartAI(g, beam_width=0).process_turn()
+
+    def targets_enemy(unit):
+        pos = (enemy.y, enemy.x)
+        return unit.attack_target == pos or unit.skill_target == pos
+
+    check("greedy_no_overkill", sum(targets_enemy(u) for u in (a, b)) == 1,
+          f"a={a.attack_target or a.skill_target} b={b.attack_target or b.skill_target}")
+    check("greedy_distinct_moves", a.move_target is None or a.move_target != b.move_target,
+          f"a={a.move_target} b={b.move_target}")
+
+
+# ---------------------------------------------------------------------------
+# (f) SmartAI with the planner queues a plan the engine executes without error,
+#     and so does the greedy beam_width=0 path.
+# ---------------------------------------------------------------------------
+def test_smart_ai_turn_executes():
+    for width in (0, 1, 4):
+        g, enemy, far, a, b = skirmish()
+        ai = SmartAI(g, beam_width=width)
+        ok = ai.process_turn()
+        queued = sum(1 for u in (a, b)
+                     if u.move_target or u.attack_target or u.skill_target)
+        try:
+            g.execute_turn(ui=None)
+            executed = True
+        except Exception:
+            executed = False
+        check(f"smart_ai_turn_width_{width}", ok and executed and queued == 2,
+              f"queued={queued} executed={executed}")
+
+
+# ---------------------------------------------------------------------------
+# (g) A planned action leaves the board execute_turn() would: a DERELICTIONIST
+#     hits with Severance and retreats, a shielded target's PRT absorbs damage.
+# ---------------------------------------------------------------------------
+def test_planned_action_resolves_like_engine():
+    cases = (("severance", UnitType.DERELICTIONIST, UnitType.GLAIVEMAN, 0),
+             ("prt", UnitType.GLAIVEMAN, UnitType.POTPOURRIST, 3))
+    for name, attacker_type, target_type, prt in cases:
+        g = fresh_game()
+        ts = free_tiles(g, 30)
+        attacker = place(g, attacker_type, AI_PLAYER, *ts[20])
+        target = place(g, target_type, 1, *ts[21])
+        target.prt_bonus = prt
+        g.current_player = AI_PLAYER
+
+        memo = {}
+        engine = g.clone(memo)
+        with message_log.suppressed():
+            queue_action(engine, memo[id(attacker)], Action("attack", target=memo[id(target)]))
+            engine.execute_turn(ui=None)
+
+            planner = TurnPlanner(g, AI_PLAYER)
+            root = planner._root_node()
+            to_state = root.to_state()
+            child = planner._apply(root, to_state[id(attacker)], Action("attack", target=to_state[id(target)]))
+        planned, expected = child.to_state(), memo
+        check(f"resolves_like_engine_{name}",
+              planned[id(target)].hp == expected[id(target)].hp < target.hp
+              and (planned[id(attacker)].y, planned[id(attacker)].x) == (expected[id(attacker)].y, expected[id(attacker)].x),
+              f"planned hp={planned[id(target)].hp} engine hp={expected[id(target)].hp}")
+
+
+# ---------------------------------------------------------------------------
+# (h) A node budget turns the search greedy once spent, but every unit still acts.
+# ---------------------------------------------------------------------------
+def test_node_budget():
+    g, enemy, far, a, b = skirmish()
+    full = TurnPlanner(g, AI_PLAYER, beam_width=4)
+    full.plan_turn([a, b])
+    capped = TurnPlanner(g, AI_PLAYER, beam_width=4, node_budget=2)
+    steps = capped.plan_turn([a, b])
+    # Spending the budget mid-layer finishes that node's branching, then one child per unit
+    check("node_budget_caps_search", capped.nodes < full.nodes and capped.nodes <= 2 + full.branching,
+          f"capped={capped.nodes} full={full.nodes}")
+    check("node_budget_plans_every_unit", len(steps) == 2, f"steps={len(steps)}")
+
+
+def main():
+    return run_checks("TURN PLANNER", [
+        test_clone_is_detached,
+        test_planning_is_side_effect_free,
+        test_plan_references_live_objects,
+        test_second_unit_sees_first_units_damage,
+        test_greedy_units_see_earlier_actions,
+        test_smart_ai_turn_executes,
+        test_planned_action_resolves_like_engine,
+        test_node_budget,
+    ])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""AI scoring weights and self-play tuning.
+
+SmartAI's scoring terms, generic and skill-specific, live in AIWeights so
+boneglaive.ai.tuning can tune them with SPSA self-play. The default weights have
+to play exactly like the hand-tuned constants did; weights round-trip through
+vectors and JSON files; the tuner checkpoints and resumes; the game loads the
+file named by the ai_weights_file config key; match games start from random
+rosters that a seed reproduces.
+
+Run with: SDL_VIDEODRIVER=dummy SDL_AUDIODRIVER=dummy python tests/test_weights_tuning.py
+"""
+import os
+import sys
+import json
+import tempfile
+from types import SimpleNamespace
+
+from harness import check, run_checks
+
+from boneglaive.ai.ai_interface import AIInterface
+from boneglaive.ai.tactical_evaluator import TacticalEvaluator
+from boneglaive.ai.weights import AIWeights, DEFAULT_WEIGHTS
+from boneglaive.game.engine import Game
+from boneglaive.utils.config import ConfigManager
+from boneglaive.ai.selfplay import play_headless_game, smart_ai_factory
+from boneglaive.ai.tuning import SelfPlayMatch, SPSATuner
+from boneglaive.utils.message_log import message_log
+
+
+def summary(result):
+    return (result.winner, result.turns, result.player1_gp, result.player2_gp)
+
+
+# ---------------------------------------------------------------------------
+# (a) Explicit default weights play the same game as no weights at all.
+# ---------------------------------------------------------------------------
+def test_default_weights_unchanged():
+    with message_log.suppressed():
+        plain = play_headless_game("lime_foyer", 3, smart_ai_factory(0), smart_ai_factory(0), 12)
+        weighted = play_headless_game("lime_foyer", 3, smart_ai_factory(0, DEFAULT_WEIGHTS),
+                                      smart_ai_factory(0, AIWeights()), 12)
+    check("default_weights_unchanged", summary(plain) == summary(weighted),
+          f"{summary(plain)} vs {summary(weighted)}")
+
+
+# ---------------------------------------------------------------------------
+# (b) Weights round-trip through vectors, dicts and files.
+# ---------------------------------------------------------------------------
+def test_weights_round_trip():
+    tuned = DEFAULT_WEIGHTS.updated(kill_bonus=61.5, center_pull=3.0)
+    check("vector_round_trip", AIWeights.from_vector(tuned.to_vector()) == tuned)
+    check("dict_ignores_unknown", AIWeights.from_dict({**tuned.to_dict(), "retired": 1.0}) == tuned)
+    check("diff_lists_changes", [name for name, _, _ in DEFAULT_WEIGHTS.diff(tuned)]
+          == ["kill_bonus", "center_pull"])
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "weights.json")
+        tuned.save(path)
+        check("file_round_trip", AIWeights.load(path) == tuned)
+
+
+# ---------------------------------------------------------------------------
+# (c) The tuner checkpoints every iteration and resumes from the file.
+# ---------------------------------------------------------------------------
+def test_tuner_checkpoint_resume():
+    match = SelfPlayMatch(["lime_foyer"], games_per_side=1, beam_width=0, max_turns=4)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "tuning.json")
+        first = SPSATuner(match, path, seed=5, names=["kill_bonus", "approach_scale"])
+        first.step()
+        with open(path) as f:
+            state = json.load(f)
+        check("checkpoint_written", state["iteration"] == 1 and len(state["history"]) == 1,
+              f"iteration={state['iteration']}")
+
+        resumed = SPSATuner(match, path)
+        check("checkpoint_resumed", resumed.iteration == 1 and resumed.scales == first.scales
+              and resumed.names == ["kill_bonus", "approach_scale"], f"scales={resumed.scales}")
+
+
+
+class PreferHighKillBonus:
+    """Stand-in for SelfPlayMatch: the side with the larger kill bonus wins."""
+
+    def score(self, a, b, seed):
+        return 1.0 if a.kill_bonus > b.kill_bonus else 0.0
+
+
+# ---------------------------------------------------------------------------
+# (d) A resumed run ends where an uninterrupted run ends, moving along the gradient.
+# ---------------------------------------------------------------------------
+def test_tuner_resume_reproducible():
+    names = ["kill_bonus", "approach_scale"]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "tuning.json")
+        SPSATuner(PreferHighKillBonus(), path, seed=7, names=names).run(2)
+        resumed = SPSATuner(PreferHighKillBonus(), path)
+        resumed.run(5)
+    straight = SPSATuner(PreferHighKillBonus(), None, seed=7, names=names)
+    straight.run(5)
+    check("resume_reproducible", resumed.scales == straight.scales,
+          f"{resumed.scales} vs {straight.scales}")
+    check("follows_gradient", straight.scales["kill_bonus"] > 1.0 and straight.weights.kill_bonus > 50.0,
+          f"kill_bonus scale={straight.scales['kill_bonus']:.2f}")
+
+
+# ---------------------------------------------------------------------------
+# (e) Skill-specific scorers read their terms from the weights.
+# ---------------------------------------------------------------------------
+def test_skill_scorers_use_weights():
+    g = Game(skip_setup=True, map_name="lime_foyer")
+    landscaper = SimpleNamespace(active_skills=[SimpleNamespace(current_cooldown=2)])
+    default = TacticalEvaluator(g, 2)._landscaper_cooldown_cycling_bonus(landscaper, 4)
+    tuned = TacticalEvaluator(g, 2, DEFAULT_WEIGHTS.updated(landscaper_per_cooldown=8.0))
+    check("skill_weight_default", default == 9.0, f"bonus={default}")
+    check("skill_weight_tuned", tuned._landscaper_cooldown_cycling_bonus(landscaper, 4) == 12.0)
+
+
+# ---------------------------------------------------------------------------
+# (f) The game loads the weights file named by ai_weights_file, falling back to defaults.
+# ---------------------------------------------------------------------------
+def test_interface_loads_configured_weights():
+    tuned = DEFAULT_WEIGHTS.updated(kill_bonus=61.5, dissonance_kill=12.0)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "tuned_weights.json")
+        tuned.save(path)
+        interface = AIInterface()
+        interface.config = ConfigManager(os.path.join(tmp, "config.json"), save_delay=0)
+
+        check("no_file_uses_defaults", interface.load_weights() is DEFAULT_WEIGHTS)
+        interface.config.set('ai_weights_file', path)
+        check("file_loaded", interface.load_weights() == tuned)
+        check("controller_uses_file", interface.initialize(Game(skip_setup=True, map_name="lime_foyer"))
+              and interface.ai_controller.weights == tuned)
+        interface.config.set('ai_weights_file', os.path.join(tmp, "missing.json"))
+        check("missing_file_uses_defaults", interface.load_weights() is DEFAULT_WEIGHTS)
+
+
+# ---------------------------------------------------------------------------
+# (g) Match games field a random roster per side, the same for every replay of a seed.
+# ---------------------------------------------------------------------------
+def test_match_games_use_random_rosters():
+    with message_log.suppressed():
+        games = [play_headless_game("lime_foyer", 11, smart_ai_factory(0), smart_ai_factory(0), 4,
+                                    random_rosters=True) for _ in range(2)]
+        other = play_headless_game("lime_foyer", 12, smart_ai_factory(0), smart_ai_factory(0), 4,
+                                   random_rosters=True)
+    check("match_seed_reproducible", games[0].units == games[1].units
+          and summary(games[0]) == summary(games[1]), f"{games[0].units} vs {games[1].units}")
+    check("match_not_default_roster", games[0].units[1] != ["GLAIVEMAN"] * 3, f"{games[0].units}")
+    check("match_seeds_differ", other.units != games[0].units, f"{other.units}")
+
+
+def main():
+    return run_checks("WEIGHTS TUNING", [
+        test_default_weights_unchanged,
+        test_weights_round_trip,
+        test_tuner_checkpoint_resume,
+        test_tuner_resume_reproducible,
+        test_skill_scorers_use_weights,
+        test_interface_loads_configured_weights,
+        test_match_games_use_random_rosters,
+    ])
+
+
+if __name__ == "__main__":
+    sys.exit(main())